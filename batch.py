@@ -0,0 +1,202 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from cache import PortfolioCache
+from energy_star import workbook_read_errors, StageTimer, process_workbook, compile_records, export_records, export_validation, output_formats, logger
+
+
+
+
+#-------------------- BATCH FUNCTIONS --------------------
+
+
+#every .xlsx file in the given files and directories, in a stable order
+def find_workbooks(paths):
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file in sorted(files):
+                    if file.lower().endswith('.xlsx') and not file.startswith('~$'):
+                        found.append(os.path.join(root, file))
+        else:
+            found.append(path)
+    return found
+
+
+#one output file per input, numbered when two inputs share a name
+def output_paths(inputs, out_dir, output='Excel'):
+    extension = output_formats[output][0]
+    seen = {}
+    targets = []
+    for path in inputs:
+        name = os.path.splitext(os.path.basename(path))[0]
+        seen[name] = seen.get(name, 0) + 1
+        suffix = '' if seen[name] == 1 else f'_{seen[name]}'
+        targets.append(os.path.join(out_dir, f'{name}{suffix}_export.{extension}'))
+    return targets
+
+
+#convert a single export. Runs in a worker process, so everything, errors included, comes back as a plain dict
+#intervals is an interval data file for the meters of the export. It isn't part of the cache key, so it skips the cache.
+def convert_file(path, target, method='Blend', year=None, output='Excel', cache_dir=None, chunk_rows=None, rollup=None, intervals=None):
+    start = time.perf_counter()
+    result = {
+        'input': path,
+        'output': None,
+        'validation': None,
+        'status': 'ok',
+        'cached': False,
+        'reused': 0,
+        'buildings': 0,
+        'warnings': [],
+        'error': None,
+        'seconds': None,
+        'stages': []
+    }
+    timer = StageTimer()
+    try:
+        if cache_dir is None or intervals is not None:
+            portfolio = process_workbook(path, timer=timer, chunk_rows=chunk_rows, intervals=intervals)
+        else:
+            cache = PortfolioCache(cache_dir)
+            with open(path, 'rb') as f:
+                portfolio = cache.load(f.read(), label=os.path.basename(path), timer=timer, chunk_rows=chunk_rows)
+            result['cached'] = cache.hits > 0
+            result['reused'] = portfolio.reused
+        with timer.stage('compile') as stage:
+            records = compile_records(portfolio, method, year, rollup=rollup)
+            stage['rows'] = len(records)
+        with timer.stage('export') as stage:
+            with open(target, 'wb') as f:
+                export_records(records, output, f)
+            stage['rows'] = len(records)
+        result['output'] = target
+        #skipped meter entries go to a validation workbook next to the output
+        if len(portfolio.diagnostics) > 0:
+            result['validation'] = f'{os.path.splitext(target)[0]}_validation.xlsx'
+            with open(result['validation'], 'wb') as f:
+                export_validation(portfolio.diagnostics, f)
+        result['buildings'] = len(records)
+        result['warnings'] = portfolio.unmatched_messages()
+    #the same as the app, a file that isn't a usable export is invalid rather than failed
+    except workbook_read_errors as e:
+        result['status'] = 'invalid'
+        result['error'] = str(e)
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    result['stages'] = timer.stages
+    return result
+
+
+#convert every input across a process pool, results are returned in input order
+def run_batch(inputs, out_dir, method='Blend', year=None, output='Excel', workers=None, progress=None, cache_dir=None, chunk_rows=None, rollup=None, intervals=None):
+    os.makedirs(out_dir, exist_ok=True)
+    targets = output_paths(inputs, out_dir, output)
+    results = [None] * len(inputs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(convert_file, path, target, method, year, output, cache_dir, chunk_rows, rollup, intervals): index
+            for index, (path, target) in enumerate(zip(inputs, targets))
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if progress is not None:
+                progress(result)
+    return results
+
+
+#summary of the run next to the outputs, as JSON and as CSV
+def write_summary(results, out_dir):
+    with open(os.path.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump(results, f, indent=2)
+    summary = pd.DataFrame(results, columns=['input', 'output', 'validation', 'status', 'cached', 'reused', 'buildings', 'warnings', 'error', 'seconds'])
+    summary['warnings'] = summary['warnings'].map('; '.join)
+    summary.to_csv(os.path.join(out_dir, 'summary.csv'), index=False)
+    return summary
+
+
+#stage totals of the run in the Prometheus text format, e.g. for the node_exporter textfile collector.
+#Written next to the final name and renamed, so a scrape never reads half a file.
+def write_metrics(results, path, seconds):
+    stages = pd.DataFrame([stage for result in results for stage in result['stages']], columns=['stage', 'rows', 'seconds', 'max_rss_mb'])
+    totals = stages.groupby('stage', sort=False).agg({'seconds': 'sum', 'rows': 'sum', 'max_rss_mb': 'max'})
+    statuses = pd.Series([result['status'] for result in results]).value_counts()
+    metrics = [
+        ('energy_star_stage_seconds', 'Wall time spent in each stage over the batch.', totals['seconds']),
+        ('energy_star_stage_rows', 'Rows handled by each stage over the batch.', totals['rows']),
+        ('energy_star_stage_max_rss_megabytes', 'Largest worker memory high-water mark after each stage.', totals['max_rss_mb'])
+    ]
+    lines = []
+    for name, help, values in metrics:
+        lines += [f'# HELP {name} {help}', f'# TYPE {name} gauge']
+        lines += [f'{name}{{stage="{stage}"}} {value:g}' for stage, value in values.dropna().items()]
+    lines += ['# HELP energy_star_files Files in the batch by result.', '# TYPE energy_star_files gauge']
+    lines += [f'energy_star_files{{status="{status}"}} {count}' for status, count in statuses.items()]
+    lines += ['# HELP energy_star_batch_seconds Wall time of the whole batch.', '# TYPE energy_star_batch_seconds gauge']
+    lines += [f'energy_star_batch_seconds {seconds:g}']
+    lines += ['# HELP energy_star_batch_timestamp_seconds When the batch finished.', '# TYPE energy_star_batch_timestamp_seconds gauge']
+    lines += [f'energy_star_batch_timestamp_seconds {time.time():.0f}']
+
+    staging = f'{path}.{os.getpid()}.tmp'
+    with open(staging, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(staging, path)
+
+
+
+
+#-------------------- MAIN EXECUTION --------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert Portfolio Manager exports for Carbon Signal without the Streamlit app.')
+    parser.add_argument('inputs', nargs='+', help='.xlsx exports or directories containing them')
+    parser.add_argument('-o', '--out', default='exports', help='directory for the converted files and the summary')
+    parser.add_argument('-m', '--method', default='Blend', choices=['Blend', 'Complete', 'Latest'])
+    parser.add_argument('-y', '--year', type=int, default=None, help='calendar year used by Latest, last year by default')
+    parser.add_argument('-f', '--format', dest='output', default='Excel', choices=list(output_formats))
+    parser.add_argument('-r', '--rollup', default=None, choices=['parents', 'all'], help='sum child properties into their parents, keeping only the top level rows or all of them')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes, one per CPU by default')
+    parser.add_argument('-c', '--cache', default=None, help='directory of processed workbooks to reuse, off by default')
+    parser.add_argument('--chunk-rows', type=int, default=None, help='stream Meter Entries in chunks of this many rows, for very large exports')
+    parser.add_argument('-i', '--intervals', default=None, help='.parquet or .csv file of interval readings for the meters of a single export')
+    parser.add_argument('--metrics', default=None, help='Prometheus text file with stage totals, metrics.prom in the output directory by default')
+    args = parser.parse_args(argv)
+
+    inputs = find_workbooks(args.inputs)
+    if len(inputs) == 0:
+        parser.error('no .xlsx files found')
+    if args.intervals is not None and len(inputs) > 1:
+        parser.error('--intervals needs a single export')
+
+    #progress for people on stderr, one JSON line per file on stdout
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    def progress(result):
+        print(f"{result['status']:>7}  {result['seconds']:>7.2f}s  {result['input']}", file=sys.stderr)
+        logger.info(json.dumps({'event': 'conversion', **result}, default=str))
+
+    start = time.perf_counter()
+    results = run_batch(inputs, args.out, args.method, args.year, args.output, args.workers, progress, args.cache, args.chunk_rows, args.rollup, args.intervals)
+    summary = write_summary(results, args.out)
+    write_metrics(results, args.metrics or os.path.join(args.out, 'metrics.prom'), time.perf_counter() - start)
+    failed = int((summary['status'] != 'ok').sum())
+    print(f'{len(results) - failed} of {len(results)} files converted, summary in {args.out}', file=sys.stderr)
+    return 1 if failed > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+from emissions_factors import get_factors_batch
+from energy_star import (
+    PortfolioWorkbook, get_buildings, get_meters, build_monthly_cube, fill_blend, fill_complete, fill_latest,
+    compile_records, create_excel, records_table, export_table
+)
+from synthetic import generate_workbook
+
+
+
+
+#-------------------- BENCHMARK STAGES --------------------
+
+
+#each stage takes the state left by the ones before it and returns the number of rows it produced
+def load_workbook(state):
+    state['workbook'] = PortfolioWorkbook(state['path'])
+    frames = state['workbook'].frames()
+    return sum(len(df) for df in frames.values())
+
+
+def parse_buildings(state):
+    state['portfolio'] = get_buildings(state['workbook'])
+    return len(state['portfolio'].buildings)
+
+
+def ingest_meters(state):
+    get_meters(state['workbook'], state['portfolio'])
+    return len(state['workbook'].frame('Meter Entries'))
+
+
+def lookup_factors(state):
+    buildings = state['portfolio'].buildings
+    state['factors'] = get_factors_batch(
+        [b.fuel_types for b in buildings],
+        [b.country for b in buildings],
+        [b.postal for b in buildings]
+    )
+    return len(buildings)
+
+
+def resample(state):
+    state['portfolio'].cube = build_monthly_cube(state['portfolio'].buildings)
+    return len(state['portfolio'].cube)
+
+
+def blend(state):
+    state['Blend'] = fill_blend(state['portfolio'].cube)
+    return len(state['Blend'])
+
+
+def complete(state):
+    state['Complete'] = fill_complete(state['portfolio'].cube)
+    return len(state['Complete'])
+
+
+def latest(state):
+    return len(fill_latest(state['portfolio'].cube, state['year']))
+
+
+def compile_output(state):
+    state['portfolio'].filled = {'Blend': state['Blend'], 'Complete': state['Complete']}
+    state['records'] = compile_records(state['portfolio'], 'Blend')
+    return len(state['records'])
+
+
+def export_excel(state):
+    create_excel(state['records'], io.BytesIO())
+    return len(state['records'])
+
+
+def export_parquet(state):
+    export_table(records_table(state['records']), 'Parquet', io.BytesIO())
+    return len(state['records'])
+
+
+stages = {
+    'workbook load': load_workbook,
+    'building parse': parse_buildings,
+    'meter ingestion': ingest_meters,
+    'factor lookup': lookup_factors,
+    'resampling': resample,
+    'fill Blend': blend,
+    'fill Complete': complete,
+    'fill Latest': latest,
+    'compile records': compile_output,
+    'export xlsx': export_excel,
+    'export parquet': export_parquet
+}
+
+
+
+
+#-------------------- BENCHMARK FUNCTIONS --------------------
+
+
+#wall time of every stage, run without tracing so the timings aren't skewed
+def time_stages(path, year):
+    state = {'path': path, 'year': year}
+    timings = {}
+    for name, stage in stages.items():
+        start = time.perf_counter()
+        rows = stage(state)
+        timings[name] = (time.perf_counter() - start, rows)
+    return timings
+
+
+#peak traced memory of every stage, each measured from the memory already held before it
+def trace_stages(path, year):
+    state = {'path': path, 'year': year}
+    peaks = {}
+    tracemalloc.start()
+    for name, stage in stages.items():
+        tracemalloc.reset_peak()
+        held = tracemalloc.get_traced_memory()[0]
+        stage(state)
+        peaks[name] = (tracemalloc.get_traced_memory()[1] - held) / 1024 ** 2
+    tracemalloc.stop()
+    return peaks
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+#tracing slows the workbook load down several times, memory=False skips that pass
+def run_benchmark(path, repeat=3, year=None, memory=True):
+    year = datetime.date.today().year - 1 if year is None else year
+    runs = [time_stages(path, year) for i in range(repeat)]
+    peaks = trace_stages(path, year) if memory else {name: None for name in stages}
+    results = {}
+    for name in stages:
+        seconds = statistics.median(run[name][0] for run in runs)
+        rows = runs[0][name][1]
+        results[name] = {
+            'seconds': round(seconds, 6),
+            'rows': rows,
+            'rows_per_second': round(rows / seconds, 1) if seconds > 0 else None,
+            'peak_mb': None if peaks[name] is None else round(peaks[name], 3)
+        }
+    return {
+        'commit': git_commit(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'workbook': os.path.basename(path),
+        'repeat': repeat,
+        'stages': results,
+        'total_seconds': round(sum(r['seconds'] for r in results.values()), 6)
+    }
+
+
+#stage by stage ratio of two result files, above 1 is slower than the baseline
+def compare(baseline, current):
+    rows = []
+    for name, stage in current['stages'].items():
+        before = baseline['stages'].get(name)
+        ratio = None if before is None or before['seconds'] == 0 else stage['seconds'] / before['seconds']
+        rows.append([name, None if before is None else before['seconds'], stage['seconds'], ratio])
+    return pd.DataFrame(rows, columns=['stage', 'baseline_s', 'current_s', 'ratio'])
+
+
+
+
+#-------------------- MAIN EXECUTION --------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time and memory-profile each stage of the conversion.')
+    parser.add_argument('-w', '--workbook', default=None, help='export to benchmark, a synthetic one is generated by default')
+    parser.add_argument('-b', '--buildings', type=int, default=500, help='size of the synthetic export')
+    parser.add_argument('-m', '--meters', type=int, default=3, help='meters per building of the synthetic export')
+    parser.add_argument('-y', '--years', type=int, default=3, help='years of history of the synthetic export')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='timed runs, the median is kept')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='skip the traced memory pass')
+    parser.add_argument('-o', '--out', default=None, help='write the results to this JSON file')
+    parser.add_argument('-c', '--compare', default=None, help='earlier results to compare against')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.workbook
+        if path is None:
+            path = os.path.join(directory, f'synthetic_{args.buildings}.xlsx')
+            generate_workbook(path, args.buildings, args.meters, args.years, seed=0)
+        results = run_benchmark(path, args.repeat, memory=args.memory)
+        results['synthetic'] = None if args.workbook is not None else {
+            'buildings': args.buildings, 'meters_per_building': args.meters, 'years': args.years
+        }
+
+    table = pd.DataFrame(results['stages']).T
+    print(table.to_string())
+    print(f"total {results['total_seconds']:.3f}s")
+    if args.out is not None:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare is not None:
+        with open(args.compare) as f:
+            print(compare(json.load(f), results).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
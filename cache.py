@@ -0,0 +1,179 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import pandas as pd
+from emissions_factors import factor_store
+from energy_star import StageTimer, logger, pipeline_version, process_workbook, restore_portfolio
+
+
+
+
+#-------------------- MAIN CLASSES --------------------
+
+
+#Processed portfolios on disk, keyed by the SHA-256 of the uploaded bytes and the pipeline version.
+#Every entry is a directory of parquet tables. Reading an entry touches it, and the least recently
+#used entries are removed once the total size goes over max_bytes. A label, such as the file name,
+#points to the last entry stored under it, so a new export of the same portfolio can reuse the
+#buildings that didn't change.
+class PortfolioCache:
+    def __init__(self, path, max_bytes=1024 ** 3):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    #a new eGRID vintage starts over as well, the same as a new pipeline version
+    @staticmethod
+    def key(data):
+        digest = hashlib.sha256(f'energy-star-v{pipeline_version}-egrid{factor_store.latest}:'.encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def entry(self, key):
+        return os.path.join(self._path, key)
+
+    def has(self, key):
+        return os.path.isdir(self.entry(key))
+
+    #what wrote an entry, a labelled entry from an older pipeline or vintage is not reused
+    @staticmethod
+    def manifest():
+        return {'pipeline_version': pipeline_version, 'egrid': factor_store.latest}
+
+    def get(self, key, pool=None, chunk_size=1000):
+        portfolio = self.read(key, pool, chunk_size)
+        if portfolio is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return portfolio
+
+    #same as get without counting, used for the previous run of a labelled export
+    def read(self, key, pool=None, chunk_size=1000):
+        if key is None:
+            return None
+        entry = self.entry(key)
+        try:
+            with open(os.path.join(entry, 'manifest.json')) as f:
+                if json.load(f) != self.manifest():
+                    return None
+            tables = {
+                file[:-len('.parquet')]: pd.read_parquet(os.path.join(entry, file))
+                for file in os.listdir(entry) if file.endswith('.parquet')
+            }
+            os.utime(entry)
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        #an entry that can't be restored is treated as missing, the workbook is then processed again
+        try:
+            return restore_portfolio(tables, pool, chunk_size)
+        except Exception:
+            logger.exception(f'Cache entry {key} could not be restored')
+            return None
+
+    def labels(self):
+        try:
+            with open(os.path.join(self._path, 'labels.json')) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def set_label(self, label, key):
+        labels = self.labels()
+        labels[label] = key
+        staging = os.path.join(self._path, f'.labels-{os.getpid()}.json')
+        with open(staging, 'w') as f:
+            json.dump(labels, f)
+        os.replace(staging, os.path.join(self._path, 'labels.json'))
+
+    #written to a temporary directory and renamed into place, so readers never see half an entry
+    def put(self, key, portfolio):
+        entry = self.entry(key)
+        if os.path.isdir(entry):
+            return
+        staging = tempfile.mkdtemp(prefix=f'.{key}-', dir=self._path)
+        try:
+            for name, table in portfolio.to_tables().items():
+                table.to_parquet(os.path.join(staging, f'{name}.parquet'), index=False)
+            with open(os.path.join(staging, 'manifest.json'), 'w') as f:
+                json.dump(self.manifest(), f)
+            os.rename(staging, entry)
+        except OSError:
+            #another process stored the same upload first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+
+    #the portfolio for an uploaded workbook, parsed only when it isn't stored yet
+    #pool is an optional process pool the fill methods are spread over, see fill_table_parallel,
+    #chunk_rows streams the Meter Entries sheet in chunks of that many rows, see stream_workbook
+    def load(self, data, key=None, label=None, timer=None, pool=None, chunk_size=1000, chunk_rows=None):
+        timer = StageTimer() if timer is None else timer
+        key = self.key(data) if key is None else key
+        with timer.stage('cache') as stage:
+            portfolio = self.get(key, pool, chunk_size)
+            stage['rows'] = None if portfolio is None else len(portfolio.buildings)
+        if portfolio is None:
+            #an entry under this key that couldn't be read is replaced
+            if self.has(key):
+                shutil.rmtree(self.entry(key), ignore_errors=True)
+            previous = None if label is None or chunk_rows is not None else self.read(self.labels().get(label), pool, chunk_size)
+            portfolio = process_workbook(io.BytesIO(data), previous, timer, pool, chunk_size, chunk_rows)
+            with timer.stage('cache write'):
+                self.put(key, portfolio)
+        portfolio.stages = timer.stages
+        if label is not None:
+            self.set_label(label, key)
+        return portfolio
+
+    #(key, bytes, last used) of every stored entry, oldest first
+    def entries(self):
+        found = []
+        for key in os.listdir(self._path):
+            entry = self.entry(key)
+            if key.startswith('.') or not os.path.isdir(entry):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry))
+                found.append((key, size, os.stat(entry).st_mtime))
+            except FileNotFoundError:
+                continue
+        return sorted(found, key=lambda e: e[2])
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(e[1] for e in entries)
+        for key, size, used in entries:
+            if total <= self._max_bytes:
+                break
+            shutil.rmtree(self.entry(key), ignore_errors=True)
+            total -= size
+
+    def stats(self):
+        entries = self.entries()
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'entries': len(entries),
+            'bytes': sum(e[1] for e in entries)
+        }
@@ -1,47 +1,173 @@
-subregions = {'00001': 'AKMS', '00002': 'AKMS', '00003': 'AKMS', '00004': 'AKMS', '00005': 'AKMS', '00006': 'AKGD', '00007': 'AKMS', '00008': 'AKMS', '00009': 'AKMS', '00010': 'AKMS', '00011': 'AKGD', '00012': 'CAMX', '00013': 'HIMS', '00014': 'AZNM', '00015': 'AZNM', '00016': 'CAMX', '00017': 'CAMX', '00018': 'CAMX', '00019': 'CAMX', '00020': 'CAMX', '00022': 'CAMX', '00026': 'CAMX', '00027': 'RMPA', '00028': 'CAMX', '00029': 'CAMX', '00031': 'CAMX', '00032': 'CAMX', '00033': 'CAMX', '00034': 'NWPP', '00035': 'NWPP', '00037': 'CAMX', '00038': 'CAMX', '00039': 'CAMX', '00040': 'CAMX', '00041': 'FRCC', '00042': 'FRCC', '00043': 'FRCC', '00044': 'CAMX', '00045': 'FRCC', '00047': 'CAMX', '00048': 'CAMX', '00049': 'NWPP', '00050': 'CAMX', '00051': 'CAMX', '00052': 'CAMX', '00053': 'FRCC', '00054': 'CAMX', '00055': 'CAMX', '00056': 'NWPP', '00057': 'CAMX', '00058': 'CAMX', '00059': 'MROW', '00060': 'MROW', '00061': 'CAMX', '00063': 'NWPP', '00064': 'AZNM', '00065': 'CAMX', '00066': 'AZNM', '00067': 'SPSO', '00068': 'NWPP', '00069': 'NWPP', '00070': 'NWPP', '00071': 'NWPP', '00072': 'NWPP', '00073': 'NWPP', '00074': 'NWPP', '00076': 'NWPP', '00077': 'NWPP', '00084': 'SRVC', '00087': 'FRCC', '00097': 'FRCC', '00098': 'FRCC', '00100': 'NWPP', '00116': 'SRMV', '00119': 'SRMV', '00120': 'SRMV', '00121': 'SRMV', '00125': 'NEWE', '00126': 'NEWE', '00127': 'NEWE', '00128': 'NEWE', '00130': 'NEWE', '00132': 'NEWE', '00133': 'NEWE', '00134': 'NEWE', '00135': 'NEWE', '00137': 'NEWE', '00138': 'NEWE', '00139': 'NEWE', '00141': 'NEWE', '00148': 'NEWE', '00151': 'NEWE', '00152': 'RFCE', '00158': 'NEWE', '00160': 'MROW', '00161': 'MROW', '00164': 'MROW', '00165': 'MROW', '00166': 'MROW', '00168': 'NEWE', '00172': 'NEWE', '00173': 'NEWE', '00174': 'NEWE', '00176': 'NEWE', '00177': 'NEWE', '00179': 'NEWE', '00180': 'NEWE', '00181': 'NEWE', '00182': 'NEWE', '00183': 'NEWE', '00184': 'NEWE', '00185': 'NEWE', '00188': 'ERCT', '00195': 'NWPP', '00197': 'AZNM', '00198': 'AKGD', '00199': 'AZNM', '00501': 'NYLI', '00544': 'NYLI', '00601': 'PRMS', '00602': 'PRMS', '00603': 'PRMS', '00604': 'PRMS', '00605': 'PRMS', '00606': 'PRMS', '00610': 'PRMS', '00611': 'PRMS', '00612': 'PRMS', '00613': 'PRMS', '00614': 'PRMS', '00616': 'PRMS', '00617': 'PRMS', '00622': 'PRMS', '00623': 'PRMS', '00624': 'PRMS', '00627': 'PRMS', '00631': 'PRMS', '00636': 'PRMS', '00637': 'PRMS', '00638': 'PRMS', '00641': 'PRMS', '00646': 'PRMS', '00647': 'PRMS', '00650': 'PRMS', '00652': 'PRMS', '00653': 'PRMS', '00656': 'PRMS', '00659': 'PRMS', '00660': 'PRMS', '00662': 'PRMS', '00664': 'PRMS', '00667': 'PRMS', '00669': 'PRMS', '00670': 'PRMS', '00674': 'PRMS', '00676': 'PRMS', '00677': 'PRMS', '00678': 'PRMS', '00680': 'PRMS', '00681': 'PRMS', '00682': 'PRMS', '00683': 'PRMS', '00685': 'PRMS', '00687': 'PRMS', '00688': 'PRMS', '00690': 'PRMS', '00692': 'PRMS', '00693': 'PRMS', '00694': 'PRMS', '00698': 'PRMS', '00703': 'PRMS', '00704': 'PRMS', '00705': 'PRMS', '00707': 'PRMS', '00714': 'PRMS', '00715': 'PRMS', '00716': 'PRMS', '00717': 'PRMS', '00718': 'PRMS', '00719': 'PRMS', '00720': 'PRMS', '00721': 'PRMS', '00723': 'PRMS', '00725': 'PRMS', '00726': 'PRMS', '00727': 'PRMS', '00728': 'PRMS', '00729': 'PRMS', '00730': 'PRMS', '00731': 'PRMS', '00732': 'PRMS', '00733': 'PRMS', '00734': 'PRMS', '00735': 'PRMS', '00736': 'PRMS', '00737': 'PRMS', '00738': 'PRMS', '00739': 'PRMS', '00740': 'PRMS', '00741': 'PRMS', '00742': 'PRMS', '00744': 'PRMS', '00745': 'PRMS', '00751': 'PRMS', '00754': 'PRMS', '00757': 'PRMS', '00765': 'PRMS', '00766': 'PRMS', '00767': 'PRMS', '00769': 'PRMS', '00771': 'PRMS', '00772': 'PRMS', '00773': 'PRMS', '00775': 'PRMS', '00777': 'PRMS', '00778': 'PRMS', '00780': 'PRMS', '00782': 'PRMS', '00783': 'PRMS', '00784': 'PRMS', '00785': 'PRMS', '00786': 'PRMS', '00791': 'PRMS', '00792': 'PRMS', '00794': 'PRMS', '00795': 'PRMS', '00901': 'PRMS', '00902': 'PRMS', '00906': 'PRMS', '00907': 'PRMS', '00908': 'PRMS', '00909': 'PRMS', '00910': 'PRMS', '00911': 'PRMS', '00912': 'PRMS', '00913': 'PRMS', '00914': 'PRMS', '00915': 'PRMS', '00916': 'PRMS', '00917': 'PRMS', '00918': 'PRMS', '00919': 'PRMS', '00920': 'PRMS', '00921': 'PRMS', '00922': 'PRMS', '00923': 'PRMS', '00924': 'PRMS', '00925': 'PRMS', '00926': 'PRMS', '00927': 'PRMS', '00928': 'PRMS', '00929': 'PRMS', '00930': 'PRMS', '00931': 'PRMS', '00933': 'PRMS', '00934': 'PRMS', '00935': 'PRMS', '00936': 'PRMS', '00937': 'PRMS', '00939': 'PRMS', '00940': 'PRMS', '00949': 'PRMS', '00950': 'PRMS', '00951': 'PRMS', '00952': 'PRMS', '00953': 'PRMS', '00954': 'PRMS', '00955': 'PRMS', '00956': 'PRMS', '00957': 'PRMS', '00958': 'PRMS', '00959': 'PRMS', '00960': 'PRMS', '00961': 'PRMS', '00962': 'PRMS', '00963': 'PRMS', '00965': 'PRMS', '00966': 'PRMS', '00968': 'PRMS', '00969': 'PRMS', '00970': 'PRMS', '00971': 'PRMS', '00975': 'PRMS', '00976': 'PRMS', '00977': 'PRMS', '00978': 'PRMS', '00979': 'PRMS', '00981': 'PRMS', '00982': 'PRMS', '00983': 'PRMS', '00984': 'PRMS', '00985': 'PRMS', '00986': 'PRMS', '00987': 'PRMS', '00988': 'PRMS', '01001': 'NEWE', '01002': 'NEWE', '01003': 'NEWE', '01004': 'NEWE', '01005': 'NEWE', '01007': 'NEWE', '01008': 'NEWE', '01009': 'NEWE', '01010': 'NEWE', '01011': 'NEWE', '01012': 'NEWE', '01013': 'NEWE', '01014': 'NEWE', '01020': 'NEWE', '01021': 'NEWE', '01022': 'NEWE', '01026': 'NEWE', '01027': 'NEWE', '01028': 'NEWE', '01029': 'NEWE', '01030': 'NEWE', '01031': 'NEWE', '01032': 'NEWE', '01033': 'NEWE', '01034': 'NEWE', '01035': 'NEWE', '01036': 'NEWE', '01037': 'NEWE', '01038': 'NEWE', '01039': 'NEWE', '01040': 'NEWE', '01041': 'NEWE', '01050': 'NEWE', '01053': 'NEWE', '01054': 'NEWE', '01056': 'NEWE', '01057': 'NEWE', '01059': 'NEWE', '01060': 'NEWE', '01061': 'NEWE', '01062': 'NEWE', '01063': 'NEWE', '01066': 'NEWE', '01068': 'NEWE', '01069': 'NEWE', '01070': 'NEWE', '01071': 'NEWE', '01072': 'NEWE', '01073': 'NEWE', '01074': 'NEWE', '01075': 'NEWE', '01077': 'NEWE', '01079': 'NEWE', '01080': 'NEWE', '01081': 'NEWE', '01082': 'NEWE', '01083': 'NEWE', '01084': 'NEWE', '01085': 'NEWE', '01086': 'NEWE', '01088': 'NEWE', '01089': 'NEWE', '01090': 'NEWE', '01092': 'NEWE', '01093': 'NEWE', '01094': 'NEWE', '01095': 'NEWE', '01096': 'NEWE', '01097': 'NEWE', '01098': 'NEWE', '01101': 'NEWE', '01102': 'NEWE', '01103': 'NEWE', '01104': 'NEWE', '01105': 'NEWE', '01106': 'NEWE', '01107': 'NEWE', '01108': 'NEWE', '01109': 'NEWE', '01111': 'NEWE', '01115': 'NEWE', '01116': 'NEWE', '01118': 'NEWE', '01119': 'NEWE', '01128': 'NEWE', '01129': 'NEWE', '01138': 'NEWE', '01139': 'NEWE', '01144': 'NEWE', '01151': 'NEWE', '01152': 'NEWE', '01199': 'NEWE', '01201': 'NEWE', '01202': 'NEWE', '01203': 'NEWE', '01220': 'NEWE', '01222': 'NEWE', '01223': 'NEWE', '01224': 'NEWE', '01225': 'NEWE', '01226': 'NEWE', '01227': 'NEWE', '01229': 'NEWE', '01230': 'NEWE', '01235': 'NEWE', '01236': 'NEWE', '01237': 'NEWE', '01238': 'NEWE', '01240': 'NEWE', '01242': 'NEWE', '01243': 'NEWE', '01244': 'NEWE', '01245': 'NEWE', '01247': 'NEWE', '01252': 'NEWE', '01253': 'NEWE', '01254': 'NEWE', '01255': 'NEWE', '01256': 'NEWE', '01257': 'NEWE', '01258': 'NEWE', '01259': 'NEWE', '01260': 'NEWE', '01262': 'NEWE', '01263': 'NEWE', '01264': 'NEWE', '01266': 'NEWE', '01267': 'NEWE', '01270': 'NEWE', '01301': 'NEWE', '01302': 'NEWE', '01330': 'NEWE', '01331': 'NEWE', '01337': 'NEWE', '01338': 'NEWE', '01339': 'NEWE', '01340': 'NEWE', '01341': 'NEWE', '01342': 'NEWE', '01343': 'NEWE', '01344': 'NEWE', '01346': 'NEWE', '01347': 'NEWE', '01349': 'NEWE', '01350': 'NEWE', '01351': 'NEWE', '01354': 'NEWE', '01355': 'NEWE', '01360': 'NEWE', '01364': 'NEWE', '01366': 'NEWE', '01367': 'NEWE', '01368': 'NEWE', '01370': 'NEWE', '01373': 'NEWE', '01375': 'NEWE', '01376': 'NEWE', '01378': 'NEWE', '01379': 'NEWE', '01380': 'NEWE', '01420': 'NEWE', '01430': 'NEWE', '01431': 'NEWE', '01432': 'NEWE', '01434': 'NEWE', '01436': 'NEWE', '01438': 'NEWE', '01440': 'NEWE', '01441': 'NEWE', '01450': 'NEWE', '01451': 'NEWE', '01452': 'NEWE', '01453': 'NEWE', '01460': 'NEWE', '01462': 'NEWE', '01463': 'NEWE', '01464': 'NEWE', '01467': 'NEWE', '01468': 'NEWE', '01469': 'NEWE', '01470': 'NEWE', '01471': 'NEWE', '01472': 'NEWE', '01473': 'NEWE', '01474': 'NEWE', '01475': 'NEWE', '01477': 'NEWE', '01501': 'NEWE', '01503': 'NEWE', '01504': 'NEWE', '01505': 'NEWE', '01506': 'NEWE', '01507': 'NEWE', '01508': 'NEWE', '01509': 'NEWE', '01510': 'NEWE', '01515': 'NEWE', '01516': 'NEWE', '01517': 'NEWE', '01518': 'NEWE', '01519': 'NEWE', '01520': 'NEWE', '01521': 'NEWE', '01522': 'NEWE', '01523': 'NEWE', '01524': 'NEWE', '01525': 'NEWE', '01526': 'NEWE', '01527': 'NEWE', '01529': 'NEWE', '01531': 'NEWE', '01532': 'NEWE', '01534': 'NEWE', '01535': 'NEWE', '01536': 'NEWE', '01537': 'NEWE', '01538': 'NEWE', '01540': 'NEWE', '01541': 'NEWE', '01542': 'NEWE', '01543': 'NEWE', '01545': 'NEWE', '01546': 'NEWE', '01550': 'NEWE', '01560': 'NEWE', '01561': 'NEWE', '01562': 'NEWE', '01564': 'NEWE', '01566': 'NEWE', '01568': 'NEWE', '01569': 'NEWE', '01570': 'NEWE', '01571': 'NEWE', '01580': 'NEWE', '01581': 'NEWE', '01582': 'NEWE', '01583': 'NEWE', '01585': 'NEWE', '01586': 'NEWE', '01588': 'NEWE', '01590': 'NEWE', '01601': 'NEWE', '01602': 'NEWE', '01603': 'NEWE', '01604': 'NEWE', '01605': 'NEWE', '01606': 'NEWE', '01607': 'NEWE', '01608': 'NEWE', '01609': 'NEWE', '01610': 'NEWE', '01611': 'NEWE', '01612': 'NEWE', '01613': 'NEWE', '01614': 'NEWE', '01615': 'NEWE', '01653': 'NEWE', '01654': 'NEWE', '01655': 'NEWE', '01701': 'NEWE', '01702': 'NEWE', '01703': 'NEWE', '01704': 'NEWE', '01705': 'NEWE', '01718': 'NEWE', '01719': 'NEWE', '01720': 'NEWE', '01721': 'NEWE', '01730': 'NEWE', '01731': 'NEWE', '01740': 'NEWE', '01741': 'NEWE', '01742': 'NEWE', '01745': 'NEWE', '01746': 'NEWE', '01747': 'NEWE', '01748': 'NEWE', '01749': 'NEWE', '01752': 'NEWE', '01754': 'NEWE', '01756': 'NEWE', '01757': 'NEWE', '01760': 'NEWE', '01770': 'NEWE', '01772': 'NEWE', '01773': 'NEWE', '01775': 'NEWE', '01776': 'NEWE', '01778': 'NEWE', '01784': 'NEWE', '01801': 'NEWE', '01803': 'NEWE', '01805': 'NEWE', '01807': 'NEWE', '01810': 'NEWE', '01812': 'NEWE', '01813': 'NEWE', '01815': 'NEWE', '01821': 'NEWE', '01822': 'NEWE', '01824': 'NEWE', '01826': 'NEWE', '01827': 'NEWE', '01830': 'NEWE', '01831': 'NEWE', '01832': 'NEWE', '01833': 'NEWE', '01834': 'NEWE', '01835': 'NEWE', '01840': 'NEWE', '01841': 'NEWE', '01842': 'NEWE', '01843': 'NEWE', '01844': 'NEWE', '01845': 'NEWE', '01850': 'NEWE', '01851': 'NEWE', '01852': 'NEWE', '01853': 'NEWE', '01854': 'NEWE', '01860': 'NEWE', '01862': 'NEWE', '01863': 'NEWE', '01864': 'NEWE', '01865': 'NEWE', '01866': 'NEWE', '01867': 'NEWE', '01876': 'NEWE', '01879': 'NEWE', '01880': 'NEWE', '01885': 'NEWE', '01886': 'NEWE', '01887': 'NEWE', '01888': 'NEWE', '01889': 'NEWE', '01890': 'NEWE', '01899': 'NEWE', '01901': 'NEWE', '01902': 'NEWE', '01903': 'NEWE', '01904': 'NEWE', '01905': 'NEWE', '01906': 'NEWE', '01907': 'NEWE', '01908': 'NEWE', '01910': 'NEWE', '01913': 'NEWE', '01915': 'NEWE', '01921': 'NEWE', '01922': 'NEWE', '01923': 'NEWE', '01929': 'NEWE', '01930': 'NEWE', '01931': 'NEWE', '01936': 'NEWE', '01937': 'NEWE', '01938': 'NEWE', '01940': 'NEWE', '01944': 'NEWE', '01945': 'NEWE', '01949': 'NEWE', '01950': 'NEWE', '01951': 'NEWE', '01952': 'NEWE', '01960': 'NEWE', '01961': 'NEWE', '01965': 'NEWE', '01966': 'NEWE', '01969': 'NEWE', '01970': 'NEWE', '01971': 'NEWE', '01982': 'NEWE', '01983': 'NEWE', '01984': 'NEWE', '01985': 'NEWE', '02018': 'NEWE', '02019': 'NEWE', '02020': 'NEWE', '02021': 'NEWE', '02025': 'NEWE', '02026': 'NEWE', '02027': 'NEWE', '02030': 'NEWE', '02032': 'NEWE', '02035': 'NEWE', '02038': 'NEWE', '02040': 'NEWE', '02041': 'NEWE', '02043': 'NEWE', '02044': 'NEWE', '02045': 'NEWE', '02047': 'NEWE', '02048': 'NEWE', '02050': 'NEWE', '02051': 'NEWE', '02052': 'NEWE', '02053': 'NEWE', '02054': 'NEWE', '02055': 'NEWE', '02056': 'NEWE', '02059': 'NEWE', '02060': 'NEWE', '02061': 'NEWE', '02062': 'NEWE', '02065': 'NEWE', '02066': 'NEWE', '02067': 'NEWE', '02070': 'NEWE', '02071': 'NEWE', '02072': 'NEWE', '02081': 'NEWE', '02090': 'NEWE', '02093': 'NEWE', '02101': 'NEWE', '02108': 'NEWE', '02109': 'NEWE', '02110': 'NEWE', '02111': 'NEWE', '02112': 'NEWE', '02113': 'NEWE', '02114': 'NEWE', '02115': 'NEWE', '02116': 'NEWE', '02117': 'NEWE', '02118': 'NEWE', '02119': 'NEWE', '02120': 'NEWE', '02121': 'NEWE', '02122': 'NEWE', '02123': 'NEWE', '02124': 'NEWE', '02125': 'NEWE', '02126': 'NEWE', '02127': 'NEWE', '02128': 'NEWE', '02129': 'NEWE', '02130': 'NEWE', '02131': 'NEWE', '02132': 'NEWE', '02133': 'NEWE', '02134': 'NEWE', '02135': 'NEWE', '02136': 'NEWE', '02137': 'NEWE', '02138': 'NEWE', '02139': 'NEWE', '02140': 'NEWE', '02141': 'NEWE', '02142': 'NEWE', '02143': 'NEWE', '02144': 'NEWE', '02145': 'NEWE', '02148': 'NEWE', '02149': 'NEWE', '02150': 'NEWE', '02151': 'NEWE', '02152': 'NEWE', '02153': 'NEWE', '02155': 'NEWE', '02156': 'NEWE', '02163': 'NEWE', '02169': 'NEWE', '02170': 'NEWE', '02171': 'NEWE', '02176': 'NEWE', '02180': 'NEWE', '02184': 'NEWE', '02185': 'NEWE', '02186': 'NEWE', '02187': 'NEWE', '02188': 'NEWE', '02189': 'NEWE', '02190': 'NEWE', '02191': 'NEWE', '02196': 'NEWE', '02199': 'NEWE', '02201': 'NEWE', '02203': 'NEWE', '02204': 'NEWE', '02205': 'NEWE', '02206': 'NEWE', '02210': 'NEWE', '02211': 'NEWE', '02212': 'NEWE', '02215': 'NEWE', '02217': 'NEWE', '02222': 'NEWE', '02228': 'NEWE', '02238': 'NEWE', '02241': 'NEWE', '02266': 'NEWE', '02269': 'NEWE', '02283': 'NEWE', '02284': 'NEWE', '02293': 'NEWE', '02295': 'NEWE', '02297': 'NEWE', '02298': 'NEWE', '02301': 'NEWE', '02302': 'NEWE', '02303': 'NEWE', '02304': 'NEWE', '02305': 'NEWE', '02322': 'NEWE', '02324': 'NEWE', '02325': 'NEWE', '02327': 'NEWE', '02330': 'NEWE', '02331': 'NEWE', '02332': 'NEWE', '02333': 'NEWE', '02334': 'NEWE', '02337': 'NEWE', '02338': 'NEWE', '02339': 'NEWE', '02340': 'NEWE', '02341': 'NEWE', '02343': 'NEWE', '02344': 'NEWE', '02345': 'NEWE', '02346': 'NEWE', '02347': 'NEWE', '02348': 'NEWE', '02349': 'NEWE', '02350': 'NEWE', '02351': 'NEWE', '02355': 'NEWE', '02356': 'NEWE', '02357': 'NEWE', '02358': 'NEWE', '02359': 'NEWE', '02360': 'NEWE', '02361': 'NEWE', '02362': 'NEWE', '02364': 'NEWE', '02366': 'NEWE', '02367': 'NEWE', '02368': 'NEWE', '02370': 'NEWE', '02375': 'NEWE', '02379': 'NEWE', '02381': 'NEWE', '02382': 'NEWE', '02420': 'NEWE', '02421': 'NEWE', '02445': 'NEWE', '02446': 'NEWE', '02447': 'NEWE', '02451': 'NEWE', '02452': 'NEWE', '02453': 'NEWE', '02454': 'NEWE', '02455': 'NEWE', '02456': 'NEWE', '02457': 'NEWE', '02458': 'NEWE', '02459': 'NEWE', '02460': 'NEWE', '02461': 'NEWE', '02462': 'NEWE', '02464': 'NEWE', '02465': 'NEWE', '02466': 'NEWE', '02467': 'NEWE', '02468': 'NEWE', '02471': 'NEWE', '02472': 'NEWE', '02474': 'NEWE', '02475': 'NEWE', '02476': 'NEWE', '02477': 'NEWE', '02478': 'NEWE', '02479': 'NEWE', '02481': 'NEWE', '02482': 'NEWE', '02492': 'NEWE', '02493': 'NEWE', '02494': 'NEWE', '02495': 'NEWE', '02532': 'NEWE', '02534': 'NEWE', '02535': 'NEWE', '02536': 'NEWE', '02537': 'NEWE', '02538': 'NEWE', '02539': 'NEWE', '02540': 'NEWE', '02541': 'NEWE', '02542': 'NEWE', '02543': 'NEWE', '02552': 'NEWE', '02553': 'NEWE', '02554': 'NEWE', '02556': 'NEWE', '02557': 'NEWE', '02558': 'NEWE', '02559': 'NEWE', '02561': 'NEWE', '02562': 'NEWE', '02563': 'NEWE', '02564': 'NEWE', '02565': 'NEWE', '02568': 'NEWE', '02571': 'NEWE', '02573': 'NEWE', '02574': 'NEWE', '02575': 'NEWE', '02576': 'NEWE', '02584': 'NEWE', '02601': 'NEWE', '02630': 'NEWE', '02631': 'NEWE', '02632': 'NEWE', '02633': 'NEWE', '02634': 'NEWE', '02635': 'NEWE', '02637': 'NEWE', '02638': 'NEWE', '02639': 'NEWE', '02641': 'NEWE', '02642': 'NEWE', '02643': 'NEWE', '02644': 'NEWE', '02645': 'NEWE', '02646': 'NEWE', '02647': 'NEWE', '02648': 'NEWE', '02649': 'NEWE', '02650': 'NEWE', '02651': 'NEWE', '02652': 'NEWE', '02653': 'NEWE', '02655': 'NEWE', '02657': 'NEWE', '02659': 'NEWE', '02660': 'NEWE', '02661': 'NEWE', '02662': 'NEWE', '02663': 'NEWE', '02664': 'NEWE', '02666': 'NEWE', '02667': 'NEWE', '02668': 'NEWE', '02669': 'NEWE', '02670': 'NEWE', '02671': 'NEWE', '02672': 'NEWE', '02673': 'NEWE', '02675': 'NEWE', '02702': 'NEWE', '02703': 'NEWE', '02712': 'NEWE', '02713': 'NEWE', '02714': 'NEWE', '02715': 'NEWE', '02717': 'NEWE', '02718': 'NEWE', '02719': 'NEWE', '02720': 'NEWE', '02721': 'NEWE', '02722': 'NEWE', '02723': 'NEWE', '02724': 'NEWE', '02725': 'NEWE', '02726': 'NEWE', '02738': 'NEWE', '02739': 'NEWE', '02740': 'NEWE', '02741': 'NEWE', '02742': 'NEWE', '02743': 'NEWE', '02744': 'NEWE', '02745': 'NEWE', '02746': 'NEWE', '02747': 'NEWE', '02748': 'NEWE', '02760': 'NEWE', '02761': 'NEWE', '02762': 'NEWE', '02763': 'NEWE', '02764': 'NEWE', '02766': 'NEWE', '02767': 'NEWE', '02768': 'NEWE', '02769': 'NEWE', '02770': 'NEWE', '02771': 'NEWE', '02777': 'NEWE', '02779': 'NEWE', '02780': 'NEWE', '02783': 'NEWE', '02790': 'NEWE', '02791': 'NEWE', '02801': 'NEWE', '02802': 'NEWE', '02804': 'NEWE', '02806': 'NEWE', '02807': 'NEWE', '02808': 'NEWE', '02809': 'NEWE', '02812': 'NEWE', '02813': 'NEWE', '02814': 'NEWE', '02815': 'NEWE', '02816': 'NEWE', '02817': 'NEWE', '02818': 'NEWE', '02822': 'NEWE', '02823': 'NEWE', '02824': 'NEWE', '02825': 'NEWE', '02826': 'NEWE', '02827': 'NEWE', '02828': 'NEWE', '02829': 'NEWE', '02830': 'NEWE', '02831': 'NEWE', '02832': 'NEWE', '02833': 'NEWE', '02835': 'NEWE', '02836': 'NEWE', '02837': 'NEWE', '02838': 'NEWE', '02839': 'NEWE', '02840': 'NEWE', '02841': 'NEWE', '02842': 'NEWE', '02852': 'NEWE', '02857': 'NEWE', '02858': 'NEWE', '02859': 'NEWE', '02860': 'NEWE', '02861': 'NEWE', '02862': 'NEWE', '02863': 'NEWE', '02864': 'NEWE', '02865': 'NEWE', '02871': 'NEWE', '02872': 'NEWE', '02873': 'NEWE', '02874': 'NEWE', '02875': 'NEWE', '02876': 'NEWE', '02877': 'NEWE', '02878': 'NEWE', '02879': 'NEWE', '02880': 'NEWE', '02881': 'NEWE', '02882': 'NEWE', '02883': 'NEWE', '02885': 'NEWE', '02886': 'NEWE', '02887': 'NEWE', '02888': 'NEWE', '02889': 'NEWE', '02891': 'NEWE', '02892': 'NEWE', '02893': 'NEWE', '02894': 'NEWE', '02895': 'NEWE', '02896': 'NEWE', '02898': 'NEWE', '02901': 'NEWE', '02902': 'NEWE', '02903': 'NEWE', '02904': 'NEWE', '02905': 'NEWE', '02906': 'NEWE', '02907': 'NEWE', '02908': 'NEWE', '02909': 'NEWE', '02910': 'NEWE', '02911': 'NEWE', '02912': 'NEWE', '02914': 'NEWE', '02915': 'NEWE', '02916': 'NEWE', '02917': 'NEWE', '02918': 'NEWE', '02919': 'NEWE', '02920': 'NEWE', '02921': 'NEWE', '02940': 'NEWE', '03031': 'NEWE', '03032': 'NEWE', '03033': 'NEWE', '03034': 'NEWE', '03036': 'NEWE', '03037': 'NEWE', '03038': 'NEWE', '03040': 'NEWE', '03041': 'NEWE', '03042': 'NEWE', '03043': 'NEWE', '03044': 'NEWE', '03045': 'NEWE', '03046': 'NEWE', '03047': 'NEWE', '03048': 'NEWE', '03049': 'NEWE', '03051': 'NEWE', '03052': 'NEWE', '03053': 'NEWE', '03054': 'NEWE', '03055': 'NEWE', '03057': 'NEWE', '03060': 'NEWE', '03061': 'NEWE', '03062': 'NEWE', '03063': 'NEWE', '03064': 'NEWE', '03070': 'NEWE', '03071': 'NEWE', '03073': 'NEWE', '03076': 'NEWE', '03077': 'NEWE', '03079': 'NEWE', '03082': 'NEWE', '03084': 'NEWE', '03086': 'NEWE', '03087': 'NEWE', '03101': 'NEWE', '03102': 'NEWE', '03103': 'NEWE', '03104': 'NEWE', '03105': 'NEWE', '03106': 'NEWE', '03107': 'NEWE', '03108': 'NEWE', '03109': 'NEWE', '03110': 'NEWE', '03111': 'NEWE', '03215': 'NEWE', '03216': 'NEWE', '03217': 'NEWE', '03218': 'NEWE', '03220': 'NEWE', '03221': 'NEWE', '03222': 'NEWE', '03223': 'NEWE', '03224': 'NEWE', '03225': 'NEWE', '03226': 'NEWE', '03227': 'NEWE', '03229': 'NEWE', '03230': 'NEWE', '03231': 'NEWE', '03233': 'NEWE', '03234': 'NEWE', '03235': 'NEWE', '03237': 'NEWE', '03238': 'NEWE', '03240': 'NEWE', '03241': 'NEWE', '03242': 'NEWE', '03243': 'NEWE', '03244': 'NEWE', '03245': 'NEWE', '03246': 'NEWE', '03247': 'NEWE', '03249': 'NEWE', '03251': 'NEWE', '03252': 'NEWE', '03253': 'NEWE', '03254': 'NEWE', '03255': 'NEWE', '03256': 'NEWE', '03257': 'NEWE', '03258': 'NEWE', '03259': 'NEWE', '03260': 'NEWE', '03261': 'NEWE', '03262': 'NEWE', '03263': 'NEWE', '03264': 'NEWE', '03266': 'NEWE', '03268': 'NEWE', '03269': 'NEWE', '03272': 'NEWE', '03273': 'NEWE', '03274': 'NEWE', '03275': 'NEWE', '03276': 'NEWE', '03278': 'NEWE', '03279': 'NEWE', '03280': 'NEWE', '03281': 'NEWE', '03282': 'NEWE', '03284': 'NEWE', '03285': 'NEWE', '03287': 'NEWE', '03289': 'NEWE', '03290': 'NEWE', '03291': 'NEWE', '03293': 'NEWE', '03298': 'NEWE', '03299': 'NEWE', '03301': 'NEWE', '03302': 'NEWE', '03303': 'NEWE', '03304': 'NEWE', '03305': 'NEWE', '03307': 'NEWE', '03431': 'NEWE', '03435': 'NEWE', '03440': 'NEWE', '03441': 'NEWE', '03442': 'NEWE', '03443': 'NEWE', '03444': 'NEWE', '03445': 'NEWE', '03446': 'NEWE', '03447': 'NEWE', '03448': 'NEWE', '03449': 'NEWE', '03450': 'NEWE', '03451': 'NEWE', '03452': 'NEWE', '03455': 'NEWE', '03456': 'NEWE', '03457': 'NEWE', '03458': 'NEWE', '03461': 'NEWE', '03462': 'NEWE', '03464': 'NEWE', '03465': 'NEWE', '03466': 'NEWE', '03467': 'NEWE', '03468': 'NEWE', '03469': 'NEWE', '03470': 'NEWE', '03561': 'NEWE', '03570': 'NEWE', '03574': 'NEWE', '03575': 'NEWE', '03576': 'NEWE', '03579': 'NEWE', '03580': 'NEWE', '03581': 'NEWE', '03582': 'NEWE', '03583': 'NEWE', '03584': 'NEWE', '03585': 'NEWE', '03586': 'NEWE', '03588': 'NEWE', '03589': 'NEWE', '03590': 'NEWE', '03592': 'NEWE', '03593': 'NEWE', '03595': 'NEWE', '03597': 'NEWE', '03598': 'NEWE', '03601': 'NEWE', '03602': 'NEWE', '03603': 'NEWE', '03604': 'NEWE', '03605': 'NEWE', '03607': 'NEWE', '03608': 'NEWE', '03609': 'NEWE', '03740': 'NEWE', '03741': 'NEWE', '03743': 'NEWE', '03745': 'NEWE', '03746': 'NEWE', '03748': 'NEWE', '03749': 'NEWE', '03750': 'NEWE', '03751': 'NEWE', '03752': 'NEWE', '03753': 'NEWE', '03754': 'NEWE', '03755': 'NEWE', '03756': 'NEWE', '03765': 'NEWE', '03766': 'NEWE', '03768': 'NEWE', '03769': 'NEWE', '03770': 'NEWE', '03771': 'NEWE', '03773': 'NEWE', '03774': 'NEWE', '03777': 'NEWE', '03779': 'NEWE', '03780': 'NEWE', '03781': 'NEWE', '03782': 'NEWE', '03784': 'NEWE', '03785': 'NEWE', '03801': 'NEWE', '03802': 'NEWE', '03803': 'NEWE', '03804': 'NEWE', '03805': 'NEWE', '03809': 'NEWE', '03810': 'NEWE', '03811': 'NEWE', '03812': 'NEWE', '03813': 'NEWE', '03814': 'NEWE', '03815': 'NEWE', '03816': 'NEWE', '03817': 'NEWE', '03818': 'NEWE', '03819': 'NEWE', '03820': 'NEWE', '03821': 'NEWE', '03822': 'NEWE', '03823': 'NEWE', '03824': 'NEWE', '03825': 'NEWE', '03826': 'NEWE', '03827': 'NEWE', '03830': 'NEWE', '03832': 'NEWE', '03833': 'NEWE', '03835': 'NEWE', '03836': 'NEWE', '03837': 'NEWE', '03838': 'NEWE', '03839': 'NEWE', '03840': 'NEWE', '03841': 'NEWE', '03842': 'NEWE', '03843': 'NEWE', '03844': 'NEWE', '03845': 'NEWE', '03846': 'NEWE', '03847': 'NEWE', '03848': 'NEWE', '03849': 'NEWE', '03850': 'NEWE', '03851': 'NEWE', '03852': 'NEWE', '03853': 'NEWE', '03854': 'NEWE', '03855': 'NEWE', '03856': 'NEWE', '03857': 'NEWE', '03858': 'NEWE', '03859': 'NEWE', '03860': 'NEWE', '03861': 'NEWE', '03862': 'NEWE', '03864': 'NEWE', '03865': 'NEWE', '03866': 'NEWE', '03867': 'NEWE', '03868': 'NEWE', '03869': 'NEWE', '03870': 'NEWE', '03871': 'NEWE', '03872': 'NEWE', '03873': 'NEWE', '03874': 'NEWE', '03875': 'NEWE', '03878': 'NEWE', '03882': 'NEWE', '03883': 'NEWE', '03884': 'NEWE', '03885': 'NEWE', '03886': 'NEWE', '03887': 'NEWE', '03890': 'NEWE', '03894': 'NEWE', '03896': 'NEWE', '03897': 'NEWE', '03901': 'NEWE', '03902': 'NEWE', '03903': 'NEWE', '03904': 'NEWE', '03905': 'NEWE', '03906': 'NEWE', '03907': 'NEWE', '03908': 'NEWE', '03909': 'NEWE', '03910': 'NEWE', '03911': 'NEWE', '04001': 'NEWE', '04002': 'NEWE', '04003': 'NEWE', '04004': 'NEWE', '04005': 'NEWE', '04006': 'NEWE', '04007': 'NEWE', '04008': 'NEWE', '04009': 'NEWE', '04010': 'NEWE', '04011': 'NEWE', '04013': 'NEWE', '04014': 'NEWE', '04015': 'NEWE', '04016': 'NEWE', '04017': 'NEWE', '04019': 'NEWE', '04020': 'NEWE', '04021': 'NEWE', '04022': 'NEWE', '04024': 'NEWE', '04027': 'NEWE', '04028': 'NEWE', '04029': 'NEWE', '04030': 'NEWE', '04032': 'NEWE', '04033': 'NEWE', '04034': 'NEWE', '04037': 'NEWE', '04038': 'NEWE', '04039': 'NEWE', '04040': 'NEWE', '04041': 'NEWE', '04042': 'NEWE', '04043': 'NEWE', '04046': 'NEWE', '04047': 'NEWE', '04048': 'NEWE', '04049': 'NEWE', '04050': 'NEWE', '04051': 'NEWE', '04054': 'NEWE', '04055': 'NEWE', '04056': 'NEWE', '04057': 'NEWE', '04061': 'NEWE', '04062': 'NEWE', '04063': 'NEWE', '04064': 'NEWE', '04066': 'NEWE', '04068': 'NEWE', '04069': 'NEWE', '04070': 'NEWE', '04071': 'NEWE', '04072': 'NEWE', '04073': 'NEWE', '04074': 'NEWE', '04076': 'NEWE', '04077': 'NEWE', '04078': 'NEWE', '04079': 'NEWE', '04082': 'NEWE', '04083': 'NEWE', '04084': 'NEWE', '04085': 'NEWE', '04086': 'NEWE', '04087': 'NEWE', '04088': 'NEWE', '04090': 'NEWE', '04091': 'NEWE', '04092': 'NEWE', '04093': 'NEWE', '04094': 'NEWE', '04095': 'NEWE', '04096': 'NEWE', '04097': 'NEWE', '04098': 'NEWE', '04101': 'NEWE', '04102': 'NEWE', '04103': 'NEWE', '04104': 'NEWE', '04105': 'NEWE', '04106': 'NEWE', '04107': 'NEWE', '04108': 'NEWE', '04109': 'NEWE', '04110': 'NEWE', '04112': 'NEWE', '04116': 'NEWE', '04122': 'NEWE', '04123': 'NEWE', '04124': 'NEWE', '04210': 'NEWE', '04211': 'NEWE', '04212': 'NEWE', '04216': 'NEWE', '04217': 'NEWE', '04219': 'NEWE', '04220': 'NEWE', '04221': 'NEWE', '04222': 'NEWE', '04223': 'NEWE', '04224': 'NEWE', '04225': 'NEWE', '04226': 'NEWE', '04227': 'NEWE', '04228': 'NEWE', '04230': 'NEWE', '04231': 'NEWE', '04234': 'NEWE', '04236': 'NEWE', '04237': 'NEWE', '04238': 'NEWE', '04239': 'NEWE', '04240': 'NEWE', '04241': 'NEWE', '04243': 'NEWE', '04250': 'NEWE', '04252': 'NEWE', '04253': 'NEWE', '04254': 'NEWE', '04255': 'NEWE', '04256': 'NEWE', '04257': 'NEWE', '04258': 'NEWE', '04259': 'NEWE', '04260': 'NEWE', '04261': 'NEWE', '04262': 'NEWE', '04263': 'NEWE', '04265': 'NEWE', '04266': 'NEWE', '04267': 'NEWE', '04268': 'NEWE', '04270': 'NEWE', '04271': 'NEWE', '04274': 'NEWE', '04275': 'NEWE', '04276': 'NEWE', '04280': 'NEWE', '04281': 'NEWE', '04282': 'NEWE', '04284': 'NEWE', '04285': 'NEWE', '04286': 'NEWE', '04287': 'NEWE', '04288': 'NEWE', '04289': 'NEWE', '04290': 'NEWE', '04291': 'NEWE', '04292': 'NEWE', '04294': 'NEWE', '04330': 'NEWE', '04332': 'NEWE', '04333': 'NEWE', '04336': 'NEWE', '04338': 'NEWE', '04341': 'NEWE', '04342': 'NEWE', '04343': 'NEWE', '04344': 'NEWE', '04345': 'NEWE', '04346': 'NEWE', '04347': 'NEWE', '04348': 'NEWE', '04349': 'NEWE', '04350': 'NEWE', '04351': 'NEWE', '04352': 'NEWE', '04353': 'NEWE', '04354': 'NEWE', '04355': 'NEWE', '04357': 'NEWE', '04358': 'NEWE', '04359': 'NEWE', '04360': 'NEWE', '04363': 'NEWE', '04364': 'NEWE', '04401': 'NEWE', '04402': 'NEWE', '04406': 'NEWE', '04408': 'NEWE', '04410': 'NEWE', '04411': 'NEWE', '04412': 'NEWE', '04413': 'NEWE', '04414': 'NEWE', '04415': 'NEWE', '04416': 'NEWE', '04417': 'NEWE', '04418': 'NEWE', '04419': 'NEWE', '04420': 'NEWE', '04421': 'NEWE', '04422': 'NEWE', '04424': 'NEWE', '04426': 'NEWE', '04427': 'NEWE', '04428': 'NEWE', '04429': 'NEWE', '04430': 'NEWE', '04431': 'NEWE', '04434': 'NEWE', '04435': 'NEWE', '04438': 'NEWE', '04441': 'NEWE', '04442': 'NEWE', '04443': 'NEWE', '04444': 'NEWE', '04448': 'NEWE', '04449': 'NEWE', '04450': 'NEWE', '04451': 'NEWE', '04453': 'NEWE', '04454': 'NEWE', '04455': 'NEWE', '04456': 'NEWE', '04457': 'NEWE', '04459': 'NEWE', '04460': 'NEWE', '04461': 'NEWE', '04462': 'NEWE', '04463': 'NEWE', '04464': 'NEWE', '04468': 'NEWE', '04469': 'NEWE', '04471': 'NEWE', '04472': 'NEWE', '04473': 'NEWE', '04474': 'NEWE', '04475': 'NEWE', '04476': 'NEWE', '04478': 'NEWE', '04479': 'NEWE', '04481': 'NEWE', '04485': 'NEWE', '04487': 'NEWE', '04488': 'NEWE', '04489': 'NEWE', '04490': 'NEWE', '04491': 'NEWE', '04492': 'NEWE', '04493': 'NEWE', '04495': 'NEWE', '04496': 'NEWE', '04497': 'NEWE', '04530': 'NEWE', '04535': 'NEWE', '04537': 'NEWE', '04538': 'NEWE', '04539': 'NEWE', '04541': 'NEWE', '04543': 'NEWE', '04544': 'NEWE', '04547': 'NEWE', '04548': 'NEWE', '04549': 'NEWE', '04551': 'NEWE', '04553': 'NEWE', '04554': 'NEWE', '04555': 'NEWE', '04556': 'NEWE', '04558': 'NEWE', '04562': 'NEWE', '04563': 'NEWE', '04564': 'NEWE', '04565': 'NEWE', '04568': 'NEWE', '04570': 'NEWE', '04571': 'NEWE', '04572': 'NEWE', '04573': 'NEWE', '04574': 'NEWE', '04575': 'NEWE', '04576': 'NEWE', '04578': 'NEWE', '04579': 'NEWE', '04605': 'NEWE', '04606': 'NEWE', '04607': 'NEWE', '04609': 'NEWE', '04611': 'NEWE', '04612': 'NEWE', '04613': 'NEWE', '04614': 'NEWE', '04616': 'NEWE', '04617': 'NEWE', '04619': 'NEWE', '04622': 'NEWE', '04623': 'NEWE', '04624': 'NEWE', '04625': 'NEWE', '04626': 'NEWE', '04627': 'NEWE', '04628': 'NEWE', '04629': 'NEWE', '04630': 'NEWE', '04631': 'NEWE', '04634': 'NEWE', '04635': 'NEWE', '04637': 'NEWE', '04640': 'NEWE', '04642': 'NEWE', '04643': 'NEWE', '04644': 'NEWE', '04645': 'NEWE', '04646': 'NEWE', '04648': 'NEWE', '04649': 'NEWE', '04650': 'NEWE', '04652': 'NEWE', '04653': 'NEWE', '04654': 'NEWE', '04655': 'NEWE', '04657': 'NEWE', '04658': 'NEWE', '04660': 'NEWE', '04662': 'NEWE', '04664': 'NEWE', '04666': 'NEWE', '04667': 'NEWE', '04668': 'NEWE', '04669': 'NEWE', '04671': 'NEWE', '04672': 'NEWE', '04673': 'NEWE', '04674': 'NEWE', '04675': 'NEWE', '04676': 'NEWE', '04677': 'NEWE', '04679': 'NEWE', '04680': 'NEWE', '04681': 'NEWE', '04683': 'NEWE', '04684': 'NEWE', '04685': 'NEWE', '04686': 'NEWE', '04691': 'NEWE', '04693': 'NEWE', '04694': 'NEWE', '04730': 'NEWE', '04732': 'NEWE', '04733': 'NEWE', '04734': 'NEWE', '04735': 'NEWE', '04736': 'NEWE', '04737': 'NEWE', '04738': 'NEWE', '04739': 'NEWE', '04740': 'NEWE', '04741': 'NEWE', '04742': 'NEWE', '04743': 'NEWE', '04744': 'NEWE', '04745': 'NEWE', '04746': 'NEWE', '04747': 'NEWE', '04750': 'NEWE', '04751': 'NEWE', '04756': 'NEWE', '04757': 'NEWE', '04758': 'NEWE', '04760': 'NEWE', '04761': 'NEWE', '04762': 'NEWE', '04763': 'NEWE', '04764': 'NEWE', '04765': 'NEWE', '04766': 'NEWE', '04768': 'NEWE', '04769': 'NEWE', '04772': 'NEWE', '04773': 'NEWE', '04774': 'NEWE', '04775': 'NEWE', '04776': 'NEWE', '04777': 'NEWE', '04779': 'NEWE', '04780': 'NEWE', '04781': 'NEWE', '04783': 'NEWE', '04785': 'NEWE', '04786': 'NEWE', '04787': 'NEWE', '04841': 'NEWE', '04843': 'NEWE', '04846': 'NEWE', '04847': 'NEWE', '04848': 'NEWE', '04849': 'NEWE', '04850': 'NEWE', '04851': 'NEWE', '04852': 'NEWE', '04853': 'NEWE', '04854': 'NEWE', '04855': 'NEWE', '04856': 'NEWE', '04858': 'NEWE', '04859': 'NEWE', '04860': 'NEWE', '04861': 'NEWE', '04862': 'NEWE', '04863': 'NEWE', '04864': 'NEWE', '04865': 'NEWE', '04901': 'NEWE', '04903': 'NEWE', '04910': 'NEWE', '04911': 'NEWE', '04912': 'NEWE', '04915': 'NEWE', '04917': 'NEWE', '04918': 'NEWE', '04920': 'NEWE', '04921': 'NEWE', '04922': 'NEWE', '04923': 'NEWE', '04924': 'NEWE', '04925': 'NEWE', '04926': 'NEWE', '04927': 'NEWE', '04928': 'NEWE', '04929': 'NEWE', '04930': 'NEWE', '04932': 'NEWE', '04933': 'NEWE', '04935': 'NEWE', '04936': 'NEWE', '04937': 'NEWE', '04938': 'NEWE', '04939': 'NEWE', '04940': 'NEWE', '04941': 'NEWE', '04942': 'NEWE', '04943': 'NEWE', '04944': 'NEWE', '04945': 'NEWE', '04947': 'NEWE', '04949': 'NEWE', '04950': 'NEWE', '04951': 'NEWE', '04952': 'NEWE', '04953': 'NEWE', '04954': 'NEWE', '04955': 'NEWE', '04956': 'NEWE', '04957': 'NEWE', '04958': 'NEWE', '04961': 'NEWE', '04962': 'NEWE', '04963': 'NEWE', '04964': 'NEWE', '04965': 'NEWE', '04966': 'NEWE', '04967': 'NEWE', '04969': 'NEWE', '04970': 'NEWE', '04971': 'NEWE', '04972': 'NEWE', '04973': 'NEWE', '04974': 'NEWE', '04975': 'NEWE', '04976': 'NEWE', '04978': 'NEWE', '04979': 'NEWE', '04981': 'NEWE', '04982': 'NEWE', '04983': 'NEWE', '04984': 'NEWE', '04985': 'NEWE', '04986': 'NEWE', '04987': 'NEWE', '04988': 'NEWE', '04989': 'NEWE', '04992': 'NEWE', '05001': 'NEWE', '05009': 'NEWE', '05030': 'NEWE', '05031': 'NEWE', '05032': 'NEWE', '05033': 'NEWE', '05034': 'NEWE', '05035': 'NEWE', '05036': 'NEWE', '05037': 'NEWE', '05038': 'NEWE', '05039': 'NEWE', '05040': 'NEWE', '05041': 'NEWE', '05042': 'NEWE', '05043': 'NEWE', '05045': 'NEWE', '05046': 'NEWE', '05047': 'NEWE', '05048': 'NEWE', '05049': 'NEWE', '05050': 'NEWE', '05051': 'NEWE', '05052': 'NEWE', '05053': 'NEWE', '05054': 'NEWE', '05055': 'NEWE', '05056': 'NEWE', '05058': 'NEWE', '05059': 'NEWE', '05060': 'NEWE', '05061': 'NEWE', '05062': 'NEWE', '05065': 'NEWE', '05067': 'NEWE', '05068': 'NEWE', '05069': 'NEWE', '05070': 'NEWE', '05071': 'NEWE', '05072': 'NEWE', '05073': 'NEWE', '05074': 'NEWE', '05075': 'NEWE', '05076': 'NEWE', '05077': 'NEWE', '05079': 'NEWE', '05081': 'NEWE', '05083': 'NEWE', '05084': 'NEWE', '05085': 'NEWE', '05086': 'NEWE', '05088': 'NEWE', '05089': 'NEWE', '05091': 'NEWE', '05101': 'NEWE', '05141': 'NEWE', '05142': 'NEWE', '05143': 'NEWE', '05144': 'NEWE', '05146': 'NEWE', '05148': 'NEWE', '05149': 'NEWE', '05150': 'NEWE', '05151': 'NEWE', '05152': 'NEWE', '05153': 'NEWE', '05154': 'NEWE', '05155': 'NEWE', '05156': 'NEWE', '05158': 'NEWE', '05159': 'NEWE', '05161': 'NEWE', '05201': 'NEWE', '05250': 'NEWE', '05251': 'NEWE', '05252': 'NEWE', '05253': 'NEWE', '05254': 'NEWE', '05255': 'NEWE', '05257': 'NEWE', '05260': 'NEWE', '05261': 'NEWE', '05262': 'NEWE', '05301': 'NEWE', '05302': 'NEWE', '05303': 'NEWE', '05304': 'NEWE', '05340': 'NEWE', '05341': 'NEWE', '05342': 'NEWE', '05343': 'NEWE', '05344': 'NEWE', '05345': 'NEWE', '05346': 'NEWE', '05350': 'NEWE', '05351': 'NEWE', '05352': 'NEWE', '05353': 'NEWE', '05354': 'NEWE', '05355': 'NEWE', '05356': 'NEWE', '05357': 'NEWE', '05358': 'NEWE', '05359': 'NEWE', '05360': 'NEWE', '05361': 'NEWE', '05362': 'NEWE', '05363': 'NEWE', '05401': 'NEWE', '05402': 'NEWE', '05403': 'NEWE', '05404': 'NEWE', '05405': 'NEWE', '05406': 'NEWE', '05407': 'NEWE', '05408': 'NEWE', '05439': 'NEWE', '05440': 'NEWE', '05441': 'NEWE', '05442': 'NEWE', '05443': 'NEWE', '05444': 'NEWE', '05445': 'NEWE', '05446': 'NEWE', '05447': 'NEWE', '05448': 'NEWE', '05449': 'NEWE', '05450': 'NEWE', '05451': 'NEWE', '05452': 'NEWE', '05453': 'NEWE', '05454': 'NEWE', '05455': 'NEWE', '05456': 'NEWE', '05457': 'NEWE', '05458': 'NEWE', '05459': 'NEWE', '05460': 'NEWE', '05461': 'NEWE', '05462': 'NEWE', '05463': 'NEWE', '05464': 'NEWE', '05465': 'NEWE', '05466': 'NEWE', '05468': 'NEWE', '05469': 'NEWE', '05470': 'NEWE', '05471': 'NEWE', '05472': 'NEWE', '05473': 'NEWE', '05474': 'NEWE', '05476': 'NEWE', '05477': 'NEWE', '05478': 'NEWE', '05479': 'NEWE', '05481': 'NEWE', '05482': 'NEWE', '05483': 'NEWE', '05485': 'NEWE', '05486': 'NEWE', '05487': 'NEWE', '05488': 'NEWE', '05489': 'NEWE', '05490': 'NEWE', '05491': 'NEWE', '05492': 'NEWE', '05494': 'NEWE', '05495': 'NEWE', '05501': 'NEWE', '05544': 'NEWE', '05601': 'NEWE', '05602': 'NEWE', '05603': 'NEWE', '05604': 'NEWE', '05609': 'NEWE', '05620': 'NEWE', '05633': 'NEWE', '05640': 'NEWE', '05641': 'NEWE', '05647': 'NEWE', '05648': 'NEWE', '05649': 'NEWE', '05650': 'NEWE', '05651': 'NEWE', '05652': 'NEWE', '05653': 'NEWE', '05654': 'NEWE', '05655': 'NEWE', '05656': 'NEWE', '05657': 'NEWE', '05658': 'NEWE', '05660': 'NEWE', '05661': 'NEWE', '05662': 'NEWE', '05663': 'NEWE', '05664': 'NEWE', '05665': 'NEWE', '05666': 'NEWE', '05667': 'NEWE', '05669': 'NEWE', '05670': 'NEWE', '05671': 'NEWE', '05672': 'NEWE', '05673': 'NEWE', '05674': 'NEWE', '05675': 'NEWE', '05676': 'NEWE', '05677': 'NEWE', '05678': 'NEWE', '05679': 'NEWE', '05680': 'NEWE', '05681': 'NEWE', '05682': 'NEWE', '05701': 'NEWE', '05702': 'NEWE', '05730': 'NEWE', '05731': 'NEWE', '05732': 'NEWE', '05733': 'NEWE', '05734': 'NEWE', '05735': 'NEWE', '05736': 'NEWE', '05737': 'NEWE', '05738': 'NEWE', '05739': 'NEWE', '05740': 'NEWE', '05741': 'NEWE', '05742': 'NEWE', '05743': 'NEWE', '05744': 'NEWE', '05745': 'NEWE', '05746': 'NEWE', '05747': 'NEWE', '05748': 'NEWE', '05750': 'NEWE', '05751': 'NEWE', '05753': 'NEWE', '05757': 'NEWE', '05758': 'NEWE', '05759': 'NEWE', '05760': 'NEWE', '05761': 'NEWE', '05762': 'NEWE', '05763': 'NEWE', '05764': 'NEWE', '05765': 'NEWE', '05766': 'NEWE', '05767': 'NEWE', '05768': 'NEWE', '05769': 'NEWE', '05770': 'NEWE', '05772': 'NEWE', '05773': 'NEWE', '05774': 'NEWE', '05775': 'NEWE', '05776': 'NEWE', '05777': 'NEWE', '05778': 'NEWE', '05819': 'NEWE', '05820': 'NEWE', '05821': 'NEWE', '05822': 'NEWE', '05823': 'NEWE', '05824': 'NEWE', '05825': 'NEWE', '05826': 'NEWE', '05827': 'NEWE', '05828': 'NEWE', '05829': 'NEWE', '05830': 'NEWE', '05832': 'NEWE', '05833': 'NEWE', '05836': 'NEWE', '05837': 'NEWE', '05838': 'NEWE', '05839': 'NEWE', '05840': 'NEWE', '05841': 'NEWE', '05842': 'NEWE', '05843': 'NEWE', '05845': 'NEWE', '05846': 'NEWE', '05847': 'NEWE', '05848': 'NEWE', '05849': 'NEWE', '05850': 'NEWE', '05851': 'NEWE', '05853': 'NEWE', '05855': 'NEWE', '05857': 'NEWE', '05858': 'NEWE', '05859': 'NEWE', '05860': 'NEWE', '05861': 'NEWE', '05862': 'NEWE', '05863': 'NEWE', '05866': 'NEWE', '05867': 'NEWE', '05868': 'NEWE', '05871': 'NEWE', '05872': 'NEWE', '05873': 'NEWE', '05874': 'NEWE', '05875': 'NEWE', '05901': 'NEWE', '05902': 'NEWE', '05903': 'NEWE', '05904': 'NEWE', '05905': 'NEWE', '05906': 'NEWE', '05907': 'NEWE', '06001': 'NEWE', '06002': 'NEWE', '06006': 'NEWE', '06010': 'NEWE', '06011': 'NEWE', '06013': 'NEWE', '06016': 'NEWE', '06018': 'NEWE', '06019': 'NEWE', '06020': 'NEWE', '06021': 'NEWE', '06022': 'NEWE', '06023': 'NEWE', '06024': 'NEWE', '06025': 'NEWE', '06026': 'NEWE', '06027': 'NEWE', '06028': 'NEWE', '06029': 'NEWE', '06030': 'NEWE', '06031': 'NEWE', '06032': 'NEWE', '06033': 'NEWE', '06034': 'NEWE', '06035': 'NEWE', '06037': 'NEWE', '06039': 'NEWE', '06040': 'NEWE', '06041': 'NEWE', '06042': 'NEWE', '06043': 'NEWE', '06045': 'NEWE', '06050': 'NEWE', '06051': 'NEWE', '06052': 'NEWE', '06053': 'NEWE', '06057': 'NEWE', '06058': 'NEWE', '06059': 'NEWE', '06060': 'NEWE', '06061': 'NEWE', '06062': 'NEWE', '06063': 'NEWE', '06064': 'NEWE', '06065': 'NEWE', '06066': 'NEWE', '06067': 'NEWE', '06068': 'NEWE', '06069': 'NEWE', '06070': 'NEWE', '06071': 'NEWE', '06072': 'NEWE', '06073': 'NEWE', '06074': 'NEWE', '06075': 'NEWE', '06076': 'NEWE', '06077': 'NEWE', '06078': 'NEWE', '06079': 'NEWE', '06080': 'NEWE', '06081': 'NEWE', '06082': 'NEWE', '06083': 'NEWE', '06084': 'NEWE', '06085': 'NEWE', '06087': 'NEWE', '06088': 'NEWE', '06089': 'NEWE', '06090': 'NEWE', '06091': 'NEWE', '06092': 'NEWE', '06093': 'NEWE', '06094': 'NEWE', '06095': 'NEWE', '06096': 'NEWE', '06098': 'NEWE', '06101': 'NEWE', '06102': 'NEWE', '06103': 'NEWE', '06104': 'NEWE', '06105': 'NEWE', '06106': 'NEWE', '06107': 'NEWE', '06108': 'NEWE', '06109': 'NEWE', '06110': 'NEWE', '06111': 'NEWE', '06112': 'NEWE', '06114': 'NEWE', '06115': 'NEWE', '06117': 'NEWE', '06118': 'NEWE', '06119': 'NEWE', '06120': 'NEWE', '06123': 'NEWE', '06126': 'NEWE', '06127': 'NEWE', '06128': 'NEWE', '06129': 'NEWE', '06131': 'NEWE', '06132': 'NEWE', '06133': 'NEWE', '06134': 'NEWE', '06137': 'NEWE', '06138': 'NEWE', '06140': 'NEWE', '06141': 'NEWE', '06142': 'NEWE', '06143': 'NEWE', '06144': 'NEWE', '06145': 'NEWE', '06146': 'NEWE', '06147': 'NEWE', '06150': 'NEWE', '06151': 'NEWE', '06152': 'NEWE', '06153': 'NEWE', '06154': 'NEWE', '06155': 'NEWE', '06156': 'NEWE', '06160': 'NEWE', '06161': 'NEWE', '06167': 'NEWE', '06176': 'NEWE', '06180': 'NEWE', '06183': 'NEWE', '06199': 'NEWE', '06226': 'NEWE', '06230': 'NEWE', '06231': 'NEWE', '06232': 'NEWE', '06233': 'NEWE', '06234': 'NEWE', '06235': 'NEWE', '06237': 'NEWE', '06238': 'NEWE', '06239': 'NEWE', '06241': 'NEWE', '06242': 'NEWE', '06243': 'NEWE', '06244': 'NEWE', '06245': 'NEWE', '06246': 'NEWE', '06247': 'NEWE', '06248': 'NEWE', '06249': 'NEWE', '06250': 'NEWE', '06251': 'NEWE', '06254': 'NEWE', '06255': 'NEWE', '06256': 'NEWE', '06258': 'NEWE', '06259': 'NEWE', '06260': 'NEWE', '06262': 'NEWE', '06263': 'NEWE', '06264': 'NEWE', '06265': 'NEWE', '06266': 'NEWE', '06267': 'NEWE', '06268': 'NEWE', '06269': 'NEWE', '06277': 'NEWE', '06278': 'NEWE', '06279': 'NEWE', '06280': 'NEWE', '06281': 'NEWE', '06282': 'NEWE', '06320': 'NEWE', '06330': 'NEWE', '06331': 'NEWE', '06332': 'NEWE', '06333': 'NEWE', '06334': 'NEWE', '06335': 'NEWE', '06336': 'NEWE', '06338': 'NEWE', '06339': 'NEWE', '06340': 'NEWE', '06349': 'NEWE', '06350': 'NEWE', '06351': 'NEWE', '06353': 'NEWE', '06354': 'NEWE', '06355': 'NEWE', '06357': 'NEWE', '06359': 'NEWE', '06360': 'NEWE', '06365': 'NEWE', '06370': 'NEWE', '06371': 'NEWE', '06372': 'NEWE', '06373': 'NEWE', '06374': 'NEWE', '06375': 'NEWE', '06376': 'NEWE', '06377': 'NEWE', '06378': 'NEWE', '06379': 'NEWE', '06380': 'NEWE', '06382': 'NEWE', '06383': 'NEWE', '06384': 'NEWE', '06385': 'NEWE', '06387': 'NEWE', '06388': 'NEWE', '06389': 'NEWE', '06390': 'NEWE', '06401': 'NEWE', '06403': 'NEWE', '06404': 'NEWE', '06405': 'NEWE', '06408': 'NEWE', '06409': 'NEWE', '06410': 'NEWE', '06411': 'NEWE', '06412': 'NEWE', '06413': 'NEWE', '06414': 'NEWE', '06415': 'NEWE', '06416': 'NEWE', '06417': 'NEWE', '06418': 'NEWE', '06419': 'NEWE', '06420': 'NEWE', '06422': 'NEWE', '06423': 'NEWE', '06424': 'NEWE', '06426': 'NEWE', '06437': 'NEWE', '06438': 'NEWE', '06439': 'NEWE', '06440': 'NEWE', '06441': 'NEWE', '06442': 'NEWE', '06443': 'NEWE', '06444': 'NEWE', '06447': 'NEWE', '06450': 'NEWE', '06451': 'NEWE', '06455': 'NEWE', '06456': 'NEWE', '06457': 'NEWE', '06459': 'NEWE', '06460': 'NEWE', '06461': 'NEWE', '06467': 'NEWE', '06468': 'NEWE', '06469': 'NEWE', '06470': 'NEWE', '06471': 'NEWE', '06472': 'NEWE', '06473': 'NEWE', '06474': 'NEWE', '06475': 'NEWE', '06477': 'NEWE', '06478': 'NEWE', '06479': 'NEWE', '06480': 'NEWE', '06481': 'NEWE', '06482': 'NEWE', '06483': 'NEWE', '06484': 'NEWE', '06487': 'NEWE', '06488': 'NEWE', '06489': 'NEWE', '06491': 'NEWE', '06492': 'NEWE', '06493': 'NEWE', '06494': 'NEWE', '06495': 'NEWE', '06498': 'NEWE', '06501': 'NEWE', '06502': 'NEWE', '06503': 'NEWE', '06504': 'NEWE', '06505': 'NEWE', '06506': 'NEWE', '06507': 'NEWE', '06508': 'NEWE', '06509': 'NEWE', '06510': 'NEWE', '06511': 'NEWE', '06512': 'NEWE', '06513': 'NEWE', '06514': 'NEWE', '06515': 'NEWE', '06516': 'NEWE', '06517': 'NEWE', '06518': 'NEWE', '06519': 'NEWE', '06520': 'NEWE', '06521': 'NEWE', '06524': 'NEWE', '06525': 'NEWE', '06530': 'NEWE', '06531': 'NEWE', '06532': 'NEWE', '06533': 'NEWE', '06534': 'NEWE', '06535': 'NEWE', '06536': 'NEWE', '06537': 'NEWE', '06538': 'NEWE', '06540': 'NEWE', '06601': 'NEWE', '06602': 'NEWE', '06604': 'NEWE', '06605': 'NEWE', '06606': 'NEWE', '06607': 'NEWE', '06608': 'NEWE', '06610': 'NEWE', '06611': 'NEWE', '06612': 'NEWE', '06614': 'NEWE', '06615': 'NEWE', '06650': 'NEWE', '06673': 'NEWE', '06699': 'NEWE', '06701': 'NEWE', '06702': 'NEWE', '06703': 'NEWE', '06704': 'NEWE', '06705': 'NEWE', '06706': 'NEWE', '06708': 'NEWE', '06710': 'NEWE', '06712': 'NEWE', '06716': 'NEWE', '06720': 'NEWE', '06721': 'NEWE', '06722': 'NEWE', '06723': 'NEWE', '06724': 'NEWE', '06725': 'NEWE', '06726': 'NEWE', '06749': 'NEWE', '06750': 'NEWE', '06751': 'NEWE', '06752': 'NEWE', '06753': 'NEWE', '06754': 'NEWE', '06755': 'NEWE', '06756': 'NEWE', '06757': 'NEWE', '06758': 'NEWE', '06759': 'NEWE', '06762': 'NEWE', '06763': 'NEWE', '06770': 'NEWE', '06776': 'NEWE', '06777': 'NEWE', '06778': 'NEWE', '06779': 'NEWE', '06781': 'NEWE', '06782': 'NEWE', '06783': 'NEWE', '06784': 'NEWE', '06785': 'NEWE', '06786': 'NEWE', '06787': 'NEWE', '06790': 'NEWE', '06791': 'NEWE', '06792': 'NEWE', '06793': 'NEWE', '06794': 'NEWE', '06795': 'NEWE', '06796': 'NEWE', '06798': 'NEWE', '06801': 'NEWE', '06804': 'NEWE', '06807': 'NEWE', '06810': 'NEWE', '06811': 'NEWE', '06812': 'NEWE', '06813': 'NEWE', '06814': 'NEWE', '06816': 'NEWE', '06817': 'NEWE', '06820': 'NEWE', '06824': 'NEWE', '06825': 'NEWE', '06828': 'NEWE', '06829': 'NEWE', '06830': 'NEWE', '06831': 'NEWE', '06836': 'NEWE', '06838': 'NEWE', '06840': 'NEWE', '06850': 'NEWE', '06851': 'NEWE', '06852': 'NEWE', '06853': 'NEWE', '06854': 'NEWE', '06855': 'NEWE', '06856': 'NEWE', '06857': 'NEWE', '06858': 'NEWE', '06859': 'NEWE', '06860': 'NEWE', '06870': 'NEWE', '06875': 'NEWE', '06876': 'NEWE', '06877': 'NEWE', '06878': 'NEWE', '06879': 'NEWE', '06880': 'NEWE', '06881': 'NEWE', '06883': 'NEWE', '06888': 'NEWE', '06889': 'NEWE', '06890': 'NEWE', '06896': 'NEWE', '06897': 'NEWE', '06901': 'NEWE', '06902': 'NEWE', '06903': 'NEWE', '06904': 'NEWE', '06905': 'NEWE', '06906': 'NEWE', '06907': 'NEWE', '06910': 'NEWE', '06911': 'NEWE', '06912': 'NEWE', '06913': 'NEWE', '06914': 'NEWE', '06920': 'NEWE', '06921': 'NEWE', '06922': 'NEWE', '06925': 'NEWE', '06926': 'NEWE', '06927': 'NEWE', '06928': 'NEWE', '07001': 'RFCE', '07002': 'RFCE', '07003': 'RFCE', '07004': 'RFCE', '07005': 'RFCE', '07006': 'RFCE', '07007': 'RFCE', '07008': 'RFCE', '07009': 'RFCE', '07010': 'RFCE', '07011': 'RFCE', '07012': 'RFCE', '07013': 'RFCE', '07014': 'RFCE', '07015': 'RFCE', '07016': 'RFCE', '07017': 'RFCE', '07018': 'RFCE', '07019': 'RFCE', '07020': 'RFCE', '07021': 'RFCE', '07022': 'RFCE', '07023': 'RFCE', '07024': 'RFCE', '07026': 'RFCE', '07027': 'RFCE', '07028': 'RFCE', '07029': 'RFCE', '07030': 'RFCE', '07031': 'RFCE', '07032': 'RFCE', '07033': 'RFCE', '07034': 'RFCE', '07035': 'RFCE', '07036': 'RFCE', '07039': 'RFCE', '07040': 'RFCE', '07041': 'RFCE', '07042': 'RFCE', '07043': 'RFCE', '07044': 'RFCE', '07045': 'RFCE', '07046': 'RFCE', '07047': 'RFCE', '07050': 'RFCE', '07051': 'RFCE', '07052': 'RFCE', '07054': 'RFCE', '07055': 'RFCE', '07057': 'RFCE', '07058': 'RFCE', '07059': 'RFCE', '07060': 'RFCE', '07061': 'RFCE', '07062': 'RFCE', '07063': 'RFCE', '07064': 'RFCE', '07065': 'RFCE', '07066': 'RFCE', '07067': 'RFCE', '07068': 'RFCE', '07069': 'RFCE', '07070': 'RFCE', '07071': 'RFCE', '07072': 'RFCE', '07073': 'RFCE', '07074': 'RFCE', '07075': 'RFCE', '07076': 'RFCE', '07077': 'RFCE', '07078': 'RFCE', '07079': 'RFCE', '07080': 'RFCE', '07081': 'RFCE', '07082': 'RFCE', '07083': 'RFCE', '07086': 'RFCE', '07087': 'RFCE', '07088': 'RFCE', '07090': 'RFCE', '07091': 'RFCE', '07092': 'RFCE', '07093': 'RFCE', '07094': 'RFCE', '07095': 'RFCE', '07096': 'RFCE', '07097': 'RFCE', '07099': 'RFCE', '07101': 'RFCE', '07102': 'RFCE', '07103': 'RFCE', '07104': 'RFCE', '07105': 'RFCE', '07106': 'RFCE', '07107': 'RFCE', '07108': 'RFCE', '07109': 'RFCE', '07110': 'RFCE', '07111': 'RFCE', '07112': 'RFCE', '07114': 'RFCE', '07175': 'RFCE', '07184': 'RFCE', '07188': 'RFCE', '07189': 'RFCE', '07191': 'RFCE', '07192': 'RFCE', '07193': 'RFCE', '07195': 'RFCE', '07198': 'RFCE', '07199': 'RFCE', '07201': 'RFCE', '07202': 'RFCE', '07203': 'RFCE', '07204': 'RFCE', '07205': 'RFCE', '07206': 'RFCE', '07207': 'RFCE', '07208': 'RFCE', '07302': 'RFCE', '07303': 'RFCE', '07304': 'RFCE', '07305': 'RFCE', '07306': 'RFCE', '07307': 'RFCE', '07308': 'RFCE', '07309': 'SRSO', '07310': 'RFCE', '07311': 'RFCE', '07395': 'RFCE', '07399': 'RFCE', '07401': 'RFCE', '07403': 'RFCE', '07405': 'RFCE', '07407': 'RFCE', '07410': 'RFCE', '07416': 'RFCE', '07417': 'RFCE', '07418': 'RFCE', '07419': 'RFCE', '07420': 'RFCE', '07421': 'NYUP', '07422': 'RFCE', '07423': 'RFCE', '07424': 'RFCE', '07428': 'RFCE', '07430': 'NYUP', '07432': 'RFCE', '07435': 'RFCE', '07436': 'RFCE', '07438': 'RFCE', '07439': 'RFCE', '07440': 'RFCE', '07442': 'RFCE', '07444': 'RFCE', '07446': 'NYUP', '07450': 'RFCE', '07451': 'RFCE', '07452': 'RFCE', '07456': 'RFCE', '07457': 'RFCE', '07458': 'RFCE', '07460': 'RFCE', '07461': 'RFCE', '07462': 'RFCE', '07463': 'RFCE', '07465': 'RFCE', '07470': 'RFCE', '07474': 'RFCE', '07480': 'RFCE', '07481': 'RFCE', '07495': 'NYUP', '07501': 'RFCE', '07502': 'RFCE', '07503': 'RFCE', '07504': 'RFCE', '07505': 'RFCE', '07506': 'RFCE', '07507': 'RFCE', '07508': 'RFCE', '07509': 'RFCE', '07510': 'RFCE', '07511': 'RFCE', '07512': 'RFCE', '07513': 'RFCE', '07514': 'RFCE', '07522': 'RFCE', '07524': 'RFCE', '07533': 'RFCE', '07538': 'RFCE', '07543': 'RFCE', '07544': 'RFCE', '07601': 'RFCE', '07602': 'RFCE', '07603': 'RFCE', '07604': 'RFCE', '07605': 'RFCE', '07606': 'RFCE', '07607': 'RFCE', '07608': 'RFCE', '07620': 'NYUP', '07621': 'RFCE', '07624': 'NYUP', '07626': 'RFCE', '07627': 'RFCE', '07628': 'RFCE', '07630': 'RFCE', '07631': 'RFCE', '07632': 'RFCE', '07640': 'RFCE', '07641': 'RFCE', '07642': 'RFCE', '07643': 'RFCE', '07644': 'RFCE', '07645': 'NYUP', '07646': 'RFCE', '07647': 'NYUP', '07648': 'NYUP', '07649': 'RFCE', '07650': 'RFCE', '07652': 'RFCE', '07653': 'RFCE', '07656': 'RFCE', '07657': 'RFCE', '07660': 'RFCE', '07661': 'RFCE', '07662': 'RFCE', '07663': 'RFCE', '07666': 'RFCE', '07670': 'RFCE', '07675': 'RFCE', '07676': 'RFCE', '07677': 'RFCE', '07699': 'RFCE', '07701': 'RFCE', '07702': 'RFCE', '07703': 'RFCE', '07704': 'RFCE', '07709': 'RFCE', '07710': 'RFCE', '07711': 'RFCE', '07712': 'RFCE', '07715': 'RFCE', '07716': 'RFCE', '07717': 'RFCE', '07718': 'RFCE', '07719': 'RFCE', '07720': 'RFCE', '07721': 'RFCE', '07722': 'RFCE', '07723': 'RFCE', '07724': 'RFCE', '07726': 'RFCE', '07727': 'RFCE', '07728': 'RFCE', '07730': 'RFCE', '07731': 'RFCE', '07732': 'RFCE', '07733': 'RFCE', '07734': 'RFCE', '07735': 'RFCE', '07737': 'RFCE', '07738': 'RFCE', '07739': 'RFCE', '07740': 'RFCE', '07746': 'RFCE', '07747': 'RFCE', '07748': 'RFCE', '07750': 'RFCE', '07751': 'RFCE', '07752': 'RFCE', '07753': 'RFCE', '07754': 'RFCE', '07755': 'RFCE', '07756': 'RFCE', '07757': 'RFCE', '07758': 'RFCE', '07760': 'RFCE', '07762': 'RFCE', '07763': 'RFCE', '07764': 'RFCE', '07765': 'RFCE', '07799': 'RFCE', '07801': 'RFCE', '07802': 'RFCE', '07803': 'RFCE', '07806': 'RFCE', '07820': 'RFCE', '07821': 'RFCE', '07822': 'RFCE', '07823': 'RFCE', '07825': 'RFCE', '07826': 'RFCE', '07827': 'RFCE', '07828': 'RFCE', '07829': 'RFCE', '07830': 'RFCE', '07831': 'RFCE', '07832': 'RFCE', '07833': 'RFCE', '07834': 'RFCE', '07836': 'RFCE', '07837': 'RFCE', '07838': 'RFCE', '07839': 'RFCE', '07840': 'RFCE', '07842': 'RFCE', '07843': 'RFCE', '07844': 'RFCE', '07845': 'RFCE', '07846': 'RFCE', '07847': 'RFCE', '07848': 'RFCE', '07849': 'RFCE', '07850': 'RFCE', '07851': 'RFCE', '07852': 'RFCE', '07853': 'RFCE', '07855': 'RFCE', '07856': 'RFCE', '07857': 'RFCE', '07860': 'RFCE', '07863': 'RFCE', '07865': 'RFCE', '07866': 'RFCE', '07869': 'RFCE', '07870': 'RFCE', '07871': 'RFCE', '07874': 'RFCE', '07875': 'RFCE', '07876': 'RFCE', '07877': 'RFCE', '07878': 'RFCE', '07879': 'RFCE', '07880': 'RFCE', '07881': 'RFCE', '07882': 'RFCE', '07885': 'RFCE', '07890': 'RFCE', '07901': 'RFCE', '07902': 'RFCE', '07920': 'RFCE', '07921': 'RFCE', '07922': 'RFCE', '07924': 'RFCE', '07926': 'RFCE', '07927': 'RFCE', '07928': 'RFCE', '07930': 'RFCE', '07931': 'RFCE', '07932': 'RFCE', '07933': 'RFCE', '07934': 'RFCE', '07935': 'RFCE', '07936': 'RFCE', '07938': 'RFCE', '07939': 'RFCE', '07940': 'RFCE', '07945': 'RFCE', '07946': 'RFCE', '07950': 'RFCE', '07960': 'RFCE', '07961': 'RFCE', '07962': 'RFCE', '07963': 'RFCE', '07970': 'RFCE', '07974': 'RFCE', '07976': 'RFCE', '07977': 'RFCE', '07978': 'RFCE', '07979': 'RFCE', '07980': 'RFCE', '07981': 'RFCE', '07999': 'RFCE', '08001': 'RFCE', '08002': 'RFCE', '08003': 'RFCE', '08004': 'RFCE', '08005': 'RFCE', '08006': 'RFCE', '08007': 'RFCE', '08008': 'RFCE', '08009': 'RFCE', '08010': 'RFCE', '08011': 'RFCE', '08012': 'RFCE', '08014': 'RFCE', '08015': 'RFCE', '08016': 'RFCE', '08018': 'RFCE', '08019': 'RFCE', '08020': 'RFCE', '08021': 'RFCE', '08022': 'RFCE', '08023': 'RFCE', '08025': 'RFCE', '08026': 'RFCE', '08027': 'RFCE', '08028': 'RFCE', '08029': 'RFCE', '08030': 'RFCE', '08031': 'RFCE', '08032': 'RFCE', '08033': 'RFCE', '08034': 'RFCE', '08035': 'RFCE', '08036': 'RFCE', '08037': 'RFCE', '08038': 'RFCE', '08039': 'RFCE', '08041': 'RFCE', '08042': 'RFCE', '08043': 'RFCE', '08045': 'RFCE', '08046': 'RFCE', '08048': 'RFCE', '08049': 'RFCE', '08050': 'RFCE', '08051': 'RFCE', '08052': 'RFCE', '08053': 'RFCE', '08054': 'RFCE', '08055': 'RFCE', '08056': 'RFCE', '08057': 'RFCE', '08059': 'RFCE', '08060': 'RFCE', '08061': 'RFCE', '08062': 'RFCE', '08063': 'RFCE', '08064': 'RFCE', '08065': 'RFCE', '08066': 'RFCE', '08067': 'RFCE', '08068': 'RFCE', '08069': 'RFCE', '08070': 'RFCE', '08071': 'RFCE', '08072': 'RFCE', '08073': 'RFCE', '08074': 'RFCE', '08075': 'RFCE', '08076': 'RFCE', '08077': 'RFCE', '08078': 'RFCE', '08079': 'RFCE', '08080': 'RFCE', '08081': 'RFCE', '08083': 'RFCE', '08084': 'RFCE', '08085': 'RFCE', '08086': 'RFCE', '08087': 'RFCE', '08088': 'RFCE', '08089': 'RFCE', '08090': 'RFCE', '08091': 'RFCE', '08092': 'RFCE', '08093': 'RFCE', '08094': 'RFCE', '08095': 'RFCE', '08096': 'RFCE', '08097': 'RFCE', '08098': 'RFCE', '08099': 'RFCE', '08101': 'RFCE', '08102': 'RFCE', '08103': 'RFCE', '08104': 'RFCE', '08105': 'RFCE', '08106': 'RFCE', '08107': 'RFCE', '08108': 'RFCE', '08109': 'RFCE', '08110': 'RFCE', '08201': 'RFCE', '08202': 'RFCE', '08203': 'RFCE', '08204': 'RFCE', '08205': 'RFCE', '08210': 'RFCE', '08212': 'RFCE', '08213': 'RFCE', '08214': 'RFCE', '08215': 'RFCE', '08217': 'RFCE', '08218': 'RFCE', '08219': 'RFCE', '08220': 'RFCE', '08221': 'RFCE', '08223': 'RFCE', '08224': 'RFCE', '08225': 'RFCE', '08226': 'RFCE', '08230': 'RFCE', '08231': 'RFCE', '08232': 'RFCE', '08234': 'RFCE', '08240': 'RFCE', '08241': 'RFCE', '08242': 'RFCE', '08243': 'RFCE', '08244': 'RFCE', '08245': 'RFCE', '08246': 'RFCE', '08247': 'RFCE', '08248': 'RFCE', '08250': 'RFCE', '08251': 'RFCE', '08252': 'RFCE', '08260': 'RFCE', '08270': 'RFCE', '08302': 'RFCE', '08310': 'RFCE', '08311': 'RFCE', '08312': 'RFCE', '08313': 'RFCE', '08314': 'RFCE', '08315': 'RFCE', '08316': 'RFCE', '08317': 'RFCE', '08318': 'RFCE', '08319': 'RFCE', '08320': 'RFCE', '08321': 'RFCE', '08322': 'RFCE', '08323': 'RFCE', '08324': 'RFCE', '08326': 'RFCE', '08327': 'RFCE', '08328': 'RFCE', '08329': 'RFCE', '08330': 'RFCE', '08332': 'RFCE', '08340': 'RFCE', '08341': 'RFCE', '08342': 'RFCE', '08343': 'RFCE', '08344': 'RFCE', '08345': 'RFCE', '08346': 'RFCE', '08347': 'RFCE', '08348': 'RFCE', '08349': 'RFCE', '08350': 'RFCE', '08352': 'RFCE', '08353': 'RFCE', '08360': 'RFCE', '08361': 'RFCE', '08362': 'RFCE', '08401': 'RFCE', '08402': 'RFCE', '08403': 'RFCE', '08404': 'RFCE', '08405': 'RFCE', '08406': 'RFCE', '08501': 'RFCE', '08502': 'RFCE', '08504': 'RFCE', '08505': 'RFCE', '08510': 'RFCE', '08511': 'RFCE', '08512': 'RFCE', '08514': 'RFCE', '08515': 'RFCE', '08518': 'RFCE', '08520': 'RFCE', '08525': 'RFCE', '08526': 'RFCE', '08527': 'RFCE', '08528': 'RFCE', '08530': 'RFCE', '08533': 'RFCE', '08534': 'RFCE', '08535': 'RFCE', '08536': 'RFCE', '08540': 'RFCE', '08541': 'RFCE', '08542': 'RFCE', '08543': 'RFCE', '08544': 'RFCE', '08550': 'RFCE', '08551': 'RFCE', '08553': 'RFCE', '08554': 'RFCE', '08555': 'RFCE', '08556': 'RFCE', '08557': 'RFCE', '08558': 'RFCE', '08559': 'RFCE', '08560': 'RFCE', '08561': 'RFCE', '08562': 'RFCE', '08601': 'RFCE', '08602': 'RFCE', '08603': 'RFCE', '08604': 'RFCE', '08605': 'RFCE', '08606': 'RFCE', '08607': 'RFCE', '08608': 'RFCE', '08609': 'RFCE', '08610': 'RFCE', '08611': 'RFCE', '08618': 'RFCE', '08619': 'RFCE', '08620': 'RFCE', '08625': 'RFCE', '08628': 'RFCE', '08629': 'RFCE', '08638': 'RFCE', '08640': 'RFCE', '08641': 'RFCE', '08645': 'RFCE', '08646': 'RFCE', '08647': 'RFCE', '08648': 'RFCE', '08650': 'RFCE', '08666': 'RFCE', '08690': 'RFCE', '08691': 'RFCE', '08695': 'RFCE', '08701': 'RFCE', '08720': 'RFCE', '08721': 'RFCE', '08722': 'RFCE', '08723': 'RFCE', '08724': 'RFCE', '08730': 'RFCE', '08731': 'RFCE', '08732': 'RFCE', '08733': 'RFCE', '08734': 'RFCE', '08735': 'RFCE', '08736': 'RFCE', '08738': 'RFCE', '08739': 'RFCE', '08740': 'RFCE', '08741': 'RFCE', '08742': 'RFCE', '08750': 'RFCE', '08751': 'RFCE', '08752': 'RFCE', '08753': 'RFCE', '08754': 'RFCE', '08755': 'RFCE', '08756': 'RFCE', '08757': 'RFCE', '08758': 'RFCE', '08759': 'RFCE', '08801': 'RFCE', '08802': 'RFCE', '08803': 'RFCE', '08804': 'RFCE', '08805': 'RFCE', '08807': 'RFCE', '08808': 'RFCE', '08809': 'RFCE', '08810': 'RFCE', '08812': 'RFCE', '08816': 'RFCE', '08817': 'RFCE', '08818': 'RFCE', '08820': 'RFCE', '08821': 'RFCE', '08822': 'RFCE', '08823': 'RFCE', '08824': 'RFCE', '08825': 'RFCE', '08826': 'RFCE', '08827': 'RFCE', '08828': 'RFCE', '08829': 'RFCE', '08830': 'RFCE', '08831': 'RFCE', '08832': 'RFCE', '08833': 'RFCE', '08834': 'RFCE', '08835': 'RFCE', '08836': 'RFCE', '08837': 'RFCE', '08840': 'RFCE', '08844': 'RFCE', '08846': 'RFCE', '08848': 'RFCE', '08850': 'RFCE', '08852': 'RFCE', '08853': 'RFCE', '08854': 'RFCE', '08855': 'RFCE', '08857': 'RFCE', '08858': 'RFCE', '08859': 'RFCE', '08861': 'RFCE', '08862': 'RFCE', '08863': 'RFCE', '08865': 'RFCE', '08867': 'RFCE', '08868': 'RFCE', '08869': 'RFCE', '08870': 'RFCE', '08871': 'RFCE', '08872': 'RFCE', '08873': 'RFCE', '08875': 'RFCE', '08876': 'RFCE', '08879': 'RFCE', '08880': 'RFCE', '08882': 'RFCE', '08884': 'RFCE', '08885': 'RFCE', '08886': 'RFCE', '08887': 'RFCE', '08888': 'RFCE', '08889': 'RFCE', '08890': 'RFCE', '08899': 'RFCE', '08901': 'RFCE', '08902': 'RFCE', '08903': 'RFCE', '08904': 'RFCE', '08905': 'SRSO', '08906': 'RFCE', '08933': 'RFCE', '08989': 'RFCE', '10001': 'NYCW', '10002': 'NYCW', '10003': 'NYCW', '10004': 'NYCW', '10005': 'NYCW', '10006': 'NYCW', '10007': 'NYCW', '10008': 'NYCW', '10009': 'NYCW', '10010': 'NYCW', '10011': 'NYCW', '10012': 'NYCW', '10013': 'NYCW', '10014': 'NYCW', '10016': 'NYCW', '10017': 'NYCW', '10018': 'NYCW', '10019': 'NYCW', '10020': 'NYCW', '10021': 'NYCW', '10022': 'NYCW', '10023': 'NYCW', '10024': 'NYCW', '10025': 'NYCW', '10026': 'NYCW', '10027': 'NYCW', '10028': 'NYCW', '10029': 'NYCW', '10030': 'NYCW', '10031': 'NYCW', '10032': 'NYCW', '10033': 'NYCW', '10034': 'NYCW', '10035': 'NYCW', '10036': 'NYCW', '10037': 'NYCW', '10038': 'NYCW', '10039': 'NYCW', '10040': 'NYCW', '10041': 'NYCW', '10043': 'NYCW', '10044': 'NYCW', '10045': 'NYCW', '10055': 'NYCW', '10060': 'NYCW', '10065': 'NYCW', '10069': 'NYCW', '10072': 'NYCW', '10075': 'NYCW', '10080': 'NYCW', '10081': 'NYCW', '10082': 'NYCW', '10087': 'NYCW', '10090': 'NYCW', '10095': 'NYCW', '10101': 'NYCW', '10102': 'NYCW', '10103': 'NYCW', '10104': 'NYCW', '10105': 'NYCW', '10106': 'NYCW', '10107': 'NYCW', '10108': 'NYCW', '10109': 'NYCW', '10110': 'NYCW', '10111': 'NYCW', '10112': 'NYCW', '10113': 'NYCW', '10114': 'NYCW', '10115': 'NYCW', '10116': 'NYCW', '10117': 'NYCW', '10118': 'NYCW', '10119': 'NYCW', '10120': 'NYCW', '10121': 'NYCW', '10122': 'NYCW', '10123': 'NYCW', '10124': 'NYCW', '10125': 'NYCW', '10126': 'NYCW', '10128': 'NYCW', '10129': 'NYCW', '10130': 'NYCW', '10131': 'NYCW', '10132': 'NYCW', '10133': 'NYCW', '10138': 'NYCW', '10149': 'NYCW', '10150': 'NYCW', '10151': 'NYCW', '10152': 'NYCW', '10153': 'NYCW', '10154': 'NYCW', '10155': 'NYCW', '10156': 'NYCW', '10157': 'NYCW', '10158': 'NYCW', '10159': 'NYCW', '10160': 'NYCW', '10161': 'NYCW', '10162': 'NYCW', '10163': 'NYCW', '10164': 'NYCW', '10165': 'NYCW', '10166': 'NYCW', '10167': 'NYCW', '10168': 'NYCW', '10169': 'NYCW', '10170': 'NYCW', '10171': 'NYCW', '10172': 'NYCW', '10173': 'NYCW', '10174': 'NYCW', '10175': 'NYCW', '10176': 'NYCW', '10177': 'NYCW', '10178': 'NYCW', '10179': 'NYCW', '10185': 'NYCW', '10197': 'NYCW', '10199': 'NYCW', '10203': 'NYCW', '10211': 'NYCW', '10212': 'NYCW', '10213': 'NYCW', '10242': 'NYCW', '10249': 'NYCW', '10256': 'NYCW', '10257': 'NYCW', '10258': 'NYCW', '10259': 'NYCW', '10260': 'NYCW', '10261': 'NYCW', '10265': 'NYCW', '10268': 'NYCW', '10269': 'NYCW', '10270': 'NYCW', '10271': 'NYCW', '10272': 'NYCW', '10273': 'NYCW', '10274': 'NYCW', '10275': 'NYCW', '10276': 'NYCW', '10277': 'NYCW', '10278': 'NYCW', '10279': 'NYCW', '10280': 'NYCW', '10281': 'NYCW', '10282': 'NYCW', '10285': 'NYCW', '10286': 'NYCW', '10292': 'NYCW', '10301': 'NYCW', '10302': 'NYCW', '10303': 'NYCW', '10304': 'NYCW', '10305': 'NYCW', '10306': 'NYCW', '10307': 'NYCW', '10308': 'NYCW', '10309': 'NYCW', '10310': 'NYCW', '10311': 'NYCW', '10312': 'NYCW', '10313': 'NYCW', '10314': 'NYCW', '10451': 'NYCW', '10452': 'NYCW', '10453': 'NYCW', '10454': 'NYCW', '10455': 'NYCW', '10456': 'NYCW', '10457': 'NYCW', '10458': 'NYCW', '10459': 'NYCW', '10460': 'NYCW', '10461': 'NYCW', '10462': 'NYCW', '10463': 'NYCW', '10464': 'NYCW', '10465': 'NYCW', '10466': 'NYCW', '10467': 'NYCW', '10468': 'NYCW', '10469': 'NYCW', '10470': 'NYCW', '10471': 'NYCW', '10472': 'NYCW', '10473': 'NYCW', '10474': 'NYCW', '10475': 'NYCW', '10499': 'NYCW', '10501': 'NYCW', '10502': 'NYCW', '10503': 'NYCW', '10504': 'NYCW', '10505': 'NYUP', '10506': 'NYCW', '10507': 'NYCW', '10509': 'NYUP', '10510': 'NYCW', '10511': 'NYCW', '10512': 'NYUP', '10514': 'NYCW', '10516': 'NYUP', '10517': 'NYCW', '10518': 'NYUP', '10519': 'NYUP', '10520': 'NYCW', '10521': 'NYCW', '10522': 'NYCW', '10523': 'NYCW', '10524': 'NYUP', '10526': 'NYUP', '10527': 'NYUP', '10528': 'NYCW', '10530': 'NYCW', '10532': 'NYCW', '10533': 'NYCW', '10535': 'NYCW', '10536': 'NYCW', '10537': 'NYUP', '10538': 'NYCW', '10540': 'NYUP', '10541': 'NYUP', '10542': 'NYUP', '10543': 'NYCW', '10545': 'NYCW', '10546': 'NYCW', '10547': 'NYCW', '10548': 'NYCW', '10549': 'NYCW', '10550': 'NYCW', '10551': 'NYCW', '10552': 'NYCW', '10553': 'NYCW', '10560': 'NYUP', '10562': 'NYCW', '10566': 'NYCW', '10567': 'NYUP', '10570': 'NYCW', '10573': 'NYCW', '10576': 'NYCW', '10577': 'NYCW', '10578': 'NYUP', '10579': 'NYUP', '10580': 'NYCW', '10583': 'NYCW', '10587': 'NYUP', '10588': 'NYCW', '10589': 'NYUP', '10590': 'NYUP', '10591': 'NYCW', '10594': 'NYCW', '10595': 'NYCW', '10596': 'NYCW', '10597': 'NYUP', '10598': 'NYCW', '10601': 'NYCW', '10602': 'NYCW', '10603': 'NYCW', '10604': 'NYCW', '10605': 'NYCW', '10606': 'NYCW', '10607': 'NYCW', '10610': 'NYCW', '10701': 'NYCW', '10702': 'NYCW', '10703': 'NYCW', '10704': 'NYCW', '10705': 'NYCW', '10706': 'NYCW', '10707': 'NYCW', '10708': 'NYCW', '10709': 'NYCW', '10710': 'NYCW', '10801': 'NYCW', '10802': 'NYCW', '10803': 'NYCW', '10804': 'NYCW', '10805': 'NYCW', '10901': 'NYUP', '10910': 'NYUP', '10911': 'NYUP', '10912': 'NYUP', '10913': 'NYUP', '10914': 'NYUP', '10915': 'NYUP', '10916': 'NYUP', '10917': 'NYUP', '10918': 'NYUP', '10919': 'NYUP', '10920': 'NYUP', '10921': 'NYUP', '10922': 'NYUP', '10923': 'NYUP', '10924': 'NYUP', '10925': 'NYUP', '10926': 'NYUP', '10927': 'NYUP', '10928': 'NYUP', '10930': 'NYUP', '10931': 'NYUP', '10932': 'NYUP', '10933': 'NYUP', '10940': 'NYUP', '10941': 'NYUP', '10949': 'NYUP', '10950': 'NYUP', '10952': 'NYUP', '10953': 'NYUP', '10954': 'NYUP', '10956': 'NYUP', '10958': 'NYUP', '10959': 'NYUP', '10960': 'NYUP', '10962': 'NYUP', '10963': 'NYUP', '10964': 'NYUP', '10965': 'NYUP', '10968': 'NYUP', '10969': 'NYUP', '10970': 'NYUP', '10973': 'NYUP', '10974': 'NYUP', '10975': 'NYUP', '10976': 'NYUP', '10977': 'NYUP', '10979': 'NYUP', '10980': 'NYUP', '10981': 'NYUP', '10982': 'NYUP', '10983': 'NYUP', '10984': 'NYUP', '10985': 'NYUP', '10986': 'NYUP', '10987': 'NYUP', '10988': 'NYUP', '10989': 'NYUP', '10990': 'NYUP', '10992': 'NYUP', '10993': 'NYUP', '10994': 'NYUP', '10996': 'NYUP', '10997': 'NYUP', '10998': 'NYUP', '11001': 'NYCW', '11002': 'NYCW', '11003': 'NYCW', '11004': 'NYCW', '11005': 'NYCW', '11010': 'NYLI', '11020': 'NYLI', '11021': 'NYLI', '11022': 'NYLI', '11023': 'NYLI', '11024': 'NYLI', '11026': 'NYLI', '11027': 'NYLI', '11030': 'NYLI', '11040': 'NYCW', '11042': 'NYLI', '11050': 'NYLI', '11051': 'NYLI', '11052': 'NYLI', '11053': 'NYLI', '11054': 'NYLI', '11055': 'NYLI', '11096': 'NYCW', '11101': 'NYCW', '11102': 'NYCW', '11103': 'NYCW', '11104': 'NYCW', '11105': 'NYCW', '11106': 'NYCW', '11109': 'NYCW', '11120': 'NYCW', '11201': 'NYCW', '11202': 'NYCW', '11203': 'NYCW', '11204': 'NYCW', '11205': 'NYCW', '11206': 'NYCW', '11207': 'NYCW', '11208': 'NYCW', '11209': 'NYCW', '11210': 'NYCW', '11211': 'NYCW', '11212': 'NYCW', '11213': 'NYCW', '11214': 'NYCW', '11215': 'NYCW', '11216': 'NYCW', '11217': 'NYCW', '11218': 'NYCW', '11219': 'NYCW', '11220': 'NYCW', '11221': 'NYCW', '11222': 'NYCW', '11223': 'NYCW', '11224': 'NYCW', '11225': 'NYCW', '11226': 'NYCW', '11228': 'NYCW', '11229': 'NYCW', '11230': 'NYCW', '11231': 'NYCW', '11232': 'NYCW', '11233': 'NYCW', '11234': 'NYCW', '11235': 'NYCW', '11236': 'NYCW', '11237': 'NYCW', '11238': 'NYCW', '11239': 'NYCW', '11241': 'NYCW', '11242': 'NYCW', '11243': 'NYCW', '11245': 'NYCW', '11247': 'NYCW', '11249': 'NYCW', '11251': 'NYCW', '11252': 'NYCW', '11256': 'NYCW', '11351': 'NYCW', '11352': 'NYCW', '11354': 'NYCW', '11355': 'NYCW', '11356': 'NYCW', '11357': 'NYCW', '11358': 'NYCW', '11359': 'NYCW', '11360': 'NYCW', '11361': 'NYCW', '11362': 'NYCW', '11363': 'NYCW', '11364': 'NYCW', '11365': 'NYCW', '11366': 'NYCW', '11367': 'NYCW', '11368': 'NYCW', '11369': 'NYCW', '11370': 'NYCW', '11371': 'NYCW', '11372': 'NYCW', '11373': 'NYCW', '11374': 'NYCW', '11375': 'NYCW', '11377': 'NYCW', '11378': 'NYCW', '11379': 'NYCW', '11380': 'NYCW', '11381': 'NYCW', '11385': 'NYCW', '11386': 'NYCW', '11390': 'NYCW', '11405': 'NYCW', '11411': 'NYCW', '11412': 'NYCW', '11413': 'NYCW', '11414': 'NYCW', '11415': 'NYCW', '11416': 'NYCW', '11417': 'NYCW', '11418': 'NYCW', '11419': 'NYCW', '11420': 'NYCW', '11421': 'NYCW', '11422': 'NYCW', '11423': 'NYCW', '11424': 'NYCW', '11425': 'NYCW', '11426': 'NYCW', '11427': 'NYCW', '11428': 'NYCW', '11429': 'NYCW', '11430': 'NYCW', '11431': 'NYCW', '11432': 'NYCW', '11433': 'NYCW', '11434': 'NYCW', '11435': 'NYCW', '11436': 'NYCW', '11437': 'NYCW', '11439': 'NYCW', '11451': 'NYCW', '11499': 'NYCW', '11501': 'NYLI', '11507': 'NYLI', '11509': 'NYLI', '11510': 'NYLI', '11514': 'NYLI', '11516': 'NYCW', '11518': 'NYLI', '11520': 'NYLI', '11530': 'NYLI', '11531': 'NYLI', '11535': 'NYLI', '11542': 'NYLI', '11545': 'NYLI', '11547': 'NYLI', '11548': 'NYLI', '11549': 'NYLI', '11550': 'NYLI', '11551': 'NYLI', '11552': 'NYLI', '11553': 'NYLI', '11554': 'NYLI', '11555': 'NYLI', '11556': 'NYLI', '11557': 'NYLI', '11558': 'NYLI', '11559': 'NYCW', '11560': 'NYLI', '11561': 'NYLI', '11563': 'NYLI', '11565': 'NYLI', '11566': 'NYLI', '11568': 'NYLI', '11569': 'NYLI', '11570': 'NYLI', '11571': 'NYLI', '11572': 'NYLI', '11575': 'NYLI', '11576': 'NYLI', '11577': 'NYLI', '11579': 'NYLI', '11580': 'NYCW', '11581': 'NYCW', '11582': 'NYLI', '11590': 'NYLI', '11596': 'NYLI', '11598': 'NYLI', '11599': 'NYLI', '11690': 'NYCW', '11691': 'NYCW', '11692': 'NYCW', '11693': 'NYCW', '11694': 'NYCW', '11695': 'NYCW', '11697': 'NYCW', '11701': 'NYLI', '11702': 'NYLI', '11703': 'NYLI', '11704': 'NYLI', '11705': 'NYLI', '11706': 'NYLI', '11707': 'NYLI', '11709': 'NYLI', '11710': 'NYLI', '11713': 'NYLI', '11714': 'NYLI', '11715': 'NYLI', '11716': 'NYLI', '11717': 'NYLI', '11718': 'NYLI', '11719': 'NYLI', '11720': 'NYLI', '11721': 'NYLI', '11722': 'NYLI', '11724': 'NYLI', '11725': 'NYLI', '11726': 'NYLI', '11727': 'NYLI', '11729': 'NYLI', '11730': 'NYLI', '11731': 'NYLI', '11732': 'NYLI', '11733': 'NYLI', '11735': 'NYLI', '11736': 'NYLI', '11737': 'NYLI', '11738': 'NYLI', '11739': 'NYLI', '11740': 'NYLI', '11741': 'NYLI', '11742': 'NYLI', '11743': 'NYLI', '11746': 'NYLI', '11747': 'NYLI', '11749': 'NYLI', '11751': 'NYLI', '11752': 'NYLI', '11753': 'NYLI', '11754': 'NYLI', '11755': 'NYLI', '11756': 'NYLI', '11757': 'NYLI', '11758': 'NYLI', '11760': 'NYLI', '11762': 'NYLI', '11763': 'NYLI', '11764': 'NYLI', '11765': 'NYLI', '11766': 'NYLI', '11767': 'NYLI', '11768': 'NYLI', '11769': 'NYLI', '11770': 'NYLI', '11771': 'NYLI', '11772': 'NYLI', '11773': 'NYLI', '11774': 'NYLI', '11775': 'NYLI', '11776': 'NYLI', '11777': 'NYLI', '11778': 'NYLI', '11779': 'NYLI', '11780': 'NYLI', '11782': 'NYLI', '11783': 'NYLI', '11784': 'NYLI', '11786': 'NYLI', '11787': 'NYLI', '11788': 'NYLI', '11789': 'NYLI', '11790': 'NYLI', '11791': 'NYLI', '11792': 'NYLI', '11793': 'NYLI', '11794': 'NYLI', '11795': 'NYLI', '11796': 'NYLI', '11797': 'NYLI', '11798': 'NYLI', '11801': 'NYLI', '11802': 'NYLI', '11803': 'NYLI', '11804': 'NYLI', '11815': 'NYLI', '11819': 'NYLI', '11853': 'NYLI', '11854': 'NYLI', '11901': 'NYLI', '11930': 'NYLI', '11931': 'NYLI', '11932': 'NYLI', '11933': 'NYLI', '11934': 'NYLI', '11935': 'NYLI', '11937': 'NYLI', '11939': 'NYLI', '11940': 'NYLI', '11941': 'NYLI', '11942': 'NYLI', '11944': 'NYLI', '11946': 'NYLI', '11947': 'NYLI', '11948': 'NYLI', '11949': 'NYLI', '11950': 'NYLI', '11951': 'NYLI', '11952': 'NYLI', '11953': 'NYLI', '11954': 'NYLI', '11955': 'NYLI', '11956': 'NYLI', '11957': 'NYLI', '11958': 'NYLI', '11959': 'NYLI', '11960': 'NYLI', '11961': 'NYLI', '11962': 'NYLI', '11963': 'NYLI', '11964': 'NYLI', '11965': 'NYLI', '11967': 'NYLI', '11968': 'NYLI', '11969': 'NYLI', '11970': 'NYLI', '11971': 'NYLI', '11972': 'NYLI', '11973': 'NYLI', '11975': 'NYLI', '11976': 'NYLI', '11977': 'NYLI', '11978': 'NYLI', '11980': 'NYLI', '12007': 'NYUP', '12008': 'NYUP', '12009': 'NYUP', '12010': 'NYUP', '12015': 'NYUP', '12016': 'NYUP', '12017': 'NYUP', '12018': 'NYUP', '12019': 'NYUP', '12020': 'NYUP', '12022': 'NYUP', '12023': 'NYUP', '12024': 'NYUP', '12025': 'NYUP', '12027': 'NYUP', '12028': 'NYUP', '12029': 'NYUP', '12031': 'NYUP', '12032': 'NYUP', '12033': 'NYUP', '12035': 'NYUP', '12036': 'NYUP', '12037': 'NYUP', '12040': 'NYUP', '12041': 'NYUP', '12042': 'NYUP', '12043': 'NYUP', '12045': 'NYUP', '12046': 'NYUP', '12047': 'NYUP', '12050': 'NYUP', '12051': 'NYUP', '12052': 'NYUP', '12053': 'NYUP', '12054': 'NYUP', '12055': 'NYUP', '12056': 'NYUP', '12057': 'NYUP', '12058': 'NYUP', '12059': 'NYUP', '12060': 'NYUP', '12061': 'NYUP', '12062': 'NYUP', '12063': 'NYUP', '12064': 'NYUP', '12065': 'NYUP', '12066': 'NYUP', '12067': 'NYUP', '12068': 'NYUP', '12069': 'NYUP', '12070': 'NYUP', '12071': 'NYUP', '12072': 'NYUP', '12073': 'NYUP', '12074': 'NYUP', '12075': 'NYUP', '12076': 'NYUP', '12077': 'NYUP', '12078': 'NYUP', '12082': 'NYUP', '12083': 'NYUP', '12084': 'NYUP', '12085': 'NYUP', '12086': 'NYUP', '12087': 'NYUP', '12089': 'NYUP', '12090': 'NYUP', '12092': 'NYUP', '12093': 'NYUP', '12094': 'NYUP', '12095': 'NYUP', '12106': 'NYUP', '12107': 'NYUP', '12108': 'NYUP', '12110': 'NYUP', '12115': 'NYUP', '12116': 'NYUP', '12117': 'NYUP', '12118': 'NYUP', '12120': 'NYUP', '12121': 'NYUP', '12122': 'NYUP', '12123': 'NYUP', '12124': 'NYUP', '12125': 'NYUP', '12128': 'NYUP', '12130': 'NYUP', '12131': 'NYUP', '12132': 'NYUP', '12133': 'NYUP', '12134': 'NYUP', '12136': 'NYUP', '12137': 'NYUP', '12138': 'NYUP', '12139': 'NYUP', '12140': 'NYUP', '12141': 'NYUP', '12143': 'NYUP', '12144': 'NYUP', '12147': 'NYUP', '12148': 'NYUP', '12149': 'NYUP', '12150': 'NYUP', '12151': 'NYUP', '12153': 'NYUP', '12154': 'NYUP', '12155': 'NYUP', '12156': 'NYUP', '12157': 'NYUP', '12158': 'NYUP', '12159': 'NYUP', '12160': 'NYUP', '12161': 'NYUP', '12164': 'NYUP', '12165': 'NYUP', '12166': 'NYUP', '12167': 'NYUP', '12168': 'NYUP', '12169': 'NYUP', '12170': 'NYUP', '12172': 'NYUP', '12173': 'NYUP', '12174': 'NYUP', '12175': 'NYUP', '12176': 'NYUP', '12177': 'NYUP', '12180': 'NYUP', '12181': 'NYUP', '12182': 'NYUP', '12183': 'NYUP', '12184': 'NYUP', '12185': 'NYUP', '12186': 'NYUP', '12187': 'NYUP', '12188': 'NYUP', '12189': 'NYUP', '12190': 'NYUP', '12192': 'NYUP', '12193': 'NYUP', '12194': 'NYUP', '12195': 'NYUP', '12196': 'NYUP', '12197': 'NYUP', '12198': 'NYUP', '12201': 'NYUP', '12202': 'NYUP', '12203': 'NYUP', '12204': 'NYUP', '12205': 'NYUP', '12206': 'NYUP', '12207': 'NYUP', '12208': 'NYUP', '12209': 'NYUP', '12210': 'NYUP', '12211': 'NYUP', '12212': 'NYUP', '12214': 'NYUP', '12220': 'NYUP', '12222': 'NYUP', '12223': 'NYUP', '12224': 'NYUP', '12225': 'NYUP', '12226': 'NYUP', '12227': 'NYUP', '12228': 'NYUP', '12229': 'NYUP', '12230': 'NYUP', '12231': 'NYUP', '12232': 'NYUP', '12233': 'NYUP', '12234': 'NYUP', '12235': 'NYUP', '12236': 'NYUP', '12237': 'NYUP', '12238': 'NYUP', '12239': 'NYUP', '12240': 'NYUP', '12241': 'NYUP', '12242': 'NYUP', '12243': 'NYUP', '12244': 'NYUP', '12245': 'NYUP', '12246': 'NYUP', '12247': 'NYUP', '12248': 'NYUP', '12249': 'NYUP', '12250': 'NYUP', '12252': 'NYUP', '12255': 'NYUP', '12256': 'NYUP', '12257': 'NYUP', '12260': 'NYUP', '12261': 'NYUP', '12288': 'NYUP', '12301': 'NYUP', '12302': 'NYUP', '12303': 'NYUP', '12304': 'NYUP', '12305': 'NYUP', '12306': 'NYUP', '12307': 'NYUP', '12308': 'NYUP', '12309': 'NYUP', '12325': 'NYUP', '12345': 'NYUP', '12401': 'NYUP', '12402': 'NYUP', '12404': 'NYUP', '12405': 'NYUP', '12406': 'NYUP', '12407': 'NYUP', '12409': 'NYUP', '12410': 'NYUP', '12411': 'NYUP', '12412': 'NYUP', '12413': 'NYUP', '12414': 'NYUP', '12416': 'NYUP', '12417': 'NYUP', '12418': 'NYUP', '12419': 'NYUP', '12420': 'NYUP', '12421': 'NYUP', '12422': 'NYUP', '12423': 'NYUP', '12424': 'NYUP', '12427': 'NYUP', '12428': 'NYUP', '12429': 'NYUP', '12430': 'NYUP', '12431': 'NYUP', '12432': 'NYUP', '12433': 'NYUP', '12434': 'NYUP', '12435': 'NYUP', '12436': 'NYUP', '12438': 'NYUP', '12439': 'NYUP', '12440': 'NYUP', '12441': 'NYUP', '12442': 'NYUP', '12443': 'NYUP', '12444': 'NYUP', '12446': 'NYUP', '12448': 'NYUP', '12449': 'NYUP', '12450': 'NYUP', '12451': 'NYUP', '12452': 'NYUP', '12453': 'NYUP', '12454': 'NYUP', '12455': 'NYUP', '12456': 'NYUP', '12457': 'NYUP', '12458': 'NYUP', '12459': 'NYUP', '12460': 'NYUP', '12461': 'NYUP', '12463': 'NYUP', '12464': 'NYUP', '12465': 'NYUP', '12466': 'NYUP', '12468': 'NYUP', '12469': 'NYUP', '12470': 'NYUP', '12471': 'NYUP', '12472': 'NYUP', '12473': 'NYUP', '12474': 'NYUP', '12475': 'NYUP', '12477': 'NYUP', '12480': 'NYUP', '12481': 'NYUP', '12482': 'NYUP', '12483': 'NYUP', '12484': 'NYUP', '12485': 'NYUP', '12486': 'NYUP', '12487': 'NYUP', '12489': 'NYUP', '12490': 'NYUP', '12491': 'NYUP', '12492': 'NYUP', '12493': 'NYUP', '12494': 'NYUP', '12495': 'NYUP', '12496': 'NYUP', '12498': 'NYUP', '12501': 'NYUP', '12502': 'NYUP', '12503': 'NYUP', '12504': 'NYUP', '12506': 'NYUP', '12507': 'NYUP', '12508': 'NYUP', '12510': 'NYUP', '12511': 'NYUP', '12512': 'NYUP', '12513': 'NYUP', '12514': 'NYUP', '12515': 'NYUP', '12516': 'NYUP', '12517': 'NYUP', '12518': 'NYUP', '12520': 'NYUP', '12521': 'NYUP', '12522': 'NYUP', '12523': 'NYUP', '12524': 'NYUP', '12525': 'NYUP', '12526': 'NYUP', '12527': 'NYUP', '12528': 'NYUP', '12529': 'NYUP', '12530': 'NYUP', '12531': 'NYUP', '12533': 'NYUP', '12534': 'NYUP', '12537': 'NYUP', '12538': 'NYUP', '12540': 'NYUP', '12541': 'NYUP', '12542': 'NYUP', '12543': 'NYUP', '12544': 'NYUP', '12545': 'NYUP', '12546': 'NYUP', '12547': 'NYUP', '12548': 'NYUP', '12549': 'NYUP', '12550': 'NYUP', '12551': 'NYUP', '12552': 'NYUP', '12553': 'NYUP', '12555': 'NYUP', '12561': 'NYUP', '12563': 'NYUP', '12564': 'NYUP', '12565': 'NYUP', '12566': 'NYUP', '12567': 'NYUP', '12568': 'NYUP', '12569': 'NYUP', '12570': 'NYUP', '12571': 'NYUP', '12572': 'NYUP', '12574': 'NYUP', '12575': 'NYUP', '12577': 'NYUP', '12578': 'NYUP', '12580': 'NYUP', '12581': 'NYUP', '12582': 'NYUP', '12583': 'NYUP', '12584': 'NYUP', '12585': 'NYUP', '12586': 'NYUP', '12588': 'NYUP', '12589': 'NYUP', '12590': 'NYUP', '12592': 'NYUP', '12594': 'NYUP', '12601': 'NYUP', '12602': 'NYUP', '12603': 'NYUP', '12604': 'NYUP', '12701': 'NYUP', '12719': 'NYUP', '12720': 'NYUP', '12721': 'NYUP', '12722': 'NYUP', '12723': 'NYUP', '12724': 'NYUP', '12725': 'NYUP', '12726': 'NYUP', '12727': 'NYUP', '12729': 'NYUP', '12732': 'NYUP', '12733': 'NYUP', '12734': 'NYUP', '12736': 'NYUP', '12737': 'NYUP', '12738': 'NYUP', '12740': 'NYUP', '12741': 'NYUP', '12742': 'NYUP', '12743': 'NYUP', '12745': 'NYUP', '12746': 'NYUP', '12747': 'NYUP', '12748': 'NYUP', '12749': 'NYUP', '12750': 'NYUP', '12751': 'NYUP', '12752': 'NYUP', '12754': 'NYUP', '12758': 'NYUP', '12759': 'NYUP', '12760': 'NYUP', '12762': 'NYUP', '12763': 'NYUP', '12764': 'NYUP', '12765': 'NYUP', '12766': 'NYUP', '12767': 'NYUP', '12768': 'NYUP', '12769': 'NYUP', '12770': 'NYUP', '12771': 'NYUP', '12775': 'NYUP', '12776': 'NYUP', '12777': 'NYUP', '12778': 'NYUP', '12779': 'NYUP', '12780': 'NYUP', '12781': 'NYUP', '12783': 'NYUP', '12784': 'NYUP', '12785': 'NYUP', '12786': 'NYUP', '12787': 'NYUP', '12788': 'NYUP', '12789': 'NYUP', '12790': 'NYUP', '12791': 'NYUP', '12792': 'NYUP', '12801': 'NYUP', '12803': 'NYUP', '12804': 'NYUP', '12808': 'NYUP', '12809': 'NYUP', '12810': 'NYUP', '12811': 'NYUP', '12812': 'NYUP', '12814': 'NYUP', '12815': 'NYUP', '12816': 'NYUP', '12817': 'NYUP', '12819': 'NYUP', '12820': 'NYUP', '12821': 'NYUP', '12822': 'NYUP', '12823': 'NYUP', '12824': 'NYUP', '12827': 'NYUP', '12828': 'NYUP', '12831': 'NYUP', '12832': 'NYUP', '12833': 'NYUP', '12834': 'NYUP', '12835': 'NYUP', '12836': 'NYUP', '12837': 'NYUP', '12838': 'NYUP', '12839': 'NYUP', '12841': 'NYUP', '12842': 'NYUP', '12843': 'NYUP', '12844': 'NYUP', '12845': 'NYUP', '12846': 'NYUP', '12847': 'NYUP', '12848': 'NYUP', '12849': 'NYUP', '12850': 'NYUP', '12851': 'NYUP', '12852': 'NYUP', '12853': 'NYUP', '12854': 'NYUP', '12855': 'NYUP', '12856': 'NYUP', '12857': 'NYUP', '12858': 'NYUP', '12859': 'NYUP', '12860': 'NYUP', '12861': 'NYUP', '12862': 'NYUP', '12863': 'NYUP', '12864': 'NYUP', '12865': 'NYUP', '12866': 'NYUP', '12870': 'NYUP', '12871': 'NYUP', '12872': 'NYUP', '12873': 'NYUP', '12874': 'NYUP', '12878': 'NYUP', '12879': 'NYUP', '12883': 'NYUP', '12884': 'NYUP', '12885': 'NYUP', '12886': 'NYUP', '12887': 'NYUP', '12901': 'NYUP', '12903': 'NYUP', '12910': 'NYUP', '12911': 'NYUP', '12912': 'NYUP', '12913': 'NYUP', '12914': 'NYUP', '12915': 'NYUP', '12916': 'NYUP', '12917': 'NYUP', '12918': 'NYUP', '12919': 'NYUP', '12920': 'NYUP', '12921': 'NYUP', '12922': 'NYUP', '12923': 'NYUP', '12924': 'NYUP', '12926': 'NYUP', '12927': 'NYUP', '12928': 'NYUP', '12929': 'NYUP', '12930': 'NYUP', '12932': 'NYUP', '12933': 'NYUP', '12934': 'NYUP', '12935': 'NYUP', '12936': 'NYUP', '12937': 'NYUP', '12939': 'NYUP', '12941': 'NYUP', '12942': 'NYUP', '12943': 'NYUP', '12944': 'NYUP', '12945': 'NYUP', '12946': 'NYUP', '12949': 'NYUP', '12950': 'NYUP', '12952': 'NYUP', '12953': 'NYUP', '12955': 'NYUP', '12956': 'NYUP', '12957': 'NYUP', '12958': 'NYUP', '12959': 'NYUP', '12960': 'NYUP', '12961': 'NYUP', '12962': 'NYUP', '12964': 'NYUP', '12965': 'NYUP', '12966': 'NYUP', '12967': 'NYUP', '12969': 'NYUP', '12970': 'NYUP', '12972': 'NYUP', '12973': 'NYUP', '12974': 'NYUP', '12975': 'NYUP', '12976': 'NYUP', '12977': 'NYUP', '12978': 'NYUP', '12979': 'NYUP', '12980': 'NYUP', '12981': 'NYUP', '12983': 'NYUP', '12985': 'NYUP', '12986': 'NYUP', '12987': 'NYUP', '12989': 'NYUP', '12992': 'NYUP', '12993': 'NYUP', '12995': 'NYUP', '12996': 'NYUP', '12997': 'NYUP', '12998': 'NYUP', '13020': 'NYUP', '13021': 'NYUP', '13022': 'NYUP', '13024': 'NYUP', '13026': 'NYUP', '13027': 'NYUP', '13028': 'NYUP', '13029': 'NYUP', '13030': 'NYUP', '13031': 'NYUP', '13032': 'NYUP', '13033': 'NYUP', '13034': 'NYUP', '13035': 'NYUP', '13036': 'NYUP', '13037': 'NYUP', '13039': 'NYUP', '13040': 'NYUP', '13041': 'NYUP', '13042': 'NYUP', '13043': 'NYUP', '13044': 'NYUP', '13045': 'NYUP', '13051': 'NYUP', '13052': 'NYUP', '13053': 'NYUP', '13054': 'NYUP', '13056': 'NYUP', '13057': 'NYUP', '13060': 'NYUP', '13061': 'NYUP', '13062': 'NYUP', '13063': 'NYUP', '13064': 'NYUP', '13065': 'NYUP', '13066': 'NYUP', '13068': 'NYUP', '13069': 'NYUP', '13071': 'NYUP', '13072': 'NYUP', '13073': 'NYUP', '13074': 'NYUP', '13076': 'NYUP', '13077': 'NYUP', '13078': 'NYUP', '13080': 'NYUP', '13081': 'NYUP', '13082': 'NYUP', '13083': 'NYUP', '13084': 'NYUP', '13087': 'NYUP', '13088': 'NYUP', '13089': 'NYUP', '13090': 'NYUP', '13092': 'NYUP', '13093': 'NYUP', '13101': 'NYUP', '13102': 'NYUP', '13103': 'NYUP', '13104': 'NYUP', '13107': 'NYUP', '13108': 'NYUP', '13110': 'NYUP', '13111': 'NYUP', '13112': 'NYUP', '13113': 'NYUP', '13114': 'NYUP', '13115': 'NYUP', '13116': 'NYUP', '13117': 'NYUP', '13118': 'NYUP', '13119': 'NYUP', '13120': 'NYUP', '13121': 'NYUP', '13122': 'NYUP', '13123': 'NYUP', '13124': 'NYUP', '13126': 'NYUP', '13131': 'NYUP', '13132': 'NYUP', '13134': 'NYUP', '13135': 'NYUP', '13136': 'NYUP', '13137': 'NYUP', '13138': 'NYUP', '13139': 'NYUP', '13140': 'NYUP', '13141': 'NYUP', '13142': 'NYUP', '13143': 'NYUP', '13144': 'NYUP', '13145': 'NYUP', '13146': 'NYUP', '13147': 'NYUP', '13148': 'NYUP', '13152': 'NYUP', '13153': 'NYUP', '13154': 'NYUP', '13155': 'NYUP', '13156': 'NYUP', '13157': 'NYUP', '13158': 'NYUP', '13159': 'NYUP', '13160': 'NYUP', '13162': 'NYUP', '13163': 'NYUP', '13164': 'NYUP', '13165': 'NYUP', '13166': 'NYUP', '13167': 'NYUP', '13201': 'NYUP', '13202': 'NYUP', '13203': 'NYUP', '13204': 'NYUP', '13205': 'NYUP', '13206': 'NYUP', '13207': 'NYUP', '13208': 'NYUP', '13209': 'NYUP', '13210': 'NYUP', '13211': 'NYUP', '13212': 'NYUP', '13214': 'NYUP', '13215': 'NYUP', '13217': 'NYUP', '13218': 'NYUP', '13219': 'NYUP', '13220': 'NYUP', '13221': 'NYUP', '13224': 'NYUP', '13225': 'NYUP', '13235': 'NYUP', '13244': 'NYUP', '13250': 'NYUP', '13251': 'NYUP', '13252': 'NYUP', '13261': 'NYUP', '13290': 'NYUP', '13301': 'NYUP', '13302': 'NYUP', '13303': 'NYUP', '13304': 'NYUP', '13305': 'NYUP', '13308': 'NYUP', '13309': 'NYUP', '13310': 'NYUP', '13312': 'NYUP', '13313': 'NYUP', '13314': 'NYUP', '13315': 'NYUP', '13316': 'NYUP', '13317': 'NYUP', '13318': 'NYUP', '13319': 'NYUP', '13320': 'NYUP', '13321': 'NYUP', '13322': 'NYUP', '13323': 'NYUP', '13324': 'NYUP', '13325': 'NYUP', '13326': 'NYUP', '13327': 'NYUP', '13328': 'NYUP', '13329': 'NYUP', '13331': 'NYUP', '13332': 'NYUP', '13333': 'NYUP', '13334': 'NYUP', '13335': 'NYUP', '13337': 'NYUP', '13338': 'NYUP', '13339': 'NYUP', '13340': 'NYUP', '13341': 'NYUP', '13342': 'NYUP', '13343': 'NYUP', '13345': 'NYUP', '13346': 'NYUP', '13348': 'NYUP', '13350': 'NYUP', '13352': 'NYUP', '13353': 'NYUP', '13354': 'NYUP', '13355': 'NYUP', '13357': 'NYUP', '13360': 'NYUP', '13361': 'NYUP', '13362': 'NYUP', '13363': 'NYUP', '13364': 'NYUP', '13365': 'NYUP', '13367': 'NYUP', '13368': 'NYUP', '13401': 'NYUP', '13402': 'NYUP', '13403': 'NYUP', '13404': 'NYUP', '13406': 'NYUP', '13407': 'NYUP', '13408': 'NYUP', '13409': 'NYUP', '13410': 'NYUP', '13411': 'NYUP', '13413': 'NYUP', '13415': 'NYUP', '13416': 'NYUP', '13417': 'NYUP', '13418': 'NYUP', '13420': 'NYUP', '13421': 'NYUP', '13424': 'NYUP', '13425': 'NYUP', '13426': 'NYUP', '13428': 'NYUP', '13431': 'NYUP', '13433': 'NYUP', '13435': 'NYUP', '13436': 'NYUP', '13437': 'NYUP', '13438': 'NYUP', '13439': 'NYUP', '13440': 'NYUP', '13441': 'NYUP', '13442': 'NYUP', '13449': 'NYUP', '13450': 'NYUP', '13452': 'NYUP', '13454': 'NYUP', '13455': 'NYUP', '13456': 'NYUP', '13457': 'NYUP', '13459': 'NYUP', '13460': 'NYUP', '13461': 'NYUP', '13464': 'NYUP', '13465': 'NYUP', '13468': 'NYUP', '13469': 'NYUP', '13470': 'NYUP', '13471': 'NYUP', '13472': 'NYUP', '13473': 'NYUP', '13475': 'NYUP', '13476': 'NYUP', '13477': 'NYUP', '13478': 'NYUP', '13479': 'NYUP', '13480': 'NYUP', '13482': 'NYUP', '13483': 'NYUP', '13484': 'NYUP', '13485': 'NYUP', '13486': 'NYUP', '13488': 'NYUP', '13489': 'NYUP', '13490': 'NYUP', '13491': 'NYUP', '13492': 'NYUP', '13493': 'NYUP', '13494': 'NYUP', '13495': 'NYUP', '13501': 'NYUP', '13502': 'NYUP', '13503': 'NYUP', '13504': 'NYUP', '13505': 'NYUP', '13599': 'NYUP', '13601': 'NYUP', '13602': 'NYUP', '13603': 'NYUP', '13605': 'NYUP', '13606': 'NYUP', '13607': 'NYUP', '13608': 'NYUP', '13611': 'NYUP', '13612': 'NYUP', '13613': 'NYUP', '13614': 'NYUP', '13615': 'NYUP', '13616': 'NYUP', '13617': 'NYUP', '13618': 'NYUP', '13619': 'NYUP', '13620': 'NYUP', '13621': 'NYUP', '13622': 'NYUP', '13623': 'NYUP', '13624': 'NYUP', '13625': 'NYUP', '13626': 'NYUP', '13627': 'NYUP', '13628': 'NYUP', '13630': 'NYUP', '13631': 'NYUP', '13632': 'NYUP', '13633': 'NYUP', '13634': 'NYUP', '13635': 'NYUP', '13636': 'NYUP', '13637': 'NYUP', '13638': 'NYUP', '13639': 'NYUP', '13640': 'NYUP', '13641': 'NYUP', '13642': 'NYUP', '13643': 'NYUP', '13645': 'NYUP', '13646': 'NYUP', '13647': 'NYUP', '13648': 'NYUP', '13649': 'NYUP', '13650': 'NYUP', '13651': 'NYUP', '13652': 'NYUP', '13654': 'NYUP', '13655': 'NYUP', '13656': 'NYUP', '13657': 'NYUP', '13658': 'NYUP', '13659': 'NYUP', '13660': 'NYUP', '13661': 'NYUP', '13662': 'NYUP', '13664': 'NYUP', '13665': 'NYUP', '13666': 'NYUP', '13667': 'NYUP', '13668': 'NYUP', '13669': 'NYUP', '13670': 'NYUP', '13671': 'NYUP', '13672': 'NYUP', '13673': 'NYUP', '13674': 'NYUP', '13675': 'NYUP', '13676': 'NYUP', '13677': 'NYUP', '13678': 'NYUP', '13679': 'NYUP', '13680': 'NYUP', '13681': 'NYUP', '13682': 'NYUP', '13683': 'NYUP', '13684': 'NYUP', '13685': 'NYUP', '13687': 'NYUP', '13690': 'NYUP', '13691': 'NYUP', '13692': 'NYUP', '13693': 'NYUP', '13694': 'NYUP', '13695': 'NYUP', '13696': 'NYUP', '13697': 'NYUP', '13699': 'NYUP', '13730': 'NYUP', '13731': 'NYUP', '13732': 'NYUP', '13733': 'NYUP', '13734': 'NYUP', '13736': 'NYUP', '13737': 'NYUP', '13738': 'NYUP', '13739': 'NYUP', '13740': 'NYUP', '13743': 'NYUP', '13744': 'NYUP', '13745': 'NYUP', '13746': 'NYUP', '13747': 'NYUP', '13748': 'NYUP', '13749': 'NYUP', '13750': 'NYUP', '13751': 'NYUP', '13752': 'NYUP', '13753': 'NYUP', '13754': 'NYUP', '13755': 'NYUP', '13756': 'NYUP', '13757': 'NYUP', '13758': 'NYUP', '13760': 'NYUP', '13761': 'NYUP', '13762': 'NYUP', '13763': 'NYUP', '13774': 'NYUP', '13775': 'NYUP', '13776': 'NYUP', '13777': 'NYUP', '13778': 'NYUP', '13780': 'NYUP', '13782': 'NYUP', '13783': 'NYUP', '13784': 'NYUP', '13786': 'NYUP', '13787': 'NYUP', '13788': 'NYUP', '13790': 'NYUP', '13794': 'NYUP', '13795': 'NYUP', '13796': 'NYUP', '13797': 'NYUP', '13801': 'NYUP', '13802': 'NYUP', '13803': 'NYUP', '13804': 'NYUP', '13806': 'NYUP', '13807': 'NYUP', '13808': 'NYUP', '13809': 'NYUP', '13810': 'NYUP', '13811': 'NYUP', '13812': 'NYUP', '13813': 'NYUP', '13814': 'NYUP', '13815': 'NYUP', '13820': 'NYUP', '13825': 'NYUP', '13826': 'NYUP', '13827': 'NYUP', '13830': 'NYUP', '13832': 'NYUP', '13833': 'NYUP', '13834': 'NYUP', '13835': 'NYUP', '13838': 'NYUP', '13839': 'NYUP', '13840': 'NYUP', '13841': 'NYUP', '13842': 'NYUP', '13843': 'NYUP', '13844': 'NYUP', '13845': 'NYUP', '13846': 'NYUP', '13847': 'NYUP', '13848': 'NYUP', '13849': 'NYUP', '13850': 'NYUP', '13851': 'NYUP', '13856': 'NYUP', '13859': 'NYUP', '13860': 'NYUP', '13861': 'NYUP', '13862': 'NYUP', '13863': 'NYUP', '13864': 'NYUP', '13865': 'NYUP', '13901': 'NYUP', '13902': 'NYUP', '13903': 'NYUP', '13904': 'NYUP', '13905': 'NYUP', '14001': 'NYUP', '14004': 'NYUP', '14005': 'NYUP', '14006': 'NYUP', '14008': 'NYUP', '14009': 'NYUP', '14010': 'NYUP', '14011': 'NYUP', '14012': 'NYUP', '14013': 'NYUP', '14020': 'NYUP', '14021': 'NYUP', '14024': 'NYUP', '14025': 'NYUP', '14026': 'NYUP', '14027': 'NYUP', '14028': 'NYUP', '14029': 'NYUP', '14030': 'NYUP', '14031': 'NYUP', '14032': 'NYUP', '14033': 'NYUP', '14034': 'NYUP', '14035': 'NYUP', '14036': 'NYUP', '14037': 'NYUP', '14038': 'NYUP', '14039': 'NYUP', '14040': 'NYUP', '14041': 'NYUP', '14042': 'NYUP', '14043': 'NYUP', '14047': 'NYUP', '14048': 'NYUP', '14051': 'NYUP', '14052': 'NYUP', '14054': 'NYUP', '14055': 'NYUP', '14056': 'NYUP', '14057': 'NYUP', '14058': 'NYUP', '14059': 'NYUP', '14060': 'NYUP', '14061': 'NYUP', '14062': 'NYUP', '14063': 'NYUP', '14065': 'NYUP', '14066': 'NYUP', '14067': 'NYUP', '14068': 'NYUP', '14069': 'NYUP', '14070': 'NYUP', '14072': 'NYUP', '14075': 'NYUP', '14080': 'NYUP', '14081': 'NYUP', '14082': 'NYUP', '14083': 'NYUP', '14085': 'NYUP', '14086': 'NYUP', '14091': 'NYUP', '14092': 'NYUP', '14094': 'NYUP', '14095': 'NYUP', '14098': 'NYUP', '14101': 'NYUP', '14102': 'NYUP', '14103': 'NYUP', '14105': 'NYUP', '14107': 'NYUP', '14108': 'NYUP', '14109': 'NYUP', '14110': 'NYUP', '14111': 'NYUP', '14112': 'NYUP', '14113': 'NYUP', '14120': 'NYUP', '14125': 'NYUP', '14126': 'NYUP', '14127': 'NYUP', '14129': 'NYUP', '14130': 'NYUP', '14131': 'NYUP', '14132': 'NYUP', '14133': 'NYUP', '14134': 'NYUP', '14135': 'NYUP', '14136': 'NYUP', '14138': 'NYUP', '14139': 'NYUP', '14140': 'NYUP', '14141': 'NYUP', '14143': 'NYUP', '14144': 'NYUP', '14145': 'NYUP', '14150': 'NYUP', '14151': 'NYUP', '14166': 'NYUP', '14167': 'NYUP', '14168': 'NYUP', '14169': 'NYUP', '14170': 'NYUP', '14171': 'NYUP', '14172': 'NYUP', '14173': 'NYUP', '14174': 'NYUP', '14201': 'NYUP', '14202': 'NYUP', '14203': 'NYUP', '14204': 'NYUP', '14205': 'NYUP', '14206': 'NYUP', '14207': 'NYUP', '14208': 'NYUP', '14209': 'NYUP', '14210': 'NYUP', '14211': 'NYUP', '14212': 'NYUP', '14213': 'NYUP', '14214': 'NYUP', '14215': 'NYUP', '14216': 'NYUP', '14217': 'NYUP', '14218': 'NYUP', '14219': 'NYUP', '14220': 'NYUP', '14221': 'NYUP', '14222': 'NYUP', '14223': 'NYUP', '14224': 'NYUP', '14225': 'NYUP', '14226': 'NYUP', '14227': 'NYUP', '14228': 'NYUP', '14231': 'NYUP', '14233': 'NYUP', '14240': 'NYUP', '14241': 'NYUP', '14260': 'NYUP', '14261': 'NYUP', '14263': 'NYUP', '14264': 'NYUP', '14265': 'NYUP', '14267': 'NYUP', '14269': 'NYUP', '14270': 'NYUP', '14272': 'NYUP', '14273': 'NYUP', '14276': 'NYUP', '14280': 'NYUP', '14301': 'NYUP', '14302': 'NYUP', '14303': 'NYUP', '14304': 'NYUP', '14305': 'NYUP', '14410': 'NYUP', '14411': 'NYUP', '14413': 'NYUP', '14414': 'NYUP', '14415': 'NYUP', '14416': 'NYUP', '14418': 'NYUP', '14420': 'NYUP', '14422': 'NYUP', '14423': 'NYUP', '14424': 'NYUP', '14425': 'NYUP', '14427': 'NYUP', '14428': 'NYUP', '14429': 'NYUP', '14430': 'NYUP', '14432': 'NYUP', '14433': 'NYUP', '14435': 'NYUP', '14437': 'NYUP', '14441': 'NYUP', '14443': 'NYUP', '14445': 'NYUP', '14449': 'NYUP', '14450': 'NYUP', '14452': 'NYUP', '14453': 'NYUP', '14454': 'NYUP', '14456': 'NYUP', '14461': 'NYUP', '14462': 'NYUP', '14463': 'NYUP', '14464': 'NYUP', '14466': 'NYUP', '14467': 'NYUP', '14468': 'NYUP', '14469': 'NYUP', '14470': 'NYUP', '14471': 'NYUP', '14472': 'NYUP', '14475': 'NYUP', '14476': 'NYUP', '14477': 'NYUP', '14478': 'NYUP', '14479': 'NYUP', '14480': 'NYUP', '14481': 'NYUP', '14482': 'NYUP', '14485': 'NYUP', '14486': 'NYUP', '14487': 'NYUP', '14488': 'NYUP', '14489': 'NYUP', '14502': 'NYUP', '14504': 'NYUP', '14505': 'NYUP', '14506': 'NYUP', '14507': 'NYUP', '14508': 'NYUP', '14510': 'NYUP', '14511': 'NYUP', '14512': 'NYUP', '14513': 'NYUP', '14514': 'NYUP', '14515': 'NYUP', '14516': 'NYUP', '14517': 'NYUP', '14518': 'NYUP', '14519': 'NYUP', '14520': 'NYUP', '14521': 'NYUP', '14522': 'NYUP', '14525': 'NYUP', '14526': 'NYUP', '14527': 'NYUP', '14529': 'NYUP', '14530': 'NYUP', '14532': 'NYUP', '14533': 'NYUP', '14534': 'NYUP', '14536': 'NYUP', '14537': 'NYUP', '14538': 'NYUP', '14539': 'NYUP', '14541': 'NYUP', '14542': 'NYUP', '14543': 'NYUP', '14544': 'NYUP', '14545': 'NYUP', '14546': 'NYUP', '14547': 'NYUP', '14548': 'NYUP', '14549': 'NYUP', '14550': 'NYUP', '14551': 'NYUP', '14555': 'NYUP', '14556': 'NYUP', '14557': 'NYUP', '14558': 'NYUP', '14559': 'NYUP', '14560': 'NYUP', '14561': 'NYUP', '14563': 'NYUP', '14564': 'NYUP', '14568': 'NYUP', '14569': 'NYUP', '14571': 'NYUP', '14572': 'NYUP', '14580': 'NYUP', '14585': 'NYUP', '14586': 'NYUP', '14588': 'NYUP', '14589': 'NYUP', '14590': 'NYUP', '14591': 'NYUP', '14592': 'NYUP', '14602': 'NYUP', '14603': 'NYUP', '14604': 'NYUP', '14605': 'NYUP', '14606': 'NYUP', '14607': 'NYUP', '14608': 'NYUP', '14609': 'NYUP', '14610': 'NYUP', '14611': 'NYUP', '14612': 'NYUP', '14613': 'NYUP', '14614': 'NYUP', '14615': 'NYUP', '14616': 'NYUP', '14617': 'NYUP', '14618': 'NYUP', '14619': 'NYUP', '14620': 'NYUP', '14621': 'NYUP', '14622': 'NYUP', '14623': 'NYUP', '14624': 'NYUP', '14625': 'NYUP', '14626': 'NYUP', '14627': 'NYUP', '14638': 'NYUP', '14639': 'NYUP', '14642': 'NYUP', '14643': 'NYUP', '14644': 'NYUP', '14646': 'NYUP', '14647': 'NYUP', '14649': 'NYUP', '14650': 'NYUP', '14651': 'NYUP', '14652': 'NYUP', '14653': 'NYUP', '14692': 'NYUP', '14694': 'NYUP', '14701': 'NYUP', '14702': 'NYUP', '14706': 'NYUP', '14707': 'NYUP', '14708': 'NYUP', '14709': 'NYUP', '14710': 'NYUP', '14711': 'NYUP', '14712': 'NYUP', '14714': 'NYUP', '14715': 'NYUP', '14716': 'NYUP', '14717': 'NYUP', '14718': 'NYUP', '14719': 'NYUP', '14720': 'NYUP', '14721': 'NYUP', '14722': 'NYUP', '14723': 'NYUP', '14724': 'NYUP', '14726': 'NYUP', '14727': 'NYUP', '14728': 'NYUP', '14729': 'NYUP', '14730': 'NYUP', '14731': 'NYUP', '14732': 'NYUP', '14733': 'NYUP', '14735': 'NYUP', '14736': 'NYUP', '14737': 'NYUP', '14738': 'NYUP', '14739': 'NYUP', '14740': 'NYUP', '14741': 'NYUP', '14742': 'NYUP', '14743': 'NYUP', '14744': 'NYUP', '14745': 'NYUP', '14747': 'NYUP', '14748': 'NYUP', '14750': 'NYUP', '14751': 'NYUP', '14752': 'NYUP', '14753': 'NYUP', '14754': 'RFCE', '14755': 'NYUP', '14756': 'NYUP', '14757': 'NYUP', '14758': 'NYUP', '14760': 'NYUP', '14766': 'NYUP', '14767': 'NYUP', '14769': 'NYUP', '14770': 'NYUP', '14772': 'NYUP', '14774': 'NYUP', '14775': 'NYUP', '14777': 'NYUP', '14778': 'NYUP', '14779': 'NYUP', '14781': 'NYUP', '14782': 'NYUP', '14783': 'NYUP', '14784': 'NYUP', '14785': 'NYUP', '14786': 'NYUP', '14787': 'NYUP', '14788': 'NYUP', '14801': 'NYUP', '14802': 'NYUP', '14803': 'NYUP', '14804': 'NYUP', '14805': 'NYUP', '14806': 'NYUP', '14807': 'NYUP', '14808': 'NYUP', '14809': 'NYUP', '14810': 'NYUP', '14812': 'NYUP', '14813': 'NYUP', '14814': 'NYUP', '14815': 'NYUP', '14816': 'NYUP', '14817': 'NYUP', '14818': 'NYUP', '14819': 'NYUP', '14820': 'NYUP', '14821': 'NYUP', '14822': 'NYUP', '14823': 'NYUP', '14824': 'NYUP', '14825': 'NYUP', '14826': 'NYUP', '14827': 'NYUP', '14830': 'NYUP', '14831': 'NYUP', '14836': 'NYUP', '14837': 'NYUP', '14838': 'NYUP', '14839': 'NYUP', '14840': 'NYUP', '14841': 'NYUP', '14842': 'NYUP', '14843': 'NYUP', '14845': 'NYUP', '14846': 'NYUP', '14847': 'NYUP', '14850': 'NYUP', '14851': 'NYUP', '14852': 'NYUP', '14853': 'NYUP', '14854': 'NYUP', '14855': 'NYUP', '14856': 'NYUP', '14857': 'NYUP', '14858': 'NYUP', '14859': 'NYUP', '14860': 'NYUP', '14861': 'NYUP', '14863': 'NYUP', '14864': 'NYUP', '14865': 'NYUP', '14867': 'NYUP', '14869': 'NYUP', '14870': 'NYUP', '14871': 'NYUP', '14872': 'NYUP', '14873': 'NYUP', '14874': 'NYUP', '14876': 'NYUP', '14877': 'NYUP', '14878': 'NYUP', '14879': 'NYUP', '14880': 'NYUP', '14881': 'NYUP', '14882': 'NYUP', '14883': 'NYUP', '14884': 'NYUP', '14885': 'NYUP', '14886': 'NYUP', '14887': 'NYUP', '14889': 'NYUP', '14891': 'NYUP', '14892': 'NYUP', '14893': 'NYUP', '14894': 'NYUP', '14895': 'NYUP', '14897': 'NYUP', '14898': 'NYUP', '14901': 'NYUP', '14902': 'NYUP', '14903': 'NYUP', '14904': 'NYUP', '14905': 'NYUP', '14925': 'NYUP', '15001': 'RFCW', '15003': 'RFCW', '15004': 'RFCW', '15005': 'RFCW', '15006': 'RFCW', '15007': 'RFCE', '15009': 'RFCW', '15010': 'RFCW', '15012': 'RFCW', '15014': 'RFCW', '15015': 'RFCW', '15017': 'RFCW', '15018': 'RFCW', '15019': 'RFCW', '15020': 'RFCW', '15021': 'RFCW', '15022': 'RFCW', '15024': 'RFCW', '15025': 'RFCW', '15026': 'RFCW', '15027': 'RFCW', '15028': 'RFCW', '15030': 'RFCW', '15031': 'RFCW', '15032': 'RFCW', '15033': 'RFCW', '15034': 'RFCW', '15035': 'RFCW', '15037': 'RFCW', '15038': 'RFCW', '15042': 'RFCW', '15043': 'RFCW', '15044': 'RFCE', '15045': 'RFCW', '15046': 'RFCW', '15047': 'RFCW', '15049': 'RFCW', '15050': 'RFCW', '15051': 'RFCW', '15052': 'RFCW', '15053': 'RFCW', '15054': 'RFCW', '15055': 'RFCW', '15056': 'RFCW', '15057': 'RFCW', '15059': 'RFCW', '15060': 'RFCW', '15061': 'RFCW', '15062': 'RFCW', '15063': 'RFCW', '15064': 'RFCW', '15065': 'RFCW', '15066': 'RFCW', '15067': 'RFCW', '15068': 'RFCW', '15069': 'RFCW', '15071': 'RFCW', '15072': 'RFCW', '15074': 'RFCW', '15075': 'RFCW', '15076': 'RFCW', '15077': 'RFCW', '15078': 'RFCW', '15081': 'RFCW', '15082': 'RFCW', '15083': 'RFCW', '15084': 'RFCE', '15085': 'RFCW', '15086': 'RFCW', '15087': 'RFCW', '15088': 'RFCW', '15089': 'RFCW', '15090': 'RFCW', '15091': 'RFCW', '15095': 'RFCW', '15096': 'RFCW', '15101': 'RFCE', '15102': 'RFCW', '15104': 'RFCW', '15106': 'RFCW', '15108': 'RFCW', '15110': 'RFCW', '15112': 'RFCW', '15116': 'RFCW', '15120': 'RFCW', '15122': 'RFCW', '15123': 'RFCW', '15126': 'RFCW', '15127': 'RFCW', '15129': 'RFCW', '15131': 'RFCW', '15132': 'RFCW', '15133': 'RFCW', '15134': 'RFCW', '15135': 'RFCW', '15136': 'RFCW', '15137': 'RFCW', '15139': 'RFCW', '15140': 'RFCW', '15142': 'RFCW', '15143': 'RFCW', '15144': 'RFCW', '15145': 'RFCW', '15146': 'RFCW', '15147': 'RFCW', '15148': 'RFCW', '15201': 'RFCW', '15202': 'RFCW', '15203': 'RFCW', '15204': 'RFCW', '15205': 'RFCW', '15206': 'RFCW', '15207': 'RFCW', '15208': 'RFCW', '15209': 'RFCW', '15210': 'RFCW', '15211': 'RFCW', '15212': 'RFCW', '15213': 'RFCW', '15214': 'RFCW', '15215': 'RFCW', '15216': 'RFCW', '15217': 'RFCW', '15218': 'RFCW', '15219': 'RFCW', '15220': 'RFCW', '15221': 'RFCW', '15222': 'RFCW', '15223': 'RFCW', '15224': 'RFCW', '15225': 'RFCW', '15226': 'RFCW', '15227': 'RFCW', '15228': 'RFCW', '15229': 'RFCW', '15230': 'RFCW', '15231': 'RFCW', '15232': 'RFCW', '15233': 'RFCW', '15234': 'RFCW', '15235': 'RFCW', '15236': 'RFCW', '15237': 'RFCW', '15238': 'RFCW', '15239': 'RFCW', '15240': 'RFCW', '15241': 'RFCW', '15242': 'RFCW', '15243': 'RFCW', '15244': 'RFCW', '15250': 'RFCW', '15251': 'RFCW', '15252': 'RFCW', '15253': 'RFCW', '15254': 'RFCW', '15255': 'RFCW', '15257': 'RFCW', '15258': 'RFCW', '15259': 'RFCW', '15260': 'RFCW', '15261': 'RFCW', '15262': 'RFCW', '15264': 'RFCW', '15265': 'RFCW', '15267': 'RFCW', '15268': 'RFCW', '15270': 'RFCW', '15272': 'RFCW', '15274': 'RFCW', '15275': 'RFCW', '15276': 'RFCW', '15277': 'RFCW', '15278': 'RFCW', '15279': 'RFCW', '15281': 'RFCW', '15282': 'RFCW', '15283': 'RFCW', '15286': 'RFCW', '15289': 'RFCW', '15290': 'RFCW', '15295': 'RFCW', '15301': 'RFCW', '15310': 'RFCW', '15311': 'RFCW', '15312': 'RFCW', '15313': 'RFCW', '15314': 'RFCW', '15315': 'RFCW', '15316': 'RFCW', '15317': 'RFCW', '15320': 'RFCW', '15321': 'RFCW', '15322': 'RFCW', '15323': 'RFCW', '15324': 'RFCW', '15325': 'RFCW', '15327': 'RFCW', '15329': 'RFCW', '15330': 'RFCW', '15331': 'RFCW', '15332': 'RFCW', '15333': 'RFCW', '15334': 'RFCW', '15336': 'RFCW', '15337': 'RFCW', '15338': 'RFCW', '15339': 'RFCW', '15340': 'RFCW', '15341': 'RFCW', '15342': 'RFCW', '15344': 'RFCW', '15345': 'RFCW', '15346': 'RFCW', '15347': 'RFCW', '15348': 'RFCW', '15349': 'RFCW', '15350': 'RFCW', '15351': 'RFCW', '15352': 'RFCW', '15353': 'RFCW', '15357': 'RFCW', '15358': 'RFCW', '15359': 'RFCW', '15360': 'RFCW', '15361': 'RFCW', '15362': 'RFCW', '15363': 'RFCW', '15364': 'RFCW', '15365': 'RFCW', '15366': 'RFCW', '15367': 'RFCW', '15368': 'RFCW', '15370': 'RFCW', '15376': 'RFCW', '15377': 'RFCW', '15378': 'RFCW', '15379': 'RFCW', '15380': 'RFCW', '15401': 'RFCW', '15410': 'RFCW', '15411': 'RFCE', '15412': 'RFCW', '15413': 'RFCW', '15415': 'RFCW', '15416': 'RFCW', '15417': 'RFCW', '15419': 'RFCW', '15420': 'RFCW', '15421': 'RFCW', '15422': 'RFCW', '15423': 'RFCW', '15424': 'RFCE', '15425': 'RFCW', '15427': 'RFCW', '15428': 'RFCW', '15429': 'RFCW', '15430': 'RFCW', '15431': 'RFCE', '15432': 'RFCW', '15433': 'RFCW', '15434': 'RFCW', '15435': 'RFCW', '15436': 'RFCW', '15437': 'RFCW', '15438': 'RFCW', '15439': 'RFCW', '15440': 'RFCW', '15442': 'RFCW', '15443': 'RFCW', '15444': 'RFCW', '15445': 'RFCW', '15446': 'RFCE', '15447': 'RFCW', '15448': 'RFCW', '15449': 'RFCW', '15450': 'RFCW', '15451': 'RFCW', '15454': 'RFCW', '15455': 'RFCW', '15456': 'RFCW', '15458': 'RFCW', '15459': 'RFCE', '15460': 'RFCW', '15461': 'RFCW', '15462': 'RFCW', '15463': 'RFCW', '15464': 'RFCE', '15465': 'RFCW', '15466': 'RFCW', '15467': 'RFCW', '15468': 'RFCW', '15469': 'RFCE', '15470': 'RFCE', '15472': 'RFCW', '15473': 'RFCW', '15474': 'RFCW', '15475': 'RFCW', '15476': 'RFCW', '15477': 'RFCW', '15478': 'RFCW', '15479': 'RFCW', '15480': 'RFCW', '15482': 'RFCW', '15483': 'RFCW', '15484': 'RFCW', '15485': 'RFCE', '15486': 'RFCW', '15488': 'RFCW', '15489': 'RFCW', '15490': 'RFCW', '15492': 'RFCW', '15501': 'RFCE', '15502': 'RFCE', '15510': 'RFCE', '15520': 'RFCE', '15521': 'RFCE', '15522': 'RFCE', '15530': 'RFCE', '15531': 'RFCE', '15532': 'RFCE', '15533': 'RFCE', '15534': 'RFCE', '15535': 'RFCE', '15536': 'RFCE', '15537': 'RFCE', '15538': 'RFCE', '15539': 'RFCE', '15540': 'RFCE', '15541': 'RFCE', '15542': 'RFCE', '15544': 'RFCE', '15545': 'RFCE', '15546': 'RFCE', '15547': 'RFCE', '15548': 'RFCE', '15549': 'RFCE', '15550': 'RFCE', '15551': 'RFCE', '15552': 'RFCE', '15553': 'RFCE', '15554': 'RFCE', '15555': 'RFCE', '15557': 'RFCE', '15558': 'RFCE', '15559': 'RFCE', '15560': 'RFCE', '15561': 'RFCE', '15562': 'RFCE', '15563': 'RFCE', '15564': 'RFCE', '15565': 'RFCE', '15601': 'RFCW', '15605': 'RFCW', '15606': 'RFCW', '15610': 'RFCW', '15611': 'RFCW', '15612': 'RFCW', '15613': 'RFCE', '15615': 'RFCW', '15616': 'RFCW', '15617': 'RFCW', '15618': 'RFCE', '15619': 'RFCW', '15620': 'RFCW', '15621': 'RFCW', '15622': 'RFCE', '15623': 'RFCW', '15624': 'RFCW', '15625': 'RFCW', '15626': 'RFCW', '15627': 'RFCE', '15628': 'RFCW', '15629': 'RFCW', '15631': 'RFCW', '15632': 'RFCW', '15633': 'RFCW', '15634': 'RFCW', '15635': 'RFCW', '15636': 'RFCW', '15637': 'RFCW', '15638': 'RFCW', '15639': 'RFCW', '15640': 'RFCW', '15641': 'RFCW', '15642': 'RFCW', '15644': 'RFCW', '15646': 'RFCW', '15647': 'RFCW', '15650': 'RFCW', '15655': 'RFCE', '15656': 'RFCW', '15658': 'RFCE', '15660': 'RFCW', '15661': 'RFCW', '15662': 'RFCW', '15663': 'RFCW', '15664': 'RFCW', '15665': 'RFCW', '15666': 'RFCW', '15668': 'RFCW', '15670': 'RFCE', '15671': 'RFCW', '15672': 'RFCW', '15673': 'RFCW', '15674': 'RFCW', '15675': 'RFCW', '15676': 'RFCW', '15677': 'RFCE', '15678': 'RFCW', '15679': 'RFCW', '15680': 'RFCW', '15681': 'RFCE', '15682': 'RFCW', '15683': 'RFCW', '15684': 'RFCW', '15685': 'RFCW', '15686': 'RFCE', '15687': 'RFCE', '15688': 'RFCW', '15689': 'RFCW', '15690': 'RFCW', '15691': 'RFCW', '15692': 'RFCW', '15693': 'RFCW', '15695': 'RFCW', '15696': 'RFCW', '15697': 'RFCW', '15698': 'RFCW', '15701': 'RFCE', '15705': 'RFCE', '15710': 'RFCE', '15711': 'RFCE', '15712': 'RFCE', '15713': 'RFCE', '15714': 'RFCE', '15715': 'RFCE', '15716': 'RFCE', '15717': 'RFCE', '15720': 'RFCE', '15721': 'RFCE', '15722': 'RFCE', '15723': 'RFCE', '15724': 'RFCE', '15725': 'RFCE', '15727': 'RFCE', '15728': 'RFCE', '15729': 'RFCE', '15730': 'RFCE', '15731': 'RFCE', '15732': 'RFCE', '15733': 'RFCE', '15734': 'RFCE', '15736': 'RFCE', '15737': 'RFCE', '15738': 'RFCE', '15739': 'RFCE', '15741': 'RFCE', '15742': 'RFCE', '15744': 'RFCE', '15745': 'RFCE', '15746': 'RFCE', '15747': 'RFCE', '15748': 'RFCE', '15750': 'RFCE', '15752': 'RFCE', '15753': 'RFCE', '15754': 'RFCE', '15756': 'RFCE', '15757': 'RFCE', '15758': 'RFCE', '15759': 'RFCE', '15760': 'RFCE', '15761': 'RFCE', '15762': 'RFCE', '15763': 'RFCE', '15764': 'RFCE', '15765': 'RFCE', '15767': 'RFCE', '15770': 'RFCE', '15771': 'RFCE', '15772': 'RFCE', '15773': 'RFCE', '15774': 'RFCE', '15775': 'RFCE', '15776': 'RFCE', '15777': 'RFCE', '15778': 'RFCE', '15779': 'RFCE', '15780': 'RFCE', '15781': 'RFCE', '15783': 'RFCE', '15784': 'RFCE', '15801': 'RFCE', '15821': 'RFCW', '15822': 'RFCW', '15823': 'RFCE', '15824': 'RFCE', '15825': 'RFCE', '15827': 'RFCW', '15828': 'RFCE', '15829': 'RFCE', '15831': 'RFCW', '15832': 'RFCE', '15834': 'RFCE', '15840': 'RFCE', '15841': 'RFCW', '15845': 'RFCW', '15846': 'RFCE', '15847': 'RFCE', '15848': 'RFCE', '15849': 'RFCE', '15851': 'RFCE', '15853': 'RFCE', '15856': 'RFCE', '15857': 'RFCW', '15860': 'RFCE', '15861': 'RFCE', '15863': 'RFCE', '15864': 'RFCE', '15865': 'RFCE', '15866': 'RFCE', '15868': 'RFCE', '15870': 'RFCW', '15901': 'RFCE', '15902': 'RFCE', '15904': 'RFCE', '15905': 'RFCE', '15906': 'RFCE', '15907': 'RFCE', '15909': 'RFCE', '15915': 'RFCE', '15920': 'RFCE', '15921': 'RFCE', '15922': 'RFCE', '15923': 'RFCE', '15924': 'RFCE', '15925': 'RFCE', '15926': 'RFCE', '15927': 'RFCE', '15928': 'RFCE', '15929': 'RFCE', '15930': 'RFCE', '15931': 'RFCE', '15934': 'RFCE', '15935': 'RFCE', '15936': 'RFCE', '15937': 'RFCE', '15938': 'RFCE', '15940': 'RFCE', '15942': 'RFCE', '15943': 'RFCE', '15944': 'RFCE', '15945': 'RFCE', '15946': 'RFCE', '15948': 'RFCE', '15949': 'RFCE', '15951': 'RFCE', '15952': 'RFCE', '15953': 'RFCE', '15954': 'RFCE', '15955': 'RFCE', '15956': 'RFCE', '15957': 'RFCE', '15958': 'RFCE', '15959': 'RFCE', '15960': 'RFCE', '15961': 'RFCE', '15962': 'RFCE', '15963': 'RFCE', '16001': 'RFCE', '16002': 'RFCE', '16003': 'RFCW', '16016': 'RFCE', '16017': 'RFCE', '16018': 'RFCE', '16020': 'RFCE', '16021': 'RFCE', '16022': 'RFCE', '16023': 'RFCE', '16024': 'RFCW', '16025': 'RFCE', '16027': 'RFCW', '16028': 'RFCE', '16029': 'RFCE', '16030': 'RFCE', '16033': 'RFCE', '16034': 'RFCE', '16035': 'RFCE', '16036': 'RFCE', '16037': 'RFCE', '16038': 'RFCE', '16039': 'RFCE', '16040': 'RFCE', '16041': 'RFCE', '16045': 'RFCW', '16046': 'RFCE', '16048': 'RFCE', '16049': 'RFCE', '16050': 'RFCE', '16051': 'RFCE', '16052': 'RFCE', '16053': 'RFCE', '16054': 'RFCE', '16055': 'RFCE', '16056': 'RFCE', '16057': 'RFCE', '16058': 'RFCE', '16059': 'RFCE', '16061': 'RFCE', '16063': 'RFCE', '16066': 'RFCW', '16101': 'RFCE', '16102': 'RFCW', '16103': 'RFCW', '16105': 'RFCW', '16107': 'RFCW', '16108': 'RFCW', '16110': 'RFCE', '16111': 'RFCE', '16112': 'RFCW', '16113': 'RFCW', '16114': 'RFCW', '16115': 'RFCW', '16116': 'RFCW', '16117': 'RFCW', '16120': 'RFCW', '16121': 'RFCW', '16123': 'RFCW', '16124': 'RFCW', '16125': 'RFCE', '16127': 'RFCE', '16130': 'RFCE', '16131': 'RFCE', '16132': 'RFCW', '16133': 'RFCW', '16134': 'RFCE', '16136': 'RFCW', '16137': 'RFCW', '16140': 'RFCW', '16141': 'RFCW', '16142': 'RFCW', '16143': 'RFCW', '16145': 'RFCE', '16146': 'RFCW', '16148': 'RFCW', '16150': 'RFCW', '16151': 'RFCW', '16153': 'RFCE', '16154': 'RFCW', '16155': 'RFCW', '16156': 'RFCE', '16157': 'RFCW', '16159': 'RFCW', '16160': 'RFCW', '16161': 'RFCW', '16172': 'RFCW', '16201': 'RFCE', '16210': 'RFCE', '16211': 'RFCE', '16212': 'RFCW', '16213': 'RFCE', '16214': 'RFCE', '16217': 'RFCE', '16218': 'RFCE', '16220': 'RFCE', '16221': 'RFCE', '16222': 'RFCE', '16223': 'RFCW', '16224': 'RFCE', '16225': 'RFCE', '16226': 'RFCE', '16228': 'RFCW', '16229': 'RFCE', '16230': 'RFCE', '16232': 'RFCE', '16233': 'RFCE', '16234': 'RFCE', '16235': 'RFCE', '16236': 'RFCW', '16238': 'RFCW', '16239': 'RFCE', '16240': 'RFCE', '16242': 'RFCE', '16244': 'RFCW', '16245': 'RFCE', '16246': 'RFCE', '16248': 'RFCE', '16249': 'RFCE', '16250': 'RFCW', '16253': 'RFCW', '16254': 'RFCE', '16255': 'RFCE', '16256': 'RFCE', '16257': 'RFCE', '16258': 'RFCE', '16259': 'RFCE', '16260': 'RFCE', '16261': 'RFCW', '16262': 'RFCE', '16263': 'RFCW', '16301': 'RFCE', '16311': 'RFCE', '16312': 'RFCE', '16313': 'RFCE', '16314': 'RFCE', '16316': 'RFCE', '16317': 'RFCE', '16319': 'RFCE', '16321': 'RFCE', '16322': 'RFCE', '16323': 'RFCE', '16326': 'RFCE', '16327': 'RFCE', '16328': 'RFCE', '16329': 'RFCE', '16331': 'RFCE', '16332': 'RFCE', '16333': 'RFCE', '16334': 'RFCE', '16335': 'RFCE', '16340': 'RFCE', '16341': 'RFCE', '16342': 'RFCE', '16343': 'RFCE', '16344': 'RFCE', '16345': 'RFCE', '16346': 'RFCE', '16347': 'RFCE', '16350': 'RFCE', '16351': 'RFCE', '16352': 'RFCE', '16353': 'RFCE', '16354': 'RFCE', '16360': 'RFCE', '16361': 'RFCE', '16362': 'RFCE', '16364': 'RFCE', '16365': 'RFCE', '16366': 'RFCE', '16367': 'RFCE', '16368': 'RFCE', '16369': 'RFCE', '16370': 'RFCE', '16371': 'RFCE', '16372': 'RFCE', '16373': 'RFCE', '16374': 'RFCE', '16375': 'RFCE', '16388': 'RFCE', '16401': 'RFCE', '16402': 'RFCE', '16403': 'RFCE', '16404': 'RFCE', '16405': 'RFCE', '16406': 'RFCE', '16407': 'RFCE', '16410': 'RFCE', '16411': 'RFCE', '16412': 'RFCE', '16413': 'RFCE', '16415': 'RFCE', '16416': 'RFCE', '16417': 'RFCE', '16420': 'RFCE', '16421': 'RFCE', '16422': 'RFCE', '16423': 'RFCE', '16424': 'RFCE', '16426': 'RFCE', '16427': 'RFCE', '16428': 'RFCE', '16430': 'RFCE', '16432': 'RFCE', '16433': 'RFCE', '16434': 'RFCE', '16435': 'RFCE', '16436': 'RFCE', '16438': 'RFCE', '16440': 'RFCE', '16441': 'RFCE', '16442': 'RFCE', '16443': 'RFCE', '16444': 'RFCE', '16475': 'RFCE', '16501': 'RFCE', '16502': 'RFCE', '16503': 'RFCE', '16504': 'RFCE', '16505': 'RFCE', '16506': 'RFCE', '16507': 'RFCE', '16508': 'RFCE', '16509': 'RFCE', '16510': 'RFCE', '16511': 'RFCE', '16512': 'RFCE', '16514': 'RFCE', '16515': 'RFCE', '16522': 'RFCE', '16530': 'RFCE', '16531': 'RFCE', '16534': 'RFCE', '16538': 'RFCE', '16541': 'RFCE', '16544': 'RFCE', '16546': 'RFCE', '16550': 'RFCE', '16553': 'RFCE', '16563': 'RFCE', '16565': 'RFCE', '16601': 'RFCE', '16602': 'RFCE', '16603': 'RFCE', '16611': 'RFCE', '16613': 'RFCE', '16616': 'RFCE', '16617': 'RFCE', '16619': 'RFCE', '16620': 'RFCE', '16621': 'RFCE', '16622': 'RFCE', '16623': 'RFCE', '16624': 'RFCE', '16625': 'RFCE', '16627': 'RFCE', '16629': 'RFCE', '16630': 'RFCE', '16631': 'RFCE', '16633': 'RFCE', '16634': 'RFCE', '16635': 'RFCE', '16636': 'RFCE', '16637': 'RFCE', '16638': 'RFCE', '16639': 'RFCE', '16640': 'RFCE', '16641': 'RFCE', '16644': 'RFCE', '16645': 'RFCE', '16646': 'RFCE', '16647': 'RFCE', '16648': 'RFCE', '16650': 'RFCE', '16651': 'RFCE', '16652': 'RFCE', '16654': 'RFCE', '16655': 'RFCE', '16656': 'RFCE', '16657': 'RFCE', '16659': 'RFCE', '16660': 'RFCE', '16661': 'RFCE', '16662': 'RFCE', '16663': 'RFCE', '16664': 'RFCE', '16665': 'RFCE', '16666': 'RFCE', '16667': 'RFCE', '16668': 'RFCE', '16669': 'RFCE', '16670': 'RFCE', '16671': 'RFCE', '16672': 'RFCE', '16673': 'RFCE', '16674': 'RFCE', '16675': 'RFCE', '16677': 'RFCE', '16678': 'RFCE', '16679': 'RFCE', '16680': 'RFCE', '16681': 'RFCE', '16682': 'RFCE', '16683': 'RFCE', '16684': 'RFCE', '16685': 'RFCE', '16686': 'RFCE', '16689': 'RFCE', '16691': 'RFCE', '16692': 'RFCE', '16693': 'RFCE', '16694': 'RFCE', '16695': 'RFCE', '16698': 'RFCE', '16699': 'RFCE', '16701': 'RFCE', '16720': 'RFCE', '16724': 'RFCW', '16725': 'RFCE', '16726': 'RFCE', '16727': 'RFCE', '16728': 'RFCW', '16729': 'RFCE', '16730': 'RFCE', '16731': 'RFCE', '16732': 'RFCE', '16733': 'RFCW', '16734': 'RFCW', '16735': 'RFCE', '16738': 'RFCE', '16740': 'RFCW', '16743': 'RFCE', '16744': 'RFCE', '16745': 'RFCE', '16746': 'RFCE', '16748': 'RFCE', '16749': 'RFCE', '16750': 'RFCE', '16801': 'RFCE', '16802': 'RFCW', '16803': 'RFCW', '16804': 'RFCW', '16805': 'RFCW', '16820': 'RFCE', '16821': 'RFCE', '16822': 'RFCE', '16823': 'RFCW', '16825': 'RFCE', '16826': 'RFCW', '16827': 'RFCW', '16828': 'RFCE', '16829': 'RFCE', '16830': 'RFCE', '16832': 'RFCE', '16833': 'RFCE', '16834': 'RFCE', '16835': 'RFCW', '16836': 'RFCE', '16837': 'RFCE', '16838': 'RFCE', '16839': 'RFCE', '16840': 'RFCE', '16841': 'RFCE', '16843': 'RFCE', '16844': 'RFCE', '16845': 'RFCE', '16847': 'RFCE', '16848': 'RFCW', '16849': 'RFCE', '16850': 'RFCE', '16851': 'RFCW', '16852': 'RFCW', '16853': 'RFCW', '16854': 'RFCW', '16855': 'RFCE', '16856': 'RFCW', '16858': 'RFCE', '16859': 'RFCE', '16860': 'RFCE', '16861': 'RFCE', '16863': 'RFCE', '16864': 'RFCE', '16865': 'RFCE', '16866': 'RFCE', '16868': 'RFCE', '16870': 'RFCE', '16871': 'RFCE', '16872': 'RFCE', '16873': 'RFCE', '16874': 'RFCE', '16875': 'RFCE', '16876': 'RFCE', '16877': 'RFCE', '16878': 'RFCE', '16879': 'RFCE', '16881': 'RFCE', '16882': 'RFCE', '16901': 'RFCE', '16910': 'RFCE', '16911': 'RFCE', '16912': 'RFCE', '16914': 'RFCE', '16915': 'RFCE', '16917': 'RFCE', '16920': 'RFCE', '16921': 'RFCE', '16922': 'RFCE', '16923': 'RFCE', '16925': 'RFCE', '16926': 'RFCE', '16927': 'RFCE', '16928': 'RFCE', '16929': 'RFCE', '16930': 'RFCE', '16932': 'RFCE', '16933': 'RFCE', '16935': 'RFCE', '16936': 'RFCE', '16937': 'RFCE', '16938': 'RFCE', '16939': 'RFCE', '16940': 'RFCE', '16941': 'RFCE', '16942': 'RFCE', '16943': 'RFCE', '16945': 'RFCE', '16946': 'RFCE', '16947': 'RFCE', '16948': 'RFCE', '16950': 'RFCE', '17001': 'RFCE', '17002': 'RFCE', '17003': 'RFCE', '17004': 'RFCE', '17005': 'RFCE', '17006': 'RFCE', '17007': 'RFCE', '17009': 'RFCE', '17010': 'RFCE', '17011': 'RFCE', '17012': 'RFCE', '17013': 'RFCE', '17014': 'RFCE', '17015': 'RFCE', '17016': 'RFCE', '17017': 'RFCE', '17018': 'RFCE', '17019': 'RFCE', '17020': 'RFCE', '17021': 'RFCE', '17022': 'RFCE', '17023': 'RFCE', '17024': 'RFCE', '17025': 'RFCE', '17026': 'RFCE', '17027': 'RFCE', '17028': 'RFCE', '17029': 'RFCE', '17030': 'RFCE', '17032': 'RFCE', '17033': 'RFCE', '17034': 'RFCE', '17035': 'RFCE', '17036': 'RFCE', '17037': 'RFCE', '17038': 'RFCE', '17039': 'RFCE', '17040': 'RFCE', '17041': 'RFCE', '17042': 'RFCE', '17043': 'RFCE', '17044': 'RFCE', '17045': 'RFCE', '17046': 'RFCE', '17047': 'RFCE', '17048': 'RFCE', '17049': 'RFCE', '17050': 'RFCE', '17051': 'RFCE', '17052': 'RFCE', '17053': 'RFCE', '17054': 'RFCE', '17055': 'RFCE', '17056': 'RFCE', '17057': 'RFCE', '17058': 'RFCE', '17059': 'RFCE', '17060': 'RFCE', '17061': 'RFCE', '17062': 'RFCE', '17063': 'RFCE', '17064': 'RFCE', '17065': 'RFCE', '17066': 'RFCE', '17067': 'RFCE', '17068': 'RFCE', '17069': 'RFCE', '17070': 'RFCE', '17071': 'RFCE', '17072': 'RFCE', '17073': 'RFCE', '17074': 'RFCE', '17075': 'RFCE', '17076': 'RFCE', '17077': 'RFCE', '17078': 'RFCE', '17080': 'RFCE', '17081': 'RFCE', '17082': 'RFCE', '17083': 'RFCE', '17084': 'RFCE', '17085': 'RFCE', '17086': 'RFCE', '17087': 'RFCE', '17088': 'RFCE', '17089': 'RFCE', '17090': 'RFCE', '17093': 'RFCE', '17094': 'RFCE', '17097': 'RFCE', '17098': 'RFCE', '17099': 'RFCE', '17101': 'RFCE', '17102': 'RFCE', '17103': 'RFCE', '17104': 'RFCE', '17105': 'RFCE', '17106': 'RFCE', '17107': 'RFCE', '17108': 'RFCE', '17109': 'RFCE', '17110': 'RFCE', '17111': 'RFCE', '17112': 'RFCE', '17113': 'RFCE', '17120': 'RFCE', '17121': 'RFCE', '17122': 'RFCE', '17123': 'RFCE', '17124': 'RFCE', '17125': 'RFCE', '17126': 'RFCE', '17127': 'RFCE', '17128': 'RFCE', '17129': 'RFCE', '17130': 'RFCE', '17140': 'RFCE', '17177': 'RFCE', '17201': 'RFCE', '17202': 'RFCE', '17210': 'RFCE', '17211': 'RFCW', '17212': 'RFCW', '17213': 'RFCE', '17214': 'RFCE', '17215': 'RFCE', '17217': 'RFCE', '17219': 'RFCE', '17220': 'RFCE', '17221': 'RFCE', '17222': 'RFCE', '17223': 'RFCE', '17224': 'RFCE', '17225': 'RFCW', '17228': 'RFCE', '17229': 'RFCE', '17231': 'RFCW', '17232': 'RFCE', '17233': 'RFCE', '17235': 'RFCW', '17236': 'RFCW', '17237': 'RFCW', '17238': 'RFCE', '17239': 'RFCE', '17240': 'RFCE', '17241': 'RFCE', '17243': 'RFCE', '17244': 'RFCE', '17246': 'RFCE', '17247': 'RFCW', '17249': 'RFCE', '17250': 'RFCW', '17251': 'RFCE', '17252': 'RFCW', '17253': 'RFCE', '17254': 'RFCW', '17255': 'RFCE', '17256': 'RFCW', '17257': 'RFCE', '17260': 'RFCE', '17261': 'RFCW', '17262': 'RFCE', '17263': 'RFCW', '17264': 'RFCE', '17265': 'RFCE', '17266': 'RFCE', '17267': 'RFCE', '17268': 'RFCW', '17270': 'RFCW', '17271': 'RFCE', '17272': 'RFCW', '17301': 'RFCE', '17302': 'RFCE', '17303': 'RFCE', '17304': 'RFCE', '17306': 'RFCE', '17307': 'RFCE', '17309': 'RFCE', '17310': 'RFCE', '17311': 'RFCE', '17312': 'RFCE', '17313': 'RFCE', '17314': 'RFCE', '17315': 'RFCE', '17316': 'RFCE', '17317': 'RFCE', '17318': 'RFCE', '17319': 'RFCE', '17320': 'RFCE', '17321': 'RFCE', '17322': 'RFCE', '17323': 'RFCE', '17324': 'RFCE', '17325': 'RFCE', '17327': 'RFCE', '17329': 'RFCE', '17331': 'RFCE', '17332': 'RFCE', '17333': 'RFCE', '17334': 'RFCE', '17335': 'RFCE', '17337': 'RFCE', '17339': 'RFCE', '17340': 'RFCE', '17342': 'RFCE', '17343': 'RFCE', '17344': 'RFCE', '17345': 'RFCE', '17347': 'RFCE', '17349': 'RFCE', '17350': 'RFCE', '17352': 'RFCE', '17353': 'RFCE', '17354': 'RFCE', '17355': 'RFCE', '17356': 'RFCE', '17358': 'RFCE', '17360': 'RFCE', '17361': 'RFCE', '17362': 'RFCE', '17363': 'RFCE', '17364': 'RFCE', '17365': 'RFCE', '17366': 'RFCE', '17368': 'RFCE', '17370': 'RFCE', '17371': 'RFCE', '17372': 'RFCE', '17375': 'RFCE', '17401': 'RFCE', '17402': 'RFCE', '17403': 'RFCE', '17404': 'RFCE', '17405': 'RFCE', '17406': 'RFCE', '17407': 'RFCE', '17408': 'RFCE', '17415': 'RFCE', '17501': 'RFCE', '17502': 'RFCE', '17503': 'RFCE', '17504': 'RFCE', '17505': 'RFCE', '17506': 'RFCE', '17507': 'RFCE', '17508': 'RFCE', '17509': 'RFCE', '17512': 'RFCE', '17516': 'RFCE', '17517': 'RFCE', '17518': 'RFCE', '17519': 'RFCE', '17520': 'RFCE', '17521': 'RFCE', '17522': 'RFCE', '17527': 'RFCE', '17528': 'RFCE', '17529': 'RFCE', '17532': 'RFCE', '17533': 'RFCE', '17534': 'RFCE', '17535': 'RFCE', '17536': 'RFCE', '17537': 'RFCE', '17538': 'RFCE', '17540': 'RFCE', '17543': 'RFCE', '17545': 'RFCE', '17547': 'RFCE', '17549': 'RFCE', '17550': 'RFCE', '17551': 'RFCE', '17552': 'RFCE', '17554': 'RFCE', '17555': 'RFCE', '17557': 'RFCE', '17560': 'RFCE', '17562': 'RFCE', '17563': 'RFCE', '17564': 'RFCE', '17565': 'RFCE', '17566': 'RFCE', '17567': 'RFCE', '17568': 'RFCE', '17569': 'RFCE', '17570': 'RFCE', '17572': 'RFCE', '17573': 'RFCE', '17575': 'RFCE', '17576': 'RFCE', '17578': 'RFCE', '17579': 'RFCE', '17580': 'RFCE', '17581': 'RFCE', '17582': 'RFCE', '17583': 'RFCE', '17584': 'RFCE', '17585': 'RFCE', '17601': 'RFCE', '17602': 'RFCE', '17603': 'RFCE', '17604': 'RFCE', '17605': 'RFCE', '17606': 'RFCE', '17607': 'RFCE', '17608': 'RFCE', '17611': 'RFCE', '17622': 'RFCE', '17699': 'RFCE', '17701': 'RFCE', '17702': 'RFCE', '17703': 'RFCE', '17705': 'RFCE', '17720': 'RFCE', '17721': 'RFCE', '17723': 'RFCE', '17724': 'RFCE', '17726': 'RFCE', '17727': 'RFCE', '17728': 'RFCE', '17729': 'RFCE', '17730': 'RFCE', '17731': 'RFCE', '17735': 'RFCE', '17737': 'RFCE', '17738': 'RFCE', '17739': 'RFCE', '17740': 'RFCE', '17742': 'RFCE', '17744': 'RFCE', '17745': 'RFCE', '17747': 'RFCE', '17748': 'RFCE', '17749': 'RFCE', '17750': 'RFCW', '17751': 'RFCE', '17752': 'RFCE', '17754': 'RFCE', '17756': 'RFCE', '17758': 'RFCE', '17760': 'RFCE', '17762': 'RFCE', '17763': 'RFCE', '17764': 'RFCE', '17765': 'RFCE', '17767': 'RFCW', '17768': 'RFCE', '17769': 'RFCE', '17771': 'RFCE', '17772': 'RFCE', '17773': 'RFCE', '17774': 'RFCE', '17776': 'RFCE', '17777': 'RFCE', '17778': 'RFCE', '17779': 'RFCE', '17801': 'RFCE', '17810': 'RFCE', '17812': 'RFCE', '17813': 'RFCE', '17814': 'RFCE', '17815': 'RFCE', '17820': 'RFCE', '17821': 'RFCE', '17822': 'RFCE', '17823': 'RFCE', '17824': 'RFCE', '17827': 'RFCE', '17829': 'RFCE', '17830': 'RFCE', '17831': 'RFCE', '17832': 'RFCE', '17833': 'RFCE', '17834': 'RFCE', '17835': 'RFCE', '17836': 'RFCE', '17837': 'RFCE', '17839': 'RFCE', '17840': 'RFCE', '17841': 'RFCE', '17842': 'RFCE', '17843': 'RFCE', '17844': 'RFCE', '17845': 'RFCE', '17846': 'RFCE', '17847': 'RFCE', '17850': 'RFCE', '17851': 'RFCE', '17853': 'RFCE', '17855': 'RFCE', '17856': 'RFCE', '17857': 'RFCE', '17858': 'RFCE', '17859': 'RFCE', '17860': 'RFCE', '17861': 'RFCE', '17862': 'RFCE', '17864': 'RFCE', '17865': 'RFCE', '17866': 'RFCE', '17867': 'RFCE', '17868': 'RFCE', '17870': 'RFCE', '17872': 'RFCE', '17876': 'RFCE', '17877': 'RFCE', '17878': 'RFCE', '17880': 'RFCE', '17881': 'RFCE', '17882': 'RFCE', '17883': 'RFCE', '17884': 'RFCE', '17885': 'RFCE', '17886': 'RFCE', '17887': 'RFCE', '17888': 'RFCE', '17889': 'RFCE', '17901': 'RFCE', '17920': 'RFCE', '17921': 'RFCE', '17922': 'RFCE', '17923': 'RFCE', '17925': 'RFCE', '17929': 'RFCE', '17930': 'RFCE', '17931': 'RFCE', '17932': 'RFCE', '17933': 'RFCE', '17934': 'RFCE', '17935': 'RFCE', '17936': 'RFCE', '17938': 'RFCE', '17941': 'RFCE', '17942': 'RFCE', '17943': 'RFCE', '17944': 'RFCE', '17945': 'RFCE', '17946': 'RFCE', '17948': 'RFCE', '17949': 'RFCE', '17951': 'RFCE', '17952': 'RFCE', '17953': 'RFCE', '17954': 'RFCE', '17957': 'RFCE', '17959': 'RFCE', '17960': 'RFCE', '17961': 'RFCE', '17963': 'RFCE', '17964': 'RFCE', '17965': 'RFCE', '17966': 'RFCE', '17967': 'RFCE', '17968': 'RFCE', '17970': 'RFCE', '17972': 'RFCE', '17974': 'RFCE', '17976': 'RFCE', '17978': 'RFCE', '17979': 'RFCE', '17980': 'RFCE', '17981': 'RFCE', '17982': 'RFCE', '17983': 'RFCE', '17985': 'RFCE', '18001': 'RFCE', '18002': 'RFCE', '18003': 'RFCE', '18010': 'RFCE', '18011': 'RFCE', '18012': 'RFCE', '18013': 'RFCE', '18014': 'RFCE', '18015': 'RFCE', '18016': 'RFCE', '18017': 'RFCE', '18018': 'RFCE', '18020': 'RFCE', '18025': 'RFCE', '18030': 'RFCE', '18031': 'RFCE', '18032': 'RFCE', '18034': 'RFCE', '18035': 'RFCE', '18036': 'RFCE', '18037': 'RFCE', '18038': 'RFCE', '18039': 'RFCE', '18040': 'RFCE', '18041': 'RFCE', '18042': 'RFCE', '18043': 'RFCE', '18044': 'RFCE', '18045': 'RFCE', '18046': 'RFCE', '18049': 'RFCE', '18050': 'RFCE', '18051': 'RFCE', '18052': 'RFCE', '18053': 'RFCE', '18054': 'RFCE', '18055': 'RFCE', '18056': 'RFCE', '18058': 'RFCE', '18059': 'RFCE', '18060': 'RFCE', '18062': 'RFCE', '18063': 'RFCE', '18064': 'RFCE', '18065': 'RFCE', '18066': 'RFCE', '18067': 'RFCE', '18068': 'RFCE', '18069': 'RFCE', '18070': 'RFCE', '18071': 'RFCE', '18072': 'RFCE', '18073': 'RFCE', '18074': 'RFCE', '18076': 'RFCE', '18077': 'RFCE', '18078': 'RFCE', '18079': 'RFCE', '18080': 'RFCE', '18081': 'RFCE', '18083': 'RFCE', '18084': 'RFCE', '18085': 'RFCE', '18086': 'RFCE', '18087': 'RFCE', '18088': 'RFCE', '18091': 'RFCE', '18092': 'RFCE', '18098': 'RFCE', '18099': 'RFCE', '18101': 'RFCE', '18102': 'RFCE', '18103': 'RFCE', '18104': 'RFCE', '18105': 'RFCE', '18106': 'RFCE', '18109': 'RFCE', '18195': 'RFCE', '18201': 'RFCE', '18202': 'RFCE', '18210': 'RFCE', '18211': 'RFCE', '18212': 'RFCE', '18214': 'RFCE', '18216': 'RFCE', '18218': 'RFCE', '18219': 'RFCE', '18220': 'RFCE', '18221': 'RFCE', '18222': 'RFCE', '18223': 'RFCE', '18224': 'RFCE', '18225': 'RFCE', '18229': 'RFCE', '18230': 'RFCE', '18231': 'RFCE', '18232': 'RFCE', '18234': 'RFCE', '18235': 'RFCE', '18237': 'RFCE', '18239': 'RFCE', '18240': 'RFCE', '18241': 'RFCE', '18242': 'RFCE', '18244': 'RFCE', '18245': 'RFCE', '18246': 'RFCE', '18247': 'RFCE', '18248': 'RFCE', '18249': 'RFCE', '18250': 'RFCE', '18251': 'RFCE', '18252': 'RFCE', '18254': 'RFCE', '18255': 'RFCE', '18256': 'RFCE', '18301': 'RFCE', '18302': 'RFCE', '18320': 'RFCE', '18321': 'RFCE', '18322': 'RFCE', '18323': 'RFCE', '18324': 'RFCE', '18325': 'RFCE', '18326': 'RFCE', '18327': 'RFCE', '18328': 'RFCE', '18330': 'RFCE', '18331': 'RFCE', '18332': 'RFCE', '18333': 'RFCE', '18334': 'RFCE', '18335': 'RFCE', '18336': 'NYUP', '18337': 'RFCE', '18340': 'NYUP', '18341': 'RFCE', '18342': 'RFCE', '18343': 'RFCE', '18344': 'RFCE', '18346': 'RFCE', '18347': 'RFCE', '18348': 'RFCE', '18349': 'RFCE', '18350': 'RFCE', '18351': 'RFCE', '18352': 'RFCE', '18353': 'RFCE', '18354': 'RFCE', '18355': 'RFCE', '18356': 'RFCE', '18357': 'RFCE', '18360': 'RFCE', '18370': 'RFCE', '18371': 'RFCE', '18372': 'RFCE', '18373': 'RFCE', '18403': 'RFCE', '18405': 'RFCE', '18407': 'RFCE', '18410': 'RFCE', '18411': 'RFCE', '18413': 'RFCE', '18414': 'RFCE', '18415': 'RFCE', '18416': 'RFCE', '18417': 'RFCE', '18419': 'RFCE', '18420': 'RFCE', '18421': 'RFCE', '18424': 'RFCE', '18425': 'RFCE', '18426': 'RFCE', '18427': 'RFCE', '18428': 'RFCE', '18430': 'RFCE', '18431': 'RFCE', '18433': 'RFCE', '18434': 'RFCE', '18435': 'RFCE', '18436': 'RFCE', '18437': 'RFCE', '18438': 'RFCE', '18439': 'RFCE', '18440': 'RFCE', '18441': 'RFCE', '18443': 'RFCE', '18444': 'RFCE', '18445': 'RFCE', '18446': 'RFCE', '18447': 'RFCE', '18448': 'RFCE', '18449': 'RFCE', '18451': 'RFCE', '18452': 'RFCE', '18453': 'RFCE', '18454': 'RFCE', '18455': 'RFCE', '18456': 'RFCE', '18457': 'RFCE', '18458': 'RFCE', '18459': 'RFCE', '18460': 'RFCE', '18461': 'RFCE', '18462': 'RFCE', '18463': 'RFCE', '18464': 'RFCE', '18465': 'RFCE', '18466': 'RFCE', '18469': 'RFCE', '18470': 'RFCE', '18471': 'RFCE', '18472': 'RFCE', '18473': 'RFCE', '18501': 'RFCE', '18502': 'RFCE', '18503': 'RFCE', '18504': 'RFCE', '18505': 'RFCE', '18507': 'RFCE', '18508': 'RFCE', '18509': 'RFCE', '18510': 'RFCE', '18512': 'RFCE', '18515': 'RFCE', '18517': 'RFCE', '18518': 'RFCE', '18519': 'RFCE', '18540': 'RFCE', '18577': 'RFCE', '18601': 'RFCE', '18602': 'RFCE', '18603': 'RFCE', '18610': 'RFCE', '18611': 'RFCE', '18612': 'RFCE', '18614': 'RFCE', '18615': 'RFCE', '18616': 'RFCE', '18617': 'RFCE', '18618': 'RFCE', '18619': 'RFCE', '18621': 'RFCE', '18622': 'RFCE', '18623': 'RFCE', '18624': 'RFCE', '18625': 'RFCE', '18626': 'RFCE', '18627': 'RFCE', '18628': 'RFCE', '18629': 'RFCE', '18630': 'RFCE', '18631': 'RFCE', '18632': 'RFCE', '18634': 'RFCE', '18635': 'RFCE', '18636': 'RFCE', '18640': 'RFCE', '18641': 'RFCE', '18642': 'RFCE', '18643': 'RFCE', '18644': 'RFCE', '18651': 'RFCE', '18653': 'RFCE', '18654': 'RFCE', '18655': 'RFCE', '18656': 'RFCE', '18657': 'RFCE', '18660': 'RFCE', '18661': 'RFCE', '18690': 'RFCE', '18701': 'RFCE', '18702': 'RFCE', '18703': 'RFCE', '18704': 'RFCE', '18705': 'RFCE', '18706': 'RFCE', '18707': 'RFCE', '18708': 'RFCE', '18709': 'RFCE', '18710': 'RFCE', '18711': 'RFCE', '18762': 'RFCE', '18764': 'RFCE', '18765': 'RFCE', '18766': 'RFCE', '18767': 'RFCE', '18769': 'RFCE', '18773': 'RFCE', '18801': 'RFCE', '18810': 'RFCE', '18812': 'RFCE', '18813': 'RFCE', '18814': 'RFCE', '18815': 'RFCE', '18816': 'RFCE', '18817': 'RFCE', '18818': 'RFCE', '18820': 'RFCE', '18821': 'RFCE', '18822': 'RFCE', '18823': 'RFCE', '18824': 'RFCE', '18825': 'RFCE', '18826': 'RFCE', '18827': 'RFCE', '18828': 'RFCE', '18829': 'RFCE', '18830': 'RFCE', '18831': 'RFCE', '18832': 'RFCE', '18833': 'RFCE', '18834': 'RFCE', '18837': 'RFCE', '18840': 'RFCE', '18842': 'RFCE', '18843': 'RFCE', '18844': 'RFCE', '18845': 'RFCE', '18846': 'RFCE', '18847': 'RFCE', '18848': 'RFCE', '18850': 'RFCE', '18851': 'RFCE', '18853': 'RFCE', '18854': 'RFCE', '18901': 'RFCE', '18902': 'RFCE', '18910': 'RFCE', '18911': 'RFCE', '18912': 'RFCE', '18913': 'RFCE', '18914': 'RFCE', '18915': 'RFCE', '18916': 'RFCE', '18917': 'RFCE', '18918': 'RFCE', '18920': 'RFCE', '18921': 'RFCE', '18922': 'RFCE', '18923': 'RFCE', '18924': 'RFCE', '18925': 'RFCE', '18926': 'RFCE', '18927': 'RFCE', '18928': 'RFCE', '18929': 'RFCE', '18930': 'RFCE', '18931': 'RFCE', '18932': 'RFCE', '18933': 'RFCE', '18934': 'RFCE', '18935': 'RFCE', '18936': 'RFCE', '18938': 'RFCE', '18940': 'RFCE', '18942': 'RFCE', '18943': 'RFCE', '18944': 'RFCE', '18946': 'RFCE', '18947': 'RFCE', '18949': 'RFCE', '18950': 'RFCE', '18951': 'RFCE', '18953': 'RFCE', '18954': 'RFCE', '18955': 'RFCE', '18956': 'RFCE', '18957': 'RFCE', '18958': 'RFCE', '18960': 'RFCE', '18962': 'RFCE', '18963': 'RFCE', '18964': 'RFCE', '18966': 'RFCE', '18968': 'RFCE', '18969': 'RFCE', '18970': 'RFCE', '18971': 'RFCE', '18972': 'RFCE', '18974': 'RFCE', '18976': 'RFCE', '18977': 'RFCE', '18979': 'RFCE', '18980': 'RFCE', '18981': 'RFCE', '18991': 'RFCE', '19001': 'RFCE', '19002': 'RFCE', '19003': 'RFCE', '19004': 'RFCE', '19006': 'RFCE', '19007': 'RFCE', '19008': 'RFCE', '19009': 'RFCE', '19010': 'RFCE', '19012': 'RFCE', '19013': 'RFCE', '19014': 'RFCE', '19015': 'RFCE', '19016': 'RFCE', '19017': 'RFCE', '19018': 'RFCE', '19019': 'RFCE', '19020': 'RFCE', '19021': 'RFCE', '19022': 'RFCE', '19023': 'RFCE', '19025': 'RFCE', '19026': 'RFCE', '19027': 'RFCE', '19028': 'RFCE', '19029': 'RFCE', '19030': 'RFCE', '19031': 'RFCE', '19032': 'RFCE', '19033': 'RFCE', '19034': 'RFCE', '19035': 'RFCE', '19036': 'RFCE', '19037': 'RFCE', '19038': 'RFCE', '19039': 'RFCE', '19040': 'RFCE', '19041': 'RFCE', '19043': 'RFCE', '19044': 'RFCE', '19046': 'RFCE', '19047': 'RFCE', '19048': 'RFCE', '19049': 'RFCE', '19050': 'RFCE', '19052': 'RFCE', '19053': 'RFCE', '19054': 'RFCE', '19055': 'RFCE', '19056': 'RFCE', '19057': 'RFCE', '19058': 'RFCE', '19060': 'RFCE', '19061': 'RFCE', '19063': 'RFCE', '19064': 'RFCE', '19065': 'RFCE', '19066': 'RFCE', '19067': 'RFCE', '19070': 'RFCE', '19072': 'RFCE', '19073': 'RFCE', '19074': 'RFCE', '19075': 'RFCE', '19076': 'RFCE', '19078': 'RFCE', '19079': 'RFCE', '19080': 'RFCE', '19081': 'RFCE', '19082': 'RFCE', '19083': 'RFCE', '19085': 'RFCE', '19086': 'RFCE', '19087': 'RFCE', '19088': 'RFCE', '19089': 'RFCE', '19090': 'RFCE', '19091': 'RFCE', '19092': 'RFCE', '19093': 'RFCE', '19094': 'RFCE', '19095': 'RFCE', '19096': 'RFCE', '19098': 'RFCE', '19099': 'RFCE', '19101': 'RFCE', '19102': 'RFCE', '19103': 'RFCE', '19104': 'RFCE', '19105': 'RFCE', '19106': 'RFCE', '19107': 'RFCE', '19108': 'RFCE', '19109': 'RFCE', '19110': 'RFCE', '19111': 'RFCE', '19112': 'RFCE', '19113': 'RFCE', '19114': 'RFCE', '19115': 'RFCE', '19116': 'RFCE', '19118': 'RFCE', '19119': 'RFCE', '19120': 'RFCE', '19121': 'RFCE', '19122': 'RFCE', '19123': 'RFCE', '19124': 'RFCE', '19125': 'RFCE', '19126': 'RFCE', '19127': 'RFCE', '19128': 'RFCE', '19129': 'RFCE', '19130': 'RFCE', '19131': 'RFCE', '19132': 'RFCE', '19133': 'RFCE', '19134': 'RFCE', '19135': 'RFCE', '19136': 'RFCE', '19137': 'RFCE', '19138': 'RFCE', '19139': 'RFCE', '19140': 'RFCE', '19141': 'RFCE', '19142': 'RFCE', '19143': 'RFCE', '19144': 'RFCE', '19145': 'RFCE', '19146': 'RFCE', '19147': 'RFCE', '19148': 'RFCE', '19149': 'RFCE', '19150': 'RFCE', '19151': 'RFCE', '19152': 'RFCE', '19153': 'RFCE', '19154': 'RFCE', '19155': 'RFCE', '19160': 'RFCE', '19161': 'RFCE', '19162': 'RFCE', '19170': 'RFCE', '19171': 'RFCE', '19172': 'RFCE', '19173': 'RFCE', '19175': 'RFCE', '19176': 'RFCE', '19177': 'RFCE', '19178': 'RFCE', '19179': 'RFCE', '19181': 'RFCE', '19182': 'RFCE', '19183': 'RFCE', '19184': 'RFCE', '19185': 'RFCE', '19187': 'RFCE', '19188': 'RFCE', '19190': 'RFCE', '19191': 'RFCE', '19192': 'RFCE', '19193': 'RFCE', '19194': 'RFCE', '19195': 'RFCE', '19196': 'RFCE', '19197': 'RFCE', '19244': 'RFCE', '19255': 'RFCE', '19301': 'RFCE', '19310': 'RFCE', '19311': 'RFCE', '19312': 'RFCE', '19316': 'RFCE', '19317': 'RFCE', '19318': 'RFCE', '19319': 'RFCE', '19320': 'RFCE', '19330': 'RFCE', '19331': 'RFCE', '19333': 'RFCE', '19335': 'RFCE', '19339': 'RFCE', '19340': 'RFCE', '19341': 'RFCE', '19342': 'RFCE', '19343': 'RFCE', '19344': 'RFCE', '19345': 'RFCE', '19346': 'RFCE', '19347': 'RFCE', '19348': 'RFCE', '19350': 'RFCE', '19351': 'RFCE', '19352': 'RFCE', '19353': 'RFCE', '19354': 'RFCE', '19355': 'RFCE', '19357': 'RFCE', '19358': 'RFCE', '19360': 'RFCE', '19362': 'RFCE', '19363': 'RFCE', '19365': 'RFCE', '19366': 'RFCE', '19367': 'RFCE', '19369': 'RFCE', '19371': 'RFCE', '19372': 'RFCE', '19373': 'RFCE', '19374': 'RFCE', '19375': 'RFCE', '19376': 'RFCE', '19380': 'RFCE', '19381': 'RFCE', '19382': 'RFCE', '19383': 'RFCE', '19388': 'RFCE', '19390': 'RFCE', '19395': 'RFCE', '19397': 'RFCE', '19398': 'RFCE', '19399': 'RFCE', '19401': 'RFCE', '19403': 'RFCE', '19404': 'RFCE', '19405': 'RFCE', '19406': 'RFCE', '19407': 'RFCE', '19408': 'RFCE', '19409': 'RFCE', '19415': 'RFCE', '19420': 'RFCE', '19421': 'RFCE', '19422': 'RFCE', '19423': 'RFCE', '19424': 'RFCE', '19425': 'RFCE', '19426': 'RFCE', '19428': 'RFCE', '19429': 'RFCE', '19430': 'RFCE', '19432': 'RFCE', '19435': 'RFCE', '19436': 'RFCE', '19437': 'RFCE', '19438': 'RFCE', '19440': 'RFCE', '19441': 'RFCE', '19442': 'RFCE', '19443': 'RFCE', '19444': 'RFCE', '19446': 'RFCE', '19450': 'RFCE', '19451': 'RFCE', '19453': 'RFCE', '19454': 'RFCE', '19455': 'RFCE', '19456': 'RFCE', '19457': 'RFCE', '19460': 'RFCE', '19462': 'RFCE', '19464': 'RFCE', '19465': 'RFCE', '19468': 'RFCE', '19470': 'RFCE', '19472': 'RFCE', '19473': 'RFCE', '19474': 'RFCE', '19475': 'RFCE', '19477': 'RFCE', '19478': 'RFCE', '19480': 'RFCE', '19481': 'RFCE', '19482': 'RFCE', '19484': 'RFCE', '19485': 'RFCE', '19486': 'RFCE', '19490': 'RFCE', '19492': 'RFCE', '19493': 'RFCE', '19494': 'RFCE', '19495': 'RFCE', '19496': 'RFCE', '19501': 'RFCE', '19503': 'RFCE', '19504': 'RFCE', '19505': 'RFCE', '19506': 'RFCE', '19507': 'RFCE', '19508': 'RFCE', '19510': 'RFCE', '19511': 'RFCE', '19512': 'RFCE', '19516': 'RFCE', '19518': 'RFCE', '19519': 'RFCE', '19520': 'RFCE', '19522': 'RFCE', '19523': 'RFCE', '19525': 'RFCE', '19526': 'RFCE', '19529': 'RFCE', '19530': 'RFCE', '19533': 'RFCE', '19534': 'RFCE', '19535': 'RFCE', '19536': 'RFCE', '19538': 'RFCE', '19539': 'RFCE', '19540': 'RFCE', '19541': 'RFCE', '19542': 'RFCE', '19543': 'RFCE', '19544': 'RFCE', '19545': 'RFCE', '19547': 'RFCE', '19548': 'RFCE', '19549': 'RFCE', '19550': 'RFCE', '19551': 'RFCE', '19554': 'RFCE', '19555': 'RFCE', '19559': 'RFCE', '19560': 'RFCE', '19562': 'RFCE', '19564': 'RFCE', '19565': 'RFCE', '19567': 'RFCE', '19601': 'RFCE', '19602': 'RFCE', '19603': 'RFCE', '19604': 'RFCE', '19605': 'RFCE', '19606': 'RFCE', '19607': 'RFCE', '19608': 'RFCE', '19609': 'RFCE', '19610': 'RFCE', '19611': 'RFCE', '19612': 'RFCE', '19701': 'RFCE', '19702': 'RFCE', '19703': 'RFCE', '19706': 'RFCE', '19707': 'RFCE', '19708': 'RFCE', '19709': 'RFCE', '19710': 'RFCE', '19711': 'RFCE', '19712': 'RFCE', '19713': 'RFCE', '19714': 'RFCE', '19715': 'RFCE', '19716': 'RFCE', '19717': 'RFCE', '19718': 'RFCE', '19720': 'RFCE', '19721': 'RFCE', '19725': 'RFCE', '19726': 'RFCE', '19730': 'RFCE', '19731': 'RFCE', '19732': 'RFCE', '19733': 'RFCE', '19734': 'RFCE', '19735': 'RFCE', '19736': 'RFCE', '19801': 'RFCE', '19802': 'RFCE', '19803': 'RFCE', '19804': 'RFCE', '19805': 'RFCE', '19806': 'RFCE', '19807': 'RFCE', '19808': 'RFCE', '19809': 'RFCE', '19810': 'RFCE', '19850': 'RFCE', '19880': 'RFCE', '19884': 'RFCE', '19885': 'RFCE', '19886': 'RFCE', '19890': 'RFCE', '19891': 'RFCE', '19892': 'RFCE', '19893': 'RFCE', '19894': 'RFCE', '19895': 'RFCE', '19896': 'RFCE', '19897': 'RFCE', '19898': 'RFCE', '19899': 'RFCE', '19901': 'RFCE', '19902': 'RFCE', '19903': 'RFCE', '19904': 'RFCE', '19905': 'RFCE', '19906': 'RFCE', '19930': 'RFCE', '19931': 'RFCE', '19933': 'RFCE', '19934': 'RFCE', '19936': 'RFCE', '19938': 'RFCE', '19939': 'RFCE', '19940': 'RFCE', '19941': 'RFCE', '19943': 'RFCE', '19944': 'RFCE', '19945': 'RFCE', '19946': 'RFCE', '19947': 'RFCE', '19950': 'RFCE', '19951': 'RFCE', '19952': 'RFCE', '19953': 'RFCE', '19954': 'RFCE', '19955': 'RFCE', '19956': 'RFCE', '19958': 'RFCE', '19960': 'RFCE', '19961': 'RFCE', '19962': 'RFCE', '19963': 'RFCE', '19964': 'RFCE', '19966': 'RFCE', '19967': 'RFCE', '19968': 'RFCE', '19969': 'RFCE', '19970': 'RFCE', '19971': 'RFCE', '19973': 'RFCE', '19975': 'RFCE', '19977': 'RFCE', '19979': 'RFCE', '19980': 'RFCE', '20001': 'RFCE', '20002': 'RFCE', '20003': 'RFCE', '20004': 'RFCE', '20005': 'RFCE', '20006': 'RFCE', '20007': 'RFCE', '20008': 'RFCE', '20009': 'RFCE', '20010': 'RFCE', '20011': 'RFCE', '20012': 'RFCE', '20013': 'RFCE', '20015': 'RFCE', '20016': 'RFCE', '20017': 'RFCE', '20018': 'RFCE', '20019': 'RFCE', '20020': 'RFCE', '20022': 'RFCE', '20023': 'RFCE', '20024': 'RFCE', '20026': 'RFCE', '20027': 'RFCE', '20029': 'RFCE', '20030': 'RFCE', '20032': 'RFCE', '20033': 'RFCE', '20035': 'RFCE', '20036': 'RFCE', '20037': 'RFCE', '20038': 'RFCE', '20039': 'RFCE', '20040': 'RFCE', '20041': 'SRVC', '20042': 'RFCE', '20043': 'RFCE', '20044': 'RFCE', '20045': 'RFCE', '20046': 'RFCE', '20047': 'RFCE', '20049': 'RFCE', '20050': 'RFCE', '20051': 'RFCE', '20052': 'RFCE', '20053': 'RFCE', '20055': 'RFCE', '20056': 'RFCE', '20057': 'RFCE', '20058': 'RFCE', '20059': 'RFCE', '20060': 'RFCE', '20061': 'RFCE', '20062': 'RFCE', '20063': 'RFCE', '20064': 'RFCE', '20065': 'RFCE', '20066': 'RFCE', '20067': 'RFCE', '20068': 'RFCE', '20069': 'RFCE', '20070': 'RFCE', '20071': 'RFCE', '20073': 'RFCE', '20074': 'RFCE', '20075': 'RFCE', '20076': 'RFCE', '20077': 'RFCE', '20078': 'RFCE', '20080': 'RFCE', '20081': 'RFCE', '20082': 'RFCE', '20088': 'RFCE', '20090': 'RFCE', '20091': 'RFCE', '20097': 'RFCE', '20098': 'RFCE', '20101': 'SRVC', '20102': 'SRVC', '20103': 'SRVC', '20104': 'SRVC', '20105': 'SRVC', '20106': 'SRVC', '20108': 'SRVC', '20109': 'SRVC', '20110': 'SRVC', '20111': 'SRVC', '20112': 'SRVC', '20113': 'SRVC', '20115': 'SRVC', '20116': 'SRVC', '20117': 'SRVC', '20118': 'SRVC', '20119': 'SRVC', '20120': 'SRVC', '20121': 'SRVC', '20122': 'SRVC', '20124': 'SRVC', '20128': 'SRVC', '20129': 'SRVC', '20130': 'SRVC', '20131': 'SRVC', '20132': 'SRVC', '20134': 'SRVC', '20135': 'SRVC', '20136': 'SRVC', '20137': 'SRVC', '20138': 'SRVC', '20139': 'SRVC', '20140': 'SRVC', '20141': 'SRVC', '20142': 'SRVC', '20143': 'SRVC', '20144': 'SRVC', '20146': 'SRVC', '20147': 'SRVC', '20148': 'SRVC', '20149': 'SRVC', '20151': 'SRVC', '20152': 'SRVC', '20153': 'SRVC', '20155': 'SRVC', '20156': 'SRVC', '20158': 'SRVC', '20159': 'SRVC', '20160': 'SRVC', '20163': 'SRVC', '20164': 'SRVC', '20165': 'SRVC', '20166': 'SRVC', '20167': 'SRVC', '20168': 'SRVC', '20169': 'SRVC', '20170': 'SRVC', '20171': 'SRVC', '20172': 'SRVC', '20175': 'SRVC', '20176': 'SRVC', '20177': 'SRVC', '20178': 'SRVC', '20180': 'SRVC', '20181': 'SRVC', '20182': 'SRVC', '20184': 'SRVC', '20185': 'SRVC', '20186': 'SRVC', '20187': 'SRVC', '20188': 'SRVC', '20189': 'SRVC', '20190': 'SRVC', '20191': 'SRVC', '20192': 'SRVC', '20194': 'SRVC', '20195': 'SRVC', '20196': 'SRVC', '20197': 'SRVC', '20198': 'SRVC', '20201': 'RFCE', '20202': 'RFCE', '20203': 'RFCE', '20204': 'RFCE', '20206': 'RFCE', '20207': 'RFCE', '20208': 'RFCE', '20210': 'RFCE', '20211': 'RFCE', '20212': 'RFCE', '20213': 'RFCE', '20214': 'RFCE', '20215': 'RFCE', '20216': 'RFCE', '20217': 'RFCE', '20218': 'RFCE', '20219': 'RFCE', '20220': 'RFCE', '20221': 'RFCE', '20222': 'RFCE', '20223': 'RFCE', '20224': 'RFCE', '20226': 'RFCE', '20227': 'RFCE', '20228': 'RFCE', '20229': 'RFCE', '20230': 'RFCE', '20232': 'RFCE', '20233': 'RFCE', '20235': 'RFCE', '20237': 'RFCE', '20238': 'RFCE', '20239': 'RFCE', '20240': 'RFCE', '20241': 'RFCE', '20242': 'RFCE', '20244': 'RFCE', '20245': 'RFCE', '20250': 'RFCE', '20251': 'RFCE', '20254': 'RFCE', '20260': 'RFCE', '20261': 'RFCE', '20262': 'RFCE', '20265': 'RFCE', '20266': 'RFCE', '20268': 'RFCE', '20270': 'RFCE', '20277': 'RFCE', '20289': 'RFCE', '20299': 'RFCE', '20301': 'RFCE', '20303': 'RFCE', '20306': 'RFCE', '20307': 'RFCE', '20310': 'RFCE', '20314': 'RFCE', '20317': 'RFCE', '20318': 'RFCE', '20319': 'RFCE', '20330': 'SRVC', '20340': 'RFCE', '20350': 'RFCE', '20355': 'RFCE', '20370': 'RFCE', '20372': 'RFCE', '20373': 'RFCE', '20374': 'RFCE', '20375': 'RFCE', '20376': 'RFCE', '20380': 'RFCE', '20388': 'RFCE', '20389': 'RFCE', '20390': 'RFCE', '20391': 'RFCE', '20392': 'RFCE', '20393': 'RFCE', '20394': 'RFCE', '20395': 'RFCE', '20398': 'RFCE', '20401': 'RFCE', '20402': 'RFCE', '20403': 'RFCE', '20404': 'RFCE', '20405': 'RFCE', '20406': 'RFCE', '20407': 'RFCE', '20408': 'RFCE', '20409': 'RFCE', '20410': 'RFCE', '20411': 'RFCE', '20412': 'RFCE', '20413': 'RFCE', '20414': 'RFCE', '20415': 'RFCE', '20416': 'RFCE', '20417': 'RFCE', '20418': 'RFCE', '20419': 'RFCE', '20420': 'RFCE', '20421': 'RFCE', '20422': 'RFCE', '20423': 'RFCE', '20424': 'RFCE', '20425': 'RFCE', '20426': 'RFCE', '20427': 'RFCE', '20428': 'RFCE', '20429': 'RFCE', '20431': 'RFCE', '20433': 'RFCE', '20434': 'RFCE', '20435': 'RFCE', '20436': 'RFCE', '20437': 'RFCE', '20439': 'RFCE', '20440': 'RFCE', '20441': 'RFCE', '20442': 'RFCE', '20444': 'RFCE', '20447': 'RFCE', '20451': 'RFCE', '20453': 'RFCE', '20456': 'RFCE', '20460': 'RFCE', '20463': 'RFCE', '20468': 'RFCE', '20469': 'RFCE', '20470': 'RFCE', '20472': 'RFCE', '20500': 'RFCE', '20501': 'RFCE', '20502': 'RFCE', '20503': 'RFCE', '20504': 'RFCE', '20505': 'RFCE', '20506': 'RFCE', '20507': 'RFCE', '20508': 'RFCE', '20509': 'RFCE', '20510': 'RFCE', '20511': 'RFCE', '20515': 'RFCE', '20520': 'RFCE', '20521': 'RFCE', '20522': 'RFCE', '20523': 'RFCE', '20524': 'RFCE', '20525': 'RFCE', '20526': 'RFCE', '20527': 'RFCE', '20528': 'RFCE', '20529': 'RFCE', '20530': 'RFCE', '20531': 'RFCE', '20532': 'RFCE', '20533': 'RFCE', '20534': 'RFCE', '20535': 'RFCE', '20536': 'RFCE', '20537': 'RFCE', '20538': 'RFCE', '20539': 'RFCE', '20540': 'RFCE', '20541': 'RFCE', '20542': 'RFCE', '20543': 'RFCE', '20544': 'RFCE', '20546': 'RFCE', '20547': 'RFCE', '20548': 'RFCE', '20549': 'RFCE', '20551': 'RFCE', '20552': 'RFCE', '20553': 'RFCE', '20554': 'RFCE', '20555': 'RFCE', '20557': 'RFCE', '20558': 'RFCE', '20559': 'RFCE', '20560': 'RFCE', '20565': 'RFCE', '20566': 'RFCE', '20570': 'RFCE', '20571': 'RFCE', '20572': 'RFCE', '20573': 'RFCE', '20575': 'RFCE', '20576': 'RFCE', '20577': 'RFCE', '20578': 'RFCE', '20579': 'RFCE', '20580': 'RFCE', '20581': 'RFCE', '20585': 'RFCE', '20586': 'RFCE', '20588': 'RFCE', '20590': 'RFCE', '20591': 'RFCE', '20593': 'RFCE', '20594': 'RFCE', '20597': 'RFCE', '20598': 'SRVC', '20599': 'RFCE', '20601': 'RFCE', '20602': 'RFCE', '20603': 'RFCE', '20604': 'RFCE', '20606': 'RFCE', '20607': 'RFCE', '20608': 'RFCE', '20609': 'RFCE', '20610': 'RFCE', '20611': 'RFCE', '20612': 'RFCE', '20613': 'RFCE', '20615': 'RFCE', '20616': 'RFCE', '20617': 'RFCE', '20618': 'RFCE', '20619': 'RFCE', '20620': 'RFCE', '20621': 'RFCE', '20622': 'RFCE', '20623': 'RFCE', '20624': 'RFCE', '20625': 'RFCE', '20626': 'RFCE', '20627': 'RFCE', '20628': 'RFCE', '20629': 'RFCE', '20630': 'RFCE', '20632': 'RFCE', '20634': 'RFCE', '20635': 'RFCE', '20636': 'RFCE', '20637': 'RFCE', '20639': 'RFCE', '20640': 'RFCE', '20643': 'RFCE', '20645': 'RFCE', '20646': 'RFCE', '20650': 'RFCE', '20653': 'RFCE', '20656': 'RFCE', '20657': 'RFCE', '20658': 'RFCE', '20659': 'RFCE', '20660': 'RFCE', '20661': 'RFCE', '20662': 'RFCE', '20664': 'RFCE', '20667': 'RFCE', '20670': 'RFCE', '20674': 'RFCE', '20675': 'RFCE', '20676': 'RFCE', '20677': 'RFCE', '20678': 'RFCE', '20680': 'RFCE', '20682': 'RFCE', '20684': 'RFCE', '20685': 'RFCE', '20686': 'RFCE', '20687': 'RFCE', '20688': 'RFCE', '20689': 'RFCE', '20690': 'RFCE', '20692': 'RFCE', '20693': 'RFCE', '20695': 'RFCE', '20697': 'RFCE', '20701': 'RFCE', '20703': 'RFCE', '20704': 'RFCE', '20705': 'RFCE', '20706': 'RFCE', '20707': 'RFCE', '20708': 'RFCE', '20709': 'RFCE', '20710': 'RFCE', '20711': 'RFCE', '20712': 'RFCE', '20714': 'RFCE', '20715': 'RFCE', '20716': 'RFCE', '20717': 'RFCE', '20718': 'RFCE', '20719': 'RFCE', '20720': 'RFCE', '20721': 'RFCE', '20722': 'RFCE', '20723': 'RFCE', '20724': 'RFCE', '20725': 'RFCE', '20726': 'RFCE', '20731': 'RFCE', '20732': 'RFCE', '20733': 'RFCE', '20735': 'RFCE', '20736': 'RFCE', '20737': 'RFCE', '20738': 'RFCE', '20740': 'RFCE', '20741': 'RFCE', '20742': 'RFCE', '20743': 'RFCE', '20744': 'RFCE', '20745': 'RFCE', '20746': 'RFCE', '20747': 'RFCE', '20748': 'RFCE', '20749': 'RFCE', '20750': 'RFCE', '20751': 'RFCE', '20752': 'RFCE', '20753': 'RFCE', '20754': 'RFCE', '20755': 'RFCE', '20757': 'RFCE', '20758': 'RFCE', '20759': 'RFCE', '20762': 'RFCE', '20763': 'RFCE', '20764': 'RFCE', '20765': 'RFCE', '20768': 'RFCE', '20769': 'RFCE', '20770': 'RFCE', '20771': 'RFCE', '20772': 'RFCE', '20773': 'RFCE', '20774': 'RFCE', '20775': 'RFCE', '20776': 'RFCE', '20777': 'RFCE', '20778': 'RFCE', '20779': 'RFCE', '20781': 'RFCE', '20782': 'RFCE', '20783': 'RFCE', '20784': 'RFCE', '20785': 'RFCE', '20787': 'RFCE', '20788': 'RFCE', '20790': 'RFCE', '20791': 'RFCE', '20792': 'RFCE', '20794': 'RFCE', '20797': 'RFCE', '20799': 'RFCE', '20810': 'RFCE', '20811': 'RFCE', '20812': 'RFCE', '20813': 'RFCE', '20814': 'RFCE', '20815': 'RFCE', '20816': 'RFCE', '20817': 'RFCE', '20818': 'RFCE', '20824': 'RFCE', '20825': 'RFCE', '20827': 'RFCE', '20830': 'RFCE', '20832': 'RFCE', '20833': 'RFCE', '20837': 'RFCE', '20838': 'RFCW', '20839': 'RFCW', '20841': 'RFCE', '20842': 'RFCW', '20847': 'RFCE', '20848': 'RFCE', '20849': 'RFCE', '20850': 'RFCE', '20851': 'RFCE', '20852': 'RFCE', '20853': 'RFCE', '20854': 'RFCE', '20855': 'RFCE', '20857': 'RFCE', '20859': 'RFCE', '20860': 'RFCE', '20861': 'RFCE', '20862': 'RFCE', '20866': 'RFCE', '20868': 'RFCE', '20871': 'RFCW', '20872': 'RFCW', '20874': 'RFCE', '20875': 'RFCW', '20876': 'RFCE', '20877': 'RFCE', '20878': 'RFCE', '20879': 'RFCE', '20880': 'RFCE', '20882': 'RFCE', '20883': 'RFCE', '20884': 'RFCE', '20885': 'RFCE', '20886': 'RFCE', '20889': 'RFCE', '20891': 'RFCE', '20892': 'RFCE', '20894': 'RFCE', '20895': 'RFCE', '20896': 'RFCE', '20897': 'RFCE', '20898': 'RFCE', '20899': 'RFCE', '20901': 'RFCE', '20902': 'RFCE', '20903': 'RFCE', '20904': 'RFCE', '20905': 'RFCE', '20906': 'RFCE', '20907': 'RFCE', '20908': 'RFCE', '20910': 'RFCE', '20911': 'RFCE', '20912': 'RFCE', '20913': 'RFCE', '20914': 'RFCE', '20915': 'RFCE', '20916': 'RFCE', '20918': 'RFCE', '20993': 'RFCE', '20997': 'RFCE', '21001': 'RFCE', '21005': 'RFCE', '21009': 'RFCE', '21010': 'RFCE', '21012': 'RFCE', '21013': 'RFCE', '21014': 'RFCE', '21015': 'RFCE', '21017': 'RFCE', '21018': 'RFCE', '21020': 'RFCE', '21022': 'RFCE', '21023': 'RFCE', '21027': 'RFCE', '21028': 'RFCE', '21029': 'RFCE', '21030': 'RFCE', '21031': 'RFCE', '21032': 'RFCE', '21034': 'RFCE', '21035': 'RFCE', '21036': 'RFCE', '21037': 'RFCE', '21040': 'RFCE', '21041': 'RFCE', '21042': 'RFCE', '21043': 'RFCE', '21044': 'RFCE', '21045': 'RFCE', '21046': 'RFCE', '21047': 'RFCE', '21048': 'RFCE', '21050': 'RFCE', '21051': 'RFCE', '21052': 'RFCE', '21053': 'RFCE', '21054': 'RFCE', '21056': 'RFCE', '21057': 'RFCE', '21060': 'RFCE', '21061': 'RFCE', '21062': 'RFCE', '21065': 'RFCE', '21071': 'RFCE', '21074': 'RFCE', '21075': 'RFCE', '21076': 'RFCE', '21077': 'RFCE', '21078': 'RFCE', '21082': 'RFCE', '21084': 'RFCE', '21085': 'RFCE', '21087': 'RFCE', '21088': 'RFCE', '21090': 'RFCE', '21092': 'RFCE', '21093': 'RFCE', '21094': 'RFCE', '21102': 'RFCE', '21104': 'RFCE', '21105': 'RFCE', '21106': 'RFCE', '21108': 'RFCE', '21111': 'RFCE', '21113': 'RFCE', '21114': 'RFCE', '21117': 'RFCE', '21120': 'RFCE', '21122': 'RFCE', '21123': 'RFCE', '21128': 'RFCE', '21130': 'RFCE', '21131': 'RFCE', '21132': 'RFCE', '21133': 'RFCE', '21136': 'RFCE', '21139': 'RFCE', '21140': 'RFCE', '21144': 'RFCE', '21146': 'RFCE', '21150': 'RFCE', '21152': 'RFCE', '21153': 'RFCE', '21154': 'RFCE', '21155': 'RFCE', '21156': 'RFCE', '21157': 'RFCE', '21158': 'RFCE', '21160': 'RFCE', '21161': 'RFCE', '21162': 'RFCE', '21163': 'RFCE', '21201': 'RFCE', '21202': 'RFCE', '21203': 'RFCE', '21204': 'RFCE', '21205': 'RFCE', '21206': 'RFCE', '21207': 'RFCE', '21208': 'RFCE', '21209': 'RFCE', '21210': 'RFCE', '21211': 'RFCE', '21212': 'RFCE', '21213': 'RFCE', '21214': 'RFCE', '21215': 'RFCE', '21216': 'RFCE', '21217': 'RFCE', '21218': 'RFCE', '21219': 'RFCE', '21220': 'RFCE', '21221': 'RFCE', '21222': 'RFCE', '21223': 'RFCE', '21224': 'RFCE', '21225': 'RFCE', '21226': 'RFCE', '21227': 'RFCE', '21228': 'RFCE', '21229': 'RFCE', '21230': 'RFCE', '21231': 'RFCE', '21233': 'RFCE', '21234': 'RFCE', '21235': 'RFCE', '21236': 'RFCE', '21237': 'RFCE', '21239': 'RFCE', '21240': 'RFCE', '21241': 'RFCE', '21244': 'RFCE', '21250': 'RFCE', '21251': 'RFCE', '21252': 'RFCE', '21260': 'RFCE', '21261': 'RFCE', '21263': 'RFCE', '21264': 'RFCE', '21265': 'RFCE', '21270': 'RFCE', '21273': 'RFCE', '21274': 'RFCE', '21275': 'RFCE', '21278': 'RFCE', '21279': 'RFCE', '21280': 'RFCE', '21281': 'RFCE', '21282': 'RFCE', '21283': 'RFCE', '21284': 'RFCE', '21285': 'RFCE', '21286': 'RFCE', '21287': 'RFCE', '21288': 'RFCE', '21289': 'RFCE', '21290': 'RFCE', '21297': 'RFCE', '21298': 'RFCE', '21401': 'RFCE', '21402': 'RFCE', '21403': 'RFCE', '21404': 'RFCE', '21405': 'RFCE', '21409': 'RFCE', '21411': 'RFCE', '21412': 'RFCE', '21501': 'RFCW', '21502': 'RFCW', '21503': 'RFCW', '21504': 'RFCW', '21505': 'RFCW', '21520': 'RFCW', '21521': 'RFCW', '21522': 'RFCW', '21523': 'RFCW', '21524': 'RFCW', '21528': 'RFCW', '21529': 'RFCW', '21530': 'RFCW', '21531': 'RFCW', '21532': 'RFCW', '21536': 'RFCW', '21538': 'RFCW', '21539': 'RFCW', '21540': 'RFCW', '21541': 'RFCW', '21542': 'RFCW', '21543': 'RFCW', '21545': 'RFCW', '21550': 'RFCW', '21555': 'RFCW', '21556': 'RFCW', '21557': 'RFCW', '21560': 'RFCW', '21561': 'RFCW', '21562': 'RFCW', '21601': 'RFCE', '21607': 'RFCE', '21609': 'RFCE', '21610': 'RFCE', '21612': 'RFCE', '21613': 'RFCE', '21617': 'RFCE', '21619': 'RFCE', '21620': 'RFCE', '21622': 'RFCE', '21623': 'RFCE', '21624': 'RFCE', '21625': 'RFCE', '21626': 'RFCE', '21627': 'RFCE', '21628': 'RFCE', '21629': 'RFCE', '21631': 'RFCE', '21632': 'RFCE', '21634': 'RFCE', '21635': 'RFCE', '21636': 'RFCE', '21638': 'RFCE', '21639': 'RFCE', '21640': 'RFCE', '21641': 'RFCE', '21643': 'RFCE', '21644': 'RFCE', '21645': 'RFCE', '21647': 'RFCE', '21648': 'RFCE', '21649': 'RFCE', '21650': 'RFCE', '21651': 'RFCE', '21652': 'RFCE', '21653': 'RFCE', '21654': 'RFCE', '21655': 'RFCE', '21656': 'RFCE', '21657': 'RFCE', '21658': 'RFCE', '21659': 'RFCE', '21660': 'RFCE', '21661': 'RFCE', '21662': 'RFCE', '21663': 'RFCE', '21664': 'RFCE', '21665': 'RFCE', '21666': 'RFCE', '21667': 'RFCE', '21668': 'RFCE', '21669': 'RFCE', '21670': 'RFCE', '21671': 'RFCE', '21672': 'RFCE', '21673': 'RFCE', '21675': 'RFCE', '21676': 'RFCE', '21677': 'RFCE', '21678': 'RFCE', '21679': 'RFCE', '21690': 'RFCE', '21701': 'RFCW', '21702': 'RFCW', '21703': 'RFCW', '21704': 'RFCW', '21705': 'RFCW', '21709': 'RFCW', '21710': 'RFCW', '21711': 'RFCW', '21713': 'RFCW', '21714': 'RFCW', '21715': 'RFCW', '21716': 'RFCW', '21717': 'RFCW', '21718': 'RFCW', '21719': 'RFCW', '21720': 'RFCW', '21721': 'RFCW', '21722': 'RFCW', '21723': 'RFCE', '21727': 'RFCW', '21733': 'RFCW', '21734': 'RFCE', '21737': 'RFCE', '21738': 'RFCE', '21740': 'RFCW', '21741': 'RFCE', '21742': 'RFCW', '21746': 'RFCW', '21747': 'RFCW', '21748': 'RFCW', '21749': 'RFCE', '21750': 'RFCW', '21754': 'RFCW', '21755': 'RFCW', '21756': 'RFCW', '21757': 'RFCW', '21758': 'RFCW', '21759': 'RFCW', '21762': 'RFCW', '21765': 'RFCW', '21766': 'RFCW', '21767': 'RFCW', '21769': 'RFCW', '21770': 'RFCW', '21771': 'RFCE', '21773': 'RFCW', '21774': 'RFCW', '21775': 'RFCW', '21776': 'RFCE', '21777': 'RFCW', '21778': 'RFCW', '21779': 'RFCW', '21780': 'RFCW', '21781': 'RFCW', '21782': 'RFCW', '21783': 'RFCW', '21784': 'RFCE', '21787': 'RFCE', '21788': 'RFCW', '21790': 'RFCW', '21791': 'RFCE', '21792': 'RFCW', '21793': 'RFCW', '21794': 'RFCE', '21795': 'RFCW', '21797': 'RFCE', '21798': 'RFCW', '21801': 'RFCE', '21802': 'RFCE', '21803': 'RFCE', '21804': 'RFCE', '21810': 'RFCE', '21811': 'RFCE', '21813': 'RFCE', '21814': 'RFCE', '21817': 'RFCE', '21821': 'RFCE', '21822': 'RFCE', '21824': 'RFCE', '21826': 'RFCE', '21829': 'RFCE', '21830': 'RFCE', '21835': 'RFCE', '21836': 'RFCE', '21837': 'RFCE', '21838': 'RFCE', '21840': 'RFCE', '21841': 'RFCE', '21842': 'RFCE', '21843': 'RFCE', '21849': 'RFCE', '21850': 'RFCE', '21851': 'RFCE', '21852': 'RFCE', '21853': 'RFCE', '21856': 'RFCE', '21857': 'RFCE', '21861': 'RFCE', '21862': 'RFCE', '21863': 'RFCE', '21864': 'RFCE', '21865': 'RFCE', '21866': 'RFCE', '21867': 'RFCE', '21869': 'RFCE', '21871': 'RFCE', '21872': 'RFCE', '21874': 'RFCE', '21875': 'RFCE', '21890': 'RFCE', '21901': 'RFCE', '21902': 'RFCE', '21903': 'RFCE', '21904': 'RFCE', '21911': 'RFCE', '21912': 'RFCE', '21913': 'RFCE', '21914': 'RFCE', '21915': 'RFCE', '21916': 'RFCE', '21917': 'RFCE', '21918': 'RFCE', '21919': 'RFCE', '21920': 'RFCE', '21921': 'RFCE', '21922': 'RFCE', '21930': 'RFCE', '22003': 'SRVC', '22009': 'SRVC', '22015': 'SRVC', '22025': 'SRVC', '22026': 'SRVC', '22027': 'SRVC', '22030': 'SRVC', '22031': 'SRVC', '22032': 'SRVC', '22033': 'SRVC', '22034': 'SRVC', '22035': 'SRVC', '22036': 'SRVC', '22037': 'SRVC', '22038': 'SRVC', '22039': 'SRVC', '22040': 'SRVC', '22041': 'SRVC', '22042': 'SRVC', '22043': 'SRVC', '22044': 'SRVC', '22046': 'SRVC', '22060': 'SRVC', '22066': 'SRVC', '22067': 'SRVC', '22079': 'SRVC', '22081': 'SRVC', '22082': 'SRVC', '22095': 'SRVC', '22096': 'SRVC', '22101': 'SRVC', '22102': 'SRVC', '22103': 'SRVC', '22106': 'SRVC', '22107': 'SRVC', '22108': 'SRVC', '22109': 'SRVC', '22116': 'SRVC', '22118': 'SRVC', '22119': 'SRVC', '22121': 'SRVC', '22122': 'SRVC', '22124': 'SRVC', '22125': 'SRVC', '22134': 'SRVC', '22135': 'SRVC', '22150': 'SRVC', '22151': 'SRVC', '22152': 'SRVC', '22153': 'SRVC', '22156': 'SRVC', '22158': 'SRVC', '22159': 'SRVC', '22160': 'SRVC', '22161': 'SRVC', '22172': 'SRVC', '22180': 'SRVC', '22181': 'SRVC', '22182': 'SRVC', '22183': 'SRVC', '22185': 'SRVC', '22191': 'SRVC', '22192': 'SRVC', '22193': 'SRVC', '22194': 'SRVC', '22195': 'SRVC', '22199': 'SRVC', '22201': 'SRVC', '22202': 'SRVC', '22203': 'SRVC', '22204': 'SRVC', '22205': 'SRVC', '22206': 'SRVC', '22207': 'SRVC', '22209': 'SRVC', '22210': 'SRVC', '22211': 'SRVC', '22212': 'SRVC', '22213': 'SRVC', '22214': 'SRVC', '22215': 'SRVC', '22216': 'SRVC', '22217': 'SRVC', '22219': 'SRVC', '22222': 'SRVC', '22225': 'SRVC', '22226': 'SRVC', '22227': 'SRVC', '22230': 'SRVC', '22240': 'SRVC', '22241': 'SRVC', '22242': 'SRVC', '22243': 'SRVC', '22244': 'SRVC', '22245': 'SRVC', '22246': 'SRVC', '22301': 'SRVC', '22302': 'SRVC', '22303': 'SRVC', '22304': 'SRVC', '22305': 'SRVC', '22306': 'SRVC', '22307': 'SRVC', '22308': 'SRVC', '22309': 'SRVC', '22310': 'SRVC', '22311': 'SRVC', '22312': 'SRVC', '22313': 'SRVC', '22314': 'SRVC', '22315': 'SRVC', '22320': 'SRVC', '22331': 'SRVC', '22332': 'SRVC', '22333': 'SRVC', '22334': 'SRVC', '22350': 'SRVC', '22401': 'SRVC', '22402': 'SRVC', '22403': 'SRVC', '22404': 'SRVC', '22405': 'SRVC', '22406': 'SRVC', '22407': 'SRVC', '22408': 'SRVC', '22412': 'SRVC', '22427': 'SRVC', '22428': 'SRVC', '22430': 'SRVC', '22432': 'SRVC', '22433': 'SRVC', '22435': 'SRVC', '22436': 'SRVC', '22437': 'SRVC', '22438': 'SRVC', '22442': 'SRVC', '22443': 'SRVC', '22446': 'SRVC', '22448': 'SRVC', '22451': 'SRVC', '22454': 'SRVC', '22456': 'SRVC', '22460': 'SRVC', '22463': 'SRVC', '22469': 'SRVC', '22471': 'SRVC', '22472': 'SRVC', '22473': 'SRVC', '22476': 'SRVC', '22480': 'SRVC', '22481': 'SRVC', '22482': 'SRVC', '22485': 'SRVC', '22488': 'SRVC', '22501': 'SRVC', '22503': 'SRVC', '22504': 'SRVC', '22507': 'SRVC', '22508': 'SRVC', '22509': 'SRVC', '22511': 'SRVC', '22513': 'SRVC', '22514': 'SRVC', '22517': 'SRVC', '22520': 'SRVC', '22523': 'SRVC', '22524': 'SRVC', '22526': 'SRVC', '22528': 'SRVC', '22529': 'SRVC', '22530': 'SRVC', '22534': 'SRVC', '22535': 'SRVC', '22538': 'SRVC', '22539': 'SRVC', '22542': 'SRVC', '22544': 'SRVC', '22545': 'SRVC', '22546': 'SRVC', '22547': 'SRVC', '22548': 'SRVC', '22551': 'SRVC', '22552': 'SRVC', '22553': 'SRVC', '22554': 'SRVC', '22555': 'SRVC', '22556': 'SRVC', '22558': 'SRVC', '22560': 'SRVC', '22565': 'SRVC', '22567': 'SRVC', '22570': 'SRVC', '22572': 'SRVC', '22576': 'SRVC', '22577': 'SRVC', '22578': 'SRVC', '22579': 'SRVC', '22580': 'SRVC', '22581': 'SRVC', '22601': 'SRVC', '22602': 'SRVC', '22603': 'SRVC', '22604': 'SRVC', '22610': 'SRVC', '22611': 'SRVC', '22620': 'SRVC', '22622': 'RFCW', '22623': 'SRVC', '22624': 'SRVC', '22625': 'RFCW', '22626': 'RFCW', '22627': 'SRVC', '22630': 'SRVC', '22637': 'RFCW', '22639': 'SRVC', '22640': 'SRVC', '22641': 'SRVC', '22642': 'SRVC', '22643': 'SRVC', '22644': 'RFCW', '22645': 'SRVC', '22646': 'SRVC', '22649': 'SRVC', '22650': 'SRVC', '22652': 'SRVC', '22654': 'RFCW', '22655': 'SRVC', '22656': 'SRVC', '22657': 'SRVC', '22660': 'RFCW', '22663': 'SRVC', '22664': 'RFCW', '22701': 'SRVC', '22709': 'SRVC', '22711': 'SRVC', '22712': 'SRVC', '22713': 'SRVC', '22714': 'SRVC', '22715': 'SRVC', '22716': 'SRVC', '22718': 'SRVC', '22719': 'SRVC', '22720': 'SRVC', '22721': 'SRVC', '22722': 'SRVC', '22723': 'SRVC', '22724': 'SRVC', '22725': 'SRVC', '22726': 'SRVC', '22727': 'SRVC', '22728': 'SRVC', '22729': 'SRVC', '22730': 'SRVC', '22731': 'SRVC', '22732': 'SRVC', '22733': 'SRVC', '22734': 'SRVC', '22735': 'SRVC', '22736': 'SRVC', '22737': 'SRVC', '22738': 'SRVC', '22739': 'SRVC', '22740': 'SRVC', '22741': 'SRVC', '22742': 'SRVC', '22743': 'SRVC', '22746': 'SRVC', '22747': 'SRVC', '22748': 'SRVC', '22749': 'SRVC', '22801': 'SRVC', '22802': 'SRVC', '22803': 'SRVC', '22807': 'SRVC', '22810': 'RFCW', '22811': 'RFCW', '22812': 'RFCW', '22815': 'RFCW', '22820': 'RFCW', '22821': 'RFCW', '22824': 'RFCW', '22827': 'SRVC', '22830': 'RFCW', '22831': 'RFCW', '22832': 'RFCW', '22833': 'RFCW', '22834': 'RFCW', '22835': 'SRVC', '22840': 'RFCW', '22841': 'RFCW', '22842': 'RFCW', '22843': 'RFCW', '22844': 'RFCW', '22845': 'RFCW', '22846': 'RFCW', '22847': 'RFCW', '22848': 'SRVC', '22849': 'RFCW', '22850': 'RFCW', '22851': 'SRVC', '22853': 'RFCW', '22901': 'SRVC', '22902': 'RFCW', '22903': 'RFCW', '22904': 'SRVC', '22905': 'SRVC', '22906': 'SRVC', '22907': 'SRVC', '22908': 'SRVC', '22909': 'SRVC', '22910': 'SRVC', '22911': 'SRVC', '22920': 'RFCW', '22922': 'RFCW', '22923': 'SRVC', '22924': 'SRVC', '22931': 'RFCW', '22932': 'SRVC', '22935': 'SRVC', '22936': 'SRVC', '22937': 'RFCW', '22938': 'RFCW', '22939': 'RFCW', '22940': 'SRVC', '22942': 'SRVC', '22943': 'SRVC', '22945': 'SRVC', '22946': 'RFCW', '22947': 'SRVC', '22948': 'SRVC', '22949': 'RFCW', '22952': 'SRVC', '22957': 'SRVC', '22958': 'SRVC', '22959': 'RFCW', '22960': 'SRVC', '22963': 'SRVC', '22964': 'RFCW', '22965': 'SRVC', '22967': 'RFCW', '22968': 'SRVC', '22969': 'RFCW', '22971': 'RFCW', '22972': 'SRVC', '22973': 'SRVC', '22974': 'SRVC', '22976': 'RFCW', '22980': 'RFCW', '22987': 'SRVC', '22989': 'SRVC', '23001': 'SRVC', '23002': 'SRVC', '23003': 'SRVC', '23004': 'SRVC', '23005': 'SRVC', '23009': 'SRVC', '23011': 'SRVC', '23014': 'SRVC', '23015': 'SRVC', '23018': 'SRVC', '23021': 'SRVC', '23022': 'SRVC', '23023': 'SRVC', '23024': 'SRVC', '23025': 'SRVC', '23027': 'SRVC', '23030': 'SRVC', '23031': 'SRVC', '23032': 'SRVC', '23035': 'SRVC', '23038': 'SRVC', '23039': 'SRVC', '23040': 'SRVC', '23043': 'SRVC', '23045': 'SRVC', '23047': 'SRVC', '23050': 'SRVC', '23055': 'SRVC', '23056': 'SRVC', '23058': 'SRVC', '23059': 'SRVC', '23060': 'SRVC', '23061': 'SRVC', '23062': 'SRVC', '23063': 'SRVC', '23064': 'SRVC', '23065': 'SRVC', '23066': 'SRVC', '23067': 'SRVC', '23068': 'SRVC', '23069': 'SRVC', '23070': 'SRVC', '23071': 'SRVC', '23072': 'SRVC', '23075': 'SRVC', '23076': 'SRVC', '23079': 'SRVC', '23081': 'SRVC', '23083': 'SRVC', '23084': 'SRVC', '23085': 'SRVC', '23086': 'SRVC', '23089': 'SRVC', '23090': 'SRVC', '23091': 'SRVC', '23092': 'SRVC', '23093': 'SRVC', '23101': 'SRVC', '23102': 'SRVC', '23103': 'SRVC', '23105': 'SRVC', '23106': 'SRVC', '23107': 'SRVC', '23108': 'SRVC', '23109': 'SRVC', '23110': 'SRVC', '23111': 'SRVC', '23112': 'SRVC', '23113': 'SRVC', '23114': 'SRVC', '23115': 'SRVC', '23116': 'SRVC', '23117': 'SRVC', '23119': 'SRVC', '23120': 'SRVC', '23123': 'SRVC', '23124': 'SRVC', '23125': 'SRVC', '23126': 'SRVC', '23127': 'SRVC', '23128': 'SRVC', '23129': 'SRVC', '23130': 'SRVC', '23131': 'SRVC', '23138': 'SRVC', '23139': 'SRVC', '23140': 'SRVC', '23141': 'SRVC', '23146': 'SRVC', '23147': 'SRVC', '23148': 'SRVC', '23149': 'SRVC', '23150': 'SRVC', '23153': 'SRVC', '23154': 'SRVC', '23155': 'SRVC', '23156': 'SRVC', '23160': 'SRVC', '23161': 'SRVC', '23162': 'SRVC', '23163': 'SRVC', '23168': 'SRVC', '23169': 'SRVC', '23170': 'SRVC', '23173': 'SRVC', '23175': 'SRVC', '23176': 'SRVC', '23177': 'SRVC', '23178': 'SRVC', '23180': 'SRVC', '23181': 'SRVC', '23183': 'SRVC', '23184': 'SRVC', '23185': 'SRVC', '23186': 'SRVC', '23187': 'SRVC', '23188': 'SRVC', '23190': 'SRVC', '23192': 'SRVC', '23218': 'SRVC', '23219': 'SRVC', '23220': 'SRVC', '23221': 'SRVC', '23222': 'SRVC', '23223': 'SRVC', '23224': 'SRVC', '23225': 'SRVC', '23226': 'SRVC', '23227': 'SRVC', '23228': 'SRVC', '23229': 'SRVC', '23230': 'SRVC', '23231': 'SRVC', '23232': 'SRVC', '23233': 'SRVC', '23234': 'SRVC', '23235': 'SRVC', '23236': 'SRVC', '23237': 'SRVC', '23238': 'SRVC', '23241': 'SRVC', '23242': 'SRVC', '23249': 'SRVC', '23250': 'SRVC', '23255': 'SRVC', '23260': 'SRVC', '23261': 'SRVC', '23269': 'SRVC', '23273': 'SRVC', '23274': 'SRVC', '23276': 'SRVC', '23278': 'SRVC', '23279': 'SRVC', '23282': 'SRVC', '23284': 'SRVC', '23285': 'SRVC', '23286': 'SRVC', '23288': 'SRVC', '23289': 'SRVC', '23290': 'SRVC', '23291': 'SRVC', '23292': 'SRVC', '23293': 'SRVC', '23294': 'SRVC', '23295': 'SRVC', '23297': 'SRVC', '23298': 'SRVC', '23301': 'RFCE', '23302': 'RFCE', '23303': 'RFCE', '23304': 'SRVC', '23306': 'RFCE', '23307': 'RFCE', '23308': 'RFCE', '23310': 'RFCE', '23313': 'RFCE', '23314': 'SRVC', '23315': 'SRVC', '23316': 'RFCE', '23320': 'SRVC', '23321': 'SRVC', '23322': 'SRVC', '23323': 'SRVC', '23324': 'SRVC', '23325': 'SRVC', '23326': 'SRVC', '23327': 'SRVC', '23328': 'SRVC', '23336': 'RFCE', '23337': 'RFCE', '23341': 'RFCE', '23345': 'RFCE', '23347': 'RFCE', '23350': 'RFCE', '23354': 'RFCE', '23356': 'RFCE', '23357': 'RFCE', '23358': 'RFCE', '23359': 'RFCE', '23389': 'RFCE', '23395': 'RFCE', '23396': 'RFCE', '23397': 'SRVC', '23398': 'RFCE', '23399': 'RFCE', '23401': 'RFCE', '23404': 'RFCE', '23405': 'RFCE', '23407': 'RFCE', '23408': 'RFCE', '23409': 'RFCE', '23410': 'RFCE', '23412': 'RFCE', '23413': 'RFCE', '23414': 'RFCE', '23415': 'RFCE', '23416': 'RFCE', '23417': 'RFCE', '23418': 'RFCE', '23419': 'RFCE', '23420': 'RFCE', '23421': 'RFCE', '23422': 'RFCE', '23423': 'RFCE', '23424': 'SRVC', '23426': 'RFCE', '23427': 'RFCE', '23429': 'RFCE', '23430': 'SRVC', '23431': 'SRVC', '23432': 'SRVC', '23433': 'SRVC', '23434': 'SRVC', '23435': 'SRVC', '23436': 'SRVC', '23437': 'SRVC', '23438': 'SRVC', '23439': 'SRVC', '23440': 'RFCE', '23441': 'RFCE', '23442': 'RFCE', '23443': 'RFCE', '23450': 'SRVC', '23451': 'SRVC', '23452': 'SRVC', '23453': 'SRVC', '23454': 'SRVC', '23455': 'SRVC', '23456': 'SRVC', '23457': 'SRVC', '23458': 'SRVC', '23459': 'SRVC', '23460': 'SRVC', '23461': 'SRVC', '23462': 'SRVC', '23463': 'SRVC', '23464': 'SRVC', '23465': 'SRVC', '23466': 'SRVC', '23467': 'SRVC', '23471': 'SRVC', '23479': 'SRVC', '23480': 'RFCE', '23482': 'RFCE', '23483': 'RFCE', '23486': 'RFCE', '23487': 'SRVC', '23488': 'RFCE', '23501': 'SRVC', '23502': 'SRVC', '23503': 'SRVC', '23504': 'SRVC', '23505': 'SRVC', '23506': 'SRVC', '23507': 'SRVC', '23508': 'SRVC', '23509': 'SRVC', '23510': 'SRVC', '23511': 'SRVC', '23512': 'SRVC', '23513': 'SRVC', '23514': 'SRVC', '23515': 'SRVC', '23517': 'SRVC', '23518': 'SRVC', '23519': 'SRVC', '23520': 'SRVC', '23521': 'SRVC', '23523': 'SRVC', '23529': 'SRVC', '23541': 'SRVC', '23551': 'SRVC', '23601': 'SRVC', '23602': 'SRVC', '23603': 'SRVC', '23604': 'SRVC', '23605': 'SRVC', '23606': 'SRVC', '23607': 'SRVC', '23608': 'SRVC', '23609': 'SRVC', '23612': 'SRVC', '23628': 'SRVC', '23630': 'SRVC', '23651': 'SRVC', '23661': 'SRVC', '23662': 'SRVC', '23663': 'SRVC', '23664': 'SRVC', '23665': 'SRVC', '23666': 'SRVC', '23667': 'SRVC', '23668': 'SRVC', '23669': 'SRVC', '23670': 'SRVC', '23681': 'SRVC', '23690': 'SRVC', '23691': 'SRVC', '23692': 'SRVC', '23693': 'SRVC', '23694': 'SRVC', '23696': 'SRVC', '23701': 'SRVC', '23702': 'SRVC', '23703': 'SRVC', '23704': 'SRVC', '23705': 'SRVC', '23707': 'SRVC', '23708': 'SRVC', '23709': 'SRVC', '23801': 'SRVC', '23803': 'SRVC', '23804': 'SRVC', '23805': 'SRVC', '23806': 'SRVC', '23821': 'SRVC', '23822': 'SRVC', '23824': 'SRVC', '23827': 'SRVC', '23828': 'SRVC', '23829': 'SRVC', '23830': 'SRVC', '23831': 'SRVC', '23832': 'SRVC', '23833': 'SRVC', '23834': 'SRVC', '23836': 'SRVC', '23837': 'SRVC', '23838': 'SRVC', '23839': 'SRVC', '23840': 'SRVC', '23841': 'SRVC', '23842': 'SRVC', '23843': 'SRVC', '23844': 'SRVC', '23845': 'SRVC', '23846': 'SRVC', '23847': 'SRVC', '23850': 'SRVC', '23851': 'SRVC', '23856': 'SRVC', '23857': 'SRVC', '23860': 'SRVC', '23866': 'SRVC', '23867': 'SRVC', '23868': 'SRVC', '23870': 'SRVC', '23872': 'SRVC', '23873': 'SRVC', '23874': 'SRVC', '23875': 'SRVC', '23876': 'SRVC', '23878': 'SRVC', '23879': 'SRVC', '23881': 'SRVC', '23882': 'SRVC', '23883': 'SRVC', '23884': 'SRVC', '23885': 'SRVC', '23887': 'SRVC', '23888': 'SRVC', '23889': 'SRVC', '23890': 'SRVC', '23891': 'SRVC', '23893': 'SRVC', '23894': 'SRVC', '23897': 'SRVC', '23898': 'SRVC', '23899': 'SRVC', '23901': 'SRVC', '23909': 'SRVC', '23915': 'SRVC', '23917': 'SRVC', '23919': 'SRVC', '23920': 'SRVC', '23921': 'SRVC', '23922': 'SRVC', '23923': 'SRVC', '23924': 'SRVC', '23927': 'SRVC', '23930': 'SRVC', '23934': 'SRVC', '23936': 'SRVC', '23937': 'SRVC', '23938': 'SRVC', '23939': 'SRVC', '23941': 'SRVC', '23942': 'SRVC', '23943': 'SRVC', '23944': 'SRVC', '23947': 'SRVC', '23950': 'SRVC', '23952': 'SRVC', '23954': 'SRVC', '23955': 'SRVC', '23958': 'SRVC', '23959': 'SRVC', '23960': 'SRVC', '23962': 'SRVC', '23963': 'SRVC', '23964': 'SRVC', '23966': 'SRVC', '23967': 'SRVC', '23968': 'SRVC', '23970': 'SRVC', '23974': 'SRVC', '23976': 'SRVC', '24001': 'RFCW', '24002': 'RFCW', '24003': 'RFCW', '24004': 'RFCW', '24005': 'RFCW', '24006': 'RFCW', '24007': 'RFCW', '24008': 'RFCW', '24009': 'RFCW', '24010': 'RFCW', '24011': 'RFCW', '24012': 'RFCW', '24013': 'RFCW', '24014': 'RFCW', '24015': 'RFCW', '24016': 'RFCW', '24017': 'RFCW', '24018': 'RFCW', '24019': 'RFCW', '24020': 'RFCW', '24022': 'RFCW', '24023': 'RFCW', '24024': 'RFCW', '24025': 'RFCW', '24026': 'RFCW', '24027': 'RFCW', '24028': 'RFCW', '24029': 'RFCW', '24030': 'RFCW', '24031': 'RFCW', '24032': 'RFCW', '24033': 'RFCW', '24034': 'RFCW', '24035': 'RFCW', '24036': 'RFCW', '24037': 'RFCW', '24038': 'RFCW', '24040': 'RFCW', '24042': 'RFCW', '24043': 'RFCW', '24050': 'RFCW', '24053': 'RFCW', '24054': 'RFCW', '24055': 'RFCW', '24058': 'RFCW', '24059': 'RFCW', '24060': 'RFCW', '24061': 'RFCW', '24062': 'RFCW', '24063': 'RFCW', '24064': 'RFCW', '24065': 'RFCW', '24066': 'RFCW', '24067': 'RFCW', '24068': 'RFCW', '24069': 'RFCW', '24070': 'RFCW', '24072': 'RFCW', '24073': 'RFCW', '24076': 'RFCW', '24077': 'RFCW', '24078': 'RFCW', '24079': 'RFCW', '24082': 'RFCW', '24083': 'RFCW', '24084': 'RFCW', '24085': 'RFCW', '24086': 'RFCW', '24087': 'RFCW', '24088': 'RFCW', '24089': 'RFCW', '24090': 'RFCW', '24091': 'RFCW', '24092': 'RFCW', '24093': 'RFCW', '24095': 'RFCW', '24101': 'RFCW', '24102': 'RFCW', '24104': 'RFCW', '24105': 'RFCW', '24111': 'RFCW', '24112': 'RFCW', '24113': 'RFCW', '24114': 'RFCW', '24115': 'RFCW', '24120': 'RFCW', '24121': 'RFCW', '24122': 'RFCW', '24124': 'RFCW', '24126': 'RFCW', '24127': 'RFCW', '24128': 'RFCW', '24129': 'RFCW', '24130': 'SRVC', '24131': 'SRVC', '24132': 'RFCW', '24133': 'RFCW', '24134': 'RFCW', '24136': 'RFCW', '24137': 'RFCW', '24138': 'RFCW', '24139': 'SRVC', '24141': 'RFCW', '24142': 'RFCW', '24143': 'RFCW', '24146': 'RFCW', '24147': 'RFCW', '24148': 'RFCW', '24149': 'RFCW', '24150': 'RFCW', '24151': 'RFCW', '24153': 'RFCW', '24155': 'RFCW', '24157': 'RFCW', '24161': 'RFCW', '24162': 'RFCW', '24165': 'RFCW', '24167': 'RFCW', '24168': 'RFCW', '24171': 'RFCW', '24174': 'RFCW', '24175': 'RFCW', '24176': 'RFCW', '24177': 'RFCW', '24178': 'RFCW', '24179': 'RFCW', '24184': 'RFCW', '24185': 'RFCW', '24201': 'RFCW', '24202': 'RFCW', '24203': 'SRTV', '24205': 'SRTV', '24209': 'SRTV', '24210': 'RFCW', '24211': 'RFCW', '24212': 'RFCW', '24215': 'SRTV', '24216': 'RFCW', '24217': 'RFCW', '24218': 'SRTV', '24219': 'RFCW', '24220': 'RFCW', '24221': 'SRTV', '24224': 'RFCW', '24225': 'RFCW', '24226': 'RFCW', '24228': 'RFCW', '24230': 'RFCW', '24236': 'RFCW', '24237': 'RFCW', '24239': 'RFCW', '24243': 'SRTV', '24244': 'RFCW', '24245': 'RFCW', '24246': 'SRTV', '24248': 'SRTV', '24250': 'RFCW', '24251': 'RFCW', '24256': 'RFCW', '24258': 'RFCW', '24260': 'RFCW', '24263': 'SRTV', '24265': 'SRTV', '24266': 'RFCW', '24269': 'RFCW', '24270': 'RFCW', '24271': 'RFCW', '24272': 'RFCW', '24273': 'RFCW', '24277': 'SRTV', '24279': 'RFCW', '24280': 'RFCW', '24281': 'SRTV', '24282': 'SRTV', '24283': 'RFCW', '24290': 'RFCW', '24292': 'RFCW', '24293': 'RFCW', '24301': 'RFCW', '24311': 'RFCW', '24312': 'RFCW', '24313': 'RFCW', '24314': 'RFCW', '24315': 'RFCW', '24316': 'RFCW', '24317': 'RFCW', '24318': 'RFCW', '24319': 'RFCW', '24322': 'RFCW', '24323': 'RFCW', '24324': 'RFCW', '24325': 'RFCW', '24326': 'RFCW', '24327': 'RFCW', '24328': 'RFCW', '24330': 'RFCW', '24333': 'RFCW', '24340': 'RFCW', '24343': 'RFCW', '24347': 'RFCW', '24348': 'RFCW', '24350': 'RFCW', '24351': 'RFCW', '24352': 'RFCW', '24354': 'RFCW', '24360': 'RFCW', '24361': 'RFCW', '24363': 'RFCW', '24366': 'RFCW', '24368': 'RFCW', '24370': 'RFCW', '24374': 'RFCW', '24375': 'RFCW', '24377': 'RFCW', '24378': 'RFCW', '24380': 'RFCW', '24381': 'RFCW', '24382': 'RFCW', '24401': 'RFCW', '24402': 'SRVC', '24411': 'SRVC', '24412': 'SRVC', '24413': 'RFCW', '24415': 'SRVC', '24416': 'SRVC', '24421': 'RFCW', '24422': 'SRVC', '24426': 'SRVC', '24430': 'RFCW', '24431': 'RFCW', '24432': 'RFCW', '24433': 'RFCW', '24435': 'SRVC', '24437': 'RFCW', '24438': 'SRVC', '24439': 'RFCW', '24440': 'RFCW', '24441': 'SRVC', '24442': 'RFCW', '24445': 'SRVC', '24448': 'SRVC', '24450': 'SRVC', '24457': 'SRVC', '24458': 'RFCW', '24459': 'RFCW', '24460': 'SRVC', '24463': 'SRVC', '24464': 'SRVC', '24465': 'RFCW', '24467': 'RFCW', '24468': 'RFCW', '24469': 'SRVC', '24471': 'RFCW', '24472': 'SRVC', '24473': 'SRVC', '24474': 'SRVC', '24476': 'RFCW', '24477': 'RFCW', '24479': 'RFCW', '24482': 'RFCW', '24483': 'RFCW', '24484': 'RFCW', '24485': 'RFCW', '24486': 'RFCW', '24487': 'RFCW', '24501': 'RFCW', '24502': 'RFCW', '24503': 'RFCW', '24504': 'RFCW', '24505': 'RFCW', '24506': 'RFCW', '24513': 'RFCW', '24514': 'RFCW', '24515': 'RFCW', '24517': 'SRVC', '24520': 'RFCW', '24521': 'RFCW', '24522': 'RFCW', '24523': 'RFCW', '24526': 'RFCW', '24527': 'RFCW', '24528': 'SRVC', '24529': 'SRVC', '24530': 'RFCW', '24531': 'RFCW', '24533': 'RFCW', '24534': 'SRVC', '24535': 'SRVC', '24536': 'RFCW', '24538': 'RFCW', '24539': 'SRVC', '24540': 'RFCW', '24541': 'RFCW', '24543': 'SRVC', '24549': 'RFCW', '24550': 'RFCW', '24551': 'RFCW', '24553': 'RFCW', '24554': 'RFCW', '24555': 'RFCW', '24556': 'RFCW', '24557': 'SRVC', '24558': 'RFCW', '24562': 'RFCW', '24563': 'SRVC', '24565': 'SRVC', '24566': 'RFCW', '24569': 'SRVC', '24570': 'RFCW', '24571': 'RFCW', '24572': 'RFCW', '24574': 'RFCW', '24576': 'SRVC', '24577': 'SRVC', '24578': 'SRVC', '24579': 'RFCW', '24580': 'SRVC', '24581': 'RFCW', '24586': 'RFCW', '24588': 'RFCW', '24589': 'SRVC', '24590': 'RFCW', '24592': 'SRVC', '24593': 'SRVC', '24594': 'RFCW', '24595': 'RFCW', '24597': 'RFCW', '24598': 'SRVC', '24599': 'RFCW', '24601': 'RFCW', '24602': 'RFCW', '24603': 'RFCW', '24604': 'RFCW', '24605': 'RFCW', '24606': 'RFCW', '24607': 'RFCW', '24608': 'RFCW', '24609': 'RFCW', '24612': 'RFCW', '24613': 'RFCW', '24614': 'RFCW', '24619': 'RFCW', '24620': 'RFCW', '24622': 'RFCW', '24624': 'RFCW', '24627': 'RFCW', '24628': 'RFCW', '24630': 'RFCW', '24631': 'RFCW', '24634': 'RFCW', '24635': 'RFCW', '24637': 'RFCW', '24639': 'RFCW', '24640': 'RFCW', '24641': 'RFCW', '24646': 'RFCW', '24647': 'RFCW', '24649': 'RFCW', '24651': 'RFCW', '24656': 'RFCW', '24657': 'RFCW', '24658': 'RFCW', '24701': 'RFCW', '24712': 'RFCW', '24714': 'RFCW', '24715': 'RFCW', '24716': 'RFCW', '24719': 'RFCW', '24724': 'RFCW', '24726': 'RFCW', '24729': 'RFCW', '24731': 'RFCW', '24732': 'RFCW', '24733': 'RFCW', '24736': 'RFCW', '24737': 'RFCW', '24738': 'RFCW', '24739': 'RFCW', '24740': 'RFCW', '24747': 'RFCW', '24751': 'RFCW', '24801': 'RFCW', '24808': 'RFCW', '24811': 'RFCW', '24813': 'RFCW', '24815': 'RFCW', '24816': 'RFCW', '24817': 'RFCW', '24818': 'RFCW', '24822': 'RFCW', '24823': 'RFCW', '24826': 'RFCW', '24827': 'RFCW', '24828': 'RFCW', '24829': 'RFCW', '24830': 'RFCW', '24831': 'RFCW', '24834': 'RFCW', '24836': 'RFCW', '24839': 'RFCW', '24843': 'RFCW', '24844': 'RFCW', '24845': 'RFCW', '24846': 'RFCW', '24847': 'RFCW', '24848': 'RFCW', '24849': 'RFCW', '24850': 'RFCW', '24851': 'RFCW', '24853': 'RFCW', '24854': 'RFCW', '24855': 'RFCW', '24857': 'RFCW', '24859': 'RFCW', '24860': 'RFCW', '24861': 'RFCW', '24862': 'RFCW', '24866': 'RFCW', '24867': 'RFCW', '24868': 'RFCW', '24869': 'RFCW', '24870': 'RFCW', '24871': 'RFCW', '24872': 'RFCW', '24873': 'RFCW', '24874': 'RFCW', '24878': 'RFCW', '24879': 'RFCW', '24880': 'RFCW', '24881': 'RFCW', '24882': 'RFCW', '24884': 'RFCW', '24887': 'RFCW', '24888': 'RFCW', '24892': 'RFCW', '24894': 'RFCW', '24895': 'RFCW', '24898': 'RFCW', '24901': 'RFCW', '24902': 'RFCW', '24910': 'RFCW', '24915': 'RFCW', '24916': 'RFCW', '24918': 'RFCW', '24920': 'RFCW', '24924': 'RFCW', '24925': 'RFCW', '24927': 'RFCW', '24931': 'RFCW', '24934': 'RFCW', '24935': 'RFCW', '24938': 'RFCW', '24941': 'RFCW', '24943': 'RFCW', '24944': 'RFCW', '24945': 'RFCW', '24946': 'RFCW', '24951': 'RFCW', '24954': 'RFCW', '24957': 'RFCW', '24962': 'RFCW', '24963': 'RFCW', '24966': 'RFCW', '24970': 'RFCW', '24974': 'RFCW', '24976': 'RFCW', '24977': 'RFCW', '24981': 'RFCW', '24983': 'RFCW', '24984': 'RFCW', '24985': 'RFCW', '24986': 'RFCW', '24991': 'RFCW', '24993': 'RFCW', '25002': 'RFCW', '25003': 'RFCW', '25005': 'RFCW', '25007': 'RFCW', '25008': 'RFCW', '25009': 'RFCW', '25011': 'RFCW', '25015': 'RFCW', '25019': 'RFCW', '25021': 'RFCW', '25022': 'RFCW', '25024': 'RFCW', '25025': 'RFCW', '25026': 'RFCW', '25028': 'RFCW', '25030': 'RFCW', '25031': 'RFCW', '25033': 'RFCW', '25035': 'RFCW', '25036': 'RFCW', '25039': 'RFCW', '25040': 'RFCW', '25043': 'RFCW', '25044': 'RFCW', '25045': 'RFCW', '25047': 'RFCW', '25048': 'RFCW', '25049': 'RFCW', '25051': 'RFCW', '25053': 'RFCW', '25054': 'RFCW', '25057': 'RFCW', '25059': 'RFCW', '25060': 'RFCW', '25061': 'RFCW', '25062': 'RFCW', '25063': 'RFCW', '25064': 'RFCW', '25067': 'RFCW', '25070': 'RFCW', '25071': 'RFCW', '25075': 'RFCW', '25076': 'RFCW', '25079': 'RFCW', '25081': 'RFCW', '25082': 'RFCW', '25083': 'RFCW', '25085': 'RFCW', '25086': 'RFCW', '25088': 'RFCW', '25090': 'RFCW', '25093': 'RFCW', '25102': 'RFCW', '25103': 'RFCW', '25106': 'RFCW', '25107': 'RFCW', '25108': 'RFCW', '25109': 'RFCW', '25110': 'RFCW', '25111': 'RFCW', '25112': 'RFCW', '25113': 'RFCW', '25114': 'RFCW', '25115': 'RFCW', '25118': 'RFCW', '25119': 'RFCW', '25121': 'RFCW', '25123': 'RFCW', '25124': 'RFCW', '25125': 'RFCW', '25126': 'RFCW', '25130': 'RFCW', '25132': 'RFCW', '25133': 'RFCW', '25134': 'RFCW', '25136': 'RFCW', '25139': 'RFCW', '25140': 'RFCW', '25141': 'RFCW', '25142': 'RFCW', '25143': 'RFCW', '25148': 'RFCW', '25149': 'RFCW', '25152': 'RFCW', '25154': 'RFCW', '25156': 'RFCW', '25159': 'RFCW', '25160': 'RFCW', '25161': 'RFCW', '25162': 'RFCW', '25164': 'RFCW', '25165': 'RFCW', '25168': 'RFCW', '25169': 'RFCW', '25173': 'RFCW', '25174': 'RFCW', '25177': 'RFCW', '25180': 'RFCW', '25181': 'RFCW', '25183': 'RFCW', '25185': 'RFCW', '25186': 'RFCW', '25187': 'RFCW', '25193': 'RFCW', '25201': 'RFCW', '25202': 'RFCW', '25203': 'RFCW', '25204': 'RFCW', '25205': 'RFCW', '25206': 'RFCW', '25208': 'RFCW', '25209': 'RFCW', '25211': 'RFCW', '25213': 'RFCW', '25214': 'RFCW', '25231': 'RFCW', '25234': 'RFCW', '25235': 'RFCW', '25239': 'RFCW', '25241': 'RFCW', '25243': 'RFCW', '25244': 'RFCW', '25245': 'RFCW', '25247': 'RFCW', '25248': 'RFCW', '25251': 'RFCW', '25252': 'RFCW', '25253': 'RFCW', '25259': 'RFCW', '25260': 'RFCW', '25261': 'RFCW', '25262': 'RFCW', '25264': 'RFCW', '25265': 'RFCW', '25266': 'RFCW', '25267': 'RFCW', '25268': 'RFCW', '25270': 'RFCW', '25271': 'RFCW', '25275': 'RFCW', '25276': 'RFCW', '25285': 'RFCW', '25286': 'RFCW', '25287': 'RFCW', '25301': 'RFCW', '25302': 'RFCW', '25303': 'RFCW', '25304': 'RFCW', '25305': 'RFCW', '25306': 'RFCW', '25309': 'RFCW', '25311': 'RFCW', '25312': 'RFCW', '25313': 'RFCW', '25314': 'RFCW', '25315': 'RFCW', '25317': 'RFCW', '25320': 'RFCW', '25321': 'RFCW', '25322': 'RFCW', '25323': 'RFCW', '25324': 'RFCW', '25325': 'RFCW', '25326': 'RFCW', '25327': 'RFCW', '25328': 'RFCW', '25329': 'RFCW', '25330': 'RFCW', '25331': 'RFCW', '25332': 'RFCW', '25333': 'RFCW', '25334': 'RFCW', '25335': 'RFCW', '25336': 'RFCW', '25337': 'RFCW', '25338': 'RFCW', '25339': 'RFCW', '25350': 'RFCW', '25356': 'RFCW', '25357': 'RFCW', '25358': 'RFCW', '25360': 'RFCW', '25361': 'RFCW', '25362': 'RFCW', '25364': 'RFCW', '25365': 'RFCW', '25375': 'RFCW', '25387': 'RFCW', '25389': 'RFCW', '25392': 'RFCW', '25396': 'RFCW', '25401': 'RFCW', '25402': 'RFCW', '25403': 'RFCW', '25404': 'RFCW', '25405': 'RFCW', '25410': 'RFCW', '25411': 'RFCW', '25413': 'RFCW', '25414': 'RFCW', '25419': 'RFCW', '25420': 'RFCW', '25421': 'RFCW', '25422': 'RFCW', '25423': 'RFCW', '25425': 'RFCW', '25427': 'RFCW', '25428': 'RFCW', '25430': 'RFCW', '25431': 'RFCW', '25432': 'RFCW', '25434': 'RFCW', '25437': 'RFCW', '25438': 'RFCW', '25440': 'RFCW', '25441': 'RFCW', '25442': 'RFCW', '25443': 'RFCW', '25444': 'RFCW', '25446': 'RFCW', '25501': 'RFCW', '25502': 'RFCW', '25503': 'RFCW', '25504': 'RFCW', '25505': 'RFCW', '25506': 'RFCW', '25507': 'RFCW', '25508': 'RFCW', '25510': 'RFCW', '25511': 'RFCW', '25512': 'RFCW', '25514': 'RFCW', '25515': 'RFCW', '25517': 'RFCW', '25520': 'RFCW', '25521': 'RFCW', '25523': 'RFCW', '25524': 'RFCW', '25526': 'RFCW', '25529': 'RFCW', '25530': 'RFCW', '25534': 'RFCW', '25535': 'RFCW', '25537': 'RFCW', '25540': 'RFCW', '25541': 'RFCW', '25544': 'RFCW', '25545': 'RFCW', '25547': 'RFCW', '25550': 'RFCW', '25555': 'RFCW', '25557': 'RFCW', '25559': 'RFCW', '25560': 'RFCW', '25562': 'RFCW', '25564': 'RFCW', '25565': 'RFCW', '25567': 'RFCW', '25569': 'RFCW', '25570': 'RFCW', '25571': 'RFCW', '25572': 'RFCW', '25573': 'RFCW', '25601': 'RFCW', '25606': 'RFCW', '25607': 'RFCW', '25608': 'RFCW', '25611': 'RFCW', '25612': 'RFCW', '25614': 'RFCW', '25617': 'RFCW', '25621': 'RFCW', '25624': 'RFCW', '25625': 'RFCW', '25628': 'RFCW', '25630': 'RFCW', '25632': 'RFCW', '25634': 'RFCW', '25635': 'RFCW', '25637': 'RFCW', '25638': 'RFCW', '25639': 'RFCW', '25644': 'RFCW', '25646': 'RFCW', '25647': 'RFCW', '25649': 'RFCW', '25650': 'RFCW', '25651': 'RFCW', '25652': 'RFCW', '25653': 'RFCW', '25654': 'RFCW', '25661': 'RFCW', '25665': 'RFCW', '25666': 'RFCW', '25667': 'RFCW', '25669': 'RFCW', '25670': 'RFCW', '25671': 'RFCW', '25672': 'RFCW', '25674': 'RFCW', '25676': 'RFCW', '25678': 'RFCW', '25685': 'RFCW', '25686': 'RFCW', '25688': 'RFCW', '25690': 'RFCW', '25691': 'RFCW', '25692': 'RFCW', '25696': 'RFCW', '25699': 'RFCW', '25701': 'RFCW', '25702': 'RFCW', '25703': 'RFCW', '25704': 'RFCW', '25705': 'RFCW', '25706': 'RFCW', '25707': 'RFCW', '25708': 'RFCW', '25709': 'RFCW', '25710': 'RFCW', '25711': 'RFCW', '25712': 'RFCW', '25713': 'RFCW', '25714': 'RFCW', '25715': 'RFCW', '25716': 'RFCW', '25717': 'RFCW', '25718': 'RFCW', '25719': 'RFCW', '25720': 'RFCW', '25721': 'RFCW', '25722': 'RFCW', '25723': 'RFCW', '25724': 'RFCW', '25725': 'RFCW', '25726': 'RFCW', '25727': 'RFCW', '25728': 'RFCW', '25729': 'RFCW', '25755': 'RFCW', '25770': 'RFCW', '25771': 'RFCW', '25772': 'RFCW', '25773': 'RFCW', '25774': 'RFCW', '25775': 'RFCW', '25776': 'RFCW', '25777': 'RFCW', '25778': 'RFCW', '25779': 'RFCW', '25801': 'RFCW', '25802': 'RFCW', '25810': 'RFCW', '25811': 'RFCW', '25812': 'RFCW', '25813': 'RFCW', '25817': 'RFCW', '25818': 'RFCW', '25820': 'RFCW', '25823': 'RFCW', '25825': 'RFCW', '25826': 'RFCW', '25827': 'RFCW', '25831': 'RFCW', '25832': 'RFCW', '25833': 'RFCW', '25836': 'RFCW', '25837': 'RFCW', '25839': 'RFCW', '25840': 'RFCW', '25841': 'RFCW', '25843': 'RFCW', '25844': 'RFCW', '25845': 'RFCW', '25846': 'RFCW', '25848': 'RFCW', '25849': 'RFCW', '25851': 'RFCW', '25853': 'RFCW', '25854': 'RFCW', '25855': 'RFCW', '25857': 'RFCW', '25860': 'RFCW', '25862': 'RFCW', '25864': 'RFCW', '25865': 'RFCW', '25866': 'RFCW', '25868': 'RFCW', '25870': 'RFCW', '25871': 'RFCW', '25873': 'RFCW', '25875': 'RFCW', '25876': 'RFCW', '25878': 'RFCW', '25879': 'RFCW', '25880': 'RFCW', '25882': 'RFCW', '25901': 'RFCW', '25902': 'RFCW', '25904': 'RFCW', '25906': 'RFCW', '25907': 'RFCW', '25908': 'RFCW', '25909': 'RFCW', '25911': 'RFCW', '25913': 'RFCW', '25915': 'RFCW', '25916': 'RFCW', '25917': 'RFCW', '25918': 'RFCW', '25919': 'RFCW', '25920': 'RFCW', '25921': 'RFCW', '25922': 'RFCW', '25927': 'RFCW', '25928': 'RFCW', '25932': 'RFCW', '25936': 'RFCW', '25938': 'RFCW', '25942': 'RFCW', '25943': 'RFCW', '25951': 'RFCW', '25958': 'RFCW', '25962': 'RFCW', '25966': 'RFCW', '25969': 'RFCW', '25971': 'RFCW', '25972': 'RFCW', '25976': 'RFCW', '25977': 'RFCW', '25978': 'RFCW', '25979': 'RFCW', '25981': 'RFCW', '25984': 'RFCW', '25985': 'RFCW', '25986': 'RFCW', '25989': 'RFCW', '26003': 'RFCW', '26030': 'RFCW', '26031': 'RFCW', '26032': 'RFCW', '26033': 'RFCW', '26034': 'RFCW', '26035': 'RFCW', '26036': 'RFCW', '26037': 'RFCW', '26038': 'RFCW', '26039': 'RFCW', '26040': 'RFCW', '26041': 'RFCW', '26047': 'RFCW', '26050': 'RFCW', '26055': 'RFCW', '26056': 'RFCW', '26058': 'RFCW', '26059': 'RFCW', '26060': 'RFCW', '26062': 'RFCW', '26070': 'RFCW', '26074': 'RFCW', '26075': 'RFCW', '26101': 'RFCW', '26102': 'RFCW', '26103': 'RFCW', '26104': 'RFCW', '26105': 'RFCW', '26106': 'RFCW', '26120': 'RFCW', '26121': 'RFCW', '26133': 'RFCW', '26134': 'RFCW', '26136': 'RFCW', '26137': 'RFCW', '26138': 'RFCW', '26141': 'RFCW', '26142': 'RFCW', '26143': 'RFCW', '26146': 'RFCW', '26147': 'RFCW', '26148': 'RFCW', '26149': 'RFCW', '26150': 'RFCW', '26151': 'RFCW', '26152': 'RFCW', '26155': 'RFCW', '26159': 'RFCW', '26160': 'RFCW', '26161': 'RFCW', '26162': 'RFCW', '26164': 'RFCW', '26167': 'RFCW', '26169': 'RFCW', '26170': 'RFCW', '26175': 'RFCW', '26178': 'RFCW', '26180': 'RFCW', '26181': 'RFCW', '26184': 'RFCW', '26187': 'RFCW', '26201': 'RFCW', '26202': 'RFCW', '26203': 'RFCW', '26205': 'RFCW', '26206': 'RFCW', '26208': 'RFCW', '26209': 'RFCW', '26210': 'RFCW', '26215': 'RFCW', '26217': 'RFCW', '26218': 'RFCW', '26219': 'RFCW', '26222': 'RFCW', '26224': 'RFCW', '26228': 'RFCW', '26229': 'RFCW', '26230': 'RFCW', '26234': 'RFCW', '26236': 'RFCW', '26237': 'RFCW', '26238': 'RFCW', '26241': 'RFCW', '26250': 'RFCW', '26253': 'RFCW', '26254': 'RFCW', '26257': 'RFCW', '26259': 'RFCW', '26260': 'RFCW', '26261': 'RFCW', '26263': 'RFCW', '26264': 'RFCW', '26266': 'RFCW', '26267': 'RFCW', '26268': 'RFCW', '26269': 'RFCW', '26270': 'RFCW', '26271': 'RFCW', '26273': 'RFCW', '26275': 'RFCW', '26276': 'RFCW', '26278': 'RFCW', '26280': 'RFCW', '26282': 'RFCW', '26283': 'RFCW', '26285': 'RFCW', '26287': 'RFCW', '26288': 'RFCW', '26289': 'RFCW', '26291': 'RFCW', '26292': 'RFCW', '26293': 'RFCW', '26294': 'RFCW', '26296': 'RFCW', '26298': 'RFCW', '26301': 'RFCW', '26302': 'RFCW', '26306': 'RFCW', '26320': 'RFCW', '26321': 'RFCW', '26323': 'RFCW', '26325': 'RFCW', '26327': 'RFCW', '26330': 'RFCW', '26335': 'RFCW', '26337': 'RFCW', '26338': 'RFCW', '26339': 'RFCW', '26342': 'RFCW', '26343': 'RFCW', '26346': 'RFCW', '26347': 'RFCW', '26348': 'RFCW', '26349': 'RFCW', '26351': 'RFCW', '26354': 'RFCW', '26361': 'RFCW', '26362': 'RFCW', '26366': 'RFCW', '26369': 'RFCW', '26372': 'RFCW', '26374': 'RFCW', '26376': 'RFCW', '26377': 'RFCW', '26378': 'RFCW', '26384': 'RFCW', '26385': 'RFCW', '26386': 'RFCW', '26404': 'RFCW', '26405': 'RFCW', '26408': 'RFCW', '26410': 'RFCW', '26411': 'RFCW', '26412': 'RFCW', '26415': 'RFCW', '26416': 'RFCW', '26419': 'RFCW', '26421': 'RFCW', '26422': 'RFCW', '26424': 'RFCW', '26425': 'RFCW', '26426': 'RFCW', '26430': 'RFCW', '26431': 'RFCW', '26434': 'RFCW', '26435': 'RFCW', '26436': 'RFCW', '26437': 'RFCW', '26438': 'RFCW', '26440': 'RFCW', '26443': 'RFCW', '26444': 'RFCW', '26447': 'RFCW', '26448': 'RFCW', '26451': 'RFCW', '26452': 'RFCW', '26456': 'RFCW', '26463': 'RFCW', '26501': 'RFCW', '26502': 'RFCW', '26504': 'RFCW', '26505': 'RFCW', '26506': 'RFCW', '26507': 'RFCW', '26508': 'RFCW', '26519': 'RFCW', '26520': 'RFCW', '26521': 'RFCW', '26524': 'RFCW', '26525': 'RFCW', '26527': 'RFCW', '26531': 'RFCW', '26534': 'RFCW', '26537': 'RFCW', '26541': 'RFCW', '26542': 'RFCW', '26543': 'RFCW', '26544': 'RFCW', '26546': 'RFCW', '26547': 'RFCW', '26554': 'RFCW', '26555': 'RFCW', '26559': 'RFCW', '26560': 'RFCW', '26561': 'RFCW', '26562': 'RFCW', '26563': 'RFCW', '26566': 'RFCW', '26568': 'RFCW', '26570': 'RFCW', '26571': 'RFCW', '26572': 'RFCW', '26574': 'RFCW', '26575': 'RFCW', '26576': 'RFCW', '26578': 'RFCW', '26581': 'RFCW', '26582': 'RFCW', '26585': 'RFCW', '26586': 'RFCW', '26587': 'RFCW', '26588': 'RFCW', '26590': 'RFCW', '26591': 'RFCW', '26601': 'RFCW', '26610': 'RFCW', '26611': 'RFCW', '26615': 'RFCW', '26617': 'RFCW', '26619': 'RFCW', '26621': 'RFCW', '26623': 'RFCW', '26624': 'RFCW', '26627': 'RFCW', '26629': 'RFCW', '26631': 'RFCW', '26636': 'RFCW', '26638': 'RFCW', '26651': 'RFCW', '26656': 'RFCW', '26660': 'RFCW', '26662': 'RFCW', '26667': 'RFCW', '26671': 'RFCW', '26675': 'RFCW', '26676': 'RFCW', '26678': 'RFCW', '26679': 'RFCW', '26680': 'RFCW', '26681': 'RFCW', '26684': 'RFCW', '26690': 'RFCW', '26691': 'RFCW', '26704': 'RFCW', '26705': 'RFCW', '26707': 'RFCW', '26710': 'RFCW', '26711': 'RFCW', '26714': 'RFCW', '26716': 'RFCW', '26717': 'RFCW', '26719': 'RFCW', '26720': 'RFCW', '26722': 'RFCW', '26726': 'RFCW', '26731': 'RFCW', '26739': 'RFCW', '26743': 'RFCW', '26750': 'RFCW', '26753': 'RFCW', '26755': 'RFCW', '26757': 'RFCW', '26761': 'RFCW', '26763': 'RFCW', '26764': 'RFCW', '26767': 'RFCW', '26801': 'RFCW', '26802': 'RFCW', '26804': 'RFCW', '26807': 'RFCW', '26808': 'RFCW', '26810': 'RFCW', '26812': 'RFCW', '26814': 'RFCW', '26815': 'RFCW', '26817': 'RFCW', '26818': 'RFCW', '26823': 'RFCW', '26833': 'RFCW', '26836': 'RFCW', '26838': 'RFCW', '26845': 'RFCW', '26847': 'RFCW', '26851': 'RFCW', '26852': 'RFCW', '26855': 'RFCW', '26865': 'RFCW', '26866': 'RFCW', '26884': 'RFCW', '26886': 'RFCW', '27006': 'SRVC', '27007': 'SRVC', '27009': 'SRVC', '27010': 'SRVC', '27011': 'SRVC', '27012': 'SRVC', '27013': 'SRVC', '27014': 'SRVC', '27016': 'SRVC', '27017': 'SRVC', '27018': 'SRVC', '27019': 'SRVC', '27020': 'SRVC', '27021': 'SRVC', '27022': 'SRVC', '27023': 'SRVC', '27024': 'SRVC', '27025': 'SRVC', '27027': 'SRVC', '27028': 'SRVC', '27030': 'SRVC', '27031': 'SRVC', '27040': 'SRVC', '27041': 'SRVC', '27042': 'SRVC', '27043': 'SRVC', '27045': 'SRVC', '27046': 'SRVC', '27047': 'SRVC', '27048': 'SRVC', '27049': 'SRVC', '27050': 'SRVC', '27051': 'SRVC', '27052': 'SRVC', '27053': 'SRVC', '27054': 'SRVC', '27055': 'SRVC', '27094': 'SRVC', '27098': 'SRVC', '27099': 'SRVC', '27101': 'SRVC', '27102': 'SRVC', '27103': 'SRVC', '27104': 'SRVC', '27105': 'SRVC', '27106': 'SRVC', '27107': 'SRVC', '27108': 'SRVC', '27109': 'SRVC', '27110': 'SRVC', '27111': 'SRVC', '27113': 'SRVC', '27114': 'SRVC', '27115': 'SRVC', '27116': 'SRVC', '27117': 'SRVC', '27120': 'SRVC', '27127': 'SRVC', '27130': 'SRVC', '27150': 'SRVC', '27152': 'SRVC', '27155': 'SRVC', '27157': 'SRVC', '27198': 'SRVC', '27199': 'SRVC', '27201': 'SRVC', '27202': 'SRVC', '27203': 'SRVC', '27204': 'SRVC', '27205': 'SRVC', '27207': 'SRVC', '27208': 'SRVC', '27209': 'SRVC', '27212': 'SRVC', '27213': 'SRVC', '27214': 'SRVC', '27215': 'SRVC', '27216': 'SRVC', '27217': 'SRVC', '27228': 'SRVC', '27229': 'SRVC', '27230': 'SRVC', '27231': 'SRVC', '27233': 'SRVC', '27235': 'SRVC', '27237': 'SRVC', '27239': 'SRVC', '27242': 'SRVC', '27243': 'SRVC', '27244': 'SRVC', '27247': 'SRVC', '27248': 'SRVC', '27249': 'SRVC', '27252': 'SRVC', '27253': 'SRVC', '27256': 'SRVC', '27258': 'SRVC', '27259': 'SRVC', '27260': 'SRVC', '27261': 'SRVC', '27262': 'SRVC', '27263': 'SRVC', '27264': 'SRVC', '27265': 'SRVC', '27278': 'SRVC', '27281': 'SRVC', '27282': 'SRVC', '27283': 'SRVC', '27284': 'SRVC', '27285': 'SRVC', '27288': 'SRVC', '27289': 'SRVC', '27291': 'SRVC', '27292': 'SRVC', '27293': 'SRVC', '27294': 'SRVC', '27295': 'SRVC', '27298': 'SRVC', '27299': 'SRVC', '27301': 'SRVC', '27302': 'SRVC', '27305': 'SRVC', '27306': 'SRVC', '27310': 'SRVC', '27311': 'SRVC', '27312': 'SRVC', '27313': 'SRVC', '27314': 'SRVC', '27315': 'SRVC', '27316': 'SRVC', '27317': 'SRVC', '27320': 'SRVC', '27323': 'SRVC', '27325': 'SRVC', '27326': 'SRVC', '27330': 'SRVC', '27331': 'SRVC', '27332': 'SRVC', '27340': 'SRVC', '27341': 'SRVC', '27342': 'SRVC', '27343': 'SRVC', '27344': 'SRVC', '27349': 'SRVC', '27350': 'SRVC', '27351': 'SRVC', '27355': 'SRVC', '27356': 'SRVC', '27357': 'SRVC', '27358': 'SRVC', '27359': 'SRVC', '27360': 'SRVC', '27361': 'SRVC', '27370': 'SRVC', '27371': 'SRVC', '27373': 'SRVC', '27374': 'SRVC', '27375': 'SRVC', '27376': 'SRVC', '27377': 'SRVC', '27379': 'SRVC', '27401': 'SRVC', '27402': 'SRVC', '27403': 'SRVC', '27404': 'SRVC', '27405': 'SRVC', '27406': 'SRVC', '27407': 'SRVC', '27408': 'SRVC', '27409': 'SRVC', '27410': 'SRVC', '27411': 'SRVC', '27412': 'SRVC', '27413': 'SRVC', '27415': 'SRVC', '27416': 'SRVC', '27417': 'SRVC', '27419': 'SRVC', '27420': 'SRVC', '27425': 'SRVC', '27427': 'SRVC', '27429': 'SRVC', '27435': 'SRVC', '27438': 'SRVC', '27455': 'SRVC', '27495': 'SRVC', '27497': 'SRVC', '27498': 'SRVC', '27499': 'SRVC', '27501': 'SRVC', '27502': 'SRVC', '27503': 'SRVC', '27504': 'SRVC', '27505': 'SRVC', '27506': 'SRVC', '27507': 'SRVC', '27508': 'SRVC', '27509': 'SRVC', '27510': 'SRVC', '27511': 'SRVC', '27512': 'SRVC', '27513': 'SRVC', '27514': 'SRVC', '27515': 'SRVC', '27516': 'SRVC', '27517': 'SRVC', '27518': 'SRVC', '27519': 'SRVC', '27520': 'SRVC', '27521': 'SRVC', '27522': 'SRVC', '27523': 'SRVC', '27524': 'SRVC', '27525': 'SRVC', '27526': 'SRVC', '27527': 'SRVC', '27528': 'SRVC', '27529': 'SRVC', '27530': 'SRVC', '27531': 'SRVC', '27532': 'SRVC', '27533': 'SRVC', '27534': 'SRVC', '27536': 'SRVC', '27537': 'SRVC', '27539': 'SRVC', '27540': 'SRVC', '27541': 'SRVC', '27542': 'SRVC', '27543': 'SRVC', '27544': 'SRVC', '27545': 'SRVC', '27546': 'SRVC', '27549': 'SRVC', '27551': 'SRVC', '27552': 'SRVC', '27553': 'SRVC', '27555': 'SRVC', '27556': 'SRVC', '27557': 'SRVC', '27559': 'SRVC', '27560': 'SRVC', '27562': 'SRVC', '27563': 'SRVC', '27564': 'SRVC', '27565': 'SRVC', '27568': 'SRVC', '27569': 'SRVC', '27570': 'SRVC', '27571': 'SRVC', '27572': 'SRVC', '27573': 'SRVC', '27574': 'SRVC', '27576': 'SRVC', '27577': 'SRVC', '27581': 'SRVC', '27582': 'SRVC', '27583': 'SRVC', '27584': 'SRVC', '27586': 'SRVC', '27587': 'SRVC', '27588': 'SRVC', '27589': 'SRVC', '27591': 'SRVC', '27592': 'SRVC', '27593': 'SRVC', '27594': 'SRVC', '27596': 'SRVC', '27597': 'SRVC', '27599': 'SRVC', '27601': 'SRVC', '27602': 'SRVC', '27603': 'SRVC', '27604': 'SRVC', '27605': 'SRVC', '27606': 'SRVC', '27607': 'SRVC', '27608': 'SRVC', '27609': 'SRVC', '27610': 'SRVC', '27611': 'SRVC', '27612': 'SRVC', '27613': 'SRVC', '27614': 'SRVC', '27615': 'SRVC', '27616': 'SRVC', '27617': 'SRVC', '27619': 'SRVC', '27620': 'SRVC', '27621': 'SRVC', '27622': 'SRVC', '27623': 'SRVC', '27624': 'SRVC', '27625': 'SRVC', '27626': 'SRVC', '27627': 'SRVC', '27628': 'SRVC', '27629': 'SRVC', '27634': 'SRVC', '27635': 'SRVC', '27636': 'SRVC', '27640': 'SRVC', '27650': 'SRVC', '27656': 'SRVC', '27658': 'SRVC', '27661': 'SRVC', '27668': 'SRVC', '27675': 'SRVC', '27676': 'SRVC', '27690': 'SRVC', '27695': 'SRVC', '27697': 'SRVC', '27698': 'SRVC', '27699': 'SRVC', '27701': 'SRVC', '27702': 'SRVC', '27703': 'SRVC', '27704': 'SRVC', '27705': 'SRVC', '27706': 'SRVC', '27707': 'SRVC', '27708': 'SRVC', '27709': 'SRVC', '27710': 'SRVC', '27711': 'SRVC', '27712': 'SRVC', '27713': 'SRVC', '27715': 'SRVC', '27717': 'SRVC', '27722': 'SRVC', '27801': 'SRVC', '27802': 'SRVC', '27803': 'SRVC', '27804': 'SRVC', '27805': 'SRVC', '27806': 'SRVC', '27807': 'SRVC', '27808': 'SRVC', '27809': 'SRVC', '27810': 'SRVC', '27811': 'SRVC', '27812': 'SRVC', '27813': 'SRVC', '27814': 'SRVC', '27815': 'SRVC', '27816': 'SRVC', '27817': 'SRVC', '27818': 'SRVC', '27819': 'SRVC', '27820': 'SRVC', '27821': 'SRVC', '27822': 'SRVC', '27823': 'SRVC', '27824': 'SRVC', '27825': 'SRVC', '27826': 'SRVC', '27827': 'SRVC', '27828': 'SRVC', '27829': 'SRVC', '27830': 'SRVC', '27831': 'SRVC', '27832': 'SRVC', '27833': 'SRVC', '27834': 'SRVC', '27835': 'SRVC', '27836': 'SRVC', '27837': 'SRVC', '27839': 'SRVC', '27840': 'SRVC', '27841': 'SRVC', '27842': 'SRVC', '27843': 'SRVC', '27844': 'SRVC', '27845': 'SRVC', '27846': 'SRVC', '27847': 'SRVC', '27849': 'SRVC', '27850': 'SRVC', '27851': 'SRVC', '27852': 'SRVC', '27853': 'SRVC', '27855': 'SRVC', '27856': 'SRVC', '27857': 'SRVC', '27858': 'SRVC', '27860': 'SRVC', '27861': 'SRVC', '27862': 'SRVC', '27863': 'SRVC', '27864': 'SRVC', '27865': 'SRVC', '27866': 'SRVC', '27867': 'SRVC', '27868': 'SRVC', '27869': 'SRVC', '27870': 'SRVC', '27871': 'SRVC', '27872': 'SRVC', '27873': 'SRVC', '27874': 'SRVC', '27875': 'SRVC', '27876': 'SRVC', '27877': 'SRVC', '27878': 'SRVC', '27879': 'SRVC', '27880': 'SRVC', '27881': 'SRVC', '27882': 'SRVC', '27883': 'SRVC', '27884': 'SRVC', '27885': 'SRVC', '27886': 'SRVC', '27887': 'SRVC', '27888': 'SRVC', '27889': 'SRVC', '27890': 'SRVC', '27891': 'SRVC', '27892': 'SRVC', '27893': 'SRVC', '27894': 'SRVC', '27895': 'SRVC', '27896': 'SRVC', '27897': 'SRVC', '27906': 'SRVC', '27907': 'SRVC', '27909': 'SRVC', '27910': 'SRVC', '27915': 'SRVC', '27916': 'SRVC', '27917': 'SRVC', '27919': 'SRVC', '27920': 'SRVC', '27921': 'SRVC', '27922': 'SRVC', '27923': 'SRVC', '27924': 'SRVC', '27925': 'SRVC', '27926': 'SRVC', '27927': 'SRVC', '27928': 'SRVC', '27929': 'SRVC', '27930': 'SRVC', '27932': 'SRVC', '27935': 'SRVC', '27936': 'SRVC', '27937': 'SRVC', '27938': 'SRVC', '27939': 'SRVC', '27941': 'SRVC', '27942': 'SRVC', '27943': 'SRVC', '27944': 'SRVC', '27946': 'SRVC', '27947': 'SRVC', '27948': 'SRVC', '27949': 'SRVC', '27950': 'SRVC', '27953': 'SRVC', '27954': 'SRVC', '27956': 'SRVC', '27957': 'SRVC', '27958': 'SRVC', '27959': 'SRVC', '27960': 'SRVC', '27962': 'SRVC', '27964': 'SRVC', '27965': 'SRVC', '27966': 'SRVC', '27967': 'SRVC', '27968': 'SRVC', '27969': 'SRVC', '27970': 'SRVC', '27972': 'SRVC', '27973': 'SRVC', '27974': 'SRVC', '27976': 'SRVC', '27978': 'SRVC', '27979': 'SRVC', '27980': 'SRVC', '27981': 'SRVC', '27982': 'SRVC', '27983': 'SRVC', '27985': 'SRVC', '27986': 'SRVC', '28001': 'SRVC', '28002': 'SRVC', '28006': 'SRVC', '28007': 'SRVC', '28009': 'SRVC', '28010': 'SRVC', '28012': 'SRVC', '28016': 'SRVC', '28017': 'SRVC', '28018': 'SRVC', '28019': 'SRVC', '28020': 'SRVC', '28021': 'SRVC', '28023': 'SRVC', '28024': 'SRVC', '28025': 'SRVC', '28026': 'SRVC', '28027': 'SRVC', '28031': 'SRVC', '28032': 'SRVC', '28033': 'SRVC', '28034': 'SRVC', '28035': 'SRVC', '28036': 'SRVC', '28037': 'SRVC', '28038': 'SRVC', '28039': 'SRVC', '28040': 'SRVC', '28041': 'SRVC', '28042': 'SRVC', '28043': 'SRVC', '28052': 'SRVC', '28053': 'SRVC', '28054': 'SRVC', '28055': 'SRVC', '28056': 'SRVC', '28070': 'SRVC', '28071': 'SRVC', '28072': 'SRVC', '28073': 'SRVC', '28074': 'SRVC', '28075': 'SRVC', '28076': 'SRVC', '28077': 'SRVC', '28078': 'SRVC', '28079': 'SRVC', '28080': 'SRVC', '28081': 'SRVC', '28082': 'SRVC', '28083': 'SRVC', '28086': 'SRVC', '28088': 'SRVC', '28089': 'SRVC', '28090': 'SRVC', '28091': 'SRVC', '28092': 'SRVC', '28093': 'SRVC', '28097': 'SRVC', '28098': 'SRVC', '28101': 'SRVC', '28102': 'SRVC', '28103': 'SRVC', '28104': 'SRVC', '28105': 'SRVC', '28106': 'SRVC', '28107': 'SRVC', '28108': 'SRVC', '28109': 'SRVC', '28110': 'SRVC', '28111': 'SRVC', '28112': 'SRVC', '28114': 'SRVC', '28115': 'SRVC', '28117': 'SRVC', '28119': 'SRVC', '28120': 'SRVC', '28123': 'SRVC', '28124': 'SRVC', '28125': 'SRVC', '28126': 'SRVC', '28127': 'SRVC', '28128': 'SRVC', '28129': 'SRVC', '28130': 'SRVC', '28133': 'SRVC', '28134': 'SRVC', '28135': 'SRVC', '28136': 'SRVC', '28137': 'SRVC', '28138': 'SRVC', '28139': 'SRVC', '28144': 'SRVC', '28145': 'SRVC', '28146': 'SRVC', '28147': 'SRVC', '28150': 'SRVC', '28151': 'SRVC', '28152': 'SRVC', '28159': 'SRVC', '28160': 'SRVC', '28163': 'SRVC', '28164': 'SRVC', '28166': 'SRVC', '28167': 'SRVC', '28168': 'SRVC', '28169': 'SRVC', '28170': 'SRVC', '28173': 'SRVC', '28174': 'SRVC', '28201': 'SRVC', '28202': 'SRVC', '28203': 'SRVC', '28204': 'SRVC', '28205': 'SRVC', '28206': 'SRVC', '28207': 'SRVC', '28208': 'SRVC', '28209': 'SRVC', '28210': 'SRVC', '28211': 'SRVC', '28212': 'SRVC', '28213': 'SRVC', '28214': 'SRVC', '28215': 'SRVC', '28216': 'SRVC', '28217': 'SRVC', '28218': 'SRVC', '28219': 'SRVC', '28220': 'SRVC', '28221': 'SRVC', '28222': 'SRVC', '28223': 'SRVC', '28224': 'SRVC', '28226': 'SRVC', '28227': 'SRVC', '28228': 'SRVC', '28229': 'SRVC', '28230': 'SRVC', '28231': 'SRVC', '28232': 'SRVC', '28233': 'SRVC', '28234': 'SRVC', '28235': 'SRVC', '28236': 'SRVC', '28237': 'SRVC', '28241': 'SRVC', '28242': 'SRVC', '28243': 'SRVC', '28244': 'SRVC', '28246': 'SRVC', '28247': 'SRVC', '28250': 'SRVC', '28253': 'SRVC', '28254': 'SRVC', '28255': 'SRVC', '28256': 'SRVC', '28258': 'SRVC', '28260': 'SRVC', '28262': 'SRVC', '28263': 'SRVC', '28265': 'SRVC', '28266': 'SRVC', '28269': 'SRVC', '28270': 'SRVC', '28271': 'SRVC', '28272': 'SRVC', '28273': 'SRVC', '28274': 'SRVC', '28275': 'SRVC', '28277': 'SRVC', '28278': 'SRVC', '28280': 'SRVC', '28281': 'SRVC', '28282': 'SRVC', '28284': 'SRVC', '28285': 'SRVC', '28287': 'SRVC', '28288': 'SRVC', '28289': 'SRVC', '28290': 'SRVC', '28296': 'SRVC', '28297': 'SRVC', '28299': 'SRVC', '28301': 'SRVC', '28302': 'SRVC', '28303': 'SRVC', '28304': 'SRVC', '28305': 'SRVC', '28306': 'SRVC', '28307': 'SRVC', '28308': 'SRVC', '28309': 'SRVC', '28310': 'SRVC', '28311': 'SRVC', '28312': 'SRVC', '28314': 'SRVC', '28315': 'SRVC', '28318': 'SRVC', '28319': 'SRVC', '28320': 'SRVC', '28323': 'SRVC', '28325': 'SRVC', '28326': 'SRVC', '28327': 'SRVC', '28328': 'SRVC', '28329': 'SRVC', '28330': 'SRVC', '28331': 'SRVC', '28332': 'SRVC', '28333': 'SRVC', '28334': 'SRVC', '28335': 'SRVC', '28337': 'SRVC', '28338': 'SRVC', '28339': 'SRVC', '28340': 'SRVC', '28341': 'SRVC', '28342': 'SRVC', '28343': 'SRVC', '28344': 'SRVC', '28345': 'SRVC', '28347': 'SRVC', '28348': 'SRVC', '28349': 'SRVC', '28350': 'SRVC', '28351': 'SRVC', '28352': 'SRVC', '28353': 'SRVC', '28355': 'SRVC', '28356': 'SRVC', '28357': 'SRVC', '28358': 'SRVC', '28359': 'SRVC', '28360': 'SRVC', '28362': 'SRVC', '28363': 'SRVC', '28364': 'SRVC', '28365': 'SRVC', '28366': 'SRVC', '28367': 'SRVC', '28368': 'SRVC', '28369': 'SRVC', '28370': 'SRVC', '28371': 'SRVC', '28372': 'SRVC', '28373': 'SRVC', '28374': 'SRVC', '28375': 'SRVC', '28376': 'SRVC', '28377': 'SRVC', '28378': 'SRVC', '28379': 'SRVC', '28380': 'SRVC', '28382': 'SRVC', '28383': 'SRVC', '28384': 'SRVC', '28385': 'SRVC', '28386': 'SRVC', '28387': 'SRVC', '28388': 'SRVC', '28390': 'SRVC', '28391': 'SRVC', '28392': 'SRVC', '28393': 'SRVC', '28394': 'SRVC', '28395': 'SRVC', '28396': 'SRVC', '28398': 'SRVC', '28399': 'SRVC', '28401': 'SRVC', '28402': 'SRVC', '28403': 'SRVC', '28404': 'SRVC', '28405': 'SRVC', '28406': 'SRVC', '28407': 'SRVC', '28408': 'SRVC', '28409': 'SRVC', '28410': 'SRVC', '28411': 'SRVC', '28412': 'SRVC', '28420': 'SRVC', '28421': 'SRVC', '28422': 'SRVC', '28423': 'SRVC', '28424': 'SRVC', '28425': 'SRVC', '28428': 'SRVC', '28429': 'SRVC', '28430': 'SRVC', '28431': 'SRVC', '28432': 'SRVC', '28433': 'SRVC', '28434': 'SRVC', '28435': 'SRVC', '28436': 'SRVC', '28438': 'SRVC', '28439': 'SRVC', '28441': 'SRVC', '28442': 'SRVC', '28443': 'SRVC', '28444': 'SRVC', '28445': 'SRVC', '28447': 'SRVC', '28448': 'SRVC', '28449': 'SRVC', '28450': 'SRVC', '28451': 'SRVC', '28452': 'SRVC', '28453': 'SRVC', '28454': 'SRVC', '28455': 'SRVC', '28456': 'SRVC', '28457': 'SRVC', '28458': 'SRVC', '28459': 'SRVC', '28460': 'SRVC', '28461': 'SRVC', '28462': 'SRVC', '28463': 'SRVC', '28464': 'SRVC', '28465': 'SRVC', '28466': 'SRVC', '28467': 'SRVC', '28468': 'SRVC', '28469': 'SRVC', '28470': 'SRVC', '28472': 'SRVC', '28478': 'SRVC', '28479': 'SRVC', '28480': 'SRVC', '28501': 'SRVC', '28502': 'SRVC', '28503': 'SRVC', '28504': 'SRVC', '28508': 'SRVC', '28509': 'SRVC', '28510': 'SRVC', '28511': 'SRVC', '28512': 'SRVC', '28513': 'SRVC', '28515': 'SRVC', '28516': 'SRVC', '28518': 'SRVC', '28519': 'SRVC', '28520': 'SRVC', '28521': 'SRVC', '28522': 'SRVC', '28523': 'SRVC', '28524': 'SRVC', '28525': 'SRVC', '28526': 'SRVC', '28527': 'SRVC', '28528': 'SRVC', '28529': 'SRVC', '28530': 'SRVC', '28531': 'SRVC', '28532': 'SRVC', '28533': 'SRVC', '28537': 'SRVC', '28538': 'SRVC', '28539': 'SRVC', '28540': 'SRVC', '28541': 'SRVC', '28542': 'SRVC', '28543': 'SRVC', '28544': 'SRVC', '28545': 'SRVC', '28546': 'SRVC', '28547': 'SRVC', '28551': 'SRVC', '28552': 'SRVC', '28553': 'SRVC', '28554': 'SRVC', '28555': 'SRVC', '28556': 'SRVC', '28557': 'SRVC', '28560': 'SRVC', '28561': 'SRVC', '28562': 'SRVC', '28563': 'SRVC', '28564': 'SRVC', '28570': 'SRVC', '28571': 'SRVC', '28572': 'SRVC', '28573': 'SRVC', '28574': 'SRVC', '28575': 'SRVC', '28577': 'SRVC', '28578': 'SRVC', '28579': 'SRVC', '28580': 'SRVC', '28581': 'SRVC', '28582': 'SRVC', '28583': 'SRVC', '28584': 'SRVC', '28585': 'SRVC', '28586': 'SRVC', '28587': 'SRVC', '28589': 'SRVC', '28590': 'SRVC', '28594': 'SRVC', '28601': 'SRVC', '28602': 'SRVC', '28603': 'SRVC', '28604': 'SRVC', '28605': 'SRVC', '28606': 'SRVC', '28607': 'SRVC', '28608': 'SRVC', '28609': 'SRVC', '28610': 'SRVC', '28611': 'SRVC', '28612': 'SRVC', '28613': 'SRVC', '28615': 'SRVC', '28616': 'SRTV', '28617': 'SRVC', '28618': 'SRVC', '28619': 'SRVC', '28621': 'SRVC', '28622': 'SRVC', '28623': 'SRVC', '28624': 'SRVC', '28625': 'SRVC', '28626': 'SRVC', '28627': 'SRVC', '28628': 'SRVC', '28629': 'SRVC', '28630': 'SRVC', '28631': 'SRVC', '28633': 'SRVC', '28634': 'SRVC', '28635': 'SRVC', '28636': 'SRVC', '28637': 'SRVC', '28638': 'SRVC', '28640': 'SRVC', '28641': 'SRVC', '28642': 'SRVC', '28643': 'SRVC', '28644': 'SRVC', '28645': 'SRVC', '28646': 'SRVC', '28647': 'SRVC', '28649': 'SRVC', '28650': 'SRVC', '28651': 'SRVC', '28652': 'SRTV', '28653': 'SRTV', '28654': 'SRVC', '28655': 'SRVC', '28656': 'SRVC', '28657': 'SRVC', '28658': 'SRVC', '28659': 'SRVC', '28660': 'SRVC', '28661': 'SRVC', '28662': 'SRTV', '28663': 'SRVC', '28664': 'SRTV', '28665': 'SRVC', '28666': 'SRVC', '28667': 'SRVC', '28668': 'SRVC', '28669': 'SRVC', '28670': 'SRVC', '28671': 'SRVC', '28672': 'SRVC', '28673': 'SRVC', '28675': 'SRVC', '28676': 'SRVC', '28677': 'SRVC', '28678': 'SRVC', '28679': 'SRVC', '28680': 'SRVC', '28681': 'SRVC', '28682': 'SRVC', '28683': 'SRVC', '28684': 'SRVC', '28685': 'SRVC', '28687': 'SRVC', '28688': 'SRVC', '28689': 'SRVC', '28690': 'SRVC', '28691': 'SRVC', '28692': 'SRVC', '28693': 'SRVC', '28694': 'SRVC', '28697': 'SRVC', '28698': 'SRVC', '28699': 'SRVC', '28701': 'SRVC', '28702': 'SRTV', '28704': 'SRVC', '28705': 'SRVC', '28707': 'SRVC', '28708': 'SRVC', '28709': 'SRVC', '28710': 'SRVC', '28711': 'SRVC', '28712': 'SRVC', '28713': 'SRVC', '28714': 'SRVC', '28715': 'SRVC', '28716': 'SRVC', '28717': 'SRTV', '28718': 'SRVC', '28719': 'SRVC', '28720': 'SRVC', '28721': 'SRVC', '28722': 'SRVC', '28723': 'SRVC', '28724': 'SRVC', '28725': 'SRVC', '28726': 'SRVC', '28727': 'SRVC', '28728': 'SRVC', '28729': 'SRVC', '28730': 'SRVC', '28731': 'SRVC', '28732': 'SRVC', '28733': 'SRVC', '28734': 'SRVC', '28735': 'SRVC', '28736': 'SRVC', '28737': 'SRVC', '28738': 'SRVC', '28739': 'SRVC', '28740': 'SRVC', '28741': 'SRTV', '28742': 'SRVC', '28743': 'SRVC', '28744': 'SRVC', '28745': 'SRVC', '28746': 'SRVC', '28747': 'SRVC', '28748': 'SRVC', '28749': 'SRVC', '28750': 'SRVC', '28751': 'SRVC', '28752': 'SRVC', '28753': 'SRVC', '28754': 'SRVC', '28755': 'SRVC', '28756': 'SRVC', '28757': 'SRVC', '28758': 'SRVC', '28759': 'SRVC', '28760': 'SRVC', '28761': 'SRVC', '28762': 'SRVC', '28763': 'SRVC', '28765': 'SRTV', '28766': 'SRVC', '28768': 'SRVC', '28770': 'SRVC', '28771': 'SRVC', '28772': 'SRVC', '28773': 'SRVC', '28774': 'SRVC', '28775': 'SRTV', '28776': 'SRVC', '28777': 'SRVC', '28778': 'SRVC', '28779': 'SRVC', '28781': 'SRVC', '28782': 'SRVC', '28783': 'SRVC', '28784': 'SRVC', '28785': 'SRVC', '28786': 'SRVC', '28787': 'SRVC', '28788': 'SRVC', '28789': 'SRVC', '28790': 'SRVC', '28791': 'SRVC', '28792': 'SRVC', '28793': 'SRVC', '28801': 'SRVC', '28802': 'SRVC', '28803': 'SRVC', '28804': 'SRVC', '28805': 'SRVC', '28806': 'SRVC', '28810': 'SRVC', '28813': 'SRVC', '28814': 'SRVC', '28815': 'SRVC', '28816': 'SRVC', '28901': 'SRVC', '28902': 'SRTV', '28903': 'SRTV', '28904': 'SRTV', '28905': 'SRVC', '28906': 'SRTV', '28909': 'SRTV', '29001': 'SRVC', '29002': 'SRVC', '29003': 'SRVC', '29006': 'SRVC', '29009': 'SRVC', '29010': 'SRVC', '29014': 'SRVC', '29015': 'SRVC', '29016': 'SRVC', '29018': 'SRVC', '29020': 'SRVC', '29021': 'SRVC', '29030': 'SRVC', '29031': 'SRVC', '29032': 'SRVC', '29033': 'SRVC', '29036': 'SRVC', '29037': 'SRVC', '29038': 'SRVC', '29039': 'SRVC', '29040': 'SRVC', '29041': 'SRVC', '29042': 'SRVC', '29044': 'SRVC', '29045': 'SRVC', '29046': 'SRVC', '29047': 'SRVC', '29048': 'SRVC', '29051': 'SRVC', '29052': 'SRVC', '29053': 'SRVC', '29054': 'SRVC', '29055': 'SRVC', '29056': 'SRVC', '29058': 'SRVC', '29059': 'SRVC', '29061': 'SRVC', '29062': 'SRVC', '29063': 'SRVC', '29065': 'SRVC', '29067': 'SRVC', '29069': 'SRVC', '29070': 'SRVC', '29071': 'SRVC', '29072': 'SRVC', '29073': 'SRVC', '29074': 'SRVC', '29075': 'SRVC', '29078': 'SRVC', '29079': 'SRVC', '29080': 'SRVC', '29081': 'SRVC', '29082': 'SRVC', '29101': 'SRVC', '29102': 'SRVC', '29104': 'SRVC', '29105': 'SRVC', '29107': 'SRVC', '29108': 'SRVC', '29111': 'SRVC', '29112': 'SRVC', '29113': 'SRVC', '29114': 'SRVC', '29115': 'SRVC', '29116': 'SRVC', '29117': 'SRVC', '29118': 'SRVC', '29122': 'SRVC', '29123': 'SRVC', '29125': 'SRVC', '29126': 'SRVC', '29127': 'SRVC', '29128': 'SRVC', '29129': 'SRVC', '29130': 'SRVC', '29132': 'SRVC', '29133': 'SRVC', '29135': 'SRVC', '29137': 'SRVC', '29138': 'SRVC', '29142': 'SRVC', '29143': 'SRVC', '29145': 'SRVC', '29146': 'SRVC', '29147': 'SRVC', '29148': 'SRVC', '29150': 'SRVC', '29151': 'SRVC', '29152': 'SRVC', '29153': 'SRVC', '29154': 'SRVC', '29160': 'SRVC', '29161': 'SRVC', '29162': 'SRVC', '29163': 'SRVC', '29164': 'SRVC', '29166': 'SRVC', '29168': 'SRVC', '29169': 'SRVC', '29170': 'SRVC', '29171': 'SRVC', '29172': 'SRVC', '29175': 'SRVC', '29177': 'SRVC', '29178': 'SRVC', '29180': 'SRVC', '29201': 'SRVC', '29202': 'SRVC', '29203': 'SRVC', '29204': 'SRVC', '29205': 'SRVC', '29206': 'SRVC', '29207': 'SRVC', '29208': 'SRVC', '29209': 'SRVC', '29210': 'SRVC', '29211': 'SRVC', '29212': 'SRVC', '29214': 'SRVC', '29215': 'SRVC', '29216': 'SRVC', '29217': 'SRVC', '29218': 'SRVC', '29219': 'SRVC', '29220': 'SRVC', '29221': 'SRVC', '29222': 'SRVC', '29223': 'SRVC', '29224': 'SRVC', '29225': 'SRVC', '29226': 'SRVC', '29227': 'SRVC', '29228': 'SRVC', '29229': 'SRVC', '29230': 'SRVC', '29240': 'SRVC', '29250': 'SRVC', '29260': 'SRVC', '29290': 'SRVC', '29292': 'SRVC', '29301': 'SRVC', '29302': 'SRVC', '29303': 'SRVC', '29304': 'SRVC', '29305': 'SRVC', '29306': 'SRVC', '29307': 'SRVC', '29316': 'SRVC', '29318': 'SRVC', '29319': 'SRVC', '29320': 'SRVC', '29321': 'SRVC', '29322': 'SRVC', '29323': 'SRVC', '29324': 'SRVC', '29325': 'SRVC', '29329': 'SRVC', '29330': 'SRVC', '29331': 'SRVC', '29332': 'SRVC', '29333': 'SRVC', '29334': 'SRVC', '29335': 'SRVC', '29336': 'SRVC', '29338': 'SRVC', '29340': 'SRVC', '29341': 'SRVC', '29342': 'SRVC', '29346': 'SRVC', '29348': 'SRVC', '29349': 'SRVC', '29351': 'SRVC', '29353': 'SRVC', '29355': 'SRVC', '29356': 'SRVC', '29360': 'SRVC', '29364': 'SRVC', '29365': 'SRVC', '29368': 'SRVC', '29369': 'SRVC', '29370': 'SRVC', '29372': 'SRVC', '29373': 'SRVC', '29374': 'SRVC', '29375': 'SRVC', '29376': 'SRVC', '29377': 'SRVC', '29378': 'SRVC', '29379': 'SRVC', '29384': 'SRVC', '29385': 'SRVC', '29386': 'SRVC', '29388': 'SRVC', '29390': 'SRVC', '29391': 'SRVC', '29395': 'SRVC', '29401': 'SRVC', '29402': 'SRVC', '29403': 'SRVC', '29404': 'SRVC', '29405': 'SRVC', '29406': 'SRVC', '29407': 'SRVC', '29409': 'SRVC', '29410': 'SRVC', '29412': 'SRVC', '29413': 'SRVC', '29414': 'SRVC', '29415': 'SRVC', '29416': 'SRVC', '29417': 'SRVC', '29418': 'SRVC', '29419': 'SRVC', '29420': 'SRVC', '29422': 'SRVC', '29423': 'SRVC', '29424': 'SRVC', '29425': 'SRVC', '29426': 'SRVC', '29429': 'SRVC', '29430': 'SRVC', '29431': 'SRVC', '29432': 'SRVC', '29433': 'SRVC', '29434': 'SRVC', '29435': 'SRVC', '29436': 'SRVC', '29437': 'SRVC', '29438': 'SRVC', '29439': 'SRVC', '29440': 'SRVC', '29442': 'SRVC', '29445': 'SRVC', '29446': 'SRVC', '29447': 'SRVC', '29448': 'SRVC', '29449': 'SRVC', '29450': 'SRVC', '29451': 'SRVC', '29452': 'SRVC', '29453': 'SRVC', '29455': 'SRVC', '29456': 'SRVC', '29457': 'SRVC', '29458': 'SRVC', '29461': 'SRVC', '29464': 'SRVC', '29465': 'SRVC', '29466': 'SRVC', '29468': 'SRVC', '29469': 'SRVC', '29470': 'SRVC', '29471': 'SRVC', '29472': 'SRVC', '29474': 'SRVC', '29475': 'SRVC', '29476': 'SRVC', '29477': 'SRVC', '29479': 'SRVC', '29481': 'SRVC', '29482': 'SRVC', '29483': 'SRVC', '29484': 'SRVC', '29485': 'SRVC', '29486': 'SRVC', '29487': 'SRVC', '29488': 'SRVC', '29492': 'SRVC', '29493': 'SRVC', '29501': 'SRVC', '29502': 'SRVC', '29503': 'SRVC', '29504': 'SRVC', '29505': 'SRVC', '29506': 'SRVC', '29510': 'SRVC', '29511': 'SRVC', '29512': 'SRVC', '29516': 'SRVC', '29518': 'SRVC', '29519': 'SRVC', '29520': 'SRVC', '29525': 'SRVC', '29526': 'SRVC', '29527': 'SRVC', '29528': 'SRVC', '29530': 'SRVC', '29532': 'SRVC', '29536': 'SRVC', '29540': 'SRVC', '29541': 'SRVC', '29543': 'SRVC', '29544': 'SRVC', '29545': 'SRVC', '29546': 'SRVC', '29547': 'SRVC', '29550': 'SRVC', '29551': 'SRVC', '29554': 'SRVC', '29555': 'SRVC', '29556': 'SRVC', '29560': 'SRVC', '29563': 'SRVC', '29564': 'SRVC', '29565': 'SRVC', '29566': 'SRVC', '29567': 'SRVC', '29568': 'SRVC', '29569': 'SRVC', '29570': 'SRVC', '29571': 'SRVC', '29572': 'SRVC', '29573': 'SRVC', '29574': 'SRVC', '29575': 'SRVC', '29576': 'SRVC', '29577': 'SRVC', '29578': 'SRVC', '29579': 'SRVC', '29580': 'SRVC', '29581': 'SRVC', '29582': 'SRVC', '29583': 'SRVC', '29584': 'SRVC', '29585': 'SRVC', '29587': 'SRVC', '29588': 'SRVC', '29589': 'SRVC', '29590': 'SRVC', '29591': 'SRVC', '29592': 'SRVC', '29593': 'SRVC', '29594': 'SRVC', '29596': 'SRVC', '29597': 'SRVC', '29598': 'SRVC', '29601': 'SRVC', '29602': 'SRVC', '29603': 'SRVC', '29604': 'SRVC', '29605': 'SRVC', '29606': 'SRVC', '29607': 'SRVC', '29608': 'SRVC', '29609': 'SRVC', '29610': 'SRVC', '29611': 'SRVC', '29612': 'SRVC', '29613': 'SRVC', '29614': 'SRVC', '29615': 'SRVC', '29616': 'SRVC', '29617': 'SRVC', '29620': 'SRVC', '29621': 'SRVC', '29622': 'SRVC', '29623': 'SRVC', '29624': 'SRVC', '29625': 'SRVC', '29626': 'SRVC', '29627': 'SRVC', '29628': 'SRVC', '29630': 'SRVC', '29631': 'SRVC', '29632': 'SRVC', '29633': 'SRVC', '29634': 'SRVC', '29635': 'SRVC', '29636': 'SRVC', '29638': 'SRVC', '29639': 'SRVC', '29640': 'SRVC', '29641': 'SRVC', '29642': 'SRVC', '29643': 'SRVC', '29644': 'SRVC', '29645': 'SRVC', '29646': 'SRVC', '29647': 'SRVC', '29648': 'SRVC', '29649': 'SRVC', '29650': 'SRVC', '29651': 'SRVC', '29652': 'SRVC', '29653': 'SRVC', '29654': 'SRVC', '29655': 'SRVC', '29656': 'SRVC', '29657': 'SRVC', '29658': 'SRVC', '29659': 'SRVC', '29661': 'SRVC', '29662': 'SRVC', '29664': 'SRVC', '29665': 'SRVC', '29666': 'SRVC', '29667': 'SRVC', '29669': 'SRVC', '29670': 'SRVC', '29671': 'SRVC', '29672': 'SRVC', '29673': 'SRVC', '29675': 'SRVC', '29676': 'SRVC', '29677': 'SRVC', '29678': 'SRVC', '29679': 'SRVC', '29680': 'SRVC', '29681': 'SRVC', '29682': 'SRVC', '29683': 'SRVC', '29684': 'SRVC', '29685': 'SRVC', '29686': 'SRVC', '29687': 'SRVC', '29688': 'SRVC', '29689': 'SRVC', '29690': 'SRVC', '29691': 'SRVC', '29692': 'SRVC', '29693': 'SRVC', '29695': 'SRVC', '29696': 'SRVC', '29697': 'SRVC', '29698': 'SRVC', '29702': 'SRVC', '29703': 'SRVC', '29704': 'SRVC', '29706': 'SRVC', '29707': 'SRVC', '29708': 'SRVC', '29709': 'SRVC', '29710': 'SRVC', '29712': 'SRVC', '29714': 'SRVC', '29715': 'SRVC', '29716': 'SRVC', '29717': 'SRVC', '29718': 'SRVC', '29720': 'SRVC', '29721': 'SRVC', '29722': 'SRVC', '29724': 'SRVC', '29726': 'SRVC', '29727': 'SRVC', '29728': 'SRVC', '29729': 'SRVC', '29730': 'SRVC', '29731': 'SRVC', '29732': 'SRVC', '29733': 'SRVC', '29734': 'SRVC', '29741': 'SRVC', '29742': 'SRVC', '29743': 'SRVC', '29744': 'SRVC', '29745': 'SRVC', '29801': 'SRVC', '29802': 'SRVC', '29803': 'SRVC', '29804': 'SRVC', '29805': 'SRVC', '29808': 'SRVC', '29809': 'SRVC', '29810': 'SRVC', '29812': 'SRVC', '29813': 'SRVC', '29816': 'SRVC', '29817': 'SRVC', '29819': 'SRVC', '29821': 'SRVC', '29822': 'SRVC', '29824': 'SRVC', '29826': 'SRVC', '29827': 'SRVC', '29828': 'SRVC', '29829': 'SRVC', '29831': 'SRVC', '29832': 'SRVC', '29834': 'SRVC', '29835': 'SRVC', '29836': 'SRVC', '29838': 'SRVC', '29839': 'SRVC', '29840': 'SRVC', '29841': 'SRVC', '29842': 'SRVC', '29843': 'SRVC', '29844': 'SRVC', '29845': 'SRVC', '29846': 'SRVC', '29847': 'SRVC', '29848': 'SRVC', '29849': 'SRVC', '29850': 'SRVC', '29851': 'SRVC', '29853': 'SRVC', '29856': 'SRVC', '29860': 'SRVC', '29861': 'SRVC', '29899': 'SRVC', '29901': 'SRVC', '29902': 'SRVC', '29903': 'SRVC', '29904': 'SRVC', '29905': 'SRVC', '29906': 'SRVC', '29907': 'SRVC', '29909': 'SRVC', '29910': 'SRVC', '29911': 'SRVC', '29912': 'SRVC', '29913': 'SRVC', '29914': 'SRVC', '29915': 'SRVC', '29916': 'SRVC', '29918': 'SRVC', '29920': 'SRVC', '29921': 'SRVC', '29922': 'SRVC', '29923': 'SRVC', '29924': 'SRVC', '29925': 'SRVC', '29926': 'SRVC', '29927': 'SRVC', '29928': 'SRVC', '29929': 'SRVC', '29931': 'SRVC', '29932': 'SRVC', '29933': 'SRVC', '29934': 'SRVC', '29935': 'SRVC', '29936': 'SRVC', '29938': 'SRVC', '29939': 'SRVC', '29940': 'SRVC', '29941': 'SRVC', '29943': 'SRVC', '29944': 'SRVC', '29945': 'SRVC', '30002': 'SRSO', '30003': 'SRSO', '30004': 'SRSO', '30005': 'SRSO', '30006': 'SRSO', '30007': 'SRSO', '30008': 'SRSO', '30009': 'SRSO', '30010': 'SRSO', '30011': 'SRSO', '30012': 'SRSO', '30013': 'SRSO', '30014': 'SRSO', '30015': 'SRSO', '30016': 'SRSO', '30017': 'SRSO', '30018': 'SRSO', '30019': 'SRSO', '30021': 'SRSO', '30022': 'SRSO', '30023': 'SRSO', '30024': 'SRSO', '30025': 'SRSO', '30026': 'SRSO', '30028': 'SRSO', '30029': 'SRSO', '30030': 'SRSO', '30031': 'SRSO', '30032': 'SRSO', '30033': 'SRSO', '30034': 'SRSO', '30035': 'SRSO', '30036': 'SRSO', '30037': 'SRSO', '30038': 'SRSO', '30039': 'SRSO', '30040': 'SRSO', '30041': 'SRSO', '30042': 'SRSO', '30043': 'SRSO', '30044': 'SRSO', '30045': 'SRSO', '30046': 'SRSO', '30047': 'SRSO', '30048': 'SRSO', '30049': 'SRSO', '30052': 'SRSO', '30054': 'SRSO', '30055': 'SRSO', '30056': 'SRSO', '30058': 'SRSO', '30060': 'SRSO', '30061': 'SRSO', '30062': 'SRSO', '30063': 'SRSO', '30064': 'SRSO', '30065': 'SRSO', '30066': 'SRSO', '30067': 'SRSO', '30068': 'SRSO', '30069': 'SRSO', '30070': 'SRSO', '30071': 'SRSO', '30072': 'SRSO', '30074': 'SRSO', '30075': 'SRSO', '30076': 'SRSO', '30077': 'SRSO', '30078': 'SRSO', '30079': 'SRSO', '30080': 'SRSO', '30081': 'SRSO', '30082': 'SRSO', '30083': 'SRSO', '30084': 'SRSO', '30085': 'SRSO', '30086': 'SRSO', '30087': 'SRSO', '30088': 'SRSO', '30090': 'SRSO', '30091': 'SRSO', '30092': 'SRSO', '30093': 'SRSO', '30094': 'SRSO', '30095': 'SRSO', '30096': 'SRSO', '30097': 'SRSO', '30098': 'SRSO', '30099': 'SRSO', '30101': 'SRSO', '30102': 'SRSO', '30103': 'SRSO', '30104': 'SRSO', '30105': 'SRSO', '30106': 'SRSO', '30107': 'SRSO', '30108': 'SRSO', '30109': 'SRSO', '30110': 'SRSO', '30111': 'SRSO', '30112': 'SRSO', '30113': 'SRSO', '30114': 'SRSO', '30115': 'SRSO', '30116': 'SRSO', '30117': 'SRSO', '30118': 'SRSO', '30119': 'SRSO', '30120': 'SRSO', '30121': 'SRSO', '30122': 'SRSO', '30123': 'SRSO', '30124': 'SRSO', '30125': 'SRSO', '30126': 'SRSO', '30127': 'SRSO', '30129': 'SRSO', '30132': 'SRSO', '30133': 'SRSO', '30134': 'SRSO', '30135': 'SRSO', '30137': 'SRSO', '30138': 'SRSO', '30139': 'SRSO', '30140': 'SRSO', '30141': 'SRSO', '30142': 'SRSO', '30143': 'SRSO', '30144': 'SRSO', '30145': 'SRSO', '30146': 'SRSO', '30147': 'SRSO', '30148': 'SRSO', '30149': 'SRSO', '30150': 'SRSO', '30151': 'SRSO', '30152': 'SRSO', '30153': 'SRSO', '30154': 'SRSO', '30156': 'SRSO', '30157': 'SRSO', '30160': 'SRSO', '30161': 'SRSO', '30162': 'SRSO', '30163': 'SRSO', '30164': 'SRSO', '30165': 'SRSO', '30168': 'SRSO', '30169': 'SRSO', '30170': 'SRSO', '30171': 'SRSO', '30172': 'SRSO', '30173': 'SRSO', '30175': 'SRSO', '30176': 'SRSO', '30177': 'SRSO', '30178': 'SRSO', '30179': 'SRSO', '30180': 'SRSO', '30182': 'SRSO', '30183': 'SRSO', '30184': 'SRSO', '30185': 'SRSO', '30187': 'SRSO', '30188': 'SRSO', '30189': 'SRSO', '30204': 'SRSO', '30205': 'SRSO', '30206': 'SRSO', '30212': 'SRSO', '30213': 'SRSO', '30214': 'SRSO', '30215': 'SRSO', '30216': 'SRSO', '30217': 'SRSO', '30218': 'SRSO', '30219': 'SRSO', '30220': 'SRSO', '30222': 'SRSO', '30223': 'SRSO', '30224': 'SRSO', '30228': 'SRSO', '30229': 'SRSO', '30230': 'SRSO', '30233': 'SRSO', '30234': 'SRSO', '30236': 'SRSO', '30237': 'SRSO', '30238': 'SRSO', '30240': 'SRSO', '30241': 'SRSO', '30248': 'SRSO', '30250': 'SRSO', '30251': 'SRSO', '30252': 'SRSO', '30253': 'SRSO', '30256': 'SRSO', '30257': 'SRSO', '30258': 'SRSO', '30259': 'SRSO', '30260': 'SRSO', '30261': 'SRSO', '30263': 'SRSO', '30264': 'SRSO', '30265': 'SRSO', '30266': 'SRSO', '30268': 'SRSO', '30269': 'SRSO', '30270': 'SRSO', '30271': 'SRSO', '30272': 'SRSO', '30273': 'SRSO', '30274': 'SRSO', '30275': 'SRSO', '30276': 'SRSO', '30277': 'SRSO', '30281': 'SRSO', '30284': 'SRSO', '30285': 'SRSO', '30286': 'SRSO', '30287': 'SRSO', '30288': 'SRSO', '30289': 'SRSO', '30290': 'SRSO', '30291': 'SRSO', '30292': 'SRSO', '30293': 'SRSO', '30294': 'SRSO', '30295': 'SRSO', '30296': 'SRSO', '30297': 'SRSO', '30298': 'SRSO', '30301': 'SRSO', '30302': 'SRSO', '30303': 'SRSO', '30304': 'SRSO', '30305': 'SRSO', '30306': 'SRSO', '30307': 'SRSO', '30308': 'SRSO', '30309': 'SRSO', '30310': 'SRSO', '30311': 'SRSO', '30312': 'SRSO', '30313': 'SRSO', '30314': 'SRSO', '30315': 'SRSO', '30316': 'SRSO', '30317': 'SRSO', '30318': 'SRSO', '30319': 'SRSO', '30320': 'SRSO', '30321': 'SRSO', '30322': 'SRSO', '30324': 'SRSO', '30325': 'SRSO', '30326': 'SRSO', '30327': 'SRSO', '30328': 'SRSO', '30329': 'SRSO', '30330': 'SRSO', '30331': 'SRSO', '30332': 'SRSO', '30333': 'SRSO', '30334': 'SRSO', '30336': 'SRSO', '30337': 'SRSO', '30338': 'SRSO', '30339': 'SRSO', '30340': 'SRSO', '30341': 'SRSO', '30342': 'SRSO', '30343': 'SRSO', '30344': 'SRSO', '30345': 'SRSO', '30346': 'SRSO', '30347': 'SRSO', '30348': 'SRSO', '30349': 'SRSO', '30350': 'SRSO', '30353': 'SRSO', '30354': 'SRSO', '30355': 'SRSO', '30356': 'SRSO', '30357': 'SRSO', '30358': 'SRSO', '30359': 'SRSO', '30360': 'SRSO', '30361': 'SRSO', '30362': 'SRSO', '30363': 'SRSO', '30364': 'SRSO', '30366': 'SRSO', '30368': 'SRSO', '30369': 'SRSO', '30370': 'SRSO', '30371': 'SRSO', '30374': 'SRSO', '30375': 'SRSO', '30376': 'SRSO', '30377': 'SRSO', '30378': 'SRSO', '30379': 'SRSO', '30380': 'SRSO', '30384': 'SRSO', '30385': 'SRSO', '30388': 'SRSO', '30390': 'SRSO', '30392': 'SRSO', '30394': 'SRSO', '30396': 'SRSO', '30398': 'SRSO', '30401': 'SRSO', '30410': 'SRSO', '30411': 'SRSO', '30412': 'SRSO', '30413': 'SRSO', '30414': 'SRSO', '30415': 'SRSO', '30417': 'SRSO', '30420': 'SRSO', '30421': 'SRSO', '30423': 'SRSO', '30424': 'SRSO', '30425': 'SRSO', '30426': 'SRSO', '30427': 'SRSO', '30428': 'SRSO', '30429': 'SRSO', '30434': 'SRSO', '30436': 'SRSO', '30438': 'SRSO', '30439': 'SRSO', '30441': 'SRSO', '30442': 'SRSO', '30445': 'SRSO', '30446': 'SRSO', '30447': 'SRSO', '30448': 'SRSO', '30449': 'SRSO', '30450': 'SRSO', '30451': 'SRSO', '30452': 'SRSO', '30453': 'SRSO', '30454': 'SRSO', '30455': 'SRSO', '30456': 'SRSO', '30457': 'SRSO', '30458': 'SRSO', '30459': 'SRSO', '30460': 'SRSO', '30461': 'SRSO', '30464': 'SRSO', '30467': 'SRSO', '30470': 'SRSO', '30471': 'SRSO', '30473': 'SRSO', '30474': 'SRSO', '30475': 'SRSO', '30477': 'SRSO', '30499': 'SRSO', '30501': 'SRSO', '30502': 'SRSO', '30503': 'SRSO', '30504': 'SRSO', '30506': 'SRSO', '30507': 'SRSO', '30510': 'SRSO', '30511': 'SRSO', '30512': 'SRSO', '30513': 'SRSO', '30514': 'SRTV', '30515': 'SRSO', '30516': 'SRSO', '30517': 'SRSO', '30518': 'SRSO', '30519': 'SRSO', '30520': 'SRSO', '30521': 'SRSO', '30522': 'SRSO', '30523': 'SRTV', '30525': 'SRTV', '30527': 'SRSO', '30528': 'SRSO', '30529': 'SRSO', '30530': 'SRSO', '30531': 'SRSO', '30533': 'SRSO', '30534': 'SRSO', '30535': 'SRSO', '30536': 'SRSO', '30537': 'SRTV', '30538': 'SRSO', '30539': 'SRSO', '30540': 'SRSO', '30541': 'SRSO', '30542': 'SRSO', '30543': 'SRSO', '30544': 'SRSO', '30545': 'SRSO', '30546': 'SRTV', '30547': 'SRSO', '30548': 'SRSO', '30549': 'SRSO', '30552': 'SRSO', '30553': 'SRSO', '30554': 'SRSO', '30555': 'SRSO', '30557': 'SRSO', '30558': 'SRSO', '30559': 'SRTV', '30560': 'SRTV', '30562': 'SRSO', '30563': 'SRSO', '30564': 'SRSO', '30565': 'SRSO', '30566': 'SRSO', '30567': 'SRSO', '30568': 'SRSO', '30571': 'SRSO', '30572': 'SRSO', '30573': 'SRSO', '30575': 'SRSO', '30576': 'SRSO', '30577': 'SRSO', '30580': 'SRSO', '30581': 'SRSO', '30582': 'SRTV', '30597': 'SRSO', '30598': 'SRSO', '30599': 'SRSO', '30601': 'SRSO', '30602': 'SRSO', '30603': 'SRSO', '30604': 'SRSO', '30605': 'SRSO', '30606': 'SRSO', '30607': 'SRSO', '30608': 'SRSO', '30609': 'SRSO', '30612': 'SRSO', '30619': 'SRSO', '30620': 'SRSO', '30621': 'SRSO', '30622': 'SRSO', '30623': 'SRSO', '30624': 'SRSO', '30625': 'SRSO', '30627': 'SRSO', '30628': 'SRSO', '30629': 'SRSO', '30630': 'SRSO', '30631': 'SRSO', '30633': 'SRSO', '30634': 'SRSO', '30635': 'SRSO', '30638': 'SRSO', '30639': 'SRSO', '30641': 'SRSO', '30642': 'SRSO', '30643': 'SRSO', '30645': 'SRSO', '30646': 'SRSO', '30647': 'SRSO', '30648': 'SRSO', '30650': 'SRSO', '30655': 'SRSO', '30656': 'SRSO', '30660': 'SRSO', '30662': 'SRSO', '30663': 'SRSO', '30664': 'SRSO', '30665': 'SRSO', '30666': 'SRSO', '30667': 'SRSO', '30668': 'SRSO', '30669': 'SRSO', '30671': 'SRSO', '30673': 'SRSO', '30677': 'SRSO', '30678': 'SRSO', '30680': 'SRSO', '30683': 'SRSO', '30701': 'SRSO', '30703': 'SRSO', '30705': 'SRSO', '30707': 'SRTV', '30708': 'SRTV', '30710': 'SRTV', '30711': 'SRSO', '30719': 'SRTV', '30720': 'SRSO', '30721': 'SRSO', '30722': 'SRSO', '30724': 'SRTV', '30725': 'SRTV', '30726': 'SRTV', '30728': 'SRSO', '30730': 'SRSO', '30731': 'SRSO', '30732': 'SRTV', '30733': 'SRSO', '30734': 'SRSO', '30735': 'SRTV', '30736': 'SRTV', '30738': 'SRTV', '30739': 'SRTV', '30740': 'SRSO', '30741': 'SRTV', '30742': 'SRTV', '30746': 'SRTV', '30747': 'SRSO', '30750': 'SRTV', '30751': 'SRTV', '30752': 'SRSO', '30753': 'SRSO', '30755': 'SRSO', '30756': 'SRTV', '30757': 'SRTV', '30802': 'SRSO', '30803': 'SRSO', '30805': 'SRSO', '30806': 'SRSO', '30807': 'SRSO', '30808': 'SRSO', '30809': 'SRSO', '30810': 'SRSO', '30811': 'SRSO', '30812': 'SRSO', '30813': 'SRSO', '30814': 'SRSO', '30815': 'SRSO', '30816': 'SRSO', '30817': 'SRSO', '30818': 'SRSO', '30819': 'SRSO', '30820': 'SRSO', '30821': 'SRSO', '30822': 'SRSO', '30823': 'SRSO', '30824': 'SRSO', '30828': 'SRSO', '30830': 'SRSO', '30833': 'SRSO', '30901': 'SRSO', '30903': 'SRSO', '30904': 'SRSO', '30905': 'SRSO', '30906': 'SRSO', '30907': 'SRSO', '30909': 'SRSO', '30912': 'SRSO', '30914': 'SRSO', '30916': 'SRSO', '30917': 'SRSO', '30919': 'SRSO', '30999': 'SRSO', '31001': 'SRSO', '31002': 'SRSO', '31003': 'SRSO', '31004': 'SRSO', '31005': 'SRSO', '31006': 'SRSO', '31007': 'SRSO', '31008': 'SRSO', '31009': 'SRSO', '31010': 'SRSO', '31011': 'SRSO', '31012': 'SRSO', '31013': 'SRSO', '31014': 'SRSO', '31015': 'SRSO', '31016': 'SRSO', '31017': 'SRSO', '31018': 'SRSO', '31019': 'SRSO', '31020': 'SRSO', '31021': 'SRSO', '31022': 'SRSO', '31023': 'SRSO', '31024': 'SRSO', '31025': 'SRSO', '31026': 'SRSO', '31027': 'SRSO', '31028': 'SRSO', '31029': 'SRSO', '31030': 'SRSO', '31031': 'SRSO', '31032': 'SRSO', '31033': 'SRSO', '31034': 'SRSO', '31035': 'SRSO', '31036': 'SRSO', '31037': 'SRSO', '31038': 'SRSO', '31039': 'SRSO', '31040': 'SRSO', '31041': 'SRSO', '31042': 'SRSO', '31044': 'SRSO', '31045': 'SRSO', '31046': 'SRSO', '31047': 'SRSO', '31049': 'SRSO', '31050': 'SRSO', '31051': 'SRSO', '31052': 'SRSO', '31054': 'SRSO', '31055': 'SRSO', '31057': 'SRSO', '31058': 'SRSO', '31059': 'SRSO', '31060': 'SRSO', '31061': 'SRSO', '31062': 'SRSO', '31063': 'SRSO', '31064': 'SRSO', '31065': 'SRSO', '31066': 'SRSO', '31067': 'SRSO', '31068': 'SRSO', '31069': 'SRSO', '31070': 'SRSO', '31071': 'SRSO', '31072': 'SRSO', '31075': 'SRSO', '31076': 'SRSO', '31077': 'SRSO', '31078': 'SRSO', '31079': 'SRSO', '31081': 'SRSO', '31082': 'SRSO', '31083': 'SRSO', '31084': 'SRSO', '31085': 'SRSO', '31086': 'SRSO', '31087': 'SRSO', '31088': 'SRSO', '31089': 'SRSO', '31090': 'SRSO', '31091': 'SRSO', '31092': 'SRSO', '31093': 'SRSO', '31094': 'SRSO', '31095': 'SRSO', '31096': 'SRSO', '31097': 'SRSO', '31098': 'SRSO', '31099': 'SRSO', '31106': 'SRSO', '31107': 'SRSO', '31119': 'SRSO', '31126': 'SRSO', '31131': 'SRSO', '31136': 'SRSO', '31139': 'SRSO', '31141': 'SRSO', '31144': 'SRSO', '31145': 'SRSO', '31146': 'SRSO', '31150': 'SRSO', '31156': 'SRSO', '31169': 'SRSO', '31192': 'SRSO', '31193': 'SRSO', '31195': 'SRSO', '31196': 'SRSO', '31201': 'SRSO', '31202': 'SRSO', '31203': 'SRSO', '31204': 'SRSO', '31205': 'SRSO', '31206': 'SRSO', '31207': 'SRSO', '31208': 'SRSO', '31209': 'SRSO', '31210': 'SRSO', '31211': 'SRSO', '31212': 'SRSO', '31213': 'SRSO', '31216': 'SRSO', '31217': 'SRSO', '31220': 'SRSO', '31221': 'SRSO', '31294': 'SRSO', '31295': 'SRSO', '31296': 'SRSO', '31297': 'SRSO', '31301': 'SRSO', '31302': 'SRSO', '31303': 'SRSO', '31304': 'SRSO', '31305': 'SRSO', '31307': 'SRSO', '31308': 'SRSO', '31309': 'SRSO', '31310': 'SRSO', '31312': 'SRSO', '31313': 'SRSO', '31314': 'SRSO', '31315': 'SRSO', '31316': 'SRSO', '31318': 'SRSO', '31319': 'SRSO', '31320': 'SRSO', '31321': 'SRSO', '31322': 'SRSO', '31323': 'SRSO', '31324': 'SRSO', '31326': 'SRSO', '31327': 'SRSO', '31328': 'SRSO', '31329': 'SRSO', '31331': 'SRSO', '31333': 'SRSO', '31401': 'SRSO', '31402': 'SRSO', '31403': 'SRSO', '31404': 'SRSO', '31405': 'SRSO', '31406': 'SRSO', '31407': 'SRSO', '31408': 'SRSO', '31409': 'SRSO', '31410': 'SRSO', '31411': 'SRSO', '31412': 'SRSO', '31414': 'SRSO', '31415': 'SRSO', '31416': 'SRSO', '31418': 'SRSO', '31419': 'SRSO', '31420': 'SRSO', '31421': 'SRSO', '31501': 'SRSO', '31502': 'SRSO', '31503': 'SRSO', '31510': 'SRSO', '31512': 'SRSO', '31513': 'SRSO', '31515': 'SRSO', '31516': 'SRSO', '31518': 'SRSO', '31519': 'SRSO', '31520': 'SRSO', '31521': 'SRSO', '31522': 'SRSO', '31523': 'SRSO', '31524': 'SRSO', '31525': 'SRSO', '31527': 'SRSO', '31532': 'SRSO', '31533': 'SRSO', '31534': 'SRSO', '31535': 'SRSO', '31537': 'SRSO', '31539': 'SRSO', '31542': 'SRSO', '31543': 'SRSO', '31544': 'SRSO', '31545': 'SRSO', '31546': 'SRSO', '31547': 'SRSO', '31548': 'SRSO', '31549': 'SRSO', '31550': 'SRSO', '31551': 'SRSO', '31552': 'SRSO', '31553': 'SRSO', '31554': 'SRSO', '31555': 'SRSO', '31556': 'SRSO', '31557': 'SRSO', '31558': 'SRSO', '31560': 'SRSO', '31561': 'SRSO', '31562': 'SRSO', '31563': 'SRSO', '31564': 'SRSO', '31565': 'SRSO', '31566': 'SRSO', '31567': 'SRSO', '31568': 'SRSO', '31569': 'SRSO', '31598': 'SRSO', '31599': 'SRSO', '31601': 'SRSO', '31602': 'SRSO', '31603': 'SRSO', '31604': 'SRSO', '31605': 'SRSO', '31606': 'SRSO', '31620': 'SRSO', '31622': 'SRSO', '31623': 'SRSO', '31624': 'SRSO', '31625': 'SRSO', '31626': 'SRSO', '31627': 'SRSO', '31629': 'SRSO', '31630': 'SRSO', '31631': 'SRSO', '31632': 'SRSO', '31634': 'SRSO', '31635': 'SRSO', '31636': 'SRSO', '31637': 'SRSO', '31638': 'SRSO', '31639': 'SRSO', '31641': 'SRSO', '31642': 'SRSO', '31643': 'SRSO', '31645': 'SRSO', '31647': 'SRSO', '31648': 'SRSO', '31649': 'SRSO', '31650': 'SRSO', '31698': 'SRSO', '31699': 'SRSO', '31701': 'SRSO', '31702': 'SRSO', '31703': 'SRSO', '31704': 'SRSO', '31705': 'SRSO', '31706': 'SRSO', '31707': 'SRSO', '31708': 'SRSO', '31709': 'SRSO', '31711': 'SRSO', '31712': 'SRSO', '31714': 'SRSO', '31716': 'SRSO', '31719': 'SRSO', '31720': 'SRSO', '31721': 'SRSO', '31722': 'SRSO', '31727': 'SRSO', '31730': 'SRSO', '31733': 'SRSO', '31735': 'SRSO', '31738': 'SRSO', '31739': 'SRSO', '31743': 'SRSO', '31744': 'SRSO', '31747': 'SRSO', '31749': 'SRSO', '31750': 'SRSO', '31753': 'SRSO', '31756': 'SRSO', '31757': 'SRSO', '31758': 'SRSO', '31760': 'SRSO', '31763': 'SRSO', '31764': 'SRSO', '31765': 'SRSO', '31768': 'SRSO', '31769': 'SRSO', '31771': 'SRSO', '31772': 'SRSO', '31773': 'SRSO', '31774': 'SRSO', '31775': 'SRSO', '31776': 'SRSO', '31778': 'SRSO', '31779': 'SRSO', '31780': 'SRSO', '31781': 'SRSO', '31782': 'SRSO', '31783': 'SRSO', '31784': 'SRSO', '31787': 'SRSO', '31788': 'SRSO', '31789': 'SRSO', '31790': 'SRSO', '31791': 'SRSO', '31792': 'SRSO', '31793': 'SRSO', '31794': 'SRSO', '31795': 'SRSO', '31796': 'SRSO', '31798': 'SRSO', '31799': 'SRSO', '31801': 'SRSO', '31803': 'SRSO', '31804': 'SRSO', '31805': 'SRSO', '31806': 'SRSO', '31807': 'SRSO', '31808': 'SRSO', '31810': 'SRSO', '31811': 'SRSO', '31812': 'SRSO', '31814': 'SRSO', '31815': 'SRSO', '31816': 'SRSO', '31820': 'SRSO', '31821': 'SRSO', '31822': 'SRSO', '31823': 'SRSO', '31824': 'SRSO', '31825': 'SRSO', '31826': 'SRSO', '31827': 'SRSO', '31829': 'SRSO', '31830': 'SRSO', '31831': 'SRSO', '31832': 'SRSO', '31833': 'SRSO', '31836': 'SRSO', '31901': 'SRSO', '31902': 'SRSO', '31903': 'SRSO', '31904': 'SRSO', '31905': 'SRSO', '31906': 'SRSO', '31907': 'SRSO', '31908': 'SRSO', '31909': 'SRSO', '31914': 'SRSO', '31917': 'SRSO', '31993': 'SRSO', '31995': 'SRSO', '31997': 'SRSO', '31998': 'SRSO', '31999': 'SRSO', '32003': 'FRCC', '32004': 'FRCC', '32006': 'FRCC', '32007': 'FRCC', '32008': 'FRCC', '32009': 'FRCC', '32011': 'FRCC', '32013': 'FRCC', '32024': 'FRCC', '32025': 'FRCC', '32026': 'FRCC', '32030': 'FRCC', '32033': 'FRCC', '32034': 'FRCC', '32035': 'FRCC', '32038': 'FRCC', '32040': 'FRCC', '32041': 'FRCC', '32042': 'FRCC', '32043': 'FRCC', '32044': 'FRCC', '32046': 'FRCC', '32050': 'FRCC', '32052': 'FRCC', '32053': 'FRCC', '32054': 'FRCC', '32055': 'FRCC', '32056': 'FRCC', '32058': 'FRCC', '32059': 'FRCC', '32060': 'FRCC', '32061': 'FRCC', '32062': 'FRCC', '32063': 'FRCC', '32064': 'FRCC', '32065': 'FRCC', '32066': 'FRCC', '32067': 'FRCC', '32068': 'FRCC', '32071': 'FRCC', '32072': 'SRSO', '32073': 'FRCC', '32079': 'FRCC', '32080': 'FRCC', '32081': 'FRCC', '32082': 'FRCC', '32083': 'FRCC', '32084': 'FRCC', '32085': 'FRCC', '32086': 'FRCC', '32087': 'FRCC', '32091': 'FRCC', '32092': 'FRCC', '32094': 'FRCC', '32095': 'FRCC', '32096': 'FRCC', '32097': 'FRCC', '32099': 'FRCC', '32102': 'FRCC', '32105': 'FRCC', '32110': 'FRCC', '32111': 'FRCC', '32112': 'FRCC', '32113': 'FRCC', '32114': 'FRCC', '32115': 'FRCC', '32116': 'FRCC', '32117': 'FRCC', '32118': 'FRCC', '32119': 'FRCC', '32120': 'FRCC', '32121': 'FRCC', '32122': 'FRCC', '32123': 'FRCC', '32124': 'FRCC', '32125': 'FRCC', '32126': 'FRCC', '32127': 'FRCC', '32128': 'FRCC', '32129': 'FRCC', '32130': 'FRCC', '32131': 'FRCC', '32132': 'FRCC', '32133': 'FRCC', '32134': 'FRCC', '32135': 'FRCC', '32136': 'FRCC', '32137': 'FRCC', '32138': 'FRCC', '32139': 'FRCC', '32140': 'FRCC', '32141': 'FRCC', '32142': 'FRCC', '32143': 'FRCC', '32145': 'FRCC', '32147': 'FRCC', '32148': 'FRCC', '32149': 'FRCC', '32157': 'FRCC', '32158': 'FRCC', '32159': 'FRCC', '32160': 'FRCC', '32162': 'FRCC', '32163': 'FRCC', '32164': 'FRCC', '32168': 'FRCC', '32169': 'FRCC', '32170': 'FRCC', '32173': 'FRCC', '32174': 'FRCC', '32175': 'FRCC', '32176': 'FRCC', '32177': 'FRCC', '32178': 'FRCC', '32179': 'FRCC', '32180': 'FRCC', '32181': 'FRCC', '32182': 'FRCC', '32183': 'FRCC', '32185': 'FRCC', '32187': 'FRCC', '32189': 'FRCC', '32190': 'FRCC', '32192': 'FRCC', '32193': 'FRCC', '32195': 'FRCC', '32198': 'FRCC', '32201': 'FRCC', '32202': 'FRCC', '32203': 'FRCC', '32204': 'FRCC', '32205': 'FRCC', '32206': 'FRCC', '32207': 'FRCC', '32208': 'FRCC', '32209': 'FRCC', '32210': 'FRCC', '32211': 'FRCC', '32212': 'FRCC', '32214': 'FRCC', '32215': 'FRCC', '32216': 'FRCC', '32217': 'FRCC', '32218': 'FRCC', '32219': 'FRCC', '32220': 'FRCC', '32221': 'FRCC', '32222': 'FRCC', '32223': 'FRCC', '32224': 'FRCC', '32225': 'FRCC', '32226': 'FRCC', '32227': 'FRCC', '32228': 'FRCC', '32229': 'FRCC', '32230': 'FRCC', '32231': 'FRCC', '32232': 'FRCC', '32233': 'FRCC', '32234': 'FRCC', '32235': 'FRCC', '32236': 'FRCC', '32237': 'FRCC', '32238': 'FRCC', '32239': 'FRCC', '32240': 'FRCC', '32241': 'FRCC', '32244': 'FRCC', '32245': 'FRCC', '32246': 'FRCC', '32247': 'FRCC', '32250': 'FRCC', '32254': 'FRCC', '32255': 'FRCC', '32256': 'FRCC', '32257': 'FRCC', '32258': 'FRCC', '32259': 'FRCC', '32260': 'FRCC', '32266': 'FRCC', '32277': 'FRCC', '32301': 'FRCC', '32302': 'FRCC', '32303': 'FRCC', '32304': 'FRCC', '32305': 'FRCC', '32306': 'FRCC', '32307': 'FRCC', '32308': 'FRCC', '32309': 'FRCC', '32310': 'FRCC', '32311': 'FRCC', '32312': 'FRCC', '32313': 'FRCC', '32314': 'FRCC', '32315': 'FRCC', '32316': 'FRCC', '32317': 'FRCC', '32318': 'FRCC', '32320': 'FRCC', '32321': 'FRCC', '32322': 'FRCC', '32323': 'FRCC', '32324': 'FRCC', '32326': 'FRCC', '32327': 'FRCC', '32328': 'FRCC', '32329': 'FRCC', '32330': 'FRCC', '32331': 'FRCC', '32332': 'FRCC', '32333': 'FRCC', '32334': 'FRCC', '32335': 'FRCC', '32336': 'FRCC', '32337': 'FRCC', '32340': 'FRCC', '32341': 'FRCC', '32343': 'FRCC', '32344': 'FRCC', '32345': 'FRCC', '32346': 'FRCC', '32347': 'FRCC', '32348': 'FRCC', '32350': 'FRCC', '32351': 'FRCC', '32352': 'FRCC', '32353': 'FRCC', '32355': 'FRCC', '32356': 'FRCC', '32357': 'FRCC', '32358': 'FRCC', '32359': 'FRCC', '32360': 'FRCC', '32361': 'FRCC', '32362': 'FRCC', '32395': 'FRCC', '32399': 'FRCC', '32401': 'SRSO', '32402': 'SRSO', '32403': 'SRSO', '32404': 'FRCC', '32405': 'SRSO', '32406': 'SRSO', '32407': 'SRSO', '32408': 'SRSO', '32409': 'SRSO', '32410': 'SRSO', '32411': 'SRSO', '32412': 'SRSO', '32413': 'SRSO', '32417': 'SRSO', '32420': 'FRCC', '32421': 'FRCC', '32422': 'SRSO', '32423': 'FRCC', '32424': 'FRCC', '32425': 'SRSO', '32426': 'SRSO', '32427': 'SRSO', '32428': 'SRSO', '32430': 'FRCC', '32431': 'SRSO', '32432': 'FRCC', '32433': 'SRSO', '32434': 'SRSO', '32435': 'SRSO', '32437': 'SRSO', '32438': 'FRCC', '32439': 'SRSO', '32440': 'SRSO', '32442': 'FRCC', '32443': 'FRCC', '32444': 'SRSO', '32445': 'FRCC', '32446': 'FRCC', '32447': 'SRSO', '32448': 'FRCC', '32449': 'FRCC', '32452': 'SRSO', '32455': 'SRSO', '32456': 'FRCC', '32457': 'FRCC', '32459': 'SRSO', '32460': 'FRCC', '32461': 'SRSO', '32462': 'SRSO', '32463': 'SRSO', '32464': 'SRSO', '32465': 'FRCC', '32466': 'FRCC', '32501': 'SRSO', '32502': 'SRSO', '32503': 'SRSO', '32504': 'SRSO', '32505': 'SRSO', '32506': 'SRSO', '32507': 'SRSO', '32508': 'SRSO', '32509': 'SRSO', '32511': 'SRSO', '32512': 'SRSO', '32513': 'SRSO', '32514': 'SRSO', '32516': 'SRSO', '32520': 'SRSO', '32521': 'SRSO', '32522': 'SRSO', '32523': 'SRSO', '32524': 'SRSO', '32526': 'SRSO', '32530': 'SRSO', '32531': 'SRSO', '32533': 'SRSO', '32534': 'SRSO', '32535': 'SRSO', '32536': 'SRSO', '32537': 'SRSO', '32538': 'SRSO', '32539': 'SRSO', '32540': 'SRSO', '32541': 'SRSO', '32542': 'SRSO', '32544': 'SRSO', '32547': 'SRSO', '32548': 'SRSO', '32549': 'SRSO', '32550': 'SRSO', '32559': 'SRSO', '32560': 'SRSO', '32561': 'SRSO', '32562': 'SRSO', '32563': 'SRSO', '32564': 'SRSO', '32565': 'SRSO', '32566': 'SRSO', '32567': 'SRSO', '32568': 'SRSO', '32569': 'SRSO', '32570': 'SRSO', '32571': 'SRSO', '32572': 'SRSO', '32577': 'SRSO', '32578': 'SRSO', '32579': 'SRSO', '32580': 'SRSO', '32583': 'SRSO', '32588': 'SRSO', '32590': 'SRSO', '32591': 'SRSO', '32592': 'SRSO', '32601': 'FRCC', '32602': 'FRCC', '32603': 'FRCC', '32604': 'FRCC', '32605': 'FRCC', '32606': 'FRCC', '32607': 'FRCC', '32608': 'FRCC', '32609': 'FRCC', '32610': 'FRCC', '32611': 'FRCC', '32612': 'FRCC', '32613': 'FRCC', '32614': 'FRCC', '32615': 'FRCC', '32616': 'FRCC', '32617': 'FRCC', '32618': 'FRCC', '32619': 'FRCC', '32621': 'FRCC', '32622': 'FRCC', '32625': 'FRCC', '32626': 'FRCC', '32627': 'FRCC', '32628': 'FRCC', '32631': 'FRCC', '32633': 'FRCC', '32634': 'FRCC', '32635': 'FRCC', '32639': 'FRCC', '32640': 'FRCC', '32641': 'FRCC', '32643': 'FRCC', '32644': 'FRCC', '32648': 'FRCC', '32653': 'FRCC', '32654': 'FRCC', '32655': 'FRCC', '32656': 'FRCC', '32658': 'FRCC', '32662': 'FRCC', '32663': 'FRCC', '32664': 'FRCC', '32666': 'FRCC', '32667': 'FRCC', '32668': 'FRCC', '32669': 'FRCC', '32680': 'FRCC', '32681': 'FRCC', '32683': 'FRCC', '32686': 'FRCC', '32692': 'FRCC', '32693': 'FRCC', '32694': 'FRCC', '32696': 'FRCC', '32697': 'FRCC', '32701': 'FRCC', '32702': 'FRCC', '32703': 'FRCC', '32704': 'FRCC', '32706': 'FRCC', '32707': 'FRCC', '32708': 'FRCC', '32709': 'FRCC', '32710': 'FRCC', '32712': 'FRCC', '32713': 'FRCC', '32714': 'FRCC', '32715': 'FRCC', '32716': 'FRCC', '32718': 'FRCC', '32719': 'FRCC', '32720': 'FRCC', '32721': 'FRCC', '32722': 'FRCC', '32723': 'FRCC', '32724': 'FRCC', '32725': 'FRCC', '32726': 'FRCC', '32727': 'FRCC', '32728': 'FRCC', '32730': 'FRCC', '32732': 'FRCC', '32733': 'FRCC', '32735': 'FRCC', '32736': 'FRCC', '32738': 'FRCC', '32739': 'FRCC', '32744': 'FRCC', '32745': 'FRCC', '32746': 'FRCC', '32747': 'FRCC', '32750': 'FRCC', '32751': 'FRCC', '32752': 'FRCC', '32753': 'FRCC', '32754': 'FRCC', '32756': 'FRCC', '32757': 'FRCC', '32759': 'FRCC', '32762': 'FRCC', '32763': 'FRCC', '32764': 'FRCC', '32765': 'FRCC', '32766': 'FRCC', '32767': 'FRCC', '32768': 'FRCC', '32771': 'FRCC', '32772': 'FRCC', '32773': 'FRCC', '32774': 'FRCC', '32775': 'FRCC', '32776': 'FRCC', '32777': 'FRCC', '32778': 'FRCC', '32779': 'FRCC', '32780': 'FRCC', '32781': 'FRCC', '32782': 'FRCC', '32783': 'FRCC', '32784': 'FRCC', '32789': 'FRCC', '32790': 'FRCC', '32791': 'FRCC', '32792': 'FRCC', '32793': 'FRCC', '32794': 'FRCC', '32795': 'FRCC', '32796': 'FRCC', '32798': 'FRCC', '32799': 'FRCC', '32801': 'FRCC', '32802': 'FRCC', '32803': 'FRCC', '32804': 'FRCC', '32805': 'FRCC', '32806': 'FRCC', '32807': 'FRCC', '32808': 'FRCC', '32809': 'FRCC', '32810': 'FRCC', '32811': 'FRCC', '32812': 'FRCC', '32814': 'FRCC', '32815': 'FRCC', '32816': 'FRCC', '32817': 'FRCC', '32818': 'FRCC', '32819': 'FRCC', '32820': 'FRCC', '32821': 'FRCC', '32822': 'FRCC', '32824': 'FRCC', '32825': 'FRCC', '32826': 'FRCC', '32827': 'FRCC', '32828': 'FRCC', '32829': 'FRCC', '32830': 'FRCC', '32831': 'FRCC', '32832': 'FRCC', '32833': 'FRCC', '32834': 'FRCC', '32835': 'FRCC', '32836': 'FRCC', '32837': 'FRCC', '32839': 'FRCC', '32853': 'FRCC', '32854': 'FRCC', '32855': 'FRCC', '32856': 'FRCC', '32857': 'FRCC', '32858': 'FRCC', '32859': 'FRCC', '32860': 'FRCC', '32861': 'FRCC', '32862': 'FRCC', '32867': 'FRCC', '32868': 'FRCC', '32869': 'FRCC', '32872': 'FRCC', '32877': 'FRCC', '32878': 'FRCC', '32885': 'FRCC', '32886': 'FRCC', '32887': 'FRCC', '32891': 'FRCC', '32896': 'FRCC', '32897': 'FRCC', '32899': 'FRCC', '32901': 'FRCC', '32902': 'FRCC', '32903': 'FRCC', '32904': 'FRCC', '32905': 'FRCC', '32906': 'FRCC', '32907': 'FRCC', '32908': 'FRCC', '32909': 'FRCC', '32910': 'FRCC', '32911': 'FRCC', '32912': 'FRCC', '32919': 'FRCC', '32920': 'FRCC', '32922': 'FRCC', '32923': 'FRCC', '32924': 'FRCC', '32925': 'FRCC', '32926': 'FRCC', '32927': 'FRCC', '32931': 'FRCC', '32932': 'FRCC', '32934': 'FRCC', '32935': 'FRCC', '32936': 'FRCC', '32937': 'FRCC', '32940': 'FRCC', '32941': 'FRCC', '32948': 'FRCC', '32949': 'FRCC', '32950': 'FRCC', '32951': 'FRCC', '32952': 'FRCC', '32953': 'FRCC', '32954': 'FRCC', '32955': 'FRCC', '32956': 'FRCC', '32957': 'FRCC', '32958': 'FRCC', '32959': 'FRCC', '32960': 'FRCC', '32961': 'FRCC', '32962': 'FRCC', '32963': 'FRCC', '32964': 'FRCC', '32965': 'FRCC', '32966': 'FRCC', '32967': 'FRCC', '32968': 'FRCC', '32969': 'FRCC', '32970': 'FRCC', '32971': 'FRCC', '32976': 'FRCC', '32978': 'FRCC', '33001': 'FRCC', '33002': 'FRCC', '33004': 'FRCC', '33008': 'FRCC', '33009': 'FRCC', '33010': 'FRCC', '33011': 'FRCC', '33012': 'FRCC', '33013': 'FRCC', '33014': 'FRCC', '33015': 'FRCC', '33016': 'FRCC', '33017': 'FRCC', '33018': 'FRCC', '33019': 'FRCC', '33020': 'FRCC', '33021': 'FRCC', '33022': 'FRCC', '33023': 'FRCC', '33024': 'FRCC', '33025': 'FRCC', '33026': 'FRCC', '33027': 'FRCC', '33028': 'FRCC', '33029': 'FRCC', '33030': 'FRCC', '33031': 'FRCC', '33032': 'FRCC', '33033': 'FRCC', '33034': 'FRCC', '33035': 'FRCC', '33036': 'FRCC', '33037': 'FRCC', '33039': 'FRCC', '33040': 'FRCC', '33041': 'FRCC', '33042': 'FRCC', '33043': 'FRCC', '33045': 'FRCC', '33050': 'FRCC', '33051': 'FRCC', '33052': 'FRCC', '33054': 'FRCC', '33055': 'FRCC', '33056': 'FRCC', '33060': 'FRCC', '33061': 'FRCC', '33062': 'FRCC', '33063': 'FRCC', '33064': 'FRCC', '33065': 'FRCC', '33066': 'FRCC', '33067': 'FRCC', '33068': 'FRCC', '33069': 'FRCC', '33070': 'FRCC', '33071': 'FRCC', '33072': 'FRCC', '33073': 'FRCC', '33074': 'FRCC', '33075': 'FRCC', '33076': 'FRCC', '33077': 'FRCC', '33081': 'FRCC', '33082': 'FRCC', '33083': 'FRCC', '33084': 'FRCC', '33090': 'FRCC', '33092': 'FRCC', '33093': 'FRCC', '33097': 'FRCC', '33101': 'FRCC', '33102': 'FRCC', '33106': 'FRCC', '33109': 'FRCC', '33111': 'FRCC', '33112': 'FRCC', '33114': 'FRCC', '33116': 'FRCC', '33119': 'FRCC', '33122': 'FRCC', '33124': 'FRCC', '33125': 'FRCC', '33126': 'FRCC', '33127': 'FRCC', '33128': 'FRCC', '33129': 'FRCC', '33130': 'FRCC', '33131': 'FRCC', '33132': 'FRCC', '33133': 'FRCC', '33134': 'FRCC', '33135': 'FRCC', '33136': 'FRCC', '33137': 'FRCC', '33138': 'FRCC', '33139': 'FRCC', '33140': 'FRCC', '33141': 'FRCC', '33142': 'FRCC', '33143': 'FRCC', '33144': 'FRCC', '33145': 'FRCC', '33146': 'FRCC', '33147': 'FRCC', '33149': 'FRCC', '33150': 'FRCC', '33151': 'FRCC', '33152': 'FRCC', '33153': 'FRCC', '33154': 'FRCC', '33155': 'FRCC', '33156': 'FRCC', '33157': 'FRCC', '33158': 'FRCC', '33159': 'FRCC', '33160': 'FRCC', '33161': 'FRCC', '33162': 'FRCC', '33163': 'FRCC', '33164': 'FRCC', '33165': 'FRCC', '33166': 'FRCC', '33167': 'FRCC', '33168': 'FRCC', '33169': 'FRCC', '33170': 'FRCC', '33172': 'FRCC', '33173': 'FRCC', '33174': 'FRCC', '33175': 'FRCC', '33176': 'FRCC', '33177': 'FRCC', '33178': 'FRCC', '33179': 'FRCC', '33180': 'FRCC', '33181': 'FRCC', '33182': 'FRCC', '33183': 'FRCC', '33184': 'FRCC', '33185': 'FRCC', '33186': 'FRCC', '33187': 'FRCC', '33188': 'FRCC', '33189': 'FRCC', '33190': 'FRCC', '33193': 'FRCC', '33194': 'FRCC', '33195': 'FRCC', '33196': 'FRCC', '33197': 'FRCC', '33199': 'FRCC', '33206': 'FRCC', '33222': 'FRCC', '33231': 'FRCC', '33233': 'FRCC', '33234': 'FRCC', '33238': 'FRCC', '33239': 'FRCC', '33242': 'FRCC', '33243': 'FRCC', '33245': 'FRCC', '33247': 'FRCC', '33255': 'FRCC', '33256': 'FRCC', '33257': 'FRCC', '33261': 'FRCC', '33265': 'FRCC', '33266': 'FRCC', '33269': 'FRCC', '33280': 'FRCC', '33283': 'FRCC', '33296': 'FRCC', '33299': 'FRCC', '33301': 'FRCC', '33302': 'FRCC', '33303': 'FRCC', '33304': 'FRCC', '33305': 'FRCC', '33306': 'FRCC', '33307': 'FRCC', '33308': 'FRCC', '33309': 'FRCC', '33310': 'FRCC', '33311': 'FRCC', '33312': 'FRCC', '33313': 'FRCC', '33314': 'FRCC', '33315': 'FRCC', '33316': 'FRCC', '33317': 'FRCC', '33318': 'FRCC', '33319': 'FRCC', '33320': 'FRCC', '33321': 'FRCC', '33322': 'FRCC', '33323': 'FRCC', '33324': 'FRCC', '33325': 'FRCC', '33326': 'FRCC', '33327': 'FRCC', '33328': 'FRCC', '33329': 'FRCC', '33330': 'FRCC', '33331': 'FRCC', '33332': 'FRCC', '33334': 'FRCC', '33335': 'FRCC', '33336': 'FRCC', '33337': 'FRCC', '33338': 'FRCC', '33339': 'FRCC', '33340': 'FRCC', '33345': 'FRCC', '33346': 'FRCC', '33348': 'FRCC', '33349': 'FRCC', '33351': 'FRCC', '33355': 'FRCC', '33359': 'FRCC', '33388': 'FRCC', '33394': 'FRCC', '33401': 'FRCC', '33402': 'FRCC', '33403': 'FRCC', '33404': 'FRCC', '33405': 'FRCC', '33406': 'FRCC', '33407': 'FRCC', '33408': 'FRCC', '33409': 'FRCC', '33410': 'FRCC', '33411': 'FRCC', '33412': 'FRCC', '33413': 'FRCC', '33414': 'FRCC', '33415': 'FRCC', '33416': 'FRCC', '33417': 'FRCC', '33418': 'FRCC', '33419': 'FRCC', '33420': 'FRCC', '33421': 'FRCC', '33422': 'FRCC', '33424': 'FRCC', '33425': 'FRCC', '33426': 'FRCC', '33427': 'FRCC', '33428': 'FRCC', '33429': 'FRCC', '33430': 'FRCC', '33431': 'FRCC', '33432': 'FRCC', '33433': 'FRCC', '33434': 'FRCC', '33435': 'FRCC', '33436': 'FRCC', '33437': 'FRCC', '33438': 'FRCC', '33439': 'FRCC', '33440': 'FRCC', '33441': 'FRCC', '33442': 'FRCC', '33443': 'FRCC', '33444': 'FRCC', '33445': 'FRCC', '33446': 'FRCC', '33448': 'FRCC', '33449': 'FRCC', '33454': 'FRCC', '33455': 'FRCC', '33458': 'FRCC', '33459': 'FRCC', '33460': 'FRCC', '33461': 'FRCC', '33462': 'FRCC', '33463': 'FRCC', '33464': 'FRCC', '33465': 'FRCC', '33466': 'FRCC', '33467': 'FRCC', '33468': 'FRCC', '33469': 'FRCC', '33470': 'FRCC', '33471': 'FRCC', '33472': 'FRCC', '33473': 'FRCC', '33474': 'FRCC', '33475': 'FRCC', '33476': 'FRCC', '33477': 'FRCC', '33478': 'FRCC', '33480': 'FRCC', '33481': 'FRCC', '33482': 'FRCC', '33483': 'FRCC', '33484': 'FRCC', '33486': 'FRCC', '33487': 'FRCC', '33488': 'FRCC', '33493': 'FRCC', '33496': 'FRCC', '33497': 'FRCC', '33498': 'FRCC', '33499': 'FRCC', '33503': 'FRCC', '33508': 'FRCC', '33509': 'FRCC', '33510': 'FRCC', '33511': 'FRCC', '33513': 'FRCC', '33514': 'FRCC', '33521': 'FRCC', '33523': 'FRCC', '33524': 'FRCC', '33525': 'FRCC', '33526': 'FRCC', '33527': 'FRCC', '33530': 'FRCC', '33534': 'FRCC', '33537': 'FRCC', '33538': 'FRCC', '33539': 'FRCC', '33540': 'FRCC', '33541': 'FRCC', '33542': 'FRCC', '33543': 'FRCC', '33544': 'FRCC', '33545': 'FRCC', '33547': 'FRCC', '33548': 'FRCC', '33549': 'FRCC', '33550': 'FRCC', '33556': 'FRCC', '33558': 'FRCC', '33559': 'FRCC', '33563': 'FRCC', '33564': 'FRCC', '33565': 'FRCC', '33566': 'FRCC', '33567': 'FRCC', '33568': 'FRCC', '33569': 'FRCC', '33570': 'FRCC', '33571': 'FRCC', '33572': 'FRCC', '33573': 'FRCC', '33574': 'FRCC', '33575': 'FRCC', '33576': 'FRCC', '33578': 'FRCC', '33579': 'FRCC', '33583': 'FRCC', '33584': 'FRCC', '33585': 'FRCC', '33586': 'FRCC', '33587': 'FRCC', '33592': 'FRCC', '33593': 'FRCC', '33594': 'FRCC', '33595': 'FRCC', '33596': 'FRCC', '33597': 'FRCC', '33598': 'FRCC', '33601': 'FRCC', '33602': 'FRCC', '33603': 'FRCC', '33604': 'FRCC', '33605': 'FRCC', '33606': 'FRCC', '33607': 'FRCC', '33608': 'FRCC', '33609': 'FRCC', '33610': 'FRCC', '33611': 'FRCC', '33612': 'FRCC', '33613': 'FRCC', '33614': 'FRCC', '33615': 'FRCC', '33616': 'FRCC', '33617': 'FRCC', '33618': 'FRCC', '33619': 'FRCC', '33620': 'FRCC', '33621': 'FRCC', '33622': 'FRCC', '33623': 'FRCC', '33624': 'FRCC', '33625': 'FRCC', '33626': 'FRCC', '33629': 'FRCC', '33630': 'FRCC', '33631': 'FRCC', '33633': 'FRCC', '33634': 'FRCC', '33635': 'FRCC', '33637': 'FRCC', '33646': 'FRCC', '33647': 'FRCC', '33650': 'FRCC', '33655': 'FRCC', '33660': 'FRCC', '33661': 'FRCC', '33662': 'FRCC', '33663': 'FRCC', '33664': 'FRCC', '33672': 'FRCC', '33673': 'FRCC', '33674': 'FRCC', '33675': 'FRCC', '33677': 'FRCC', '33679': 'FRCC', '33680': 'FRCC', '33681': 'FRCC', '33682': 'FRCC', '33684': 'FRCC', '33685': 'FRCC', '33686': 'FRCC', '33687': 'FRCC', '33688': 'FRCC', '33689': 'FRCC', '33690': 'FRCC', '33694': 'FRCC', '33701': 'FRCC', '33702': 'FRCC', '33703': 'FRCC', '33704': 'FRCC', '33705': 'FRCC', '33706': 'FRCC', '33707': 'FRCC', '33708': 'FRCC', '33709': 'FRCC', '33710': 'FRCC', '33711': 'FRCC', '33712': 'FRCC', '33713': 'FRCC', '33714': 'FRCC', '33715': 'FRCC', '33716': 'FRCC', '33729': 'FRCC', '33730': 'FRCC', '33731': 'FRCC', '33732': 'FRCC', '33733': 'FRCC', '33734': 'FRCC', '33736': 'FRCC', '33737': 'FRCC', '33738': 'FRCC', '33740': 'FRCC', '33741': 'FRCC', '33742': 'FRCC', '33743': 'FRCC', '33744': 'FRCC', '33747': 'FRCC', '33755': 'FRCC', '33756': 'FRCC', '33757': 'FRCC', '33758': 'FRCC', '33759': 'FRCC', '33760': 'FRCC', '33761': 'FRCC', '33762': 'FRCC', '33763': 'FRCC', '33764': 'FRCC', '33765': 'FRCC', '33766': 'FRCC', '33767': 'FRCC', '33769': 'FRCC', '33770': 'FRCC', '33771': 'FRCC', '33772': 'FRCC', '33773': 'FRCC', '33774': 'FRCC', '33775': 'FRCC', '33776': 'FRCC', '33777': 'FRCC', '33778': 'FRCC', '33779': 'FRCC', '33780': 'FRCC', '33781': 'FRCC', '33782': 'FRCC', '33784': 'FRCC', '33785': 'FRCC', '33786': 'FRCC', '33801': 'FRCC', '33802': 'FRCC', '33803': 'FRCC', '33804': 'FRCC', '33805': 'FRCC', '33806': 'FRCC', '33807': 'FRCC', '33809': 'FRCC', '33810': 'FRCC', '33811': 'FRCC', '33812': 'FRCC', '33813': 'FRCC', '33815': 'FRCC', '33820': 'FRCC', '33823': 'FRCC', '33825': 'FRCC', '33826': 'FRCC', '33827': 'FRCC', '33830': 'FRCC', '33831': 'FRCC', '33834': 'FRCC', '33835': 'FRCC', '33836': 'FRCC', '33837': 'FRCC', '33838': 'FRCC', '33839': 'FRCC', '33840': 'FRCC', '33841': 'FRCC', '33843': 'FRCC', '33844': 'FRCC', '33845': 'FRCC', '33846': 'FRCC', '33847': 'FRCC', '33848': 'FRCC', '33849': 'FRCC', '33850': 'FRCC', '33851': 'FRCC', '33852': 'FRCC', '33853': 'FRCC', '33854': 'FRCC', '33855': 'FRCC', '33856': 'FRCC', '33857': 'FRCC', '33858': 'FRCC', '33859': 'FRCC', '33860': 'FRCC', '33862': 'FRCC', '33863': 'FRCC', '33865': 'FRCC', '33867': 'FRCC', '33868': 'FRCC', '33870': 'FRCC', '33871': 'FRCC', '33872': 'FRCC', '33873': 'FRCC', '33875': 'FRCC', '33876': 'FRCC', '33877': 'FRCC', '33880': 'FRCC', '33881': 'FRCC', '33882': 'FRCC', '33883': 'FRCC', '33884': 'FRCC', '33885': 'FRCC', '33888': 'FRCC', '33890': 'FRCC', '33896': 'FRCC', '33897': 'FRCC', '33898': 'FRCC', '33900': 'FRCC', '33901': 'FRCC', '33902': 'FRCC', '33903': 'FRCC', '33904': 'FRCC', '33905': 'FRCC', '33906': 'FRCC', '33907': 'FRCC', '33908': 'FRCC', '33909': 'FRCC', '33910': 'FRCC', '33911': 'FRCC', '33912': 'FRCC', '33913': 'FRCC', '33914': 'FRCC', '33915': 'FRCC', '33916': 'FRCC', '33917': 'FRCC', '33918': 'FRCC', '33919': 'FRCC', '33920': 'FRCC', '33921': 'FRCC', '33922': 'FRCC', '33924': 'FRCC', '33927': 'FRCC', '33928': 'FRCC', '33929': 'FRCC', '33930': 'FRCC', '33931': 'FRCC', '33932': 'FRCC', '33935': 'FRCC', '33936': 'FRCC', '33938': 'FRCC', '33944': 'FRCC', '33945': 'FRCC', '33946': 'FRCC', '33947': 'FRCC', '33948': 'FRCC', '33949': 'FRCC', '33950': 'FRCC', '33951': 'FRCC', '33952': 'FRCC', '33953': 'FRCC', '33954': 'FRCC', '33955': 'FRCC', '33956': 'FRCC', '33957': 'FRCC', '33960': 'FRCC', '33965': 'FRCC', '33966': 'FRCC', '33967': 'FRCC', '33970': 'FRCC', '33971': 'FRCC', '33972': 'FRCC', '33973': 'FRCC', '33974': 'FRCC', '33975': 'FRCC', '33976': 'FRCC', '33980': 'FRCC', '33981': 'FRCC', '33982': 'FRCC', '33983': 'FRCC', '33990': 'FRCC', '33991': 'FRCC', '33993': 'FRCC', '33994': 'FRCC', '34101': 'FRCC', '34102': 'FRCC', '34103': 'FRCC', '34104': 'FRCC', '34105': 'FRCC', '34106': 'FRCC', '34107': 'FRCC', '34108': 'FRCC', '34109': 'FRCC', '34110': 'FRCC', '34112': 'FRCC', '34113': 'FRCC', '34114': 'FRCC', '34116': 'FRCC', '34117': 'FRCC', '34119': 'FRCC', '34120': 'FRCC', '34133': 'FRCC', '34134': 'FRCC', '34135': 'FRCC', '34136': 'FRCC', '34137': 'FRCC', '34138': 'FRCC', '34139': 'FRCC', '34140': 'FRCC', '34141': 'FRCC', '34142': 'FRCC', '34143': 'FRCC', '34145': 'FRCC', '34146': 'FRCC', '34201': 'FRCC', '34202': 'FRCC', '34203': 'FRCC', '34204': 'FRCC', '34205': 'FRCC', '34206': 'FRCC', '34207': 'FRCC', '34208': 'FRCC', '34209': 'FRCC', '34210': 'FRCC', '34211': 'FRCC', '34212': 'FRCC', '34215': 'FRCC', '34216': 'FRCC', '34217': 'FRCC', '34218': 'FRCC', '34219': 'FRCC', '34220': 'FRCC', '34221': 'FRCC', '34222': 'FRCC', '34223': 'FRCC', '34224': 'FRCC', '34228': 'FRCC', '34229': 'FRCC', '34230': 'FRCC', '34231': 'FRCC', '34232': 'FRCC', '34233': 'FRCC', '34234': 'FRCC', '34235': 'FRCC', '34236': 'FRCC', '34237': 'FRCC', '34238': 'FRCC', '34239': 'FRCC', '34240': 'FRCC', '34241': 'FRCC', '34242': 'FRCC', '34243': 'FRCC', '34250': 'FRCC', '34251': 'FRCC', '34260': 'FRCC', '34264': 'FRCC', '34265': 'FRCC', '34266': 'FRCC', '34267': 'FRCC', '34268': 'FRCC', '34269': 'FRCC', '34270': 'FRCC', '34272': 'FRCC', '34274': 'FRCC', '34275': 'FRCC', '34276': 'FRCC', '34277': 'FRCC', '34278': 'FRCC', '34280': 'FRCC', '34281': 'FRCC', '34282': 'FRCC', '34284': 'FRCC', '34285': 'FRCC', '34286': 'FRCC', '34287': 'FRCC', '34288': 'FRCC', '34289': 'FRCC', '34290': 'FRCC', '34291': 'FRCC', '34292': 'FRCC', '34293': 'FRCC', '34295': 'FRCC', '34420': 'FRCC', '34421': 'FRCC', '34423': 'FRCC', '34428': 'FRCC', '34429': 'FRCC', '34430': 'FRCC', '34431': 'FRCC', '34432': 'FRCC', '34433': 'FRCC', '34434': 'FRCC', '34436': 'FRCC', '34442': 'FRCC', '34445': 'FRCC', '34446': 'FRCC', '34447': 'FRCC', '34448': 'FRCC', '34449': 'FRCC', '34450': 'FRCC', '34451': 'FRCC', '34452': 'FRCC', '34453': 'FRCC', '34460': 'FRCC', '34461': 'FRCC', '34464': 'FRCC', '34465': 'FRCC', '34470': 'FRCC', '34471': 'FRCC', '34472': 'FRCC', '34473': 'FRCC', '34474': 'FRCC', '34475': 'FRCC', '34476': 'FRCC', '34477': 'FRCC', '34478': 'FRCC', '34479': 'FRCC', '34480': 'FRCC', '34481': 'FRCC', '34482': 'FRCC', '34483': 'FRCC', '34484': 'FRCC', '34487': 'FRCC', '34488': 'FRCC', '34489': 'FRCC', '34491': 'FRCC', '34492': 'FRCC', '34498': 'FRCC', '34601': 'FRCC', '34602': 'FRCC', '34603': 'FRCC', '34604': 'FRCC', '34605': 'FRCC', '34606': 'FRCC', '34607': 'FRCC', '34608': 'FRCC', '34609': 'FRCC', '34610': 'FRCC', '34611': 'FRCC', '34613': 'FRCC', '34614': 'FRCC', '34636': 'FRCC', '34637': 'FRCC', '34638': 'FRCC', '34639': 'FRCC', '34652': 'FRCC', '34653': 'FRCC', '34654': 'FRCC', '34655': 'FRCC', '34656': 'FRCC', '34660': 'FRCC', '34661': 'FRCC', '34667': 'FRCC', '34668': 'FRCC', '34669': 'FRCC', '34673': 'FRCC', '34674': 'FRCC', '34677': 'FRCC', '34679': 'FRCC', '34680': 'FRCC', '34681': 'FRCC', '34682': 'FRCC', '34683': 'FRCC', '34684': 'FRCC', '34685': 'FRCC', '34688': 'FRCC', '34689': 'FRCC', '34690': 'FRCC', '34691': 'FRCC', '34692': 'FRCC', '34695': 'FRCC', '34697': 'FRCC', '34698': 'FRCC', '34705': 'FRCC', '34711': 'FRCC', '34712': 'FRCC', '34713': 'FRCC', '34714': 'FRCC', '34715': 'FRCC', '34729': 'FRCC', '34731': 'FRCC', '34734': 'FRCC', '34736': 'FRCC', '34737': 'FRCC', '34739': 'FRCC', '34740': 'FRCC', '34741': 'FRCC', '34742': 'FRCC', '34743': 'FRCC', '34744': 'FRCC', '34745': 'FRCC', '34746': 'FRCC', '34747': 'FRCC', '34748': 'FRCC', '34749': 'FRCC', '34753': 'FRCC', '34755': 'FRCC', '34756': 'FRCC', '34758': 'FRCC', '34759': 'FRCC', '34760': 'FRCC', '34761': 'FRCC', '34762': 'FRCC', '34769': 'FRCC', '34770': 'FRCC', '34771': 'FRCC', '34772': 'FRCC', '34773': 'FRCC', '34777': 'FRCC', '34778': 'FRCC', '34785': 'FRCC', '34786': 'FRCC', '34787': 'FRCC', '34788': 'FRCC', '34789': 'FRCC', '34797': 'FRCC', '34945': 'FRCC', '34946': 'FRCC', '34947': 'FRCC', '34948': 'FRCC', '34949': 'FRCC', '34950': 'FRCC', '34951': 'FRCC', '34952': 'FRCC', '34953': 'FRCC', '34954': 'FRCC', '34956': 'FRCC', '34957': 'FRCC', '34958': 'FRCC', '34972': 'FRCC', '34973': 'FRCC', '34974': 'FRCC', '34979': 'FRCC', '34981': 'FRCC', '34982': 'FRCC', '34983': 'FRCC', '34984': 'FRCC', '34985': 'FRCC', '34986': 'FRCC', '34987': 'FRCC', '34988': 'FRCC', '34990': 'FRCC', '34991': 'FRCC', '34992': 'FRCC', '34994': 'FRCC', '34995': 'FRCC', '34996': 'FRCC', '34997': 'FRCC', '35004': 'SRSO', '35005': 'SRSO', '35006': 'SRSO', '35007': 'SRSO', '35010': 'SRSO', '35011': 'SRSO', '35013': 'SRSO', '35014': 'SRSO', '35015': 'SRSO', '35016': 'SRSO', '35019': 'SRSO', '35020': 'SRSO', '35021': 'SRTV', '35022': 'SRSO', '35023': 'SRSO', '35031': 'SRSO', '35032': 'SRSO', '35033': 'SRSO', '35034': 'SRSO', '35035': 'SRSO', '35036': 'SRSO', '35038': 'SRSO', '35040': 'SRSO', '35041': 'SRSO', '35042': 'SRSO', '35043': 'SRSO', '35044': 'SRSO', '35045': 'SRSO', '35046': 'SRSO', '35048': 'SRSO', '35049': 'SRSO', '35051': 'SRSO', '35052': 'SRSO', '35053': 'SRSO', '35054': 'SRSO', '35055': 'SRSO', '35056': 'SRTV', '35057': 'SRTV', '35058': 'SRSO', '35060': 'SRSO', '35061': 'SRSO', '35062': 'SRSO', '35063': 'SRSO', '35064': 'SRSO', '35068': 'SRSO', '35070': 'SRTV', '35071': 'SRSO', '35072': 'SRSO', '35073': 'SRSO', '35074': 'SRSO', '35077': 'SRSO', '35078': 'SRSO', '35079': 'SRSO', '35080': 'SRSO', '35082': 'SRSO', '35083': 'SRSO', '35085': 'SRSO', '35087': 'SRTV', '35089': 'SRSO', '35091': 'SRSO', '35094': 'SRSO', '35096': 'SRSO', '35097': 'SRSO', '35098': 'SRTV', '35111': 'SRSO', '35112': 'SRSO', '35114': 'SRSO', '35115': 'SRSO', '35116': 'SRSO', '35117': 'SRSO', '35118': 'SRSO', '35119': 'SRSO', '35120': 'SRSO', '35121': 'SRSO', '35123': 'SRSO', '35124': 'SRSO', '35125': 'SRSO', '35126': 'SRSO', '35127': 'SRSO', '35128': 'SRSO', '35130': 'SRSO', '35131': 'SRSO', '35133': 'SRSO', '35135': 'SRSO', '35136': 'SRSO', '35137': 'SRSO', '35139': 'SRSO', '35142': 'SRSO', '35143': 'SRSO', '35144': 'SRSO', '35146': 'SRSO', '35147': 'SRSO', '35148': 'SRSO', '35149': 'SRSO', '35150': 'SRSO', '35151': 'SRSO', '35160': 'SRSO', '35161': 'SRSO', '35171': 'SRSO', '35172': 'SRSO', '35173': 'SRSO', '35175': 'SRTV', '35176': 'SRSO', '35178': 'SRSO', '35179': 'SRTV', '35180': 'SRSO', '35181': 'SRSO', '35182': 'SRSO', '35183': 'SRSO', '35184': 'SRSO', '35185': 'SRSO', '35186': 'SRSO', '35187': 'SRSO', '35188': 'SRSO', '35201': 'SRSO', '35202': 'SRSO', '35203': 'SRSO', '35204': 'SRSO', '35205': 'SRSO', '35206': 'SRSO', '35207': 'SRSO', '35208': 'SRSO', '35209': 'SRSO', '35210': 'SRSO', '35211': 'SRSO', '35212': 'SRSO', '35213': 'SRSO', '35214': 'SRSO', '35215': 'SRSO', '35216': 'SRSO', '35217': 'SRSO', '35218': 'SRSO', '35219': 'SRSO', '35220': 'SRSO', '35221': 'SRSO', '35222': 'SRSO', '35223': 'SRSO', '35224': 'SRSO', '35226': 'SRSO', '35228': 'SRSO', '35229': 'SRSO', '35231': 'SRSO', '35232': 'SRSO', '35233': 'SRSO', '35234': 'SRSO', '35235': 'SRSO', '35236': 'SRSO', '35237': 'SRSO', '35238': 'SRSO', '35242': 'SRSO', '35243': 'SRSO', '35244': 'SRSO', '35246': 'SRSO', '35249': 'SRSO', '35253': 'SRSO', '35254': 'SRSO', '35255': 'SRSO', '35259': 'SRSO', '35260': 'SRSO', '35261': 'SRSO', '35266': 'SRSO', '35282': 'SRSO', '35283': 'SRSO', '35285': 'SRSO', '35287': 'SRSO', '35288': 'SRSO', '35290': 'SRSO', '35291': 'SRSO', '35292': 'SRSO', '35293': 'SRSO', '35294': 'SRSO', '35295': 'SRSO', '35296': 'SRSO', '35297': 'SRSO', '35298': 'SRSO', '35401': 'SRSO', '35402': 'SRSO', '35403': 'SRSO', '35404': 'SRSO', '35405': 'SRSO', '35406': 'SRSO', '35407': 'SRSO', '35440': 'SRSO', '35441': 'SRSO', '35442': 'SRSO', '35443': 'SRSO', '35444': 'SRSO', '35446': 'SRSO', '35447': 'SRSO', '35448': 'SRSO', '35449': 'SRSO', '35452': 'SRSO', '35453': 'SRSO', '35456': 'SRSO', '35457': 'SRSO', '35458': 'SRSO', '35459': 'SRSO', '35460': 'SRSO', '35461': 'SRSO', '35462': 'SRSO', '35463': 'SRSO', '35464': 'SRSO', '35466': 'SRSO', '35468': 'SRSO', '35469': 'SRSO', '35470': 'SRSO', '35471': 'SRSO', '35473': 'SRSO', '35474': 'SRSO', '35475': 'SRSO', '35476': 'SRSO', '35477': 'SRSO', '35478': 'SRSO', '35480': 'SRSO', '35481': 'SRSO', '35482': 'SRSO', '35485': 'SRSO', '35486': 'SRSO', '35487': 'SRSO', '35490': 'SRSO', '35491': 'SRSO', '35501': 'SRSO', '35502': 'SRSO', '35503': 'SRSO', '35504': 'SRSO', '35540': 'SRSO', '35541': 'SRSO', '35542': 'SRSO', '35543': 'SRSO', '35544': 'SRSO', '35545': 'SRSO', '35546': 'SRSO', '35548': 'SRSO', '35549': 'SRSO', '35550': 'SRSO', '35551': 'SRSO', '35552': 'SRSO', '35553': 'SRSO', '35554': 'SRSO', '35555': 'SRSO', '35559': 'SRSO', '35560': 'SRSO', '35563': 'SRSO', '35564': 'SRSO', '35565': 'SRSO', '35570': 'SRSO', '35571': 'SRSO', '35572': 'SRSO', '35573': 'SRSO', '35574': 'SRSO', '35575': 'SRSO', '35576': 'SRSO', '35577': 'SRSO', '35578': 'SRSO', '35579': 'SRSO', '35580': 'SRSO', '35581': 'SRSO', '35582': 'SRSO', '35584': 'SRSO', '35585': 'SRSO', '35586': 'SRSO', '35587': 'SRSO', '35592': 'SRSO', '35593': 'SRSO', '35594': 'SRSO', '35601': 'SRTV', '35602': 'SRTV', '35603': 'SRTV', '35609': 'SRTV', '35610': 'SRTV', '35611': 'SRTV', '35612': 'SRTV', '35613': 'SRTV', '35614': 'SRTV', '35615': 'SRTV', '35616': 'SRTV', '35617': 'SRTV', '35618': 'SRTV', '35619': 'SRSO', '35620': 'SRTV', '35621': 'SRTV', '35622': 'SRTV', '35630': 'SRTV', '35631': 'SRTV', '35632': 'SRTV', '35633': 'SRTV', '35634': 'SRTV', '35640': 'SRTV', '35643': 'SRTV', '35645': 'SRTV', '35646': 'SRTV', '35647': 'SRTV', '35648': 'SRTV', '35649': 'SRTV', '35650': 'SRSO', '35651': 'SRTV', '35652': 'SRTV', '35653': 'SRSO', '35654': 'SRSO', '35660': 'SRTV', '35661': 'SRTV', '35662': 'SRTV', '35670': 'SRTV', '35671': 'SRTV', '35672': 'SRTV', '35673': 'SRTV', '35674': 'SRTV', '35677': 'SRTV', '35699': 'SRTV', '35739': 'SRTV', '35740': 'SRTV', '35741': 'SRTV', '35742': 'SRTV', '35744': 'SRTV', '35745': 'SRTV', '35746': 'SRTV', '35747': 'SRTV', '35748': 'SRTV', '35749': 'SRTV', '35750': 'SRTV', '35751': 'SRTV', '35752': 'SRTV', '35754': 'SRTV', '35755': 'SRTV', '35756': 'SRTV', '35757': 'SRTV', '35758': 'SRTV', '35759': 'SRTV', '35760': 'SRTV', '35761': 'SRTV', '35762': 'SRTV', '35763': 'SRTV', '35764': 'SRTV', '35765': 'SRTV', '35766': 'SRTV', '35767': 'SRTV', '35768': 'SRTV', '35769': 'SRTV', '35771': 'SRTV', '35772': 'SRTV', '35773': 'SRTV', '35774': 'SRTV', '35775': 'SRTV', '35776': 'SRTV', '35801': 'SRTV', '35802': 'SRTV', '35803': 'SRTV', '35804': 'SRTV', '35805': 'SRTV', '35806': 'SRTV', '35807': 'SRTV', '35808': 'SRTV', '35809': 'SRTV', '35810': 'SRTV', '35811': 'SRTV', '35812': 'SRTV', '35813': 'SRTV', '35814': 'SRTV', '35815': 'SRTV', '35816': 'SRTV', '35824': 'SRTV', '35893': 'SRTV', '35894': 'SRTV', '35895': 'SRTV', '35896': 'SRTV', '35897': 'SRTV', '35898': 'SRTV', '35899': 'SRTV', '35901': 'SRSO', '35902': 'SRSO', '35903': 'SRSO', '35904': 'SRSO', '35905': 'SRSO', '35906': 'SRSO', '35907': 'SRSO', '35950': 'SRTV', '35951': 'SRTV', '35952': 'SRSO', '35953': 'SRSO', '35954': 'SRSO', '35956': 'SRSO', '35957': 'SRSO', '35958': 'SRTV', '35959': 'SRTV', '35960': 'SRSO', '35961': 'SRSO', '35962': 'SRSO', '35963': 'SRTV', '35964': 'SRTV', '35966': 'SRTV', '35967': 'SRTV', '35968': 'SRTV', '35971': 'SRTV', '35972': 'SRSO', '35973': 'SRTV', '35974': 'SRTV', '35975': 'SRTV', '35976': 'SRSO', '35978': 'SRTV', '35979': 'SRTV', '35980': 'SRSO', '35981': 'SRTV', '35983': 'SRSO', '35984': 'SRTV', '35986': 'SRTV', '35987': 'SRSO', '35988': 'SRTV', '35989': 'SRTV', '35990': 'SRSO', '36003': 'SRSO', '36005': 'SRSO', '36006': 'SRSO', '36008': 'SRSO', '36009': 'SRSO', '36010': 'SRSO', '36013': 'SRSO', '36015': 'SRSO', '36016': 'SRSO', '36017': 'SRSO', '36020': 'SRSO', '36022': 'SRSO', '36023': 'SRSO', '36024': 'SRSO', '36025': 'SRSO', '36026': 'SRSO', '36027': 'SRSO', '36028': 'SRSO', '36029': 'SRSO', '36030': 'SRSO', '36031': 'SRSO', '36032': 'SRSO', '36033': 'SRSO', '36034': 'SRSO', '36035': 'SRSO', '36036': 'SRSO', '36037': 'SRSO', '36038': 'SRSO', '36039': 'SRSO', '36040': 'SRSO', '36041': 'SRSO', '36042': 'SRSO', '36043': 'SRSO', '36045': 'SRSO', '36046': 'SRSO', '36047': 'SRSO', '36048': 'SRSO', '36049': 'SRSO', '36051': 'SRSO', '36052': 'SRSO', '36053': 'SRSO', '36054': 'SRSO', '36057': 'SRSO', '36061': 'SRSO', '36062': 'SRSO', '36064': 'SRSO', '36065': 'SRSO', '36066': 'SRSO', '36067': 'SRSO', '36068': 'SRSO', '36069': 'SRSO', '36071': 'SRSO', '36072': 'SRSO', '36075': 'SRSO', '36078': 'SRSO', '36079': 'SRSO', '36080': 'SRSO', '36081': 'SRSO', '36082': 'SRSO', '36083': 'SRSO', '36087': 'SRSO', '36088': 'SRSO', '36089': 'SRSO', '36091': 'SRSO', '36092': 'SRSO', '36093': 'SRSO', '36101': 'SRSO', '36102': 'SRSO', '36103': 'SRSO', '36104': 'SRSO', '36105': 'SRSO', '36106': 'SRSO', '36107': 'SRSO', '36108': 'SRSO', '36109': 'SRSO', '36110': 'SRSO', '36111': 'SRSO', '36112': 'SRSO', '36113': 'SRSO', '36114': 'SRSO', '36115': 'SRSO', '36116': 'SRSO', '36117': 'SRSO', '36118': 'SRSO', '36119': 'SRSO', '36120': 'SRSO', '36121': 'SRSO', '36123': 'SRSO', '36124': 'SRSO', '36125': 'SRSO', '36130': 'SRSO', '36131': 'SRSO', '36132': 'SRSO', '36133': 'SRSO', '36134': 'SRSO', '36135': 'SRSO', '36140': 'SRSO', '36141': 'SRSO', '36142': 'SRSO', '36177': 'SRSO', '36191': 'SRSO', '36201': 'SRSO', '36202': 'SRSO', '36203': 'SRSO', '36204': 'SRSO', '36205': 'SRSO', '36206': 'SRSO', '36207': 'SRSO', '36210': 'SRSO', '36250': 'SRSO', '36251': 'SRSO', '36253': 'SRSO', '36254': 'SRSO', '36255': 'SRSO', '36256': 'SRSO', '36257': 'SRSO', '36258': 'SRSO', '36260': 'SRSO', '36261': 'SRSO', '36262': 'SRSO', '36263': 'SRSO', '36264': 'SRSO', '36265': 'SRSO', '36266': 'SRSO', '36267': 'SRSO', '36268': 'SRSO', '36269': 'SRSO', '36271': 'SRSO', '36272': 'SRSO', '36273': 'SRSO', '36274': 'SRSO', '36275': 'SRTV', '36276': 'SRSO', '36277': 'SRSO', '36278': 'SRSO', '36279': 'SRSO', '36280': 'SRSO', '36301': 'SRSO', '36302': 'SRSO', '36303': 'SRSO', '36304': 'SRSO', '36305': 'SRSO', '36310': 'SRSO', '36311': 'SRSO', '36312': 'SRSO', '36313': 'SRSO', '36314': 'SRSO', '36316': 'SRSO', '36317': 'SRSO', '36318': 'SRSO', '36319': 'SRSO', '36320': 'SRSO', '36321': 'SRSO', '36322': 'SRSO', '36323': 'SRSO', '36330': 'SRSO', '36331': 'SRSO', '36340': 'SRSO', '36343': 'SRSO', '36344': 'SRSO', '36345': 'SRSO', '36346': 'SRSO', '36349': 'SRSO', '36350': 'SRSO', '36351': 'SRSO', '36352': 'SRSO', '36353': 'SRSO', '36360': 'SRSO', '36361': 'SRSO', '36362': 'SRSO', '36370': 'SRSO', '36371': 'SRSO', '36373': 'SRSO', '36374': 'SRSO', '36375': 'SRSO', '36376': 'SRSO', '36401': 'SRSO', '36420': 'SRSO', '36421': 'SRSO', '36425': 'SRSO', '36426': 'SRSO', '36427': 'SRSO', '36429': 'SRSO', '36432': 'SRSO', '36435': 'SRSO', '36436': 'SRSO', '36439': 'SRSO', '36441': 'SRSO', '36442': 'SRSO', '36444': 'SRSO', '36445': 'SRSO', '36446': 'SRSO', '36449': 'SRSO', '36451': 'SRSO', '36453': 'SRSO', '36454': 'SRSO', '36455': 'SRSO', '36456': 'SRSO', '36457': 'SRSO', '36458': 'SRSO', '36460': 'SRSO', '36461': 'SRSO', '36462': 'SRSO', '36467': 'SRSO', '36470': 'SRSO', '36471': 'SRSO', '36473': 'SRSO', '36474': 'SRSO', '36475': 'SRSO', '36476': 'SRSO', '36477': 'SRSO', '36480': 'SRSO', '36481': 'SRSO', '36482': 'SRSO', '36483': 'SRSO', '36502': 'SRSO', '36503': 'SRSO', '36504': 'SRSO', '36505': 'SRSO', '36507': 'SRSO', '36509': 'SRSO', '36511': 'SRSO', '36512': 'SRSO', '36513': 'SRSO', '36515': 'SRSO', '36518': 'SRSO', '36521': 'SRSO', '36522': 'SRSO', '36523': 'SRSO', '36524': 'SRSO', '36525': 'SRSO', '36526': 'SRSO', '36527': 'SRSO', '36528': 'SRSO', '36529': 'SRSO', '36530': 'SRSO', '36532': 'SRSO', '36533': 'SRSO', '36535': 'SRSO', '36536': 'SRSO', '36538': 'SRSO', '36539': 'SRSO', '36540': 'SRSO', '36541': 'SRSO', '36542': 'SRSO', '36543': 'SRSO', '36544': 'SRSO', '36545': 'SRSO', '36547': 'SRSO', '36548': 'SRSO', '36549': 'SRSO', '36550': 'SRSO', '36551': 'SRSO', '36553': 'SRSO', '36555': 'SRSO', '36556': 'SRSO', '36558': 'SRSO', '36559': 'SRSO', '36560': 'SRSO', '36561': 'SRSO', '36562': 'SRSO', '36564': 'SRSO', '36567': 'SRSO', '36568': 'SRSO', '36569': 'SRSO', '36571': 'SRSO', '36572': 'SRSO', '36574': 'SRSO', '36575': 'SRSO', '36576': 'SRSO', '36577': 'SRSO', '36578': 'SRSO', '36579': 'SRSO', '36580': 'SRSO', '36581': 'SRSO', '36582': 'SRSO', '36583': 'SRSO', '36584': 'SRSO', '36585': 'SRSO', '36587': 'SRSO', '36590': 'SRSO', '36601': 'SRSO', '36602': 'SRSO', '36603': 'SRSO', '36604': 'SRSO', '36605': 'SRSO', '36606': 'SRSO', '36607': 'SRSO', '36608': 'SRSO', '36609': 'SRSO', '36610': 'SRSO', '36611': 'SRSO', '36612': 'SRSO', '36613': 'SRSO', '36615': 'SRSO', '36616': 'SRSO', '36617': 'SRSO', '36618': 'SRSO', '36619': 'SRSO', '36625': 'SRSO', '36628': 'SRSO', '36630': 'SRSO', '36633': 'SRSO', '36640': 'SRSO', '36641': 'SRSO', '36644': 'SRSO', '36652': 'SRSO', '36660': 'SRSO', '36663': 'SRSO', '36670': 'SRSO', '36671': 'SRSO', '36675': 'SRSO', '36685': 'SRSO', '36688': 'SRSO', '36689': 'SRSO', '36691': 'SRSO', '36693': 'SRSO', '36695': 'SRSO', '36701': 'SRSO', '36702': 'SRSO', '36703': 'SRSO', '36720': 'SRSO', '36721': 'SRSO', '36722': 'SRSO', '36723': 'SRSO', '36726': 'SRSO', '36727': 'SRSO', '36728': 'SRSO', '36732': 'SRSO', '36736': 'SRSO', '36738': 'SRSO', '36740': 'SRSO', '36741': 'SRSO', '36742': 'SRSO', '36744': 'SRSO', '36745': 'SRSO', '36748': 'SRSO', '36749': 'SRSO', '36750': 'SRSO', '36751': 'SRSO', '36752': 'SRSO', '36753': 'SRSO', '36754': 'SRSO', '36756': 'SRSO', '36758': 'SRSO', '36759': 'SRSO', '36761': 'SRSO', '36762': 'SRSO', '36763': 'SRSO', '36764': 'SRSO', '36765': 'SRSO', '36766': 'SRSO', '36767': 'SRSO', '36768': 'SRSO', '36769': 'SRSO', '36773': 'SRSO', '36775': 'SRSO', '36776': 'SRSO', '36782': 'SRSO', '36783': 'SRSO', '36784': 'SRSO', '36785': 'SRSO', '36786': 'SRSO', '36790': 'SRSO', '36792': 'SRSO', '36793': 'SRSO', '36801': 'SRSO', '36802': 'SRSO', '36803': 'SRSO', '36804': 'SRSO', '36830': 'SRSO', '36831': 'SRSO', '36832': 'SRSO', '36849': 'SRSO', '36850': 'SRSO', '36851': 'SRSO', '36852': 'SRSO', '36853': 'SRSO', '36854': 'SRSO', '36855': 'SRSO', '36856': 'SRSO', '36858': 'SRSO', '36859': 'SRSO', '36860': 'SRSO', '36861': 'SRSO', '36862': 'SRSO', '36863': 'SRSO', '36865': 'SRSO', '36866': 'SRSO', '36867': 'SRSO', '36868': 'SRSO', '36869': 'SRSO', '36870': 'SRSO', '36871': 'SRSO', '36872': 'SRSO', '36874': 'SRSO', '36875': 'SRSO', '36877': 'SRSO', '36879': 'SRSO', '36901': 'SRSO', '36904': 'SRSO', '36907': 'SRSO', '36908': 'SRSO', '36910': 'SRSO', '36912': 'SRSO', '36913': 'SRSO', '36915': 'SRSO', '36916': 'SRSO', '36919': 'SRSO', '36921': 'SRSO', '36922': 'SRSO', '36925': 'SRSO', '37010': 'SRTV', '37011': 'SRTV', '37012': 'SRTV', '37013': 'SRTV', '37014': 'SRTV', '37015': 'SRTV', '37016': 'SRTV', '37018': 'SRTV', '37019': 'SRTV', '37020': 'SRTV', '37022': 'SRTV', '37023': 'SRTV', '37024': 'SRTV', '37025': 'SRTV', '37026': 'SRTV', '37027': 'SRTV', '37028': 'SRTV', '37029': 'SRTV', '37030': 'SRTV', '37031': 'SRTV', '37032': 'SRTV', '37033': 'SRTV', '37034': 'SRTV', '37035': 'SRTV', '37036': 'SRTV', '37037': 'SRTV', '37040': 'SRTV', '37041': 'SRTV', '37042': 'SRTV', '37043': 'SRTV', '37044': 'SRTV', '37046': 'SRTV', '37047': 'SRTV', '37048': 'SRTV', '37049': 'SRTV', '37050': 'SRTV', '37051': 'SRTV', '37052': 'SRTV', '37055': 'SRTV', '37056': 'SRTV', '37057': 'SRTV', '37058': 'SRTV', '37059': 'SRTV', '37060': 'SRTV', '37061': 'SRTV', '37062': 'SRTV', '37063': 'SRTV', '37064': 'SRTV', '37065': 'SRTV', '37066': 'SRTV', '37067': 'SRTV', '37068': 'SRTV', '37069': 'SRTV', '37070': 'SRTV', '37071': 'SRTV', '37072': 'SRTV', '37073': 'SRTV', '37074': 'SRTV', '37075': 'SRTV', '37076': 'SRTV', '37077': 'SRTV', '37078': 'SRTV', '37079': 'SRTV', '37080': 'SRTV', '37082': 'SRTV', '37083': 'SRTV', '37085': 'SRTV', '37086': 'SRTV', '37087': 'SRTV', '37088': 'SRTV', '37089': 'SRTV', '37090': 'SRTV', '37091': 'SRTV', '37095': 'SRTV', '37096': 'SRTV', '37097': 'SRTV', '37098': 'SRTV', '37101': 'SRTV', '37110': 'SRTV', '37111': 'SRTV', '37115': 'SRTV', '37116': 'SRTV', '37118': 'SRTV', '37119': 'SRTV', '37121': 'SRTV', '37122': 'SRTV', '37127': 'SRTV', '37128': 'SRTV', '37129': 'SRTV', '37130': 'SRTV', '37131': 'SRTV', '37132': 'SRTV', '37133': 'SRTV', '37134': 'SRTV', '37135': 'SRTV', '37136': 'SRTV', '37137': 'SRTV', '37138': 'SRTV', '37140': 'SRTV', '37141': 'SRTV', '37142': 'SRTV', '37143': 'SRTV', '37144': 'SRTV', '37145': 'SRTV', '37146': 'SRTV', '37148': 'SRTV', '37149': 'SRTV', '37150': 'SRTV', '37151': 'SRTV', '37152': 'SRTV', '37153': 'SRTV', '37160': 'SRTV', '37161': 'SRTV', '37162': 'SRTV', '37165': 'SRTV', '37166': 'SRTV', '37167': 'SRTV', '37171': 'SRTV', '37172': 'SRTV', '37174': 'SRTV', '37175': 'SRTV', '37178': 'SRTV', '37179': 'SRTV', '37180': 'SRTV', '37181': 'SRTV', '37183': 'SRTV', '37184': 'SRTV', '37185': 'SRTV', '37186': 'SRTV', '37187': 'SRTV', '37188': 'SRTV', '37189': 'SRTV', '37190': 'SRTV', '37191': 'SRTV', '37201': 'SRTV', '37202': 'SRTV', '37203': 'SRTV', '37204': 'SRTV', '37205': 'SRTV', '37206': 'SRTV', '37207': 'SRTV', '37208': 'SRTV', '37209': 'SRTV', '37210': 'SRTV', '37211': 'SRTV', '37212': 'SRTV', '37213': 'SRTV', '37214': 'SRTV', '37215': 'SRTV', '37216': 'SRTV', '37217': 'SRTV', '37218': 'SRTV', '37219': 'SRTV', '37220': 'SRTV', '37221': 'SRTV', '37222': 'SRTV', '37224': 'SRTV', '37227': 'SRTV', '37228': 'SRTV', '37229': 'SRTV', '37230': 'SRTV', '37232': 'SRTV', '37234': 'SRTV', '37235': 'SRTV', '37236': 'SRTV', '37238': 'SRTV', '37240': 'SRTV', '37241': 'SRTV', '37242': 'SRTV', '37243': 'SRTV', '37244': 'SRTV', '37246': 'SRTV', '37249': 'SRTV', '37250': 'SRTV', '37301': 'SRTV', '37302': 'SRTV', '37303': 'SRTV', '37304': 'SRTV', '37305': 'SRTV', '37306': 'SRTV', '37307': 'SRTV', '37308': 'SRTV', '37309': 'SRTV', '37310': 'SRTV', '37311': 'SRTV', '37312': 'SRTV', '37313': 'SRTV', '37314': 'SRTV', '37315': 'SRTV', '37316': 'SRTV', '37317': 'SRTV', '37318': 'SRTV', '37320': 'SRTV', '37321': 'SRTV', '37322': 'SRTV', '37323': 'SRTV', '37324': 'SRTV', '37325': 'SRTV', '37326': 'SRTV', '37327': 'SRTV', '37328': 'SRTV', '37329': 'SRTV', '37330': 'SRTV', '37331': 'SRTV', '37332': 'SRTV', '37333': 'SRTV', '37334': 'SRTV', '37335': 'SRTV', '37336': 'SRTV', '37337': 'SRTV', '37338': 'SRTV', '37339': 'SRTV', '37340': 'SRTV', '37341': 'SRTV', '37342': 'SRTV', '37343': 'SRTV', '37345': 'SRTV', '37347': 'SRTV', '37348': 'SRTV', '37349': 'SRTV', '37350': 'SRTV', '37351': 'SRTV', '37352': 'SRTV', '37353': 'SRTV', '37354': 'SRTV', '37355': 'SRTV', '37356': 'SRTV', '37357': 'SRTV', '37359': 'SRTV', '37360': 'SRTV', '37361': 'SRTV', '37362': 'SRTV', '37363': 'SRTV', '37364': 'SRTV', '37365': 'SRTV', '37366': 'SRTV', '37367': 'SRTV', '37369': 'SRTV', '37370': 'SRTV', '37371': 'SRTV', '37373': 'SRTV', '37374': 'SRTV', '37375': 'SRTV', '37376': 'SRTV', '37377': 'SRTV', '37378': 'SRTV', '37379': 'SRTV', '37380': 'SRTV', '37381': 'SRTV', '37382': 'SRTV', '37383': 'SRTV', '37384': 'SRTV', '37385': 'SRTV', '37387': 'SRTV', '37388': 'SRTV', '37389': 'SRTV', '37391': 'SRTV', '37394': 'SRTV', '37396': 'SRTV', '37397': 'SRTV', '37398': 'SRTV', '37401': 'SRTV', '37402': 'SRTV', '37403': 'SRTV', '37404': 'SRTV', '37405': 'SRTV', '37406': 'SRTV', '37407': 'SRTV', '37408': 'SRTV', '37409': 'SRTV', '37410': 'SRTV', '37411': 'SRTV', '37412': 'SRTV', '37414': 'SRTV', '37415': 'SRTV', '37416': 'SRTV', '37419': 'SRTV', '37421': 'SRTV', '37422': 'SRTV', '37424': 'SRTV', '37450': 'SRTV', '37501': 'SRTV', '37544': 'SRTV', '37601': 'SRTV', '37602': 'SRTV', '37604': 'SRTV', '37605': 'SRTV', '37614': 'SRTV', '37615': 'SRTV', '37616': 'SRTV', '37617': 'SRTV', '37618': 'SRTV', '37620': 'SRTV', '37621': 'SRTV', '37625': 'SRTV', '37640': 'SRTV', '37641': 'SRTV', '37642': 'SRTV', '37643': 'SRTV', '37644': 'SRTV', '37645': 'RFCW', '37650': 'SRTV', '37656': 'SRTV', '37657': 'SRTV', '37658': 'SRTV', '37659': 'SRTV', '37660': 'SRTV', '37662': 'SRTV', '37663': 'SRTV', '37664': 'SRTV', '37665': 'SRTV', '37669': 'SRTV', '37680': 'SRTV', '37681': 'SRTV', '37682': 'SRTV', '37683': 'SRTV', '37684': 'SRTV', '37686': 'SRTV', '37687': 'SRVC', '37688': 'SRTV', '37690': 'SRTV', '37691': 'SRTV', '37692': 'SRTV', '37694': 'SRTV', '37699': 'SRTV', '37701': 'SRTV', '37705': 'SRTV', '37707': 'SRTV', '37708': 'SRTV', '37709': 'SRTV', '37710': 'SRTV', '37711': 'SRTV', '37713': 'SRTV', '37714': 'SRTV', '37715': 'SRTV', '37716': 'SRTV', '37717': 'SRTV', '37719': 'SRTV', '37721': 'SRTV', '37722': 'SRTV', '37723': 'SRTV', '37724': 'SRTV', '37725': 'SRTV', '37726': 'SRTV', '37727': 'SRTV', '37729': 'SRTV', '37730': 'SRTV', '37731': 'SRTV', '37732': 'SRTV', '37733': 'SRTV', '37737': 'SRTV', '37738': 'SRTV', '37742': 'SRTV', '37743': 'SRTV', '37744': 'SRTV', '37745': 'SRTV', '37748': 'SRTV', '37752': 'SRTV', '37753': 'SRTV', '37754': 'SRTV', '37755': 'SRTV', '37756': 'SRTV', '37757': 'SRTV', '37760': 'SRTV', '37762': 'SRTV', '37763': 'SRTV', '37764': 'SRTV', '37765': 'SRTV', '37766': 'SRTV', '37769': 'SRTV', '37770': 'SRTV', '37771': 'SRTV', '37772': 'SRTV', '37773': 'SRTV', '37774': 'SRTV', '37777': 'SRTV', '37778': 'SRTV', '37779': 'SRTV', '37801': 'SRTV', '37802': 'SRTV', '37803': 'SRTV', '37804': 'SRTV', '37806': 'SRTV', '37807': 'SRTV', '37809': 'SRTV', '37810': 'SRTV', '37811': 'SRTV', '37813': 'SRTV', '37814': 'SRTV', '37815': 'SRTV', '37816': 'SRTV', '37818': 'SRTV', '37819': 'SRTV', '37820': 'SRTV', '37821': 'SRTV', '37822': 'SRTV', '37824': 'SRTV', '37825': 'SRTV', '37826': 'SRTV', '37828': 'SRTV', '37829': 'SRTV', '37830': 'SRTV', '37831': 'SRTV', '37840': 'SRTV', '37841': 'SRTV', '37843': 'SRTV', '37845': 'SRTV', '37846': 'SRTV', '37847': 'SRTV', '37848': 'SRTV', '37849': 'SRTV', '37851': 'SRTV', '37852': 'SRTV', '37853': 'SRTV', '37854': 'SRTV', '37857': 'SRTV', '37860': 'SRTV', '37861': 'SRTV', '37862': 'SRTV', '37863': 'SRTV', '37864': 'SRTV', '37865': 'SRTV', '37866': 'SRTV', '37867': 'SRTV', '37868': 'SRTV', '37869': 'SRTV', '37870': 'SRTV', '37871': 'SRTV', '37872': 'SRTV', '37873': 'SRTV', '37874': 'SRTV', '37876': 'SRTV', '37877': 'SRTV', '37878': 'SRTV', '37879': 'SRTV', '37880': 'SRTV', '37881': 'SRTV', '37882': 'SRTV', '37885': 'SRTV', '37886': 'SRTV', '37887': 'SRTV', '37888': 'SRTV', '37890': 'SRTV', '37891': 'SRTV', '37892': 'SRTV', '37901': 'SRTV', '37902': 'SRTV', '37909': 'SRTV', '37912': 'SRTV', '37914': 'SRTV', '37915': 'SRTV', '37916': 'SRTV', '37917': 'SRTV', '37918': 'SRTV', '37919': 'SRTV', '37920': 'SRTV', '37921': 'SRTV', '37922': 'SRTV', '37923': 'SRTV', '37924': 'SRTV', '37927': 'SRTV', '37928': 'SRTV', '37929': 'SRTV', '37930': 'SRTV', '37931': 'SRTV', '37932': 'SRTV', '37933': 'SRTV', '37934': 'SRTV', '37938': 'SRTV', '37939': 'SRTV', '37940': 'SRTV', '37950': 'SRTV', '37995': 'SRTV', '37996': 'SRTV', '37997': 'SRTV', '37998': 'SRTV', '38001': 'SRTV', '38002': 'SRTV', '38004': 'SRTV', '38006': 'SRTV', '38007': 'SRTV', '38008': 'SRTV', '38010': 'SRTV', '38011': 'SRTV', '38012': 'SRTV', '38014': 'SRTV', '38015': 'SRMV', '38016': 'SRTV', '38017': 'SRTV', '38018': 'SRTV', '38019': 'SRTV', '38021': 'SRTV', '38023': 'SRTV', '38024': 'SRTV', '38025': 'SRTV', '38027': 'SRTV', '38028': 'SRTV', '38029': 'SRTV', '38030': 'SRTV', '38034': 'SRTV', '38036': 'SRTV', '38037': 'SRTV', '38039': 'SRTV', '38040': 'SRTV', '38041': 'SRMV', '38042': 'SRTV', '38044': 'SRTV', '38045': 'SRTV', '38046': 'SRTV', '38047': 'SRTV', '38048': 'SRTV', '38049': 'SRTV', '38050': 'SRTV', '38052': 'SRTV', '38053': 'SRTV', '38054': 'SRTV', '38055': 'SRTV', '38057': 'SRTV', '38058': 'SRMV', '38059': 'SRTV', '38060': 'SRTV', '38061': 'SRTV', '38063': 'SRTV', '38066': 'SRTV', '38067': 'SRTV', '38068': 'SRTV', '38069': 'SRTV', '38070': 'SRTV', '38071': 'SRMV', '38075': 'SRTV', '38076': 'SRTV', '38077': 'SRTV', '38079': 'SRTV', '38080': 'SRTV', '38083': 'SRTV', '38088': 'SRTV', '38101': 'SRTV', '38103': 'SRTV', '38104': 'SRTV', '38105': 'SRTV', '38106': 'SRTV', '38107': 'SRTV', '38108': 'SRTV', '38109': 'SRTV', '38111': 'SRTV', '38112': 'SRTV', '38113': 'SRTV', '38114': 'SRTV', '38115': 'SRTV', '38116': 'SRTV', '38117': 'SRTV', '38118': 'SRTV', '38119': 'SRTV', '38120': 'SRTV', '38122': 'SRTV', '38124': 'SRTV', '38125': 'SRTV', '38126': 'SRTV', '38127': 'SRTV', '38128': 'SRTV', '38130': 'SRTV', '38131': 'SRTV', '38132': 'SRTV', '38133': 'SRTV', '38134': 'SRTV', '38135': 'SRTV', '38136': 'SRTV', '38137': 'SRTV', '38138': 'SRTV', '38139': 'SRTV', '38141': 'SRTV', '38145': 'SRTV', '38147': 'SRTV', '38148': 'SRTV', '38150': 'SRTV', '38151': 'SRTV', '38152': 'SRTV', '38157': 'SRTV', '38159': 'SRTV', '38161': 'SRTV', '38163': 'SRTV', '38166': 'SRTV', '38167': 'SRTV', '38168': 'SRTV', '38173': 'SRTV', '38174': 'SRTV', '38175': 'SRTV', '38177': 'SRTV', '38181': 'SRTV', '38182': 'SRTV', '38183': 'SRTV', '38184': 'SRTV', '38186': 'SRTV', '38187': 'SRTV', '38188': 'SRTV', '38190': 'SRTV', '38193': 'SRTV', '38194': 'SRTV', '38197': 'SRTV', '38201': 'SRTV', '38220': 'SRTV', '38221': 'SRTV', '38222': 'SRTV', '38223': 'SRTV', '38224': 'SRTV', '38225': 'SRTV', '38226': 'SRTV', '38229': 'SRTV', '38230': 'SRTV', '38231': 'SRTV', '38232': 'SRTV', '38233': 'SRTV', '38235': 'SRTV', '38236': 'SRTV', '38237': 'SRTV', '38238': 'SRTV', '38240': 'SRTV', '38241': 'SRTV', '38242': 'SRTV', '38251': 'SRTV', '38253': 'SRTV', '38254': 'SRTV', '38255': 'SRTV', '38256': 'SRTV', '38257': 'SRTV', '38258': 'SRTV', '38259': 'SRTV', '38260': 'SRTV', '38261': 'SRTV', '38271': 'SRTV', '38281': 'SRTV', '38301': 'SRTV', '38302': 'SRTV', '38303': 'SRTV', '38305': 'SRTV', '38308': 'SRTV', '38310': 'SRTV', '38311': 'SRTV', '38313': 'SRTV', '38314': 'SRTV', '38315': 'SRTV', '38316': 'SRTV', '38317': 'SRTV', '38318': 'SRTV', '38320': 'SRTV', '38321': 'SRTV', '38324': 'SRTV', '38326': 'SRTV', '38327': 'SRTV', '38328': 'SRTV', '38329': 'SRTV', '38330': 'SRTV', '38331': 'SRTV', '38332': 'SRTV', '38333': 'SRTV', '38334': 'SRTV', '38336': 'SRTV', '38337': 'SRTV', '38338': 'SRTV', '38339': 'SRTV', '38340': 'SRTV', '38341': 'SRTV', '38342': 'SRTV', '38343': 'SRTV', '38344': 'SRTV', '38345': 'SRTV', '38346': 'SRTV', '38347': 'SRTV', '38348': 'SRTV', '38351': 'SRTV', '38352': 'SRTV', '38355': 'SRTV', '38356': 'SRTV', '38357': 'SRTV', '38358': 'SRTV', '38359': 'SRTV', '38361': 'SRTV', '38362': 'SRTV', '38363': 'SRTV', '38365': 'SRTV', '38366': 'SRTV', '38367': 'SRTV', '38368': 'SRTV', '38369': 'SRTV', '38370': 'SRTV', '38371': 'SRTV', '38372': 'SRTV', '38374': 'SRTV', '38375': 'SRTV', '38376': 'SRTV', '38377': 'SRTV', '38378': 'SRTV', '38379': 'SRTV', '38380': 'SRTV', '38381': 'SRTV', '38382': 'SRTV', '38387': 'SRTV', '38388': 'SRTV', '38389': 'SRTV', '38390': 'SRTV', '38391': 'SRTV', '38392': 'SRTV', '38393': 'SRTV', '38401': 'SRTV', '38402': 'SRTV', '38425': 'SRTV', '38449': 'SRTV', '38450': 'SRTV', '38451': 'SRTV', '38452': 'SRTV', '38453': 'SRTV', '38454': 'SRTV', '38455': 'SRTV', '38456': 'SRTV', '38457': 'SRTV', '38459': 'SRTV', '38460': 'SRTV', '38461': 'SRTV', '38462': 'SRTV', '38463': 'SRTV', '38464': 'SRTV', '38468': 'SRTV', '38469': 'SRTV', '38471': 'SRTV', '38472': 'SRTV', '38473': 'SRTV', '38474': 'SRTV', '38475': 'SRTV', '38476': 'SRTV', '38477': 'SRTV', '38478': 'SRTV', '38481': 'SRTV', '38482': 'SRTV', '38483': 'SRTV', '38485': 'SRTV', '38486': 'SRTV', '38487': 'SRTV', '38488': 'SRTV', '38501': 'SRTV', '38502': 'SRTV', '38503': 'SRTV', '38504': 'SRTV', '38505': 'SRTV', '38506': 'SRTV', '38541': 'SRTV', '38542': 'SRTV', '38543': 'SRTV', '38544': 'SRTV', '38545': 'SRTV', '38547': 'SRTV', '38548': 'SRTV', '38549': 'SRTV', '38550': 'SRTV', '38551': 'SRTV', '38552': 'SRTV', '38553': 'SRTV', '38554': 'SRTV', '38555': 'SRTV', '38556': 'SRTV', '38557': 'SRTV', '38558': 'SRTV', '38559': 'SRTV', '38560': 'SRTV', '38562': 'SRTV', '38563': 'SRTV', '38564': 'SRTV', '38565': 'SRTV', '38567': 'SRTV', '38568': 'SRTV', '38569': 'SRTV', '38570': 'SRTV', '38571': 'SRTV', '38572': 'SRTV', '38573': 'SRTV', '38574': 'SRTV', '38575': 'SRTV', '38577': 'SRTV', '38578': 'SRTV', '38579': 'SRTV', '38580': 'SRTV', '38581': 'SRTV', '38582': 'SRTV', '38583': 'SRTV', '38585': 'SRTV', '38587': 'SRTV', '38588': 'SRTV', '38589': 'SRTV', '38601': 'SRTV', '38602': 'SRTV', '38603': 'SRTV', '38606': 'SRMV', '38609': 'SRMV', '38610': 'SRTV', '38611': 'SRTV', '38614': 'SRMV', '38617': 'SRMV', '38618': 'SRMV', '38619': 'SRMV', '38620': 'SRMV', '38621': 'SRMV', '38622': 'SRTV', '38623': 'SRTV', '38625': 'SRTV', '38626': 'SRMV', '38627': 'SRTV', '38628': 'SRMV', '38629': 'SRTV', '38630': 'SRMV', '38631': 'SRMV', '38632': 'SRMV', '38633': 'SRTV', '38634': 'SRTV', '38635': 'SRTV', '38637': 'SRMV', '38638': 'SRMV', '38639': 'SRSO', '38641': 'SRMV', '38642': 'SRTV', '38643': 'SRMV', '38644': 'SRSO', '38645': 'SRMV', '38646': 'SRMV', '38647': 'SRTV', '38649': 'SRTV', '38650': 'SRTV', '38651': 'SRMV', '38652': 'SRTV', '38654': 'SRMV', '38655': 'SRTV', '38658': 'SRMV', '38659': 'SRTV', '38661': 'SRTV', '38663': 'SRTV', '38664': 'SRMV', '38665': 'SRMV', '38666': 'SRMV', '38668': 'SRMV', '38669': 'SRSO', '38670': 'SRMV', '38671': 'SRMV', '38672': 'SRMV', '38673': 'SRTV', '38674': 'SRTV', '38675': 'SRTV', '38676': 'SRMV', '38677': 'SRTV', '38679': 'SRTV', '38680': 'SRMV', '38683': 'SRTV', '38685': 'SRTV', '38686': 'SRMV', '38701': 'SRMV', '38702': 'SRSO', '38703': 'SRMV', '38704': 'SRMV', '38720': 'SRMV', '38721': 'SRMV', '38722': 'SRSO', '38723': 'SRSO', '38725': 'SRMV', '38726': 'SRMV', '38730': 'SRMV', '38731': 'SRSO', '38732': 'SRMV', '38733': 'SRMV', '38736': 'SRMV', '38737': 'SRSO', '38738': 'SRMV', '38739': 'SRMV', '38740': 'SRSO', '38744': 'SRMV', '38745': 'SRMV', '38746': 'SRSO', '38748': 'SRMV', '38749': 'SRMV', '38751': 'SRMV', '38753': 'SRMV', '38754': 'SRMV', '38756': 'SRMV', '38759': 'SRMV', '38760': 'SRMV', '38761': 'SRMV', '38762': 'SRSO', '38764': 'SRMV', '38765': 'SRMV', '38767': 'SRMV', '38768': 'SRMV', '38769': 'SRSO', '38771': 'SRMV', '38772': 'SRMV', '38773': 'SRSO', '38774': 'SRSO', '38776': 'SRSO', '38778': 'SRMV', '38780': 'SRSO', '38781': 'SRSO', '38782': 'SRMV', '38801': 'SRTV', '38802': 'SRTV', '38803': 'SRTV', '38804': 'SRTV', '38820': 'SRTV', '38821': 'SRTV', '38824': 'SRTV', '38825': 'SRTV', '38826': 'SRTV', '38827': 'SRTV', '38828': 'SRTV', '38829': 'SRTV', '38833': 'SRTV', '38834': 'SRTV', '38835': 'SRTV', '38838': 'SRTV', '38839': 'SRTV', '38841': 'SRTV', '38843': 'SRTV', '38844': 'SRTV', '38846': 'SRTV', '38847': 'SRTV', '38848': 'SRTV', '38849': 'SRTV', '38850': 'SRTV', '38851': 'SRTV', '38852': 'SRTV', '38855': 'SRTV', '38856': 'SRTV', '38857': 'SRTV', '38858': 'SRTV', '38859': 'SRTV', '38860': 'SRTV', '38862': 'SRTV', '38863': 'SRTV', '38864': 'SRTV', '38865': 'SRTV', '38866': 'SRTV', '38868': 'SRTV', '38869': 'SRTV', '38870': 'SRTV', '38871': 'SRTV', '38873': 'SRTV', '38874': 'SRTV', '38875': 'SRTV', '38876': 'SRTV', '38877': 'SRTV', '38878': 'SRTV', '38879': 'SRTV', '38880': 'SRTV', '38901': 'SRSO', '38902': 'SRMV', '38913': 'SRTV', '38914': 'SRMV', '38915': 'SRTV', '38916': 'SRTV', '38917': 'SRMV', '38920': 'SRSO', '38921': 'SRSO', '38922': 'SRMV', '38923': 'SRMV', '38924': 'SRMV', '38925': 'SRMV', '38926': 'SRMV', '38927': 'SRMV', '38928': 'SRSO', '38929': 'SRSO', '38930': 'SRMV', '38935': 'SRMV', '38940': 'SRSO', '38941': 'SRMV', '38943': 'SRSO', '38944': 'SRMV', '38945': 'SRMV', '38946': 'SRMV', '38947': 'SRSO', '38948': 'SRMV', '38949': 'SRTV', '38950': 'SRTV', '38951': 'SRTV', '38952': 'SRMV', '38953': 'SRMV', '38954': 'SRMV', '38955': 'SRTV', '38957': 'SRMV', '38958': 'SRMV', '38959': 'SRSO', '38960': 'SRMV', '38961': 'SRMV', '38962': 'SRTV', '38963': 'SRMV', '38964': 'SRMV', '38965': 'SRTV', '38966': 'SRMV', '38967': 'SRMV', '39038': 'SRMV', '39039': 'SRMV', '39040': 'SRMV', '39041': 'SRMV', '39042': 'SRTV', '39043': 'SRMV', '39044': 'SRMV', '39045': 'SRTV', '39046': 'SRTV', '39047': 'SRTV', '39051': 'SRTV', '39054': 'SRMV', '39056': 'SRMV', '39057': 'SRTV', '39058': 'SRMV', '39059': 'SRMV', '39060': 'SRMV', '39061': 'SRSO', '39062': 'SRMV', '39063': 'SRTV', '39066': 'SRMV', '39067': 'SRTV', '39069': 'SRMV', '39071': 'SRMV', '39072': 'SRMV', '39073': 'SRMV', '39074': 'SRTV', '39077': 'SRMV', '39078': 'SRMV', '39079': 'SRMV', '39080': 'SRSO', '39081': 'SRMV', '39082': 'SRMV', '39083': 'SRMV', '39086': 'SRMV', '39087': 'SRSO', '39088': 'SRMV', '39090': 'SRTV', '39092': 'SRTV', '39094': 'SRTV', '39095': 'SRMV', '39096': 'SRMV', '39097': 'SRMV', '39098': 'SRTV', '39107': 'SRTV', '39108': 'SRTV', '39109': 'SRTV', '39110': 'SRMV', '39111': 'SRMV', '39113': 'SRMV', '39114': 'SRMV', '39115': 'SRMV', '39116': 'SRMV', '39117': 'SRTV', '39119': 'SRMV', '39120': 'SRMV', '39121': 'SRMV', '39122': 'SRMV', '39130': 'SRMV', '39140': 'SRMV', '39144': 'SRMV', '39145': 'SRTV', '39146': 'SRMV', '39148': 'SRMV', '39149': 'SRMV', '39150': 'SRMV', '39151': 'SRSO', '39152': 'SRSO', '39153': 'SRMV', '39154': 'SRMV', '39156': 'SRMV', '39157': 'SRMV', '39158': 'SRMV', '39159': 'SRMV', '39160': 'SRTV', '39161': 'SRTV', '39162': 'SRMV', '39163': 'SRMV', '39165': 'SRMV', '39166': 'SRMV', '39167': 'SRMV', '39168': 'SRSO', '39169': 'SRMV', '39170': 'SRMV', '39171': 'SRTV', '39173': 'SRMV', '39174': 'SRMV', '39175': 'SRMV', '39176': 'SRMV', '39177': 'SRMV', '39179': 'SRMV', '39180': 'SRMV', '39181': 'SRMV', '39182': 'SRMV', '39183': 'SRMV', '39189': 'SRTV', '39190': 'SRMV', '39191': 'SRMV', '39192': 'SRTV', '39193': 'SRSO', '39194': 'SRMV', '39201': 'SRMV', '39202': 'SRMV', '39203': 'SRMV', '39204': 'SRMV', '39205': 'SRMV', '39206': 'SRMV', '39207': 'SRMV', '39208': 'SRMV', '39209': 'SRMV', '39210': 'SRMV', '39211': 'SRMV', '39212': 'SRMV', '39213': 'SRMV', '39215': 'SRMV', '39216': 'SRMV', '39217': 'SRMV', '39218': 'SRMV', '39225': 'SRMV', '39232': 'SRMV', '39236': 'SRMV', '39250': 'SRMV', '39269': 'SRMV', '39271': 'SRMV', '39272': 'SRMV', '39282': 'SRMV', '39283': 'SRMV', '39284': 'SRMV', '39286': 'SRMV', '39288': 'SRMV', '39289': 'SRMV', '39296': 'SRMV', '39298': 'SRMV', '39301': 'SRTV', '39302': 'SRSO', '39303': 'SRSO', '39304': 'SRSO', '39305': 'SRTV', '39307': 'SRTV', '39309': 'SRTV', '39320': 'SRTV', '39322': 'SRSO', '39323': 'SRTV', '39324': 'SRSO', '39325': 'SRTV', '39326': 'SRTV', '39327': 'SRTV', '39328': 'SRTV', '39330': 'SRTV', '39332': 'SRTV', '39335': 'SRTV', '39336': 'SRTV', '39337': 'SRTV', '39338': 'SRSO', '39339': 'SRTV', '39341': 'SRTV', '39342': 'SRSO', '39345': 'SRSO', '39346': 'SRTV', '39347': 'SRTV', '39348': 'SRSO', '39350': 'SRTV', '39352': 'SRTV', '39354': 'SRTV', '39355': 'SRTV', '39356': 'SRSO', '39358': 'SRTV', '39359': 'SRTV', '39360': 'SRSO', '39361': 'SRTV', '39362': 'SRSO', '39363': 'SRTV', '39364': 'SRTV', '39365': 'SRTV', '39366': 'SRTV', '39367': 'SRSO', '39401': 'SRSO', '39402': 'SRSO', '39403': 'SRSO', '39404': 'SRSO', '39406': 'SRSO', '39407': 'SRSO', '39421': 'SRSO', '39422': 'SRSO', '39423': 'SRSO', '39425': 'SRSO', '39426': 'SRSO', '39427': 'SRSO', '39428': 'SRSO', '39429': 'SRSO', '39436': 'SRSO', '39437': 'SRSO', '39439': 'SRSO', '39440': 'SRSO', '39441': 'SRSO', '39442': 'SRSO', '39443': 'SRSO', '39451': 'SRSO', '39452': 'SRSO', '39455': 'SRSO', '39456': 'SRSO', '39457': 'SRSO', '39459': 'SRSO', '39460': 'SRSO', '39461': 'SRSO', '39462': 'SRSO', '39463': 'SRSO', '39464': 'SRSO', '39465': 'SRSO', '39466': 'SRSO', '39470': 'SRSO', '39474': 'SRSO', '39475': 'SRSO', '39476': 'SRSO', '39477': 'SRSO', '39478': 'SRSO', '39479': 'SRSO', '39480': 'SRSO', '39481': 'SRSO', '39482': 'SRSO', '39483': 'SRSO', '39501': 'SRSO', '39502': 'SRSO', '39503': 'SRSO', '39505': 'SRSO', '39506': 'SRSO', '39507': 'SRSO', '39520': 'SRSO', '39521': 'SRSO', '39522': 'SRSO', '39525': 'SRSO', '39529': 'SRSO', '39530': 'SRSO', '39531': 'SRSO', '39532': 'SRSO', '39533': 'SRSO', '39534': 'SRSO', '39535': 'SRSO', '39540': 'SRSO', '39552': 'SRSO', '39553': 'SRSO', '39555': 'SRSO', '39556': 'SRSO', '39558': 'SRSO', '39560': 'SRSO', '39561': 'SRSO', '39562': 'SRSO', '39563': 'SRSO', '39564': 'SRSO', '39565': 'SRSO', '39566': 'SRSO', '39567': 'SRSO', '39568': 'SRSO', '39569': 'SRSO', '39571': 'SRSO', '39572': 'SRSO', '39573': 'SRSO', '39574': 'SRSO', '39576': 'SRSO', '39577': 'SRSO', '39581': 'SRSO', '39595': 'SRSO', '39601': 'SRMV', '39602': 'SRMV', '39603': 'SRMV', '39629': 'SRMV', '39630': 'SRMV', '39631': 'SRMV', '39632': 'SRSO', '39633': 'SRMV', '39635': 'SRMV', '39638': 'SRMV', '39641': 'SRSO', '39643': 'SRSO', '39645': 'SRMV', '39647': 'SRMV', '39648': 'SRMV', '39649': 'SRMV', '39652': 'SRMV', '39653': 'SRMV', '39654': 'SRMV', '39656': 'SRSO', '39657': 'SRMV', '39661': 'SRMV', '39662': 'SRSO', '39663': 'SRMV', '39664': 'SRSO', '39665': 'SRMV', '39666': 'SRMV', '39667': 'SRMV', '39668': 'SRMV', '39669': 'SRMV', '39701': 'SRTV', '39702': 'SRTV', '39703': 'SRTV', '39704': 'SRTV', '39705': 'SRTV', '39710': 'SRTV', '39730': 'SRTV', '39735': 'SRTV', '39736': 'SRTV', '39737': 'SRTV', '39739': 'SRTV', '39740': 'SRTV', '39741': 'SRTV', '39743': 'SRTV', '39744': 'SRTV', '39745': 'SRTV', '39746': 'SRTV', '39747': 'SRTV', '39750': 'SRTV', '39751': 'SRTV', '39752': 'SRTV', '39753': 'SRTV', '39754': 'SRTV', '39755': 'SRTV', '39756': 'SRTV', '39759': 'SRTV', '39760': 'SRTV', '39762': 'SRTV', '39766': 'SRTV', '39767': 'SRTV', '39769': 'SRTV', '39771': 'SRTV', '39772': 'SRTV', '39773': 'SRTV', '39776': 'SRTV', '39813': 'SRSO', '39815': 'SRSO', '39817': 'SRSO', '39818': 'SRSO', '39819': 'SRSO', '39823': 'SRSO', '39824': 'SRSO', '39825': 'SRSO', '39826': 'SRSO', '39827': 'SRSO', '39828': 'SRSO', '39829': 'SRSO', '39832': 'SRVC', '39834': 'SRSO', '39836': 'SRSO', '39837': 'SRSO', '39840': 'SRSO', '39841': 'SRSO', '39842': 'SRSO', '39845': 'SRSO', '39846': 'SRSO', '39851': 'SRSO', '39852': 'SRSO', '39854': 'SRSO', '39859': 'SRSO', '39861': 'SRSO', '39862': 'SRSO', '39866': 'SRSO', '39867': 'SRSO', '39870': 'SRSO', '39877': 'SRSO', '39885': 'SRSO', '39886': 'SRSO', '39897': 'SRSO', '39901': 'SRSO', '40003': 'SRTV', '40004': 'SRTV', '40006': 'SRTV', '40007': 'SRTV', '40008': 'SRTV', '40009': 'SRTV', '40010': 'SRTV', '40011': 'SRTV', '40012': 'SRTV', '40013': 'SRTV', '40014': 'SRTV', '40018': 'SRTV', '40019': 'SRTV', '40020': 'SRTV', '40022': 'SRTV', '40023': 'SRTV', '40025': 'SRTV', '40026': 'SRTV', '40027': 'SRTV', '40031': 'SRTV', '40032': 'SRTV', '40033': 'SRTV', '40036': 'SRTV', '40037': 'SRTV', '40040': 'SRTV', '40041': 'SRTV', '40045': 'SRTV', '40046': 'SRTV', '40047': 'SRTV', '40048': 'SRTV', '40049': 'SRTV', '40050': 'SRTV', '40051': 'SRTV', '40052': 'SRTV', '40055': 'SRTV', '40056': 'SRTV', '40057': 'SRTV', '40058': 'SRTV', '40059': 'SRTV', '40060': 'SRTV', '40061': 'SRTV', '40062': 'SRTV', '40063': 'SRTV', '40065': 'SRTV', '40066': 'SRTV', '40067': 'SRTV', '40068': 'SRTV', '40069': 'SRTV', '40070': 'SRTV', '40071': 'SRTV', '40075': 'SRTV', '40076': 'SRTV', '40077': 'SRTV', '40078': 'SRTV', '40104': 'SRTV', '40107': 'SRTV', '40108': 'SRTV', '40109': 'SRTV', '40110': 'SRTV', '40111': 'SRTV', '40115': 'SRTV', '40117': 'SRTV', '40118': 'SRTV', '40119': 'SRTV', '40121': 'SRTV', '40122': 'SRTV', '40129': 'SRTV', '40140': 'SRTV', '40142': 'SRTV', '40143': 'SRTV', '40144': 'SRTV', '40145': 'SRTV', '40146': 'SRTV', '40150': 'SRTV', '40152': 'SRTV', '40153': 'SRTV', '40155': 'SRTV', '40157': 'SRTV', '40159': 'SRTV', '40160': 'SRTV', '40161': 'SRTV', '40162': 'SRTV', '40165': 'SRTV', '40170': 'SRTV', '40171': 'SRTV', '40175': 'SRTV', '40176': 'SRTV', '40177': 'SRTV', '40178': 'SRTV', '40201': 'SRTV', '40202': 'SRTV', '40203': 'SRTV', '40204': 'SRTV', '40205': 'SRTV', '40206': 'SRTV', '40207': 'SRTV', '40208': 'SRTV', '40209': 'SRTV', '40210': 'SRTV', '40211': 'SRTV', '40212': 'SRTV', '40213': 'SRTV', '40214': 'SRTV', '40215': 'SRTV', '40216': 'SRTV', '40217': 'SRTV', '40218': 'SRTV', '40219': 'SRTV', '40220': 'SRTV', '40221': 'SRTV', '40222': 'SRTV', '40223': 'SRTV', '40224': 'SRTV', '40225': 'SRTV', '40228': 'SRTV', '40229': 'SRTV', '40231': 'SRTV', '40232': 'SRTV', '40233': 'SRTV', '40241': 'SRTV', '40242': 'SRTV', '40243': 'SRTV', '40245': 'SRTV', '40250': 'SRTV', '40251': 'SRTV', '40252': 'SRTV', '40253': 'SRTV', '40255': 'SRTV', '40256': 'SRTV', '40257': 'SRTV', '40258': 'SRTV', '40259': 'SRTV', '40261': 'SRTV', '40266': 'SRTV', '40268': 'SRTV', '40269': 'SRTV', '40270': 'SRTV', '40272': 'SRTV', '40280': 'SRTV', '40281': 'SRTV', '40282': 'SRTV', '40283': 'SRTV', '40285': 'SRTV', '40287': 'SRTV', '40289': 'SRTV', '40290': 'SRTV', '40291': 'SRTV', '40292': 'SRTV', '40293': 'SRTV', '40294': 'SRTV', '40295': 'SRTV', '40296': 'SRTV', '40297': 'SRTV', '40298': 'SRTV', '40299': 'SRTV', '40310': 'SRTV', '40311': 'SRTV', '40312': 'SRTV', '40313': 'SRTV', '40316': 'SRTV', '40317': 'SRTV', '40319': 'SRTV', '40322': 'SRTV', '40324': 'SRTV', '40328': 'SRTV', '40330': 'SRTV', '40334': 'SRTV', '40336': 'SRTV', '40337': 'SRTV', '40339': 'SRTV', '40340': 'SRTV', '40342': 'SRTV', '40346': 'SRTV', '40347': 'SRTV', '40348': 'SRTV', '40350': 'SRTV', '40351': 'SRTV', '40353': 'SRTV', '40355': 'SRTV', '40356': 'SRTV', '40357': 'SRTV', '40358': 'SRTV', '40359': 'SRTV', '40360': 'SRTV', '40361': 'SRTV', '40362': 'SRTV', '40363': 'SRTV', '40366': 'SRTV', '40370': 'SRTV', '40371': 'SRTV', '40372': 'SRTV', '40374': 'SRTV', '40376': 'SRTV', '40379': 'SRTV', '40380': 'SRTV', '40383': 'SRTV', '40384': 'SRTV', '40385': 'SRTV', '40387': 'SRTV', '40390': 'SRTV', '40391': 'SRTV', '40392': 'SRTV', '40402': 'SRTV', '40403': 'SRTV', '40404': 'SRTV', '40405': 'SRTV', '40409': 'SRTV', '40410': 'SRTV', '40419': 'SRTV', '40422': 'SRTV', '40423': 'SRTV', '40434': 'SRTV', '40437': 'SRTV', '40440': 'SRTV', '40442': 'SRTV', '40444': 'SRTV', '40445': 'SRTV', '40446': 'SRTV', '40447': 'SRTV', '40448': 'SRTV', '40452': 'SRTV', '40456': 'SRTV', '40460': 'SRTV', '40461': 'SRTV', '40464': 'SRTV', '40468': 'SRTV', '40472': 'SRTV', '40473': 'SRTV', '40475': 'SRTV', '40476': 'SRTV', '40481': 'SRTV', '40484': 'SRTV', '40486': 'SRTV', '40488': 'SRTV', '40489': 'SRTV', '40492': 'SRTV', '40502': 'SRTV', '40503': 'SRTV', '40504': 'SRTV', '40505': 'SRTV', '40506': 'SRTV', '40507': 'SRTV', '40508': 'SRTV', '40509': 'SRTV', '40510': 'SRTV', '40511': 'SRTV', '40512': 'SRTV', '40513': 'SRTV', '40514': 'SRTV', '40515': 'SRTV', '40516': 'SRTV', '40517': 'SRTV', '40522': 'SRTV', '40523': 'SRTV', '40524': 'SRTV', '40526': 'SRTV', '40533': 'SRTV', '40536': 'SRTV', '40544': 'SRTV', '40546': 'SRTV', '40550': 'SRTV', '40555': 'SRTV', '40574': 'SRTV', '40575': 'SRTV', '40576': 'SRTV', '40577': 'SRTV', '40578': 'SRTV', '40579': 'SRTV', '40580': 'SRTV', '40581': 'SRTV', '40582': 'SRTV', '40583': 'SRTV', '40588': 'SRTV', '40591': 'SRTV', '40598': 'SRTV', '40601': 'SRTV', '40602': 'SRTV', '40603': 'SRTV', '40604': 'SRTV', '40618': 'SRTV', '40619': 'SRTV', '40620': 'SRTV', '40621': 'SRTV', '40622': 'SRTV', '40701': 'SRTV', '40702': 'SRTV', '40724': 'SRTV', '40729': 'SRTV', '40730': 'SRTV', '40734': 'SRTV', '40737': 'SRTV', '40740': 'SRTV', '40741': 'SRTV', '40742': 'SRTV', '40743': 'SRTV', '40744': 'SRTV', '40745': 'SRTV', '40755': 'SRTV', '40759': 'SRTV', '40763': 'SRTV', '40769': 'SRTV', '40771': 'SRTV', '40801': 'SRTV', '40803': 'RFCW', '40806': 'SRTV', '40807': 'SRTV', '40808': 'SRTV', '40810': 'SRTV', '40813': 'SRTV', '40815': 'SRTV', '40816': 'SRTV', '40818': 'SRTV', '40819': 'SRTV', '40820': 'SRTV', '40823': 'SRTV', '40824': 'SRTV', '40826': 'SRTV', '40827': 'SRTV', '40828': 'SRTV', '40829': 'SRTV', '40830': 'SRTV', '40831': 'SRTV', '40840': 'SRTV', '40843': 'SRTV', '40844': 'RFCW', '40845': 'SRTV', '40847': 'SRTV', '40849': 'SRTV', '40854': 'SRTV', '40855': 'SRTV', '40856': 'SRTV', '40858': 'SRTV', '40862': 'SRTV', '40863': 'SRTV', '40865': 'SRTV', '40868': 'SRTV', '40870': 'SRTV', '40873': 'SRTV', '40874': 'SRTV', '40902': 'SRTV', '40903': 'SRTV', '40906': 'SRTV', '40913': 'SRTV', '40914': 'SRTV', '40915': 'SRTV', '40921': 'SRTV', '40923': 'SRTV', '40927': 'SRTV', '40930': 'SRTV', '40932': 'SRTV', '40935': 'SRTV', '40939': 'SRTV', '40940': 'SRTV', '40941': 'SRTV', '40943': 'SRTV', '40944': 'SRTV', '40946': 'SRTV', '40949': 'SRTV', '40951': 'SRTV', '40953': 'SRTV', '40955': 'SRTV', '40958': 'SRTV', '40962': 'SRTV', '40964': 'SRTV', '40965': 'SRTV', '40972': 'SRTV', '40977': 'SRTV', '40979': 'SRTV', '40981': 'SRTV', '40982': 'SRTV', '40983': 'SRTV', '40988': 'SRTV', '40995': 'SRTV', '40997': 'SRTV', '41001': 'SRTV', '41002': 'SRTV', '41003': 'SRTV', '41004': 'SRTV', '41005': 'SRTV', '41006': 'SRTV', '41007': 'SRTV', '41008': 'SRTV', '41010': 'SRTV', '41011': 'SRTV', '41012': 'SRTV', '41014': 'SRTV', '41015': 'SRTV', '41016': 'SRTV', '41017': 'SRTV', '41018': 'SRTV', '41019': 'SRTV', '41022': 'SRTV', '41030': 'SRTV', '41031': 'SRTV', '41033': 'SRTV', '41034': 'SRTV', '41035': 'SRTV', '41037': 'SRTV', '41039': 'SRTV', '41040': 'SRTV', '41041': 'SRTV', '41042': 'SRTV', '41043': 'SRTV', '41044': 'SRTV', '41045': 'SRTV', '41046': 'SRTV', '41048': 'SRTV', '41049': 'SRTV', '41051': 'SRTV', '41052': 'SRTV', '41053': 'SRTV', '41054': 'SRTV', '41055': 'SRTV', '41056': 'SRTV', '41059': 'SRTV', '41061': 'SRTV', '41062': 'SRTV', '41063': 'SRTV', '41064': 'SRTV', '41065': 'SRTV', '41071': 'SRTV', '41072': 'SRTV', '41073': 'SRTV', '41074': 'SRTV', '41075': 'SRTV', '41076': 'SRTV', '41080': 'SRTV', '41081': 'SRTV', '41083': 'SRTV', '41085': 'SRTV', '41086': 'SRTV', '41091': 'SRTV', '41092': 'SRTV', '41093': 'SRTV', '41094': 'SRTV', '41095': 'SRTV', '41096': 'SRTV', '41097': 'SRTV', '41098': 'SRTV', '41099': 'SRTV', '41101': 'RFCW', '41102': 'RFCW', '41105': 'RFCW', '41114': 'RFCW', '41121': 'SRTV', '41124': 'SRTV', '41128': 'SRTV', '41129': 'RFCW', '41132': 'RFCW', '41135': 'SRTV', '41139': 'RFCW', '41141': 'SRTV', '41142': 'RFCW', '41143': 'SRTV', '41144': 'SRTV', '41146': 'RFCW', '41149': 'SRTV', '41159': 'SRTV', '41160': 'SRTV', '41164': 'SRTV', '41166': 'SRTV', '41168': 'RFCW', '41169': 'RFCW', '41171': 'SRTV', '41173': 'RFCW', '41174': 'SRTV', '41175': 'SRTV', '41179': 'SRTV', '41180': 'SRTV', '41181': 'RFCW', '41183': 'RFCW', '41189': 'SRTV', '41201': 'RFCW', '41203': 'RFCW', '41204': 'SRTV', '41214': 'SRTV', '41216': 'SRTV', '41219': 'SRTV', '41222': 'SRTV', '41224': 'SRTV', '41226': 'SRTV', '41230': 'SRTV', '41231': 'RFCW', '41232': 'SRTV', '41234': 'SRTV', '41238': 'SRTV', '41240': 'SRTV', '41250': 'RFCW', '41254': 'SRTV', '41255': 'SRTV', '41256': 'SRTV', '41257': 'SRTV', '41260': 'SRTV', '41262': 'SRTV', '41263': 'SRTV', '41264': 'SRTV', '41265': 'SRTV', '41267': 'RFCW', '41268': 'RFCW', '41271': 'SRTV', '41274': 'SRTV', '41301': 'SRTV', '41307': 'SRTV', '41310': 'RFCW', '41311': 'SRTV', '41313': 'SRTV', '41314': 'SRTV', '41317': 'RFCW', '41332': 'SRTV', '41333': 'SRTV', '41338': 'SRTV', '41339': 'SRTV', '41347': 'SRTV', '41348': 'RFCW', '41351': 'SRTV', '41352': 'SRTV', '41360': 'SRTV', '41362': 'SRTV', '41364': 'SRTV', '41365': 'SRTV', '41366': 'RFCW', '41367': 'RFCW', '41368': 'SRTV', '41385': 'RFCW', '41386': 'SRTV', '41390': 'RFCW', '41397': 'SRTV', '41408': 'SRTV', '41413': 'SRTV', '41421': 'SRTV', '41425': 'SRTV', '41426': 'RFCW', '41451': 'SRTV', '41459': 'SRTV', '41464': 'SRTV', '41465': 'SRTV', '41472': 'SRTV', '41477': 'RFCW', '41501': 'SRTV', '41502': 'RFCW', '41503': 'RFCW', '41512': 'RFCW', '41513': 'RFCW', '41514': 'RFCW', '41517': 'RFCW', '41519': 'RFCW', '41520': 'RFCW', '41522': 'RFCW', '41524': 'RFCW', '41526': 'RFCW', '41527': 'RFCW', '41528': 'RFCW', '41531': 'RFCW', '41534': 'RFCW', '41535': 'RFCW', '41537': 'RFCW', '41538': 'RFCW', '41539': 'RFCW', '41540': 'RFCW', '41542': 'RFCW', '41543': 'RFCW', '41544': 'RFCW', '41547': 'RFCW', '41548': 'RFCW', '41549': 'RFCW', '41553': 'RFCW', '41554': 'RFCW', '41555': 'RFCW', '41557': 'RFCW', '41558': 'RFCW', '41559': 'RFCW', '41560': 'RFCW', '41561': 'RFCW', '41562': 'RFCW', '41563': 'RFCW', '41564': 'RFCW', '41566': 'RFCW', '41567': 'RFCW', '41568': 'RFCW', '41571': 'RFCW', '41572': 'RFCW', '41601': 'SRTV', '41602': 'SRTV', '41603': 'SRTV', '41604': 'RFCW', '41605': 'RFCW', '41606': 'RFCW', '41607': 'SRTV', '41612': 'RFCW', '41615': 'SRTV', '41616': 'SRTV', '41619': 'RFCW', '41621': 'SRTV', '41622': 'SRTV', '41630': 'SRTV', '41631': 'RFCW', '41632': 'SRTV', '41635': 'RFCW', '41636': 'RFCW', '41640': 'SRTV', '41642': 'SRTV', '41643': 'SRTV', '41645': 'SRTV', '41647': 'RFCW', '41649': 'SRTV', '41650': 'RFCW', '41651': 'RFCW', '41653': 'SRTV', '41655': 'SRTV', '41659': 'RFCW', '41660': 'RFCW', '41663': 'RFCW', '41666': 'SRTV', '41667': 'RFCW', '41669': 'RFCW', '41701': 'RFCW', '41702': 'RFCW', '41712': 'RFCW', '41713': 'RFCW', '41714': 'SRTV', '41719': 'RFCW', '41721': 'SRTV', '41722': 'RFCW', '41723': 'RFCW', '41725': 'RFCW', '41727': 'RFCW', '41729': 'RFCW', '41731': 'RFCW', '41735': 'SRTV', '41736': 'RFCW', '41739': 'RFCW', '41740': 'RFCW', '41743': 'RFCW', '41745': 'RFCW', '41746': 'RFCW', '41747': 'RFCW', '41749': 'SRTV', '41751': 'RFCW', '41754': 'RFCW', '41759': 'RFCW', '41760': 'RFCW', '41762': 'SRTV', '41763': 'RFCW', '41764': 'RFCW', '41766': 'RFCW', '41772': 'SRTV', '41773': 'RFCW', '41774': 'RFCW', '41775': 'RFCW', '41776': 'RFCW', '41777': 'SRTV', '41778': 'RFCW', '41804': 'RFCW', '41810': 'RFCW', '41812': 'RFCW', '41815': 'RFCW', '41817': 'RFCW', '41819': 'SRTV', '41821': 'RFCW', '41822': 'RFCW', '41824': 'RFCW', '41825': 'RFCW', '41826': 'RFCW', '41828': 'RFCW', '41831': 'SRTV', '41832': 'RFCW', '41833': 'SRTV', '41834': 'RFCW', '41835': 'RFCW', '41836': 'RFCW', '41837': 'SRTV', '41838': 'RFCW', '41839': 'SRTV', '41840': 'RFCW', '41843': 'RFCW', '41844': 'RFCW', '41845': 'RFCW', '41847': 'RFCW', '41848': 'RFCW', '41849': 'RFCW', '41855': 'RFCW', '41858': 'SRTV', '41859': 'RFCW', '41861': 'RFCW', '41862': 'RFCW', '42001': 'SRTV', '42002': 'SRTV', '42003': 'SRTV', '42020': 'SRTV', '42021': 'SRTV', '42022': 'SRTV', '42023': 'SRTV', '42024': 'SRTV', '42025': 'SRTV', '42027': 'SRTV', '42028': 'SRTV', '42029': 'SRTV', '42031': 'SRTV', '42032': 'SRTV', '42033': 'SRTV', '42035': 'SRTV', '42036': 'SRTV', '42037': 'SRTV', '42038': 'SRTV', '42039': 'SRTV', '42040': 'SRTV', '42041': 'SRTV', '42044': 'SRTV', '42045': 'SRTV', '42047': 'SRTV', '42048': 'SRTV', '42049': 'SRTV', '42050': 'SRTV', '42051': 'SRTV', '42053': 'SRTV', '42054': 'SRTV', '42055': 'SRTV', '42056': 'SRTV', '42058': 'SRTV', '42060': 'SRTV', '42061': 'SRTV', '42063': 'SRTV', '42064': 'SRTV', '42066': 'SRTV', '42069': 'SRTV', '42070': 'SRTV', '42071': 'SRTV', '42076': 'SRTV', '42078': 'SRTV', '42079': 'SRTV', '42081': 'SRTV', '42082': 'SRTV', '42083': 'SRTV', '42084': 'SRTV', '42085': 'SRTV', '42086': 'SRTV', '42087': 'SRTV', '42088': 'SRTV', '42101': 'SRTV', '42102': 'SRTV', '42103': 'SRTV', '42104': 'SRTV', '42120': 'SRTV', '42122': 'SRTV', '42123': 'SRTV', '42124': 'SRTV', '42127': 'SRTV', '42128': 'SRTV', '42129': 'SRTV', '42130': 'SRTV', '42131': 'SRTV', '42133': 'SRTV', '42134': 'SRTV', '42135': 'SRTV', '42140': 'SRTV', '42141': 'SRTV', '42142': 'SRTV', '42151': 'SRTV', '42152': 'SRTV', '42153': 'SRTV', '42154': 'SRTV', '42156': 'SRTV', '42157': 'SRTV', '42159': 'SRTV', '42160': 'SRTV', '42163': 'SRTV', '42164': 'SRTV', '42166': 'SRTV', '42167': 'SRTV', '42170': 'SRTV', '42171': 'SRTV', '42201': 'SRTV', '42202': 'SRTV', '42204': 'SRTV', '42206': 'SRTV', '42207': 'SRTV', '42210': 'SRTV', '42211': 'SRTV', '42214': 'SRTV', '42215': 'SRTV', '42216': 'SRTV', '42217': 'SRTV', '42219': 'SRTV', '42220': 'SRTV', '42221': 'SRTV', '42223': 'SRTV', '42232': 'SRTV', '42234': 'SRTV', '42236': 'SRTV', '42240': 'SRTV', '42241': 'SRTV', '42252': 'SRTV', '42254': 'SRTV', '42256': 'SRTV', '42259': 'SRTV', '42261': 'SRTV', '42262': 'SRTV', '42265': 'SRTV', '42266': 'SRTV', '42273': 'SRTV', '42274': 'SRTV', '42275': 'SRTV', '42276': 'SRTV', '42280': 'SRTV', '42283': 'SRTV', '42285': 'SRTV', '42286': 'SRTV', '42288': 'SRTV', '42301': 'SRTV', '42302': 'SRTV', '42303': 'SRTV', '42304': 'SRTV', '42320': 'SRTV', '42321': 'SRTV', '42322': 'SRTV', '42323': 'SRTV', '42324': 'SRTV', '42325': 'SRTV', '42326': 'SRTV', '42327': 'SRTV', '42328': 'SRTV', '42330': 'SRTV', '42332': 'SRTV', '42333': 'SRTV', '42334': 'SRTV', '42337': 'SRTV', '42338': 'SRTV', '42339': 'SRTV', '42343': 'SRTV', '42344': 'SRTV', '42345': 'SRTV', '42347': 'SRTV', '42348': 'SRTV', '42349': 'SRTV', '42350': 'SRTV', '42351': 'SRTV', '42352': 'SRTV', '42354': 'SRTV', '42355': 'SRTV', '42356': 'SRTV', '42361': 'SRTV', '42364': 'SRTV', '42366': 'SRTV', '42367': 'SRTV', '42368': 'SRTV', '42369': 'SRTV', '42370': 'SRTV', '42371': 'SRTV', '42372': 'SRTV', '42374': 'SRTV', '42375': 'SRTV', '42376': 'SRTV', '42377': 'SRTV', '42378': 'SRTV', '42402': 'SRTV', '42404': 'SRTV', '42406': 'SRTV', '42408': 'SRTV', '42409': 'SRTV', '42410': 'SRTV', '42411': 'SRTV', '42413': 'SRTV', '42419': 'SRTV', '42420': 'SRTV', '42431': 'SRTV', '42436': 'SRTV', '42437': 'SRTV', '42440': 'SRTV', '42441': 'SRTV', '42442': 'SRTV', '42444': 'SRTV', '42445': 'SRTV', '42450': 'SRTV', '42451': 'SRTV', '42452': 'SRTV', '42453': 'SRTV', '42455': 'SRTV', '42456': 'SRTV', '42457': 'SRTV', '42458': 'SRTV', '42459': 'SRTV', '42460': 'SRTV', '42461': 'SRTV', '42462': 'SRTV', '42463': 'SRTV', '42464': 'SRTV', '42501': 'SRTV', '42502': 'SRTV', '42503': 'SRTV', '42516': 'SRTV', '42518': 'SRTV', '42519': 'SRTV', '42528': 'SRTV', '42533': 'SRTV', '42539': 'SRTV', '42541': 'SRTV', '42544': 'SRTV', '42553': 'SRTV', '42558': 'SRTV', '42564': 'SRTV', '42565': 'SRTV', '42566': 'SRTV', '42567': 'SRTV', '42602': 'SRTV', '42603': 'SRTV', '42629': 'SRTV', '42631': 'SRTV', '42633': 'SRTV', '42634': 'SRTV', '42635': 'SRTV', '42638': 'SRTV', '42642': 'SRTV', '42647': 'SRTV', '42649': 'SRTV', '42653': 'SRTV', '42701': 'SRTV', '42702': 'SRTV', '42712': 'SRTV', '42713': 'SRTV', '42715': 'SRTV', '42716': 'SRTV', '42717': 'SRTV', '42718': 'SRTV', '42719': 'SRTV', '42720': 'SRTV', '42721': 'SRTV', '42722': 'SRTV', '42724': 'SRTV', '42726': 'SRTV', '42728': 'SRTV', '42729': 'SRTV', '42731': 'SRTV', '42732': 'SRTV', '42733': 'SRTV', '42740': 'SRTV', '42741': 'SRTV', '42742': 'SRTV', '42743': 'SRTV', '42746': 'SRTV', '42748': 'SRTV', '42749': 'SRTV', '42753': 'SRTV', '42754': 'SRTV', '42755': 'SRTV', '42757': 'SRTV', '42758': 'SRTV', '42759': 'SRTV', '42762': 'SRTV', '42764': 'SRTV', '42765': 'SRTV', '42776': 'SRTV', '42782': 'SRTV', '42784': 'SRTV', '42788': 'SRTV', '43001': 'RFCW', '43002': 'RFCW', '43003': 'RFCW', '43004': 'RFCW', '43005': 'RFCW', '43006': 'RFCW', '43007': 'RFCW', '43008': 'RFCW', '43009': 'RFCW', '43010': 'RFCW', '43011': 'RFCW', '43013': 'RFCW', '43014': 'RFCW', '43015': 'RFCW', '43016': 'RFCW', '43017': 'RFCW', '43018': 'RFCW', '43019': 'RFCW', '43021': 'RFCW', '43022': 'RFCW', '43023': 'RFCW', '43025': 'RFCW', '43026': 'RFCW', '43027': 'RFCW', '43028': 'RFCW', '43029': 'RFCW', '43030': 'RFCW', '43031': 'RFCW', '43032': 'RFCW', '43033': 'RFCW', '43035': 'RFCW', '43036': 'RFCW', '43037': 'RFCW', '43040': 'RFCW', '43041': 'RFCW', '43044': 'RFCW', '43045': 'RFCW', '43046': 'RFCW', '43047': 'RFCW', '43048': 'RFCW', '43050': 'RFCW', '43054': 'RFCW', '43055': 'RFCW', '43056': 'RFCW', '43058': 'RFCW', '43060': 'RFCW', '43061': 'RFCW', '43062': 'RFCW', '43064': 'RFCW', '43065': 'RFCW', '43066': 'RFCW', '43067': 'RFCW', '43068': 'RFCW', '43069': 'RFCW', '43070': 'RFCW', '43071': 'RFCW', '43072': 'RFCW', '43073': 'RFCW', '43074': 'RFCW', '43076': 'RFCW', '43077': 'RFCW', '43078': 'RFCW', '43080': 'RFCW', '43081': 'RFCW', '43082': 'RFCW', '43083': 'RFCW', '43084': 'RFCW', '43085': 'RFCW', '43086': 'RFCW', '43093': 'RFCW', '43101': 'RFCW', '43102': 'RFCW', '43103': 'RFCW', '43105': 'RFCW', '43106': 'RFCW', '43107': 'RFCW', '43109': 'RFCW', '43110': 'RFCW', '43111': 'RFCW', '43112': 'RFCW', '43113': 'RFCW', '43115': 'RFCW', '43116': 'RFCW', '43117': 'RFCW', '43119': 'RFCW', '43123': 'RFCW', '43125': 'RFCW', '43126': 'RFCW', '43127': 'RFCW', '43128': 'RFCW', '43130': 'RFCW', '43135': 'RFCW', '43136': 'RFCW', '43137': 'RFCW', '43138': 'RFCW', '43140': 'RFCW', '43142': 'RFCW', '43143': 'RFCW', '43144': 'RFCW', '43145': 'RFCW', '43146': 'RFCW', '43147': 'RFCW', '43148': 'RFCW', '43149': 'RFCW', '43150': 'RFCW', '43151': 'RFCW', '43152': 'RFCW', '43153': 'RFCW', '43154': 'RFCW', '43155': 'RFCW', '43156': 'RFCW', '43157': 'RFCW', '43158': 'RFCW', '43160': 'RFCW', '43162': 'RFCW', '43163': 'RFCW', '43164': 'RFCW', '43194': 'RFCW', '43195': 'RFCW', '43199': 'RFCW', '43201': 'RFCW', '43202': 'RFCW', '43203': 'RFCW', '43204': 'RFCW', '43205': 'RFCW', '43206': 'RFCW', '43207': 'RFCW', '43209': 'RFCW', '43210': 'RFCW', '43211': 'RFCW', '43212': 'RFCW', '43213': 'RFCW', '43214': 'RFCW', '43215': 'RFCW', '43216': 'RFCW', '43217': 'RFCW', '43218': 'RFCW', '43219': 'RFCW', '43220': 'RFCW', '43221': 'RFCW', '43222': 'RFCW', '43223': 'RFCW', '43224': 'RFCW', '43226': 'RFCW', '43227': 'RFCW', '43228': 'RFCW', '43229': 'RFCW', '43230': 'RFCW', '43231': 'RFCW', '43232': 'RFCW', '43234': 'RFCW', '43235': 'RFCW', '43236': 'RFCW', '43240': 'RFCW', '43251': 'RFCW', '43260': 'RFCW', '43266': 'RFCW', '43268': 'RFCW', '43270': 'RFCW', '43271': 'RFCW', '43272': 'RFCW', '43279': 'RFCW', '43287': 'RFCW', '43291': 'RFCW', '43301': 'RFCW', '43302': 'RFCW', '43306': 'RFCW', '43310': 'RFCW', '43311': 'RFCW', '43314': 'RFCW', '43315': 'RFCW', '43316': 'RFCW', '43317': 'RFCW', '43318': 'RFCW', '43319': 'RFCW', '43320': 'RFCW', '43321': 'RFCW', '43322': 'RFCW', '43323': 'RFCW', '43324': 'RFCW', '43325': 'RFCW', '43326': 'RFCW', '43330': 'RFCW', '43331': 'RFCW', '43332': 'RFCW', '43333': 'RFCW', '43334': 'RFCW', '43335': 'RFCW', '43336': 'RFCW', '43337': 'RFCW', '43338': 'RFCW', '43340': 'RFCW', '43341': 'RFCW', '43342': 'RFCW', '43343': 'RFCW', '43344': 'RFCW', '43345': 'RFCW', '43346': 'RFCW', '43347': 'RFCW', '43348': 'RFCW', '43349': 'RFCW', '43350': 'RFCW', '43351': 'RFCW', '43356': 'RFCW', '43357': 'RFCW', '43358': 'RFCW', '43359': 'RFCW', '43360': 'RFCW', '43402': 'RFCW', '43403': 'RFCW', '43406': 'RFCW', '43407': 'RFCW', '43408': 'RFCW', '43410': 'RFCW', '43412': 'RFCW', '43413': 'RFCW', '43414': 'RFCW', '43416': 'RFCW', '43420': 'RFCW', '43430': 'RFCW', '43431': 'RFCW', '43432': 'RFCW', '43433': 'RFCW', '43434': 'RFCW', '43435': 'RFCW', '43436': 'RFCW', '43437': 'RFCW', '43438': 'RFCW', '43439': 'RFCW', '43440': 'RFCW', '43441': 'RFCW', '43442': 'RFCW', '43443': 'RFCW', '43445': 'RFCW', '43446': 'RFCW', '43447': 'RFCW', '43449': 'RFCW', '43450': 'RFCW', '43451': 'RFCW', '43452': 'RFCW', '43456': 'RFCW', '43457': 'RFCW', '43458': 'RFCW', '43460': 'RFCW', '43462': 'RFCW', '43463': 'RFCW', '43464': 'RFCW', '43465': 'RFCW', '43466': 'RFCW', '43467': 'RFCW', '43468': 'RFCW', '43469': 'RFCW', '43501': 'RFCW', '43502': 'RFCW', '43504': 'RFCW', '43505': 'RFCW', '43506': 'RFCW', '43510': 'RFCW', '43511': 'RFCW', '43512': 'RFCW', '43515': 'RFCW', '43516': 'RFCW', '43517': 'RFCW', '43518': 'RFCW', '43519': 'RFCW', '43520': 'RFCW', '43521': 'RFCW', '43522': 'RFCW', '43523': 'RFCW', '43524': 'RFCW', '43525': 'RFCW', '43526': 'RFCW', '43527': 'RFCW', '43528': 'RFCW', '43529': 'RFCW', '43530': 'RFCW', '43531': 'RFCW', '43532': 'RFCW', '43533': 'RFCW', '43534': 'RFCW', '43535': 'RFCW', '43536': 'RFCW', '43537': 'RFCW', '43540': 'RFCW', '43541': 'RFCW', '43542': 'RFCW', '43543': 'RFCW', '43545': 'RFCW', '43547': 'RFCW', '43548': 'RFCW', '43549': 'RFCW', '43550': 'RFCW', '43551': 'RFCW', '43552': 'RFCW', '43553': 'RFCW', '43554': 'RFCW', '43555': 'RFCW', '43556': 'RFCW', '43557': 'RFCW', '43558': 'RFCW', '43560': 'RFCW', '43565': 'RFCW', '43566': 'RFCW', '43567': 'RFCW', '43569': 'RFCW', '43570': 'RFCW', '43571': 'RFCW', '43601': 'RFCW', '43603': 'RFCW', '43604': 'RFCW', '43605': 'RFCW', '43606': 'RFCW', '43607': 'RFCW', '43608': 'RFCW', '43609': 'RFCW', '43610': 'RFCW', '43611': 'RFCW', '43612': 'RFCW', '43613': 'RFCW', '43614': 'RFCW', '43615': 'RFCW', '43616': 'RFCW', '43617': 'RFCW', '43618': 'RFCW', '43619': 'RFCW', '43620': 'RFCW', '43623': 'RFCW', '43635': 'RFCW', '43652': 'RFCW', '43654': 'RFCW', '43656': 'RFCW', '43657': 'RFCW', '43659': 'RFCW', '43660': 'RFCW', '43661': 'RFCW', '43666': 'RFCW', '43667': 'RFCW', '43681': 'RFCW', '43682': 'RFCW', '43697': 'RFCW', '43699': 'RFCW', '43701': 'RFCW', '43702': 'RFCW', '43711': 'RFCW', '43713': 'RFCW', '43716': 'RFCW', '43717': 'RFCW', '43718': 'RFCW', '43719': 'RFCW', '43720': 'RFCW', '43721': 'RFCW', '43722': 'RFCW', '43723': 'RFCW', '43724': 'RFCW', '43725': 'RFCW', '43727': 'RFCW', '43728': 'RFCW', '43730': 'RFCW', '43731': 'RFCW', '43732': 'RFCW', '43733': 'RFCW', '43734': 'RFCW', '43735': 'RFCW', '43736': 'RFCW', '43738': 'RFCW', '43739': 'RFCW', '43740': 'RFCW', '43746': 'RFCW', '43747': 'RFCW', '43748': 'RFCW', '43749': 'RFCW', '43750': 'RFCW', '43752': 'RFCW', '43754': 'RFCW', '43755': 'RFCW', '43756': 'RFCW', '43757': 'RFCW', '43758': 'RFCW', '43759': 'RFCW', '43760': 'RFCW', '43761': 'RFCW', '43762': 'RFCW', '43764': 'RFCW', '43766': 'RFCW', '43767': 'RFCW', '43768': 'RFCW', '43771': 'RFCW', '43772': 'RFCW', '43773': 'RFCW', '43777': 'RFCW', '43778': 'RFCW', '43779': 'RFCW', '43780': 'RFCW', '43782': 'RFCW', '43783': 'RFCW', '43786': 'RFCW', '43787': 'RFCW', '43788': 'RFCW', '43791': 'RFCW', '43793': 'RFCW', '43802': 'RFCW', '43803': 'RFCW', '43804': 'RFCW', '43805': 'RFCW', '43811': 'RFCW', '43812': 'RFCW', '43821': 'RFCW', '43822': 'RFCW', '43824': 'RFCW', '43828': 'RFCW', '43830': 'RFCW', '43832': 'RFCW', '43836': 'RFCW', '43837': 'RFCW', '43840': 'RFCW', '43842': 'RFCW', '43843': 'RFCW', '43844': 'RFCW', '43845': 'RFCW', '43901': 'RFCW', '43902': 'RFCW', '43903': 'RFCW', '43905': 'RFCW', '43906': 'RFCW', '43907': 'RFCW', '43908': 'RFCW', '43909': 'RFCW', '43910': 'RFCW', '43912': 'RFCW', '43913': 'RFCW', '43914': 'RFCW', '43915': 'RFCW', '43916': 'RFCW', '43917': 'RFCW', '43920': 'RFCW', '43925': 'RFCW', '43926': 'RFCW', '43927': 'RFCW', '43928': 'RFCW', '43930': 'RFCW', '43931': 'RFCW', '43932': 'RFCW', '43933': 'RFCW', '43934': 'RFCW', '43935': 'RFCW', '43937': 'RFCW', '43938': 'RFCW', '43939': 'RFCW', '43940': 'RFCW', '43941': 'RFCW', '43942': 'RFCW', '43943': 'RFCW', '43944': 'RFCW', '43945': 'RFCW', '43946': 'RFCW', '43947': 'RFCW', '43948': 'RFCW', '43950': 'RFCW', '43951': 'RFCW', '43952': 'RFCW', '43953': 'RFCW', '43961': 'RFCW', '43962': 'RFCW', '43963': 'RFCW', '43964': 'RFCW', '43967': 'RFCW', '43968': 'RFCW', '43970': 'RFCW', '43971': 'RFCW', '43972': 'RFCW', '43973': 'RFCW', '43974': 'RFCW', '43976': 'RFCW', '43977': 'RFCW', '43981': 'RFCW', '43983': 'RFCW', '43984': 'RFCW', '43985': 'RFCW', '43986': 'RFCW', '43988': 'RFCW', '44001': 'RFCW', '44003': 'RFCW', '44004': 'RFCW', '44005': 'RFCW', '44010': 'RFCW', '44011': 'RFCW', '44012': 'RFCW', '44017': 'RFCW', '44021': 'RFCW', '44022': 'RFCW', '44023': 'RFCW', '44024': 'RFCW', '44026': 'RFCW', '44028': 'RFCW', '44030': 'RFCW', '44032': 'RFCW', '44033': 'RFCW', '44035': 'RFCW', '44036': 'RFCW', '44039': 'RFCW', '44040': 'RFCW', '44041': 'RFCW', '44044': 'RFCW', '44045': 'RFCW', '44046': 'RFCW', '44047': 'RFCW', '44048': 'RFCW', '44049': 'RFCW', '44050': 'RFCW', '44052': 'RFCW', '44053': 'RFCW', '44054': 'RFCW', '44055': 'RFCW', '44056': 'RFCW', '44057': 'RFCW', '44060': 'RFCW', '44061': 'RFCW', '44062': 'RFCW', '44064': 'RFCW', '44065': 'RFCW', '44067': 'RFCW', '44068': 'RFCW', '44070': 'RFCW', '44072': 'RFCW', '44073': 'RFCW', '44074': 'RFCW', '44076': 'RFCW', '44077': 'RFCW', '44080': 'RFCW', '44081': 'RFCW', '44082': 'RFCW', '44084': 'RFCW', '44085': 'RFCW', '44086': 'RFCW', '44087': 'RFCW', '44088': 'RFCW', '44089': 'RFCW', '44090': 'RFCW', '44092': 'RFCW', '44093': 'RFCW', '44094': 'RFCW', '44095': 'RFCW', '44096': 'RFCW', '44097': 'RFCW', '44099': 'RFCW', '44101': 'RFCW', '44102': 'RFCW', '44103': 'RFCW', '44104': 'RFCW', '44105': 'RFCW', '44106': 'RFCW', '44107': 'RFCW', '44108': 'RFCW', '44109': 'RFCW', '44110': 'RFCW', '44111': 'RFCW', '44112': 'RFCW', '44113': 'RFCW', '44114': 'RFCW', '44115': 'RFCW', '44116': 'RFCW', '44117': 'RFCW', '44118': 'RFCW', '44119': 'RFCW', '44120': 'RFCW', '44121': 'RFCW', '44122': 'RFCW', '44123': 'RFCW', '44124': 'RFCW', '44125': 'RFCW', '44126': 'RFCW', '44127': 'RFCW', '44128': 'RFCW', '44129': 'RFCW', '44130': 'RFCW', '44131': 'RFCW', '44132': 'RFCW', '44133': 'RFCW', '44134': 'RFCW', '44135': 'RFCW', '44136': 'RFCW', '44137': 'RFCW', '44138': 'RFCW', '44139': 'RFCW', '44140': 'RFCW', '44141': 'RFCW', '44142': 'RFCW', '44143': 'RFCW', '44144': 'RFCW', '44145': 'RFCW', '44146': 'RFCW', '44147': 'RFCW', '44149': 'RFCW', '44181': 'RFCW', '44188': 'RFCW', '44190': 'RFCW', '44191': 'RFCW', '44192': 'RFCW', '44193': 'RFCW', '44194': 'RFCW', '44195': 'RFCW', '44197': 'RFCW', '44198': 'RFCW', '44199': 'RFCW', '44201': 'RFCW', '44202': 'RFCW', '44203': 'RFCW', '44210': 'RFCW', '44211': 'RFCW', '44212': 'RFCW', '44214': 'RFCW', '44215': 'RFCW', '44216': 'RFCW', '44217': 'RFCW', '44221': 'RFCW', '44222': 'RFCW', '44223': 'RFCW', '44224': 'RFCW', '44230': 'RFCW', '44231': 'RFCW', '44232': 'RFCW', '44233': 'RFCW', '44234': 'RFCW', '44235': 'RFCW', '44236': 'RFCW', '44237': 'RFCW', '44240': 'RFCW', '44241': 'RFCW', '44242': 'RFCW', '44243': 'RFCW', '44250': 'RFCW', '44251': 'RFCW', '44253': 'RFCW', '44254': 'RFCW', '44255': 'RFCW', '44256': 'RFCW', '44258': 'RFCW', '44260': 'RFCW', '44262': 'RFCW', '44264': 'RFCW', '44265': 'RFCW', '44266': 'RFCW', '44270': 'RFCW', '44272': 'RFCW', '44273': 'RFCW', '44274': 'RFCW', '44275': 'RFCW', '44276': 'RFCW', '44278': 'RFCW', '44280': 'RFCW', '44281': 'RFCW', '44282': 'RFCW', '44285': 'RFCW', '44286': 'RFCW', '44287': 'RFCW', '44288': 'RFCW', '44301': 'RFCW', '44302': 'RFCW', '44303': 'RFCW', '44304': 'RFCW', '44305': 'RFCW', '44306': 'RFCW', '44307': 'RFCW', '44308': 'RFCW', '44309': 'RFCW', '44310': 'RFCW', '44311': 'RFCW', '44312': 'RFCW', '44313': 'RFCW', '44314': 'RFCW', '44315': 'RFCW', '44316': 'RFCW', '44317': 'RFCW', '44319': 'RFCW', '44320': 'RFCW', '44321': 'RFCW', '44325': 'RFCW', '44326': 'RFCW', '44328': 'RFCW', '44333': 'RFCW', '44334': 'RFCW', '44372': 'RFCW', '44393': 'RFCW', '44396': 'RFCW', '44398': 'RFCW', '44399': 'RFCW', '44401': 'RFCW', '44402': 'RFCW', '44403': 'RFCW', '44404': 'RFCW', '44405': 'RFCW', '44406': 'RFCW', '44408': 'RFCW', '44410': 'RFCW', '44411': 'RFCW', '44412': 'RFCW', '44413': 'RFCW', '44415': 'RFCW', '44416': 'RFCW', '44417': 'RFCW', '44418': 'RFCW', '44420': 'RFCW', '44422': 'RFCW', '44423': 'RFCW', '44424': 'RFCW', '44425': 'RFCW', '44427': 'RFCW', '44428': 'RFCW', '44429': 'RFCW', '44430': 'RFCW', '44431': 'RFCW', '44432': 'RFCW', '44436': 'RFCW', '44437': 'RFCW', '44438': 'RFCW', '44439': 'RFCW', '44440': 'RFCW', '44441': 'RFCW', '44442': 'RFCW', '44443': 'RFCW', '44444': 'RFCW', '44445': 'RFCW', '44446': 'RFCW', '44449': 'RFCW', '44450': 'RFCW', '44451': 'RFCW', '44452': 'RFCW', '44453': 'RFCW', '44454': 'RFCW', '44455': 'RFCW', '44460': 'RFCW', '44470': 'RFCW', '44471': 'RFCW', '44473': 'RFCW', '44481': 'RFCW', '44482': 'RFCW', '44483': 'RFCW', '44484': 'RFCW', '44485': 'RFCW', '44486': 'RFCW', '44488': 'RFCW', '44490': 'RFCW', '44491': 'RFCW', '44492': 'RFCW', '44493': 'RFCW', '44501': 'RFCW', '44502': 'RFCW', '44503': 'RFCW', '44504': 'RFCW', '44505': 'RFCW', '44506': 'RFCW', '44507': 'RFCW', '44509': 'RFCW', '44510': 'RFCW', '44511': 'RFCW', '44512': 'RFCW', '44513': 'RFCW', '44514': 'RFCW', '44515': 'RFCW', '44555': 'RFCW', '44601': 'RFCW', '44606': 'RFCW', '44607': 'RFCW', '44608': 'RFCW', '44609': 'RFCW', '44610': 'RFCW', '44611': 'RFCW', '44612': 'RFCW', '44613': 'RFCW', '44614': 'RFCW', '44615': 'RFCW', '44617': 'RFCW', '44618': 'RFCW', '44619': 'RFCW', '44620': 'RFCW', '44621': 'RFCW', '44622': 'RFCW', '44624': 'RFCW', '44625': 'RFCW', '44626': 'RFCW', '44627': 'RFCW', '44628': 'RFCW', '44629': 'RFCW', '44630': 'RFCW', '44631': 'RFCW', '44632': 'RFCW', '44633': 'RFCW', '44634': 'RFCW', '44636': 'RFCW', '44637': 'RFCW', '44638': 'RFCW', '44639': 'RFCW', '44640': 'RFCW', '44641': 'RFCW', '44643': 'RFCW', '44644': 'RFCW', '44645': 'RFCW', '44646': 'RFCW', '44647': 'RFCW', '44648': 'RFCW', '44650': 'RFCW', '44651': 'RFCW', '44652': 'RFCW', '44653': 'RFCW', '44654': 'RFCW', '44656': 'RFCW', '44657': 'RFCW', '44659': 'RFCW', '44660': 'RFCW', '44661': 'RFCW', '44662': 'RFCW', '44663': 'RFCW', '44665': 'RFCW', '44666': 'RFCW', '44667': 'RFCW', '44669': 'RFCW', '44670': 'RFCW', '44671': 'RFCW', '44672': 'RFCW', '44675': 'RFCW', '44676': 'RFCW', '44677': 'RFCW', '44678': 'RFCW', '44679': 'RFCW', '44680': 'RFCW', '44681': 'RFCW', '44682': 'RFCW', '44683': 'RFCW', '44685': 'RFCW', '44687': 'RFCW', '44688': 'RFCW', '44689': 'RFCW', '44690': 'RFCW', '44691': 'RFCW', '44693': 'RFCW', '44695': 'RFCW', '44697': 'RFCW', '44699': 'RFCW', '44701': 'RFCW', '44702': 'RFCW', '44703': 'RFCW', '44704': 'RFCW', '44705': 'RFCW', '44706': 'RFCW', '44707': 'RFCW', '44708': 'RFCW', '44709': 'RFCW', '44710': 'RFCW', '44711': 'RFCW', '44714': 'RFCW', '44718': 'RFCW', '44720': 'RFCW', '44721': 'RFCW', '44730': 'RFCW', '44735': 'RFCW', '44750': 'RFCW', '44767': 'RFCW', '44799': 'RFCW', '44802': 'RFCW', '44804': 'RFCW', '44805': 'RFCW', '44807': 'RFCW', '44809': 'RFCW', '44811': 'RFCW', '44813': 'RFCW', '44814': 'RFCW', '44815': 'RFCW', '44816': 'RFCW', '44817': 'RFCW', '44818': 'RFCW', '44820': 'RFCW', '44822': 'RFCW', '44824': 'RFCW', '44825': 'RFCW', '44826': 'RFCW', '44827': 'RFCW', '44828': 'RFCW', '44830': 'RFCW', '44833': 'RFCW', '44836': 'RFCW', '44837': 'RFCW', '44838': 'RFCW', '44839': 'RFCW', '44840': 'RFCW', '44841': 'RFCW', '44842': 'RFCW', '44843': 'RFCW', '44844': 'RFCW', '44845': 'RFCW', '44846': 'RFCW', '44847': 'RFCW', '44848': 'RFCW', '44849': 'RFCW', '44850': 'RFCW', '44851': 'RFCW', '44853': 'RFCW', '44854': 'RFCW', '44855': 'RFCW', '44856': 'RFCW', '44857': 'RFCW', '44859': 'RFCW', '44860': 'RFCW', '44861': 'RFCW', '44862': 'RFCW', '44864': 'RFCW', '44865': 'RFCW', '44866': 'RFCW', '44867': 'RFCW', '44870': 'RFCW', '44871': 'RFCW', '44874': 'RFCW', '44875': 'RFCW', '44878': 'RFCW', '44880': 'RFCW', '44881': 'RFCW', '44882': 'RFCW', '44883': 'RFCW', '44887': 'RFCW', '44888': 'RFCW', '44889': 'RFCW', '44890': 'RFCW', '44901': 'RFCW', '44902': 'RFCW', '44903': 'RFCW', '44904': 'RFCW', '44905': 'RFCW', '44906': 'RFCW', '44907': 'RFCW', '45001': 'RFCW', '45002': 'RFCW', '45003': 'RFCW', '45004': 'RFCW', '45005': 'RFCW', '45011': 'RFCW', '45012': 'RFCW', '45013': 'RFCW', '45014': 'RFCW', '45015': 'RFCW', '45018': 'RFCW', '45025': 'RFCW', '45026': 'RFCW', '45030': 'RFCW', '45032': 'RFCW', '45033': 'RFCW', '45034': 'RFCW', '45036': 'RFCW', '45039': 'RFCW', '45040': 'RFCW', '45041': 'RFCW', '45042': 'RFCW', '45043': 'RFCW', '45044': 'RFCW', '45050': 'RFCW', '45051': 'RFCW', '45052': 'RFCW', '45053': 'RFCW', '45054': 'RFCW', '45055': 'RFCW', '45056': 'RFCW', '45061': 'RFCW', '45062': 'RFCW', '45063': 'RFCW', '45064': 'RFCW', '45065': 'RFCW', '45066': 'RFCW', '45067': 'RFCW', '45068': 'RFCW', '45069': 'RFCW', '45070': 'RFCW', '45071': 'RFCW', '45101': 'RFCW', '45102': 'RFCW', '45103': 'RFCW', '45105': 'RFCW', '45106': 'RFCW', '45107': 'RFCW', '45110': 'RFCW', '45111': 'RFCW', '45112': 'RFCW', '45113': 'RFCW', '45114': 'RFCW', '45115': 'RFCW', '45118': 'RFCW', '45119': 'RFCW', '45120': 'RFCW', '45121': 'RFCW', '45122': 'RFCW', '45123': 'RFCW', '45130': 'RFCW', '45131': 'RFCW', '45132': 'RFCW', '45133': 'RFCW', '45135': 'RFCW', '45138': 'RFCW', '45140': 'RFCW', '45142': 'RFCW', '45144': 'RFCW', '45145': 'RFCW', '45146': 'RFCW', '45147': 'RFCW', '45148': 'RFCW', '45150': 'RFCW', '45152': 'RFCW', '45153': 'RFCW', '45154': 'RFCW', '45155': 'RFCW', '45156': 'RFCW', '45157': 'RFCW', '45158': 'RFCW', '45159': 'RFCW', '45160': 'RFCW', '45162': 'RFCW', '45164': 'RFCW', '45166': 'RFCW', '45167': 'RFCW', '45168': 'RFCW', '45169': 'RFCW', '45171': 'RFCW', '45172': 'RFCW', '45174': 'RFCW', '45176': 'RFCW', '45177': 'RFCW', '45201': 'RFCW', '45202': 'RFCW', '45203': 'RFCW', '45204': 'RFCW', '45205': 'RFCW', '45206': 'RFCW', '45207': 'RFCW', '45208': 'RFCW', '45209': 'RFCW', '45211': 'RFCW', '45212': 'RFCW', '45213': 'RFCW', '45214': 'RFCW', '45215': 'RFCW', '45216': 'RFCW', '45217': 'RFCW', '45218': 'RFCW', '45219': 'RFCW', '45220': 'RFCW', '45221': 'RFCW', '45222': 'RFCW', '45223': 'RFCW', '45224': 'RFCW', '45225': 'RFCW', '45226': 'RFCW', '45227': 'RFCW', '45228': 'RFCW', '45229': 'RFCW', '45230': 'RFCW', '45231': 'RFCW', '45232': 'RFCW', '45233': 'RFCW', '45234': 'RFCW', '45235': 'RFCW', '45236': 'RFCW', '45237': 'RFCW', '45238': 'RFCW', '45239': 'RFCW', '45240': 'RFCW', '45241': 'RFCW', '45242': 'RFCW', '45243': 'RFCW', '45244': 'RFCW', '45245': 'RFCW', '45246': 'RFCW', '45247': 'RFCW', '45248': 'RFCW', '45249': 'RFCW', '45250': 'RFCW', '45251': 'RFCW', '45252': 'RFCW', '45253': 'RFCW', '45254': 'RFCW', '45255': 'RFCW', '45258': 'RFCW', '45262': 'RFCW', '45263': 'RFCW', '45264': 'RFCW', '45267': 'RFCW', '45268': 'RFCW', '45269': 'RFCW', '45270': 'RFCW', '45271': 'RFCW', '45273': 'RFCW', '45274': 'RFCW', '45275': 'RFCW', '45277': 'RFCW', '45280': 'RFCW', '45296': 'RFCW', '45298': 'RFCW', '45299': 'RFCW', '45301': 'RFCW', '45302': 'RFCW', '45303': 'RFCW', '45304': 'RFCW', '45305': 'RFCW', '45306': 'RFCW', '45307': 'RFCW', '45308': 'RFCW', '45309': 'RFCW', '45310': 'RFCW', '45311': 'RFCW', '45312': 'RFCW', '45314': 'RFCW', '45315': 'RFCW', '45316': 'RFCW', '45317': 'RFCW', '45318': 'RFCW', '45319': 'RFCW', '45320': 'RFCW', '45321': 'RFCW', '45322': 'RFCW', '45323': 'RFCW', '45324': 'RFCW', '45325': 'RFCW', '45326': 'RFCW', '45327': 'RFCW', '45328': 'RFCW', '45330': 'RFCW', '45331': 'RFCW', '45332': 'RFCW', '45333': 'RFCW', '45334': 'RFCW', '45335': 'RFCW', '45336': 'RFCW', '45337': 'RFCW', '45338': 'RFCW', '45339': 'RFCW', '45340': 'RFCW', '45341': 'RFCW', '45342': 'RFCW', '45343': 'RFCW', '45344': 'RFCW', '45345': 'RFCW', '45346': 'RFCW', '45347': 'RFCW', '45348': 'RFCW', '45349': 'RFCW', '45350': 'RFCW', '45351': 'RFCW', '45352': 'RFCW', '45353': 'RFCW', '45354': 'RFCW', '45356': 'RFCW', '45358': 'RFCW', '45359': 'RFCW', '45360': 'RFCW', '45361': 'RFCW', '45362': 'RFCW', '45363': 'RFCW', '45365': 'RFCW', '45367': 'RFCW', '45368': 'RFCW', '45369': 'RFCW', '45370': 'RFCW', '45371': 'RFCW', '45372': 'RFCW', '45373': 'RFCW', '45374': 'RFCW', '45377': 'RFCW', '45378': 'RFCW', '45380': 'RFCW', '45381': 'RFCW', '45382': 'RFCW', '45383': 'RFCW', '45384': 'RFCW', '45385': 'RFCW', '45387': 'RFCW', '45388': 'RFCW', '45389': 'RFCW', '45390': 'RFCW', '45400': 'RFCW', '45401': 'RFCW', '45402': 'RFCW', '45403': 'RFCW', '45404': 'RFCW', '45405': 'RFCW', '45406': 'RFCW', '45408': 'RFCW', '45409': 'RFCW', '45410': 'RFCW', '45412': 'RFCW', '45413': 'RFCW', '45414': 'RFCW', '45415': 'RFCW', '45416': 'RFCW', '45417': 'RFCW', '45418': 'RFCW', '45419': 'RFCW', '45420': 'RFCW', '45422': 'RFCW', '45423': 'RFCW', '45424': 'RFCW', '45426': 'RFCW', '45427': 'RFCW', '45428': 'RFCW', '45429': 'RFCW', '45430': 'RFCW', '45431': 'RFCW', '45432': 'RFCW', '45433': 'RFCW', '45434': 'RFCW', '45435': 'RFCW', '45437': 'RFCW', '45439': 'RFCW', '45440': 'RFCW', '45441': 'RFCW', '45448': 'RFCW', '45449': 'RFCW', '45454': 'RFCW', '45458': 'RFCW', '45459': 'RFCW', '45469': 'RFCW', '45470': 'RFCW', '45475': 'RFCW', '45479': 'RFCW', '45481': 'RFCW', '45482': 'RFCW', '45490': 'RFCW', '45501': 'RFCW', '45502': 'RFCW', '45503': 'RFCW', '45504': 'RFCW', '45505': 'RFCW', '45506': 'RFCW', '45601': 'RFCW', '45612': 'RFCW', '45613': 'RFCW', '45614': 'RFCW', '45616': 'RFCW', '45617': 'RFCW', '45618': 'RFCW', '45619': 'RFCW', '45620': 'RFCW', '45621': 'RFCW', '45622': 'RFCW', '45623': 'RFCW', '45624': 'RFCW', '45628': 'RFCW', '45629': 'RFCW', '45630': 'RFCW', '45631': 'RFCW', '45633': 'RFCW', '45634': 'RFCW', '45636': 'RFCW', '45638': 'RFCW', '45640': 'RFCW', '45642': 'RFCW', '45643': 'RFCW', '45644': 'RFCW', '45645': 'RFCW', '45646': 'RFCW', '45647': 'RFCW', '45648': 'RFCW', '45650': 'RFCW', '45651': 'RFCW', '45652': 'RFCW', '45653': 'RFCW', '45654': 'RFCW', '45656': 'RFCW', '45657': 'RFCW', '45658': 'RFCW', '45659': 'RFCW', '45660': 'RFCW', '45661': 'RFCW', '45662': 'RFCW', '45663': 'RFCW', '45669': 'RFCW', '45671': 'RFCW', '45672': 'RFCW', '45673': 'RFCW', '45674': 'RFCW', '45675': 'RFCW', '45677': 'RFCW', '45678': 'RFCW', '45679': 'RFCW', '45680': 'RFCW', '45681': 'RFCW', '45682': 'RFCW', '45683': 'RFCW', '45684': 'RFCW', '45685': 'RFCW', '45686': 'RFCW', '45687': 'RFCW', '45688': 'RFCW', '45690': 'RFCW', '45692': 'RFCW', '45693': 'RFCW', '45694': 'RFCW', '45695': 'RFCW', '45696': 'RFCW', '45697': 'RFCW', '45698': 'RFCW', '45699': 'RFCW', '45701': 'RFCW', '45710': 'RFCW', '45711': 'RFCW', '45712': 'RFCW', '45713': 'RFCW', '45714': 'RFCW', '45715': 'RFCW', '45716': 'RFCW', '45717': 'RFCW', '45719': 'RFCW', '45720': 'RFCW', '45721': 'RFCW', '45723': 'RFCW', '45724': 'RFCW', '45727': 'RFCW', '45729': 'RFCW', '45732': 'RFCW', '45734': 'RFCW', '45735': 'RFCW', '45739': 'RFCW', '45740': 'RFCW', '45741': 'RFCW', '45742': 'RFCW', '45743': 'RFCW', '45744': 'RFCW', '45745': 'RFCW', '45746': 'RFCW', '45750': 'RFCW', '45760': 'RFCW', '45761': 'RFCW', '45764': 'RFCW', '45766': 'RFCW', '45767': 'RFCW', '45768': 'RFCW', '45769': 'RFCW', '45770': 'RFCW', '45771': 'RFCW', '45772': 'RFCW', '45773': 'RFCW', '45775': 'RFCW', '45776': 'RFCW', '45777': 'RFCW', '45778': 'RFCW', '45779': 'RFCW', '45780': 'RFCW', '45782': 'RFCW', '45783': 'RFCW', '45784': 'RFCW', '45786': 'RFCW', '45787': 'RFCW', '45788': 'RFCW', '45789': 'RFCW', '45801': 'RFCW', '45802': 'RFCW', '45804': 'RFCW', '45805': 'RFCW', '45806': 'RFCW', '45807': 'RFCW', '45808': 'RFCW', '45809': 'RFCW', '45810': 'RFCW', '45812': 'RFCW', '45813': 'RFCW', '45814': 'RFCW', '45815': 'RFCW', '45816': 'RFCW', '45817': 'RFCW', '45819': 'RFCW', '45820': 'RFCW', '45821': 'RFCW', '45822': 'RFCW', '45826': 'RFCW', '45827': 'RFCW', '45828': 'RFCW', '45830': 'RFCW', '45831': 'RFCW', '45832': 'RFCW', '45833': 'RFCW', '45835': 'RFCW', '45836': 'RFCW', '45837': 'RFCW', '45838': 'RFCW', '45839': 'RFCW', '45840': 'RFCW', '45841': 'RFCW', '45843': 'RFCW', '45844': 'RFCW', '45845': 'RFCW', '45846': 'RFCW', '45848': 'RFCW', '45849': 'RFCW', '45850': 'RFCW', '45851': 'RFCW', '45853': 'RFCW', '45854': 'RFCW', '45855': 'RFCW', '45856': 'RFCW', '45858': 'RFCW', '45859': 'RFCW', '45860': 'RFCW', '45861': 'RFCW', '45862': 'RFCW', '45863': 'RFCW', '45864': 'RFCW', '45865': 'RFCW', '45866': 'RFCW', '45867': 'RFCW', '45868': 'RFCW', '45869': 'RFCW', '45870': 'RFCW', '45871': 'RFCW', '45872': 'RFCW', '45873': 'RFCW', '45874': 'RFCW', '45875': 'RFCW', '45876': 'RFCW', '45877': 'RFCW', '45879': 'RFCW', '45880': 'RFCW', '45881': 'RFCW', '45882': 'RFCW', '45883': 'RFCW', '45884': 'RFCW', '45885': 'RFCW', '45886': 'RFCW', '45887': 'RFCW', '45888': 'RFCW', '45889': 'RFCW', '45890': 'RFCW', '45891': 'RFCW', '45893': 'RFCW', '45894': 'RFCW', '45895': 'RFCW', '45896': 'RFCW', '45897': 'RFCW', '45898': 'RFCW', '45899': 'RFCW', '45999': 'RFCW', '46001': 'RFCW', '46011': 'RFCW', '46012': 'RFCW', '46013': 'RFCW', '46014': 'RFCW', '46015': 'RFCW', '46016': 'RFCW', '46017': 'RFCW', '46018': 'RFCW', '46030': 'RFCW', '46031': 'RFCW', '46032': 'RFCW', '46033': 'RFCW', '46034': 'RFCW', '46035': 'RFCW', '46036': 'RFCW', '46037': 'RFCW', '46038': 'RFCW', '46039': 'RFCW', '46040': 'RFCW', '46041': 'RFCW', '46044': 'RFCW', '46045': 'RFCW', '46047': 'RFCW', '46048': 'RFCW', '46049': 'RFCW', '46050': 'RFCW', '46051': 'RFCW', '46052': 'RFCW', '46055': 'RFCW', '46056': 'RFCW', '46057': 'RFCW', '46058': 'RFCW', '46060': 'RFCW', '46061': 'RFCW', '46062': 'RFCW', '46063': 'RFCW', '46064': 'RFCW', '46065': 'RFCW', '46067': 'RFCW', '46068': 'RFCW', '46069': 'RFCW', '46070': 'RFCW', '46071': 'RFCW', '46072': 'RFCW', '46074': 'RFCW', '46075': 'RFCW', '46076': 'RFCW', '46077': 'RFCW', '46082': 'RFCW', '46085': 'RFCW', '46102': 'RFCW', '46103': 'RFCW', '46104': 'RFCW', '46105': 'RFCW', '46106': 'RFCW', '46107': 'RFCW', '46110': 'RFCW', '46111': 'RFCW', '46112': 'RFCW', '46113': 'RFCW', '46115': 'RFCW', '46117': 'RFCW', '46118': 'RFCW', '46120': 'RFCW', '46121': 'RFCW', '46122': 'RFCW', '46123': 'RFCW', '46124': 'RFCW', '46125': 'RFCW', '46126': 'RFCW', '46127': 'RFCW', '46128': 'RFCW', '46129': 'RFCW', '46130': 'RFCW', '46131': 'RFCW', '46133': 'RFCW', '46135': 'RFCW', '46140': 'RFCW', '46142': 'RFCW', '46143': 'RFCW', '46144': 'RFCW', '46146': 'RFCW', '46147': 'RFCW', '46148': 'RFCW', '46149': 'RFCW', '46150': 'RFCW', '46151': 'RFCW', '46154': 'RFCW', '46155': 'RFCW', '46156': 'RFCW', '46157': 'RFCW', '46158': 'RFCW', '46160': 'RFCW', '46161': 'RFCW', '46162': 'RFCW', '46163': 'RFCW', '46164': 'RFCW', '46165': 'RFCW', '46166': 'RFCW', '46167': 'RFCW', '46168': 'RFCW', '46170': 'RFCW', '46171': 'RFCW', '46172': 'RFCW', '46173': 'RFCW', '46175': 'RFCW', '46176': 'RFCW', '46180': 'RFCW', '46181': 'RFCW', '46182': 'RFCW', '46183': 'RFCW', '46184': 'RFCW', '46186': 'RFCW', '46201': 'RFCW', '46202': 'RFCW', '46203': 'RFCW', '46204': 'RFCW', '46205': 'RFCW', '46206': 'RFCW', '46207': 'RFCW', '46208': 'RFCW', '46209': 'RFCW', '46211': 'RFCW', '46214': 'RFCW', '46216': 'RFCW', '46217': 'RFCW', '46218': 'RFCW', '46219': 'RFCW', '46220': 'RFCW', '46221': 'RFCW', '46222': 'RFCW', '46223': 'RFCW', '46224': 'RFCW', '46225': 'RFCW', '46226': 'RFCW', '46227': 'RFCW', '46228': 'RFCW', '46229': 'RFCW', '46230': 'RFCW', '46231': 'RFCW', '46234': 'RFCW', '46235': 'RFCW', '46236': 'RFCW', '46237': 'RFCW', '46239': 'RFCW', '46240': 'RFCW', '46241': 'RFCW', '46242': 'RFCW', '46244': 'RFCW', '46247': 'RFCW', '46249': 'RFCW', '46250': 'RFCW', '46251': 'RFCW', '46253': 'RFCW', '46254': 'RFCW', '46255': 'RFCW', '46256': 'RFCW', '46259': 'RFCW', '46260': 'RFCW', '46262': 'RFCW', '46266': 'RFCW', '46268': 'RFCW', '46274': 'RFCW', '46275': 'RFCW', '46277': 'RFCW', '46278': 'RFCW', '46280': 'RFCW', '46282': 'RFCW', '46283': 'RFCW', '46285': 'RFCW', '46290': 'RFCW', '46291': 'RFCW', '46295': 'RFCW', '46296': 'RFCW', '46298': 'RFCW', '46301': 'RFCW', '46302': 'RFCW', '46303': 'RFCW', '46304': 'RFCW', '46307': 'RFCW', '46308': 'RFCW', '46310': 'RFCW', '46311': 'RFCW', '46312': 'RFCW', '46319': 'RFCW', '46320': 'RFCW', '46321': 'RFCW', '46322': 'RFCW', '46323': 'RFCW', '46324': 'RFCW', '46325': 'RFCW', '46327': 'RFCW', '46340': 'RFCW', '46341': 'RFCW', '46342': 'RFCW', '46345': 'RFCW', '46346': 'RFCW', '46347': 'RFCW', '46348': 'RFCW', '46349': 'RFCW', '46350': 'RFCW', '46352': 'RFCW', '46355': 'RFCW', '46356': 'RFCW', '46360': 'RFCW', '46361': 'RFCW', '46365': 'RFCW', '46366': 'RFCW', '46368': 'RFCW', '46371': 'RFCW', '46372': 'RFCW', '46373': 'RFCW', '46374': 'RFCW', '46375': 'RFCW', '46376': 'RFCW', '46377': 'RFCW', '46379': 'RFCW', '46380': 'RFCW', '46381': 'RFCW', '46382': 'RFCW', '46383': 'RFCW', '46384': 'RFCW', '46385': 'RFCW', '46390': 'RFCW', '46391': 'RFCW', '46392': 'RFCW', '46393': 'RFCW', '46394': 'RFCW', '46401': 'RFCW', '46402': 'RFCW', '46403': 'RFCW', '46404': 'RFCW', '46405': 'RFCW', '46406': 'RFCW', '46407': 'RFCW', '46408': 'RFCW', '46409': 'RFCW', '46410': 'RFCW', '46411': 'RFCW', '46501': 'RFCW', '46502': 'RFCW', '46504': 'RFCW', '46506': 'RFCW', '46507': 'RFCW', '46508': 'RFCW', '46510': 'RFCW', '46511': 'RFCW', '46513': 'RFCW', '46514': 'RFCW', '46515': 'RFCW', '46516': 'RFCW', '46517': 'RFCW', '46524': 'RFCW', '46526': 'RFCW', '46527': 'RFCW', '46528': 'RFCW', '46530': 'RFCW', '46531': 'RFCW', '46532': 'RFCW', '46534': 'RFCW', '46536': 'RFCW', '46537': 'RFCW', '46538': 'RFCW', '46539': 'RFCW', '46540': 'RFCW', '46542': 'RFCW', '46543': 'RFCW', '46544': 'RFCW', '46545': 'RFCW', '46546': 'RFCW', '46550': 'RFCW', '46552': 'RFCW', '46553': 'RFCW', '46554': 'RFCW', '46555': 'RFCW', '46556': 'RFCW', '46561': 'RFCW', '46562': 'RFCW', '46563': 'RFCW', '46565': 'RFCW', '46567': 'RFCW', '46570': 'RFCW', '46571': 'RFCW', '46572': 'RFCW', '46573': 'RFCW', '46574': 'RFCW', '46580': 'RFCW', '46581': 'RFCW', '46582': 'RFCW', '46590': 'RFCW', '46595': 'RFCW', '46601': 'RFCW', '46613': 'RFCW', '46614': 'RFCW', '46615': 'RFCW', '46616': 'RFCW', '46617': 'RFCW', '46619': 'RFCW', '46624': 'RFCW', '46626': 'RFCW', '46628': 'RFCW', '46634': 'RFCW', '46635': 'RFCW', '46637': 'RFCW', '46660': 'RFCW', '46680': 'RFCW', '46699': 'RFCW', '46701': 'RFCW', '46702': 'RFCW', '46703': 'RFCW', '46704': 'RFCW', '46705': 'RFCW', '46706': 'RFCW', '46710': 'RFCW', '46711': 'RFCW', '46713': 'RFCW', '46714': 'RFCW', '46721': 'RFCW', '46723': 'RFCW', '46725': 'RFCW', '46730': 'RFCW', '46731': 'RFCW', '46732': 'RFCW', '46733': 'RFCW', '46737': 'RFCW', '46738': 'RFCW', '46740': 'RFCW', '46741': 'RFCW', '46742': 'RFCW', '46743': 'RFCW', '46745': 'RFCW', '46746': 'RFCW', '46747': 'RFCW', '46748': 'RFCW', '46750': 'RFCW', '46755': 'RFCW', '46759': 'RFCW', '46760': 'RFCW', '46761': 'RFCW', '46763': 'RFCW', '46764': 'RFCW', '46765': 'RFCW', '46766': 'RFCW', '46767': 'RFCW', '46769': 'RFCW', '46770': 'RFCW', '46771': 'RFCW', '46772': 'RFCW', '46773': 'RFCW', '46774': 'RFCW', '46776': 'RFCW', '46777': 'RFCW', '46778': 'RFCW', '46779': 'RFCW', '46780': 'RFCW', '46781': 'RFCW', '46782': 'RFCW', '46783': 'RFCW', '46784': 'RFCW', '46785': 'RFCW', '46786': 'RFCW', '46787': 'RFCW', '46788': 'RFCW', '46789': 'RFCW', '46791': 'RFCW', '46792': 'RFCW', '46793': 'RFCW', '46794': 'RFCW', '46795': 'RFCW', '46796': 'RFCW', '46797': 'RFCW', '46798': 'RFCW', '46799': 'RFCW', '46801': 'RFCW', '46802': 'RFCW', '46803': 'RFCW', '46804': 'RFCW', '46805': 'RFCW', '46806': 'RFCW', '46807': 'RFCW', '46808': 'RFCW', '46809': 'RFCW', '46814': 'RFCW', '46815': 'RFCW', '46816': 'RFCW', '46818': 'RFCW', '46819': 'RFCW', '46825': 'RFCW', '46835': 'RFCW', '46845': 'RFCW', '46850': 'RFCW', '46851': 'RFCW', '46852': 'RFCW', '46853': 'RFCW', '46854': 'RFCW', '46855': 'RFCW', '46856': 'RFCW', '46857': 'RFCW', '46858': 'RFCW', '46859': 'RFCW', '46860': 'RFCW', '46861': 'RFCW', '46862': 'RFCW', '46863': 'RFCW', '46864': 'RFCW', '46865': 'RFCW', '46866': 'RFCW', '46867': 'RFCW', '46868': 'RFCW', '46869': 'RFCW', '46885': 'RFCW', '46895': 'RFCW', '46896': 'RFCW', '46897': 'RFCW', '46898': 'RFCW', '46899': 'RFCW', '46901': 'RFCW', '46902': 'RFCW', '46903': 'RFCW', '46904': 'RFCW', '46910': 'RFCW', '46911': 'RFCW', '46912': 'RFCW', '46913': 'RFCW', '46914': 'RFCW', '46915': 'RFCW', '46916': 'RFCW', '46917': 'RFCW', '46919': 'RFCW', '46920': 'RFCW', '46921': 'RFCW', '46922': 'RFCW', '46923': 'RFCW', '46926': 'RFCW', '46928': 'RFCW', '46929': 'RFCW', '46930': 'RFCW', '46931': 'RFCW', '46932': 'RFCW', '46933': 'RFCW', '46935': 'RFCW', '46936': 'RFCW', '46937': 'RFCW', '46938': 'RFCW', '46939': 'RFCW', '46940': 'RFCW', '46941': 'RFCW', '46942': 'RFCW', '46943': 'RFCW', '46945': 'RFCW', '46946': 'RFCW', '46947': 'RFCW', '46950': 'RFCW', '46951': 'RFCW', '46952': 'RFCW', '46953': 'RFCW', '46957': 'RFCW', '46958': 'RFCW', '46959': 'RFCW', '46960': 'RFCW', '46961': 'RFCW', '46962': 'RFCW', '46965': 'RFCW', '46967': 'RFCW', '46968': 'RFCW', '46970': 'RFCW', '46971': 'RFCW', '46974': 'RFCW', '46975': 'RFCW', '46977': 'RFCW', '46978': 'RFCW', '46979': 'RFCW', '46980': 'RFCW', '46982': 'RFCW', '46984': 'RFCW', '46985': 'RFCW', '46986': 'RFCW', '46987': 'RFCW', '46988': 'RFCW', '46989': 'RFCW', '46990': 'RFCW', '46991': 'RFCW', '46992': 'RFCW', '46994': 'RFCW', '46995': 'RFCW', '46996': 'RFCW', '46998': 'RFCW', '47001': 'RFCW', '47003': 'RFCW', '47006': 'RFCW', '47010': 'RFCW', '47011': 'RFCW', '47012': 'RFCW', '47016': 'RFCW', '47017': 'RFCW', '47018': 'RFCW', '47019': 'RFCW', '47020': 'RFCW', '47021': 'RFCW', '47022': 'RFCW', '47023': 'RFCW', '47024': 'RFCW', '47025': 'RFCW', '47030': 'RFCW', '47031': 'RFCW', '47032': 'RFCW', '47033': 'RFCW', '47034': 'RFCW', '47035': 'RFCW', '47036': 'RFCW', '47037': 'RFCW', '47038': 'RFCW', '47039': 'RFCW', '47040': 'RFCW', '47041': 'RFCW', '47042': 'RFCW', '47043': 'RFCW', '47060': 'RFCW', '47102': 'RFCW', '47104': 'RFCW', '47106': 'RFCW', '47107': 'RFCW', '47108': 'RFCW', '47110': 'RFCW', '47111': 'RFCW', '47112': 'RFCW', '47114': 'RFCW', '47115': 'RFCW', '47116': 'RFCW', '47117': 'RFCW', '47118': 'RFCW', '47119': 'RFCW', '47120': 'RFCW', '47122': 'RFCW', '47123': 'RFCW', '47124': 'RFCW', '47125': 'RFCW', '47126': 'RFCW', '47129': 'RFCW', '47130': 'RFCW', '47131': 'RFCW', '47132': 'RFCW', '47133': 'RFCW', '47134': 'RFCW', '47135': 'RFCW', '47136': 'RFCW', '47137': 'RFCW', '47138': 'RFCW', '47139': 'RFCW', '47140': 'RFCW', '47141': 'RFCW', '47142': 'RFCW', '47143': 'RFCW', '47144': 'RFCW', '47145': 'RFCW', '47146': 'RFCW', '47147': 'RFCW', '47150': 'RFCW', '47151': 'RFCW', '47160': 'RFCW', '47161': 'RFCW', '47162': 'RFCW', '47163': 'RFCW', '47164': 'RFCW', '47165': 'RFCW', '47166': 'RFCW', '47167': 'RFCW', '47170': 'RFCW', '47172': 'RFCW', '47174': 'RFCW', '47175': 'RFCW', '47177': 'RFCW', '47190': 'RFCW', '47199': 'RFCW', '47201': 'RFCW', '47202': 'RFCW', '47203': 'RFCW', '47220': 'RFCW', '47223': 'RFCW', '47224': 'RFCW', '47225': 'RFCW', '47226': 'RFCW', '47227': 'RFCW', '47228': 'RFCW', '47229': 'RFCW', '47230': 'RFCW', '47231': 'RFCW', '47232': 'RFCW', '47234': 'RFCW', '47235': 'RFCW', '47236': 'RFCW', '47240': 'RFCW', '47243': 'RFCW', '47244': 'RFCW', '47245': 'RFCW', '47246': 'RFCW', '47247': 'RFCW', '47249': 'RFCW', '47250': 'RFCW', '47260': 'RFCW', '47261': 'RFCW', '47263': 'RFCW', '47264': 'RFCW', '47265': 'RFCW', '47270': 'RFCW', '47272': 'RFCW', '47273': 'RFCW', '47274': 'RFCW', '47280': 'RFCW', '47281': 'RFCW', '47282': 'RFCW', '47283': 'RFCW', '47302': 'RFCW', '47303': 'RFCW', '47304': 'RFCW', '47305': 'RFCW', '47306': 'RFCW', '47307': 'RFCW', '47308': 'RFCW', '47320': 'RFCW', '47322': 'RFCW', '47324': 'RFCW', '47325': 'RFCW', '47326': 'RFCW', '47327': 'RFCW', '47330': 'RFCW', '47331': 'RFCW', '47334': 'RFCW', '47335': 'RFCW', '47336': 'RFCW', '47337': 'RFCW', '47338': 'RFCW', '47339': 'RFCW', '47340': 'RFCW', '47341': 'RFCW', '47342': 'RFCW', '47344': 'RFCW', '47345': 'RFCW', '47346': 'RFCW', '47348': 'RFCW', '47351': 'RFCW', '47352': 'RFCW', '47353': 'RFCW', '47354': 'RFCW', '47355': 'RFCW', '47356': 'RFCW', '47357': 'RFCW', '47358': 'RFCW', '47359': 'RFCW', '47360': 'RFCW', '47361': 'RFCW', '47362': 'RFCW', '47366': 'RFCW', '47367': 'RFCW', '47368': 'RFCW', '47369': 'RFCW', '47370': 'RFCW', '47371': 'RFCW', '47373': 'RFCW', '47374': 'RFCW', '47375': 'RFCW', '47380': 'RFCW', '47381': 'RFCW', '47382': 'RFCW', '47383': 'RFCW', '47384': 'RFCW', '47385': 'RFCW', '47386': 'RFCW', '47387': 'RFCW', '47388': 'RFCW', '47390': 'RFCW', '47392': 'RFCW', '47393': 'RFCW', '47394': 'RFCW', '47396': 'RFCW', '47401': 'RFCW', '47402': 'RFCW', '47403': 'RFCW', '47404': 'RFCW', '47405': 'RFCW', '47406': 'RFCW', '47407': 'RFCW', '47408': 'RFCW', '47420': 'RFCW', '47421': 'RFCW', '47424': 'RFCW', '47426': 'RFCW', '47427': 'RFCW', '47429': 'RFCW', '47431': 'RFCW', '47432': 'RFCW', '47433': 'RFCW', '47434': 'RFCW', '47435': 'RFCW', '47436': 'RFCW', '47437': 'RFCW', '47438': 'RFCW', '47439': 'RFCW', '47441': 'RFCW', '47443': 'RFCW', '47445': 'RFCW', '47446': 'RFCW', '47448': 'RFCW', '47449': 'RFCW', '47451': 'RFCW', '47452': 'RFCW', '47453': 'RFCW', '47454': 'RFCW', '47455': 'RFCW', '47456': 'RFCW', '47457': 'RFCW', '47458': 'RFCW', '47459': 'RFCW', '47460': 'RFCW', '47462': 'RFCW', '47463': 'RFCW', '47464': 'RFCW', '47465': 'RFCW', '47467': 'RFCW', '47468': 'RFCW', '47469': 'RFCW', '47470': 'RFCW', '47471': 'RFCW', '47501': 'RFCW', '47512': 'RFCW', '47513': 'RFCW', '47514': 'RFCW', '47515': 'RFCW', '47516': 'RFCW', '47519': 'RFCW', '47520': 'RFCW', '47521': 'RFCW', '47522': 'RFCW', '47523': 'RFCW', '47524': 'RFCW', '47525': 'RFCW', '47527': 'RFCW', '47528': 'RFCW', '47529': 'RFCW', '47531': 'RFCW', '47532': 'RFCW', '47535': 'RFCW', '47536': 'RFCW', '47537': 'RFCW', '47541': 'RFCW', '47542': 'RFCW', '47545': 'RFCW', '47546': 'RFCW', '47547': 'RFCW', '47549': 'RFCW', '47550': 'RFCW', '47551': 'RFCW', '47552': 'RFCW', '47553': 'RFCW', '47556': 'RFCW', '47557': 'RFCW', '47558': 'RFCW', '47561': 'RFCW', '47562': 'RFCW', '47564': 'RFCW', '47567': 'RFCW', '47568': 'RFCW', '47573': 'RFCW', '47574': 'RFCW', '47575': 'RFCW', '47576': 'RFCW', '47577': 'RFCW', '47578': 'RFCW', '47579': 'RFCW', '47580': 'RFCW', '47581': 'RFCW', '47584': 'RFCW', '47585': 'RFCW', '47586': 'RFCW', '47588': 'RFCW', '47590': 'RFCW', '47591': 'RFCW', '47596': 'RFCW', '47597': 'RFCW', '47598': 'RFCW', '47601': 'RFCW', '47610': 'RFCW', '47611': 'RFCW', '47612': 'RFCW', '47613': 'RFCW', '47614': 'RFCW', '47615': 'RFCW', '47616': 'RFCW', '47617': 'RFCW', '47618': 'RFCW', '47619': 'RFCW', '47620': 'RFCW', '47629': 'RFCW', '47630': 'RFCW', '47631': 'RFCW', '47633': 'RFCW', '47634': 'RFCW', '47635': 'RFCW', '47637': 'RFCW', '47638': 'RFCW', '47639': 'RFCW', '47640': 'RFCW', '47647': 'RFCW', '47648': 'RFCW', '47649': 'RFCW', '47654': 'RFCW', '47660': 'RFCW', '47665': 'RFCW', '47666': 'RFCW', '47670': 'RFCW', '47683': 'RFCW', '47701': 'RFCW', '47702': 'RFCW', '47703': 'RFCW', '47704': 'RFCW', '47705': 'RFCW', '47706': 'RFCW', '47708': 'RFCW', '47710': 'RFCW', '47711': 'RFCW', '47712': 'RFCW', '47713': 'RFCW', '47714': 'RFCW', '47715': 'RFCW', '47716': 'RFCW', '47719': 'RFCW', '47720': 'RFCW', '47721': 'RFCW', '47722': 'RFCW', '47724': 'RFCW', '47725': 'RFCW', '47727': 'RFCW', '47728': 'RFCW', '47730': 'RFCW', '47731': 'RFCW', '47732': 'RFCW', '47733': 'RFCW', '47734': 'RFCW', '47735': 'RFCW', '47736': 'RFCW', '47737': 'RFCW', '47740': 'RFCW', '47744': 'RFCW', '47747': 'RFCW', '47750': 'RFCW', '47801': 'RFCW', '47802': 'RFCW', '47803': 'RFCW', '47804': 'RFCW', '47805': 'RFCW', '47807': 'RFCW', '47808': 'RFCW', '47809': 'RFCW', '47811': 'RFCW', '47812': 'RFCW', '47830': 'RFCW', '47831': 'RFCW', '47832': 'RFCW', '47833': 'RFCW', '47834': 'RFCW', '47836': 'RFCW', '47837': 'RFCW', '47838': 'RFCW', '47840': 'RFCW', '47841': 'RFCW', '47842': 'RFCW', '47845': 'RFCW', '47846': 'RFCW', '47847': 'RFCW', '47848': 'RFCW', '47849': 'RFCW', '47850': 'RFCW', '47851': 'RFCW', '47852': 'RFCW', '47853': 'RFCW', '47854': 'RFCW', '47855': 'RFCW', '47857': 'RFCW', '47858': 'RFCW', '47859': 'RFCW', '47860': 'RFCW', '47861': 'RFCW', '47862': 'RFCW', '47863': 'RFCW', '47865': 'RFCW', '47866': 'RFCW', '47868': 'RFCW', '47869': 'RFCW', '47870': 'RFCW', '47871': 'RFCW', '47872': 'RFCW', '47874': 'RFCW', '47875': 'RFCW', '47876': 'RFCW', '47878': 'RFCW', '47879': 'RFCW', '47880': 'RFCW', '47881': 'RFCW', '47882': 'RFCW', '47884': 'RFCW', '47885': 'RFCW', '47901': 'RFCW', '47902': 'RFCW', '47903': 'RFCW', '47904': 'RFCW', '47905': 'RFCW', '47906': 'RFCW', '47907': 'RFCW', '47909': 'RFCW', '47916': 'RFCW', '47917': 'RFCW', '47918': 'RFCW', '47920': 'RFCW', '47921': 'RFCW', '47922': 'RFCW', '47923': 'RFCW', '47924': 'RFCW', '47925': 'RFCW', '47926': 'RFCW', '47928': 'RFCW', '47929': 'RFCW', '47930': 'RFCW', '47932': 'RFCW', '47933': 'RFCW', '47934': 'RFCW', '47935': 'RFCW', '47936': 'RFCW', '47937': 'RFCW', '47938': 'RFCW', '47939': 'RFCW', '47940': 'RFCW', '47941': 'RFCW', '47942': 'RFCW', '47943': 'RFCW', '47944': 'RFCW', '47946': 'RFCW', '47948': 'RFCW', '47949': 'RFCW', '47950': 'RFCW', '47951': 'RFCW', '47952': 'RFCW', '47954': 'RFCW', '47955': 'RFCW', '47957': 'RFCW', '47958': 'RFCW', '47959': 'RFCW', '47960': 'RFCW', '47962': 'RFCW', '47963': 'RFCW', '47964': 'RFCW', '47965': 'RFCW', '47966': 'RFCW', '47967': 'RFCW', '47968': 'RFCW', '47969': 'RFCW', '47970': 'RFCW', '47971': 'RFCW', '47974': 'RFCW', '47975': 'RFCW', '47977': 'RFCW', '47978': 'RFCW', '47980': 'RFCW', '47981': 'RFCW', '47982': 'RFCW', '47983': 'RFCW', '47984': 'RFCW', '47986': 'RFCW', '47987': 'RFCW', '47988': 'RFCW', '47989': 'RFCW', '47990': 'RFCW', '47991': 'RFCW', '47992': 'RFCW', '47993': 'RFCW', '47994': 'RFCW', '47995': 'RFCW', '47996': 'RFCW', '47997': 'RFCW', '48001': 'RFCM', '48002': 'RFCM', '48003': 'RFCM', '48004': 'RFCM', '48005': 'RFCM', '48006': 'RFCM', '48007': 'RFCM', '48009': 'RFCM', '48012': 'RFCM', '48014': 'RFCM', '48015': 'RFCM', '48017': 'RFCM', '48021': 'RFCM', '48022': 'RFCM', '48023': 'RFCM', '48025': 'RFCM', '48026': 'RFCM', '48027': 'RFCM', '48028': 'RFCM', '48030': 'RFCM', '48032': 'RFCM', '48033': 'RFCM', '48034': 'RFCM', '48035': 'RFCM', '48036': 'RFCM', '48037': 'RFCM', '48038': 'RFCM', '48039': 'RFCM', '48040': 'RFCM', '48041': 'RFCM', '48042': 'RFCM', '48043': 'RFCM', '48044': 'RFCM', '48045': 'RFCM', '48046': 'RFCM', '48047': 'RFCM', '48048': 'RFCM', '48049': 'RFCM', '48050': 'RFCM', '48051': 'RFCM', '48054': 'RFCM', '48059': 'RFCM', '48060': 'RFCM', '48061': 'RFCM', '48062': 'RFCM', '48063': 'RFCM', '48064': 'RFCM', '48065': 'RFCM', '48066': 'RFCM', '48067': 'RFCM', '48068': 'RFCM', '48069': 'RFCM', '48070': 'RFCM', '48071': 'RFCM', '48072': 'RFCM', '48073': 'RFCM', '48074': 'RFCM', '48075': 'RFCM', '48076': 'RFCM', '48079': 'RFCM', '48080': 'RFCM', '48081': 'RFCM', '48082': 'RFCM', '48083': 'RFCM', '48084': 'RFCM', '48085': 'RFCM', '48086': 'RFCM', '48088': 'RFCM', '48089': 'RFCM', '48090': 'RFCM', '48091': 'RFCM', '48092': 'RFCM', '48093': 'RFCM', '48094': 'RFCM', '48095': 'RFCM', '48096': 'RFCM', '48097': 'RFCM', '48098': 'RFCM', '48099': 'RFCM', '48101': 'RFCM', '48103': 'RFCM', '48104': 'RFCM', '48105': 'RFCM', '48106': 'RFCM', '48107': 'RFCM', '48108': 'RFCM', '48109': 'RFCM', '48110': 'RFCM', '48111': 'RFCM', '48112': 'RFCM', '48113': 'RFCM', '48114': 'RFCM', '48115': 'RFCM', '48116': 'RFCM', '48117': 'RFCM', '48118': 'RFCM', '48120': 'RFCM', '48121': 'RFCM', '48122': 'RFCM', '48123': 'RFCM', '48124': 'RFCM', '48125': 'RFCM', '48126': 'RFCM', '48127': 'RFCM', '48128': 'RFCM', '48130': 'RFCM', '48131': 'RFCM', '48133': 'RFCM', '48134': 'RFCM', '48135': 'RFCM', '48136': 'RFCM', '48137': 'RFCM', '48138': 'RFCM', '48139': 'RFCM', '48140': 'RFCM', '48141': 'RFCM', '48143': 'RFCM', '48144': 'RFCM', '48145': 'RFCM', '48146': 'RFCM', '48150': 'RFCM', '48151': 'RFCM', '48152': 'RFCM', '48153': 'RFCM', '48154': 'RFCM', '48157': 'RFCM', '48158': 'RFCM', '48159': 'RFCM', '48160': 'RFCM', '48161': 'RFCM', '48162': 'RFCM', '48164': 'RFCM', '48165': 'RFCM', '48166': 'RFCM', '48167': 'RFCM', '48168': 'RFCM', '48169': 'RFCM', '48170': 'RFCM', '48173': 'RFCM', '48174': 'RFCM', '48175': 'RFCM', '48176': 'RFCM', '48177': 'RFCM', '48178': 'RFCM', '48179': 'RFCM', '48180': 'RFCM', '48182': 'RFCM', '48183': 'RFCM', '48184': 'RFCM', '48185': 'RFCM', '48186': 'RFCM', '48187': 'RFCM', '48188': 'RFCM', '48189': 'RFCM', '48190': 'RFCM', '48191': 'RFCM', '48192': 'RFCM', '48193': 'RFCM', '48195': 'RFCM', '48197': 'RFCM', '48198': 'RFCM', '48201': 'RFCM', '48202': 'RFCM', '48203': 'RFCM', '48204': 'RFCM', '48205': 'RFCM', '48206': 'RFCM', '48207': 'RFCM', '48208': 'RFCM', '48209': 'RFCM', '48210': 'RFCM', '48211': 'RFCM', '48212': 'RFCM', '48213': 'RFCM', '48214': 'RFCM', '48215': 'RFCM', '48216': 'RFCM', '48217': 'RFCM', '48218': 'RFCM', '48219': 'RFCM', '48220': 'RFCM', '48221': 'RFCM', '48222': 'RFCM', '48223': 'RFCM', '48224': 'RFCM', '48225': 'RFCM', '48226': 'RFCM', '48227': 'RFCM', '48228': 'RFCM', '48229': 'RFCM', '48230': 'RFCM', '48231': 'RFCM', '48232': 'RFCM', '48233': 'RFCM', '48234': 'RFCM', '48235': 'RFCM', '48236': 'RFCM', '48237': 'RFCM', '48238': 'RFCM', '48239': 'RFCM', '48240': 'RFCM', '48242': 'RFCM', '48243': 'RFCM', '48244': 'RFCM', '48255': 'RFCM', '48260': 'RFCM', '48264': 'RFCM', '48265': 'RFCM', '48266': 'RFCM', '48267': 'RFCM', '48268': 'RFCM', '48269': 'RFCM', '48272': 'RFCM', '48275': 'RFCM', '48277': 'RFCM', '48278': 'RFCM', '48279': 'RFCM', '48288': 'RFCM', '48301': 'RFCM', '48302': 'RFCM', '48303': 'RFCM', '48304': 'RFCM', '48306': 'RFCM', '48307': 'RFCM', '48308': 'RFCM', '48309': 'RFCM', '48310': 'RFCM', '48311': 'RFCM', '48312': 'RFCM', '48313': 'RFCM', '48314': 'RFCM', '48315': 'RFCM', '48316': 'RFCM', '48317': 'RFCM', '48318': 'RFCM', '48320': 'RFCM', '48321': 'RFCM', '48322': 'RFCM', '48323': 'RFCM', '48324': 'RFCM', '48325': 'RFCM', '48326': 'RFCM', '48327': 'RFCM', '48328': 'RFCM', '48329': 'RFCM', '48330': 'RFCM', '48331': 'RFCM', '48332': 'RFCM', '48333': 'RFCM', '48334': 'RFCM', '48335': 'RFCM', '48336': 'RFCM', '48340': 'RFCM', '48341': 'RFCM', '48342': 'RFCM', '48343': 'RFCM', '48346': 'RFCM', '48347': 'RFCM', '48348': 'RFCM', '48350': 'RFCM', '48353': 'RFCM', '48356': 'RFCM', '48357': 'RFCM', '48359': 'RFCM', '48360': 'RFCM', '48361': 'RFCM', '48362': 'RFCM', '48363': 'RFCM', '48366': 'RFCM', '48367': 'RFCM', '48370': 'RFCM', '48371': 'RFCM', '48374': 'RFCM', '48375': 'RFCM', '48376': 'RFCM', '48377': 'RFCM', '48380': 'RFCM', '48381': 'RFCM', '48382': 'RFCM', '48383': 'RFCM', '48386': 'RFCM', '48387': 'RFCM', '48390': 'RFCM', '48391': 'RFCM', '48393': 'RFCM', '48397': 'RFCM', '48401': 'RFCM', '48410': 'RFCM', '48411': 'RFCM', '48412': 'RFCM', '48413': 'RFCM', '48414': 'RFCM', '48415': 'RFCM', '48416': 'RFCM', '48417': 'RFCM', '48418': 'RFCM', '48419': 'RFCM', '48420': 'RFCM', '48421': 'RFCM', '48422': 'RFCM', '48423': 'RFCM', '48426': 'RFCM', '48427': 'RFCM', '48428': 'RFCM', '48429': 'RFCM', '48430': 'RFCM', '48432': 'RFCM', '48433': 'RFCM', '48434': 'RFCM', '48435': 'RFCM', '48436': 'RFCM', '48437': 'RFCM', '48438': 'RFCM', '48439': 'RFCM', '48440': 'RFCM', '48441': 'RFCM', '48442': 'RFCM', '48444': 'RFCM', '48445': 'RFCM', '48446': 'RFCM', '48449': 'RFCM', '48450': 'RFCM', '48451': 'RFCM', '48453': 'RFCM', '48454': 'RFCM', '48455': 'RFCM', '48456': 'RFCM', '48457': 'RFCM', '48458': 'RFCM', '48460': 'RFCM', '48461': 'RFCM', '48462': 'RFCM', '48463': 'RFCM', '48464': 'RFCM', '48465': 'RFCM', '48466': 'RFCM', '48467': 'RFCM', '48468': 'RFCM', '48469': 'RFCM', '48470': 'RFCM', '48471': 'RFCM', '48472': 'RFCM', '48473': 'RFCM', '48475': 'RFCM', '48476': 'RFCM', '48480': 'RFCM', '48501': 'RFCM', '48502': 'RFCM', '48503': 'RFCM', '48504': 'RFCM', '48505': 'RFCM', '48506': 'RFCM', '48507': 'RFCM', '48509': 'RFCM', '48519': 'RFCM', '48529': 'RFCM', '48531': 'RFCM', '48532': 'RFCM', '48550': 'RFCM', '48551': 'RFCM', '48552': 'RFCM', '48553': 'RFCM', '48554': 'RFCM', '48555': 'RFCM', '48556': 'RFCM', '48557': 'RFCM', '48601': 'RFCM', '48602': 'RFCM', '48603': 'RFCM', '48604': 'RFCM', '48605': 'RFCM', '48606': 'RFCM', '48607': 'RFCM', '48608': 'RFCM', '48609': 'RFCM', '48610': 'RFCM', '48611': 'RFCM', '48612': 'RFCM', '48613': 'RFCM', '48614': 'RFCM', '48615': 'RFCM', '48616': 'RFCM', '48617': 'RFCM', '48618': 'RFCM', '48619': 'RFCM', '48620': 'RFCM', '48621': 'RFCM', '48622': 'RFCM', '48623': 'RFCM', '48624': 'RFCM', '48625': 'RFCM', '48626': 'RFCM', '48627': 'RFCM', '48628': 'RFCM', '48629': 'RFCM', '48630': 'RFCM', '48631': 'RFCM', '48632': 'RFCM', '48633': 'RFCM', '48634': 'RFCM', '48635': 'RFCM', '48636': 'RFCM', '48637': 'RFCM', '48638': 'RFCM', '48640': 'RFCM', '48641': 'RFCM', '48642': 'RFCM', '48647': 'RFCM', '48649': 'RFCM', '48650': 'RFCM', '48651': 'RFCM', '48652': 'RFCM', '48653': 'RFCM', '48654': 'RFCM', '48655': 'RFCM', '48656': 'RFCM', '48657': 'RFCM', '48658': 'RFCM', '48659': 'RFCM', '48661': 'RFCM', '48662': 'RFCM', '48663': 'RFCM', '48667': 'RFCM', '48670': 'RFCM', '48674': 'RFCM', '48686': 'RFCM', '48701': 'RFCM', '48703': 'RFCM', '48705': 'RFCM', '48706': 'RFCM', '48707': 'RFCM', '48708': 'RFCM', '48710': 'RFCM', '48720': 'RFCM', '48721': 'RFCM', '48722': 'RFCM', '48723': 'RFCM', '48724': 'RFCM', '48725': 'RFCM', '48726': 'RFCM', '48727': 'RFCM', '48728': 'RFCM', '48729': 'RFCM', '48730': 'RFCM', '48731': 'RFCM', '48732': 'RFCM', '48733': 'RFCM', '48734': 'RFCM', '48735': 'RFCM', '48736': 'RFCM', '48737': 'RFCM', '48738': 'RFCM', '48739': 'RFCM', '48740': 'RFCM', '48741': 'RFCM', '48742': 'RFCM', '48743': 'RFCM', '48744': 'RFCM', '48745': 'RFCM', '48746': 'RFCM', '48747': 'RFCM', '48748': 'RFCM', '48749': 'RFCM', '48750': 'RFCM', '48754': 'RFCM', '48755': 'RFCM', '48756': 'RFCM', '48757': 'RFCM', '48758': 'RFCM', '48759': 'RFCM', '48760': 'RFCM', '48761': 'RFCM', '48762': 'RFCM', '48763': 'RFCM', '48764': 'RFCM', '48765': 'RFCM', '48766': 'RFCM', '48767': 'RFCM', '48768': 'RFCM', '48769': 'RFCM', '48770': 'RFCM', '48787': 'RFCM', '48801': 'RFCM', '48802': 'RFCM', '48804': 'RFCM', '48805': 'RFCM', '48806': 'RFCM', '48807': 'RFCM', '48808': 'RFCM', '48809': 'RFCM', '48811': 'RFCM', '48812': 'RFCM', '48813': 'RFCM', '48815': 'RFCM', '48816': 'RFCM', '48817': 'RFCM', '48818': 'RFCM', '48819': 'RFCM', '48820': 'RFCM', '48821': 'RFCM', '48822': 'RFCM', '48823': 'RFCM', '48824': 'RFCM', '48825': 'RFCM', '48826': 'RFCM', '48827': 'RFCM', '48829': 'RFCM', '48830': 'RFCM', '48831': 'RFCM', '48832': 'RFCM', '48833': 'RFCM', '48834': 'RFCM', '48835': 'RFCM', '48836': 'RFCM', '48837': 'RFCM', '48838': 'RFCM', '48840': 'RFCM', '48841': 'RFCM', '48842': 'RFCM', '48843': 'RFCM', '48844': 'RFCM', '48845': 'RFCM', '48846': 'RFCM', '48847': 'RFCM', '48848': 'RFCM', '48849': 'RFCM', '48850': 'RFCM', '48851': 'RFCM', '48852': 'RFCM', '48853': 'RFCM', '48854': 'RFCM', '48855': 'RFCM', '48856': 'RFCM', '48857': 'RFCM', '48858': 'RFCM', '48859': 'RFCM', '48860': 'RFCM', '48861': 'RFCM', '48862': 'RFCM', '48863': 'RFCM', '48864': 'RFCM', '48865': 'RFCM', '48866': 'RFCM', '48867': 'RFCM', '48870': 'RFCM', '48871': 'RFCM', '48872': 'RFCM', '48873': 'RFCM', '48874': 'RFCM', '48875': 'RFCM', '48876': 'RFCM', '48877': 'RFCM', '48878': 'RFCM', '48879': 'RFCM', '48880': 'RFCM', '48881': 'RFCM', '48882': 'RFCM', '48883': 'RFCM', '48884': 'RFCM', '48885': 'RFCM', '48886': 'RFCM', '48887': 'RFCM', '48888': 'RFCM', '48889': 'RFCM', '48890': 'RFCM', '48891': 'RFCM', '48892': 'RFCM', '48893': 'RFCM', '48894': 'RFCM', '48895': 'RFCM', '48896': 'RFCM', '48897': 'RFCM', '48901': 'RFCM', '48906': 'RFCM', '48908': 'RFCM', '48909': 'RFCM', '48910': 'RFCM', '48911': 'RFCM', '48912': 'RFCM', '48913': 'RFCM', '48915': 'RFCM', '48916': 'RFCM', '48917': 'RFCM', '48918': 'RFCM', '48919': 'RFCM', '48921': 'RFCM', '48922': 'RFCM', '48924': 'RFCM', '48929': 'RFCM', '48930': 'RFCM', '48933': 'RFCM', '48937': 'RFCM', '48950': 'RFCM', '48951': 'RFCM', '48956': 'RFCM', '48980': 'RFCM', '49001': 'RFCM', '49002': 'RFCM', '49003': 'RFCM', '49004': 'RFCM', '49005': 'RFCM', '49006': 'RFCM', '49007': 'RFCM', '49008': 'RFCM', '49009': 'RFCM', '49010': 'RFCM', '49011': 'RFCM', '49012': 'RFCM', '49013': 'RFCM', '49014': 'RFCM', '49015': 'RFCM', '49016': 'RFCM', '49017': 'RFCM', '49018': 'RFCM', '49019': 'RFCM', '49020': 'RFCM', '49021': 'RFCM', '49022': 'RFCW', '49023': 'RFCW', '49024': 'RFCM', '49026': 'RFCM', '49027': 'RFCM', '49028': 'RFCM', '49029': 'RFCM', '49030': 'RFCM', '49031': 'RFCW', '49032': 'RFCM', '49033': 'RFCM', '49034': 'RFCM', '49035': 'RFCM', '49036': 'RFCM', '49037': 'RFCM', '49038': 'RFCM', '49039': 'RFCW', '49040': 'RFCM', '49041': 'RFCM', '49042': 'RFCM', '49043': 'RFCM', '49045': 'RFCM', '49046': 'RFCM', '49047': 'RFCM', '49048': 'RFCM', '49050': 'RFCM', '49051': 'RFCM', '49052': 'RFCM', '49053': 'RFCM', '49055': 'RFCM', '49056': 'RFCM', '49057': 'RFCM', '49058': 'RFCM', '49060': 'RFCM', '49061': 'RFCW', '49062': 'RFCM', '49063': 'RFCM', '49064': 'RFCM', '49065': 'RFCM', '49066': 'RFCM', '49067': 'RFCW', '49068': 'RFCM', '49069': 'RFCM', '49070': 'RFCM', '49071': 'RFCM', '49072': 'RFCM', '49073': 'RFCM', '49074': 'RFCM', '49075': 'RFCM', '49076': 'RFCM', '49077': 'RFCM', '49078': 'RFCM', '49079': 'RFCM', '49080': 'RFCM', '49081': 'RFCM', '49082': 'RFCM', '49083': 'RFCM', '49084': 'RFCW', '49085': 'RFCW', '49087': 'RFCM', '49088': 'RFCM', '49089': 'RFCM', '49090': 'RFCM', '49091': 'RFCW', '49092': 'RFCM', '49093': 'RFCM', '49094': 'RFCM', '49095': 'RFCW', '49096': 'RFCM', '49097': 'RFCM', '49098': 'RFCW', '49099': 'RFCM', '49101': 'RFCW', '49102': 'RFCW', '49103': 'RFCW', '49104': 'RFCW', '49106': 'RFCW', '49107': 'RFCW', '49111': 'RFCW', '49112': 'RFCW', '49113': 'RFCW', '49115': 'RFCW', '49116': 'RFCW', '49117': 'RFCW', '49119': 'RFCW', '49120': 'RFCW', '49121': 'RFCW', '49125': 'RFCW', '49126': 'RFCW', '49127': 'RFCW', '49128': 'RFCW', '49129': 'RFCW', '49130': 'RFCW', '49201': 'RFCM', '49202': 'RFCM', '49203': 'RFCM', '49204': 'RFCM', '49220': 'RFCM', '49221': 'RFCM', '49224': 'RFCM', '49227': 'RFCM', '49228': 'RFCM', '49229': 'RFCM', '49230': 'RFCM', '49232': 'RFCM', '49233': 'RFCM', '49234': 'RFCM', '49235': 'RFCM', '49236': 'RFCM', '49237': 'RFCM', '49238': 'RFCM', '49239': 'RFCM', '49240': 'RFCM', '49241': 'RFCM', '49242': 'RFCM', '49245': 'RFCM', '49246': 'RFCM', '49247': 'RFCM', '49248': 'RFCM', '49249': 'RFCM', '49250': 'RFCM', '49251': 'RFCM', '49252': 'RFCM', '49253': 'RFCM', '49254': 'RFCM', '49255': 'RFCM', '49256': 'RFCM', '49257': 'RFCM', '49258': 'RFCM', '49259': 'RFCM', '49261': 'RFCM', '49262': 'RFCM', '49263': 'RFCM', '49264': 'RFCM', '49265': 'RFCM', '49266': 'RFCM', '49267': 'RFCM', '49268': 'RFCM', '49269': 'RFCM', '49270': 'RFCM', '49271': 'RFCM', '49272': 'RFCM', '49274': 'RFCM', '49276': 'RFCM', '49277': 'RFCM', '49279': 'RFCM', '49281': 'RFCM', '49282': 'RFCM', '49283': 'RFCM', '49284': 'RFCM', '49285': 'RFCM', '49286': 'RFCM', '49287': 'RFCM', '49288': 'RFCM', '49289': 'RFCM', '49301': 'RFCM', '49302': 'RFCM', '49303': 'RFCM', '49304': 'RFCM', '49305': 'RFCM', '49306': 'RFCM', '49307': 'RFCM', '49309': 'RFCM', '49310': 'RFCM', '49311': 'RFCM', '49312': 'RFCM', '49314': 'RFCM', '49315': 'RFCM', '49316': 'RFCM', '49317': 'RFCM', '49318': 'RFCM', '49319': 'RFCM', '49320': 'RFCM', '49321': 'RFCM', '49322': 'RFCM', '49323': 'RFCM', '49325': 'RFCM', '49326': 'RFCM', '49327': 'RFCM', '49328': 'RFCM', '49329': 'RFCM', '49330': 'RFCM', '49331': 'RFCM', '49332': 'RFCM', '49333': 'RFCM', '49335': 'RFCM', '49336': 'RFCM', '49337': 'RFCM', '49338': 'RFCM', '49339': 'RFCM', '49340': 'RFCM', '49341': 'RFCM', '49342': 'RFCM', '49343': 'RFCM', '49344': 'RFCM', '49345': 'RFCM', '49346': 'RFCM', '49347': 'RFCM', '49348': 'RFCM', '49349': 'RFCM', '49351': 'RFCM', '49355': 'RFCM', '49356': 'RFCM', '49357': 'RFCM', '49401': 'RFCM', '49402': 'RFCM', '49403': 'RFCM', '49404': 'RFCM', '49405': 'RFCM', '49406': 'RFCM', '49408': 'RFCM', '49409': 'RFCM', '49410': 'RFCM', '49411': 'RFCM', '49412': 'RFCM', '49413': 'RFCM', '49415': 'RFCM', '49416': 'RFCM', '49417': 'RFCM', '49418': 'RFCM', '49419': 'RFCM', '49420': 'RFCM', '49421': 'RFCM', '49422': 'RFCM', '49423': 'RFCM', '49424': 'RFCM', '49425': 'RFCM', '49426': 'RFCM', '49427': 'RFCM', '49428': 'RFCM', '49429': 'RFCM', '49430': 'RFCM', '49431': 'RFCM', '49434': 'RFCM', '49435': 'RFCM', '49436': 'RFCM', '49437': 'RFCM', '49440': 'RFCM', '49441': 'RFCM', '49442': 'RFCM', '49443': 'RFCM', '49444': 'RFCM', '49445': 'RFCM', '49446': 'RFCM', '49448': 'RFCM', '49449': 'RFCM', '49450': 'RFCM', '49451': 'RFCM', '49452': 'RFCM', '49453': 'RFCM', '49454': 'RFCM', '49455': 'RFCM', '49456': 'RFCM', '49457': 'RFCM', '49458': 'RFCM', '49459': 'RFCM', '49460': 'RFCM', '49461': 'RFCM', '49463': 'RFCM', '49464': 'RFCM', '49468': 'RFCM', '49501': 'RFCM', '49502': 'RFCM', '49503': 'RFCM', '49504': 'RFCM', '49505': 'RFCM', '49506': 'RFCM', '49507': 'RFCM', '49508': 'RFCM', '49509': 'RFCM', '49510': 'RFCM', '49512': 'RFCM', '49514': 'RFCM', '49515': 'RFCM', '49516': 'RFCM', '49518': 'RFCM', '49519': 'RFCM', '49523': 'RFCM', '49525': 'RFCM', '49528': 'RFCM', '49530': 'RFCM', '49534': 'RFCM', '49544': 'RFCM', '49546': 'RFCM', '49548': 'RFCM', '49550': 'RFCM', '49555': 'RFCM', '49560': 'RFCM', '49588': 'RFCM', '49599': 'RFCM', '49601': 'RFCM', '49610': 'RFCM', '49611': 'RFCM', '49612': 'RFCM', '49613': 'RFCM', '49614': 'RFCM', '49615': 'RFCM', '49616': 'RFCM', '49617': 'RFCM', '49618': 'RFCM', '49619': 'RFCM', '49620': 'RFCM', '49621': 'RFCM', '49622': 'RFCM', '49623': 'RFCM', '49625': 'RFCM', '49626': 'RFCM', '49627': 'RFCM', '49628': 'RFCM', '49629': 'RFCM', '49630': 'RFCM', '49631': 'RFCM', '49632': 'RFCM', '49633': 'RFCM', '49634': 'RFCM', '49635': 'RFCM', '49636': 'RFCM', '49637': 'RFCM', '49638': 'RFCM', '49639': 'RFCM', '49640': 'RFCM', '49642': 'RFCM', '49643': 'RFCM', '49644': 'RFCM', '49645': 'RFCM', '49646': 'RFCM', '49648': 'RFCM', '49649': 'RFCM', '49650': 'RFCM', '49651': 'RFCM', '49653': 'RFCM', '49654': 'RFCM', '49655': 'RFCM', '49656': 'RFCM', '49657': 'RFCM', '49659': 'RFCM', '49660': 'RFCM', '49663': 'RFCM', '49664': 'RFCM', '49665': 'RFCM', '49666': 'RFCM', '49667': 'RFCM', '49668': 'RFCM', '49670': 'RFCM', '49673': 'RFCM', '49674': 'RFCM', '49675': 'RFCM', '49676': 'RFCM', '49677': 'RFCM', '49679': 'RFCM', '49680': 'RFCM', '49682': 'RFCM', '49683': 'RFCM', '49684': 'RFCM', '49685': 'RFCM', '49686': 'RFCM', '49688': 'RFCM', '49689': 'RFCM', '49690': 'RFCM', '49696': 'RFCM', '49701': 'RFCM', '49705': 'RFCM', '49706': 'RFCM', '49707': 'RFCM', '49709': 'RFCM', '49710': 'RFCW', '49711': 'RFCM', '49712': 'RFCM', '49713': 'RFCM', '49715': 'RFCW', '49716': 'RFCM', '49717': 'RFCM', '49718': 'RFCM', '49719': 'RFCW', '49720': 'RFCM', '49721': 'RFCM', '49722': 'RFCM', '49723': 'RFCM', '49724': 'RFCW', '49725': 'RFCW', '49726': 'RFCW', '49727': 'RFCM', '49728': 'RFCW', '49729': 'RFCM', '49730': 'RFCM', '49733': 'RFCM', '49734': 'RFCM', '49735': 'RFCM', '49736': 'RFCW', '49737': 'RFCM', '49738': 'RFCM', '49739': 'RFCM', '49740': 'RFCM', '49743': 'RFCM', '49744': 'RFCM', '49745': 'RFCW', '49746': 'RFCM', '49747': 'RFCM', '49748': 'RFCW', '49749': 'RFCM', '49751': 'RFCM', '49752': 'RFCW', '49753': 'RFCM', '49755': 'RFCM', '49756': 'RFCM', '49757': 'RFCM', '49759': 'RFCM', '49760': 'RFCW', '49761': 'RFCM', '49762': 'RFCW', '49764': 'RFCM', '49765': 'RFCM', '49766': 'RFCM', '49768': 'RFCW', '49769': 'RFCM', '49770': 'RFCM', '49774': 'RFCW', '49775': 'RFCM', '49776': 'RFCM', '49777': 'RFCM', '49779': 'RFCM', '49780': 'RFCW', '49781': 'RFCW', '49782': 'RFCM', '49783': 'RFCW', '49784': 'RFCW', '49785': 'RFCW', '49786': 'RFCW', '49788': 'RFCW', '49791': 'RFCM', '49792': 'RFCM', '49793': 'RFCW', '49795': 'RFCM', '49796': 'RFCM', '49797': 'RFCM', '49799': 'RFCM', '49801': 'RFCW', '49802': 'RFCW', '49805': 'MROE', '49806': 'MROE', '49807': 'MROE', '49808': 'MROE', '49812': 'MROE', '49814': 'MROE', '49815': 'RFCW', '49816': 'MROE', '49817': 'MROE', '49818': 'MROE', '49819': 'MROE', '49820': 'RFCW', '49821': 'MROE', '49822': 'MROE', '49825': 'MROE', '49826': 'MROE', '49827': 'RFCW', '49829': 'MROE', '49831': 'MROE', '49833': 'MROE', '49834': 'MROE', '49835': 'MROE', '49836': 'MROE', '49837': 'MROE', '49838': 'RFCW', '49839': 'MROE', '49840': 'RFCW', '49841': 'MROE', '49845': 'MROE', '49847': 'MROE', '49848': 'MROE', '49849': 'MROE', '49852': 'RFCW', '49853': 'MROE', '49854': 'MROE', '49855': 'MROE', '49858': 'MROE', '49861': 'MROE', '49862': 'MROE', '49863': 'MROE', '49864': 'MROE', '49865': 'MROE', '49866': 'MROE', '49868': 'MROE', '49870': 'RFCW', '49871': 'MROE', '49872': 'MROE', '49873': 'MROE', '49874': 'MROE', '49876': 'RFCW', '49877': 'RFCW', '49878': 'MROE', '49879': 'MROE', '49880': 'MROE', '49881': 'RFCW', '49883': 'MROE', '49884': 'MROE', '49885': 'MROE', '49886': 'MROE', '49887': 'MROE', '49891': 'MROE', '49892': 'MROE', '49893': 'MROE', '49894': 'MROE', '49895': 'MROE', '49896': 'MROE', '49901': 'MROE', '49902': 'RFCW', '49903': 'RFCW', '49905': 'MROE', '49908': 'MROE', '49910': 'MROW', '49911': 'MROW', '49912': 'MROW', '49913': 'MROE', '49915': 'MROE', '49916': 'MROE', '49917': 'MROE', '49918': 'MROE', '49919': 'MROE', '49920': 'RFCW', '49921': 'MROE', '49922': 'MROE', '49925': 'MROW', '49927': 'MROE', '49929': 'MROE', '49930': 'MROE', '49931': 'MROE', '49934': 'MROE', '49935': 'MROE', '49938': 'MROW', '49942': 'MROE', '49945': 'MROE', '49946': 'MROE', '49947': 'MROW', '49948': 'MROE', '49950': 'MROE', '49952': 'MROE', '49953': 'MROW', '49955': 'MROE', '49958': 'MROE', '49959': 'MROW', '49960': 'MROE', '49961': 'MROE', '49962': 'MROE', '49963': 'MROE', '49964': 'MROE', '49965': 'MROE', '49967': 'MROE', '49968': 'MROW', '49969': 'MROW', '49970': 'MROE', '49971': 'MROE', '50001': 'MROW', '50002': 'MROW', '50003': 'MROW', '50005': 'MROW', '50006': 'MROW', '50007': 'MROW', '50008': 'MROW', '50009': 'MROW', '50010': 'MROW', '50011': 'MROW', '50012': 'MROW', '50013': 'MROW', '50014': 'MROW', '50020': 'MROW', '50021': 'MROW', '50022': 'MROW', '50023': 'MROW', '50025': 'MROW', '50026': 'MROW', '50027': 'MROW', '50028': 'MROW', '50029': 'MROW', '50031': 'MROW', '50032': 'MROW', '50033': 'MROW', '50034': 'MROW', '50035': 'MROW', '50036': 'MROW', '50037': 'MROW', '50038': 'MROW', '50039': 'MROW', '50040': 'MROW', '50041': 'MROW', '50042': 'MROW', '50043': 'MROW', '50044': 'MROW', '50046': 'MROW', '50047': 'MROW', '50048': 'MROW', '50049': 'MROW', '50050': 'MROW', '50051': 'MROW', '50052': 'MROW', '50054': 'MROW', '50055': 'MROW', '50056': 'MROW', '50057': 'MROW', '50058': 'MROW', '50059': 'MROW', '50060': 'MROW', '50061': 'MROW', '50062': 'MROW', '50063': 'MROW', '50064': 'MROW', '50065': 'MROW', '50066': 'MROW', '50067': 'MROW', '50068': 'MROW', '50069': 'MROW', '50070': 'MROW', '50071': 'MROW', '50072': 'MROW', '50073': 'MROW', '50074': 'MROW', '50075': 'MROW', '50076': 'MROW', '50078': 'MROW', '50099': 'MROW', '50101': 'MROW', '50102': 'MROW', '50103': 'MROW', '50104': 'MROW', '50105': 'MROW', '50106': 'MROW', '50107': 'MROW', '50108': 'MROW', '50109': 'MROW', '50110': 'MROW', '50111': 'MROW', '50112': 'MROW', '50115': 'MROW', '50116': 'MROW', '50117': 'MROW', '50118': 'MROW', '50119': 'MROW', '50120': 'MROW', '50122': 'MROW', '50123': 'MROW', '50124': 'MROW', '50125': 'MROW', '50126': 'MROW', '50127': 'MROW', '50128': 'MROW', '50129': 'MROW', '50130': 'MROW', '50131': 'MROW', '50132': 'MROW', '50133': 'MROW', '50134': 'MROW', '50135': 'MROW', '50136': 'MROW', '50137': 'MROW', '50138': 'MROW', '50139': 'MROW', '50140': 'MROW', '50141': 'MROW', '50142': 'MROW', '50143': 'MROW', '50144': 'MROW', '50145': 'MROW', '50146': 'MROW', '50147': 'MROW', '50148': 'MROW', '50149': 'MROW', '50150': 'MROW', '50151': 'MROW', '50152': 'MROW', '50153': 'MROW', '50154': 'MROW', '50155': 'MROW', '50156': 'MROW', '50157': 'MROW', '50158': 'MROW', '50160': 'MROW', '50161': 'MROW', '50162': 'MROW', '50163': 'MROW', '50164': 'MROW', '50165': 'MROW', '50166': 'MROW', '50167': 'MROW', '50168': 'MROW', '50169': 'MROW', '50170': 'MROW', '50171': 'MROW', '50173': 'MROW', '50174': 'MROW', '50201': 'MROW', '50206': 'MROW', '50207': 'MROW', '50208': 'MROW', '50210': 'MROW', '50211': 'MROW', '50212': 'MROW', '50213': 'MROW', '50214': 'MROW', '50216': 'MROW', '50217': 'MROW', '50218': 'MROW', '50219': 'MROW', '50220': 'MROW', '50222': 'MROW', '50223': 'MROW', '50225': 'MROW', '50226': 'MROW', '50227': 'MROW', '50228': 'MROW', '50229': 'MROW', '50230': 'MROW', '50231': 'MROW', '50232': 'MROW', '50233': 'MROW', '50234': 'MROW', '50235': 'MROW', '50236': 'MROW', '50237': 'MROW', '50238': 'MROW', '50239': 'MROW', '50240': 'MROW', '50241': 'MROW', '50242': 'MROW', '50243': 'MROW', '50244': 'MROW', '50246': 'MROW', '50247': 'MROW', '50248': 'MROW', '50249': 'MROW', '50250': 'MROW', '50251': 'MROW', '50252': 'MROW', '50254': 'MROW', '50255': 'MROW', '50256': 'MROW', '50257': 'MROW', '50258': 'MROW', '50259': 'MROW', '50261': 'MROW', '50262': 'MROW', '50263': 'MROW', '50264': 'MROW', '50265': 'MROW', '50266': 'MROW', '50268': 'MROW', '50269': 'MROW', '50271': 'MROW', '50272': 'MROW', '50273': 'MROW', '50274': 'MROW', '50275': 'MROW', '50276': 'MROW', '50277': 'MROW', '50278': 'MROW', '50301': 'MROW', '50302': 'MROW', '50303': 'MROW', '50304': 'MROW', '50305': 'MROW', '50306': 'MROW', '50307': 'MROW', '50308': 'MROW', '50309': 'MROW', '50310': 'MROW', '50311': 'MROW', '50312': 'MROW', '50313': 'MROW', '50314': 'MROW', '50315': 'MROW', '50316': 'MROW', '50317': 'MROW', '50318': 'MROW', '50319': 'MROW', '50320': 'MROW', '50321': 'MROW', '50322': 'MROW', '50323': 'MROW', '50324': 'MROW', '50325': 'MROW', '50327': 'MROW', '50328': 'MROW', '50329': 'MROW', '50330': 'MROW', '50331': 'MROW', '50332': 'MROW', '50333': 'MROW', '50334': 'MROW', '50335': 'MROW', '50336': 'MROW', '50339': 'MROW', '50340': 'MROW', '50359': 'MROW', '50360': 'MROW', '50361': 'MROW', '50362': 'MROW', '50363': 'MROW', '50364': 'MROW', '50367': 'MROW', '50368': 'MROW', '50369': 'MROW', '50380': 'MROW', '50381': 'MROW', '50391': 'MROW', '50392': 'MROW', '50393': 'MROW', '50394': 'MROW', '50395': 'MROW', '50396': 'MROW', '50398': 'MROW', '50401': 'MROW', '50402': 'MROW', '50420': 'MROW', '50421': 'MROW', '50423': 'MROW', '50424': 'MROW', '50426': 'MROW', '50427': 'MROW', '50428': 'MROW', '50430': 'MROW', '50431': 'MROW', '50432': 'MROW', '50433': 'MROW', '50434': 'MROW', '50435': 'MROW', '50436': 'MROW', '50438': 'MROW', '50439': 'MROW', '50440': 'MROW', '50441': 'MROW', '50444': 'MROW', '50446': 'MROW', '50447': 'MROW', '50448': 'MROW', '50449': 'MROW', '50450': 'MROW', '50451': 'MROW', '50452': 'MROW', '50453': 'MROW', '50454': 'MROW', '50455': 'MROW', '50456': 'MROW', '50457': 'MROW', '50458': 'MROW', '50459': 'MROW', '50460': 'MROW', '50461': 'MROW', '50464': 'MROW', '50465': 'MROW', '50466': 'MROW', '50467': 'MROW', '50468': 'MROW', '50469': 'MROW', '50470': 'MROW', '50471': 'MROW', '50472': 'MROW', '50473': 'MROW', '50475': 'MROW', '50476': 'MROW', '50477': 'MROW', '50478': 'MROW', '50479': 'MROW', '50480': 'MROW', '50481': 'MROW', '50482': 'MROW', '50483': 'MROW', '50484': 'MROW', '50501': 'MROW', '50510': 'MROW', '50511': 'MROW', '50514': 'MROW', '50515': 'MROW', '50516': 'MROW', '50517': 'MROW', '50518': 'MROW', '50519': 'MROW', '50520': 'MROW', '50521': 'MROW', '50522': 'MROW', '50523': 'MROW', '50524': 'MROW', '50525': 'MROW', '50526': 'MROW', '50527': 'MROW', '50528': 'MROW', '50529': 'MROW', '50530': 'MROW', '50531': 'MROW', '50532': 'MROW', '50533': 'MROW', '50535': 'MROW', '50536': 'MROW', '50538': 'MROW', '50539': 'MROW', '50540': 'MROW', '50541': 'MROW', '50542': 'MROW', '50543': 'MROW', '50544': 'MROW', '50545': 'MROW', '50546': 'MROW', '50548': 'MROW', '50551': 'MROW', '50552': 'MROW', '50554': 'MROW', '50556': 'MROW', '50557': 'MROW', '50558': 'MROW', '50559': 'MROW', '50560': 'MROW', '50561': 'MROW', '50562': 'MROW', '50563': 'MROW', '50565': 'MROW', '50566': 'MROW', '50567': 'MROW', '50568': 'MROW', '50569': 'MROW', '50570': 'MROW', '50571': 'MROW', '50573': 'MROW', '50574': 'MROW', '50575': 'MROW', '50576': 'MROW', '50577': 'MROW', '50578': 'MROW', '50579': 'MROW', '50581': 'MROW', '50582': 'MROW', '50583': 'MROW', '50585': 'MROW', '50586': 'MROW', '50588': 'MROW', '50590': 'MROW', '50591': 'MROW', '50592': 'MROW', '50593': 'MROW', '50594': 'MROW', '50595': 'MROW', '50597': 'MROW', '50598': 'MROW', '50599': 'MROW', '50601': 'MROW', '50602': 'MROW', '50603': 'MROW', '50604': 'MROW', '50605': 'MROW', '50606': 'MROW', '50607': 'MROW', '50608': 'MROW', '50609': 'MROW', '50611': 'MROW', '50612': 'MROW', '50613': 'MROW', '50614': 'MROW', '50616': 'MROW', '50619': 'MROW', '50620': 'MROW', '50621': 'MROW', '50622': 'MROW', '50623': 'MROW', '50624': 'MROW', '50625': 'MROW', '50626': 'MROW', '50627': 'MROW', '50628': 'MROW', '50629': 'MROW', '50630': 'MROW', '50631': 'MROW', '50632': 'MROW', '50633': 'MROW', '50634': 'MROW', '50635': 'MROW', '50636': 'MROW', '50638': 'MROW', '50641': 'MROW', '50642': 'MROW', '50643': 'MROW', '50644': 'MROW', '50645': 'MROW', '50647': 'MROW', '50648': 'MROW', '50649': 'MROW', '50650': 'MROW', '50651': 'MROW', '50652': 'MROW', '50653': 'MROW', '50654': 'MROW', '50655': 'MROW', '50657': 'MROW', '50658': 'MROW', '50659': 'MROW', '50660': 'MROW', '50661': 'MROW', '50662': 'MROW', '50664': 'MROW', '50665': 'MROW', '50666': 'MROW', '50667': 'MROW', '50668': 'MROW', '50669': 'MROW', '50670': 'MROW', '50671': 'MROW', '50672': 'MROW', '50673': 'MROW', '50674': 'MROW', '50675': 'MROW', '50676': 'MROW', '50677': 'MROW', '50680': 'MROW', '50681': 'MROW', '50682': 'MROW', '50701': 'MROW', '50702': 'MROW', '50703': 'MROW', '50704': 'MROW', '50707': 'MROW', '50801': 'MROW', '50830': 'MROW', '50831': 'MROW', '50833': 'MROW', '50835': 'MROW', '50836': 'MROW', '50837': 'MROW', '50839': 'MROW', '50840': 'MROW', '50841': 'MROW', '50842': 'MROW', '50843': 'MROW', '50845': 'MROW', '50846': 'MROW', '50847': 'MROW', '50848': 'MROW', '50849': 'MROW', '50851': 'MROW', '50853': 'MROW', '50854': 'MROW', '50857': 'MROW', '50858': 'MROW', '50859': 'MROW', '50860': 'MROW', '50861': 'MROW', '50862': 'MROW', '50863': 'MROW', '50864': 'MROW', '50936': 'MROW', '50940': 'MROW', '50947': 'MROW', '50950': 'MROW', '50980': 'MROW', '50981': 'MROW', '50982': 'MROW', '50983': 'MROW', '51001': 'MROW', '51002': 'MROW', '51003': 'MROW', '51004': 'MROW', '51005': 'MROW', '51006': 'MROW', '51007': 'MROW', '51008': 'MROW', '51009': 'MROW', '51010': 'MROW', '51011': 'MROW', '51012': 'MROW', '51014': 'MROW', '51015': 'MROW', '51016': 'MROW', '51018': 'MROW', '51019': 'MROW', '51020': 'MROW', '51022': 'MROW', '51023': 'MROW', '51024': 'MROW', '51025': 'MROW', '51026': 'MROW', '51027': 'MROW', '51028': 'MROW', '51029': 'MROW', '51030': 'MROW', '51031': 'MROW', '51033': 'MROW', '51034': 'MROW', '51035': 'MROW', '51036': 'MROW', '51037': 'MROW', '51038': 'MROW', '51039': 'MROW', '51040': 'MROW', '51041': 'MROW', '51044': 'MROW', '51045': 'MROW', '51046': 'MROW', '51047': 'MROW', '51048': 'MROW', '51049': 'MROW', '51050': 'MROW', '51051': 'MROW', '51052': 'MROW', '51053': 'MROW', '51054': 'MROW', '51055': 'MROW', '51056': 'MROW', '51058': 'MROW', '51060': 'MROW', '51061': 'MROW', '51062': 'MROW', '51063': 'MROW', '51101': 'MROW', '51102': 'MROW', '51103': 'MROW', '51104': 'MROW', '51105': 'MROW', '51106': 'MROW', '51108': 'MROW', '51109': 'MROW', '51111': 'MROW', '51201': 'MROW', '51230': 'MROW', '51231': 'MROW', '51232': 'MROW', '51234': 'MROW', '51235': 'MROW', '51237': 'MROW', '51238': 'MROW', '51239': 'MROW', '51240': 'MROW', '51241': 'MROW', '51242': 'MROW', '51243': 'MROW', '51244': 'MROW', '51245': 'MROW', '51246': 'MROW', '51247': 'MROW', '51248': 'MROW', '51249': 'MROW', '51250': 'MROW', '51301': 'MROW', '51331': 'MROW', '51333': 'MROW', '51334': 'MROW', '51338': 'MROW', '51340': 'MROW', '51341': 'MROW', '51342': 'MROW', '51343': 'MROW', '51345': 'MROW', '51346': 'MROW', '51347': 'MROW', '51350': 'MROW', '51351': 'MROW', '51354': 'MROW', '51355': 'MROW', '51357': 'MROW', '51358': 'MROW', '51360': 'MROW', '51363': 'MROW', '51364': 'MROW', '51365': 'MROW', '51366': 'MROW', '51401': 'MROW', '51430': 'MROW', '51431': 'MROW', '51432': 'MROW', '51433': 'MROW', '51436': 'MROW', '51439': 'MROW', '51440': 'MROW', '51441': 'MROW', '51442': 'MROW', '51443': 'MROW', '51444': 'MROW', '51445': 'MROW', '51446': 'MROW', '51447': 'MROW', '51448': 'MROW', '51449': 'MROW', '51450': 'MROW', '51451': 'MROW', '51452': 'MROW', '51453': 'MROW', '51454': 'MROW', '51455': 'MROW', '51458': 'MROW', '51459': 'MROW', '51460': 'MROW', '51461': 'MROW', '51462': 'MROW', '51463': 'MROW', '51465': 'MROW', '51466': 'MROW', '51467': 'MROW', '51501': 'MROW', '51502': 'MROW', '51503': 'MROW', '51510': 'MROW', '51520': 'MROW', '51521': 'MROW', '51523': 'MROW', '51525': 'MROW', '51526': 'MROW', '51527': 'MROW', '51528': 'MROW', '51529': 'MROW', '51530': 'MROW', '51531': 'MROW', '51532': 'MROW', '51533': 'MROW', '51534': 'MROW', '51535': 'MROW', '51536': 'MROW', '51537': 'MROW', '51540': 'MROW', '51541': 'MROW', '51542': 'MROW', '51543': 'MROW', '51544': 'MROW', '51545': 'MROW', '51546': 'MROW', '51548': 'MROW', '51549': 'MROW', '51550': 'MROW', '51551': 'MROW', '51552': 'MROW', '51553': 'MROW', '51554': 'MROW', '51555': 'MROW', '51556': 'MROW', '51557': 'MROW', '51558': 'MROW', '51559': 'MROW', '51560': 'MROW', '51561': 'MROW', '51562': 'MROW', '51563': 'MROW', '51564': 'MROW', '51565': 'MROW', '51566': 'MROW', '51570': 'MROW', '51571': 'MROW', '51572': 'MROW', '51573': 'MROW', '51575': 'MROW', '51576': 'MROW', '51577': 'MROW', '51578': 'MROW', '51579': 'MROW', '51591': 'MROW', '51593': 'MROW', '51601': 'MROW', '51602': 'MROW', '51603': 'MROW', '51630': 'MROW', '51631': 'MROW', '51632': 'MROW', '51636': 'MROW', '51637': 'MROW', '51638': 'MROW', '51639': 'MROW', '51640': 'MROW', '51645': 'MROW', '51646': 'MROW', '51647': 'SRMW', '51648': 'MROW', '51649': 'MROW', '51650': 'MROW', '51651': 'MROW', '51652': 'MROW', '51653': 'MROW', '51654': 'MROW', '51656': 'MROW', '52001': 'MROW', '52002': 'MROW', '52003': 'MROW', '52004': 'MROW', '52030': 'MROW', '52031': 'MROW', '52032': 'MROW', '52033': 'MROW', '52035': 'MROW', '52036': 'MROW', '52037': 'MROW', '52038': 'MROW', '52039': 'MROW', '52040': 'MROW', '52041': 'MROW', '52042': 'MROW', '52043': 'MROW', '52044': 'MROW', '52045': 'MROW', '52046': 'MROW', '52047': 'MROW', '52048': 'MROW', '52049': 'MROW', '52050': 'MROW', '52052': 'MROW', '52053': 'MROW', '52054': 'MROW', '52056': 'MROW', '52057': 'MROW', '52060': 'MROW', '52064': 'MROW', '52065': 'MROW', '52066': 'MROW', '52068': 'MROW', '52069': 'MROW', '52070': 'MROW', '52071': 'MROW', '52072': 'MROW', '52073': 'MROW', '52074': 'MROW', '52075': 'MROW', '52076': 'MROW', '52077': 'MROW', '52078': 'MROW', '52079': 'MROW', '52099': 'MROW', '52101': 'MROW', '52132': 'MROW', '52133': 'MROW', '52134': 'MROW', '52135': 'MROW', '52136': 'MROW', '52140': 'MROW', '52141': 'MROW', '52142': 'MROW', '52144': 'MROW', '52146': 'MROW', '52147': 'MROW', '52149': 'MROW', '52151': 'MROW', '52154': 'MROW', '52155': 'MROW', '52156': 'MROW', '52157': 'MROW', '52158': 'MROW', '52159': 'MROW', '52160': 'MROW', '52161': 'MROW', '52162': 'MROW', '52163': 'MROW', '52164': 'MROW', '52165': 'MROW', '52166': 'MROW', '52168': 'MROW', '52169': 'MROW', '52170': 'MROW', '52171': 'MROW', '52172': 'MROW', '52175': 'MROW', '52201': 'MROW', '52202': 'MROW', '52203': 'MROW', '52204': 'MROW', '52205': 'MROW', '52206': 'MROW', '52207': 'MROW', '52208': 'MROW', '52209': 'MROW', '52210': 'MROW', '52211': 'MROW', '52212': 'MROW', '52213': 'MROW', '52214': 'MROW', '52215': 'MROW', '52216': 'MROW', '52217': 'MROW', '52218': 'MROW', '52219': 'MROW', '52220': 'MROW', '52221': 'MROW', '52222': 'MROW', '52223': 'MROW', '52224': 'MROW', '52225': 'MROW', '52227': 'MROW', '52228': 'MROW', '52229': 'MROW', '52231': 'MROW', '52232': 'MROW', '52233': 'MROW', '52235': 'MROW', '52236': 'MROW', '52237': 'MROW', '52240': 'MROW', '52241': 'MROW', '52242': 'MROW', '52243': 'MROW', '52244': 'MROW', '52245': 'MROW', '52246': 'MROW', '52247': 'MROW', '52248': 'MROW', '52249': 'MROW', '52251': 'MROW', '52252': 'MROW', '52253': 'MROW', '52254': 'MROW', '52255': 'MROW', '52257': 'MROW', '52301': 'MROW', '52302': 'MROW', '52305': 'MROW', '52306': 'MROW', '52307': 'MROW', '52308': 'MROW', '52309': 'MROW', '52310': 'MROW', '52312': 'MROW', '52313': 'MROW', '52314': 'MROW', '52315': 'MROW', '52316': 'MROW', '52317': 'MROW', '52318': 'MROW', '52319': 'MROW', '52320': 'MROW', '52321': 'MROW', '52322': 'MROW', '52323': 'MROW', '52324': 'MROW', '52325': 'MROW', '52326': 'MROW', '52327': 'MROW', '52328': 'MROW', '52329': 'MROW', '52330': 'MROW', '52332': 'MROW', '52333': 'MROW', '52334': 'MROW', '52335': 'MROW', '52336': 'MROW', '52337': 'MROW', '52338': 'MROW', '52339': 'MROW', '52340': 'MROW', '52341': 'MROW', '52342': 'MROW', '52344': 'MROW', '52345': 'MROW', '52346': 'MROW', '52347': 'MROW', '52348': 'MROW', '52349': 'MROW', '52350': 'MROW', '52351': 'MROW', '52352': 'MROW', '52353': 'SRMW', '52354': 'MROW', '52355': 'MROW', '52356': 'MROW', '52358': 'MROW', '52359': 'MROW', '52361': 'MROW', '52362': 'MROW', '52401': 'MROW', '52402': 'MROW', '52403': 'MROW', '52404': 'MROW', '52405': 'MROW', '52406': 'MROW', '52407': 'MROW', '52408': 'MROW', '52409': 'MROW', '52410': 'MROW', '52411': 'MROW', '52497': 'MROW', '52498': 'MROW', '52499': 'MROW', '52501': 'SRMW', '52530': 'SRMW', '52531': 'MROW', '52533': 'SRMW', '52534': 'MROW', '52535': 'SRMW', '52536': 'MROW', '52537': 'MROW', '52540': 'SRMW', '52542': 'MROW', '52543': 'MROW', '52544': 'MROW', '52548': 'MROW', '52549': 'MROW', '52550': 'MROW', '52551': 'SRMW', '52552': 'MROW', '52553': 'MROW', '52554': 'SRMW', '52555': 'MROW', '52556': 'SRMW', '52557': 'MROW', '52560': 'SRMW', '52561': 'MROW', '52562': 'MROW', '52563': 'SRMW', '52565': 'SRMW', '52566': 'MROW', '52567': 'SRMW', '52568': 'MROW', '52569': 'MROW', '52570': 'MROW', '52571': 'MROW', '52572': 'MROW', '52573': 'MROW', '52574': 'MROW', '52576': 'SRMW', '52577': 'MROW', '52580': 'SRMW', '52581': 'MROW', '52583': 'MROW', '52584': 'MROW', '52585': 'SRMW', '52586': 'MROW', '52588': 'SRMW', '52590': 'MROW', '52591': 'MROW', '52593': 'MROW', '52594': 'MROW', '52595': 'MROW', '52601': 'SRMW', '52619': 'SRMW', '52620': 'SRMW', '52621': 'MROW', '52623': 'SRMW', '52624': 'MROW', '52625': 'SRMW', '52626': 'SRMW', '52627': 'SRMW', '52630': 'SRMW', '52631': 'MROW', '52632': 'MROW', '52635': 'SRMW', '52637': 'MROW', '52638': 'MROW', '52639': 'MROW', '52640': 'SRMW', '52641': 'SRMW', '52642': 'SRMW', '52644': 'SRMW', '52645': 'SRMW', '52646': 'MROW', '52647': 'MROW', '52648': 'MROW', '52649': 'SRMW', '52650': 'MROW', '52651': 'SRMW', '52652': 'MROW', '52653': 'MROW', '52654': 'SRMW', '52655': 'MROW', '52656': 'SRMW', '52657': 'MROW', '52658': 'SRMW', '52659': 'SRMW', '52660': 'SRMW', '52701': 'MROW', '52720': 'MROW', '52721': 'MROW', '52722': 'MROW', '52726': 'MROW', '52727': 'MROW', '52728': 'MROW', '52729': 'MROW', '52730': 'MROW', '52731': 'MROW', '52732': 'MROW', '52733': 'MROW', '52734': 'MROW', '52736': 'MROW', '52737': 'MROW', '52738': 'MROW', '52739': 'MROW', '52742': 'MROW', '52745': 'MROW', '52746': 'MROW', '52747': 'MROW', '52748': 'MROW', '52749': 'MROW', '52750': 'MROW', '52751': 'MROW', '52752': 'MROW', '52753': 'MROW', '52754': 'MROW', '52755': 'MROW', '52756': 'MROW', '52757': 'MROW', '52758': 'MROW', '52759': 'MROW', '52760': 'MROW', '52761': 'MROW', '52765': 'MROW', '52766': 'MROW', '52767': 'MROW', '52768': 'MROW', '52769': 'MROW', '52771': 'MROW', '52772': 'MROW', '52773': 'MROW', '52774': 'MROW', '52776': 'MROW', '52777': 'MROW', '52778': 'MROW', '52801': 'MROW', '52802': 'MROW', '52803': 'MROW', '52804': 'MROW', '52805': 'MROW', '52806': 'MROW', '52807': 'MROW', '52808': 'MROW', '52809': 'MROW', '53001': 'RFCW', '53002': 'RFCW', '53003': 'RFCW', '53004': 'RFCW', '53005': 'RFCW', '53006': 'RFCW', '53007': 'RFCW', '53008': 'RFCW', '53010': 'RFCW', '53011': 'RFCW', '53012': 'RFCW', '53013': 'RFCW', '53014': 'MROE', '53015': 'RFCW', '53016': 'RFCW', '53017': 'RFCW', '53018': 'RFCW', '53019': 'RFCW', '53020': 'MROE', '53021': 'RFCW', '53022': 'RFCW', '53023': 'RFCW', '53024': 'RFCW', '53026': 'RFCW', '53027': 'RFCW', '53029': 'RFCW', '53031': 'RFCW', '53032': 'RFCW', '53033': 'RFCW', '53034': 'MROE', '53035': 'MROE', '53036': 'RFCW', '53037': 'RFCW', '53038': 'RFCW', '53039': 'MROE', '53040': 'RFCW', '53042': 'MROE', '53044': 'RFCW', '53045': 'RFCW', '53046': 'RFCW', '53047': 'RFCW', '53048': 'RFCW', '53049': 'RFCW', '53050': 'RFCW', '53051': 'RFCW', '53052': 'RFCW', '53056': 'RFCW', '53057': 'RFCW', '53058': 'RFCW', '53059': 'MROE', '53060': 'RFCW', '53061': 'MROE', '53062': 'MROE', '53063': 'MROE', '53064': 'RFCW', '53065': 'MROE', '53066': 'RFCW', '53069': 'RFCW', '53070': 'RFCW', '53072': 'RFCW', '53073': 'RFCW', '53074': 'RFCW', '53075': 'RFCW', '53076': 'RFCW', '53078': 'RFCW', '53079': 'MROE', '53080': 'RFCW', '53081': 'MROE', '53082': 'MROE', '53083': 'RFCW', '53085': 'RFCW', '53086': 'RFCW', '53088': 'MROE', '53089': 'RFCW', '53090': 'RFCW', '53091': 'RFCW', '53092': 'RFCW', '53093': 'RFCW', '53094': 'RFCW', '53095': 'RFCW', '53097': 'RFCW', '53098': 'MROE', '53099': 'RFCW', '53101': 'MROE', '53102': 'RFCW', '53103': 'RFCW', '53104': 'RFCW', '53105': 'RFCW', '53108': 'RFCW', '53109': 'RFCW', '53110': 'RFCW', '53114': 'MROE', '53115': 'MROE', '53118': 'RFCW', '53119': 'RFCW', '53120': 'RFCW', '53121': 'MROE', '53122': 'RFCW', '53125': 'MROE', '53126': 'RFCW', '53127': 'RFCW', '53128': 'RFCW', '53129': 'RFCW', '53130': 'RFCW', '53132': 'RFCW', '53137': 'RFCW', '53138': 'RFCW', '53139': 'RFCW', '53140': 'RFCW', '53141': 'RFCW', '53142': 'RFCW', '53143': 'RFCW', '53144': 'RFCW', '53146': 'RFCW', '53147': 'RFCW', '53148': 'RFCW', '53149': 'RFCW', '53150': 'RFCW', '53151': 'RFCW', '53152': 'RFCW', '53153': 'RFCW', '53154': 'RFCW', '53156': 'RFCW', '53157': 'MROE', '53158': 'RFCW', '53159': 'MROE', '53167': 'RFCW', '53168': 'RFCW', '53170': 'RFCW', '53171': 'RFCW', '53172': 'RFCW', '53176': 'RFCW', '53177': 'RFCW', '53178': 'RFCW', '53179': 'RFCW', '53181': 'RFCW', '53182': 'RFCW', '53183': 'RFCW', '53184': 'MROE', '53185': 'RFCW', '53186': 'RFCW', '53187': 'RFCW', '53188': 'RFCW', '53189': 'RFCW', '53190': 'MROE', '53191': 'MROE', '53192': 'RFCW', '53194': 'RFCW', '53195': 'MROE', '53199': 'RFCW', '53201': 'RFCW', '53202': 'RFCW', '53203': 'RFCW', '53204': 'RFCW', '53205': 'RFCW', '53206': 'RFCW', '53207': 'RFCW', '53208': 'RFCW', '53209': 'RFCW', '53210': 'RFCW', '53211': 'RFCW', '53212': 'RFCW', '53213': 'RFCW', '53214': 'RFCW', '53215': 'RFCW', '53216': 'RFCW', '53217': 'RFCW', '53218': 'RFCW', '53219': 'RFCW', '53220': 'RFCW', '53221': 'RFCW', '53222': 'RFCW', '53223': 'RFCW', '53224': 'RFCW', '53225': 'RFCW', '53226': 'RFCW', '53227': 'RFCW', '53228': 'RFCW', '53233': 'RFCW', '53234': 'RFCW', '53235': 'RFCW', '53237': 'RFCW', '53244': 'RFCW', '53259': 'RFCW', '53263': 'RFCW', '53267': 'RFCW', '53268': 'RFCW', '53274': 'RFCW', '53278': 'RFCW', '53288': 'RFCW', '53290': 'RFCW', '53293': 'RFCW', '53295': 'RFCW', '53401': 'RFCW', '53402': 'RFCW', '53403': 'RFCW', '53404': 'RFCW', '53405': 'RFCW', '53406': 'RFCW', '53407': 'RFCW', '53408': 'RFCW', '53501': 'MROE', '53502': 'MROE', '53503': 'MROE', '53504': 'MROE', '53505': 'MROE', '53506': 'MROE', '53507': 'MROE', '53508': 'MROE', '53510': 'MROE', '53511': 'MROE', '53512': 'MROE', '53515': 'MROE', '53516': 'MROE', '53517': 'MROE', '53518': 'MROE', '53520': 'MROE', '53521': 'MROE', '53522': 'MROE', '53523': 'MROE', '53525': 'MROE', '53526': 'MROE', '53527': 'MROE', '53528': 'MROE', '53529': 'MROE', '53530': 'MROE', '53531': 'RFCW', '53532': 'MROE', '53533': 'MROE', '53534': 'MROE', '53535': 'MROE', '53536': 'MROE', '53537': 'MROE', '53538': 'MROE', '53540': 'MROE', '53541': 'MROE', '53542': 'MROE', '53543': 'MROE', '53544': 'MROE', '53545': 'MROE', '53546': 'MROE', '53547': 'MROE', '53548': 'MROE', '53549': 'RFCW', '53550': 'MROE', '53551': 'RFCW', '53553': 'MROE', '53554': 'MROE', '53555': 'MROE', '53556': 'MROE', '53557': 'RFCW', '53558': 'MROE', '53559': 'MROE', '53560': 'MROE', '53561': 'MROE', '53562': 'MROE', '53563': 'MROE', '53565': 'MROE', '53566': 'MROE', '53569': 'MROE', '53570': 'MROE', '53571': 'MROE', '53572': 'MROE', '53573': 'MROE', '53574': 'MROE', '53575': 'MROE', '53576': 'MROE', '53577': 'MROE', '53578': 'MROE', '53579': 'RFCW', '53580': 'MROE', '53581': 'MROW', '53582': 'MROE', '53583': 'MROE', '53584': 'MROE', '53585': 'MROE', '53586': 'MROE', '53587': 'MROE', '53588': 'MROE', '53589': 'MROE', '53590': 'MROE', '53593': 'MROE', '53594': 'MROE', '53595': 'MROE', '53596': 'MROE', '53597': 'MROE', '53598': 'MROE', '53599': 'MROE', '53701': 'MROE', '53702': 'MROE', '53703': 'MROE', '53704': 'MROE', '53705': 'MROE', '53706': 'MROE', '53707': 'MROE', '53708': 'MROE', '53711': 'MROE', '53713': 'MROE', '53714': 'MROE', '53715': 'MROE', '53716': 'MROE', '53717': 'MROE', '53718': 'MROE', '53719': 'MROE', '53725': 'MROE', '53726': 'MROE', '53744': 'MROE', '53774': 'MROE', '53777': 'MROE', '53778': 'MROE', '53779': 'MROE', '53782': 'MROE', '53783': 'MROE', '53784': 'MROE', '53785': 'MROE', '53786': 'MROE', '53788': 'MROE', '53789': 'MROE', '53790': 'MROE', '53791': 'MROE', '53792': 'MROE', '53793': 'MROE', '53794': 'MROE', '53801': 'MROE', '53802': 'MROE', '53803': 'MROE', '53804': 'MROE', '53805': 'MROE', '53806': 'MROE', '53807': 'MROE', '53808': 'MROE', '53809': 'MROE', '53810': 'MROE', '53811': 'MROE', '53812': 'MROE', '53813': 'MROE', '53816': 'MROE', '53817': 'MROE', '53818': 'MROE', '53820': 'MROE', '53821': 'MROE', '53824': 'MROE', '53825': 'MROE', '53826': 'MROE', '53827': 'MROE', '53901': 'MROE', '53910': 'MROE', '53911': 'MROE', '53913': 'MROE', '53916': 'MROE', '53919': 'MROE', '53920': 'MROE', '53922': 'MROE', '53923': 'MROE', '53924': 'MROE', '53925': 'MROE', '53926': 'MROE', '53927': 'MROE', '53928': 'MROE', '53929': 'MROE', '53930': 'MROE', '53931': 'MROE', '53932': 'MROE', '53933': 'MROE', '53934': 'MROE', '53935': 'MROE', '53936': 'MROE', '53937': 'MROE', '53939': 'MROE', '53940': 'MROE', '53941': 'MROE', '53942': 'MROE', '53943': 'MROE', '53944': 'MROE', '53946': 'MROE', '53947': 'MROE', '53948': 'MROE', '53949': 'MROE', '53950': 'MROE', '53951': 'MROE', '53952': 'MROE', '53953': 'MROE', '53954': 'MROE', '53955': 'MROE', '53956': 'MROE', '53957': 'MROE', '53958': 'MROE', '53959': 'MROE', '53960': 'MROE', '53961': 'MROE', '53962': 'MROE', '53963': 'MROE', '53964': 'MROE', '53965': 'MROE', '53968': 'MROE', '53969': 'MROE', '54001': 'MROW', '54002': 'MROW', '54003': 'MROW', '54004': 'MROW', '54005': 'MROW', '54006': 'MROW', '54007': 'MROW', '54009': 'MROW', '54010': 'MROW', '54011': 'MROW', '54013': 'MROW', '54014': 'MROW', '54015': 'MROW', '54016': 'MROW', '54017': 'MROW', '54020': 'MROW', '54021': 'MROW', '54022': 'MROW', '54023': 'MROW', '54024': 'MROW', '54025': 'MROW', '54026': 'MROW', '54027': 'MROW', '54028': 'MROW', '54082': 'MROW', '54101': 'MROE', '54102': 'MROE', '54103': 'MROE', '54104': 'MROE', '54106': 'RFCW', '54107': 'RFCW', '54110': 'RFCW', '54111': 'RFCW', '54112': 'MROE', '54113': 'RFCW', '54114': 'MROE', '54115': 'RFCW', '54119': 'MROE', '54120': 'MROE', '54121': 'RFCW', '54123': 'RFCW', '54124': 'RFCW', '54125': 'MROE', '54126': 'RFCW', '54127': 'RFCW', '54128': 'MROE', '54129': 'RFCW', '54130': 'RFCW', '54131': 'RFCW', '54135': 'RFCW', '54136': 'RFCW', '54137': 'RFCW', '54138': 'MROE', '54139': 'MROE', '54140': 'RFCW', '54141': 'MROE', '54143': 'MROE', '54149': 'RFCW', '54150': 'MROE', '54151': 'RFCW', '54152': 'RFCW', '54153': 'MROE', '54154': 'RFCW', '54155': 'RFCW', '54156': 'RFCW', '54157': 'MROE', '54159': 'MROE', '54160': 'MROE', '54161': 'MROE', '54162': 'RFCW', '54165': 'RFCW', '54166': 'RFCW', '54169': 'RFCW', '54170': 'RFCW', '54171': 'MROE', '54173': 'MROE', '54174': 'RFCW', '54175': 'MROE', '54177': 'RFCW', '54180': 'MROE', '54182': 'RFCW', '54201': 'MROE', '54202': 'MROE', '54204': 'MROE', '54205': 'MROE', '54207': 'MROE', '54208': 'MROE', '54209': 'MROE', '54210': 'MROE', '54211': 'MROE', '54212': 'MROE', '54213': 'MROE', '54214': 'MROE', '54215': 'MROE', '54216': 'MROE', '54217': 'MROE', '54220': 'MROE', '54221': 'MROE', '54226': 'MROE', '54227': 'MROE', '54228': 'MROE', '54229': 'MROE', '54230': 'MROE', '54232': 'MROE', '54234': 'MROE', '54235': 'MROE', '54240': 'MROE', '54241': 'MROE', '54245': 'MROE', '54246': 'MROE', '54247': 'MROE', '54301': 'MROE', '54302': 'MROE', '54303': 'MROE', '54304': 'MROE', '54305': 'MROE', '54306': 'MROE', '54307': 'MROE', '54308': 'MROE', '54311': 'MROE', '54313': 'MROE', '54324': 'MROE', '54344': 'MROE', '54401': 'MROE', '54402': 'MROE', '54403': 'MROE', '54404': 'MROE', '54405': 'MROW', '54406': 'MROE', '54407': 'MROE', '54408': 'MROE', '54409': 'MROE', '54410': 'MROE', '54411': 'MROW', '54412': 'MROE', '54413': 'MROE', '54414': 'MROE', '54415': 'MROE', '54416': 'MROE', '54417': 'MROE', '54418': 'MROE', '54420': 'MROE', '54421': 'MROW', '54422': 'MROW', '54423': 'MROE', '54424': 'MROE', '54425': 'MROW', '54426': 'MROW', '54427': 'MROE', '54428': 'MROE', '54429': 'MROE', '54430': 'MROE', '54432': 'MROE', '54433': 'MROW', '54434': 'MROW', '54435': 'MROE', '54436': 'MROW', '54437': 'MROW', '54439': 'MROW', '54440': 'MROE', '54441': 'MROE', '54442': 'MROE', '54443': 'MROE', '54446': 'MROW', '54447': 'MROW', '54448': 'MROE', '54449': 'MROE', '54450': 'MROE', '54451': 'MROW', '54452': 'MROW', '54454': 'MROE', '54455': 'MROE', '54456': 'MROW', '54457': 'MROE', '54458': 'MROE', '54459': 'MROW', '54460': 'MROW', '54462': 'MROE', '54463': 'MROE', '54464': 'MROE', '54465': 'MROE', '54466': 'MROE', '54467': 'MROE', '54469': 'MROE', '54470': 'MROW', '54471': 'MROE', '54472': 'MROE', '54473': 'MROE', '54474': 'MROE', '54475': 'MROE', '54476': 'MROE', '54479': 'MROE', '54480': 'MROW', '54481': 'MROE', '54482': 'MROE', '54484': 'MROE', '54485': 'MROE', '54486': 'MROE', '54487': 'MROW', '54488': 'MROW', '54489': 'MROE', '54490': 'MROW', '54491': 'MROE', '54492': 'MROE', '54493': 'MROW', '54494': 'MROE', '54495': 'MROE', '54498': 'MROW', '54499': 'MROE', '54501': 'MROE', '54511': 'RFCW', '54512': 'MROW', '54513': 'MROW', '54514': 'MROW', '54515': 'MROW', '54517': 'MROW', '54519': 'RFCW', '54520': 'MROE', '54521': 'MROE', '54524': 'MROW', '54525': 'MROW', '54526': 'MROW', '54527': 'MROW', '54529': 'MROE', '54530': 'MROW', '54531': 'MROE', '54532': 'MROE', '54534': 'MROW', '54536': 'MROW', '54537': 'MROW', '54538': 'MROW', '54539': 'MROE', '54540': 'MROW', '54541': 'MROE', '54542': 'RFCW', '54543': 'MROE', '54545': 'MROW', '54546': 'MROW', '54547': 'MROW', '54548': 'MROW', '54550': 'MROW', '54552': 'MROW', '54554': 'RFCW', '54555': 'MROW', '54556': 'MROW', '54557': 'MROW', '54558': 'MROE', '54559': 'MROW', '54560': 'MROE', '54561': 'RFCW', '54562': 'MROE', '54563': 'MROW', '54564': 'MROW', '54565': 'MROW', '54566': 'MROE', '54568': 'MROE', '54601': 'MROW', '54602': 'MROW', '54603': 'MROW', '54610': 'MROW', '54611': 'MROW', '54612': 'MROW', '54613': 'MROE', '54614': 'MROW', '54615': 'MROW', '54616': 'MROW', '54618': 'MROE', '54619': 'MROW', '54620': 'MROW', '54621': 'MROW', '54622': 'MROW', '54623': 'MROW', '54624': 'MROW', '54625': 'MROW', '54626': 'MROE', '54627': 'MROW', '54628': 'MROW', '54629': 'MROW', '54630': 'MROW', '54631': 'MROW', '54632': 'MROW', '54634': 'MROE', '54635': 'MROW', '54636': 'MROW', '54637': 'MROE', '54638': 'MROE', '54639': 'MROW', '54640': 'MROE', '54641': 'MROE', '54642': 'MROW', '54643': 'MROE', '54644': 'MROW', '54645': 'MROE', '54646': 'MROE', '54648': 'MROW', '54649': 'MROE', '54650': 'MROW', '54651': 'MROE', '54652': 'MROE', '54653': 'MROW', '54654': 'MROE', '54655': 'MROE', '54656': 'MROW', '54657': 'MROE', '54658': 'MROW', '54659': 'MROW', '54660': 'MROE', '54661': 'MROW', '54662': 'MROE', '54664': 'MROE', '54665': 'MROW', '54666': 'MROE', '54667': 'MROW', '54669': 'MROW', '54670': 'MROE', '54701': 'MROW', '54702': 'MROW', '54703': 'MROW', '54720': 'MROW', '54721': 'MROW', '54722': 'MROW', '54723': 'MROW', '54724': 'MROW', '54725': 'MROW', '54726': 'MROW', '54727': 'MROW', '54728': 'MROW', '54729': 'MROW', '54730': 'MROW', '54731': 'MROW', '54732': 'MROW', '54733': 'MROW', '54734': 'MROW', '54735': 'MROW', '54736': 'MROW', '54737': 'MROW', '54738': 'MROW', '54739': 'MROW', '54740': 'MROW', '54741': 'MROW', '54742': 'MROW', '54743': 'MROW', '54745': 'MROW', '54746': 'MROW', '54747': 'MROW', '54748': 'MROW', '54749': 'MROW', '54750': 'MROW', '54751': 'MROW', '54754': 'MROW', '54755': 'MROW', '54756': 'MROW', '54757': 'MROW', '54758': 'MROW', '54759': 'MROW', '54760': 'MROW', '54761': 'MROW', '54762': 'MROW', '54763': 'MROW', '54764': 'MROW', '54765': 'MROW', '54766': 'MROW', '54767': 'MROW', '54768': 'MROW', '54769': 'MROW', '54770': 'MROW', '54771': 'MROW', '54772': 'MROW', '54773': 'MROW', '54774': 'MROW', '54801': 'MROW', '54805': 'MROW', '54806': 'MROW', '54810': 'MROW', '54812': 'MROW', '54813': 'MROW', '54814': 'MROW', '54816': 'MROW', '54817': 'MROW', '54818': 'MROW', '54819': 'MROW', '54820': 'MROW', '54821': 'MROW', '54822': 'MROW', '54824': 'MROW', '54826': 'MROW', '54827': 'MROW', '54828': 'MROW', '54829': 'MROW', '54830': 'MROW', '54832': 'MROW', '54834': 'MROW', '54835': 'MROW', '54836': 'MROW', '54837': 'MROW', '54838': 'MROW', '54839': 'MROW', '54840': 'MROW', '54841': 'MROW', '54842': 'MROW', '54843': 'MROW', '54844': 'MROW', '54845': 'MROW', '54846': 'MROW', '54847': 'MROW', '54848': 'MROW', '54849': 'MROW', '54850': 'MROW', '54853': 'MROW', '54854': 'MROW', '54855': 'MROW', '54856': 'MROW', '54857': 'MROW', '54858': 'MROW', '54859': 'MROW', '54861': 'MROW', '54862': 'MROW', '54864': 'MROW', '54865': 'MROW', '54867': 'MROW', '54868': 'MROW', '54870': 'MROW', '54871': 'MROW', '54872': 'MROW', '54873': 'MROW', '54874': 'MROW', '54875': 'MROW', '54876': 'MROW', '54880': 'MROW', '54888': 'MROW', '54889': 'MROW', '54890': 'MROW', '54891': 'MROW', '54893': 'MROW', '54895': 'MROW', '54896': 'MROW', '54901': 'MROE', '54902': 'MROE', '54903': 'MROE', '54904': 'MROE', '54906': 'MROE', '54909': 'MROE', '54911': 'RFCW', '54912': 'RFCW', '54913': 'RFCW', '54914': 'RFCW', '54915': 'RFCW', '54919': 'RFCW', '54921': 'MROE', '54922': 'RFCW', '54923': 'MROE', '54926': 'MROE', '54927': 'MROE', '54928': 'MROE', '54929': 'RFCW', '54930': 'MROE', '54931': 'RFCW', '54932': 'MROE', '54933': 'MROE', '54934': 'MROE', '54935': 'MROE', '54936': 'MROE', '54937': 'RFCW', '54940': 'RFCW', '54941': 'MROE', '54942': 'RFCW', '54943': 'MROE', '54944': 'RFCW', '54945': 'RFCW', '54946': 'MROE', '54947': 'RFCW', '54948': 'MROE', '54949': 'RFCW', '54950': 'RFCW', '54952': 'RFCW', '54956': 'RFCW', '54957': 'RFCW', '54960': 'MROE', '54961': 'RFCW', '54962': 'RFCW', '54963': 'MROE', '54964': 'MROE', '54965': 'MROE', '54966': 'MROE', '54967': 'MROE', '54968': 'MROE', '54969': 'RFCW', '54970': 'MROE', '54971': 'MROE', '54974': 'MROE', '54976': 'MROE', '54977': 'MROE', '54978': 'MROE', '54979': 'MROE', '54980': 'MROE', '54981': 'MROE', '54982': 'MROE', '54983': 'RFCW', '54984': 'MROE', '54985': 'MROE', '54986': 'RFCW', '54990': 'MROE', '55001': 'MROW', '55002': 'MROW', '55003': 'MROW', '55005': 'MROW', '55006': 'MROW', '55007': 'MROW', '55008': 'MROW', '55009': 'MROW', '55010': 'MROW', '55011': 'MROW', '55012': 'MROW', '55013': 'MROW', '55014': 'MROW', '55016': 'MROW', '55017': 'MROW', '55018': 'MROW', '55019': 'MROW', '55020': 'MROW', '55021': 'MROW', '55024': 'MROW', '55025': 'MROW', '55026': 'MROW', '55027': 'MROW', '55029': 'MROW', '55030': 'MROW', '55031': 'MROW', '55032': 'MROW', '55033': 'MROW', '55036': 'MROW', '55037': 'MROW', '55038': 'MROW', '55040': 'MROW', '55041': 'MROW', '55042': 'MROW', '55043': 'MROW', '55044': 'MROW', '55045': 'MROW', '55046': 'MROW', '55047': 'MROW', '55049': 'MROW', '55051': 'MROW', '55052': 'MROW', '55053': 'MROW', '55054': 'MROW', '55055': 'MROW', '55056': 'MROW', '55057': 'MROW', '55060': 'MROW', '55063': 'MROW', '55065': 'MROW', '55066': 'MROW', '55067': 'MROW', '55068': 'MROW', '55069': 'MROW', '55070': 'MROW', '55071': 'MROW', '55072': 'MROW', '55073': 'MROW', '55074': 'MROW', '55075': 'MROW', '55076': 'MROW', '55077': 'MROW', '55078': 'MROW', '55079': 'MROW', '55080': 'MROW', '55082': 'MROW', '55083': 'MROW', '55084': 'MROW', '55085': 'MROW', '55087': 'MROW', '55088': 'MROW', '55089': 'MROW', '55090': 'MROW', '55092': 'MROW', '55101': 'MROW', '55102': 'MROW', '55103': 'MROW', '55104': 'MROW', '55105': 'MROW', '55106': 'MROW', '55107': 'MROW', '55108': 'MROW', '55109': 'MROW', '55110': 'MROW', '55111': 'MROW', '55112': 'MROW', '55113': 'MROW', '55114': 'MROW', '55115': 'MROW', '55116': 'MROW', '55117': 'MROW', '55118': 'MROW', '55119': 'MROW', '55120': 'MROW', '55121': 'MROW', '55122': 'MROW', '55123': 'MROW', '55124': 'MROW', '55125': 'MROW', '55126': 'MROW', '55127': 'MROW', '55128': 'MROW', '55129': 'MROW', '55130': 'MROW', '55133': 'MROW', '55144': 'MROW', '55145': 'MROW', '55146': 'MROW', '55150': 'MROW', '55155': 'MROW', '55164': 'MROW', '55165': 'MROW', '55166': 'MROW', '55168': 'MROW', '55169': 'MROW', '55170': 'MROW', '55171': 'MROW', '55172': 'MROW', '55175': 'MROW', '55187': 'MROW', '55188': 'MROW', '55301': 'MROW', '55302': 'MROW', '55303': 'MROW', '55304': 'MROW', '55305': 'MROW', '55306': 'MROW', '55307': 'MROW', '55308': 'MROW', '55309': 'MROW', '55310': 'MROW', '55311': 'MROW', '55312': 'MROW', '55313': 'MROW', '55314': 'MROW', '55315': 'MROW', '55316': 'MROW', '55317': 'MROW', '55318': 'MROW', '55319': 'MROW', '55320': 'MROW', '55321': 'MROW', '55322': 'MROW', '55323': 'MROW', '55324': 'MROW', '55325': 'MROW', '55327': 'MROW', '55328': 'MROW', '55329': 'MROW', '55330': 'MROW', '55331': 'MROW', '55332': 'MROW', '55333': 'MROW', '55334': 'MROW', '55335': 'MROW', '55336': 'MROW', '55337': 'MROW', '55338': 'MROW', '55339': 'MROW', '55340': 'MROW', '55341': 'MROW', '55342': 'MROW', '55343': 'MROW', '55344': 'MROW', '55345': 'MROW', '55346': 'MROW', '55347': 'MROW', '55348': 'MROW', '55349': 'MROW', '55350': 'MROW', '55352': 'MROW', '55353': 'MROW', '55354': 'MROW', '55355': 'MROW', '55356': 'MROW', '55357': 'MROW', '55358': 'MROW', '55359': 'MROW', '55360': 'MROW', '55361': 'MROW', '55362': 'MROW', '55363': 'MROW', '55364': 'MROW', '55365': 'MROW', '55366': 'MROW', '55367': 'MROW', '55368': 'MROW', '55369': 'MROW', '55370': 'MROW', '55371': 'MROW', '55372': 'MROW', '55373': 'MROW', '55374': 'MROW', '55375': 'MROW', '55376': 'MROW', '55377': 'MROW', '55378': 'MROW', '55379': 'MROW', '55380': 'MROW', '55381': 'MROW', '55382': 'MROW', '55383': 'MROW', '55384': 'MROW', '55385': 'MROW', '55386': 'MROW', '55387': 'MROW', '55388': 'MROW', '55389': 'MROW', '55390': 'MROW', '55391': 'MROW', '55392': 'MROW', '55393': 'MROW', '55394': 'MROW', '55395': 'MROW', '55396': 'MROW', '55397': 'MROW', '55398': 'MROW', '55399': 'MROW', '55401': 'MROW', '55402': 'MROW', '55403': 'MROW', '55404': 'MROW', '55405': 'MROW', '55406': 'MROW', '55407': 'MROW', '55408': 'MROW', '55409': 'MROW', '55410': 'MROW', '55411': 'MROW', '55412': 'MROW', '55413': 'MROW', '55414': 'MROW', '55415': 'MROW', '55416': 'MROW', '55417': 'MROW', '55418': 'MROW', '55419': 'MROW', '55420': 'MROW', '55421': 'MROW', '55422': 'MROW', '55423': 'MROW', '55424': 'MROW', '55425': 'MROW', '55426': 'MROW', '55427': 'MROW', '55428': 'MROW', '55429': 'MROW', '55430': 'MROW', '55431': 'MROW', '55432': 'MROW', '55433': 'MROW', '55434': 'MROW', '55435': 'MROW', '55436': 'MROW', '55437': 'MROW', '55438': 'MROW', '55439': 'MROW', '55440': 'MROW', '55441': 'MROW', '55442': 'MROW', '55443': 'MROW', '55444': 'MROW', '55445': 'MROW', '55446': 'MROW', '55447': 'MROW', '55448': 'MROW', '55449': 'MROW', '55450': 'MROW', '55454': 'MROW', '55455': 'MROW', '55458': 'MROW', '55459': 'MROW', '55460': 'MROW', '55467': 'MROW', '55470': 'MROW', '55472': 'MROW', '55473': 'MROW', '55474': 'MROW', '55478': 'MROW', '55479': 'MROW', '55480': 'MROW', '55483': 'MROW', '55484': 'MROW', '55485': 'MROW', '55486': 'MROW', '55487': 'MROW', '55488': 'MROW', '55550': 'MROW', '55551': 'MROW', '55552': 'MROW', '55553': 'MROW', '55554': 'MROW', '55555': 'MROW', '55556': 'MROW', '55557': 'MROW', '55558': 'MROW', '55559': 'MROW', '55560': 'MROW', '55561': 'MROW', '55562': 'MROW', '55563': 'MROW', '55564': 'MROW', '55565': 'MROW', '55566': 'MROW', '55567': 'MROW', '55568': 'MROW', '55569': 'MROW', '55570': 'MROW', '55571': 'MROW', '55572': 'MROW', '55573': 'MROW', '55574': 'MROW', '55575': 'MROW', '55576': 'MROW', '55577': 'MROW', '55578': 'MROW', '55579': 'MROW', '55580': 'MROW', '55581': 'MROW', '55582': 'MROW', '55583': 'MROW', '55584': 'MROW', '55585': 'MROW', '55586': 'MROW', '55587': 'MROW', '55588': 'MROW', '55589': 'MROW', '55590': 'MROW', '55591': 'MROW', '55592': 'MROW', '55593': 'MROW', '55594': 'MROW', '55595': 'MROW', '55596': 'MROW', '55597': 'MROW', '55598': 'MROW', '55599': 'MROW', '55601': 'MROW', '55602': 'MROW', '55603': 'MROW', '55604': 'MROW', '55605': 'MROW', '55606': 'MROW', '55607': 'MROW', '55609': 'MROW', '55612': 'MROW', '55613': 'MROW', '55614': 'MROW', '55615': 'MROW', '55616': 'MROW', '55701': 'MROW', '55702': 'MROW', '55703': 'MROW', '55704': 'MROW', '55705': 'MROW', '55706': 'MROW', '55707': 'MROW', '55708': 'MROW', '55709': 'MROW', '55710': 'MROW', '55711': 'MROW', '55712': 'MROW', '55713': 'MROW', '55716': 'MROW', '55717': 'MROW', '55718': 'MROW', '55719': 'MROW', '55720': 'MROW', '55721': 'MROW', '55722': 'MROW', '55723': 'MROW', '55724': 'MROW', '55725': 'MROW', '55726': 'MROW', '55730': 'MROW', '55731': 'MROW', '55732': 'MROW', '55733': 'MROW', '55734': 'MROW', '55735': 'MROW', '55736': 'MROW', '55738': 'MROW', '55741': 'MROW', '55742': 'MROW', '55744': 'MROW', '55745': 'MROW', '55746': 'MROW', '55747': 'MROW', '55748': 'MROW', '55749': 'MROW', '55750': 'MROW', '55751': 'MROW', '55752': 'MROW', '55753': 'MROW', '55756': 'MROW', '55757': 'MROW', '55758': 'MROW', '55760': 'MROW', '55763': 'MROW', '55764': 'MROW', '55765': 'MROW', '55766': 'MROW', '55767': 'MROW', '55768': 'MROW', '55769': 'MROW', '55771': 'MROW', '55772': 'MROW', '55775': 'MROW', '55777': 'MROW', '55779': 'MROW', '55780': 'MROW', '55781': 'MROW', '55782': 'MROW', '55783': 'MROW', '55784': 'MROW', '55785': 'MROW', '55786': 'MROW', '55787': 'MROW', '55790': 'MROW', '55791': 'MROW', '55792': 'MROW', '55793': 'MROW', '55795': 'MROW', '55796': 'MROW', '55797': 'MROW', '55798': 'MROW', '55801': 'MROW', '55802': 'MROW', '55803': 'MROW', '55804': 'MROW', '55805': 'MROW', '55806': 'MROW', '55807': 'MROW', '55808': 'MROW', '55810': 'MROW', '55811': 'MROW', '55812': 'MROW', '55814': 'MROW', '55815': 'MROW', '55816': 'MROW', '55901': 'MROW', '55902': 'MROW', '55903': 'MROW', '55904': 'MROW', '55905': 'MROW', '55906': 'MROW', '55909': 'MROW', '55910': 'MROW', '55912': 'MROW', '55917': 'MROW', '55918': 'MROW', '55919': 'MROW', '55920': 'MROW', '55921': 'MROW', '55922': 'MROW', '55923': 'MROW', '55924': 'MROW', '55925': 'MROW', '55926': 'MROW', '55927': 'MROW', '55929': 'MROW', '55931': 'MROW', '55932': 'MROW', '55933': 'MROW', '55934': 'MROW', '55935': 'MROW', '55936': 'MROW', '55939': 'MROW', '55940': 'MROW', '55941': 'MROW', '55942': 'MROW', '55943': 'MROW', '55944': 'MROW', '55945': 'MROW', '55946': 'MROW', '55947': 'MROW', '55949': 'MROW', '55950': 'MROW', '55951': 'MROW', '55952': 'MROW', '55953': 'MROW', '55954': 'MROW', '55955': 'MROW', '55956': 'MROW', '55957': 'MROW', '55959': 'MROW', '55960': 'MROW', '55961': 'MROW', '55962': 'MROW', '55963': 'MROW', '55964': 'MROW', '55965': 'MROW', '55967': 'MROW', '55968': 'MROW', '55969': 'MROW', '55970': 'MROW', '55971': 'MROW', '55972': 'MROW', '55973': 'MROW', '55974': 'MROW', '55975': 'MROW', '55976': 'MROW', '55977': 'MROW', '55979': 'MROW', '55981': 'MROW', '55982': 'MROW', '55983': 'MROW', '55985': 'MROW', '55987': 'MROW', '55988': 'MROW', '55990': 'MROW', '55991': 'MROW', '55992': 'MROW', '56001': 'MROW', '56002': 'MROW', '56003': 'MROW', '56006': 'MROW', '56007': 'MROW', '56009': 'MROW', '56010': 'MROW', '56011': 'MROW', '56013': 'MROW', '56014': 'MROW', '56016': 'MROW', '56017': 'MROW', '56019': 'MROW', '56020': 'MROW', '56021': 'MROW', '56022': 'MROW', '56023': 'MROW', '56024': 'MROW', '56025': 'MROW', '56026': 'MROW', '56027': 'MROW', '56028': 'MROW', '56029': 'MROW', '56030': 'MROW', '56031': 'MROW', '56032': 'MROW', '56033': 'MROW', '56034': 'MROW', '56035': 'MROW', '56036': 'MROW', '56037': 'MROW', '56039': 'MROW', '56041': 'MROW', '56042': 'MROW', '56043': 'MROW', '56044': 'MROW', '56045': 'MROW', '56046': 'MROW', '56047': 'MROW', '56048': 'MROW', '56050': 'MROW', '56051': 'MROW', '56052': 'MROW', '56054': 'MROW', '56055': 'MROW', '56056': 'MROW', '56057': 'MROW', '56058': 'MROW', '56060': 'MROW', '56062': 'MROW', '56063': 'MROW', '56065': 'MROW', '56068': 'MROW', '56069': 'MROW', '56071': 'MROW', '56072': 'MROW', '56073': 'MROW', '56074': 'MROW', '56075': 'MROW', '56078': 'MROW', '56080': 'MROW', '56081': 'MROW', '56082': 'MROW', '56083': 'MROW', '56084': 'MROW', '56085': 'MROW', '56087': 'MROW', '56088': 'MROW', '56089': 'MROW', '56090': 'MROW', '56091': 'MROW', '56093': 'MROW', '56096': 'MROW', '56097': 'MROW', '56098': 'MROW', '56101': 'MROW', '56110': 'MROW', '56111': 'MROW', '56113': 'MROW', '56114': 'MROW', '56115': 'MROW', '56116': 'MROW', '56117': 'MROW', '56118': 'MROW', '56119': 'MROW', '56120': 'MROW', '56121': 'MROW', '56122': 'MROW', '56123': 'MROW', '56125': 'MROW', '56127': 'MROW', '56128': 'MROW', '56129': 'MROW', '56131': 'MROW', '56132': 'MROW', '56134': 'MROW', '56136': 'MROW', '56137': 'MROW', '56138': 'MROW', '56139': 'MROW', '56140': 'MROW', '56141': 'MROW', '56142': 'MROW', '56143': 'MROW', '56144': 'MROW', '56145': 'MROW', '56146': 'MROW', '56147': 'MROW', '56149': 'MROW', '56150': 'MROW', '56151': 'MROW', '56152': 'MROW', '56153': 'MROW', '56155': 'MROW', '56156': 'MROW', '56157': 'MROW', '56158': 'MROW', '56159': 'MROW', '56160': 'MROW', '56161': 'MROW', '56162': 'MROW', '56164': 'MROW', '56165': 'MROW', '56166': 'MROW', '56167': 'MROW', '56168': 'MROW', '56169': 'MROW', '56170': 'MROW', '56171': 'MROW', '56172': 'MROW', '56173': 'MROW', '56174': 'MROW', '56175': 'MROW', '56176': 'MROW', '56177': 'MROW', '56178': 'MROW', '56180': 'MROW', '56181': 'MROW', '56183': 'MROW', '56185': 'MROW', '56186': 'MROW', '56187': 'MROW', '56201': 'MROW', '56207': 'MROW', '56208': 'MROW', '56209': 'MROW', '56210': 'MROW', '56211': 'MROW', '56212': 'MROW', '56214': 'MROW', '56215': 'MROW', '56216': 'MROW', '56218': 'MROW', '56219': 'MROW', '56220': 'MROW', '56221': 'MROW', '56222': 'MROW', '56223': 'MROW', '56224': 'MROW', '56225': 'MROW', '56226': 'MROW', '56227': 'MROW', '56228': 'MROW', '56229': 'MROW', '56230': 'MROW', '56231': 'MROW', '56232': 'MROW', '56235': 'MROW', '56236': 'MROW', '56237': 'MROW', '56239': 'MROW', '56240': 'MROW', '56241': 'MROW', '56243': 'MROW', '56244': 'MROW', '56245': 'MROW', '56248': 'MROW', '56249': 'MROW', '56251': 'MROW', '56252': 'MROW', '56253': 'MROW', '56255': 'MROW', '56256': 'MROW', '56257': 'MROW', '56258': 'MROW', '56260': 'MROW', '56262': 'MROW', '56263': 'MROW', '56264': 'MROW', '56265': 'MROW', '56266': 'MROW', '56267': 'MROW', '56270': 'MROW', '56271': 'MROW', '56273': 'MROW', '56274': 'MROW', '56276': 'MROW', '56277': 'MROW', '56278': 'MROW', '56279': 'MROW', '56280': 'MROW', '56281': 'MROW', '56282': 'MROW', '56283': 'MROW', '56284': 'MROW', '56285': 'MROW', '56287': 'MROW', '56288': 'MROW', '56289': 'MROW', '56291': 'MROW', '56292': 'MROW', '56293': 'MROW', '56294': 'MROW', '56295': 'MROW', '56296': 'MROW', '56297': 'MROW', '56301': 'MROW', '56302': 'MROW', '56303': 'MROW', '56304': 'MROW', '56307': 'MROW', '56308': 'MROW', '56309': 'MROW', '56310': 'MROW', '56311': 'MROW', '56312': 'MROW', '56313': 'MROW', '56314': 'MROW', '56315': 'MROW', '56316': 'MROW', '56317': 'MROW', '56318': 'MROW', '56319': 'MROW', '56320': 'MROW', '56321': 'MROW', '56323': 'MROW', '56324': 'MROW', '56325': 'MROW', '56326': 'MROW', '56327': 'MROW', '56328': 'MROW', '56329': 'MROW', '56330': 'MROW', '56331': 'MROW', '56332': 'MROW', '56333': 'MROW', '56334': 'MROW', '56335': 'MROW', '56336': 'MROW', '56338': 'MROW', '56339': 'MROW', '56340': 'MROW', '56341': 'MROW', '56342': 'MROW', '56343': 'MROW', '56344': 'MROW', '56345': 'MROW', '56347': 'MROW', '56349': 'MROW', '56350': 'MROW', '56352': 'MROW', '56353': 'MROW', '56354': 'MROW', '56355': 'MROW', '56356': 'MROW', '56357': 'MROW', '56358': 'MROW', '56359': 'MROW', '56360': 'MROW', '56361': 'MROW', '56362': 'MROW', '56363': 'MROW', '56364': 'MROW', '56367': 'MROW', '56368': 'MROW', '56369': 'MROW', '56371': 'MROW', '56372': 'MROW', '56373': 'MROW', '56374': 'MROW', '56375': 'MROW', '56376': 'MROW', '56377': 'MROW', '56378': 'MROW', '56379': 'MROW', '56381': 'MROW', '56382': 'MROW', '56384': 'MROW', '56385': 'MROW', '56386': 'MROW', '56387': 'MROW', '56388': 'MROW', '56389': 'MROW', '56393': 'MROW', '56395': 'MROW', '56396': 'MROW', '56397': 'MROW', '56398': 'MROW', '56399': 'MROW', '56401': 'MROW', '56425': 'MROW', '56430': 'MROW', '56431': 'MROW', '56433': 'MROW', '56434': 'MROW', '56435': 'MROW', '56436': 'MROW', '56437': 'MROW', '56438': 'MROW', '56440': 'MROW', '56441': 'MROW', '56442': 'MROW', '56443': 'MROW', '56444': 'MROW', '56446': 'MROW', '56447': 'MROW', '56448': 'MROW', '56449': 'MROW', '56450': 'MROW', '56452': 'MROW', '56453': 'MROW', '56455': 'MROW', '56456': 'MROW', '56458': 'MROW', '56459': 'MROW', '56461': 'MROW', '56464': 'MROW', '56465': 'MROW', '56466': 'MROW', '56467': 'MROW', '56468': 'MROW', '56469': 'MROW', '56470': 'MROW', '56472': 'MROW', '56473': 'MROW', '56474': 'MROW', '56475': 'MROW', '56477': 'MROW', '56478': 'MROW', '56479': 'MROW', '56481': 'MROW', '56482': 'MROW', '56484': 'MROW', '56501': 'MROW', '56502': 'MROW', '56510': 'MROW', '56511': 'MROW', '56514': 'MROW', '56515': 'MROW', '56516': 'MROW', '56517': 'MROW', '56518': 'MROW', '56519': 'MROW', '56520': 'MROW', '56521': 'MROW', '56522': 'MROW', '56523': 'MROW', '56524': 'MROW', '56525': 'MROW', '56527': 'MROW', '56528': 'MROW', '56529': 'MROW', '56531': 'MROW', '56533': 'MROW', '56534': 'MROW', '56535': 'MROW', '56536': 'MROW', '56537': 'MROW', '56538': 'MROW', '56540': 'MROW', '56541': 'MROW', '56542': 'MROW', '56543': 'MROW', '56544': 'MROW', '56545': 'MROW', '56546': 'MROW', '56547': 'MROW', '56548': 'MROW', '56549': 'MROW', '56550': 'MROW', '56551': 'MROW', '56552': 'MROW', '56553': 'MROW', '56554': 'MROW', '56556': 'MROW', '56557': 'MROW', '56560': 'MROW', '56561': 'MROW', '56562': 'MROW', '56563': 'MROW', '56565': 'MROW', '56566': 'MROW', '56567': 'MROW', '56568': 'MROW', '56569': 'MROW', '56570': 'MROW', '56571': 'MROW', '56572': 'MROW', '56573': 'MROW', '56574': 'MROW', '56575': 'MROW', '56576': 'MROW', '56577': 'MROW', '56578': 'MROW', '56579': 'MROW', '56580': 'MROW', '56581': 'MROW', '56583': 'MROW', '56584': 'MROW', '56585': 'MROW', '56586': 'MROW', '56587': 'MROW', '56588': 'MROW', '56589': 'MROW', '56590': 'MROW', '56591': 'MROW', '56592': 'MROW', '56593': 'MROW', '56594': 'MROW', '56601': 'MROW', '56619': 'MROW', '56621': 'MROW', '56623': 'MROW', '56626': 'MROW', '56627': 'MROW', '56628': 'MROW', '56629': 'MROW', '56630': 'MROW', '56631': 'MROW', '56633': 'MROW', '56634': 'MROW', '56636': 'MROW', '56637': 'MROW', '56639': 'MROW', '56641': 'MROW', '56644': 'MROW', '56646': 'MROW', '56647': 'MROW', '56649': 'MROW', '56650': 'MROW', '56651': 'MROW', '56652': 'MROW', '56653': 'MROW', '56654': 'MROW', '56655': 'MROW', '56657': 'MROW', '56658': 'MROW', '56659': 'MROW', '56660': 'MROW', '56661': 'MROW', '56662': 'MROW', '56663': 'MROW', '56666': 'MROW', '56667': 'MROW', '56668': 'MROW', '56669': 'MROW', '56670': 'MROW', '56671': 'MROW', '56672': 'MROW', '56673': 'MROW', '56676': 'MROW', '56678': 'MROW', '56679': 'MROW', '56680': 'MROW', '56681': 'MROW', '56682': 'MROW', '56683': 'MROW', '56684': 'MROW', '56685': 'MROW', '56686': 'MROW', '56687': 'MROW', '56688': 'MROW', '56701': 'MROW', '56710': 'MROW', '56711': 'MROW', '56713': 'MROW', '56714': 'MROW', '56715': 'MROW', '56716': 'MROW', '56720': 'MROW', '56721': 'MROW', '56722': 'MROW', '56723': 'MROW', '56724': 'MROW', '56725': 'MROW', '56726': 'MROW', '56727': 'MROW', '56728': 'MROW', '56729': 'MROW', '56731': 'MROW', '56732': 'MROW', '56733': 'MROW', '56734': 'MROW', '56735': 'MROW', '56736': 'MROW', '56737': 'MROW', '56738': 'MROW', '56740': 'MROW', '56741': 'MROW', '56742': 'MROW', '56744': 'MROW', '56748': 'MROW', '56750': 'MROW', '56751': 'MROW', '56754': 'MROW', '56755': 'MROW', '56756': 'MROW', '56757': 'MROW', '56758': 'MROW', '56759': 'MROW', '56760': 'MROW', '56761': 'MROW', '56762': 'MROW', '56763': 'MROW', '56901': 'RFCE', '56902': 'RFCE', '56904': 'RFCE', '56915': 'RFCE', '56920': 'RFCE', '56933': 'RFCE', '56944': 'RFCE', '56945': 'RFCE', '56950': 'RFCE', '56965': 'RFCE', '56972': 'RFCE', '57001': 'MROW', '57002': 'MROW', '57003': 'MROW', '57004': 'MROW', '57005': 'MROW', '57006': 'MROW', '57007': 'MROW', '57010': 'MROW', '57012': 'MROW', '57013': 'MROW', '57014': 'MROW', '57015': 'MROW', '57016': 'MROW', '57017': 'MROW', '57018': 'MROW', '57020': 'MROW', '57021': 'MROW', '57022': 'MROW', '57024': 'MROW', '57025': 'MROW', '57026': 'MROW', '57027': 'MROW', '57028': 'MROW', '57029': 'MROW', '57030': 'MROW', '57031': 'MROW', '57032': 'MROW', '57033': 'MROW', '57034': 'MROW', '57035': 'MROW', '57036': 'MROW', '57037': 'MROW', '57038': 'MROW', '57039': 'MROW', '57040': 'MROW', '57041': 'MROW', '57042': 'MROW', '57043': 'MROW', '57045': 'MROW', '57046': 'MROW', '57047': 'MROW', '57048': 'MROW', '57049': 'MROW', '57050': 'MROW', '57051': 'MROW', '57052': 'MROW', '57053': 'MROW', '57054': 'MROW', '57055': 'MROW', '57057': 'MROW', '57058': 'MROW', '57059': 'MROW', '57061': 'MROW', '57062': 'MROW', '57063': 'MROW', '57064': 'MROW', '57065': 'MROW', '57066': 'MROW', '57067': 'MROW', '57068': 'MROW', '57069': 'MROW', '57070': 'MROW', '57071': 'MROW', '57072': 'MROW', '57073': 'MROW', '57075': 'MROW', '57076': 'MROW', '57077': 'MROW', '57078': 'MROW', '57101': 'MROW', '57103': 'MROW', '57104': 'MROW', '57105': 'MROW', '57106': 'MROW', '57107': 'MROW', '57108': 'MROW', '57109': 'MROW', '57110': 'MROW', '57117': 'MROW', '57118': 'MROW', '57186': 'MROW', '57193': 'MROW', '57197': 'MROW', '57198': 'MROW', '57201': 'MROW', '57212': 'MROW', '57213': 'MROW', '57214': 'MROW', '57216': 'MROW', '57217': 'MROW', '57218': 'MROW', '57219': 'MROW', '57220': 'MROW', '57221': 'MROW', '57223': 'MROW', '57224': 'MROW', '57225': 'MROW', '57226': 'MROW', '57227': 'MROW', '57231': 'MROW', '57232': 'MROW', '57233': 'MROW', '57234': 'MROW', '57235': 'MROW', '57236': 'MROW', '57237': 'MROW', '57238': 'MROW', '57239': 'MROW', '57241': 'MROW', '57242': 'MROW', '57243': 'MROW', '57245': 'MROW', '57246': 'MROW', '57247': 'MROW', '57248': 'MROW', '57249': 'MROW', '57251': 'MROW', '57252': 'MROW', '57253': 'MROW', '57255': 'MROW', '57256': 'MROW', '57257': 'MROW', '57258': 'MROW', '57259': 'MROW', '57260': 'MROW', '57261': 'MROW', '57262': 'MROW', '57263': 'MROW', '57264': 'MROW', '57265': 'MROW', '57266': 'MROW', '57268': 'MROW', '57269': 'MROW', '57270': 'MROW', '57271': 'MROW', '57272': 'MROW', '57273': 'MROW', '57274': 'MROW', '57276': 'MROW', '57278': 'MROW', '57279': 'MROW', '57301': 'MROW', '57311': 'MROW', '57312': 'MROW', '57313': 'MROW', '57314': 'MROW', '57315': 'MROW', '57317': 'MROW', '57319': 'MROW', '57321': 'MROW', '57322': 'MROW', '57323': 'MROW', '57324': 'MROW', '57325': 'MROW', '57326': 'MROW', '57328': 'MROW', '57329': 'MROW', '57330': 'MROW', '57331': 'MROW', '57332': 'MROW', '57334': 'MROW', '57335': 'MROW', '57337': 'MROW', '57339': 'MROW', '57340': 'MROW', '57341': 'MROW', '57342': 'MROW', '57344': 'MROW', '57345': 'MROW', '57346': 'MROW', '57348': 'MROW', '57349': 'MROW', '57350': 'MROW', '57353': 'MROW', '57354': 'MROW', '57355': 'MROW', '57356': 'MROW', '57358': 'MROW', '57359': 'MROW', '57361': 'MROW', '57362': 'MROW', '57363': 'MROW', '57364': 'MROW', '57365': 'MROW', '57366': 'MROW', '57367': 'MROW', '57368': 'MROW', '57369': 'MROW', '57370': 'MROW', '57371': 'MROW', '57373': 'MROW', '57374': 'MROW', '57375': 'MROW', '57376': 'MROW', '57379': 'MROW', '57380': 'MROW', '57381': 'MROW', '57382': 'MROW', '57383': 'MROW', '57384': 'MROW', '57385': 'MROW', '57386': 'MROW', '57399': 'MROW', '57401': 'MROW', '57402': 'MROW', '57420': 'MROW', '57421': 'MROW', '57422': 'MROW', '57424': 'MROW', '57426': 'MROW', '57427': 'MROW', '57428': 'MROW', '57429': 'MROW', '57430': 'MROW', '57432': 'MROW', '57433': 'MROW', '57434': 'MROW', '57435': 'MROW', '57436': 'MROW', '57437': 'MROW', '57438': 'MROW', '57439': 'MROW', '57440': 'MROW', '57441': 'MROW', '57442': 'MROW', '57445': 'MROW', '57446': 'MROW', '57448': 'MROW', '57449': 'MROW', '57450': 'MROW', '57451': 'MROW', '57452': 'MROW', '57454': 'MROW', '57455': 'MROW', '57456': 'MROW', '57457': 'MROW', '57460': 'MROW', '57461': 'MROW', '57465': 'MROW', '57466': 'MROW', '57467': 'MROW', '57468': 'MROW', '57469': 'MROW', '57470': 'MROW', '57471': 'MROW', '57472': 'MROW', '57473': 'MROW', '57474': 'MROW', '57475': 'MROW', '57476': 'MROW', '57477': 'MROW', '57479': 'MROW', '57481': 'MROW', '57501': 'MROW', '57520': 'MROW', '57521': 'MROW', '57522': 'MROW', '57523': 'MROW', '57528': 'MROW', '57529': 'MROW', '57531': 'MROW', '57532': 'MROW', '57533': 'MROW', '57534': 'MROW', '57536': 'MROW', '57537': 'MROW', '57538': 'MROW', '57540': 'MROW', '57541': 'MROW', '57543': 'MROW', '57544': 'MROW', '57547': 'MROW', '57548': 'MROW', '57551': 'MROW', '57552': 'MROW', '57553': 'MROW', '57555': 'MROW', '57559': 'MROW', '57560': 'MROW', '57562': 'MROW', '57563': 'MROW', '57564': 'MROW', '57566': 'MROW', '57567': 'MROW', '57568': 'MROW', '57569': 'MROW', '57570': 'MROW', '57571': 'MROW', '57572': 'MROW', '57574': 'MROW', '57576': 'MROW', '57577': 'MROW', '57579': 'MROW', '57580': 'MROW', '57584': 'MROW', '57585': 'MROW', '57601': 'MROW', '57620': 'MROW', '57621': 'MROW', '57622': 'MROW', '57623': 'MROW', '57625': 'MROW', '57626': 'MROW', '57630': 'MROW', '57631': 'MROW', '57632': 'MROW', '57633': 'MROW', '57634': 'MROW', '57636': 'MROW', '57638': 'MROW', '57639': 'MROW', '57640': 'MROW', '57641': 'MROW', '57642': 'MROW', '57644': 'MROW', '57645': 'MROW', '57646': 'MROW', '57648': 'MROW', '57649': 'MROW', '57650': 'MROW', '57651': 'MROW', '57652': 'MROW', '57656': 'MROW', '57657': 'MROW', '57658': 'MROW', '57659': 'MROW', '57660': 'MROW', '57661': 'MROW', '57701': 'RMPA', '57702': 'RMPA', '57703': 'RMPA', '57706': 'RMPA', '57709': 'RMPA', '57714': 'MROW', '57716': 'MROW', '57717': 'RMPA', '57718': 'RMPA', '57719': 'RMPA', '57720': 'MROW', '57722': 'RMPA', '57724': 'MROW', '57725': 'RMPA', '57730': 'RMPA', '57732': 'RMPA', '57735': 'RMPA', '57737': 'MROW', '57738': 'RMPA', '57741': 'RMPA', '57744': 'RMPA', '57745': 'RMPA', '57747': 'RMPA', '57748': 'MROW', '57750': 'MROW', '57751': 'RMPA', '57752': 'MROW', '57754': 'RMPA', '57755': 'MROW', '57756': 'MROW', '57758': 'MROW', '57759': 'RMPA', '57760': 'RMPA', '57761': 'RMPA', '57762': 'RMPA', '57763': 'RMPA', '57764': 'RMPA', '57766': 'RMPA', '57767': 'MROW', '57769': 'RMPA', '57770': 'MROW', '57772': 'RMPA', '57773': 'RMPA', '57775': 'MROW', '57776': 'MROW', '57779': 'RMPA', '57780': 'RMPA', '57782': 'RMPA', '57783': 'RMPA', '57785': 'RMPA', '57787': 'MROW', '57788': 'RMPA', '57790': 'MROW', '57791': 'MROW', '57792': 'MROW', '57793': 'RMPA', '57794': 'MROW', '57799': 'RMPA', '58001': 'MROW', '58002': 'MROW', '58004': 'MROW', '58005': 'MROW', '58006': 'MROW', '58007': 'MROW', '58008': 'MROW', '58009': 'MROW', '58011': 'MROW', '58012': 'MROW', '58013': 'MROW', '58015': 'MROW', '58016': 'MROW', '58017': 'MROW', '58018': 'MROW', '58021': 'MROW', '58027': 'MROW', '58029': 'MROW', '58030': 'MROW', '58031': 'MROW', '58032': 'MROW', '58033': 'MROW', '58035': 'MROW', '58036': 'MROW', '58038': 'MROW', '58040': 'MROW', '58041': 'MROW', '58042': 'MROW', '58043': 'MROW', '58045': 'MROW', '58046': 'MROW', '58047': 'MROW', '58048': 'MROW', '58049': 'MROW', '58051': 'MROW', '58052': 'MROW', '58053': 'MROW', '58054': 'MROW', '58056': 'MROW', '58057': 'MROW', '58058': 'MROW', '58059': 'MROW', '58060': 'MROW', '58061': 'MROW', '58062': 'MROW', '58063': 'MROW', '58064': 'MROW', '58065': 'MROW', '58067': 'MROW', '58068': 'MROW', '58069': 'MROW', '58071': 'MROW', '58072': 'MROW', '58074': 'MROW', '58075': 'MROW', '58076': 'MROW', '58077': 'MROW', '58078': 'MROW', '58079': 'MROW', '58081': 'MROW', '58102': 'MROW', '58103': 'MROW', '58104': 'MROW', '58105': 'MROW', '58106': 'MROW', '58107': 'MROW', '58108': 'MROW', '58109': 'MROW', '58121': 'MROW', '58122': 'MROW', '58124': 'MROW', '58125': 'MROW', '58126': 'MROW', '58201': 'MROW', '58202': 'MROW', '58203': 'MROW', '58204': 'MROW', '58205': 'MROW', '58206': 'MROW', '58207': 'MROW', '58208': 'MROW', '58210': 'MROW', '58212': 'MROW', '58214': 'MROW', '58216': 'MROW', '58218': 'MROW', '58219': 'MROW', '58220': 'MROW', '58222': 'MROW', '58223': 'MROW', '58224': 'MROW', '58225': 'MROW', '58227': 'MROW', '58228': 'MROW', '58229': 'MROW', '58230': 'MROW', '58231': 'MROW', '58233': 'MROW', '58235': 'MROW', '58236': 'MROW', '58237': 'MROW', '58238': 'MROW', '58239': 'MROW', '58240': 'MROW', '58241': 'MROW', '58243': 'MROW', '58244': 'MROW', '58249': 'MROW', '58250': 'MROW', '58251': 'MROW', '58254': 'MROW', '58255': 'MROW', '58256': 'MROW', '58257': 'MROW', '58258': 'MROW', '58259': 'MROW', '58260': 'MROW', '58261': 'MROW', '58262': 'MROW', '58265': 'MROW', '58266': 'MROW', '58267': 'MROW', '58269': 'MROW', '58270': 'MROW', '58271': 'MROW', '58272': 'MROW', '58273': 'MROW', '58274': 'MROW', '58275': 'MROW', '58276': 'MROW', '58277': 'MROW', '58278': 'MROW', '58281': 'MROW', '58282': 'MROW', '58301': 'MROW', '58310': 'MROW', '58311': 'MROW', '58313': 'MROW', '58316': 'MROW', '58317': 'MROW', '58318': 'MROW', '58321': 'MROW', '58323': 'MROW', '58324': 'MROW', '58325': 'MROW', '58327': 'MROW', '58329': 'MROW', '58330': 'MROW', '58331': 'MROW', '58332': 'MROW', '58335': 'MROW', '58338': 'MROW', '58339': 'MROW', '58341': 'MROW', '58343': 'MROW', '58344': 'MROW', '58345': 'MROW', '58346': 'MROW', '58348': 'MROW', '58351': 'MROW', '58352': 'MROW', '58353': 'MROW', '58355': 'MROW', '58356': 'MROW', '58357': 'MROW', '58361': 'MROW', '58362': 'MROW', '58363': 'MROW', '58365': 'MROW', '58366': 'MROW', '58367': 'MROW', '58368': 'MROW', '58369': 'MROW', '58370': 'MROW', '58372': 'MROW', '58374': 'MROW', '58377': 'MROW', '58379': 'MROW', '58380': 'MROW', '58381': 'MROW', '58382': 'MROW', '58384': 'MROW', '58385': 'MROW', '58386': 'MROW', '58401': 'MROW', '58402': 'MROW', '58405': 'MROW', '58413': 'MROW', '58415': 'MROW', '58416': 'MROW', '58418': 'MROW', '58420': 'MROW', '58421': 'MROW', '58422': 'MROW', '58423': 'MROW', '58424': 'MROW', '58425': 'MROW', '58426': 'MROW', '58428': 'MROW', '58429': 'MROW', '58430': 'MROW', '58431': 'MROW', '58433': 'MROW', '58436': 'MROW', '58438': 'MROW', '58439': 'MROW', '58440': 'MROW', '58441': 'MROW', '58442': 'MROW', '58443': 'MROW', '58444': 'MROW', '58445': 'MROW', '58448': 'MROW', '58451': 'MROW', '58452': 'MROW', '58454': 'MROW', '58455': 'MROW', '58456': 'MROW', '58458': 'MROW', '58460': 'MROW', '58461': 'MROW', '58463': 'MROW', '58464': 'MROW', '58466': 'MROW', '58467': 'MROW', '58472': 'MROW', '58474': 'MROW', '58475': 'MROW', '58476': 'MROW', '58477': 'MROW', '58478': 'MROW', '58479': 'MROW', '58480': 'MROW', '58481': 'MROW', '58482': 'MROW', '58483': 'MROW', '58484': 'MROW', '58486': 'MROW', '58487': 'MROW', '58488': 'MROW', '58490': 'MROW', '58492': 'MROW', '58494': 'MROW', '58495': 'MROW', '58496': 'MROW', '58497': 'MROW', '58501': 'MROW', '58502': 'MROW', '58503': 'MROW', '58504': 'MROW', '58505': 'MROW', '58506': 'MROW', '58507': 'MROW', '58520': 'MROW', '58521': 'MROW', '58523': 'MROW', '58524': 'MROW', '58528': 'MROW', '58529': 'MROW', '58530': 'MROW', '58531': 'MROW', '58532': 'MROW', '58533': 'MROW', '58535': 'MROW', '58538': 'MROW', '58540': 'MROW', '58541': 'MROW', '58542': 'MROW', '58544': 'MROW', '58545': 'MROW', '58549': 'MROW', '58552': 'MROW', '58554': 'MROW', '58558': 'MROW', '58559': 'MROW', '58560': 'MROW', '58561': 'MROW', '58562': 'MROW', '58563': 'MROW', '58564': 'MROW', '58565': 'MROW', '58566': 'MROW', '58568': 'MROW', '58569': 'MROW', '58570': 'MROW', '58571': 'MROW', '58572': 'MROW', '58573': 'MROW', '58575': 'MROW', '58576': 'MROW', '58577': 'MROW', '58579': 'MROW', '58580': 'MROW', '58581': 'MROW', '58601': 'MROW', '58602': 'MROW', '58620': 'MROW', '58621': 'NWPP', '58622': 'MROW', '58623': 'MROW', '58625': 'MROW', '58626': 'MROW', '58627': 'MROW', '58630': 'MROW', '58631': 'MROW', '58632': 'MROW', '58634': 'MROW', '58636': 'MROW', '58638': 'MROW', '58639': 'MROW', '58640': 'MROW', '58641': 'MROW', '58642': 'MROW', '58643': 'MROW', '58644': 'MROW', '58645': 'MROW', '58646': 'MROW', '58647': 'MROW', '58649': 'MROW', '58650': 'MROW', '58651': 'MROW', '58652': 'MROW', '58653': 'MROW', '58654': 'MROW', '58655': 'MROW', '58656': 'MROW', '58701': 'MROW', '58702': 'MROW', '58703': 'MROW', '58704': 'MROW', '58705': 'MROW', '58707': 'MROW', '58710': 'MROW', '58711': 'MROW', '58712': 'MROW', '58713': 'MROW', '58716': 'MROW', '58718': 'MROW', '58721': 'MROW', '58722': 'MROW', '58723': 'MROW', '58725': 'MROW', '58727': 'MROW', '58730': 'MROW', '58731': 'MROW', '58733': 'MROW', '58734': 'MROW', '58735': 'MROW', '58736': 'MROW', '58737': 'MROW', '58740': 'MROW', '58741': 'MROW', '58744': 'MROW', '58746': 'MROW', '58748': 'MROW', '58750': 'MROW', '58752': 'MROW', '58755': 'MROW', '58756': 'MROW', '58757': 'MROW', '58758': 'MROW', '58759': 'MROW', '58760': 'MROW', '58761': 'MROW', '58762': 'MROW', '58763': 'MROW', '58765': 'MROW', '58768': 'MROW', '58769': 'MROW', '58770': 'MROW', '58771': 'MROW', '58772': 'MROW', '58773': 'MROW', '58775': 'MROW', '58776': 'MROW', '58778': 'MROW', '58779': 'MROW', '58781': 'MROW', '58782': 'MROW', '58783': 'MROW', '58784': 'MROW', '58785': 'MROW', '58787': 'MROW', '58788': 'MROW', '58789': 'MROW', '58790': 'MROW', '58792': 'MROW', '58793': 'MROW', '58794': 'MROW', '58795': 'MROW', '58801': 'NWPP', '58802': 'MROW', '58830': 'MROW', '58831': 'NWPP', '58833': 'MROW', '58835': 'MROW', '58838': 'NWPP', '58843': 'MROW', '58844': 'MROW', '58845': 'MROW', '58847': 'MROW', '58849': 'MROW', '58852': 'MROW', '58853': 'NWPP', '58854': 'MROW', '58856': 'MROW', '59001': 'NWPP', '59002': 'NWPP', '59003': 'RMPA', '59004': 'NWPP', '59006': 'NWPP', '59007': 'NWPP', '59008': 'NWPP', '59010': 'NWPP', '59011': 'NWPP', '59012': 'NWPP', '59013': 'NWPP', '59014': 'NWPP', '59015': 'NWPP', '59016': 'RMPA', '59018': 'NWPP', '59019': 'NWPP', '59020': 'NWPP', '59022': 'NWPP', '59024': 'NWPP', '59025': 'NWPP', '59026': 'NWPP', '59027': 'NWPP', '59028': 'NWPP', '59029': 'NWPP', '59030': 'NWPP', '59031': 'NWPP', '59032': 'NWPP', '59033': 'NWPP', '59034': 'NWPP', '59035': 'NWPP', '59036': 'NWPP', '59037': 'NWPP', '59038': 'NWPP', '59039': 'NWPP', '59041': 'NWPP', '59043': 'RMPA', '59044': 'NWPP', '59046': 'NWPP', '59047': 'NWPP', '59050': 'NWPP', '59052': 'NWPP', '59053': 'NWPP', '59054': 'NWPP', '59055': 'NWPP', '59057': 'NWPP', '59058': 'NWPP', '59059': 'NWPP', '59061': 'NWPP', '59062': 'NWPP', '59063': 'NWPP', '59064': 'NWPP', '59065': 'NWPP', '59066': 'NWPP', '59067': 'NWPP', '59068': 'NWPP', '59069': 'NWPP', '59070': 'NWPP', '59071': 'NWPP', '59072': 'NWPP', '59073': 'NWPP', '59074': 'NWPP', '59075': 'NWPP', '59076': 'NWPP', '59077': 'NWPP', '59078': 'NWPP', '59079': 'NWPP', '59081': 'NWPP', '59082': 'NWPP', '59083': 'NWPP', '59084': 'NWPP', '59085': 'NWPP', '59086': 'NWPP', '59087': 'NWPP', '59088': 'NWPP', '59089': 'NWPP', '59101': 'NWPP', '59102': 'NWPP', '59103': 'NWPP', '59104': 'NWPP', '59105': 'NWPP', '59106': 'NWPP', '59107': 'NWPP', '59108': 'NWPP', '59111': 'NWPP', '59112': 'NWPP', '59114': 'NWPP', '59115': 'NWPP', '59116': 'NWPP', '59117': 'NWPP', '59201': 'MROW', '59211': 'NWPP', '59212': 'NWPP', '59213': 'MROW', '59214': 'NWPP', '59215': 'MROW', '59217': 'NWPP', '59218': 'NWPP', '59219': 'MROW', '59221': 'NWPP', '59222': 'NWPP', '59223': 'NWPP', '59225': 'MROW', '59226': 'MROW', '59230': 'NWPP', '59231': 'MROW', '59240': 'NWPP', '59241': 'NWPP', '59242': 'MROW', '59243': 'NWPP', '59244': 'NWPP', '59247': 'MROW', '59248': 'MROW', '59250': 'NWPP', '59252': 'NWPP', '59253': 'NWPP', '59254': 'MROW', '59255': 'NWPP', '59256': 'NWPP', '59257': 'NWPP', '59258': 'MROW', '59259': 'NWPP', '59260': 'NWPP', '59261': 'NWPP', '59262': 'NWPP', '59263': 'NWPP', '59270': 'NWPP', '59273': 'NWPP', '59274': 'NWPP', '59275': 'NWPP', '59276': 'NWPP', '59301': 'MROW', '59311': 'RMPA', '59312': 'MROW', '59313': 'MROW', '59314': 'RMPA', '59315': 'NWPP', '59316': 'MROW', '59317': 'RMPA', '59318': 'NWPP', '59319': 'MROW', '59322': 'NWPP', '59323': 'NWPP', '59324': 'MROW', '59326': 'MROW', '59327': 'MROW', '59330': 'NWPP', '59332': 'MROW', '59333': 'MROW', '59336': 'MROW', '59337': 'NWPP', '59338': 'MROW', '59339': 'MROW', '59341': 'MROW', '59343': 'NWPP', '59344': 'MROW', '59345': 'MROW', '59347': 'MROW', '59349': 'MROW', '59351': 'NWPP', '59353': 'NWPP', '59354': 'MROW', '59401': 'NWPP', '59402': 'NWPP', '59403': 'NWPP', '59404': 'NWPP', '59405': 'NWPP', '59406': 'NWPP', '59410': 'NWPP', '59411': 'NWPP', '59412': 'NWPP', '59414': 'NWPP', '59416': 'NWPP', '59417': 'NWPP', '59418': 'NWPP', '59419': 'NWPP', '59420': 'NWPP', '59421': 'NWPP', '59422': 'NWPP', '59424': 'NWPP', '59425': 'NWPP', '59427': 'NWPP', '59430': 'NWPP', '59432': 'NWPP', '59433': 'NWPP', '59434': 'NWPP', '59435': 'NWPP', '59436': 'NWPP', '59440': 'NWPP', '59441': 'NWPP', '59442': 'NWPP', '59443': 'NWPP', '59444': 'NWPP', '59446': 'NWPP', '59447': 'NWPP', '59448': 'NWPP', '59450': 'NWPP', '59451': 'NWPP', '59452': 'NWPP', '59453': 'NWPP', '59454': 'NWPP', '59456': 'NWPP', '59457': 'NWPP', '59460': 'NWPP', '59461': 'NWPP', '59462': 'NWPP', '59463': 'NWPP', '59464': 'NWPP', '59465': 'NWPP', '59466': 'NWPP', '59467': 'NWPP', '59468': 'NWPP', '59469': 'NWPP', '59471': 'NWPP', '59472': 'NWPP', '59474': 'NWPP', '59477': 'NWPP', '59479': 'NWPP', '59480': 'NWPP', '59482': 'NWPP', '59483': 'NWPP', '59484': 'NWPP', '59485': 'NWPP', '59486': 'NWPP', '59487': 'NWPP', '59489': 'NWPP', '59501': 'NWPP', '59520': 'NWPP', '59521': 'NWPP', '59522': 'NWPP', '59523': 'NWPP', '59524': 'NWPP', '59525': 'NWPP', '59526': 'NWPP', '59527': 'NWPP', '59528': 'NWPP', '59529': 'NWPP', '59530': 'NWPP', '59531': 'NWPP', '59532': 'NWPP', '59535': 'NWPP', '59537': 'NWPP', '59538': 'NWPP', '59540': 'NWPP', '59542': 'NWPP', '59544': 'NWPP', '59545': 'NWPP', '59546': 'NWPP', '59547': 'NWPP', '59601': 'NWPP', '59602': 'NWPP', '59604': 'NWPP', '59620': 'NWPP', '59623': 'NWPP', '59624': 'NWPP', '59625': 'NWPP', '59626': 'NWPP', '59631': 'NWPP', '59632': 'NWPP', '59633': 'NWPP', '59634': 'NWPP', '59635': 'NWPP', '59636': 'NWPP', '59638': 'NWPP', '59639': 'NWPP', '59640': 'NWPP', '59641': 'NWPP', '59642': 'NWPP', '59643': 'NWPP', '59644': 'NWPP', '59645': 'NWPP', '59647': 'NWPP', '59648': 'NWPP', '59701': 'NWPP', '59702': 'NWPP', '59703': 'NWPP', '59707': 'NWPP', '59710': 'NWPP', '59711': 'NWPP', '59713': 'NWPP', '59714': 'NWPP', '59715': 'NWPP', '59716': 'NWPP', '59717': 'NWPP', '59718': 'NWPP', '59719': 'NWPP', '59720': 'NWPP', '59721': 'NWPP', '59722': 'NWPP', '59724': 'NWPP', '59725': 'NWPP', '59727': 'NWPP', '59728': 'NWPP', '59729': 'NWPP', '59730': 'NWPP', '59731': 'NWPP', '59732': 'NWPP', '59733': 'NWPP', '59735': 'NWPP', '59736': 'NWPP', '59739': 'NWPP', '59740': 'NWPP', '59741': 'NWPP', '59743': 'NWPP', '59745': 'NWPP', '59746': 'NWPP', '59747': 'NWPP', '59748': 'NWPP', '59749': 'NWPP', '59750': 'NWPP', '59751': 'NWPP', '59752': 'NWPP', '59754': 'NWPP', '59755': 'NWPP', '59756': 'NWPP', '59758': 'NWPP', '59759': 'NWPP', '59760': 'NWPP', '59761': 'NWPP', '59762': 'NWPP', '59771': 'NWPP', '59772': 'NWPP', '59801': 'NWPP', '59802': 'NWPP', '59803': 'NWPP', '59804': 'NWPP', '59806': 'NWPP', '59807': 'NWPP', '59808': 'NWPP', '59812': 'NWPP', '59820': 'NWPP', '59821': 'NWPP', '59823': 'NWPP', '59824': 'NWPP', '59825': 'NWPP', '59826': 'NWPP', '59827': 'NWPP', '59828': 'NWPP', '59829': 'NWPP', '59830': 'NWPP', '59831': 'NWPP', '59832': 'NWPP', '59833': 'NWPP', '59834': 'NWPP', '59835': 'NWPP', '59837': 'NWPP', '59840': 'NWPP', '59841': 'NWPP', '59842': 'NWPP', '59843': 'NWPP', '59844': 'NWPP', '59845': 'NWPP', '59846': 'NWPP', '59847': 'NWPP', '59848': 'NWPP', '59851': 'NWPP', '59853': 'NWPP', '59854': 'NWPP', '59855': 'NWPP', '59856': 'NWPP', '59858': 'NWPP', '59859': 'NWPP', '59860': 'NWPP', '59863': 'NWPP', '59864': 'NWPP', '59865': 'NWPP', '59866': 'NWPP', '59867': 'NWPP', '59868': 'NWPP', '59870': 'NWPP', '59871': 'NWPP', '59872': 'NWPP', '59873': 'NWPP', '59874': 'NWPP', '59875': 'NWPP', '59901': 'NWPP', '59903': 'NWPP', '59904': 'NWPP', '59910': 'NWPP', '59911': 'NWPP', '59912': 'NWPP', '59913': 'NWPP', '59914': 'NWPP', '59915': 'NWPP', '59916': 'NWPP', '59917': 'NWPP', '59918': 'NWPP', '59919': 'NWPP', '59920': 'NWPP', '59921': 'NWPP', '59922': 'NWPP', '59923': 'NWPP', '59925': 'NWPP', '59926': 'NWPP', '59927': 'NWPP', '59928': 'NWPP', '59929': 'NWPP', '59930': 'NWPP', '59931': 'NWPP', '59932': 'NWPP', '59933': 'NWPP', '59934': 'NWPP', '59935': 'NWPP', '59936': 'NWPP', '59937': 'NWPP', '60001': 'RFCW', '60002': 'RFCW', '60004': 'RFCW', '60005': 'RFCW', '60006': 'RFCW', '60007': 'RFCW', '60008': 'RFCW', '60009': 'RFCW', '60010': 'RFCW', '60011': 'RFCW', '60012': 'RFCW', '60013': 'RFCW', '60014': 'RFCW', '60015': 'RFCW', '60016': 'RFCW', '60017': 'RFCW', '60018': 'RFCW', '60019': 'RFCW', '60020': 'RFCW', '60021': 'RFCW', '60022': 'RFCW', '60025': 'RFCW', '60026': 'RFCW', '60029': 'RFCW', '60030': 'RFCW', '60031': 'RFCW', '60033': 'RFCW', '60034': 'RFCW', '60035': 'RFCW', '60037': 'RFCW', '60038': 'RFCW', '60039': 'RFCW', '60040': 'RFCW', '60041': 'RFCW', '60042': 'RFCW', '60043': 'RFCW', '60044': 'RFCW', '60045': 'RFCW', '60046': 'RFCW', '60047': 'RFCW', '60048': 'RFCW', '60049': 'RFCW', '60050': 'RFCW', '60051': 'RFCW', '60053': 'RFCW', '60055': 'RFCW', '60056': 'RFCW', '60060': 'RFCW', '60061': 'RFCW', '60062': 'RFCW', '60064': 'RFCW', '60065': 'RFCW', '60067': 'RFCW', '60068': 'RFCW', '60069': 'RFCW', '60070': 'RFCW', '60071': 'RFCW', '60072': 'RFCW', '60073': 'RFCW', '60074': 'RFCW', '60075': 'RFCW', '60076': 'RFCW', '60077': 'RFCW', '60078': 'RFCW', '60079': 'RFCW', '60081': 'RFCW', '60082': 'RFCW', '60083': 'RFCW', '60084': 'RFCW', '60085': 'RFCW', '60086': 'RFCW', '60087': 'RFCW', '60088': 'RFCW', '60089': 'RFCW', '60090': 'RFCW', '60091': 'RFCW', '60092': 'RFCW', '60093': 'RFCW', '60094': 'RFCW', '60095': 'RFCW', '60096': 'RFCW', '60097': 'RFCW', '60098': 'RFCW', '60099': 'RFCW', '60101': 'RFCW', '60102': 'RFCW', '60103': 'RFCW', '60104': 'RFCW', '60105': 'RFCW', '60106': 'RFCW', '60107': 'RFCW', '60108': 'RFCW', '60109': 'RFCW', '60110': 'RFCW', '60111': 'RFCW', '60112': 'RFCW', '60113': 'RFCW', '60115': 'RFCW', '60116': 'RFCW', '60117': 'RFCW', '60118': 'RFCW', '60119': 'RFCW', '60120': 'RFCW', '60121': 'RFCW', '60122': 'RFCW', '60123': 'RFCW', '60124': 'RFCW', '60126': 'RFCW', '60128': 'RFCW', '60129': 'RFCW', '60130': 'RFCW', '60131': 'RFCW', '60132': 'RFCW', '60133': 'RFCW', '60134': 'RFCW', '60135': 'RFCW', '60136': 'RFCW', '60137': 'RFCW', '60138': 'RFCW', '60139': 'RFCW', '60140': 'RFCW', '60141': 'RFCW', '60142': 'RFCW', '60143': 'RFCW', '60144': 'RFCW', '60145': 'RFCW', '60146': 'RFCW', '60147': 'RFCW', '60148': 'RFCW', '60150': 'RFCW', '60151': 'RFCW', '60152': 'RFCW', '60153': 'RFCW', '60154': 'RFCW', '60155': 'RFCW', '60156': 'RFCW', '60157': 'RFCW', '60159': 'RFCW', '60160': 'RFCW', '60161': 'RFCW', '60162': 'RFCW', '60163': 'RFCW', '60164': 'RFCW', '60165': 'RFCW', '60168': 'RFCW', '60169': 'RFCW', '60170': 'RFCW', '60171': 'RFCW', '60172': 'RFCW', '60173': 'RFCW', '60174': 'RFCW', '60175': 'RFCW', '60176': 'RFCW', '60177': 'RFCW', '60178': 'RFCW', '60179': 'RFCW', '60180': 'RFCW', '60181': 'RFCW', '60183': 'RFCW', '60184': 'RFCW', '60185': 'RFCW', '60186': 'RFCW', '60187': 'RFCW', '60188': 'RFCW', '60189': 'RFCW', '60190': 'RFCW', '60191': 'RFCW', '60192': 'RFCW', '60193': 'RFCW', '60194': 'RFCW', '60195': 'RFCW', '60196': 'RFCW', '60197': 'RFCW', '60199': 'RFCW', '60201': 'RFCW', '60202': 'RFCW', '60203': 'RFCW', '60204': 'RFCW', '60208': 'RFCW', '60209': 'RFCW', '60290': 'RFCW', '60301': 'RFCW', '60302': 'RFCW', '60303': 'RFCW', '60304': 'RFCW', '60305': 'RFCW', '60399': 'RFCW', '60401': 'RFCW', '60402': 'RFCW', '60403': 'RFCW', '60404': 'RFCW', '60406': 'RFCW', '60407': 'RFCW', '60408': 'RFCW', '60409': 'RFCW', '60410': 'RFCW', '60411': 'RFCW', '60412': 'RFCW', '60415': 'RFCW', '60416': 'RFCW', '60417': 'RFCW', '60418': 'RFCW', '60419': 'RFCW', '60420': 'RFCW', '60421': 'RFCW', '60422': 'RFCW', '60423': 'RFCW', '60424': 'RFCW', '60425': 'RFCW', '60426': 'RFCW', '60428': 'RFCW', '60429': 'RFCW', '60430': 'RFCW', '60431': 'RFCW', '60432': 'RFCW', '60433': 'RFCW', '60434': 'RFCW', '60435': 'RFCW', '60436': 'RFCW', '60437': 'RFCW', '60438': 'RFCW', '60439': 'RFCW', '60440': 'RFCW', '60441': 'RFCW', '60442': 'RFCW', '60443': 'RFCW', '60444': 'RFCW', '60445': 'RFCW', '60446': 'RFCW', '60447': 'RFCW', '60448': 'RFCW', '60449': 'RFCW', '60450': 'RFCW', '60451': 'RFCW', '60452': 'RFCW', '60453': 'RFCW', '60454': 'RFCW', '60455': 'RFCW', '60456': 'RFCW', '60457': 'RFCW', '60458': 'RFCW', '60459': 'RFCW', '60460': 'RFCW', '60461': 'RFCW', '60462': 'RFCW', '60463': 'RFCW', '60464': 'RFCW', '60465': 'RFCW', '60466': 'RFCW', '60467': 'RFCW', '60468': 'RFCW', '60469': 'RFCW', '60470': 'RFCW', '60471': 'RFCW', '60472': 'RFCW', '60473': 'RFCW', '60474': 'RFCW', '60475': 'RFCW', '60476': 'RFCW', '60477': 'RFCW', '60478': 'RFCW', '60479': 'RFCW', '60480': 'RFCW', '60481': 'RFCW', '60482': 'RFCW', '60484': 'RFCW', '60487': 'RFCW', '60490': 'RFCW', '60491': 'RFCW', '60499': 'RFCW', '60501': 'RFCW', '60502': 'RFCW', '60503': 'RFCW', '60504': 'RFCW', '60505': 'RFCW', '60506': 'RFCW', '60507': 'RFCW', '60510': 'RFCW', '60511': 'RFCW', '60512': 'RFCW', '60513': 'RFCW', '60514': 'RFCW', '60515': 'RFCW', '60516': 'RFCW', '60517': 'RFCW', '60518': 'SRMW', '60519': 'RFCW', '60520': 'RFCW', '60521': 'RFCW', '60522': 'RFCW', '60523': 'RFCW', '60525': 'RFCW', '60526': 'RFCW', '60527': 'RFCW', '60530': 'RFCW', '60531': 'SRMW', '60532': 'RFCW', '60534': 'RFCW', '60536': 'SRMW', '60537': 'SRMW', '60538': 'RFCW', '60539': 'RFCW', '60540': 'RFCW', '60541': 'SRMW', '60542': 'RFCW', '60543': 'RFCW', '60544': 'RFCW', '60545': 'SRMW', '60546': 'RFCW', '60548': 'SRMW', '60549': 'SRMW', '60550': 'RFCW', '60551': 'SRMW', '60552': 'RFCW', '60553': 'RFCW', '60554': 'RFCW', '60555': 'RFCW', '60556': 'RFCW', '60557': 'SRMW', '60558': 'RFCW', '60559': 'RFCW', '60560': 'SRMW', '60561': 'RFCW', '60563': 'RFCW', '60564': 'RFCW', '60565': 'RFCW', '60566': 'RFCW', '60567': 'RFCW', '60568': 'RFCW', '60572': 'RFCW', '60585': 'RFCW', '60586': 'RFCW', '60598': 'RFCW', '60599': 'RFCW', '60601': 'RFCW', '60602': 'RFCW', '60603': 'RFCW', '60604': 'RFCW', '60605': 'RFCW', '60606': 'RFCW', '60607': 'RFCW', '60608': 'RFCW', '60609': 'RFCW', '60610': 'RFCW', '60611': 'RFCW', '60612': 'RFCW', '60613': 'RFCW', '60614': 'RFCW', '60615': 'RFCW', '60616': 'RFCW', '60617': 'RFCW', '60618': 'RFCW', '60619': 'RFCW', '60620': 'RFCW', '60621': 'RFCW', '60622': 'RFCW', '60623': 'RFCW', '60624': 'RFCW', '60625': 'RFCW', '60626': 'RFCW', '60628': 'RFCW', '60629': 'RFCW', '60630': 'RFCW', '60631': 'RFCW', '60632': 'RFCW', '60633': 'RFCW', '60634': 'RFCW', '60636': 'RFCW', '60637': 'RFCW', '60638': 'RFCW', '60639': 'RFCW', '60640': 'RFCW', '60641': 'RFCW', '60642': 'RFCW', '60643': 'RFCW', '60644': 'RFCW', '60645': 'RFCW', '60646': 'RFCW', '60647': 'RFCW', '60649': 'RFCW', '60651': 'RFCW', '60652': 'RFCW', '60653': 'RFCW', '60654': 'RFCW', '60655': 'RFCW', '60656': 'RFCW', '60657': 'RFCW', '60659': 'RFCW', '60660': 'RFCW', '60661': 'RFCW', '60664': 'RFCW', '60666': 'RFCW', '60668': 'RFCW', '60669': 'RFCW', '60670': 'RFCW', '60673': 'RFCW', '60674': 'RFCW', '60675': 'RFCW', '60677': 'RFCW', '60678': 'RFCW', '60680': 'RFCW', '60681': 'RFCW', '60682': 'RFCW', '60684': 'RFCW', '60685': 'RFCW', '60686': 'RFCW', '60687': 'RFCW', '60688': 'RFCW', '60689': 'RFCW', '60690': 'RFCW', '60691': 'RFCW', '60693': 'RFCW', '60694': 'RFCW', '60695': 'RFCW', '60696': 'RFCW', '60697': 'RFCW', '60699': 'RFCW', '60701': 'RFCW', '60706': 'RFCW', '60707': 'RFCW', '60712': 'RFCW', '60714': 'RFCW', '60803': 'RFCW', '60804': 'RFCW', '60805': 'RFCW', '60827': 'RFCW', '60901': 'RFCW', '60910': 'RFCW', '60911': 'SRMW', '60912': 'SRMW', '60913': 'RFCW', '60914': 'RFCW', '60915': 'RFCW', '60917': 'RFCW', '60918': 'SRMW', '60919': 'RFCW', '60920': 'RFCW', '60921': 'SRMW', '60922': 'SRMW', '60924': 'SRMW', '60926': 'SRMW', '60927': 'SRMW', '60928': 'SRMW', '60929': 'SRMW', '60930': 'SRMW', '60931': 'SRMW', '60932': 'SRMW', '60933': 'SRMW', '60934': 'RFCW', '60935': 'RFCW', '60936': 'SRMW', '60938': 'SRMW', '60939': 'SRMW', '60940': 'RFCW', '60941': 'SRMW', '60942': 'SRMW', '60944': 'RFCW', '60945': 'SRMW', '60946': 'SRMW', '60948': 'SRMW', '60949': 'SRMW', '60950': 'RFCW', '60951': 'SRMW', '60952': 'SRMW', '60953': 'SRMW', '60954': 'RFCW', '60955': 'SRMW', '60956': 'SRMW', '60957': 'SRMW', '60958': 'SRMW', '60959': 'SRMW', '60960': 'SRMW', '60961': 'RFCW', '60962': 'SRMW', '60963': 'SRMW', '60964': 'SRMW', '60966': 'SRMW', '60967': 'SRMW', '60968': 'SRMW', '60969': 'RFCW', '60970': 'SRMW', '60973': 'SRMW', '60974': 'SRMW', '61001': 'RFCW', '61006': 'RFCW', '61007': 'RFCW', '61008': 'RFCW', '61010': 'RFCW', '61011': 'RFCW', '61012': 'RFCW', '61013': 'RFCW', '61014': 'RFCW', '61015': 'RFCW', '61016': 'RFCW', '61018': 'RFCW', '61019': 'RFCW', '61020': 'RFCW', '61021': 'RFCW', '61024': 'RFCW', '61025': 'RFCW', '61027': 'RFCW', '61028': 'RFCW', '61030': 'RFCW', '61031': 'RFCW', '61032': 'RFCW', '61036': 'RFCW', '61037': 'RFCW', '61038': 'RFCW', '61039': 'RFCW', '61041': 'RFCW', '61042': 'RFCW', '61043': 'RFCW', '61044': 'RFCW', '61046': 'RFCW', '61047': 'RFCW', '61048': 'RFCW', '61049': 'RFCW', '61050': 'RFCW', '61051': 'RFCW', '61052': 'RFCW', '61053': 'RFCW', '61054': 'RFCW', '61057': 'RFCW', '61059': 'RFCW', '61060': 'RFCW', '61061': 'RFCW', '61062': 'RFCW', '61063': 'RFCW', '61064': 'RFCW', '61065': 'RFCW', '61067': 'RFCW', '61068': 'RFCW', '61070': 'RFCW', '61071': 'RFCW', '61072': 'RFCW', '61073': 'RFCW', '61074': 'RFCW', '61075': 'RFCW', '61077': 'RFCW', '61078': 'RFCW', '61079': 'RFCW', '61080': 'RFCW', '61081': 'RFCW', '61084': 'RFCW', '61085': 'RFCW', '61087': 'RFCW', '61088': 'RFCW', '61089': 'RFCW', '61091': 'RFCW', '61101': 'RFCW', '61102': 'RFCW', '61103': 'RFCW', '61104': 'RFCW', '61105': 'RFCW', '61106': 'RFCW', '61107': 'RFCW', '61108': 'RFCW', '61109': 'RFCW', '61110': 'RFCW', '61111': 'RFCW', '61112': 'RFCW', '61114': 'RFCW', '61115': 'RFCW', '61125': 'RFCW', '61126': 'RFCW', '61130': 'RFCW', '61131': 'RFCW', '61132': 'RFCW', '61201': 'MROW', '61204': 'MROW', '61230': 'RFCW', '61231': 'SRMW', '61232': 'MROW', '61233': 'MROW', '61234': 'SRMW', '61235': 'SRMW', '61236': 'MROW', '61237': 'MROW', '61238': 'SRMW', '61239': 'MROW', '61240': 'MROW', '61241': 'MROW', '61242': 'RFCW', '61243': 'RFCW', '61244': 'MROW', '61250': 'RFCW', '61251': 'RFCW', '61252': 'RFCW', '61254': 'SRMW', '61256': 'MROW', '61257': 'RFCW', '61258': 'RFCW', '61259': 'SRMW', '61260': 'SRMW', '61261': 'RFCW', '61262': 'MROW', '61263': 'MROW', '61264': 'MROW', '61265': 'MROW', '61266': 'MROW', '61270': 'RFCW', '61272': 'SRMW', '61273': 'MROW', '61274': 'MROW', '61275': 'MROW', '61276': 'MROW', '61277': 'SRMW', '61278': 'MROW', '61279': 'MROW', '61281': 'SRMW', '61282': 'MROW', '61283': 'SRMW', '61284': 'MROW', '61285': 'RFCW', '61299': 'MROW', '61301': 'SRMW', '61310': 'RFCW', '61311': 'RFCW', '61312': 'SRMW', '61313': 'RFCW', '61314': 'SRMW', '61315': 'SRMW', '61316': 'SRMW', '61317': 'SRMW', '61318': 'RFCW', '61319': 'RFCW', '61320': 'SRMW', '61321': 'RFCW', '61322': 'SRMW', '61323': 'SRMW', '61324': 'RFCW', '61325': 'SRMW', '61326': 'SRMW', '61327': 'SRMW', '61328': 'SRMW', '61329': 'SRMW', '61330': 'SRMW', '61331': 'RFCW', '61332': 'RFCW', '61333': 'RFCW', '61334': 'SRMW', '61335': 'SRMW', '61336': 'SRMW', '61337': 'SRMW', '61338': 'SRMW', '61340': 'SRMW', '61341': 'SRMW', '61342': 'SRMW', '61344': 'SRMW', '61345': 'SRMW', '61346': 'SRMW', '61348': 'SRMW', '61349': 'SRMW', '61350': 'SRMW', '61353': 'RFCW', '61354': 'SRMW', '61356': 'SRMW', '61358': 'RFCW', '61359': 'SRMW', '61360': 'RFCW', '61361': 'SRMW', '61362': 'SRMW', '61363': 'SRMW', '61364': 'RFCW', '61367': 'SRMW', '61368': 'SRMW', '61369': 'SRMW', '61370': 'SRMW', '61371': 'SRMW', '61372': 'SRMW', '61373': 'SRMW', '61374': 'SRMW', '61375': 'SRMW', '61376': 'SRMW', '61377': 'RFCW', '61378': 'RFCW', '61379': 'SRMW', '61401': 'SRMW', '61402': 'SRMW', '61410': 'SRMW', '61411': 'SRMW', '61412': 'SRMW', '61413': 'SRMW', '61414': 'SRMW', '61415': 'SRMW', '61416': 'SRMW', '61417': 'SRMW', '61418': 'SRMW', '61419': 'SRMW', '61420': 'SRMW', '61421': 'SRMW', '61422': 'SRMW', '61423': 'SRMW', '61424': 'SRMW', '61425': 'SRMW', '61426': 'SRMW', '61427': 'SRMW', '61428': 'SRMW', '61430': 'SRMW', '61431': 'SRMW', '61432': 'SRMW', '61433': 'SRMW', '61434': 'SRMW', '61435': 'SRMW', '61436': 'SRMW', '61437': 'SRMW', '61438': 'SRMW', '61439': 'SRMW', '61440': 'SRMW', '61441': 'SRMW', '61442': 'SRMW', '61443': 'SRMW', '61447': 'SRMW', '61448': 'SRMW', '61449': 'SRMW', '61450': 'SRMW', '61451': 'SRMW', '61452': 'SRMW', '61453': 'SRMW', '61454': 'SRMW', '61455': 'SRMW', '61458': 'SRMW', '61459': 'SRMW', '61460': 'SRMW', '61462': 'SRMW', '61465': 'SRMW', '61466': 'SRMW', '61467': 'SRMW', '61468': 'MROW', '61469': 'SRMW', '61470': 'SRMW', '61471': 'SRMW', '61472': 'SRMW', '61473': 'SRMW', '61474': 'SRMW', '61475': 'SRMW', '61476': 'SRMW', '61477': 'SRMW', '61478': 'SRMW', '61479': 'SRMW', '61480': 'SRMW', '61482': 'SRMW', '61483': 'SRMW', '61484': 'SRMW', '61485': 'SRMW', '61486': 'SRMW', '61488': 'SRMW', '61489': 'SRMW', '61490': 'SRMW', '61491': 'SRMW', '61501': 'SRMW', '61516': 'SRMW', '61517': 'SRMW', '61519': 'SRMW', '61520': 'SRMW', '61523': 'SRMW', '61524': 'SRMW', '61525': 'SRMW', '61526': 'SRMW', '61528': 'SRMW', '61529': 'SRMW', '61530': 'SRMW', '61531': 'SRMW', '61532': 'SRMW', '61533': 'SRMW', '61534': 'SRMW', '61535': 'SRMW', '61536': 'SRMW', '61537': 'SRMW', '61539': 'SRMW', '61540': 'SRMW', '61541': 'SRMW', '61542': 'SRMW', '61543': 'SRMW', '61544': 'SRMW', '61545': 'SRMW', '61546': 'SRMW', '61547': 'SRMW', '61548': 'SRMW', '61550': 'SRMW', '61552': 'SRMW', '61553': 'SRMW', '61554': 'SRMW', '61555': 'SRMW', '61558': 'SRMW', '61559': 'SRMW', '61560': 'SRMW', '61561': 'SRMW', '61562': 'SRMW', '61563': 'SRMW', '61564': 'SRMW', '61565': 'SRMW', '61567': 'SRMW', '61568': 'SRMW', '61569': 'SRMW', '61570': 'SRMW', '61571': 'SRMW', '61572': 'SRMW', '61601': 'SRMW', '61602': 'SRMW', '61603': 'SRMW', '61604': 'SRMW', '61605': 'SRMW', '61606': 'SRMW', '61607': 'SRMW', '61610': 'SRMW', '61611': 'SRMW', '61612': 'SRMW', '61613': 'SRMW', '61614': 'SRMW', '61615': 'SRMW', '61616': 'SRMW', '61625': 'SRMW', '61629': 'SRMW', '61630': 'SRMW', '61633': 'SRMW', '61634': 'SRMW', '61635': 'SRMW', '61636': 'SRMW', '61637': 'SRMW', '61638': 'SRMW', '61639': 'SRMW', '61641': 'SRMW', '61643': 'SRMW', '61650': 'SRMW', '61651': 'SRMW', '61652': 'SRMW', '61653': 'SRMW', '61654': 'SRMW', '61655': 'SRMW', '61656': 'SRMW', '61701': 'SRMW', '61702': 'SRMW', '61704': 'SRMW', '61705': 'SRMW', '61709': 'SRMW', '61710': 'SRMW', '61720': 'SRMW', '61721': 'SRMW', '61722': 'SRMW', '61723': 'SRMW', '61724': 'SRMW', '61725': 'SRMW', '61726': 'SRMW', '61727': 'SRMW', '61728': 'SRMW', '61729': 'SRMW', '61730': 'SRMW', '61731': 'SRMW', '61732': 'SRMW', '61733': 'SRMW', '61734': 'SRMW', '61735': 'SRMW', '61736': 'SRMW', '61737': 'SRMW', '61738': 'SRMW', '61739': 'SRMW', '61740': 'SRMW', '61741': 'SRMW', '61742': 'SRMW', '61743': 'SRMW', '61744': 'SRMW', '61745': 'SRMW', '61747': 'SRMW', '61748': 'SRMW', '61749': 'SRMW', '61750': 'SRMW', '61751': 'SRMW', '61752': 'SRMW', '61753': 'SRMW', '61754': 'SRMW', '61755': 'SRMW', '61756': 'SRMW', '61758': 'SRMW', '61759': 'SRMW', '61760': 'SRMW', '61761': 'SRMW', '61764': 'SRMW', '61769': 'SRMW', '61770': 'SRMW', '61771': 'SRMW', '61772': 'SRMW', '61773': 'SRMW', '61774': 'SRMW', '61775': 'SRMW', '61776': 'SRMW', '61777': 'SRMW', '61778': 'SRMW', '61790': 'SRMW', '61791': 'SRMW', '61799': 'SRMW', '61801': 'SRMW', '61802': 'SRMW', '61803': 'SRMW', '61810': 'SRMW', '61811': 'SRMW', '61812': 'SRMW', '61813': 'SRMW', '61814': 'SRMW', '61815': 'SRMW', '61816': 'SRMW', '61817': 'SRMW', '61818': 'SRMW', '61820': 'SRMW', '61821': 'SRMW', '61822': 'SRMW', '61824': 'SRMW', '61825': 'SRMW', '61826': 'SRMW', '61830': 'SRMW', '61831': 'SRMW', '61832': 'SRMW', '61833': 'SRMW', '61834': 'SRMW', '61839': 'SRMW', '61840': 'SRMW', '61841': 'SRMW', '61842': 'SRMW', '61843': 'SRMW', '61844': 'SRMW', '61845': 'SRMW', '61846': 'SRMW', '61847': 'SRMW', '61848': 'SRMW', '61849': 'SRMW', '61850': 'SRMW', '61851': 'SRMW', '61852': 'SRMW', '61853': 'SRMW', '61854': 'SRMW', '61855': 'SRMW', '61856': 'SRMW', '61857': 'SRMW', '61858': 'SRMW', '61859': 'SRMW', '61862': 'SRMW', '61863': 'SRMW', '61864': 'SRMW', '61865': 'SRMW', '61866': 'SRMW', '61870': 'SRMW', '61871': 'SRMW', '61872': 'SRMW', '61873': 'SRMW', '61874': 'SRMW', '61875': 'SRMW', '61876': 'SRMW', '61877': 'SRMW', '61878': 'SRMW', '61880': 'SRMW', '61882': 'SRMW', '61883': 'SRMW', '61884': 'SRMW', '61910': 'SRMW', '61911': 'SRMW', '61912': 'SRMW', '61913': 'SRMW', '61914': 'SRMW', '61917': 'SRMW', '61919': 'SRMW', '61920': 'SRMW', '61924': 'SRMW', '61925': 'SRMW', '61928': 'SRMW', '61929': 'SRMW', '61930': 'SRMW', '61931': 'SRMW', '61932': 'SRMW', '61933': 'SRMW', '61936': 'SRMW', '61937': 'SRMW', '61938': 'SRMW', '61940': 'SRMW', '61941': 'SRMW', '61942': 'SRMW', '61943': 'SRMW', '61944': 'SRMW', '61949': 'SRMW', '61951': 'SRMW', '61953': 'SRMW', '61955': 'SRMW', '61956': 'SRMW', '61957': 'SRMW', '62001': 'SRMW', '62002': 'SRMW', '62006': 'SRMW', '62009': 'SRMW', '62010': 'SRMW', '62011': 'SRMW', '62012': 'SRMW', '62013': 'SRMW', '62014': 'SRMW', '62015': 'SRMW', '62016': 'SRMW', '62017': 'SRMW', '62018': 'SRMW', '62019': 'SRMW', '62021': 'SRMW', '62022': 'SRMW', '62023': 'SRMW', '62024': 'SRMW', '62025': 'SRMW', '62026': 'SRMW', '62027': 'SRMW', '62028': 'SRMW', '62030': 'SRMW', '62031': 'SRMW', '62032': 'SRMW', '62033': 'SRMW', '62034': 'SRMW', '62035': 'SRMW', '62036': 'SRMW', '62037': 'SRMW', '62040': 'SRMW', '62044': 'SRMW', '62045': 'SRMW', '62046': 'SRMW', '62047': 'SRMW', '62048': 'SRMW', '62049': 'SRMW', '62050': 'SRMW', '62051': 'SRMW', '62052': 'SRMW', '62053': 'SRMW', '62054': 'SRMW', '62056': 'SRMW', '62058': 'SRMW', '62059': 'SRMW', '62060': 'SRMW', '62061': 'SRMW', '62062': 'SRMW', '62063': 'SRMW', '62065': 'SRMW', '62067': 'SRMW', '62069': 'SRMW', '62070': 'SRMW', '62071': 'SRMW', '62074': 'SRMW', '62075': 'SRMW', '62076': 'SRMW', '62077': 'SRMW', '62078': 'SRMW', '62079': 'SRMW', '62080': 'SRMW', '62081': 'SRMW', '62082': 'SRMW', '62083': 'SRMW', '62084': 'SRMW', '62085': 'SRMW', '62086': 'SRMW', '62087': 'SRMW', '62088': 'SRMW', '62089': 'SRMW', '62090': 'SRMW', '62091': 'SRMW', '62092': 'SRMW', '62093': 'SRMW', '62094': 'SRMW', '62095': 'SRMW', '62097': 'SRMW', '62098': 'SRMW', '62201': 'SRMW', '62202': 'SRMW', '62203': 'SRMW', '62204': 'SRMW', '62205': 'SRMW', '62206': 'SRMW', '62207': 'SRMW', '62208': 'SRMW', '62214': 'SRMW', '62215': 'SRMW', '62216': 'SRMW', '62217': 'SRMW', '62218': 'SRMW', '62219': 'SRMW', '62220': 'SRMW', '62221': 'SRMW', '62222': 'SRMW', '62223': 'SRMW', '62225': 'SRMW', '62226': 'SRMW', '62230': 'SRMW', '62231': 'SRMW', '62232': 'SRMW', '62233': 'SRMW', '62234': 'SRMW', '62236': 'SRMW', '62237': 'SRMW', '62238': 'SRMW', '62239': 'SRMW', '62240': 'SRMW', '62241': 'SRMW', '62242': 'SRMW', '62243': 'SRMW', '62244': 'SRMW', '62245': 'SRMW', '62246': 'SRMW', '62247': 'SRMW', '62248': 'SRMW', '62249': 'SRMW', '62250': 'SRMW', '62252': 'SRMW', '62253': 'SRMW', '62254': 'SRMW', '62255': 'SRMW', '62256': 'SRMW', '62257': 'SRMW', '62258': 'SRMW', '62259': 'SRMW', '62260': 'SRMW', '62261': 'SRMW', '62262': 'SRMW', '62263': 'SRMW', '62264': 'SRMW', '62265': 'SRMW', '62266': 'SRMW', '62268': 'SRMW', '62269': 'SRMW', '62271': 'SRMW', '62272': 'SRMW', '62273': 'SRMW', '62274': 'SRMW', '62275': 'SRMW', '62277': 'SRMW', '62278': 'SRMW', '62279': 'SRMW', '62280': 'SRMW', '62281': 'SRMW', '62282': 'SRMW', '62284': 'SRMW', '62285': 'SRMW', '62286': 'SRMW', '62288': 'SRMW', '62289': 'SRMW', '62292': 'SRMW', '62293': 'SRMW', '62294': 'SRMW', '62295': 'SRMW', '62297': 'SRMW', '62298': 'SRMW', '62301': 'SRMW', '62305': 'SRMW', '62306': 'SRMW', '62311': 'SRMW', '62312': 'SRMW', '62313': 'SRMW', '62314': 'SRMW', '62316': 'SRMW', '62319': 'SRMW', '62320': 'SRMW', '62321': 'SRMW', '62323': 'SRMW', '62324': 'SRMW', '62325': 'SRMW', '62326': 'SRMW', '62329': 'SRMW', '62330': 'SRMW', '62334': 'SRMW', '62336': 'SRMW', '62338': 'SRMW', '62339': 'SRMW', '62340': 'SRMW', '62341': 'SRMW', '62343': 'SRMW', '62344': 'SRMW', '62345': 'SRMW', '62346': 'SRMW', '62347': 'SRMW', '62348': 'SRMW', '62349': 'SRMW', '62351': 'SRMW', '62352': 'SRMW', '62353': 'SRMW', '62354': 'SRMW', '62355': 'SRMW', '62356': 'SRMW', '62357': 'SRMW', '62358': 'SRMW', '62359': 'SRMW', '62360': 'SRMW', '62361': 'SRMW', '62362': 'SRMW', '62363': 'SRMW', '62365': 'SRMW', '62366': 'SRMW', '62367': 'SRMW', '62370': 'SRMW', '62373': 'SRMW', '62374': 'SRMW', '62375': 'SRMW', '62376': 'SRMW', '62378': 'SRMW', '62379': 'SRMW', '62380': 'SRMW', '62401': 'SRMW', '62410': 'SRMW', '62411': 'SRMW', '62413': 'SRMW', '62414': 'SRMW', '62417': 'SRMW', '62418': 'SRMW', '62419': 'SRMW', '62420': 'SRMW', '62421': 'SRMW', '62422': 'SRMW', '62423': 'SRMW', '62424': 'SRMW', '62425': 'SRMW', '62426': 'SRMW', '62427': 'SRMW', '62428': 'SRMW', '62431': 'SRMW', '62432': 'SRMW', '62433': 'SRMW', '62434': 'SRMW', '62435': 'SRMW', '62436': 'SRMW', '62438': 'SRMW', '62439': 'SRMW', '62440': 'SRMW', '62441': 'SRMW', '62442': 'SRMW', '62443': 'SRMW', '62444': 'SRMW', '62445': 'SRMW', '62446': 'SRMW', '62447': 'SRMW', '62448': 'SRMW', '62449': 'SRMW', '62450': 'SRMW', '62451': 'SRMW', '62452': 'SRMW', '62454': 'SRMW', '62458': 'SRMW', '62459': 'SRMW', '62460': 'SRMW', '62461': 'SRMW', '62462': 'SRMW', '62463': 'SRMW', '62464': 'SRMW', '62465': 'SRMW', '62466': 'SRMW', '62467': 'SRMW', '62468': 'SRMW', '62469': 'SRMW', '62471': 'SRMW', '62473': 'SRMW', '62474': 'SRMW', '62475': 'SRMW', '62476': 'SRMW', '62477': 'SRMW', '62478': 'SRMW', '62479': 'SRMW', '62480': 'SRMW', '62481': 'SRMW', '62501': 'SRMW', '62510': 'SRMW', '62512': 'SRMW', '62513': 'SRMW', '62514': 'SRMW', '62515': 'SRMW', '62517': 'SRMW', '62518': 'SRMW', '62519': 'SRMW', '62520': 'SRMW', '62521': 'SRMW', '62522': 'SRMW', '62523': 'SRMW', '62524': 'SRMW', '62525': 'SRMW', '62526': 'SRMW', '62530': 'SRMW', '62531': 'SRMW', '62532': 'SRMW', '62533': 'SRMW', '62534': 'SRMW', '62535': 'SRMW', '62536': 'SRMW', '62537': 'SRMW', '62538': 'SRMW', '62539': 'SRMW', '62540': 'SRMW', '62541': 'SRMW', '62543': 'SRMW', '62544': 'SRMW', '62545': 'SRMW', '62546': 'SRMW', '62547': 'SRMW', '62548': 'SRMW', '62549': 'SRMW', '62550': 'SRMW', '62551': 'SRMW', '62553': 'SRMW', '62554': 'SRMW', '62555': 'SRMW', '62556': 'SRMW', '62557': 'SRMW', '62558': 'SRMW', '62560': 'SRMW', '62561': 'SRMW', '62563': 'SRMW', '62565': 'SRMW', '62567': 'SRMW', '62568': 'SRMW', '62570': 'SRMW', '62571': 'SRMW', '62572': 'SRMW', '62573': 'SRMW', '62601': 'SRMW', '62610': 'SRMW', '62611': 'SRMW', '62612': 'SRMW', '62613': 'SRMW', '62615': 'SRMW', '62617': 'SRMW', '62618': 'SRMW', '62621': 'SRMW', '62622': 'SRMW', '62624': 'SRMW', '62625': 'SRMW', '62626': 'SRMW', '62627': 'SRMW', '62628': 'SRMW', '62629': 'SRMW', '62630': 'SRMW', '62631': 'SRMW', '62633': 'SRMW', '62634': 'SRMW', '62635': 'SRMW', '62638': 'SRMW', '62639': 'SRMW', '62640': 'SRMW', '62642': 'SRMW', '62643': 'SRMW', '62644': 'SRMW', '62649': 'SRMW', '62650': 'SRMW', '62651': 'SRMW', '62655': 'SRMW', '62656': 'SRMW', '62659': 'SRMW', '62660': 'SRMW', '62661': 'SRMW', '62662': 'SRMW', '62663': 'SRMW', '62664': 'SRMW', '62665': 'SRMW', '62666': 'SRMW', '62667': 'SRMW', '62668': 'SRMW', '62670': 'SRMW', '62671': 'SRMW', '62672': 'SRMW', '62673': 'SRMW', '62674': 'SRMW', '62675': 'SRMW', '62677': 'SRMW', '62681': 'SRMW', '62682': 'SRMW', '62683': 'SRMW', '62684': 'SRMW', '62685': 'SRMW', '62688': 'SRMW', '62689': 'SRMW', '62690': 'SRMW', '62691': 'SRMW', '62692': 'SRMW', '62693': 'SRMW', '62694': 'SRMW', '62695': 'SRMW', '62701': 'SRMW', '62702': 'SRMW', '62703': 'SRMW', '62704': 'SRMW', '62705': 'SRMW', '62706': 'SRMW', '62707': 'SRMW', '62708': 'SRMW', '62711': 'SRMW', '62712': 'SRMW', '62715': 'SRMW', '62716': 'SRMW', '62719': 'SRMW', '62721': 'SRMW', '62722': 'SRMW', '62723': 'SRMW', '62726': 'SRMW', '62736': 'SRMW', '62739': 'SRMW', '62746': 'SRMW', '62756': 'SRMW', '62757': 'SRMW', '62761': 'SRMW', '62762': 'SRMW', '62763': 'SRMW', '62764': 'SRMW', '62765': 'RFCW', '62766': 'SRMW', '62767': 'SRMW', '62769': 'SRMW', '62776': 'SRMW', '62777': 'SRMW', '62781': 'SRMW', '62786': 'SRMW', '62791': 'SRMW', '62794': 'SRMW', '62796': 'SRMW', '62801': 'SRMW', '62803': 'SRMW', '62805': 'SRMW', '62806': 'SRMW', '62807': 'SRMW', '62808': 'SRMW', '62809': 'SRMW', '62810': 'SRMW', '62811': 'SRMW', '62812': 'SRMW', '62814': 'SRMW', '62815': 'SRMW', '62816': 'SRMW', '62817': 'SRMW', '62818': 'SRMW', '62819': 'SRMW', '62820': 'SRMW', '62821': 'SRMW', '62822': 'SRMW', '62823': 'SRMW', '62824': 'SRMW', '62825': 'SRMW', '62827': 'SRMW', '62828': 'SRMW', '62829': 'MROW', '62830': 'SRMW', '62831': 'SRMW', '62832': 'SRMW', '62833': 'SRMW', '62834': 'SRMW', '62835': 'SRMW', '62836': 'SRMW', '62837': 'SRMW', '62838': 'SRMW', '62839': 'SRMW', '62840': 'MROW', '62841': 'SRMW', '62842': 'SRMW', '62843': 'SRMW', '62844': 'SRMW', '62846': 'SRMW', '62848': 'SRMW', '62849': 'SRMW', '62850': 'SRMW', '62851': 'SRMW', '62852': 'SRMW', '62853': 'SRMW', '62854': 'SRMW', '62855': 'SRMW', '62856': 'SRMW', '62857': 'SRMW', '62858': 'SRMW', '62859': 'SRMW', '62860': 'SRMW', '62861': 'SRMW', '62862': 'SRMW', '62863': 'SRMW', '62864': 'SRMW', '62865': 'SRMW', '62866': 'SRMW', '62867': 'SRMW', '62868': 'SRMW', '62869': 'SRMW', '62870': 'SRMW', '62871': 'SRMW', '62872': 'SRMW', '62874': 'SRMW', '62875': 'SRMW', '62876': 'SRMW', '62877': 'SRMW', '62878': 'SRMW', '62879': 'SRMW', '62880': 'SRMW', '62881': 'SRMW', '62882': 'SRMW', '62883': 'SRMW', '62884': 'SRMW', '62885': 'SRMW', '62886': 'SRMW', '62887': 'SRMW', '62888': 'SRMW', '62889': 'SRMW', '62890': 'SRMW', '62891': 'SRMW', '62892': 'SRMW', '62893': 'SRMW', '62894': 'SRMW', '62895': 'SRMW', '62896': 'SRMW', '62897': 'SRMW', '62898': 'SRMW', '62899': 'SRMW', '62901': 'SRMW', '62902': 'SRMW', '62903': 'SRMW', '62905': 'SRMW', '62906': 'SRMW', '62907': 'SRMW', '62908': 'SRMW', '62909': 'SRMW', '62910': 'SRMW', '62912': 'SRMW', '62914': 'SRMW', '62915': 'SRMW', '62916': 'SRMW', '62917': 'SRMW', '62918': 'SRMW', '62919': 'SRMW', '62920': 'SRMW', '62921': 'SRMW', '62922': 'SRMW', '62923': 'SRMW', '62924': 'SRMW', '62926': 'SRMW', '62927': 'SRMW', '62928': 'SRMW', '62930': 'SRMW', '62931': 'SRMW', '62932': 'SRMW', '62933': 'SRMW', '62934': 'SRMW', '62935': 'SRMW', '62938': 'SRMW', '62939': 'SRMW', '62940': 'SRMW', '62941': 'SRMW', '62942': 'SRMW', '62943': 'SRMW', '62946': 'SRMW', '62947': 'SRMW', '62948': 'SRMW', '62949': 'SRMW', '62950': 'SRMW', '62951': 'SRMW', '62952': 'SRMW', '62953': 'SRMW', '62954': 'SRMW', '62955': 'SRMW', '62956': 'SRMW', '62957': 'SRMW', '62958': 'SRMW', '62959': 'SRMW', '62960': 'SRMW', '62961': 'SRMW', '62962': 'SRMW', '62963': 'SRMW', '62964': 'SRMW', '62965': 'MROW', '62966': 'SRMW', '62967': 'SRMW', '62969': 'SRMW', '62970': 'SRMW', '62971': 'SRMW', '62972': 'SRMW', '62973': 'SRMW', '62974': 'SRMW', '62975': 'SRMW', '62976': 'SRMW', '62977': 'SRMW', '62979': 'SRMW', '62982': 'SRMW', '62983': 'SRMW', '62984': 'SRMW', '62985': 'SRMW', '62987': 'SRMW', '62988': 'SRMW', '62990': 'SRMW', '62992': 'SRMW', '62993': 'SRMW', '62994': 'SRMW', '62995': 'SRMW', '62996': 'SRMW', '62997': 'SRMW', '62998': 'SRMW', '62999': 'SRMW', '63001': 'SRMW', '63005': 'SRMW', '63006': 'SRMW', '63010': 'SRMW', '63011': 'SRMW', '63012': 'SRMW', '63013': 'SRMW', '63014': 'SRMW', '63015': 'SRMW', '63016': 'SRMW', '63017': 'SRMW', '63019': 'SRMW', '63020': 'SRMW', '63021': 'SRMW', '63022': 'SRMW', '63023': 'SRMW', '63024': 'SRMW', '63025': 'SRMW', '63026': 'SRMW', '63028': 'SRMW', '63030': 'SRMW', '63031': 'SRMW', '63032': 'SRMW', '63033': 'SRMW', '63034': 'SRMW', '63036': 'SRMW', '63037': 'SRMW', '63038': 'SRMW', '63039': 'SRMW', '63040': 'SRMW', '63041': 'SRMW', '63042': 'SRMW', '63043': 'SRMW', '63044': 'SRMW', '63045': 'SRMW', '63047': 'SRMW', '63048': 'SRMW', '63049': 'SRMW', '63050': 'SRMW', '63051': 'SRMW', '63052': 'SRMW', '63053': 'SRMW', '63055': 'SRMW', '63056': 'SRMW', '63057': 'SRMW', '63060': 'SRMW', '63061': 'SRMW', '63065': 'SRMW', '63066': 'SRMW', '63068': 'SRMW', '63069': 'SRMW', '63070': 'SRMW', '63071': 'SRMW', '63072': 'SRMW', '63073': 'SRMW', '63074': 'SRMW', '63077': 'SRMW', '63079': 'SRMW', '63080': 'SRMW', '63084': 'SRMW', '63087': 'SRMW', '63088': 'SRMW', '63089': 'SRMW', '63090': 'SRMW', '63091': 'SRMW', '63099': 'SRMW', '63101': 'SRMW', '63102': 'SRMW', '63103': 'SRMW', '63104': 'SRMW', '63105': 'SRMW', '63106': 'SRMW', '63107': 'SRMW', '63108': 'SRMW', '63109': 'SRMW', '63110': 'SRMW', '63111': 'SRMW', '63112': 'SRMW', '63113': 'SRMW', '63114': 'SRMW', '63115': 'SRMW', '63116': 'SRMW', '63117': 'SRMW', '63118': 'SRMW', '63119': 'SRMW', '63120': 'SRMW', '63121': 'SRMW', '63122': 'SRMW', '63123': 'SRMW', '63124': 'SRMW', '63125': 'SRMW', '63126': 'SRMW', '63127': 'SRMW', '63128': 'SRMW', '63129': 'SRMW', '63130': 'SRMW', '63131': 'SRMW', '63132': 'SRMW', '63133': 'SRMW', '63134': 'SRMW', '63135': 'SRMW', '63136': 'SRMW', '63137': 'SRMW', '63138': 'SRMW', '63139': 'SRMW', '63140': 'SRMW', '63141': 'SRMW', '63143': 'SRMW', '63144': 'SRMW', '63145': 'SRMW', '63146': 'SRMW', '63147': 'SRMW', '63150': 'SRMW', '63151': 'SRMW', '63155': 'SRMW', '63156': 'SRMW', '63157': 'SRMW', '63158': 'SRMW', '63160': 'SRMW', '63163': 'SRMW', '63164': 'SRMW', '63166': 'SRMW', '63167': 'SRMW', '63169': 'SRMW', '63171': 'SRMW', '63177': 'SRMW', '63178': 'SRMW', '63179': 'SRMW', '63180': 'SRMW', '63182': 'SRMW', '63188': 'SRMW', '63190': 'SRMW', '63195': 'SRMW', '63197': 'SRMW', '63198': 'SRMW', '63199': 'SRMW', '63301': 'SRMW', '63302': 'SRMW', '63303': 'SRMW', '63304': 'SRMW', '63330': 'SRMW', '63332': 'SRMW', '63333': 'SRMW', '63334': 'SRMW', '63336': 'SRMW', '63338': 'SRMW', '63339': 'SRMW', '63341': 'SRMW', '63342': 'SRMW', '63343': 'SRMW', '63344': 'SRMW', '63345': 'SRMW', '63346': 'SRMW', '63347': 'SRMW', '63348': 'SRMW', '63349': 'SRMW', '63350': 'SRMW', '63351': 'SRMW', '63352': 'SRMW', '63353': 'SRMW', '63357': 'SRMW', '63359': 'SRMW', '63361': 'SRMW', '63362': 'SRMW', '63363': 'SRMW', '63365': 'SRMW', '63366': 'SRMW', '63367': 'SRMW', '63368': 'SRMW', '63369': 'SRMW', '63370': 'SRMW', '63373': 'SRMW', '63376': 'SRMW', '63377': 'SRMW', '63378': 'SRMW', '63379': 'SRMW', '63380': 'SRMW', '63381': 'SRMW', '63382': 'SRMW', '63383': 'SRMW', '63384': 'SRMW', '63385': 'SRMW', '63386': 'SRMW', '63387': 'SRMW', '63388': 'SRMW', '63389': 'SRMW', '63390': 'SRMW', '63401': 'SRMW', '63430': 'SRMW', '63431': 'SRMW', '63432': 'SRMW', '63433': 'SRMW', '63434': 'SRMW', '63435': 'SRMW', '63436': 'SRMW', '63437': 'SRMW', '63438': 'SRMW', '63439': 'SRMW', '63440': 'SRMW', '63441': 'SRMW', '63442': 'SRMW', '63443': 'SRMW', '63445': 'SRMW', '63446': 'SRMW', '63447': 'SRMW', '63448': 'SRMW', '63450': 'SRMW', '63451': 'SRMW', '63452': 'SRMW', '63453': 'SRMW', '63454': 'SRMW', '63456': 'SRMW', '63457': 'SRMW', '63458': 'SRMW', '63459': 'SRMW', '63460': 'SRMW', '63461': 'SRMW', '63462': 'SRMW', '63463': 'SRMW', '63464': 'SRMW', '63465': 'SRMW', '63466': 'SRMW', '63467': 'SRMW', '63468': 'SRMW', '63469': 'SRMW', '63471': 'SRMW', '63472': 'SRMW', '63473': 'SRMW', '63474': 'SRMW', '63501': 'SRMW', '63530': 'SRMW', '63531': 'SRMW', '63532': 'SRMW', '63533': 'SRMW', '63534': 'SPNO', '63535': 'SRMW', '63536': 'SRMW', '63537': 'SRMW', '63538': 'SRMW', '63539': 'SRMW', '63540': 'SRMW', '63541': 'SRMW', '63543': 'SRMW', '63544': 'SRMW', '63545': 'SRMW', '63546': 'SRMW', '63547': 'SRMW', '63548': 'SRMW', '63549': 'SRMW', '63551': 'SRMW', '63552': 'SRMW', '63555': 'SRMW', '63556': 'SRMW', '63557': 'SRMW', '63558': 'SPNO', '63559': 'SRMW', '63560': 'SRMW', '63561': 'SRMW', '63563': 'SRMW', '63565': 'SRMW', '63566': 'SRMW', '63567': 'SRMW', '63601': 'SRMW', '63620': 'SRMW', '63621': 'SRMW', '63622': 'SRMW', '63623': 'SRMW', '63624': 'SRMW', '63625': 'SRMW', '63626': 'SRMW', '63627': 'SRMW', '63628': 'SRMW', '63629': 'SRMW', '63630': 'SRMW', '63631': 'SRMW', '63632': 'SRMW', '63633': 'SRMW', '63636': 'SRMW', '63637': 'SRMW', '63638': 'SRMW', '63640': 'SRMW', '63645': 'SRMW', '63648': 'SRMW', '63650': 'SRMW', '63651': 'SRMW', '63653': 'SRMW', '63654': 'SRMW', '63655': 'SRMW', '63656': 'SRMW', '63660': 'SRMW', '63662': 'SRMW', '63663': 'SRMW', '63664': 'SRMW', '63665': 'SRMW', '63666': 'SRMW', '63670': 'SRMW', '63673': 'SRMW', '63674': 'SRMW', '63675': 'SRMW', '63701': 'SRMW', '63702': 'SRMW', '63703': 'SRMW', '63730': 'SRMW', '63732': 'SRMW', '63735': 'SRMW', '63736': 'SRMW', '63737': 'SRMW', '63738': 'SRMW', '63739': 'SRMW', '63740': 'SRMW', '63742': 'SRMW', '63743': 'SRMW', '63744': 'SRMW', '63745': 'SRMW', '63746': 'SRMW', '63747': 'SRMW', '63748': 'SRMW', '63750': 'SRMW', '63751': 'SRMW', '63752': 'SRMW', '63755': 'SRMW', '63758': 'SRMW', '63760': 'SRMW', '63763': 'SRMW', '63764': 'SRMW', '63766': 'SRMW', '63767': 'SRMW', '63769': 'SRMW', '63770': 'SRMW', '63771': 'SRMW', '63774': 'SRMW', '63775': 'SRMW', '63776': 'SRMW', '63779': 'SRMW', '63780': 'SRMW', '63781': 'SRMW', '63782': 'SRMW', '63783': 'SRMW', '63784': 'SRMW', '63785': 'SRMW', '63787': 'SRMW', '63801': 'SRMW', '63820': 'SRMW', '63821': 'SRMW', '63822': 'SRMW', '63823': 'SRMW', '63824': 'SRMW', '63825': 'SRMW', '63826': 'SRMW', '63827': 'SRMW', '63828': 'SRMW', '63829': 'SRMW', '63830': 'SRMW', '63833': 'SRMW', '63834': 'SRMW', '63837': 'SRMW', '63839': 'SRMW', '63840': 'SRMW', '63841': 'SRMW', '63845': 'SRMW', '63846': 'SRMW', '63847': 'SRMW', '63848': 'SRMW', '63849': 'SRMW', '63850': 'SRMW', '63851': 'SRMW', '63852': 'SRMV', '63853': 'SRMW', '63855': 'SRMW', '63857': 'SRMV', '63860': 'SRMW', '63862': 'SRMW', '63863': 'SRMW', '63866': 'SRMW', '63867': 'SRMW', '63868': 'SRMW', '63869': 'SRMW', '63870': 'SRMW', '63873': 'SRMW', '63874': 'SRMW', '63875': 'SRMW', '63876': 'SRMV', '63877': 'SRMW', '63878': 'SRMW', '63879': 'SRMW', '63880': 'SRMW', '63881': 'SRMW', '63882': 'SRMW', '63901': 'SPSO', '63902': 'SPSO', '63931': 'SRMW', '63932': 'SRMW', '63933': 'SRMV', '63934': 'SRMW', '63935': 'SRMW', '63936': 'SRMW', '63937': 'SRMW', '63938': 'SRMW', '63939': 'SRMW', '63940': 'SRMW', '63941': 'SRMW', '63942': 'SRMV', '63943': 'SRMW', '63944': 'SRMW', '63945': 'SRMW', '63950': 'SRMW', '63951': 'SRMW', '63952': 'SRMW', '63953': 'SRMV', '63954': 'SRMV', '63955': 'SRMW', '63956': 'SRMW', '63957': 'SRMW', '63960': 'SRMW', '63961': 'SRMV', '63962': 'SRMW', '63963': 'SRMW', '63964': 'SRMW', '63965': 'SRMW', '63966': 'SRMW', '63967': 'SRMW', '64001': 'SPNO', '64002': 'SPNO', '64011': 'SPNO', '64012': 'SPNO', '64013': 'SPNO', '64014': 'SPNO', '64015': 'SPNO', '64016': 'SPNO', '64017': 'SPNO', '64018': 'SPNO', '64019': 'SPNO', '64020': 'SRMW', '64021': 'SPNO', '64022': 'SPNO', '64024': 'SRMW', '64028': 'SPNO', '64029': 'SPNO', '64030': 'SPNO', '64034': 'SPNO', '64035': 'SPNO', '64036': 'SPNO', '64037': 'SPNO', '64040': 'SPNO', '64048': 'SRMW', '64050': 'SPNO', '64051': 'SPNO', '64052': 'SPNO', '64053': 'SPNO', '64054': 'SPNO', '64055': 'SPNO', '64056': 'SPNO', '64057': 'SPNO', '64058': 'SPNO', '64060': 'SRMW', '64061': 'SPNO', '64062': 'SRMW', '64063': 'SPNO', '64064': 'SPNO', '64065': 'SPNO', '64066': 'SPNO', '64067': 'SPNO', '64068': 'SPNO', '64069': 'SPNO', '64070': 'SPNO', '64071': 'SPNO', '64072': 'SRMW', '64073': 'SRMW', '64074': 'SPNO', '64075': 'SPNO', '64076': 'SPNO', '64077': 'SPNO', '64078': 'SPNO', '64079': 'SPNO', '64080': 'SPNO', '64081': 'SPNO', '64082': 'SPNO', '64083': 'SPNO', '64084': 'SRMW', '64085': 'SPNO', '64086': 'SPNO', '64088': 'SPNO', '64089': 'SPNO', '64090': 'SPNO', '64092': 'SPNO', '64093': 'SPNO', '64096': 'SPNO', '64097': 'SPNO', '64098': 'SPNO', '64101': 'SPNO', '64102': 'SPNO', '64105': 'SPNO', '64106': 'SPNO', '64108': 'SPNO', '64109': 'SPNO', '64110': 'SPNO', '64111': 'SPNO', '64112': 'SPNO', '64113': 'SPNO', '64114': 'SPNO', '64116': 'SPNO', '64117': 'SPNO', '64118': 'SPNO', '64119': 'SPNO', '64120': 'SPNO', '64121': 'SPNO', '64123': 'SPNO', '64124': 'SPNO', '64125': 'SPNO', '64126': 'SPNO', '64127': 'SPNO', '64128': 'SPNO', '64129': 'SPNO', '64130': 'SPNO', '64131': 'SPNO', '64132': 'SPNO', '64133': 'SPNO', '64134': 'SPNO', '64136': 'SPNO', '64137': 'SPNO', '64138': 'SPNO', '64139': 'SPNO', '64141': 'SPNO', '64144': 'SPNO', '64145': 'SPNO', '64146': 'SPNO', '64147': 'SPNO', '64148': 'SPNO', '64149': 'SPNO', '64150': 'SPNO', '64151': 'SPNO', '64152': 'SPNO', '64153': 'SPNO', '64154': 'SPNO', '64155': 'SPNO', '64156': 'SPNO', '64157': 'SPNO', '64158': 'SPNO', '64161': 'SPNO', '64163': 'SPNO', '64164': 'SPNO', '64165': 'SRMW', '64166': 'SRMW', '64167': 'SRMW', '64168': 'SPNO', '64170': 'SPNO', '64171': 'SPNO', '64179': 'SPNO', '64180': 'SPNO', '64184': 'SPNO', '64187': 'SPNO', '64188': 'SPNO', '64190': 'SRMW', '64191': 'SPNO', '64192': 'SPNO', '64193': 'SPNO', '64195': 'SRMW', '64196': 'SPNO', '64197': 'SPNO', '64198': 'SPNO', '64199': 'SPNO', '64401': 'SPNO', '64402': 'SPNO', '64420': 'SPNO', '64421': 'SPNO', '64422': 'SRMW', '64423': 'SPNO', '64424': 'SPNO', '64426': 'SPNO', '64427': 'SPNO', '64428': 'SPNO', '64429': 'SRMW', '64430': 'SPNO', '64431': 'SPNO', '64432': 'SPNO', '64433': 'SRMW', '64434': 'SPNO', '64436': 'SPNO', '64437': 'SPNO', '64438': 'SRMW', '64439': 'SPNO', '64440': 'SPNO', '64441': 'SPNO', '64442': 'SPNO', '64443': 'SPNO', '64444': 'SPNO', '64445': 'SPNO', '64446': 'SPNO', '64448': 'SPNO', '64449': 'SPNO', '64451': 'SPNO', '64453': 'SPNO', '64454': 'SPNO', '64455': 'SPNO', '64456': 'SPNO', '64457': 'SPNO', '64458': 'SRMW', '64459': 'SPNO', '64461': 'SPNO', '64463': 'SPNO', '64465': 'SRMW', '64466': 'SPNO', '64467': 'SRMW', '64468': 'SPNO', '64469': 'SRMW', '64470': 'SPNO', '64471': 'SPNO', '64473': 'SPNO', '64474': 'SPNO', '64475': 'SPNO', '64476': 'SPNO', '64477': 'SRMW', '64479': 'SPNO', '64480': 'SPNO', '64481': 'SPNO', '64482': 'SPNO', '64483': 'SPNO', '64484': 'SPNO', '64485': 'SPNO', '64486': 'SRMW', '64487': 'SPNO', '64489': 'SPNO', '64490': 'SPNO', '64491': 'SPNO', '64492': 'SPNO', '64493': 'SRMW', '64494': 'SPNO', '64496': 'SPNO', '64497': 'SRMW', '64498': 'SPNO', '64499': 'SPNO', '64501': 'SPNO', '64502': 'SPNO', '64503': 'SPNO', '64504': 'SPNO', '64505': 'SPNO', '64506': 'SPNO', '64507': 'SPNO', '64508': 'SPNO', '64601': 'SRMW', '64620': 'SRMW', '64622': 'SPNO', '64623': 'SPNO', '64624': 'SPNO', '64625': 'SPNO', '64628': 'SPNO', '64630': 'SRMW', '64631': 'SRMW', '64632': 'SPNO', '64633': 'SPNO', '64635': 'SPNO', '64636': 'SRMW', '64637': 'SRMW', '64638': 'SPNO', '64639': 'SPNO', '64640': 'SPNO', '64641': 'SPNO', '64642': 'SPNO', '64643': 'SPNO', '64644': 'SRMW', '64645': 'SRMW', '64646': 'SRMW', '64647': 'SRMW', '64648': 'SPNO', '64649': 'SRMW', '64650': 'SRMW', '64651': 'SPNO', '64652': 'SPNO', '64653': 'SRMW', '64654': 'SPNO', '64655': 'SRMW', '64656': 'SRMW', '64657': 'SRMW', '64658': 'SPNO', '64659': 'SPNO', '64660': 'SPNO', '64661': 'SRMW', '64664': 'SRMW', '64667': 'SRMW', '64668': 'SPNO', '64670': 'SRMW', '64671': 'SRMW', '64672': 'SRMW', '64673': 'SPNO', '64674': 'SRMW', '64676': 'SPNO', '64679': 'SPNO', '64680': 'SRMW', '64681': 'SPNO', '64682': 'SPNO', '64683': 'SPNO', '64686': 'SRMW', '64688': 'SRMW', '64689': 'SRMW', '64701': 'SPNO', '64720': 'SPNO', '64722': 'SPNO', '64723': 'SPNO', '64724': 'SPNO', '64725': 'SPNO', '64726': 'SPNO', '64728': 'SPNO', '64730': 'SPNO', '64733': 'SPNO', '64734': 'SPNO', '64735': 'SRMW', '64738': 'SPNO', '64739': 'SPNO', '64740': 'SRMW', '64741': 'SPNO', '64742': 'SPNO', '64743': 'SPNO', '64744': 'SPNO', '64745': 'SRMW', '64746': 'SPNO', '64747': 'SPNO', '64748': 'SPNO', '64750': 'SPNO', '64752': 'SPNO', '64755': 'SPNO', '64756': 'SPNO', '64759': 'SPNO', '64761': 'SPNO', '64762': 'SPNO', '64763': 'SPNO', '64765': 'SPNO', '64766': 'SPNO', '64767': 'SPNO', '64769': 'SPNO', '64770': 'SPNO', '64771': 'SPNO', '64772': 'SPNO', '64776': 'SPNO', '64778': 'SPNO', '64779': 'SPNO', '64780': 'SPNO', '64781': 'SPNO', '64783': 'SPNO', '64784': 'SPNO', '64788': 'SPNO', '64790': 'SPNO', '64801': 'SPNO', '64802': 'SPNO', '64803': 'SPNO', '64804': 'SPNO', '64830': 'SPNO', '64831': 'SPNO', '64832': 'SPNO', '64833': 'SPNO', '64834': 'SPNO', '64835': 'SPNO', '64836': 'SPSO', '64840': 'SPNO', '64841': 'SPNO', '64842': 'SPNO', '64843': 'SPNO', '64844': 'SPNO', '64847': 'SPNO', '64848': 'SPNO', '64849': 'SPNO', '64850': 'SPNO', '64853': 'SPNO', '64854': 'SPSO', '64855': 'SPNO', '64856': 'SPSO', '64857': 'SPNO', '64858': 'SRMW', '64859': 'SPNO', '64861': 'SPNO', '64862': 'SPNO', '64863': 'SPSO', '64864': 'SPNO', '64865': 'SPNO', '64866': 'SPNO', '64867': 'SPNO', '64868': 'SRMW', '64869': 'SPNO', '64870': 'SPNO', '64873': 'SPNO', '64874': 'SRMW', '64999': 'SPNO', '65001': 'SRMW', '65010': 'SRMW', '65011': 'SRMW', '65013': 'SRMW', '65014': 'SRMW', '65016': 'SRMW', '65017': 'SRMW', '65018': 'SRMW', '65020': 'SRMW', '65023': 'SRMW', '65024': 'SRMW', '65025': 'SRMW', '65026': 'SRMW', '65032': 'SRMW', '65034': 'SRMW', '65035': 'SRMW', '65036': 'SRMW', '65037': 'SRMW', '65038': 'SRMW', '65039': 'SRMW', '65040': 'SRMW', '65041': 'SRMW', '65042': 'SRMW', '65043': 'SRMW', '65046': 'SRMW', '65047': 'SRMW', '65048': 'SRMW', '65049': 'SRMW', '65050': 'SRMW', '65051': 'SRMW', '65052': 'SRMW', '65053': 'SRMW', '65054': 'SRMW', '65055': 'SRMW', '65058': 'SRMW', '65059': 'SRMW', '65061': 'SRMW', '65062': 'SRMW', '65063': 'SRMW', '65064': 'SRMW', '65065': 'SRMW', '65066': 'SRMW', '65067': 'SRMW', '65068': 'SRMW', '65069': 'SRMW', '65072': 'SRMW', '65074': 'SRMW', '65075': 'SRMW', '65076': 'SRMW', '65077': 'SRMW', '65078': 'SRMW', '65079': 'SRMW', '65080': 'SRMW', '65081': 'SRMW', '65082': 'SRMW', '65083': 'SRMW', '65084': 'SRMW', '65085': 'SRMW', '65101': 'SRMW', '65102': 'SRMW', '65103': 'SRMW', '65104': 'SRMW', '65105': 'SRMW', '65106': 'SRMW', '65107': 'SRMW', '65108': 'SRMW', '65109': 'SRMW', '65110': 'SRMW', '65111': 'SRMW', '65201': 'SRMW', '65202': 'SRMW', '65203': 'SRMW', '65205': 'SRMW', '65211': 'SRMW', '65212': 'SRMW', '65215': 'SRMW', '65216': 'SRMW', '65217': 'SRMW', '65218': 'SRMW', '65230': 'SPNO', '65231': 'SRMW', '65232': 'SRMW', '65233': 'SRMW', '65236': 'SPNO', '65237': 'SRMW', '65239': 'SRMW', '65240': 'SRMW', '65243': 'SRMW', '65244': 'SPNO', '65246': 'SPNO', '65247': 'SRMW', '65248': 'SRMW', '65250': 'SRMW', '65251': 'SRMW', '65254': 'SPNO', '65255': 'SRMW', '65256': 'SRMW', '65257': 'SRMW', '65258': 'SRMW', '65259': 'SRMW', '65260': 'SRMW', '65261': 'SPNO', '65262': 'SRMW', '65263': 'SRMW', '65264': 'SRMW', '65265': 'SRMW', '65270': 'SRMW', '65274': 'SRMW', '65275': 'SRMW', '65276': 'SRMW', '65278': 'SRMW', '65279': 'SRMW', '65280': 'SRMW', '65281': 'SPNO', '65282': 'SRMW', '65283': 'SRMW', '65284': 'SRMW', '65285': 'SRMW', '65286': 'SPNO', '65287': 'SRMW', '65299': 'SRMW', '65301': 'SRMW', '65302': 'SPNO', '65305': 'SRMW', '65320': 'SRMW', '65321': 'SPNO', '65322': 'SRMW', '65323': 'SRMW', '65324': 'SRMW', '65325': 'SRMW', '65326': 'SRMW', '65327': 'SPNO', '65329': 'SRMW', '65330': 'SPNO', '65332': 'SRMW', '65333': 'SRMW', '65334': 'SRMW', '65335': 'SRMW', '65336': 'SRMW', '65337': 'SRMW', '65338': 'SRMW', '65339': 'SPNO', '65340': 'SRMW', '65344': 'SPNO', '65345': 'SRMW', '65347': 'SRMW', '65348': 'SRMW', '65349': 'SPNO', '65350': 'SRMW', '65351': 'SRMW', '65354': 'SRMW', '65355': 'SRMW', '65360': 'SRMW', '65401': 'SRMW', '65402': 'SRMW', '65409': 'SRMW', '65436': 'SRMW', '65438': 'SRMW', '65439': 'SRMW', '65440': 'SRMW', '65441': 'SRMW', '65443': 'SRMW', '65444': 'SRMW', '65446': 'SRMW', '65449': 'SRMW', '65452': 'SRMW', '65453': 'SRMW', '65456': 'SRMW', '65457': 'SRMW', '65459': 'SRMW', '65461': 'SRMW', '65462': 'SRMW', '65463': 'SRMW', '65464': 'SRMW', '65466': 'SRMW', '65468': 'SRMW', '65470': 'SRMW', '65473': 'SRMW', '65479': 'SRMW', '65483': 'SRMW', '65484': 'SRMW', '65486': 'SRMW', '65501': 'SRMW', '65529': 'SRMW', '65532': 'SRMW', '65534': 'SRMW', '65535': 'SRMW', '65536': 'SRMW', '65541': 'SRMW', '65542': 'SRMW', '65543': 'SRMW', '65546': 'SRMW', '65548': 'SRMW', '65550': 'SRMW', '65552': 'SRMW', '65555': 'SRMW', '65556': 'SRMW', '65557': 'SRMW', '65559': 'SRMW', '65560': 'SRMW', '65564': 'SRMW', '65565': 'SRMW', '65566': 'SRMW', '65567': 'SRMW', '65570': 'SRMW', '65571': 'SRMW', '65580': 'SRMW', '65582': 'SRMW', '65583': 'SRMW', '65584': 'SRMW', '65586': 'SRMW', '65588': 'SRMW', '65589': 'SRMW', '65590': 'SRMW', '65591': 'SRMW', '65601': 'SPNO', '65603': 'SPNO', '65604': 'SPNO', '65605': 'SPNO', '65606': 'SRMW', '65607': 'SPNO', '65608': 'SRMW', '65609': 'SRMW', '65610': 'SPNO', '65611': 'SPSO', '65612': 'SPNO', '65613': 'SRMW', '65614': 'SRMW', '65615': 'SPNO', '65616': 'SPSO', '65617': 'SPNO', '65618': 'SRMW', '65619': 'SRMW', '65620': 'SRMW', '65622': 'SPNO', '65623': 'SPNO', '65624': 'SPNO', '65625': 'SPSO', '65626': 'SRMW', '65627': 'SRMW', '65629': 'SRMW', '65630': 'SRMW', '65631': 'SPNO', '65632': 'SRMW', '65633': 'SPNO', '65634': 'SPNO', '65635': 'SPNO', '65636': 'SRMW', '65637': 'SRMW', '65638': 'SRMW', '65640': 'SPNO', '65641': 'SPSO', '65644': 'SRMW', '65645': 'SRMW', '65646': 'SPNO', '65647': 'SRMW', '65648': 'SRMW', '65649': 'SPNO', '65650': 'SPNO', '65652': 'SRMW', '65653': 'SRMW', '65654': 'SPNO', '65655': 'SRMW', '65656': 'SPSO', '65657': 'SRMW', '65658': 'SPSO', '65660': 'SRMW', '65661': 'SPNO', '65662': 'SRMW', '65663': 'SPNO', '65664': 'SPNO', '65666': 'SRMW', '65667': 'SRMW', '65668': 'SPNO', '65669': 'SRMW', '65672': 'SPSO', '65673': 'SPNO', '65674': 'SPNO', '65675': 'SPNO', '65676': 'SRMW', '65679': 'SRMW', '65680': 'SRMW', '65681': 'SPSO', '65682': 'SPNO', '65685': 'SPNO', '65686': 'SPSO', '65688': 'SRMW', '65689': 'SRMW', '65690': 'SRMW', '65692': 'SRMW', '65701': 'SRMW', '65702': 'SRMW', '65704': 'SRMW', '65705': 'SPNO', '65706': 'SRMW', '65707': 'SPNO', '65708': 'SPNO', '65710': 'SPNO', '65711': 'SRMW', '65712': 'SPNO', '65713': 'SRMW', '65714': 'SPNO', '65715': 'SRMW', '65717': 'SRMW', '65720': 'SRMW', '65721': 'SRMW', '65722': 'SRMW', '65723': 'SPNO', '65724': 'SRMW', '65725': 'SPNO', '65726': 'SPNO', '65727': 'SRMW', '65728': 'SRMW', '65729': 'SRMW', '65730': 'SRMW', '65731': 'SRMW', '65732': 'SPNO', '65733': 'SRMW', '65734': 'SPNO', '65735': 'SRMW', '65737': 'SPSO', '65738': 'SPNO', '65739': 'SPSO', '65740': 'SRMW', '65741': 'SRMW', '65742': 'SPNO', '65744': 'SRMW', '65745': 'SPSO', '65746': 'SRMW', '65747': 'SPSO', '65752': 'SPNO', '65753': 'SRMW', '65754': 'SRMW', '65755': 'SRMW', '65756': 'SPNO', '65757': 'SRMW', '65759': 'SRMW', '65760': 'SRMW', '65761': 'SRMW', '65762': 'SRMW', '65764': 'SRMW', '65765': 'SRMW', '65766': 'SRMW', '65767': 'SPNO', '65768': 'SRMW', '65769': 'SPNO', '65770': 'SPNO', '65771': 'SRMW', '65772': 'SPSO', '65773': 'SRMW', '65774': 'SPNO', '65775': 'SRMW', '65776': 'SPNO', '65777': 'SRMW', '65778': 'SRMV', '65779': 'SPNO', '65781': 'SPNO', '65783': 'SRMW', '65784': 'SRMW', '65785': 'SPNO', '65786': 'SRMW', '65787': 'SRMW', '65788': 'SRMW', '65789': 'SRMW', '65790': 'SRMW', '65791': 'SRMV', '65793': 'SRMW', '65801': 'SPSO', '65802': 'SRMW', '65803': 'SPSO', '65804': 'SRMW', '65805': 'SPSO', '65806': 'SPSO', '65807': 'SRMW', '65808': 'SPSO', '65809': 'SPSO', '65810': 'SRMW', '65814': 'SPSO', '65817': 'SRMW', '65890': 'SPSO', '65897': 'SPSO', '65898': 'SPSO', '65899': 'SPSO', '66002': 'SPNO', '66006': 'SPNO', '66007': 'SPNO', '66008': 'SPNO', '66010': 'SPNO', '66012': 'SPNO', '66013': 'SPNO', '66014': 'SPNO', '66015': 'SPNO', '66016': 'SPNO', '66017': 'SPNO', '66018': 'SPNO', '66019': 'SPNO', '66020': 'SPNO', '66021': 'SPNO', '66023': 'SPNO', '66024': 'SPNO', '66025': 'SPNO', '66026': 'SPNO', '66027': 'SPNO', '66030': 'SPNO', '66031': 'SPNO', '66032': 'SPNO', '66033': 'SPNO', '66035': 'SPNO', '66036': 'SPNO', '66039': 'SPNO', '66040': 'SPNO', '66041': 'SPNO', '66042': 'SPNO', '66043': 'SPNO', '66044': 'SPNO', '66045': 'SPNO', '66046': 'SPNO', '66047': 'SPNO', '66048': 'SPNO', '66049': 'SPNO', '66050': 'SPNO', '66051': 'SPNO', '66052': 'SPNO', '66053': 'SPNO', '66054': 'SPNO', '66056': 'SPNO', '66058': 'SPNO', '66060': 'SPNO', '66061': 'SPNO', '66062': 'SPNO', '66063': 'SPNO', '66064': 'SPNO', '66066': 'SPNO', '66067': 'SPNO', '66070': 'SPNO', '66071': 'SPNO', '66072': 'SPNO', '66073': 'SPNO', '66075': 'SPNO', '66076': 'SPNO', '66078': 'SPNO', '66079': 'SPNO', '66080': 'SPNO', '66083': 'SPNO', '66085': 'SPNO', '66086': 'SPNO', '66087': 'SPNO', '66088': 'SPNO', '66090': 'SPNO', '66091': 'SPNO', '66092': 'SPNO', '66093': 'SPNO', '66094': 'SPNO', '66095': 'SPNO', '66097': 'SPNO', '66101': 'SPNO', '66102': 'SPNO', '66103': 'SPNO', '66104': 'SPNO', '66105': 'SPNO', '66106': 'SPNO', '66109': 'SPNO', '66110': 'SPNO', '66111': 'SPNO', '66112': 'SPNO', '66113': 'SPNO', '66115': 'SPNO', '66117': 'SPNO', '66118': 'SPNO', '66119': 'SPNO', '66160': 'SPNO', '66201': 'SPNO', '66202': 'SPNO', '66203': 'SPNO', '66204': 'SPNO', '66205': 'SPNO', '66206': 'SPNO', '66207': 'SPNO', '66208': 'SPNO', '66209': 'SPNO', '66210': 'SPNO', '66211': 'SPNO', '66212': 'SPNO', '66213': 'SPNO', '66214': 'SPNO', '66215': 'SPNO', '66216': 'SPNO', '66217': 'SPNO', '66218': 'SPNO', '66219': 'SPNO', '66220': 'SPNO', '66221': 'SPNO', '66222': 'SPNO', '66223': 'SPNO', '66224': 'SPNO', '66225': 'SPNO', '66226': 'SPNO', '66227': 'SPNO', '66250': 'SPNO', '66251': 'SPNO', '66276': 'SPNO', '66282': 'SPNO', '66283': 'SPNO', '66285': 'SPNO', '66286': 'SPNO', '66401': 'SPNO', '66402': 'SPNO', '66403': 'SPNO', '66404': 'SPNO', '66406': 'SPNO', '66407': 'SPNO', '66408': 'SPNO', '66409': 'SPNO', '66411': 'SPNO', '66412': 'SPNO', '66413': 'SPNO', '66414': 'SPNO', '66415': 'SPNO', '66416': 'SPNO', '66417': 'SPNO', '66418': 'SPNO', '66419': 'SPNO', '66420': 'SPNO', '66422': 'SPNO', '66423': 'SPNO', '66424': 'SPNO', '66425': 'SPNO', '66426': 'SPNO', '66427': 'SPNO', '66428': 'SPNO', '66429': 'SPNO', '66431': 'SPNO', '66432': 'SPNO', '66434': 'SPNO', '66436': 'SPNO', '66438': 'SPNO', '66439': 'SPNO', '66440': 'SPNO', '66441': 'SPNO', '66442': 'SPNO', '66449': 'SPNO', '66451': 'SPNO', '66501': 'SPNO', '66502': 'SPNO', '66503': 'SPNO', '66505': 'SPNO', '66506': 'SPNO', '66507': 'SPNO', '66508': 'SPNO', '66509': 'SPNO', '66510': 'SPNO', '66512': 'SPNO', '66514': 'SPNO', '66515': 'SPNO', '66516': 'SPNO', '66517': 'SPNO', '66518': 'SPNO', '66520': 'SPNO', '66521': 'SPNO', '66522': 'SPNO', '66523': 'SPNO', '66524': 'SPNO', '66526': 'SPNO', '66527': 'SPNO', '66528': 'SPNO', '66531': 'SPNO', '66532': 'SPNO', '66533': 'SPNO', '66534': 'SPNO', '66535': 'SPNO', '66536': 'SPNO', '66537': 'SPNO', '66538': 'SPNO', '66539': 'SPNO', '66540': 'SPNO', '66541': 'SPNO', '66542': 'SPNO', '66543': 'SPNO', '66544': 'SPNO', '66546': 'SPNO', '66547': 'SPNO', '66548': 'SPNO', '66549': 'SPNO', '66550': 'SPNO', '66552': 'SPNO', '66554': 'SPNO', '66601': 'SPNO', '66603': 'SPNO', '66604': 'SPNO', '66605': 'SPNO', '66606': 'SPNO', '66607': 'SPNO', '66608': 'SPNO', '66609': 'SPNO', '66610': 'SPNO', '66611': 'SPNO', '66612': 'SPNO', '66614': 'SPNO', '66615': 'SPNO', '66616': 'SPNO', '66617': 'SPNO', '66618': 'SPNO', '66619': 'SPNO', '66620': 'SPNO', '66621': 'SPNO', '66622': 'SPNO', '66624': 'SPNO', '66625': 'SPNO', '66626': 'SPNO', '66628': 'SPNO', '66629': 'SPNO', '66636': 'SPNO', '66647': 'SPNO', '66667': 'SPNO', '66675': 'SPNO', '66683': 'SPNO', '66699': 'SPNO', '66701': 'SPNO', '66710': 'SPNO', '66711': 'SPNO', '66712': 'SPNO', '66713': 'SPNO', '66714': 'SPNO', '66716': 'SPNO', '66717': 'SPNO', '66720': 'SPNO', '66724': 'SPNO', '66725': 'SPNO', '66728': 'SPNO', '66732': 'SPNO', '66733': 'SPNO', '66734': 'SPNO', '66735': 'SPNO', '66736': 'SPNO', '66738': 'SPNO', '66739': 'SPNO', '66740': 'SPNO', '66741': 'SPNO', '66742': 'SPNO', '66743': 'SPNO', '66746': 'SPNO', '66748': 'SPNO', '66749': 'SPNO', '66751': 'SPNO', '66753': 'SPNO', '66754': 'SPNO', '66755': 'SPNO', '66756': 'SPNO', '66757': 'SPNO', '66758': 'SPNO', '66759': 'SPNO', '66760': 'SPNO', '66761': 'SPNO', '66762': 'SPNO', '66763': 'SPNO', '66767': 'SPNO', '66769': 'SPNO', '66770': 'SPNO', '66771': 'SPNO', '66772': 'SPNO', '66773': 'SPNO', '66775': 'SPNO', '66776': 'SPNO', '66777': 'SPNO', '66778': 'SPNO', '66779': 'SPNO', '66780': 'SPNO', '66781': 'SPNO', '66782': 'SPNO', '66783': 'SPNO', '66801': 'SPNO', '66830': 'SPNO', '66833': 'SPNO', '66834': 'SPNO', '66835': 'SPNO', '66838': 'SPNO', '66839': 'SPNO', '66840': 'SPNO', '66842': 'SPNO', '66843': 'SPNO', '66845': 'SPNO', '66846': 'SPNO', '66849': 'SPNO', '66850': 'SPNO', '66851': 'SPNO', '66852': 'SPNO', '66853': 'SPNO', '66854': 'SPNO', '66855': 'SPNO', '66856': 'SPNO', '66857': 'SPNO', '66858': 'SPNO', '66859': 'SPNO', '66860': 'SPNO', '66861': 'SPNO', '66862': 'SPNO', '66863': 'SPNO', '66864': 'SPNO', '66865': 'SPNO', '66866': 'SPNO', '66868': 'SPNO', '66869': 'SPNO', '66870': 'SPNO', '66871': 'SPNO', '66872': 'SPNO', '66873': 'SPNO', '66901': 'SPNO', '66930': 'SPNO', '66932': 'SPNO', '66933': 'SPNO', '66935': 'SPNO', '66936': 'SPNO', '66937': 'SPNO', '66938': 'SPNO', '66939': 'SPNO', '66940': 'SPNO', '66941': 'SPNO', '66942': 'SPNO', '66943': 'SPNO', '66944': 'SPNO', '66945': 'SPNO', '66946': 'SPNO', '66948': 'SPNO', '66949': 'SPNO', '66951': 'SPNO', '66952': 'SPNO', '66953': 'SPNO', '66955': 'SPNO', '66956': 'SPNO', '66958': 'SPNO', '66959': 'SPNO', '66960': 'SPNO', '66961': 'SPNO', '66962': 'SPNO', '66963': 'SPNO', '66964': 'SPNO', '66966': 'SPNO', '66967': 'SPNO', '66968': 'SPNO', '66970': 'SPNO', '67001': 'SPNO', '67002': 'SPNO', '67003': 'SPNO', '67004': 'SPNO', '67005': 'SPNO', '67008': 'SPNO', '67009': 'SPSO', '67010': 'SPNO', '67012': 'SPNO', '67013': 'SPNO', '67016': 'SPNO', '67017': 'SPNO', '67018': 'SPNO', '67019': 'SPNO', '67020': 'SPNO', '67021': 'SPNO', '67022': 'SPNO', '67023': 'SPNO', '67024': 'SPNO', '67025': 'SPNO', '67026': 'SPNO', '67028': 'SPNO', '67029': 'SPSO', '67030': 'SPNO', '67031': 'SPNO', '67035': 'SPNO', '67036': 'SPNO', '67037': 'SPNO', '67038': 'SPNO', '67039': 'SPNO', '67041': 'SPNO', '67042': 'SPNO', '67045': 'SPNO', '67047': 'SPNO', '67049': 'SPNO', '67050': 'SPNO', '67051': 'SPNO', '67052': 'SPNO', '67053': 'SPNO', '67054': 'SPNO', '67055': 'SPNO', '67056': 'SPNO', '67057': 'SPSO', '67058': 'SPNO', '67059': 'SPNO', '67060': 'SPNO', '67061': 'SPSO', '67062': 'SPNO', '67063': 'SPNO', '67065': 'SPNO', '67066': 'SPNO', '67067': 'SPNO', '67068': 'SPNO', '67070': 'SPSO', '67071': 'SPSO', '67072': 'SPNO', '67073': 'SPNO', '67074': 'SPNO', '67101': 'SPNO', '67102': 'SPNO', '67103': 'SPNO', '67104': 'SPSO', '67105': 'SPNO', '67106': 'SPNO', '67107': 'SPNO', '67108': 'SPNO', '67109': 'SPNO', '67110': 'SPNO', '67111': 'SPNO', '67112': 'SPSO', '67114': 'SPNO', '67117': 'SPNO', '67118': 'SPNO', '67119': 'SPNO', '67120': 'SPNO', '67122': 'SPNO', '67123': 'SPNO', '67124': 'SPNO', '67127': 'SPSO', '67131': 'SPNO', '67132': 'SPNO', '67133': 'SPNO', '67134': 'SPNO', '67135': 'SPNO', '67137': 'SPNO', '67138': 'SPSO', '67140': 'SPNO', '67142': 'SPNO', '67143': 'SPNO', '67144': 'SPNO', '67146': 'SPNO', '67147': 'SPNO', '67149': 'SPNO', '67150': 'SPSO', '67151': 'SPNO', '67152': 'SPNO', '67154': 'SPNO', '67155': 'SPNO', '67156': 'SPNO', '67159': 'SPNO', '67201': 'SPNO', '67202': 'SPNO', '67203': 'SPNO', '67204': 'SPNO', '67205': 'SPNO', '67206': 'SPNO', '67207': 'SPNO', '67208': 'SPNO', '67209': 'SPNO', '67210': 'SPNO', '67211': 'SPNO', '67212': 'SPNO', '67213': 'SPNO', '67214': 'SPNO', '67215': 'SPNO', '67216': 'SPNO', '67217': 'SPNO', '67218': 'SPNO', '67219': 'SPNO', '67220': 'SPNO', '67221': 'SPNO', '67223': 'SPNO', '67226': 'SPNO', '67227': 'SPNO', '67228': 'SPNO', '67230': 'SPNO', '67232': 'SPNO', '67235': 'SPNO', '67260': 'SPNO', '67275': 'SPNO', '67276': 'SPNO', '67277': 'SPNO', '67278': 'SPNO', '67301': 'SPNO', '67330': 'SPNO', '67332': 'SPNO', '67333': 'SPNO', '67334': 'SPNO', '67335': 'SPNO', '67336': 'SPNO', '67337': 'SPSO', '67340': 'SPNO', '67341': 'SPNO', '67342': 'SPNO', '67344': 'SPNO', '67345': 'SPNO', '67346': 'SPNO', '67347': 'SPNO', '67349': 'SPNO', '67351': 'SPNO', '67352': 'SPNO', '67353': 'SPNO', '67354': 'SPNO', '67355': 'SPNO', '67356': 'SPNO', '67357': 'SPNO', '67360': 'SPNO', '67361': 'SPNO', '67363': 'SPNO', '67364': 'SPNO', '67401': 'SPNO', '67402': 'SPNO', '67410': 'SPNO', '67416': 'SPNO', '67417': 'SPNO', '67418': 'SPNO', '67420': 'SPNO', '67422': 'SPNO', '67423': 'SPNO', '67425': 'SPNO', '67427': 'SPNO', '67428': 'SPNO', '67430': 'SPNO', '67431': 'SPNO', '67432': 'SPNO', '67436': 'SPNO', '67437': 'SPNO', '67438': 'SPNO', '67439': 'SPNO', '67441': 'SPNO', '67442': 'SPNO', '67443': 'SPNO', '67444': 'SPNO', '67445': 'SPNO', '67446': 'SPNO', '67447': 'SPNO', '67448': 'SPNO', '67449': 'SPNO', '67450': 'SPNO', '67451': 'SPNO', '67452': 'SPNO', '67454': 'SPNO', '67455': 'SPNO', '67456': 'SPNO', '67457': 'SPNO', '67458': 'SPNO', '67459': 'SPNO', '67460': 'SPNO', '67464': 'SPNO', '67466': 'SPNO', '67467': 'SPNO', '67468': 'SPNO', '67470': 'SPNO', '67473': 'SPNO', '67474': 'SPNO', '67475': 'SPNO', '67476': 'SPNO', '67478': 'SPNO', '67480': 'SPNO', '67481': 'SPNO', '67482': 'SPNO', '67483': 'SPNO', '67484': 'SPNO', '67485': 'SPNO', '67487': 'SPNO', '67490': 'SPNO', '67491': 'SPNO', '67492': 'SPNO', '67501': 'SPNO', '67502': 'SPNO', '67504': 'SPNO', '67505': 'SPNO', '67510': 'SPNO', '67511': 'SPNO', '67512': 'SPNO', '67513': 'SPNO', '67514': 'SPNO', '67515': 'SPNO', '67516': 'SPNO', '67518': 'SPNO', '67519': 'SPNO', '67520': 'SPNO', '67521': 'SPNO', '67522': 'SPNO', '67523': 'SPNO', '67524': 'SPNO', '67525': 'SPNO', '67526': 'SPNO', '67529': 'SPNO', '67530': 'SPNO', '67543': 'SPNO', '67544': 'SPNO', '67545': 'SPNO', '67546': 'SPNO', '67547': 'SPNO', '67548': 'SPNO', '67550': 'SPNO', '67552': 'SPNO', '67553': 'SPNO', '67554': 'SPNO', '67556': 'SPNO', '67557': 'SPNO', '67559': 'SPNO', '67560': 'SPNO', '67561': 'SPNO', '67563': 'SPNO', '67564': 'SPNO', '67565': 'SPNO', '67566': 'SPNO', '67567': 'SPNO', '67568': 'SPNO', '67570': 'SPNO', '67572': 'SPNO', '67573': 'SPNO', '67574': 'SPNO', '67575': 'SPNO', '67576': 'SPNO', '67578': 'SPNO', '67579': 'SPNO', '67581': 'SPNO', '67583': 'SPNO', '67584': 'SPNO', '67585': 'SPNO', '67601': 'SPNO', '67621': 'SPNO', '67622': 'SPNO', '67623': 'SPNO', '67625': 'SPNO', '67626': 'SPNO', '67627': 'SPNO', '67628': 'SPNO', '67629': 'SPNO', '67631': 'SPNO', '67632': 'SPNO', '67634': 'SPNO', '67635': 'SPNO', '67637': 'SPNO', '67638': 'SPNO', '67639': 'SPNO', '67640': 'SPNO', '67642': 'SPNO', '67643': 'SPNO', '67644': 'SPNO', '67645': 'SPNO', '67646': 'SPNO', '67647': 'SPNO', '67648': 'SPNO', '67649': 'SPNO', '67650': 'SPNO', '67651': 'SPNO', '67653': 'SPNO', '67654': 'SPNO', '67656': 'SPNO', '67657': 'SPNO', '67658': 'SPNO', '67659': 'SPNO', '67660': 'SPNO', '67661': 'SPNO', '67663': 'SPNO', '67664': 'SPNO', '67665': 'SPNO', '67667': 'SPNO', '67669': 'SPNO', '67671': 'SPNO', '67672': 'SPNO', '67673': 'SPNO', '67674': 'SPNO', '67675': 'SPNO', '67701': 'SPNO', '67730': 'SPNO', '67731': 'SPNO', '67732': 'SPNO', '67733': 'SPNO', '67734': 'SPNO', '67735': 'SPNO', '67736': 'SPNO', '67737': 'SPNO', '67738': 'SPNO', '67739': 'SPNO', '67740': 'SPNO', '67741': 'SPNO', '67743': 'SPNO', '67744': 'SPNO', '67745': 'SPNO', '67747': 'SPNO', '67748': 'SPNO', '67749': 'SPNO', '67751': 'SPNO', '67752': 'SPNO', '67753': 'SPNO', '67756': 'SPNO', '67757': 'SPNO', '67758': 'SPNO', '67761': 'SPNO', '67762': 'SPNO', '67764': 'SPNO', '67801': 'SPNO', '67831': 'SPNO', '67834': 'SPNO', '67835': 'SPNO', '67836': 'SPNO', '67837': 'SPNO', '67838': 'SPNO', '67839': 'SPNO', '67840': 'SPNO', '67841': 'SPNO', '67842': 'SPNO', '67843': 'SPNO', '67844': 'SPNO', '67846': 'SPNO', '67849': 'SPNO', '67850': 'SPNO', '67851': 'SPNO', '67853': 'SPNO', '67854': 'SPNO', '67855': 'SPNO', '67857': 'SPNO', '67859': 'SPNO', '67860': 'SPNO', '67861': 'SPNO', '67862': 'SPNO', '67863': 'SPNO', '67864': 'SPNO', '67865': 'SPNO', '67867': 'SPNO', '67868': 'SPNO', '67869': 'SPNO', '67870': 'SPNO', '67871': 'SPNO', '67876': 'SPNO', '67877': 'SPNO', '67878': 'SPNO', '67879': 'SPNO', '67880': 'SPNO', '67882': 'SPNO', '67901': 'SPNO', '67905': 'SPNO', '67950': 'SPNO', '67951': 'SPNO', '67952': 'SPNO', '67953': 'SPNO', '67954': 'SPNO', '68001': 'MROW', '68002': 'MROW', '68003': 'MROW', '68004': 'MROW', '68005': 'MROW', '68007': 'MROW', '68008': 'MROW', '68009': 'MROW', '68010': 'MROW', '68014': 'MROW', '68015': 'MROW', '68016': 'MROW', '68017': 'MROW', '68018': 'MROW', '68019': 'MROW', '68020': 'MROW', '68022': 'MROW', '68023': 'MROW', '68025': 'MROW', '68026': 'MROW', '68028': 'MROW', '68029': 'MROW', '68030': 'MROW', '68031': 'MROW', '68033': 'MROW', '68034': 'MROW', '68036': 'MROW', '68037': 'MROW', '68038': 'MROW', '68039': 'MROW', '68040': 'MROW', '68041': 'MROW', '68042': 'MROW', '68044': 'MROW', '68045': 'MROW', '68046': 'MROW', '68047': 'MROW', '68048': 'MROW', '68050': 'MROW', '68055': 'MROW', '68056': 'MROW', '68057': 'MROW', '68058': 'MROW', '68059': 'MROW', '68061': 'MROW', '68062': 'MROW', '68063': 'MROW', '68064': 'MROW', '68065': 'MROW', '68066': 'MROW', '68067': 'MROW', '68068': 'MROW', '68069': 'MROW', '68070': 'MROW', '68071': 'MROW', '68072': 'MROW', '68073': 'MROW', '68101': 'MROW', '68102': 'MROW', '68103': 'MROW', '68104': 'MROW', '68105': 'MROW', '68106': 'MROW', '68107': 'MROW', '68108': 'MROW', '68109': 'MROW', '68110': 'MROW', '68111': 'MROW', '68112': 'MROW', '68113': 'MROW', '68114': 'MROW', '68116': 'MROW', '68117': 'MROW', '68118': 'MROW', '68119': 'MROW', '68120': 'MROW', '68122': 'MROW', '68123': 'MROW', '68124': 'MROW', '68127': 'MROW', '68128': 'MROW', '68130': 'MROW', '68131': 'MROW', '68132': 'MROW', '68133': 'MROW', '68134': 'MROW', '68135': 'MROW', '68136': 'MROW', '68137': 'MROW', '68138': 'MROW', '68139': 'MROW', '68142': 'MROW', '68144': 'MROW', '68145': 'MROW', '68147': 'MROW', '68152': 'MROW', '68154': 'MROW', '68155': 'MROW', '68157': 'MROW', '68164': 'MROW', '68172': 'MROW', '68175': 'MROW', '68176': 'MROW', '68178': 'MROW', '68179': 'MROW', '68180': 'MROW', '68182': 'MROW', '68183': 'MROW', '68197': 'MROW', '68198': 'MROW', '68301': 'MROW', '68303': 'MROW', '68304': 'MROW', '68305': 'MROW', '68307': 'MROW', '68309': 'MROW', '68310': 'MROW', '68313': 'MROW', '68314': 'MROW', '68315': 'MROW', '68316': 'MROW', '68317': 'MROW', '68318': 'MROW', '68319': 'MROW', '68320': 'MROW', '68321': 'MROW', '68322': 'MROW', '68323': 'MROW', '68324': 'MROW', '68325': 'MROW', '68326': 'MROW', '68327': 'MROW', '68328': 'MROW', '68329': 'MROW', '68330': 'MROW', '68331': 'MROW', '68332': 'MROW', '68333': 'MROW', '68335': 'MROW', '68336': 'MROW', '68337': 'MROW', '68338': 'MROW', '68339': 'MROW', '68340': 'MROW', '68341': 'MROW', '68342': 'MROW', '68343': 'MROW', '68344': 'MROW', '68345': 'MROW', '68346': 'MROW', '68347': 'MROW', '68348': 'MROW', '68349': 'MROW', '68350': 'MROW', '68351': 'MROW', '68352': 'MROW', '68354': 'MROW', '68355': 'MROW', '68357': 'MROW', '68358': 'MROW', '68359': 'MROW', '68360': 'MROW', '68361': 'MROW', '68362': 'MROW', '68364': 'MROW', '68365': 'MROW', '68366': 'MROW', '68367': 'MROW', '68368': 'MROW', '68370': 'MROW', '68371': 'MROW', '68372': 'MROW', '68375': 'MROW', '68376': 'MROW', '68377': 'MROW', '68378': 'MROW', '68379': 'MROW', '68380': 'MROW', '68381': 'MROW', '68382': 'MROW', '68401': 'MROW', '68402': 'MROW', '68403': 'MROW', '68404': 'MROW', '68405': 'MROW', '68406': 'MROW', '68407': 'MROW', '68409': 'MROW', '68410': 'MROW', '68413': 'MROW', '68414': 'MROW', '68415': 'MROW', '68416': 'MROW', '68417': 'MROW', '68418': 'MROW', '68419': 'MROW', '68420': 'MROW', '68421': 'MROW', '68422': 'MROW', '68423': 'MROW', '68424': 'MROW', '68428': 'MROW', '68429': 'MROW', '68430': 'MROW', '68431': 'MROW', '68433': 'MROW', '68434': 'MROW', '68436': 'MROW', '68437': 'MROW', '68438': 'MROW', '68439': 'MROW', '68440': 'MROW', '68441': 'MROW', '68442': 'MROW', '68443': 'MROW', '68444': 'MROW', '68445': 'MROW', '68446': 'MROW', '68447': 'MROW', '68448': 'MROW', '68450': 'MROW', '68452': 'MROW', '68453': 'MROW', '68454': 'MROW', '68455': 'MROW', '68456': 'MROW', '68457': 'MROW', '68458': 'MROW', '68460': 'MROW', '68461': 'MROW', '68462': 'MROW', '68463': 'MROW', '68464': 'MROW', '68465': 'MROW', '68466': 'MROW', '68467': 'MROW', '68501': 'MROW', '68502': 'MROW', '68503': 'MROW', '68504': 'MROW', '68505': 'MROW', '68506': 'MROW', '68507': 'MROW', '68508': 'MROW', '68509': 'MROW', '68510': 'MROW', '68512': 'MROW', '68514': 'MROW', '68516': 'MROW', '68517': 'MROW', '68520': 'MROW', '68521': 'MROW', '68522': 'MROW', '68523': 'MROW', '68524': 'MROW', '68526': 'MROW', '68527': 'MROW', '68528': 'MROW', '68529': 'MROW', '68531': 'MROW', '68532': 'MROW', '68542': 'MROW', '68544': 'MROW', '68583': 'MROW', '68588': 'MROW', '68601': 'MROW', '68602': 'MROW', '68620': 'MROW', '68621': 'MROW', '68622': 'MROW', '68623': 'MROW', '68624': 'MROW', '68626': 'MROW', '68627': 'MROW', '68628': 'MROW', '68629': 'MROW', '68631': 'MROW', '68632': 'MROW', '68633': 'MROW', '68634': 'MROW', '68635': 'MROW', '68636': 'MROW', '68637': 'MROW', '68638': 'MROW', '68640': 'MROW', '68641': 'MROW', '68642': 'MROW', '68643': 'MROW', '68644': 'MROW', '68647': 'MROW', '68648': 'MROW', '68649': 'MROW', '68651': 'MROW', '68652': 'MROW', '68653': 'MROW', '68654': 'MROW', '68655': 'MROW', '68658': 'MROW', '68659': 'MROW', '68660': 'MROW', '68661': 'MROW', '68662': 'MROW', '68663': 'MROW', '68664': 'MROW', '68665': 'MROW', '68666': 'MROW', '68667': 'MROW', '68669': 'MROW', '68701': 'MROW', '68702': 'MROW', '68710': 'MROW', '68711': 'MROW', '68713': 'MROW', '68714': 'MROW', '68715': 'MROW', '68716': 'MROW', '68717': 'MROW', '68718': 'MROW', '68719': 'MROW', '68720': 'MROW', '68722': 'MROW', '68723': 'MROW', '68724': 'MROW', '68725': 'MROW', '68726': 'MROW', '68727': 'MROW', '68728': 'MROW', '68729': 'MROW', '68730': 'MROW', '68731': 'MROW', '68732': 'MROW', '68733': 'MROW', '68734': 'MROW', '68735': 'MROW', '68736': 'MROW', '68738': 'MROW', '68739': 'MROW', '68740': 'MROW', '68741': 'MROW', '68742': 'MROW', '68743': 'MROW', '68745': 'MROW', '68746': 'MROW', '68747': 'MROW', '68748': 'MROW', '68749': 'MROW', '68751': 'MROW', '68752': 'MROW', '68753': 'MROW', '68755': 'MROW', '68756': 'MROW', '68757': 'MROW', '68758': 'MROW', '68759': 'MROW', '68760': 'MROW', '68761': 'MROW', '68763': 'MROW', '68764': 'MROW', '68765': 'MROW', '68766': 'MROW', '68767': 'MROW', '68768': 'MROW', '68769': 'MROW', '68770': 'MROW', '68771': 'MROW', '68773': 'MROW', '68774': 'MROW', '68776': 'MROW', '68777': 'MROW', '68778': 'MROW', '68779': 'MROW', '68780': 'MROW', '68781': 'MROW', '68783': 'MROW', '68784': 'MROW', '68785': 'MROW', '68786': 'MROW', '68787': 'MROW', '68788': 'MROW', '68789': 'MROW', '68790': 'MROW', '68791': 'MROW', '68792': 'MROW', '68801': 'MROW', '68802': 'MROW', '68803': 'MROW', '68810': 'MROW', '68812': 'MROW', '68813': 'MROW', '68814': 'MROW', '68815': 'MROW', '68816': 'MROW', '68817': 'MROW', '68818': 'MROW', '68820': 'MROW', '68821': 'MROW', '68822': 'MROW', '68823': 'MROW', '68824': 'MROW', '68825': 'MROW', '68826': 'MROW', '68827': 'MROW', '68828': 'MROW', '68831': 'MROW', '68832': 'MROW', '68833': 'MROW', '68834': 'MROW', '68835': 'MROW', '68836': 'MROW', '68837': 'MROW', '68838': 'MROW', '68840': 'MROW', '68841': 'MROW', '68842': 'MROW', '68843': 'MROW', '68844': 'MROW', '68845': 'MROW', '68846': 'MROW', '68847': 'MROW', '68848': 'MROW', '68849': 'MROW', '68850': 'MROW', '68852': 'MROW', '68853': 'MROW', '68854': 'MROW', '68855': 'MROW', '68856': 'MROW', '68858': 'MROW', '68859': 'MROW', '68860': 'MROW', '68861': 'MROW', '68862': 'MROW', '68863': 'MROW', '68864': 'MROW', '68865': 'MROW', '68866': 'MROW', '68869': 'MROW', '68870': 'MROW', '68871': 'MROW', '68872': 'MROW', '68873': 'MROW', '68874': 'MROW', '68875': 'MROW', '68876': 'MROW', '68878': 'MROW', '68879': 'MROW', '68881': 'MROW', '68882': 'MROW', '68883': 'MROW', '68901': 'MROW', '68902': 'MROW', '68920': 'MROW', '68922': 'MROW', '68923': 'MROW', '68924': 'MROW', '68925': 'MROW', '68926': 'MROW', '68927': 'MROW', '68928': 'MROW', '68929': 'MROW', '68930': 'MROW', '68932': 'MROW', '68933': 'MROW', '68934': 'MROW', '68935': 'MROW', '68936': 'MROW', '68937': 'MROW', '68938': 'MROW', '68939': 'MROW', '68940': 'MROW', '68941': 'MROW', '68942': 'MROW', '68943': 'MROW', '68944': 'MROW', '68945': 'MROW', '68946': 'MROW', '68947': 'MROW', '68948': 'MROW', '68949': 'MROW', '68950': 'MROW', '68952': 'MROW', '68954': 'MROW', '68955': 'MROW', '68956': 'MROW', '68957': 'MROW', '68958': 'MROW', '68959': 'MROW', '68960': 'MROW', '68961': 'MROW', '68964': 'MROW', '68966': 'MROW', '68967': 'MROW', '68969': 'MROW', '68970': 'MROW', '68971': 'MROW', '68972': 'MROW', '68973': 'MROW', '68974': 'MROW', '68975': 'MROW', '68976': 'MROW', '68977': 'MROW', '68978': 'MROW', '68979': 'MROW', '68980': 'MROW', '68981': 'MROW', '68982': 'MROW', '69001': 'MROW', '69020': 'MROW', '69021': 'RMPA', '69022': 'MROW', '69023': 'RMPA', '69024': 'MROW', '69025': 'MROW', '69026': 'MROW', '69027': 'MROW', '69028': 'MROW', '69029': 'MROW', '69030': 'RMPA', '69032': 'RMPA', '69033': 'RMPA', '69034': 'MROW', '69036': 'MROW', '69037': 'MROW', '69038': 'MROW', '69039': 'MROW', '69040': 'MROW', '69041': 'MROW', '69042': 'MROW', '69043': 'MROW', '69044': 'MROW', '69045': 'RMPA', '69046': 'MROW', '69101': 'MROW', '69103': 'MROW', '69120': 'MROW', '69121': 'RMPA', '69122': 'RMPA', '69123': 'MROW', '69125': 'RMPA', '69127': 'RMPA', '69128': 'RMPA', '69129': 'RMPA', '69130': 'MROW', '69131': 'RMPA', '69132': 'MROW', '69133': 'RMPA', '69134': 'RMPA', '69135': 'MROW', '69138': 'MROW', '69140': 'RMPA', '69141': 'RMPA', '69142': 'MROW', '69143': 'MROW', '69144': 'RMPA', '69145': 'RMPA', '69146': 'RMPA', '69147': 'RMPA', '69148': 'RMPA', '69149': 'RMPA', '69150': 'RMPA', '69151': 'MROW', '69152': 'MROW', '69153': 'RMPA', '69154': 'RMPA', '69155': 'RMPA', '69156': 'RMPA', '69157': 'MROW', '69160': 'MROW', '69161': 'MROW', '69162': 'RMPA', '69163': 'MROW', '69165': 'MROW', '69166': 'MROW', '69167': 'MROW', '69168': 'RMPA', '69169': 'RMPA', '69170': 'MROW', '69171': 'MROW', '69190': 'RMPA', '69201': 'MROW', '69210': 'MROW', '69211': 'MROW', '69212': 'MROW', '69214': 'MROW', '69216': 'MROW', '69217': 'MROW', '69218': 'MROW', '69219': 'MROW', '69220': 'MROW', '69221': 'MROW', '69301': 'RMPA', '69331': 'RMPA', '69333': 'MROW', '69334': 'RMPA', '69335': 'RMPA', '69336': 'RMPA', '69337': 'RMPA', '69339': 'RMPA', '69340': 'RMPA', '69341': 'RMPA', '69343': 'MROW', '69345': 'RMPA', '69346': 'RMPA', '69347': 'RMPA', '69348': 'RMPA', '69350': 'MROW', '69351': 'RMPA', '69352': 'RMPA', '69353': 'RMPA', '69354': 'RMPA', '69355': 'RMPA', '69356': 'RMPA', '69357': 'RMPA', '69358': 'RMPA', '69360': 'MROW', '69361': 'RMPA', '69363': 'MROW', '69365': 'RMPA', '69366': 'MROW', '69367': 'RMPA', '70001': 'SRMV', '70002': 'SRMV', '70003': 'SRMV', '70004': 'SRMV', '70005': 'SRMV', '70006': 'SRMV', '70009': 'SRMV', '70010': 'SRMV', '70011': 'SRMV', '70030': 'SRMV', '70031': 'SRMV', '70032': 'SRMV', '70033': 'SRMV', '70036': 'SRMV', '70037': 'SRMV', '70038': 'SRMV', '70039': 'SRMV', '70040': 'SRMV', '70041': 'SRMV', '70043': 'SRMV', '70044': 'SRMV', '70047': 'SRMV', '70049': 'SRMV', '70050': 'SRMV', '70051': 'SRMV', '70052': 'SRMV', '70053': 'SRMV', '70054': 'SRMV', '70055': 'SRMV', '70056': 'SRMV', '70057': 'SRMV', '70058': 'SRMV', '70059': 'SRMV', '70060': 'SRMV', '70062': 'SRMV', '70063': 'SRMV', '70064': 'SRMV', '70065': 'SRMV', '70067': 'SRMV', '70068': 'SRMV', '70069': 'SRMV', '70070': 'SRMV', '70071': 'SRMV', '70072': 'SRMV', '70073': 'SRMV', '70075': 'SRMV', '70076': 'SRMV', '70078': 'SRMV', '70079': 'SRMV', '70080': 'SRMV', '70081': 'SRMV', '70082': 'SRMV', '70083': 'SRMV', '70084': 'SRMV', '70085': 'SRMV', '70086': 'SRMV', '70087': 'SRMV', '70090': 'SRMV', '70091': 'SRMV', '70092': 'SRMV', '70093': 'SRMV', '70094': 'SRMV', '70096': 'SRMV', '70097': 'SRMV', '70112': 'SRMV', '70113': 'SRMV', '70114': 'SRMV', '70115': 'SRMV', '70116': 'SRMV', '70117': 'SRMV', '70118': 'SRMV', '70119': 'SRMV', '70121': 'SRMV', '70122': 'SRMV', '70123': 'SRMV', '70124': 'SRMV', '70125': 'SRMV', '70126': 'SRMV', '70127': 'SRMV', '70128': 'SRMV', '70129': 'SRMV', '70130': 'SRMV', '70131': 'SRMV', '70139': 'SRMV', '70140': 'SRMV', '70141': 'SRMV', '70142': 'SRMV', '70143': 'SRMV', '70145': 'SRMV', '70146': 'SRMV', '70148': 'SRMV', '70149': 'SRMV', '70150': 'SRMV', '70151': 'SRMV', '70152': 'SRMV', '70153': 'SRMV', '70154': 'SRMV', '70156': 'SRMV', '70157': 'SRMV', '70158': 'SRMV', '70159': 'SRMV', '70160': 'SRMV', '70161': 'SRMV', '70162': 'SRMV', '70163': 'SRMV', '70164': 'SRMV', '70165': 'SRMV', '70166': 'SRMV', '70167': 'SRMV', '70170': 'SRMV', '70172': 'SRMV', '70174': 'SRMV', '70175': 'SRMV', '70176': 'SRMV', '70177': 'SRMV', '70178': 'SRMV', '70179': 'SRMV', '70181': 'SRMV', '70182': 'SRMV', '70183': 'SRMV', '70184': 'SRMV', '70185': 'SRMV', '70186': 'SRMV', '70187': 'SRMV', '70189': 'SRMV', '70190': 'SRMV', '70195': 'SRMV', '70301': 'SRMV', '70302': 'SRMV', '70310': 'SRMV', '70339': 'SPSO', '70340': 'SPSO', '70341': 'SRMV', '70342': 'SPSO', '70343': 'SRMV', '70344': 'SRMV', '70345': 'SRMV', '70346': 'SRMV', '70352': 'SRMV', '70353': 'SRMV', '70354': 'SRMV', '70355': 'SRMV', '70356': 'SRMV', '70357': 'SRMV', '70358': 'SRMV', '70359': 'SRMV', '70360': 'SRMV', '70361': 'SRMV', '70363': 'SRMV', '70364': 'SRMV', '70371': 'SRMV', '70372': 'SRMV', '70373': 'SRMV', '70374': 'SRMV', '70375': 'SRMV', '70377': 'SRMV', '70380': 'SPSO', '70381': 'SPSO', '70390': 'SRMV', '70391': 'SRMV', '70392': 'SPSO', '70393': 'SRMV', '70394': 'SRMV', '70395': 'SRMV', '70397': 'SRMV', '70401': 'SRMV', '70402': 'SRMV', '70403': 'SRMV', '70404': 'SRMV', '70420': 'SPSO', '70421': 'SRMV', '70422': 'SRMV', '70426': 'SRMV', '70427': 'SPSO', '70429': 'SRMV', '70431': 'SPSO', '70433': 'SPSO', '70434': 'SPSO', '70435': 'SPSO', '70436': 'SRMV', '70437': 'SPSO', '70438': 'SPSO', '70441': 'SRMV', '70442': 'SRMV', '70443': 'SRMV', '70444': 'SRMV', '70445': 'SPSO', '70446': 'SRMV', '70447': 'SPSO', '70448': 'SPSO', '70449': 'SRMV', '70450': 'SPSO', '70451': 'SRMV', '70452': 'SPSO', '70453': 'SRMV', '70454': 'SPSO', '70455': 'SPSO', '70456': 'SRMV', '70457': 'SPSO', '70458': 'SPSO', '70459': 'SPSO', '70460': 'SPSO', '70461': 'SPSO', '70462': 'SRMV', '70463': 'SRMV', '70464': 'SRMV', '70465': 'SRMV', '70466': 'SRMV', '70467': 'SRMV', '70469': 'SPSO', '70470': 'SRMV', '70471': 'SPSO', '70500': 'SRMV', '70501': 'SPSO', '70502': 'SPSO', '70503': 'SPSO', '70504': 'SPSO', '70505': 'SPSO', '70506': 'SPSO', '70507': 'SPSO', '70508': 'SPSO', '70509': 'SPSO', '70510': 'SRMV', '70511': 'SRMV', '70512': 'SPSO', '70513': 'SRMV', '70514': 'SPSO', '70515': 'SRMV', '70516': 'SPSO', '70517': 'SPSO', '70518': 'SPSO', '70519': 'SRMV', '70520': 'SRMV', '70521': 'SRMV', '70522': 'SPSO', '70523': 'SPSO', '70524': 'SPSO', '70525': 'SPSO', '70526': 'SPSO', '70527': 'SPSO', '70528': 'SRMV', '70529': 'SRMV', '70531': 'SRMV', '70532': 'SRMV', '70533': 'SPSO', '70534': 'SRMV', '70535': 'SPSO', '70537': 'SRMV', '70538': 'SPSO', '70540': 'SPSO', '70541': 'SRMV', '70542': 'SRMV', '70543': 'SPSO', '70544': 'SPSO', '70546': 'SRMV', '70548': 'SRMV', '70549': 'SRMV', '70550': 'SPSO', '70551': 'SRMV', '70552': 'SPSO', '70554': 'SRMV', '70555': 'SRMV', '70556': 'SRMV', '70558': 'SRMV', '70559': 'SRMV', '70560': 'SPSO', '70562': 'SPSO', '70563': 'SPSO', '70569': 'SPSO', '70570': 'SPSO', '70571': 'SPSO', '70575': 'SRMV', '70576': 'SPSO', '70577': 'SPSO', '70578': 'SPSO', '70580': 'SPSO', '70581': 'SRMV', '70582': 'SPSO', '70583': 'SPSO', '70584': 'SRMV', '70585': 'SPSO', '70586': 'SRMV', '70589': 'SPSO', '70591': 'SRMV', '70592': 'SPSO', '70593': 'SRMV', '70595': 'SRMV', '70596': 'SRMV', '70598': 'SPSO', '70601': 'SRMV', '70602': 'SRMV', '70605': 'SRMV', '70606': 'SRMV', '70607': 'SRMV', '70609': 'SRMV', '70611': 'SRMV', '70612': 'SRMV', '70615': 'SRMV', '70616': 'SRMV', '70629': 'SRMV', '70630': 'SRMV', '70631': 'SRMV', '70632': 'SRMV', '70633': 'SRMV', '70634': 'SRMV', '70637': 'SRMV', '70638': 'SPSO', '70639': 'SRMV', '70640': 'SRMV', '70643': 'SRMV', '70644': 'SPSO', '70645': 'SRMV', '70646': 'SRMV', '70647': 'SRMV', '70648': 'SRMV', '70650': 'SRMV', '70651': 'SRMV', '70652': 'SRMV', '70653': 'SRMV', '70654': 'SRMV', '70655': 'SRMV', '70656': 'SRMV', '70657': 'SRMV', '70658': 'SRMV', '70659': 'SPSO', '70660': 'SRMV', '70661': 'SRMV', '70662': 'SRMV', '70663': 'SRMV', '70664': 'SRMV', '70665': 'SRMV', '70668': 'SRMV', '70669': 'SRMV', '70704': 'SRMV', '70706': 'SRMV', '70707': 'SRMV', '70710': 'SRMV', '70711': 'SRMV', '70712': 'SRMV', '70714': 'SRMV', '70715': 'SPSO', '70718': 'SRMV', '70719': 'SRMV', '70721': 'SRMV', '70722': 'SRMV', '70723': 'SRMV', '70725': 'SRMV', '70726': 'SRMV', '70727': 'SRMV', '70728': 'SRMV', '70729': 'SRMV', '70730': 'SRMV', '70732': 'SRMV', '70733': 'SRMV', '70734': 'SRMV', '70736': 'SRMV', '70737': 'SRMV', '70738': 'SRMV', '70739': 'SRMV', '70740': 'SRMV', '70743': 'SRMV', '70744': 'SRMV', '70747': 'SRMV', '70748': 'SRMV', '70749': 'SRMV', '70750': 'SRMV', '70752': 'SRMV', '70753': 'SPSO', '70754': 'SRMV', '70755': 'SRMV', '70756': 'SRMV', '70757': 'SRMV', '70759': 'SRMV', '70760': 'SRMV', '70761': 'SRMV', '70762': 'SRMV', '70763': 'SRMV', '70764': 'SRMV', '70765': 'SRMV', '70767': 'SRMV', '70769': 'SRMV', '70770': 'SRMV', '70772': 'SRMV', '70773': 'SRMV', '70774': 'SRMV', '70775': 'SRMV', '70776': 'SRMV', '70777': 'SRMV', '70778': 'SRMV', '70780': 'SRMV', '70782': 'SRMV', '70783': 'SRMV', '70784': 'SRMV', '70785': 'SRMV', '70786': 'SRMV', '70787': 'SRMV', '70788': 'SRMV', '70789': 'SRMV', '70791': 'SRMV', '70792': 'SRMV', '70801': 'SRMV', '70802': 'SRMV', '70803': 'SRMV', '70804': 'SRMV', '70805': 'SRMV', '70806': 'SRMV', '70807': 'SRMV', '70808': 'SRMV', '70809': 'SRMV', '70810': 'SRMV', '70811': 'SRMV', '70812': 'SRMV', '70813': 'SRMV', '70814': 'SRMV', '70815': 'SRMV', '70816': 'SRMV', '70817': 'SRMV', '70818': 'SRMV', '70819': 'SRMV', '70820': 'SRMV', '70821': 'SRMV', '70822': 'SRMV', '70823': 'SRMV', '70825': 'SRMV', '70826': 'SRMV', '70827': 'SRMV', '70831': 'SRMV', '70833': 'SRMV', '70835': 'SRMV', '70836': 'SRMV', '70837': 'SRMV', '70873': 'SRMV', '70874': 'SRMV', '70879': 'SRMV', '70884': 'SRMV', '70891': 'SRMV', '70892': 'SRMV', '70893': 'SRMV', '70894': 'SRMV', '70895': 'SRMV', '70896': 'SRMV', '70898': 'SRMV', '71001': 'SRMV', '71002': 'SRMV', '71003': 'SRMV', '71004': 'SPSO', '71006': 'SRMV', '71007': 'SPSO', '71008': 'SRMV', '71009': 'SPSO', '71016': 'SRMV', '71018': 'SRMV', '71019': 'SRMV', '71021': 'SRMV', '71023': 'SRMV', '71024': 'SRMV', '71027': 'SPSO', '71028': 'SRMV', '71029': 'SPSO', '71030': 'SPSO', '71031': 'SRMV', '71032': 'SPSO', '71033': 'SPSO', '71034': 'SRMV', '71037': 'SRMV', '71038': 'SRMV', '71039': 'SRMV', '71040': 'SRMV', '71043': 'SPSO', '71044': 'SPSO', '71045': 'SRMV', '71046': 'SPSO', '71047': 'SPSO', '71048': 'SRMV', '71049': 'SPSO', '71050': 'SPSO', '71051': 'SRMV', '71052': 'SPSO', '71055': 'SRMV', '71058': 'SRMV', '71060': 'SPSO', '71061': 'SPSO', '71063': 'SPSO', '71064': 'SRMV', '71065': 'SPSO', '71066': 'SPSO', '71067': 'SRMV', '71068': 'SRMV', '71069': 'SPSO', '71070': 'SRMV', '71071': 'SRMV', '71072': 'SRMV', '71073': 'SRMV', '71075': 'SRMV', '71078': 'SPSO', '71079': 'SRMV', '71080': 'SRMV', '71082': 'SPSO', '71101': 'SPSO', '71102': 'SPSO', '71103': 'SPSO', '71104': 'SPSO', '71105': 'SPSO', '71106': 'SPSO', '71107': 'SPSO', '71108': 'SPSO', '71109': 'SPSO', '71110': 'SPSO', '71111': 'SPSO', '71112': 'SPSO', '71113': 'SPSO', '71115': 'SPSO', '71118': 'SPSO', '71119': 'SPSO', '71120': 'SPSO', '71129': 'SPSO', '71130': 'SPSO', '71133': 'SPSO', '71134': 'SPSO', '71135': 'SPSO', '71136': 'SPSO', '71137': 'SPSO', '71138': 'SPSO', '71148': 'SPSO', '71149': 'SPSO', '71150': 'SPSO', '71151': 'SPSO', '71152': 'SPSO', '71153': 'SPSO', '71154': 'SPSO', '71156': 'SPSO', '71161': 'SPSO', '71162': 'SPSO', '71163': 'SPSO', '71164': 'SPSO', '71165': 'SPSO', '71166': 'SPSO', '71171': 'SPSO', '71172': 'SPSO', '71201': 'SRMV', '71202': 'SRMV', '71203': 'SRMV', '71207': 'SRMV', '71209': 'SRMV', '71210': 'SRMV', '71211': 'SRMV', '71212': 'SRMV', '71213': 'SRMV', '71217': 'SRMV', '71218': 'SRMV', '71219': 'SRMV', '71220': 'SRMV', '71221': 'SRMV', '71222': 'SRMV', '71223': 'SRMV', '71225': 'SRMV', '71226': 'SRMV', '71227': 'SRMV', '71229': 'SRMV', '71230': 'SRMV', '71232': 'SRMV', '71233': 'SRMV', '71234': 'SRMV', '71235': 'SRMV', '71237': 'SRMV', '71238': 'SRMV', '71240': 'SRMV', '71241': 'SRMV', '71242': 'SRMV', '71243': 'SRMV', '71245': 'SRMV', '71247': 'SRMV', '71249': 'SRMV', '71250': 'SRMV', '71251': 'SRMV', '71253': 'SRMV', '71254': 'SRMV', '71256': 'SRMV', '71259': 'SRMV', '71260': 'SRMV', '71261': 'SRMV', '71263': 'SRMV', '71264': 'SRMV', '71266': 'SRMV', '71268': 'SRMV', '71269': 'SRMV', '71270': 'SRMV', '71272': 'SRMV', '71273': 'SRMV', '71275': 'SRMV', '71276': 'SRMV', '71277': 'SRMV', '71279': 'SRMV', '71280': 'SRMV', '71281': 'SRMV', '71282': 'SRMV', '71284': 'SRMV', '71286': 'SRMV', '71291': 'SRMV', '71292': 'SRMV', '71294': 'SRMV', '71295': 'SRMV', '71301': 'SPSO', '71302': 'SPSO', '71303': 'SPSO', '71306': 'SPSO', '71307': 'SPSO', '71309': 'SPSO', '71315': 'SPSO', '71316': 'SPSO', '71320': 'SPSO', '71322': 'SPSO', '71323': 'SPSO', '71324': 'SRMV', '71325': 'SRMV', '71326': 'SRMV', '71327': 'SPSO', '71328': 'SPSO', '71329': 'SPSO', '71330': 'SPSO', '71331': 'SPSO', '71333': 'SPSO', '71334': 'SRMV', '71336': 'SRMV', '71339': 'SPSO', '71340': 'SRMV', '71341': 'SPSO', '71342': 'SPSO', '71343': 'SPSO', '71345': 'SPSO', '71346': 'SPSO', '71348': 'SPSO', '71350': 'SPSO', '71351': 'SPSO', '71353': 'SPSO', '71354': 'SRMV', '71355': 'SPSO', '71356': 'SPSO', '71357': 'SRMV', '71358': 'SPSO', '71359': 'SPSO', '71360': 'SPSO', '71361': 'SPSO', '71362': 'SPSO', '71363': 'SRMV', '71365': 'SPSO', '71366': 'SRMV', '71367': 'SRMV', '71368': 'SRMV', '71369': 'SPSO', '71371': 'SPSO', '71373': 'SPSO', '71375': 'SRMV', '71377': 'SRMV', '71378': 'SRMV', '71401': 'SRMV', '71403': 'SRMV', '71404': 'SPSO', '71405': 'SPSO', '71406': 'SPSO', '71407': 'SPSO', '71409': 'SPSO', '71410': 'SRMV', '71411': 'SPSO', '71414': 'SPSO', '71415': 'SRMV', '71416': 'SPSO', '71417': 'SPSO', '71418': 'SRMV', '71419': 'SPSO', '71422': 'SRMV', '71423': 'SPSO', '71424': 'SPSO', '71425': 'SRMV', '71426': 'SRMV', '71427': 'SPSO', '71428': 'SPSO', '71429': 'SPSO', '71430': 'SRMV', '71431': 'SPSO', '71432': 'SPSO', '71433': 'SRMV', '71434': 'SPSO', '71435': 'SRMV', '71438': 'SRMV', '71439': 'SPSO', '71440': 'SRMV', '71441': 'SRMV', '71443': 'SPSO', '71446': 'SRMV', '71447': 'SPSO', '71448': 'SPSO', '71449': 'SPSO', '71450': 'SPSO', '71452': 'SPSO', '71454': 'SPSO', '71455': 'SPSO', '71456': 'SPSO', '71457': 'SPSO', '71458': 'SPSO', '71459': 'SRMV', '71460': 'SPSO', '71461': 'SRMV', '71462': 'SPSO', '71463': 'SRMV', '71465': 'SRMV', '71466': 'SPSO', '71467': 'SPSO', '71468': 'SPSO', '71469': 'SPSO', '71471': 'SRMV', '71472': 'SPSO', '71473': 'SRMV', '71474': 'SPSO', '71475': 'SPSO', '71477': 'SPSO', '71479': 'SRMV', '71480': 'SRMV', '71483': 'SPSO', '71485': 'SPSO', '71486': 'SPSO', '71496': 'SPSO', '71497': 'SPSO', '71601': 'SRMV', '71602': 'SRMV', '71603': 'SRMV', '71611': 'SRMV', '71612': 'SRMV', '71613': 'SRMV', '71630': 'SRMV', '71631': 'SRMV', '71635': 'SRMV', '71638': 'SRMV', '71639': 'SRMV', '71640': 'SRMV', '71642': 'SRMV', '71643': 'SRMV', '71644': 'SRMV', '71646': 'SRMV', '71647': 'SRMV', '71651': 'SRMV', '71652': 'SRMV', '71653': 'SRMV', '71654': 'SRMV', '71655': 'SRMV', '71656': 'SRMV', '71657': 'SRMV', '71658': 'SRMV', '71659': 'SRMV', '71660': 'SRMV', '71661': 'SRMV', '71662': 'SRMV', '71663': 'SRMV', '71665': 'SRMV', '71666': 'SRMV', '71667': 'SRMV', '71670': 'SRMV', '71671': 'SRMV', '71674': 'SRMV', '71675': 'SRMV', '71676': 'SRMV', '71677': 'SRMV', '71678': 'SRMV', '71701': 'SRMV', '71711': 'SRMV', '71720': 'SRMV', '71721': 'SRMV', '71722': 'SRMV', '71724': 'SRMV', '71725': 'SRMV', '71726': 'SRMV', '71728': 'SRMV', '71730': 'SRMV', '71731': 'SRMV', '71740': 'SRMV', '71742': 'SRMV', '71743': 'SRMV', '71744': 'SRMV', '71745': 'SRMV', '71747': 'SRMV', '71748': 'SRMV', '71749': 'SRMV', '71750': 'SRMV', '71751': 'SRMV', '71752': 'SRMV', '71753': 'SRMV', '71754': 'SRMV', '71758': 'SRMV', '71759': 'SRMV', '71762': 'SRMV', '71763': 'SRMV', '71764': 'SRMV', '71765': 'SRMV', '71766': 'SRMV', '71768': 'SRMV', '71770': 'SRMV', '71772': 'SRMV', '71801': 'SRMV', '71802': 'SPSO', '71820': 'SRMV', '71822': 'SRMV', '71823': 'SRMV', '71825': 'SRMV', '71826': 'SRMV', '71827': 'SRMV', '71828': 'SRMV', '71831': 'SRMV', '71832': 'SRMV', '71833': 'SRMV', '71834': 'SRMV', '71835': 'SPSO', '71836': 'SRMV', '71837': 'SRMV', '71838': 'SRMV', '71839': 'SRMV', '71840': 'SRMV', '71841': 'SRMV', '71842': 'SRMV', '71845': 'SRMV', '71846': 'SRMV', '71847': 'SRMV', '71851': 'SRMV', '71852': 'SRMV', '71853': 'SRMV', '71854': 'SRMV', '71855': 'SRMV', '71857': 'SRMV', '71858': 'SRMV', '71859': 'SRMV', '71860': 'SRMV', '71861': 'SRMV', '71862': 'SRMV', '71864': 'SRMV', '71865': 'SPSO', '71866': 'SRMV', '71901': 'SRMV', '71902': 'SRMV', '71903': 'SRMV', '71909': 'SRMV', '71910': 'SRMV', '71913': 'SRMV', '71914': 'SRMV', '71920': 'SRMV', '71921': 'SRMV', '71922': 'SRMV', '71923': 'SRMV', '71929': 'SRMV', '71932': 'SRMV', '71933': 'SRMV', '71935': 'SRMV', '71937': 'SPSO', '71940': 'SRMV', '71941': 'SRMV', '71942': 'SRMV', '71943': 'SRMV', '71944': 'SRMV', '71945': 'SPSO', '71949': 'SRMV', '71950': 'SRMV', '71952': 'SRMV', '71953': 'SRMV', '71956': 'SRMV', '71957': 'SRMV', '71958': 'SRMV', '71959': 'SRMV', '71960': 'SRMV', '71961': 'SRMV', '71962': 'SRMV', '71964': 'SRMV', '71965': 'SRMV', '71966': 'SRMV', '71968': 'SRMV', '71969': 'SRMV', '71970': 'SRMV', '71971': 'SRMV', '71972': 'SRMV', '71973': 'SRMV', '71998': 'SRMV', '71999': 'SRMV', '72001': 'SRMV', '72002': 'SRMV', '72003': 'SRMV', '72004': 'SRMV', '72005': 'SRMV', '72006': 'SRMV', '72007': 'SRMV', '72010': 'SRMV', '72011': 'SRMV', '72012': 'SRMV', '72013': 'SRMV', '72014': 'SRMV', '72015': 'SRMV', '72016': 'SRMV', '72017': 'SRMV', '72018': 'SRMV', '72019': 'SRMV', '72020': 'SRMV', '72021': 'SRMV', '72022': 'SRMV', '72023': 'SRMV', '72024': 'SRMV', '72025': 'SRMV', '72026': 'SRMV', '72027': 'SRMV', '72028': 'SRMV', '72029': 'SRMV', '72030': 'SRMV', '72031': 'SRMV', '72032': 'SRMV', '72033': 'SRMV', '72034': 'SRMV', '72035': 'SRMV', '72036': 'SRMV', '72037': 'SRMV', '72038': 'SRMV', '72039': 'SRMV', '72040': 'SRMV', '72041': 'SRMV', '72042': 'SRMV', '72043': 'SRMV', '72044': 'SRMV', '72045': 'SRMV', '72046': 'SRMV', '72047': 'SRMV', '72048': 'SRMV', '72051': 'SRMV', '72052': 'SRMV', '72053': 'SRMV', '72055': 'SRMV', '72057': 'SRMV', '72058': 'SRMV', '72059': 'SRMV', '72060': 'SRMV', '72061': 'SRMV', '72063': 'SRMV', '72064': 'SRMV', '72065': 'SRMV', '72066': 'SRMV', '72067': 'SRMV', '72068': 'SRMV', '72069': 'SRMV', '72070': 'SRMV', '72072': 'SRMV', '72073': 'SRMV', '72074': 'SRMV', '72075': 'SRMV', '72076': 'SRMV', '72078': 'SRMV', '72079': 'SRMV', '72080': 'SRMV', '72081': 'SRMV', '72082': 'SRMV', '72083': 'SRMV', '72084': 'SRMV', '72085': 'SRMV', '72086': 'SRMV', '72087': 'SRMV', '72088': 'SRMV', '72089': 'SRMV', '72099': 'SRMV', '72101': 'SRMV', '72102': 'SRMV', '72103': 'SRMV', '72104': 'SRMV', '72105': 'SRMV', '72106': 'SRMV', '72107': 'SRMV', '72108': 'SRMV', '72110': 'SRMV', '72111': 'SRMV', '72112': 'SRMV', '72113': 'SRMV', '72114': 'SRMV', '72115': 'SRMV', '72116': 'SRMV', '72117': 'SRMV', '72118': 'SRMV', '72119': 'SRMV', '72120': 'SRMV', '72121': 'SRMV', '72122': 'SRMV', '72123': 'SRMV', '72124': 'SRMV', '72125': 'SRMV', '72126': 'SRMV', '72127': 'SRMV', '72128': 'SRMV', '72129': 'SRMV', '72130': 'SRMV', '72131': 'SRMV', '72132': 'SRMV', '72133': 'SRMV', '72134': 'SRMV', '72135': 'SRMV', '72136': 'SRMV', '72137': 'SRMV', '72139': 'SRMV', '72140': 'SRMV', '72141': 'SRMV', '72142': 'SRMV', '72143': 'SRMV', '72145': 'SRMV', '72149': 'SRMV', '72150': 'SRMV', '72152': 'SRMV', '72153': 'SRMV', '72156': 'SRMV', '72157': 'SRMV', '72158': 'SRMV', '72160': 'SRMV', '72164': 'SRMV', '72165': 'SRMV', '72166': 'SRMV', '72167': 'SRMV', '72168': 'SRMV', '72169': 'SRMV', '72170': 'SRMV', '72173': 'SRMV', '72175': 'SRMV', '72176': 'SRMV', '72178': 'SRMV', '72179': 'SRMV', '72180': 'SRMV', '72181': 'SRMV', '72182': 'SRMV', '72183': 'SRMV', '72190': 'SRMV', '72198': 'SRMV', '72199': 'SRMV', '72201': 'SRMV', '72202': 'SRMV', '72203': 'SRMV', '72204': 'SRMV', '72205': 'SRMV', '72206': 'SRMV', '72207': 'SRMV', '72209': 'SRMV', '72210': 'SRMV', '72211': 'SRMV', '72212': 'SRMV', '72214': 'SRMV', '72215': 'SRMV', '72216': 'SRMV', '72217': 'SRMV', '72219': 'SRMV', '72221': 'SRMV', '72222': 'SRMV', '72223': 'SRMV', '72225': 'SRMV', '72227': 'SRMV', '72231': 'SRMV', '72260': 'SRMV', '72295': 'SRMV', '72301': 'SRMW', '72303': 'SRMW', '72310': 'SRMV', '72311': 'SRMV', '72312': 'SRMV', '72313': 'SRMV', '72315': 'SRMV', '72316': 'SRMV', '72319': 'SRMV', '72320': 'SRMV', '72321': 'SRMV', '72322': 'SRMV', '72324': 'SRMV', '72325': 'SRMV', '72326': 'SRMV', '72327': 'SRMW', '72328': 'SRMV', '72329': 'SRMV', '72330': 'SRMV', '72331': 'SRMV', '72332': 'SRMV', '72333': 'SRMV', '72335': 'SRMV', '72336': 'SRMV', '72338': 'SRTV', '72339': 'SRMV', '72340': 'SRMV', '72341': 'SRMV', '72342': 'SRMV', '72346': 'SRMV', '72347': 'SRMV', '72348': 'SRMV', '72350': 'SRMV', '72351': 'SRMV', '72352': 'SRMV', '72353': 'SRMV', '72354': 'SRMV', '72355': 'SRMV', '72358': 'SRMV', '72359': 'SRMV', '72360': 'SRMV', '72364': 'SRMW', '72365': 'SRMV', '72366': 'SRMV', '72367': 'SRMV', '72368': 'SRMV', '72369': 'SRMV', '72370': 'SRMV', '72372': 'SRMV', '72373': 'SRMV', '72374': 'SRMV', '72376': 'SRMW', '72377': 'SRMV', '72379': 'SRMV', '72383': 'SRMV', '72384': 'SRMV', '72386': 'SRMV', '72387': 'SRMV', '72389': 'SRMV', '72390': 'SRMV', '72391': 'SRMV', '72392': 'SRMV', '72394': 'SRMV', '72395': 'SRMV', '72396': 'SRMV', '72401': 'SPSO', '72402': 'SPSO', '72403': 'SPSO', '72404': 'SPSO', '72405': 'SRMV', '72410': 'SRMV', '72411': 'SPSO', '72412': 'SRMV', '72413': 'SRMV', '72414': 'SRMV', '72415': 'SRMV', '72416': 'SPSO', '72417': 'SRMV', '72419': 'SRMV', '72421': 'SRMV', '72422': 'SRMV', '72424': 'SRMV', '72425': 'SRMV', '72426': 'SRMV', '72427': 'SRMV', '72428': 'SRMV', '72429': 'SRMV', '72430': 'SRMV', '72431': 'SRMV', '72432': 'SRMV', '72433': 'SRMV', '72434': 'SRMV', '72435': 'SRMV', '72436': 'SRMV', '72437': 'SRMV', '72438': 'SRMV', '72439': 'SRMV', '72440': 'SRMV', '72441': 'SRMV', '72442': 'SRMV', '72443': 'SRMV', '72444': 'SRMV', '72445': 'SRMV', '72447': 'SRMV', '72449': 'SRMV', '72450': 'SRMV', '72451': 'SRMV', '72453': 'SRMV', '72454': 'SRMV', '72455': 'SRMV', '72456': 'SRMV', '72457': 'SRMV', '72458': 'SRMV', '72459': 'SRMV', '72460': 'SRMV', '72461': 'SRMV', '72462': 'SRMV', '72464': 'SRMV', '72465': 'SRMV', '72466': 'SRMV', '72467': 'SPSO', '72469': 'SRMV', '72470': 'SRMV', '72471': 'SRMV', '72472': 'SRMV', '72473': 'SRMV', '72474': 'SRMV', '72475': 'SRMV', '72476': 'SRMV', '72478': 'SRMV', '72479': 'SRMV', '72482': 'SRMV', '72501': 'SRMV', '72503': 'SRMV', '72512': 'SRMV', '72513': 'SRMV', '72515': 'SRMV', '72517': 'SRMV', '72519': 'SRMV', '72520': 'SRMV', '72521': 'SRMV', '72522': 'SRMV', '72523': 'SRMV', '72524': 'SRMV', '72525': 'SRMV', '72526': 'SRMV', '72527': 'SRMV', '72528': 'SRMV', '72529': 'SRMV', '72530': 'SRMV', '72531': 'SRMV', '72532': 'SRMV', '72533': 'SRMV', '72534': 'SRMV', '72536': 'SRMV', '72537': 'SRMV', '72538': 'SRMV', '72539': 'SRMV', '72540': 'SRMV', '72542': 'SRMV', '72543': 'SRMV', '72544': 'SRMV', '72545': 'SRMV', '72546': 'SRMV', '72550': 'SRMV', '72553': 'SRMV', '72554': 'SRMV', '72555': 'SRMV', '72556': 'SRMV', '72560': 'SRMV', '72561': 'SRMV', '72562': 'SRMV', '72564': 'SRMV', '72565': 'SRMV', '72566': 'SRMV', '72567': 'SRMV', '72568': 'SRMV', '72569': 'SRMV', '72571': 'SRMV', '72572': 'SRMV', '72573': 'SRMV', '72575': 'SRMV', '72576': 'SRMV', '72577': 'SRMV', '72578': 'SRMV', '72579': 'SRMV', '72581': 'SRMV', '72583': 'SRMV', '72584': 'SRMV', '72585': 'SRMV', '72587': 'SRMV', '72601': 'SPSO', '72602': 'SRMV', '72611': 'SPSO', '72613': 'SPSO', '72615': 'SRMV', '72616': 'SPSO', '72617': 'SRMV', '72619': 'SRMV', '72623': 'SRMV', '72624': 'SPSO', '72626': 'SRMV', '72628': 'SRMV', '72629': 'SRMV', '72630': 'SRMV', '72631': 'SPSO', '72632': 'SPSO', '72633': 'SRMV', '72634': 'SRMV', '72635': 'SRMV', '72636': 'SRMV', '72638': 'SPSO', '72639': 'SRMV', '72640': 'SPSO', '72641': 'SPSO', '72642': 'SRMV', '72644': 'SRMV', '72645': 'SRMV', '72648': 'SPSO', '72650': 'SRMV', '72651': 'SRMV', '72653': 'SRMV', '72654': 'SRMV', '72655': 'SPSO', '72657': 'SRMV', '72658': 'SRMV', '72659': 'SRMV', '72660': 'SPSO', '72661': 'SRMV', '72662': 'SPSO', '72663': 'SRMV', '72666': 'SPSO', '72668': 'SRMV', '72669': 'SRMV', '72670': 'SPSO', '72672': 'SRMV', '72675': 'SPSO', '72677': 'SRMV', '72679': 'SRMV', '72680': 'SRMV', '72682': 'SRMV', '72683': 'SPSO', '72685': 'SPSO', '72686': 'SRMV', '72687': 'SRMV', '72701': 'SPSO', '72702': 'SPSO', '72703': 'SPSO', '72704': 'SPSO', '72711': 'SPSO', '72712': 'SPSO', '72713': 'SRMV', '72714': 'SPSO', '72715': 'SPSO', '72716': 'SPSO', '72717': 'SRMV', '72718': 'SPSO', '72719': 'SPSO', '72721': 'SPSO', '72722': 'SPSO', '72727': 'SPSO', '72728': 'SPSO', '72729': 'SPSO', '72730': 'SPSO', '72732': 'SPSO', '72733': 'SPSO', '72734': 'SPSO', '72735': 'SPSO', '72736': 'SPSO', '72737': 'SPSO', '72738': 'SPSO', '72739': 'SPSO', '72740': 'SPSO', '72741': 'SPSO', '72742': 'SPSO', '72744': 'SPSO', '72745': 'SPSO', '72747': 'SPSO', '72749': 'SPSO', '72751': 'SPSO', '72752': 'SRMV', '72753': 'SRMV', '72756': 'SPSO', '72757': 'SPSO', '72758': 'SPSO', '72760': 'SPSO', '72761': 'SPSO', '72762': 'SPSO', '72764': 'SPSO', '72765': 'SPSO', '72766': 'SPSO', '72768': 'SPSO', '72769': 'SPSO', '72770': 'SPSO', '72773': 'SPSO', '72774': 'SRMV', '72776': 'SPSO', '72801': 'SRMV', '72802': 'SRMV', '72811': 'SRMV', '72812': 'SRMV', '72820': 'SPSO', '72821': 'SRMV', '72823': 'SRMV', '72824': 'SRMV', '72826': 'SRMV', '72827': 'SRMV', '72828': 'SRMV', '72829': 'SRMV', '72830': 'SRMV', '72832': 'SRMV', '72833': 'SRMV', '72834': 'SRMV', '72835': 'SRMV', '72837': 'SRMV', '72838': 'SRMV', '72839': 'SRMV', '72840': 'SRMV', '72841': 'SRMV', '72842': 'SRMV', '72843': 'SRMV', '72845': 'SRMV', '72846': 'SRMV', '72847': 'SRMV', '72851': 'SRMV', '72852': 'SRMV', '72853': 'SRMV', '72854': 'SRMV', '72855': 'SRMV', '72856': 'SRMV', '72857': 'SRMV', '72858': 'SRMV', '72860': 'SRMV', '72863': 'SRMV', '72865': 'SRMV', '72901': 'SPSO', '72902': 'SPSO', '72903': 'SRMV', '72904': 'SRMV', '72905': 'SRMV', '72906': 'SPSO', '72908': 'SRMV', '72913': 'SPSO', '72914': 'SPSO', '72916': 'SRMV', '72917': 'SPSO', '72918': 'SPSO', '72919': 'SRMV', '72921': 'SRMV', '72923': 'SRMV', '72926': 'SRMV', '72927': 'SRMV', '72928': 'SRMV', '72930': 'SRMV', '72932': 'SRMV', '72933': 'SRMV', '72934': 'SRMV', '72935': 'SPSO', '72936': 'SRMV', '72937': 'SRMV', '72938': 'SRMV', '72940': 'SRMV', '72941': 'SRMV', '72943': 'SRMV', '72944': 'SRMV', '72945': 'SPSO', '72946': 'SRMV', '72947': 'SRMV', '72948': 'SRMV', '72949': 'SRMV', '72950': 'SRMV', '72951': 'SRMV', '72952': 'SRMV', '72955': 'SRMV', '72956': 'SRMV', '72957': 'SPSO', '72958': 'SRMV', '72959': 'SRMV', '73001': 'SPSO', '73002': 'SPSO', '73003': 'SPSO', '73004': 'SPSO', '73005': 'SPSO', '73006': 'SPSO', '73007': 'SPSO', '73008': 'SPSO', '73009': 'SPSO', '73010': 'SPSO', '73011': 'SPSO', '73012': 'SPSO', '73013': 'SPSO', '73014': 'SPSO', '73015': 'SPSO', '73016': 'SPSO', '73017': 'SPSO', '73018': 'SPSO', '73019': 'SPSO', '73020': 'SPSO', '73021': 'SPSO', '73022': 'SPSO', '73023': 'SPSO', '73024': 'SPSO', '73025': 'SPSO', '73026': 'SPSO', '73027': 'SPSO', '73028': 'SPSO', '73029': 'SPSO', '73030': 'SPSO', '73031': 'SPSO', '73032': 'SPSO', '73033': 'SPSO', '73034': 'SPSO', '73036': 'SPSO', '73038': 'SPSO', '73039': 'SPSO', '73040': 'SPSO', '73041': 'SPSO', '73042': 'SPSO', '73043': 'SPSO', '73044': 'SPSO', '73045': 'SPSO', '73047': 'SPSO', '73048': 'SPSO', '73049': 'SPSO', '73050': 'SPSO', '73051': 'SPSO', '73052': 'SPSO', '73053': 'SPSO', '73054': 'SPSO', '73055': 'SPSO', '73056': 'SPSO', '73057': 'SPSO', '73058': 'SPSO', '73059': 'SPSO', '73061': 'SPSO', '73062': 'SPSO', '73063': 'SPSO', '73064': 'SPSO', '73065': 'SPSO', '73066': 'SPSO', '73067': 'SPSO', '73068': 'SPSO', '73069': 'SPSO', '73070': 'SPSO', '73071': 'SPSO', '73072': 'SPSO', '73073': 'SPSO', '73074': 'SPSO', '73075': 'SPSO', '73077': 'SPSO', '73078': 'SPSO', '73079': 'SPSO', '73080': 'SPSO', '73082': 'SPSO', '73083': 'SPSO', '73084': 'SPSO', '73085': 'SPSO', '73086': 'SPSO', '73089': 'SPSO', '73090': 'SPSO', '73092': 'SPSO', '73093': 'SPSO', '73095': 'SPSO', '73096': 'SPSO', '73097': 'SPSO', '73098': 'SPSO', '73099': 'SPSO', '73101': 'SPSO', '73102': 'SPSO', '73103': 'SPSO', '73104': 'SPSO', '73105': 'SPSO', '73106': 'SPSO', '73107': 'SPSO', '73108': 'SPSO', '73109': 'SPSO', '73110': 'SPSO', '73111': 'SPSO', '73112': 'SPSO', '73113': 'SPSO', '73114': 'SPSO', '73115': 'SPSO', '73116': 'SPSO', '73117': 'SPSO', '73118': 'SPSO', '73119': 'SPSO', '73120': 'SPSO', '73121': 'SPSO', '73122': 'SPSO', '73123': 'SPSO', '73124': 'SPSO', '73125': 'SPSO', '73126': 'SPSO', '73127': 'SPSO', '73128': 'SPSO', '73129': 'SPSO', '73130': 'SPSO', '73131': 'SPSO', '73132': 'SPSO', '73134': 'SPSO', '73135': 'SPSO', '73136': 'SPSO', '73137': 'SPSO', '73139': 'SPSO', '73140': 'SPSO', '73141': 'SPSO', '73142': 'SPSO', '73143': 'SPSO', '73144': 'SPSO', '73145': 'SPSO', '73146': 'SPSO', '73147': 'SPSO', '73148': 'SPSO', '73149': 'SPSO', '73150': 'SPSO', '73151': 'SPSO', '73152': 'SPSO', '73153': 'SPSO', '73154': 'SPSO', '73155': 'SPSO', '73156': 'SPSO', '73157': 'SPSO', '73159': 'SPSO', '73160': 'SPSO', '73162': 'SPSO', '73163': 'SPSO', '73164': 'SPSO', '73165': 'SPSO', '73167': 'SPSO', '73169': 'SPSO', '73170': 'SPSO', '73172': 'SPSO', '73173': 'SPSO', '73178': 'SPSO', '73179': 'SPSO', '73184': 'SPSO', '73185': 'SPSO', '73189': 'SPSO', '73190': 'SPSO', '73194': 'SPSO', '73195': 'SPSO', '73196': 'SPSO', '73198': 'SPSO', '73301': 'ERCT', '73344': 'ERCT', '73401': 'SPSO', '73402': 'SPSO', '73403': 'SPSO', '73425': 'SPSO', '73430': 'SPSO', '73432': 'SPSO', '73433': 'SPSO', '73434': 'SPSO', '73435': 'SPSO', '73436': 'SPSO', '73437': 'SPSO', '73438': 'SPSO', '73439': 'SPSO', '73440': 'SPSO', '73441': 'SPSO', '73442': 'SPSO', '73443': 'SPSO', '73444': 'SPSO', '73446': 'SPSO', '73447': 'SPSO', '73448': 'SPSO', '73449': 'SPSO', '73450': 'SPSO', '73453': 'SPSO', '73455': 'SPSO', '73456': 'SPSO', '73458': 'SPSO', '73459': 'SPSO', '73460': 'SPSO', '73461': 'SPSO', '73463': 'SPSO', '73481': 'SPSO', '73487': 'SPSO', '73488': 'SPSO', '73491': 'SPSO', '73501': 'SPSO', '73502': 'SPSO', '73503': 'SPSO', '73505': 'SPSO', '73506': 'SPSO', '73507': 'SPSO', '73520': 'SPSO', '73521': 'SPSO', '73522': 'SPSO', '73523': 'SPSO', '73526': 'SPSO', '73527': 'SPSO', '73528': 'SPSO', '73529': 'SPSO', '73530': 'SPSO', '73531': 'SPSO', '73532': 'SPSO', '73533': 'SPSO', '73534': 'SPSO', '73536': 'SPSO', '73537': 'SPSO', '73538': 'SPSO', '73539': 'SPSO', '73540': 'SPSO', '73541': 'SPSO', '73542': 'SPSO', '73543': 'SPSO', '73544': 'SPSO', '73546': 'SPSO', '73547': 'SPSO', '73548': 'SPSO', '73549': 'SPSO', '73550': 'SPSO', '73551': 'SPSO', '73552': 'SPSO', '73553': 'SPSO', '73554': 'SPSO', '73555': 'SPSO', '73556': 'SPSO', '73557': 'SPSO', '73558': 'SPSO', '73559': 'SPSO', '73560': 'SPSO', '73561': 'SPSO', '73562': 'SPSO', '73564': 'SPSO', '73565': 'SPSO', '73566': 'SPSO', '73567': 'SPSO', '73568': 'SPSO', '73569': 'SPSO', '73570': 'SPSO', '73571': 'SPSO', '73572': 'SPSO', '73573': 'SPSO', '73601': 'SPSO', '73620': 'SPSO', '73622': 'SPSO', '73624': 'SPSO', '73625': 'SPSO', '73626': 'SPSO', '73627': 'SPSO', '73628': 'SPSO', '73632': 'SPSO', '73638': 'SPSO', '73639': 'SPSO', '73641': 'SPSO', '73642': 'SPSO', '73644': 'SPSO', '73645': 'SPSO', '73646': 'SPSO', '73647': 'SPSO', '73648': 'SPSO', '73650': 'SPSO', '73651': 'SPSO', '73654': 'SPSO', '73655': 'SPSO', '73658': 'SPSO', '73659': 'SPSO', '73660': 'SPSO', '73661': 'SPSO', '73662': 'SPSO', '73663': 'SPSO', '73664': 'SPSO', '73666': 'SPSO', '73667': 'SPSO', '73668': 'SPSO', '73669': 'SPSO', '73673': 'SPSO', '73701': 'SPSO', '73702': 'SPSO', '73703': 'SPSO', '73705': 'SPSO', '73706': 'SPSO', '73716': 'SPSO', '73717': 'SPSO', '73718': 'SPSO', '73719': 'SPSO', '73720': 'SPSO', '73722': 'SPSO', '73724': 'SPSO', '73726': 'SPSO', '73727': 'SPSO', '73728': 'SPSO', '73729': 'SPSO', '73730': 'SPSO', '73731': 'SPSO', '73733': 'SPSO', '73734': 'SPSO', '73735': 'SPSO', '73736': 'SPSO', '73737': 'SPSO', '73738': 'SPSO', '73739': 'SPSO', '73741': 'SPSO', '73742': 'SPSO', '73743': 'SPSO', '73744': 'SPSO', '73746': 'SPSO', '73747': 'SPSO', '73749': 'SPSO', '73750': 'SPSO', '73753': 'SPSO', '73754': 'SPSO', '73755': 'SPSO', '73756': 'SPSO', '73757': 'SPSO', '73758': 'SPSO', '73759': 'SPSO', '73760': 'SPSO', '73761': 'SPSO', '73762': 'SPSO', '73763': 'SPSO', '73764': 'SPSO', '73766': 'SPSO', '73768': 'SPSO', '73770': 'SPSO', '73771': 'SPSO', '73772': 'SPSO', '73773': 'SPSO', '73801': 'SPSO', '73802': 'SPSO', '73832': 'SPSO', '73834': 'SPSO', '73835': 'SPSO', '73838': 'SPSO', '73840': 'SPSO', '73841': 'SPSO', '73842': 'SPSO', '73843': 'SPSO', '73844': 'SPSO', '73848': 'SPSO', '73851': 'SPSO', '73852': 'SPSO', '73853': 'SPSO', '73855': 'SPSO', '73857': 'SPSO', '73858': 'SPSO', '73859': 'SPSO', '73860': 'SPSO', '73901': 'SPSO', '73931': 'SPSO', '73932': 'SPSO', '73933': 'SPSO', '73937': 'AZNM', '73938': 'SPSO', '73939': 'SPSO', '73942': 'SPSO', '73944': 'SPSO', '73945': 'SPSO', '73946': 'AZNM', '73947': 'SPSO', '73949': 'SPSO', '73950': 'SPSO', '73951': 'SPSO', '73960': 'SPSO', '74001': 'SPSO', '74002': 'SPSO', '74003': 'SPSO', '74004': 'SPSO', '74005': 'SPSO', '74006': 'SPSO', '74008': 'SPSO', '74010': 'SPSO', '74011': 'SPSO', '74012': 'SPSO', '74013': 'SPSO', '74014': 'SPSO', '74015': 'SPSO', '74016': 'SPSO', '74017': 'SPSO', '74018': 'SPSO', '74019': 'SPSO', '74020': 'SPSO', '74021': 'SPSO', '74022': 'SPSO', '74023': 'SRMW', '74026': 'SPSO', '74027': 'SPSO', '74028': 'SPSO', '74029': 'SPSO', '74030': 'SPSO', '74031': 'SPSO', '74032': 'SPSO', '74033': 'SPSO', '74034': 'SPSO', '74035': 'SPSO', '74036': 'SPSO', '74037': 'SPSO', '74038': 'SPSO', '74039': 'SPSO', '74041': 'SPSO', '74042': 'SPSO', '74043': 'SPSO', '74044': 'SPSO', '74045': 'SPSO', '74046': 'SRMW', '74047': 'SPSO', '74048': 'SPSO', '74050': 'SPSO', '74051': 'SPSO', '74052': 'SPSO', '74053': 'SPSO', '74054': 'SPSO', '74055': 'SPSO', '74056': 'SPSO', '74058': 'SPSO', '74059': 'SPSO', '74060': 'SPSO', '74061': 'SPSO', '74062': 'SPSO', '74063': 'SPSO', '74066': 'SPSO', '74067': 'SPSO', '74068': 'SPSO', '74070': 'SPSO', '74071': 'SPSO', '74072': 'SPSO', '74073': 'SPSO', '74074': 'SPSO', '74075': 'SPSO', '74076': 'SPSO', '74077': 'SPSO', '74078': 'SPSO', '74079': 'SPSO', '74080': 'SPSO', '74081': 'SPSO', '74082': 'SPSO', '74083': 'SPSO', '74084': 'SPSO', '74085': 'SPSO', '74101': 'SPSO', '74102': 'SPSO', '74103': 'SPSO', '74104': 'SPSO', '74105': 'SPSO', '74106': 'SPSO', '74107': 'SPSO', '74108': 'SPSO', '74110': 'SPSO', '74112': 'SPSO', '74114': 'SPSO', '74115': 'SPSO', '74116': 'SPSO', '74117': 'SPSO', '74119': 'SPSO', '74120': 'SPSO', '74121': 'SPSO', '74126': 'SPSO', '74127': 'SPSO', '74128': 'SPSO', '74129': 'SPSO', '74130': 'SPSO', '74131': 'SPSO', '74132': 'SPSO', '74133': 'SPSO', '74134': 'SPSO', '74135': 'SPSO', '74136': 'SPSO', '74137': 'SPSO', '74141': 'SPSO', '74145': 'SPSO', '74146': 'SPSO', '74147': 'SPSO', '74148': 'SPSO', '74149': 'SPSO', '74150': 'SPSO', '74152': 'SPSO', '74153': 'SPSO', '74155': 'SPSO', '74156': 'SPSO', '74157': 'SPSO', '74158': 'SPSO', '74159': 'SPSO', '74169': 'SPSO', '74170': 'SPSO', '74171': 'SPSO', '74172': 'SPSO', '74182': 'SPSO', '74186': 'SPSO', '74187': 'SPSO', '74192': 'SPSO', '74193': 'SPSO', '74301': 'SPSO', '74330': 'SPSO', '74331': 'SPSO', '74332': 'SPSO', '74333': 'SPSO', '74335': 'SPNO', '74337': 'SPSO', '74338': 'SPSO', '74339': 'SPNO', '74340': 'SPSO', '74342': 'SPSO', '74343': 'SPSO', '74344': 'SPSO', '74345': 'SPSO', '74346': 'SPSO', '74347': 'SPSO', '74349': 'SPSO', '74350': 'SPSO', '74352': 'SPSO', '74354': 'SPNO', '74355': 'SPSO', '74358': 'SPNO', '74359': 'SPSO', '74360': 'SPNO', '74361': 'SPSO', '74362': 'SPSO', '74363': 'SPSO', '74364': 'SPSO', '74365': 'SPSO', '74366': 'SPSO', '74367': 'SPSO', '74368': 'SPSO', '74369': 'SPSO', '74370': 'SPSO', '74401': 'SPSO', '74402': 'SPSO', '74403': 'SPSO', '74421': 'SPSO', '74422': 'SPSO', '74423': 'SPSO', '74425': 'SPSO', '74426': 'SPSO', '74427': 'SRMW', '74428': 'SPSO', '74429': 'SPSO', '74430': 'SRMW', '74431': 'SPSO', '74432': 'SPSO', '74434': 'SPSO', '74435': 'SPSO', '74436': 'SPSO', '74437': 'SPSO', '74438': 'SPSO', '74439': 'SRMW', '74440': 'SPSO', '74441': 'SPSO', '74442': 'SPSO', '74444': 'SRMW', '74445': 'SPSO', '74446': 'SPSO', '74447': 'SPSO', '74450': 'SPSO', '74451': 'SRMW', '74452': 'SPSO', '74454': 'SPSO', '74455': 'SPSO', '74456': 'SPSO', '74457': 'SPSO', '74458': 'SPSO', '74459': 'SRMW', '74460': 'SPSO', '74461': 'SPSO', '74462': 'SPSO', '74463': 'SPSO', '74464': 'SPSO', '74465': 'SRMW', '74467': 'SPSO', '74468': 'SPSO', '74469': 'SPSO', '74470': 'SPSO', '74471': 'SPSO', '74472': 'SPSO', '74477': 'SPSO', '74501': 'SPSO', '74502': 'SPSO', '74521': 'SPSO', '74522': 'SPSO', '74523': 'SPSO', '74525': 'SPSO', '74528': 'SPSO', '74529': 'SRMW', '74530': 'SPSO', '74531': 'SPSO', '74533': 'SPSO', '74534': 'SPSO', '74535': 'SPSO', '74536': 'SPSO', '74538': 'SPSO', '74540': 'SPSO', '74543': 'SPSO', '74545': 'SPSO', '74546': 'SRMW', '74547': 'SPSO', '74549': 'SPSO', '74552': 'SPSO', '74553': 'SPSO', '74554': 'SPSO', '74555': 'SPSO', '74556': 'SPSO', '74557': 'SPSO', '74558': 'SPSO', '74559': 'SRMW', '74560': 'SPSO', '74561': 'SPSO', '74562': 'SPSO', '74563': 'SPSO', '74565': 'SPSO', '74567': 'SPSO', '74569': 'SPSO', '74570': 'SPSO', '74571': 'SPSO', '74572': 'SPSO', '74574': 'SPSO', '74576': 'SPSO', '74577': 'SPSO', '74578': 'SPSO', '74601': 'SPSO', '74602': 'SPSO', '74604': 'SPSO', '74630': 'SPSO', '74631': 'SPSO', '74632': 'SPSO', '74633': 'SPSO', '74636': 'SPSO', '74637': 'SPSO', '74640': 'SPSO', '74641': 'SPSO', '74643': 'SPSO', '74644': 'SPSO', '74646': 'SPSO', '74647': 'SPSO', '74650': 'SPSO', '74651': 'SPSO', '74652': 'SPSO', '74653': 'SPSO', '74701': 'SPSO', '74702': 'SPSO', '74720': 'SPSO', '74721': 'SPSO', '74722': 'SPSO', '74723': 'SPSO', '74724': 'SPSO', '74726': 'SPSO', '74727': 'SPSO', '74728': 'SPSO', '74729': 'SPSO', '74730': 'SPSO', '74731': 'SPSO', '74733': 'SPSO', '74734': 'SPSO', '74735': 'SPSO', '74736': 'SPSO', '74737': 'SPSO', '74738': 'SPSO', '74740': 'SPSO', '74741': 'SPSO', '74743': 'SPSO', '74745': 'SPSO', '74747': 'SPSO', '74748': 'SPSO', '74750': 'SPSO', '74752': 'SPSO', '74753': 'SPSO', '74754': 'SPSO', '74755': 'SPSO', '74756': 'SPSO', '74759': 'SPSO', '74760': 'SPSO', '74761': 'SPSO', '74764': 'SPSO', '74766': 'SPSO', '74801': 'SPSO', '74802': 'SPSO', '74804': 'SPSO', '74818': 'SPSO', '74820': 'SPSO', '74821': 'SPSO', '74824': 'SPSO', '74825': 'SPSO', '74826': 'SPSO', '74827': 'SPSO', '74829': 'SPSO', '74830': 'SPSO', '74831': 'SPSO', '74832': 'SPSO', '74833': 'SPSO', '74834': 'SPSO', '74836': 'SPSO', '74837': 'SPSO', '74839': 'SPSO', '74840': 'SPSO', '74842': 'SPSO', '74843': 'SPSO', '74844': 'SPSO', '74845': 'SPSO', '74848': 'SPSO', '74849': 'SPSO', '74850': 'SPSO', '74851': 'SPSO', '74852': 'SPSO', '74854': 'SPSO', '74855': 'SPSO', '74856': 'SPSO', '74857': 'SPSO', '74859': 'SPSO', '74860': 'SPSO', '74864': 'SPSO', '74865': 'SPSO', '74866': 'SPSO', '74867': 'SPSO', '74868': 'SPSO', '74869': 'SPSO', '74871': 'SPSO', '74872': 'SPSO', '74873': 'SPSO', '74875': 'SPSO', '74878': 'SPSO', '74880': 'SPSO', '74881': 'SPSO', '74883': 'SPSO', '74884': 'SPSO', '74901': 'SPSO', '74902': 'SPSO', '74930': 'SPSO', '74931': 'SPSO', '74932': 'SPSO', '74935': 'SRMW', '74936': 'SPSO', '74937': 'SPSO', '74939': 'SPSO', '74940': 'SPSO', '74941': 'SPSO', '74942': 'SPSO', '74943': 'SRMW', '74944': 'SPSO', '74945': 'SRMW', '74946': 'SPSO', '74947': 'SRMV', '74948': 'SPSO', '74949': 'SPSO', '74951': 'SPSO', '74953': 'SPSO', '74954': 'SPSO', '74955': 'SRMW', '74956': 'SPSO', '74957': 'SPSO', '74959': 'SPSO', '74960': 'SPSO', '74962': 'SPSO', '74963': 'SPSO', '74964': 'SPSO', '74965': 'SPSO', '74966': 'SPSO', '75001': 'ERCT', '75002': 'ERCT', '75006': 'ERCT', '75007': 'ERCT', '75009': 'ERCT', '75010': 'ERCT', '75011': 'ERCT', '75013': 'ERCT', '75014': 'ERCT', '75015': 'ERCT', '75016': 'ERCT', '75017': 'ERCT', '75019': 'ERCT', '75020': 'ERCT', '75021': 'ERCT', '75022': 'ERCT', '75023': 'ERCT', '75024': 'ERCT', '75025': 'ERCT', '75026': 'ERCT', '75027': 'ERCT', '75028': 'ERCT', '75029': 'ERCT', '75030': 'ERCT', '75032': 'ERCT', '75033': 'ERCT', '75034': 'ERCT', '75035': 'ERCT', '75036': 'ERCT', '75037': 'ERCT', '75038': 'ERCT', '75039': 'ERCT', '75040': 'ERCT', '75041': 'ERCT', '75042': 'ERCT', '75043': 'ERCT', '75044': 'ERCT', '75045': 'ERCT', '75046': 'ERCT', '75047': 'ERCT', '75048': 'ERCT', '75049': 'ERCT', '75050': 'ERCT', '75051': 'ERCT', '75052': 'ERCT', '75053': 'ERCT', '75054': 'ERCT', '75056': 'ERCT', '75057': 'ERCT', '75058': 'ERCT', '75060': 'ERCT', '75061': 'ERCT', '75062': 'ERCT', '75063': 'ERCT', '75065': 'ERCT', '75067': 'ERCT', '75068': 'ERCT', '75069': 'ERCT', '75070': 'ERCT', '75071': 'ERCT', '75072': 'ERCT', '75074': 'ERCT', '75075': 'ERCT', '75076': 'ERCT', '75077': 'ERCT', '75078': 'ERCT', '75080': 'ERCT', '75081': 'ERCT', '75082': 'ERCT', '75083': 'ERCT', '75085': 'ERCT', '75086': 'ERCT', '75087': 'ERCT', '75088': 'ERCT', '75089': 'ERCT', '75090': 'ERCT', '75091': 'ERCT', '75092': 'ERCT', '75093': 'ERCT', '75094': 'ERCT', '75097': 'ERCT', '75098': 'ERCT', '75099': 'ERCT', '75101': 'ERCT', '75102': 'ERCT', '75103': 'ERCT', '75104': 'ERCT', '75105': 'ERCT', '75106': 'ERCT', '75109': 'ERCT', '75110': 'ERCT', '75114': 'ERCT', '75115': 'ERCT', '75116': 'ERCT', '75117': 'ERCT', '75118': 'ERCT', '75119': 'ERCT', '75120': 'ERCT', '75121': 'ERCT', '75123': 'ERCT', '75124': 'ERCT', '75125': 'ERCT', '75126': 'ERCT', '75127': 'SPSO', '75132': 'ERCT', '75134': 'ERCT', '75135': 'ERCT', '75137': 'ERCT', '75138': 'ERCT', '75140': 'ERCT', '75141': 'ERCT', '75142': 'ERCT', '75143': 'ERCT', '75144': 'ERCT', '75146': 'ERCT', '75147': 'ERCT', '75148': 'ERCT', '75149': 'ERCT', '75150': 'ERCT', '75151': 'ERCT', '75152': 'ERCT', '75153': 'ERCT', '75154': 'ERCT', '75155': 'ERCT', '75156': 'ERCT', '75157': 'ERCT', '75158': 'ERCT', '75159': 'ERCT', '75160': 'ERCT', '75161': 'ERCT', '75163': 'ERCT', '75164': 'ERCT', '75165': 'ERCT', '75166': 'ERCT', '75167': 'ERCT', '75168': 'ERCT', '75169': 'ERCT', '75172': 'ERCT', '75173': 'ERCT', '75180': 'ERCT', '75181': 'ERCT', '75182': 'ERCT', '75185': 'ERCT', '75187': 'ERCT', '75189': 'ERCT', '75201': 'ERCT', '75202': 'ERCT', '75203': 'ERCT', '75204': 'ERCT', '75205': 'ERCT', '75206': 'ERCT', '75207': 'ERCT', '75208': 'ERCT', '75209': 'ERCT', '75210': 'ERCT', '75211': 'ERCT', '75212': 'ERCT', '75214': 'ERCT', '75215': 'ERCT', '75216': 'ERCT', '75217': 'ERCT', '75218': 'ERCT', '75219': 'ERCT', '75220': 'ERCT', '75221': 'ERCT', '75222': 'ERCT', '75223': 'ERCT', '75224': 'ERCT', '75225': 'ERCT', '75226': 'ERCT', '75227': 'ERCT', '75228': 'ERCT', '75229': 'ERCT', '75230': 'ERCT', '75231': 'ERCT', '75232': 'ERCT', '75233': 'ERCT', '75234': 'ERCT', '75235': 'ERCT', '75236': 'ERCT', '75237': 'ERCT', '75238': 'ERCT', '75240': 'ERCT', '75241': 'ERCT', '75242': 'ERCT', '75243': 'ERCT', '75244': 'ERCT', '75245': 'ERCT', '75246': 'ERCT', '75247': 'ERCT', '75248': 'ERCT', '75249': 'ERCT', '75250': 'ERCT', '75251': 'ERCT', '75252': 'ERCT', '75253': 'ERCT', '75254': 'ERCT', '75260': 'ERCT', '75261': 'ERCT', '75262': 'ERCT', '75263': 'ERCT', '75264': 'ERCT', '75265': 'ERCT', '75266': 'ERCT', '75267': 'ERCT', '75270': 'ERCT', '75275': 'ERCT', '75277': 'ERCT', '75283': 'ERCT', '75284': 'ERCT', '75285': 'ERCT', '75286': 'ERCT', '75287': 'ERCT', '75301': 'ERCT', '75303': 'ERCT', '75310': 'ERCT', '75312': 'ERCT', '75313': 'ERCT', '75315': 'ERCT', '75320': 'ERCT', '75323': 'ERCT', '75326': 'ERCT', '75334': 'ERCT', '75336': 'ERCT', '75339': 'ERCT', '75340': 'ERCT', '75342': 'ERCT', '75343': 'ERCT', '75344': 'ERCT', '75354': 'ERCT', '75355': 'ERCT', '75356': 'ERCT', '75357': 'ERCT', '75358': 'ERCT', '75359': 'ERCT', '75360': 'ERCT', '75367': 'ERCT', '75368': 'ERCT', '75370': 'ERCT', '75371': 'ERCT', '75372': 'ERCT', '75373': 'ERCT', '75374': 'ERCT', '75376': 'ERCT', '75378': 'ERCT', '75379': 'ERCT', '75380': 'ERCT', '75381': 'ERCT', '75382': 'ERCT', '75387': 'ERCT', '75389': 'ERCT', '75390': 'ERCT', '75391': 'ERCT', '75392': 'ERCT', '75393': 'ERCT', '75394': 'ERCT', '75395': 'ERCT', '75397': 'ERCT', '75398': 'ERCT', '75401': 'ERCT', '75402': 'ERCT', '75403': 'ERCT', '75404': 'ERCT', '75407': 'ERCT', '75409': 'ERCT', '75410': 'ERCT', '75411': 'SPSO', '75412': 'ERCT', '75413': 'ERCT', '75414': 'ERCT', '75415': 'ERCT', '75416': 'ERCT', '75417': 'ERCT', '75418': 'ERCT', '75420': 'ERCT', '75421': 'ERCT', '75422': 'ERCT', '75423': 'ERCT', '75424': 'ERCT', '75425': 'ERCT', '75426': 'ERCT', '75428': 'ERCT', '75429': 'ERCT', '75431': 'SPSO', '75432': 'ERCT', '75433': 'ERCT', '75434': 'ERCT', '75435': 'ERCT', '75436': 'ERCT', '75437': 'ERCT', '75438': 'ERCT', '75439': 'ERCT', '75440': 'ERCT', '75441': 'ERCT', '75442': 'ERCT', '75443': 'ERCT', '75444': 'SPSO', '75446': 'ERCT', '75447': 'ERCT', '75448': 'ERCT', '75449': 'ERCT', '75450': 'ERCT', '75451': 'SPSO', '75452': 'ERCT', '75453': 'ERCT', '75454': 'ERCT', '75455': 'SPSO', '75456': 'SPSO', '75457': 'SPSO', '75458': 'ERCT', '75459': 'ERCT', '75460': 'ERCT', '75461': 'ERCT', '75462': 'ERCT', '75468': 'ERCT', '75469': 'ERCT', '75470': 'ERCT', '75471': 'SPSO', '75472': 'ERCT', '75473': 'ERCT', '75474': 'ERCT', '75475': 'ERCT', '75476': 'ERCT', '75477': 'ERCT', '75478': 'SPSO', '75479': 'ERCT', '75480': 'SPSO', '75481': 'ERCT', '75482': 'ERCT', '75483': 'ERCT', '75485': 'ERCT', '75486': 'ERCT', '75487': 'ERCT', '75488': 'ERCT', '75489': 'ERCT', '75490': 'ERCT', '75491': 'ERCT', '75492': 'ERCT', '75493': 'SPSO', '75494': 'SPSO', '75495': 'ERCT', '75496': 'ERCT', '75497': 'ERCT', '75501': 'SPSO', '75503': 'SPSO', '75504': 'SPSO', '75505': 'SPSO', '75507': 'SPSO', '75550': 'ERCT', '75551': 'SPSO', '75554': 'SPSO', '75555': 'SPSO', '75556': 'SPSO', '75558': 'SPSO', '75559': 'SPSO', '75560': 'SPSO', '75561': 'SPSO', '75562': 'SPSO', '75563': 'SPSO', '75564': 'SPSO', '75565': 'SPSO', '75566': 'SPSO', '75567': 'SPSO', '75568': 'SPSO', '75569': 'SPSO', '75570': 'SPSO', '75571': 'SPSO', '75572': 'SPSO', '75573': 'SPSO', '75574': 'SPSO', '75599': 'SPSO', '75601': 'SPSO', '75602': 'SPSO', '75603': 'SPSO', '75604': 'SPSO', '75605': 'SPSO', '75606': 'SPSO', '75607': 'SPSO', '75608': 'SPSO', '75615': 'SPSO', '75630': 'SPSO', '75631': 'SPSO', '75633': 'ERCT', '75636': 'SPSO', '75637': 'SPSO', '75638': 'SPSO', '75639': 'SPSO', '75640': 'SPSO', '75641': 'SPSO', '75642': 'SPSO', '75643': 'ERCT', '75644': 'SPSO', '75645': 'SPSO', '75647': 'SPSO', '75650': 'SPSO', '75651': 'SPSO', '75652': 'SPSO', '75653': 'SPSO', '75654': 'ERCT', '75656': 'SPSO', '75657': 'SPSO', '75658': 'SPSO', '75659': 'SPSO', '75660': 'SPSO', '75661': 'SPSO', '75662': 'SPSO', '75663': 'SPSO', '75666': 'SPSO', '75667': 'ERCT', '75668': 'SPSO', '75669': 'SPSO', '75670': 'SPSO', '75671': 'SPSO', '75672': 'SPSO', '75680': 'SPSO', '75681': 'ERCT', '75682': 'SPSO', '75683': 'SPSO', '75684': 'SPSO', '75685': 'SPSO', '75686': 'SPSO', '75687': 'SPSO', '75688': 'SPSO', '75689': 'SPSO', '75691': 'SPSO', '75692': 'SPSO', '75693': 'SPSO', '75694': 'SPSO', '75701': 'ERCT', '75702': 'ERCT', '75703': 'ERCT', '75704': 'ERCT', '75705': 'SPSO', '75706': 'SPSO', '75707': 'ERCT', '75708': 'SPSO', '75709': 'ERCT', '75710': 'ERCT', '75711': 'ERCT', '75712': 'ERCT', '75713': 'ERCT', '75750': 'SPSO', '75751': 'ERCT', '75752': 'ERCT', '75754': 'ERCT', '75755': 'SPSO', '75756': 'ERCT', '75757': 'ERCT', '75758': 'ERCT', '75759': 'ERCT', '75760': 'ERCT', '75762': 'ERCT', '75763': 'ERCT', '75764': 'ERCT', '75765': 'SPSO', '75766': 'ERCT', '75770': 'ERCT', '75771': 'SPSO', '75772': 'ERCT', '75773': 'SPSO', '75778': 'ERCT', '75779': 'ERCT', '75780': 'ERCT', '75782': 'ERCT', '75783': 'SPSO', '75784': 'ERCT', '75785': 'ERCT', '75788': 'ERCT', '75789': 'ERCT', '75790': 'ERCT', '75791': 'ERCT', '75792': 'SPSO', '75797': 'SPSO', '75798': 'ERCT', '75799': 'ERCT', '75801': 'SRMV', '75802': 'ERCT', '75803': 'SRMV', '75831': 'SRMV', '75832': 'ERCT', '75833': 'SRMV', '75834': 'SRMV', '75835': 'SRMV', '75838': 'SRMV', '75839': 'SRMV', '75840': 'ERCT', '75844': 'SRMV', '75845': 'SRMV', '75846': 'SRMV', '75847': 'ERCT', '75848': 'ERCT', '75849': 'ERCT', '75850': 'SRMV', '75851': 'SRMV', '75852': 'SRMV', '75853': 'ERCT', '75855': 'SRMV', '75856': 'SRMV', '75858': 'SRMV', '75859': 'ERCT', '75860': 'SRMV', '75861': 'ERCT', '75862': 'SRMV', '75865': 'SRMV', '75880': 'ERCT', '75882': 'ERCT', '75884': 'ERCT', '75886': 'ERCT', '75901': 'SRMV', '75902': 'ERCT', '75903': 'ERCT', '75904': 'SRMV', '75915': 'ERCT', '75925': 'ERCT', '75926': 'SRMV', '75928': 'SRMV', '75929': 'ERCT', '75930': 'ERCT', '75931': 'ERCT', '75932': 'ERCT', '75933': 'SRMV', '75934': 'SRMV', '75935': 'ERCT', '75936': 'SRMV', '75937': 'ERCT', '75938': 'SRMV', '75939': 'SRMV', '75941': 'SRMV', '75942': 'SRMV', '75943': 'ERCT', '75944': 'ERCT', '75946': 'ERCT', '75948': 'ERCT', '75949': 'SRMV', '75951': 'ERCT', '75954': 'ERCT', '75956': 'SRMV', '75958': 'ERCT', '75959': 'ERCT', '75960': 'SRMV', '75961': 'ERCT', '75962': 'ERCT', '75963': 'ERCT', '75964': 'ERCT', '75965': 'SPSO', '75966': 'ERCT', '75968': 'ERCT', '75969': 'SRMV', '75972': 'ERCT', '75973': 'ERCT', '75974': 'ERCT', '75975': 'ERCT', '75976': 'ERCT', '75977': 'SRMV', '75978': 'ERCT', '75979': 'SRMV', '75980': 'ERCT', '75990': 'SRMV', '76001': 'ERCT', '76002': 'ERCT', '76003': 'ERCT', '76004': 'ERCT', '76005': 'ERCT', '76006': 'ERCT', '76007': 'ERCT', '76008': 'ERCT', '76009': 'ERCT', '76010': 'ERCT', '76011': 'ERCT', '76012': 'ERCT', '76013': 'ERCT', '76014': 'ERCT', '76015': 'ERCT', '76016': 'ERCT', '76017': 'ERCT', '76018': 'ERCT', '76019': 'ERCT', '76020': 'ERCT', '76021': 'ERCT', '76022': 'ERCT', '76023': 'ERCT', '76028': 'ERCT', '76031': 'ERCT', '76033': 'ERCT', '76034': 'ERCT', '76035': 'ERCT', '76036': 'ERCT', '76039': 'ERCT', '76040': 'ERCT', '76041': 'ERCT', '76043': 'ERCT', '76044': 'ERCT', '76048': 'ERCT', '76049': 'ERCT', '76050': 'ERCT', '76051': 'ERCT', '76052': 'ERCT', '76053': 'ERCT', '76054': 'ERCT', '76055': 'ERCT', '76058': 'ERCT', '76059': 'ERCT', '76060': 'ERCT', '76061': 'ERCT', '76063': 'ERCT', '76064': 'ERCT', '76065': 'ERCT', '76066': 'ERCT', '76067': 'ERCT', '76068': 'ERCT', '76070': 'ERCT', '76071': 'ERCT', '76073': 'ERCT', '76077': 'ERCT', '76078': 'ERCT', '76082': 'ERCT', '76084': 'ERCT', '76085': 'ERCT', '76086': 'ERCT', '76087': 'ERCT', '76088': 'ERCT', '76092': 'ERCT', '76093': 'ERCT', '76094': 'ERCT', '76095': 'ERCT', '76096': 'ERCT', '76097': 'ERCT', '76098': 'ERCT', '76099': 'ERCT', '76101': 'ERCT', '76102': 'ERCT', '76103': 'ERCT', '76104': 'ERCT', '76105': 'ERCT', '76106': 'ERCT', '76107': 'ERCT', '76108': 'ERCT', '76109': 'ERCT', '76110': 'ERCT', '76111': 'ERCT', '76112': 'ERCT', '76113': 'ERCT', '76114': 'ERCT', '76115': 'ERCT', '76116': 'ERCT', '76117': 'ERCT', '76118': 'ERCT', '76119': 'ERCT', '76120': 'ERCT', '76121': 'ERCT', '76122': 'ERCT', '76123': 'ERCT', '76124': 'ERCT', '76126': 'ERCT', '76127': 'ERCT', '76129': 'ERCT', '76130': 'ERCT', '76131': 'ERCT', '76132': 'ERCT', '76133': 'ERCT', '76134': 'ERCT', '76135': 'ERCT', '76136': 'ERCT', '76137': 'ERCT', '76140': 'ERCT', '76147': 'ERCT', '76148': 'ERCT', '76150': 'ERCT', '76155': 'ERCT', '76161': 'ERCT', '76162': 'ERCT', '76163': 'ERCT', '76164': 'ERCT', '76166': 'ERCT', '76177': 'ERCT', '76179': 'ERCT', '76180': 'ERCT', '76181': 'ERCT', '76182': 'ERCT', '76185': 'ERCT', '76191': 'ERCT', '76192': 'ERCT', '76193': 'ERCT', '76195': 'ERCT', '76196': 'ERCT', '76197': 'ERCT', '76198': 'ERCT', '76199': 'ERCT', '76201': 'ERCT', '76202': 'ERCT', '76203': 'ERCT', '76204': 'ERCT', '76205': 'ERCT', '76206': 'ERCT', '76207': 'ERCT', '76208': 'ERCT', '76209': 'ERCT', '76210': 'ERCT', '76225': 'ERCT', '76226': 'ERCT', '76227': 'ERCT', '76228': 'ERCT', '76230': 'ERCT', '76233': 'ERCT', '76234': 'ERCT', '76238': 'ERCT', '76239': 'ERCT', '76240': 'ERCT', '76241': 'ERCT', '76244': 'ERCT', '76245': 'ERCT', '76246': 'ERCT', '76247': 'ERCT', '76248': 'ERCT', '76249': 'ERCT', '76250': 'ERCT', '76251': 'ERCT', '76252': 'ERCT', '76253': 'ERCT', '76255': 'ERCT', '76258': 'ERCT', '76259': 'ERCT', '76261': 'ERCT', '76262': 'ERCT', '76263': 'ERCT', '76264': 'ERCT', '76265': 'ERCT', '76266': 'ERCT', '76267': 'ERCT', '76268': 'ERCT', '76270': 'ERCT', '76271': 'ERCT', '76272': 'ERCT', '76273': 'ERCT', '76301': 'ERCT', '76302': 'ERCT', '76305': 'ERCT', '76306': 'ERCT', '76307': 'ERCT', '76308': 'ERCT', '76309': 'ERCT', '76310': 'ERCT', '76311': 'ERCT', '76351': 'ERCT', '76352': 'ERCT', '76354': 'ERCT', '76357': 'ERCT', '76360': 'SPSO', '76363': 'ERCT', '76364': 'SPSO', '76365': 'ERCT', '76366': 'ERCT', '76367': 'ERCT', '76369': 'ERCT', '76370': 'ERCT', '76371': 'ERCT', '76372': 'ERCT', '76373': 'SPSO', '76374': 'ERCT', '76377': 'ERCT', '76379': 'ERCT', '76380': 'ERCT', '76384': 'SPSO', '76385': 'ERCT', '76388': 'ERCT', '76389': 'ERCT', '76401': 'ERCT', '76402': 'ERCT', '76424': 'ERCT', '76426': 'ERCT', '76427': 'ERCT', '76429': 'ERCT', '76430': 'ERCT', '76431': 'ERCT', '76432': 'ERCT', '76433': 'ERCT', '76435': 'ERCT', '76436': 'ERCT', '76437': 'ERCT', '76439': 'ERCT', '76442': 'ERCT', '76443': 'ERCT', '76444': 'ERCT', '76445': 'ERCT', '76446': 'ERCT', '76448': 'ERCT', '76449': 'ERCT', '76450': 'ERCT', '76452': 'ERCT', '76453': 'ERCT', '76454': 'ERCT', '76455': 'ERCT', '76457': 'ERCT', '76458': 'ERCT', '76459': 'ERCT', '76460': 'ERCT', '76461': 'ERCT', '76462': 'ERCT', '76463': 'ERCT', '76464': 'ERCT', '76465': 'ERCT', '76466': 'ERCT', '76467': 'ERCT', '76468': 'ERCT', '76469': 'ERCT', '76470': 'ERCT', '76471': 'ERCT', '76472': 'ERCT', '76474': 'ERCT', '76475': 'ERCT', '76476': 'ERCT', '76481': 'ERCT', '76483': 'ERCT', '76484': 'ERCT', '76485': 'ERCT', '76486': 'ERCT', '76487': 'ERCT', '76490': 'ERCT', '76491': 'ERCT', '76501': 'ERCT', '76502': 'ERCT', '76503': 'ERCT', '76504': 'ERCT', '76505': 'ERCT', '76508': 'ERCT', '76511': 'ERCT', '76513': 'ERCT', '76518': 'ERCT', '76519': 'ERCT', '76520': 'ERCT', '76522': 'ERCT', '76523': 'ERCT', '76524': 'ERCT', '76525': 'ERCT', '76526': 'ERCT', '76527': 'ERCT', '76528': 'ERCT', '76530': 'ERCT', '76531': 'ERCT', '76533': 'ERCT', '76534': 'ERCT', '76537': 'ERCT', '76538': 'ERCT', '76539': 'ERCT', '76540': 'ERCT', '76541': 'ERCT', '76542': 'ERCT', '76543': 'ERCT', '76544': 'ERCT', '76547': 'ERCT', '76548': 'ERCT', '76549': 'ERCT', '76550': 'ERCT', '76554': 'ERCT', '76556': 'ERCT', '76557': 'ERCT', '76558': 'ERCT', '76559': 'ERCT', '76561': 'ERCT', '76564': 'ERCT', '76565': 'ERCT', '76566': 'ERCT', '76567': 'ERCT', '76569': 'ERCT', '76570': 'ERCT', '76571': 'ERCT', '76573': 'ERCT', '76574': 'ERCT', '76577': 'ERCT', '76578': 'ERCT', '76579': 'ERCT', '76596': 'ERCT', '76597': 'ERCT', '76598': 'ERCT', '76599': 'ERCT', '76621': 'ERCT', '76622': 'ERCT', '76623': 'ERCT', '76624': 'ERCT', '76626': 'ERCT', '76627': 'ERCT', '76628': 'ERCT', '76629': 'ERCT', '76630': 'ERCT', '76631': 'ERCT', '76632': 'ERCT', '76633': 'ERCT', '76634': 'ERCT', '76635': 'ERCT', '76636': 'ERCT', '76637': 'ERCT', '76638': 'ERCT', '76639': 'ERCT', '76640': 'ERCT', '76641': 'ERCT', '76642': 'ERCT', '76643': 'ERCT', '76644': 'ERCT', '76645': 'ERCT', '76648': 'ERCT', '76649': 'ERCT', '76650': 'ERCT', '76651': 'ERCT', '76652': 'ERCT', '76653': 'SRMV', '76654': 'ERCT', '76655': 'ERCT', '76656': 'ERCT', '76657': 'ERCT', '76660': 'ERCT', '76661': 'ERCT', '76664': 'ERCT', '76665': 'ERCT', '76666': 'ERCT', '76667': 'ERCT', '76670': 'ERCT', '76671': 'ERCT', '76673': 'ERCT', '76676': 'ERCT', '76678': 'ERCT', '76679': 'ERCT', '76680': 'ERCT', '76681': 'ERCT', '76682': 'ERCT', '76684': 'ERCT', '76685': 'ERCT', '76686': 'ERCT', '76687': 'SRMV', '76689': 'ERCT', '76690': 'ERCT', '76691': 'ERCT', '76692': 'ERCT', '76693': 'ERCT', '76701': 'ERCT', '76702': 'ERCT', '76703': 'ERCT', '76704': 'ERCT', '76705': 'ERCT', '76706': 'ERCT', '76707': 'ERCT', '76708': 'ERCT', '76710': 'ERCT', '76711': 'ERCT', '76712': 'ERCT', '76714': 'ERCT', '76715': 'ERCT', '76716': 'ERCT', '76797': 'ERCT', '76798': 'ERCT', '76799': 'ERCT', '76801': 'ERCT', '76802': 'ERCT', '76803': 'ERCT', '76804': 'ERCT', '76820': 'ERCT', '76821': 'ERCT', '76823': 'ERCT', '76824': 'ERCT', '76825': 'ERCT', '76827': 'ERCT', '76828': 'ERCT', '76831': 'ERCT', '76832': 'ERCT', '76834': 'ERCT', '76836': 'ERCT', '76837': 'ERCT', '76841': 'ERCT', '76842': 'ERCT', '76844': 'ERCT', '76845': 'ERCT', '76848': 'ERCT', '76849': 'ERCT', '76852': 'ERCT', '76853': 'ERCT', '76854': 'ERCT', '76855': 'ERCT', '76856': 'ERCT', '76857': 'ERCT', '76858': 'ERCT', '76859': 'ERCT', '76861': 'ERCT', '76862': 'ERCT', '76864': 'ERCT', '76865': 'ERCT', '76866': 'ERCT', '76869': 'ERCT', '76870': 'ERCT', '76871': 'ERCT', '76872': 'ERCT', '76873': 'ERCT', '76874': 'ERCT', '76875': 'ERCT', '76877': 'ERCT', '76878': 'ERCT', '76880': 'ERCT', '76882': 'ERCT', '76883': 'ERCT', '76884': 'ERCT', '76885': 'ERCT', '76886': 'ERCT', '76887': 'ERCT', '76888': 'ERCT', '76890': 'ERCT', '76901': 'ERCT', '76902': 'ERCT', '76903': 'ERCT', '76904': 'ERCT', '76905': 'ERCT', '76906': 'ERCT', '76908': 'ERCT', '76909': 'ERCT', '76930': 'ERCT', '76932': 'ERCT', '76933': 'ERCT', '76934': 'ERCT', '76935': 'ERCT', '76936': 'ERCT', '76937': 'ERCT', '76939': 'ERCT', '76940': 'ERCT', '76941': 'ERCT', '76943': 'ERCT', '76945': 'ERCT', '76949': 'ERCT', '76950': 'ERCT', '76951': 'ERCT', '76953': 'ERCT', '76955': 'ERCT', '76957': 'ERCT', '76958': 'ERCT', '77001': 'ERCT', '77002': 'ERCT', '77003': 'ERCT', '77004': 'ERCT', '77005': 'ERCT', '77006': 'ERCT', '77007': 'ERCT', '77008': 'ERCT', '77009': 'ERCT', '77010': 'ERCT', '77011': 'ERCT', '77012': 'ERCT', '77013': 'ERCT', '77014': 'ERCT', '77015': 'ERCT', '77016': 'ERCT', '77017': 'ERCT', '77018': 'ERCT', '77019': 'ERCT', '77020': 'ERCT', '77021': 'ERCT', '77022': 'ERCT', '77023': 'ERCT', '77024': 'ERCT', '77025': 'ERCT', '77026': 'ERCT', '77027': 'ERCT', '77028': 'ERCT', '77029': 'ERCT', '77030': 'ERCT', '77031': 'ERCT', '77032': 'ERCT', '77033': 'ERCT', '77034': 'ERCT', '77035': 'ERCT', '77036': 'ERCT', '77037': 'ERCT', '77038': 'ERCT', '77039': 'ERCT', '77040': 'ERCT', '77041': 'ERCT', '77042': 'ERCT', '77043': 'ERCT', '77044': 'ERCT', '77045': 'ERCT', '77046': 'ERCT', '77047': 'ERCT', '77048': 'ERCT', '77049': 'ERCT', '77050': 'ERCT', '77051': 'ERCT', '77052': 'ERCT', '77053': 'ERCT', '77054': 'ERCT', '77055': 'ERCT', '77056': 'ERCT', '77057': 'ERCT', '77058': 'ERCT', '77059': 'ERCT', '77060': 'ERCT', '77061': 'ERCT', '77062': 'ERCT', '77063': 'ERCT', '77064': 'ERCT', '77065': 'ERCT', '77066': 'ERCT', '77067': 'ERCT', '77068': 'ERCT', '77069': 'ERCT', '77070': 'ERCT', '77071': 'ERCT', '77072': 'ERCT', '77073': 'ERCT', '77074': 'ERCT', '77075': 'ERCT', '77076': 'ERCT', '77077': 'ERCT', '77078': 'ERCT', '77079': 'ERCT', '77080': 'ERCT', '77081': 'ERCT', '77082': 'ERCT', '77083': 'ERCT', '77084': 'ERCT', '77085': 'ERCT', '77086': 'ERCT', '77087': 'ERCT', '77088': 'ERCT', '77089': 'ERCT', '77090': 'ERCT', '77091': 'ERCT', '77092': 'ERCT', '77093': 'ERCT', '77094': 'ERCT', '77095': 'ERCT', '77096': 'ERCT', '77098': 'ERCT', '77099': 'ERCT', '77201': 'ERCT', '77202': 'ERCT', '77203': 'ERCT', '77204': 'ERCT', '77205': 'ERCT', '77206': 'ERCT', '77207': 'ERCT', '77208': 'ERCT', '77209': 'ERCT', '77210': 'ERCT', '77212': 'ERCT', '77213': 'ERCT', '77215': 'ERCT', '77216': 'ERCT', '77217': 'ERCT', '77218': 'ERCT', '77219': 'ERCT', '77220': 'ERCT', '77221': 'ERCT', '77222': 'ERCT', '77223': 'ERCT', '77224': 'ERCT', '77225': 'ERCT', '77226': 'ERCT', '77227': 'ERCT', '77228': 'ERCT', '77229': 'ERCT', '77230': 'ERCT', '77231': 'ERCT', '77233': 'ERCT', '77234': 'ERCT', '77235': 'ERCT', '77236': 'ERCT', '77237': 'ERCT', '77238': 'ERCT', '77240': 'ERCT', '77241': 'ERCT', '77242': 'ERCT', '77243': 'ERCT', '77244': 'ERCT', '77245': 'ERCT', '77246': 'ERCT', '77247': 'ERCT', '77248': 'ERCT', '77249': 'ERCT', '77250': 'ERCT', '77251': 'ERCT', '77252': 'ERCT', '77253': 'ERCT', '77254': 'ERCT', '77255': 'ERCT', '77256': 'ERCT', '77257': 'ERCT', '77258': 'ERCT', '77259': 'ERCT', '77260': 'ERCT', '77261': 'ERCT', '77262': 'ERCT', '77263': 'ERCT', '77265': 'ERCT', '77266': 'ERCT', '77267': 'ERCT', '77268': 'ERCT', '77269': 'ERCT', '77270': 'ERCT', '77271': 'ERCT', '77272': 'ERCT', '77273': 'ERCT', '77274': 'ERCT', '77275': 'ERCT', '77276': 'ERCT', '77277': 'ERCT', '77278': 'ERCT', '77279': 'ERCT', '77280': 'ERCT', '77282': 'ERCT', '77284': 'ERCT', '77285': 'ERCT', '77286': 'ERCT', '77287': 'ERCT', '77288': 'ERCT', '77289': 'ERCT', '77290': 'ERCT', '77291': 'ERCT', '77292': 'ERCT', '77293': 'ERCT', '77294': 'ERCT', '77296': 'ERCT', '77297': 'ERCT', '77299': 'ERCT', '77301': 'SRMV', '77302': 'SRMV', '77303': 'SRMV', '77304': 'SRMV', '77305': 'SRMV', '77306': 'SRMV', '77315': 'ERCT', '77316': 'SRMV', '77318': 'SRMV', '77320': 'SRMV', '77325': 'SRMV', '77326': 'SRMV', '77327': 'SRMV', '77328': 'SRMV', '77331': 'SRMV', '77332': 'SRMV', '77333': 'SRMV', '77334': 'SRMV', '77335': 'SRMV', '77336': 'SRMV', '77337': 'ERCT', '77338': 'SRMV', '77339': 'SRMV', '77340': 'SRMV', '77341': 'SRMV', '77342': 'SRMV', '77343': 'SRMV', '77344': 'SRMV', '77345': 'ERCT', '77346': 'ERCT', '77347': 'ERCT', '77348': 'SRMV', '77349': 'SRMV', '77350': 'SRMV', '77351': 'SRMV', '77353': 'SRMV', '77354': 'SRMV', '77355': 'SRMV', '77356': 'SRMV', '77357': 'SRMV', '77358': 'SRMV', '77359': 'SRMV', '77360': 'SRMV', '77362': 'SRMV', '77363': 'SRMV', '77364': 'SRMV', '77365': 'SRMV', '77367': 'SRMV', '77368': 'SRMV', '77369': 'SRMV', '77371': 'SRMV', '77372': 'SRMV', '77373': 'SRMV', '77374': 'SRMV', '77375': 'SRMV', '77376': 'SRMV', '77377': 'SRMV', '77378': 'SRMV', '77379': 'ERCT', '77380': 'SRMV', '77381': 'SRMV', '77382': 'SRMV', '77383': 'ERCT', '77384': 'SRMV', '77385': 'SRMV', '77386': 'SRMV', '77387': 'SRMV', '77388': 'ERCT', '77389': 'SRMV', '77391': 'ERCT', '77393': 'SRMV', '77396': 'ERCT', '77399': 'SRMV', '77401': 'ERCT', '77402': 'ERCT', '77404': 'ERCT', '77406': 'ERCT', '77407': 'ERCT', '77410': 'ERCT', '77411': 'ERCT', '77412': 'ERCT', '77413': 'ERCT', '77414': 'ERCT', '77415': 'ERCT', '77417': 'ERCT', '77418': 'ERCT', '77419': 'ERCT', '77420': 'ERCT', '77422': 'ERCT', '77423': 'SRMV', '77426': 'ERCT', '77428': 'ERCT', '77429': 'ERCT', '77430': 'ERCT', '77431': 'ERCT', '77432': 'ERCT', '77433': 'ERCT', '77434': 'ERCT', '77435': 'ERCT', '77436': 'ERCT', '77437': 'ERCT', '77440': 'ERCT', '77441': 'SRMV', '77442': 'ERCT', '77443': 'ERCT', '77444': 'ERCT', '77445': 'ERCT', '77446': 'ERCT', '77447': 'SRMV', '77448': 'ERCT', '77449': 'ERCT', '77450': 'ERCT', '77451': 'ERCT', '77452': 'ERCT', '77453': 'ERCT', '77454': 'ERCT', '77455': 'ERCT', '77456': 'ERCT', '77457': 'ERCT', '77458': 'ERCT', '77459': 'ERCT', '77460': 'ERCT', '77461': 'ERCT', '77463': 'ERCT', '77464': 'ERCT', '77465': 'ERCT', '77466': 'ERCT', '77467': 'ERCT', '77468': 'ERCT', '77469': 'ERCT', '77470': 'ERCT', '77471': 'ERCT', '77473': 'ERCT', '77474': 'SRMV', '77475': 'ERCT', '77476': 'ERCT', '77477': 'ERCT', '77478': 'ERCT', '77479': 'ERCT', '77480': 'ERCT', '77481': 'ERCT', '77482': 'ERCT', '77483': 'ERCT', '77484': 'SRMV', '77485': 'ERCT', '77486': 'ERCT', '77487': 'ERCT', '77488': 'ERCT', '77489': 'ERCT', '77491': 'ERCT', '77492': 'ERCT', '77493': 'SRMV', '77494': 'SRMV', '77496': 'ERCT', '77497': 'ERCT', '77498': 'ERCT', '77501': 'ERCT', '77502': 'ERCT', '77503': 'ERCT', '77504': 'ERCT', '77505': 'ERCT', '77506': 'ERCT', '77507': 'ERCT', '77508': 'ERCT', '77510': 'ERCT', '77511': 'ERCT', '77512': 'ERCT', '77514': 'SRMV', '77515': 'ERCT', '77516': 'ERCT', '77517': 'ERCT', '77518': 'ERCT', '77519': 'SRMV', '77520': 'SRMV', '77521': 'SRMV', '77522': 'ERCT', '77523': 'SRMV', '77530': 'ERCT', '77531': 'ERCT', '77532': 'SRMV', '77533': 'SRMV', '77534': 'ERCT', '77535': 'SRMV', '77536': 'ERCT', '77538': 'SRMV', '77539': 'ERCT', '77541': 'ERCT', '77542': 'ERCT', '77545': 'ERCT', '77546': 'ERCT', '77547': 'ERCT', '77549': 'ERCT', '77550': 'ERCT', '77551': 'ERCT', '77552': 'ERCT', '77553': 'ERCT', '77554': 'ERCT', '77555': 'ERCT', '77560': 'SRMV', '77561': 'SRMV', '77562': 'ERCT', '77563': 'ERCT', '77564': 'SRMV', '77565': 'ERCT', '77566': 'ERCT', '77568': 'ERCT', '77571': 'ERCT', '77572': 'ERCT', '77573': 'ERCT', '77574': 'ERCT', '77575': 'SRMV', '77577': 'ERCT', '77578': 'ERCT', '77580': 'SRMV', '77581': 'ERCT', '77582': 'SRMV', '77583': 'ERCT', '77584': 'ERCT', '77585': 'SRMV', '77586': 'ERCT', '77587': 'ERCT', '77588': 'ERCT', '77590': 'ERCT', '77591': 'ERCT', '77592': 'ERCT', '77597': 'SRMV', '77598': 'ERCT', '77611': 'SRMV', '77612': 'SRMV', '77613': 'SRMV', '77614': 'SRMV', '77615': 'SRMV', '77616': 'SRMV', '77617': 'SRMV', '77619': 'SRMV', '77622': 'SRMV', '77623': 'SRMV', '77624': 'SRMV', '77625': 'SRMV', '77626': 'SRMV', '77627': 'SRMV', '77629': 'SRMV', '77630': 'SRMV', '77631': 'SRMV', '77632': 'SRMV', '77639': 'SRMV', '77640': 'SRMV', '77641': 'SRMV', '77642': 'SRMV', '77643': 'SRMV', '77650': 'SRMV', '77651': 'SRMV', '77655': 'SRMV', '77656': 'SRMV', '77657': 'SRMV', '77659': 'SRMV', '77660': 'SRMV', '77661': 'SRMV', '77662': 'SRMV', '77663': 'SRMV', '77664': 'SRMV', '77665': 'SRMV', '77670': 'SRMV', '77701': 'SRMV', '77702': 'SRMV', '77703': 'SRMV', '77704': 'SRMV', '77705': 'SRMV', '77706': 'SRMV', '77707': 'SRMV', '77708': 'SRMV', '77709': 'SRMV', '77710': 'SRMV', '77713': 'SRMV', '77720': 'SRMV', '77725': 'SRMV', '77726': 'SRMV', '77801': 'ERCT', '77802': 'ERCT', '77803': 'ERCT', '77805': 'ERCT', '77806': 'ERCT', '77807': 'ERCT', '77808': 'ERCT', '77830': 'SRMV', '77831': 'SRMV', '77833': 'ERCT', '77834': 'ERCT', '77835': 'ERCT', '77836': 'ERCT', '77837': 'ERCT', '77838': 'ERCT', '77840': 'ERCT', '77841': 'ERCT', '77842': 'ERCT', '77843': 'ERCT', '77844': 'ERCT', '77845': 'ERCT', '77850': 'SRMV', '77852': 'ERCT', '77853': 'ERCT', '77855': 'ERCT', '77856': 'SRMV', '77857': 'ERCT', '77859': 'ERCT', '77861': 'SRMV', '77862': 'ERCT', '77863': 'ERCT', '77864': 'SRMV', '77865': 'SRMV', '77866': 'SRMV', '77867': 'SRMV', '77868': 'ERCT', '77870': 'ERCT', '77871': 'SRMV', '77872': 'SRMV', '77873': 'SRMV', '77875': 'SRMV', '77876': 'SRMV', '77878': 'ERCT', '77879': 'ERCT', '77880': 'ERCT', '77881': 'ERCT', '77882': 'SRMV', '77901': 'ERCT', '77902': 'ERCT', '77903': 'ERCT', '77904': 'ERCT', '77905': 'ERCT', '77950': 'ERCT', '77951': 'ERCT', '77954': 'ERCT', '77957': 'ERCT', '77960': 'ERCT', '77961': 'ERCT', '77962': 'ERCT', '77963': 'ERCT', '77964': 'ERCT', '77967': 'ERCT', '77968': 'ERCT', '77969': 'ERCT', '77970': 'ERCT', '77971': 'ERCT', '77973': 'ERCT', '77974': 'ERCT', '77975': 'ERCT', '77976': 'ERCT', '77977': 'ERCT', '77978': 'ERCT', '77979': 'ERCT', '77982': 'ERCT', '77983': 'ERCT', '77984': 'ERCT', '77986': 'ERCT', '77987': 'ERCT', '77988': 'ERCT', '77989': 'ERCT', '77990': 'ERCT', '77991': 'ERCT', '77993': 'ERCT', '77994': 'ERCT', '77995': 'ERCT', '78001': 'ERCT', '78002': 'ERCT', '78003': 'ERCT', '78004': 'ERCT', '78005': 'ERCT', '78006': 'ERCT', '78007': 'ERCT', '78008': 'ERCT', '78009': 'ERCT', '78010': 'ERCT', '78011': 'ERCT', '78012': 'ERCT', '78013': 'ERCT', '78014': 'ERCT', '78015': 'ERCT', '78016': 'ERCT', '78017': 'ERCT', '78019': 'ERCT', '78021': 'ERCT', '78022': 'ERCT', '78023': 'ERCT', '78024': 'ERCT', '78025': 'ERCT', '78026': 'ERCT', '78027': 'ERCT', '78028': 'ERCT', '78029': 'ERCT', '78039': 'ERCT', '78040': 'ERCT', '78041': 'ERCT', '78042': 'ERCT', '78043': 'ERCT', '78044': 'ERCT', '78045': 'ERCT', '78046': 'ERCT', '78049': 'ERCT', '78050': 'ERCT', '78052': 'ERCT', '78054': 'ERCT', '78055': 'ERCT', '78056': 'ERCT', '78057': 'ERCT', '78058': 'ERCT', '78059': 'ERCT', '78060': 'ERCT', '78061': 'ERCT', '78062': 'ERCT', '78063': 'ERCT', '78064': 'ERCT', '78065': 'ERCT', '78066': 'ERCT', '78067': 'ERCT', '78069': 'ERCT', '78070': 'ERCT', '78071': 'ERCT', '78072': 'ERCT', '78073': 'ERCT', '78074': 'ERCT', '78075': 'ERCT', '78076': 'ERCT', '78101': 'ERCT', '78102': 'ERCT', '78104': 'ERCT', '78107': 'ERCT', '78108': 'ERCT', '78109': 'ERCT', '78111': 'ERCT', '78112': 'ERCT', '78113': 'ERCT', '78114': 'ERCT', '78115': 'ERCT', '78116': 'ERCT', '78117': 'ERCT', '78118': 'ERCT', '78119': 'ERCT', '78121': 'ERCT', '78122': 'ERCT', '78123': 'ERCT', '78124': 'ERCT', '78125': 'ERCT', '78130': 'ERCT', '78131': 'ERCT', '78132': 'ERCT', '78133': 'ERCT', '78135': 'ERCT', '78140': 'ERCT', '78141': 'ERCT', '78142': 'ERCT', '78143': 'ERCT', '78144': 'ERCT', '78145': 'ERCT', '78146': 'ERCT', '78147': 'ERCT', '78148': 'ERCT', '78150': 'ERCT', '78151': 'ERCT', '78152': 'ERCT', '78154': 'ERCT', '78155': 'ERCT', '78156': 'ERCT', '78159': 'ERCT', '78160': 'ERCT', '78161': 'ERCT', '78162': 'ERCT', '78163': 'ERCT', '78164': 'ERCT', '78201': 'ERCT', '78202': 'ERCT', '78203': 'ERCT', '78204': 'ERCT', '78205': 'ERCT', '78206': 'ERCT', '78207': 'ERCT', '78208': 'ERCT', '78209': 'ERCT', '78210': 'ERCT', '78211': 'ERCT', '78212': 'ERCT', '78213': 'ERCT', '78214': 'ERCT', '78215': 'ERCT', '78216': 'ERCT', '78217': 'ERCT', '78218': 'ERCT', '78219': 'ERCT', '78220': 'ERCT', '78221': 'ERCT', '78222': 'ERCT', '78223': 'ERCT', '78224': 'ERCT', '78225': 'ERCT', '78226': 'ERCT', '78227': 'ERCT', '78228': 'ERCT', '78229': 'ERCT', '78230': 'ERCT', '78231': 'ERCT', '78232': 'ERCT', '78233': 'ERCT', '78234': 'ERCT', '78235': 'ERCT', '78236': 'ERCT', '78237': 'ERCT', '78238': 'ERCT', '78239': 'ERCT', '78240': 'ERCT', '78241': 'ERCT', '78242': 'ERCT', '78243': 'ERCT', '78244': 'ERCT', '78245': 'ERCT', '78246': 'ERCT', '78247': 'ERCT', '78248': 'ERCT', '78249': 'ERCT', '78250': 'ERCT', '78251': 'ERCT', '78252': 'ERCT', '78253': 'ERCT', '78254': 'ERCT', '78255': 'ERCT', '78256': 'ERCT', '78257': 'ERCT', '78258': 'ERCT', '78259': 'ERCT', '78260': 'ERCT', '78261': 'ERCT', '78263': 'ERCT', '78264': 'ERCT', '78265': 'ERCT', '78266': 'ERCT', '78268': 'ERCT', '78269': 'ERCT', '78270': 'ERCT', '78278': 'ERCT', '78279': 'ERCT', '78280': 'ERCT', '78283': 'ERCT', '78284': 'ERCT', '78285': 'ERCT', '78287': 'ERCT', '78288': 'ERCT', '78289': 'ERCT', '78291': 'ERCT', '78292': 'ERCT', '78293': 'ERCT', '78294': 'ERCT', '78295': 'ERCT', '78296': 'ERCT', '78297': 'ERCT', '78298': 'ERCT', '78299': 'ERCT', '78330': 'ERCT', '78332': 'ERCT', '78333': 'ERCT', '78335': 'ERCT', '78336': 'ERCT', '78338': 'ERCT', '78339': 'ERCT', '78340': 'ERCT', '78341': 'ERCT', '78342': 'ERCT', '78343': 'ERCT', '78344': 'ERCT', '78347': 'ERCT', '78349': 'ERCT', '78350': 'ERCT', '78351': 'ERCT', '78352': 'ERCT', '78353': 'ERCT', '78355': 'ERCT', '78357': 'ERCT', '78358': 'ERCT', '78359': 'ERCT', '78360': 'ERCT', '78361': 'ERCT', '78362': 'ERCT', '78363': 'ERCT', '78364': 'ERCT', '78368': 'ERCT', '78369': 'ERCT', '78370': 'ERCT', '78371': 'ERCT', '78372': 'ERCT', '78373': 'ERCT', '78374': 'ERCT', '78375': 'ERCT', '78376': 'ERCT', '78377': 'ERCT', '78379': 'ERCT', '78380': 'ERCT', '78381': 'ERCT', '78382': 'ERCT', '78383': 'ERCT', '78384': 'ERCT', '78385': 'ERCT', '78387': 'ERCT', '78389': 'ERCT', '78390': 'ERCT', '78391': 'ERCT', '78393': 'ERCT', '78401': 'ERCT', '78402': 'ERCT', '78403': 'ERCT', '78404': 'ERCT', '78405': 'ERCT', '78406': 'ERCT', '78407': 'ERCT', '78408': 'ERCT', '78409': 'ERCT', '78410': 'ERCT', '78411': 'ERCT', '78412': 'ERCT', '78413': 'ERCT', '78414': 'ERCT', '78415': 'ERCT', '78416': 'ERCT', '78417': 'ERCT', '78418': 'ERCT', '78419': 'ERCT', '78426': 'ERCT', '78427': 'ERCT', '78460': 'ERCT', '78463': 'ERCT', '78465': 'ERCT', '78466': 'ERCT', '78467': 'ERCT', '78468': 'ERCT', '78469': 'ERCT', '78470': 'ERCT', '78471': 'ERCT', '78472': 'ERCT', '78473': 'ERCT', '78474': 'ERCT', '78475': 'ERCT', '78476': 'ERCT', '78477': 'ERCT', '78478': 'ERCT', '78480': 'ERCT', '78501': 'ERCT', '78502': 'ERCT', '78503': 'ERCT', '78504': 'ERCT', '78505': 'ERCT', '78516': 'ERCT', '78520': 'ERCT', '78521': 'ERCT', '78522': 'ERCT', '78523': 'ERCT', '78526': 'ERCT', '78535': 'ERCT', '78536': 'ERCT', '78537': 'ERCT', '78538': 'ERCT', '78539': 'ERCT', '78540': 'ERCT', '78541': 'ERCT', '78542': 'ERCT', '78543': 'ERCT', '78545': 'ERCT', '78547': 'ERCT', '78548': 'ERCT', '78549': 'ERCT', '78550': 'ERCT', '78551': 'ERCT', '78552': 'ERCT', '78553': 'ERCT', '78557': 'ERCT', '78558': 'ERCT', '78559': 'ERCT', '78560': 'ERCT', '78561': 'ERCT', '78562': 'ERCT', '78563': 'ERCT', '78564': 'ERCT', '78565': 'ERCT', '78566': 'ERCT', '78567': 'ERCT', '78568': 'ERCT', '78569': 'ERCT', '78570': 'ERCT', '78572': 'ERCT', '78573': 'ERCT', '78574': 'ERCT', '78575': 'ERCT', '78576': 'ERCT', '78577': 'ERCT', '78578': 'ERCT', '78579': 'ERCT', '78580': 'ERCT', '78582': 'ERCT', '78583': 'ERCT', '78584': 'ERCT', '78585': 'ERCT', '78586': 'ERCT', '78588': 'ERCT', '78589': 'ERCT', '78590': 'ERCT', '78591': 'ERCT', '78592': 'ERCT', '78593': 'ERCT', '78594': 'ERCT', '78595': 'ERCT', '78596': 'ERCT', '78597': 'ERCT', '78598': 'ERCT', '78599': 'ERCT', '78602': 'ERCT', '78604': 'ERCT', '78605': 'ERCT', '78606': 'ERCT', '78607': 'ERCT', '78608': 'ERCT', '78609': 'ERCT', '78610': 'ERCT', '78611': 'ERCT', '78612': 'ERCT', '78613': 'ERCT', '78614': 'ERCT', '78615': 'ERCT', '78616': 'ERCT', '78617': 'ERCT', '78618': 'ERCT', '78619': 'ERCT', '78620': 'ERCT', '78621': 'ERCT', '78622': 'ERCT', '78623': 'ERCT', '78624': 'ERCT', '78626': 'ERCT', '78627': 'ERCT', '78628': 'ERCT', '78629': 'ERCT', '78630': 'ERCT', '78631': 'ERCT', '78632': 'ERCT', '78633': 'ERCT', '78634': 'ERCT', '78635': 'ERCT', '78636': 'ERCT', '78638': 'ERCT', '78639': 'ERCT', '78640': 'ERCT', '78641': 'ERCT', '78642': 'ERCT', '78643': 'ERCT', '78644': 'ERCT', '78645': 'ERCT', '78646': 'ERCT', '78648': 'ERCT', '78650': 'ERCT', '78651': 'ERCT', '78652': 'ERCT', '78653': 'ERCT', '78654': 'ERCT', '78655': 'ERCT', '78656': 'ERCT', '78657': 'ERCT', '78658': 'ERCT', '78659': 'ERCT', '78660': 'ERCT', '78661': 'ERCT', '78662': 'ERCT', '78663': 'ERCT', '78664': 'ERCT', '78665': 'ERCT', '78666': 'ERCT', '78667': 'ERCT', '78669': 'ERCT', '78670': 'ERCT', '78671': 'ERCT', '78672': 'ERCT', '78673': 'ERCT', '78674': 'ERCT', '78675': 'ERCT', '78676': 'ERCT', '78677': 'ERCT', '78680': 'ERCT', '78681': 'ERCT', '78682': 'ERCT', '78683': 'ERCT', '78691': 'ERCT', '78701': 'ERCT', '78702': 'ERCT', '78703': 'ERCT', '78704': 'ERCT', '78705': 'ERCT', '78708': 'ERCT', '78709': 'ERCT', '78710': 'ERCT', '78711': 'ERCT', '78712': 'ERCT', '78713': 'ERCT', '78714': 'ERCT', '78715': 'ERCT', '78716': 'ERCT', '78717': 'ERCT', '78718': 'ERCT', '78719': 'ERCT', '78720': 'ERCT', '78721': 'ERCT', '78722': 'ERCT', '78723': 'ERCT', '78724': 'ERCT', '78725': 'ERCT', '78726': 'ERCT', '78727': 'ERCT', '78728': 'ERCT', '78729': 'ERCT', '78730': 'ERCT', '78731': 'ERCT', '78732': 'ERCT', '78733': 'ERCT', '78734': 'ERCT', '78735': 'ERCT', '78736': 'ERCT', '78737': 'ERCT', '78738': 'ERCT', '78739': 'ERCT', '78741': 'ERCT', '78742': 'ERCT', '78744': 'ERCT', '78745': 'ERCT', '78746': 'ERCT', '78747': 'ERCT', '78748': 'ERCT', '78749': 'ERCT', '78750': 'ERCT', '78751': 'ERCT', '78752': 'ERCT', '78753': 'ERCT', '78754': 'ERCT', '78755': 'ERCT', '78756': 'ERCT', '78757': 'ERCT', '78758': 'ERCT', '78759': 'ERCT', '78760': 'ERCT', '78761': 'ERCT', '78762': 'ERCT', '78763': 'ERCT', '78764': 'ERCT', '78765': 'ERCT', '78766': 'ERCT', '78767': 'ERCT', '78768': 'ERCT', '78769': 'ERCT', '78772': 'ERCT', '78773': 'ERCT', '78774': 'ERCT', '78778': 'ERCT', '78779': 'ERCT', '78780': 'ERCT', '78781': 'ERCT', '78783': 'ERCT', '78785': 'ERCT', '78789': 'ERCT', '78799': 'ERCT', '78801': 'ERCT', '78802': 'ERCT', '78827': 'ERCT', '78828': 'ERCT', '78829': 'ERCT', '78830': 'ERCT', '78832': 'ERCT', '78833': 'ERCT', '78834': 'ERCT', '78836': 'ERCT', '78837': 'ERCT', '78838': 'ERCT', '78839': 'ERCT', '78840': 'ERCT', '78841': 'ERCT', '78842': 'ERCT', '78843': 'ERCT', '78847': 'ERCT', '78850': 'ERCT', '78851': 'ERCT', '78852': 'ERCT', '78853': 'ERCT', '78860': 'ERCT', '78861': 'ERCT', '78870': 'ERCT', '78871': 'ERCT', '78872': 'ERCT', '78873': 'ERCT', '78877': 'ERCT', '78879': 'ERCT', '78880': 'ERCT', '78881': 'ERCT', '78883': 'ERCT', '78884': 'ERCT', '78885': 'ERCT', '78886': 'ERCT', '78931': 'ERCT', '78932': 'ERCT', '78933': 'ERCT', '78934': 'ERCT', '78935': 'ERCT', '78938': 'ERCT', '78940': 'ERCT', '78941': 'ERCT', '78942': 'ERCT', '78943': 'ERCT', '78944': 'ERCT', '78945': 'ERCT', '78946': 'ERCT', '78947': 'ERCT', '78948': 'ERCT', '78949': 'ERCT', '78950': 'ERCT', '78951': 'ERCT', '78952': 'ERCT', '78953': 'ERCT', '78954': 'ERCT', '78956': 'ERCT', '78957': 'ERCT', '78959': 'ERCT', '78960': 'ERCT', '78961': 'ERCT', '78962': 'ERCT', '78963': 'ERCT', '79001': 'SPSO', '79002': 'SPSO', '79003': 'SPSO', '79005': 'SPSO', '79007': 'SPSO', '79008': 'SPSO', '79009': 'SPSO', '79010': 'SPSO', '79011': 'SPSO', '79012': 'SPSO', '79013': 'SPSO', '79014': 'SPSO', '79015': 'SPSO', '79016': 'SPSO', '79018': 'SPSO', '79019': 'ERCT', '79021': 'ERCT', '79022': 'SPSO', '79024': 'SPSO', '79025': 'SPSO', '79027': 'SPSO', '79029': 'SPSO', '79031': 'SPSO', '79032': 'SPSO', '79033': 'SPSO', '79034': 'SPSO', '79035': 'SPSO', '79036': 'SPSO', '79039': 'ERCT', '79040': 'SPSO', '79041': 'SPSO', '79042': 'ERCT', '79043': 'SPSO', '79044': 'SPSO', '79045': 'SPSO', '79046': 'SPSO', '79051': 'SPSO', '79052': 'ERCT', '79053': 'SPSO', '79054': 'SPSO', '79056': 'SPSO', '79057': 'ERCT', '79058': 'SPSO', '79059': 'ERCT', '79061': 'ERCT', '79062': 'SPSO', '79063': 'SPSO', '79064': 'SPSO', '79065': 'ERCT', '79066': 'SPSO', '79068': 'SPSO', '79070': 'SPSO', '79072': 'ERCT', '79073': 'SPSO', '79077': 'ERCT', '79078': 'SPSO', '79079': 'ERCT', '79080': 'SPSO', '79081': 'SPSO', '79082': 'SPSO', '79083': 'SPSO', '79084': 'SPSO', '79085': 'SPSO', '79086': 'SPSO', '79087': 'SPSO', '79088': 'ERCT', '79091': 'SPSO', '79092': 'SPSO', '79093': 'SPSO', '79094': 'ERCT', '79095': 'ERCT', '79096': 'ERCT', '79097': 'SPSO', '79098': 'SPSO', '79101': 'SPSO', '79102': 'SPSO', '79103': 'SPSO', '79104': 'SPSO', '79105': 'SPSO', '79106': 'SPSO', '79107': 'SPSO', '79108': 'SPSO', '79109': 'SPSO', '79110': 'SPSO', '79111': 'SPSO', '79114': 'SPSO', '79116': 'SPSO', '79117': 'SPSO', '79118': 'SPSO', '79119': 'SPSO', '79120': 'SPSO', '79121': 'SPSO', '79124': 'SPSO', '79159': 'SPSO', '79166': 'SPSO', '79168': 'SPSO', '79172': 'SPSO', '79174': 'SPSO', '79178': 'SPSO', '79185': 'SPSO', '79189': 'SPSO', '79201': 'ERCT', '79220': 'ERCT', '79221': 'SPSO', '79223': 'ERCT', '79225': 'ERCT', '79226': 'ERCT', '79227': 'ERCT', '79229': 'ERCT', '79230': 'ERCT', '79231': 'ERCT', '79233': 'ERCT', '79234': 'ERCT', '79235': 'ERCT', '79236': 'ERCT', '79237': 'ERCT', '79239': 'ERCT', '79240': 'ERCT', '79241': 'ERCT', '79243': 'ERCT', '79244': 'ERCT', '79245': 'ERCT', '79247': 'ERCT', '79248': 'ERCT', '79250': 'ERCT', '79251': 'ERCT', '79252': 'ERCT', '79255': 'ERCT', '79256': 'ERCT', '79257': 'ERCT', '79258': 'SPSO', '79259': 'ERCT', '79261': 'ERCT', '79311': 'ERCT', '79312': 'SPSO', '79313': 'SPSO', '79314': 'SPSO', '79316': 'SPSO', '79322': 'ERCT', '79323': 'SPSO', '79324': 'SPSO', '79325': 'SPSO', '79326': 'SPSO', '79329': 'ERCT', '79330': 'ERCT', '79331': 'SPSO', '79336': 'SPSO', '79338': 'SPSO', '79339': 'SPSO', '79342': 'SPSO', '79343': 'ERCT', '79344': 'SPSO', '79345': 'SPSO', '79346': 'SPSO', '79347': 'SPSO', '79350': 'SPSO', '79351': 'ERCT', '79353': 'SPSO', '79355': 'SPSO', '79356': 'ERCT', '79357': 'ERCT', '79358': 'SPSO', '79359': 'SPSO', '79360': 'SPSO', '79363': 'ERCT', '79364': 'SPSO', '79366': 'ERCT', '79367': 'ERCT', '79369': 'SPSO', '79370': 'ERCT', '79371': 'SPSO', '79372': 'SPSO', '79373': 'ERCT', '79376': 'SPSO', '79377': 'SPSO', '79378': 'SPSO', '79379': 'SPSO', '79380': 'SPSO', '79381': 'SPSO', '79382': 'SPSO', '79383': 'SPSO', '79401': 'ERCT', '79402': 'ERCT', '79403': 'ERCT', '79404': 'ERCT', '79406': 'ERCT', '79407': 'ERCT', '79408': 'ERCT', '79409': 'ERCT', '79410': 'ERCT', '79411': 'ERCT', '79412': 'ERCT', '79413': 'ERCT', '79414': 'ERCT', '79415': 'ERCT', '79416': 'ERCT', '79423': 'ERCT', '79424': 'ERCT', '79430': 'ERCT', '79452': 'ERCT', '79453': 'SPSO', '79457': 'ERCT', '79464': 'ERCT', '79490': 'SPSO', '79491': 'ERCT', '79493': 'ERCT', '79499': 'SPSO', '79501': 'ERCT', '79502': 'ERCT', '79503': 'ERCT', '79504': 'ERCT', '79505': 'SPSO', '79506': 'ERCT', '79508': 'ERCT', '79510': 'ERCT', '79511': 'ERCT', '79512': 'ERCT', '79516': 'ERCT', '79517': 'ERCT', '79518': 'ERCT', '79519': 'ERCT', '79520': 'ERCT', '79521': 'ERCT', '79525': 'ERCT', '79526': 'ERCT', '79527': 'ERCT', '79528': 'ERCT', '79529': 'ERCT', '79530': 'ERCT', '79532': 'ERCT', '79533': 'ERCT', '79534': 'ERCT', '79535': 'ERCT', '79536': 'ERCT', '79537': 'ERCT', '79538': 'ERCT', '79539': 'ERCT', '79540': 'ERCT', '79541': 'ERCT', '79543': 'ERCT', '79544': 'ERCT', '79545': 'ERCT', '79546': 'ERCT', '79547': 'ERCT', '79548': 'ERCT', '79549': 'ERCT', '79550': 'ERCT', '79553': 'ERCT', '79556': 'ERCT', '79560': 'ERCT', '79561': 'ERCT', '79562': 'ERCT', '79563': 'ERCT', '79565': 'ERCT', '79566': 'ERCT', '79567': 'ERCT', '79601': 'ERCT', '79602': 'ERCT', '79603': 'ERCT', '79604': 'ERCT', '79605': 'ERCT', '79606': 'ERCT', '79607': 'ERCT', '79608': 'ERCT', '79697': 'ERCT', '79698': 'ERCT', '79699': 'ERCT', '79701': 'ERCT', '79702': 'ERCT', '79703': 'ERCT', '79704': 'ERCT', '79705': 'ERCT', '79706': 'ERCT', '79707': 'ERCT', '79708': 'ERCT', '79710': 'ERCT', '79711': 'ERCT', '79712': 'ERCT', '79713': 'SPSO', '79714': 'SPSO', '79718': 'ERCT', '79719': 'ERCT', '79720': 'ERCT', '79721': 'ERCT', '79730': 'ERCT', '79731': 'ERCT', '79733': 'ERCT', '79734': 'ERCT', '79735': 'ERCT', '79738': 'ERCT', '79739': 'ERCT', '79740': 'ERCT', '79741': 'ERCT', '79742': 'ERCT', '79743': 'ERCT', '79744': 'ERCT', '79745': 'SPSO', '79748': 'ERCT', '79749': 'ERCT', '79752': 'ERCT', '79754': 'SPSO', '79755': 'ERCT', '79756': 'ERCT', '79758': 'ERCT', '79759': 'ERCT', '79760': 'ERCT', '79761': 'ERCT', '79762': 'ERCT', '79763': 'ERCT', '79764': 'ERCT', '79765': 'ERCT', '79766': 'ERCT', '79768': 'ERCT', '79769': 'ERCT', '79770': 'SPSO', '79772': 'ERCT', '79776': 'ERCT', '79777': 'ERCT', '79778': 'ERCT', '79780': 'ERCT', '79781': 'ERCT', '79782': 'ERCT', '79783': 'ERCT', '79785': 'ERCT', '79786': 'ERCT', '79788': 'ERCT', '79789': 'ERCT', '79821': 'AZNM', '79830': 'ERCT', '79831': 'ERCT', '79832': 'ERCT', '79834': 'ERCT', '79835': 'AZNM', '79836': 'AZNM', '79837': 'ERCT', '79838': 'AZNM', '79839': 'AZNM', '79842': 'ERCT', '79843': 'ERCT', '79845': 'ERCT', '79846': 'ERCT', '79847': 'ERCT', '79848': 'ERCT', '79849': 'AZNM', '79851': 'AZNM', '79852': 'ERCT', '79853': 'AZNM', '79854': 'ERCT', '79855': 'AZNM', '79901': 'AZNM', '79902': 'AZNM', '79903': 'AZNM', '79904': 'AZNM', '79905': 'AZNM', '79906': 'AZNM', '79907': 'AZNM', '79908': 'AZNM', '79910': 'AZNM', '79911': 'AZNM', '79912': 'AZNM', '79913': 'AZNM', '79914': 'AZNM', '79915': 'AZNM', '79916': 'AZNM', '79917': 'AZNM', '79918': 'AZNM', '79920': 'AZNM', '79922': 'AZNM', '79923': 'AZNM', '79924': 'AZNM', '79925': 'AZNM', '79926': 'AZNM', '79927': 'AZNM', '79928': 'AZNM', '79929': 'AZNM', '79930': 'AZNM', '79931': 'AZNM', '79932': 'AZNM', '79934': 'AZNM', '79935': 'AZNM', '79936': 'AZNM', '79937': 'AZNM', '79938': 'AZNM', '79940': 'AZNM', '79941': 'AZNM', '79942': 'ERCT', '79943': 'AZNM', '79944': 'AZNM', '79945': 'AZNM', '79946': 'AZNM', '79947': 'AZNM', '79948': 'AZNM', '79949': 'AZNM', '79950': 'AZNM', '79951': 'AZNM', '79952': 'AZNM', '79953': 'AZNM', '79954': 'AZNM', '79955': 'AZNM', '79958': 'AZNM', '79960': 'AZNM', '79961': 'AZNM', '79968': 'AZNM', '79976': 'AZNM', '79978': 'AZNM', '79980': 'AZNM', '79990': 'AZNM', '79995': 'AZNM', '79996': 'AZNM', '79997': 'AZNM', '79998': 'AZNM', '79999': 'AZNM', '80001': 'RMPA', '80002': 'RMPA', '80003': 'RMPA', '80004': 'RMPA', '80005': 'RMPA', '80006': 'RMPA', '80007': 'RMPA', '80010': 'RMPA', '80011': 'RMPA', '80012': 'RMPA', '80013': 'RMPA', '80014': 'RMPA', '80015': 'RMPA', '80016': 'RMPA', '80017': 'RMPA', '80018': 'RMPA', '80019': 'RMPA', '80020': 'RMPA', '80021': 'RMPA', '80022': 'RMPA', '80023': 'RMPA', '80024': 'RMPA', '80025': 'RMPA', '80026': 'RMPA', '80027': 'RMPA', '80030': 'RMPA', '80031': 'RMPA', '80033': 'RMPA', '80034': 'RMPA', '80035': 'RMPA', '80036': 'RMPA', '80037': 'RMPA', '80038': 'RMPA', '80040': 'RMPA', '80041': 'RMPA', '80042': 'RMPA', '80044': 'RMPA', '80045': 'RMPA', '80046': 'RMPA', '80047': 'RMPA', '80101': 'RMPA', '80102': 'RMPA', '80103': 'RMPA', '80104': 'RMPA', '80105': 'RMPA', '80106': 'RMPA', '80107': 'RMPA', '80108': 'RMPA', '80109': 'RMPA', '80110': 'RMPA', '80111': 'RMPA', '80112': 'RMPA', '80113': 'RMPA', '80116': 'RMPA', '80117': 'RMPA', '80118': 'RMPA', '80120': 'RMPA', '80121': 'RMPA', '80122': 'RMPA', '80123': 'RMPA', '80124': 'RMPA', '80125': 'RMPA', '80126': 'RMPA', '80127': 'RMPA', '80128': 'RMPA', '80129': 'RMPA', '80130': 'RMPA', '80131': 'RMPA', '80132': 'RMPA', '80133': 'RMPA', '80134': 'RMPA', '80135': 'RMPA', '80136': 'RMPA', '80137': 'RMPA', '80138': 'RMPA', '80150': 'RMPA', '80151': 'RMPA', '80155': 'RMPA', '80160': 'RMPA', '80161': 'RMPA', '80162': 'RMPA', '80163': 'RMPA', '80165': 'RMPA', '80166': 'RMPA', '80201': 'RMPA', '80202': 'RMPA', '80203': 'RMPA', '80204': 'RMPA', '80205': 'RMPA', '80206': 'RMPA', '80207': 'RMPA', '80208': 'RMPA', '80209': 'RMPA', '80210': 'RMPA', '80211': 'RMPA', '80212': 'RMPA', '80214': 'RMPA', '80215': 'RMPA', '80216': 'RMPA', '80217': 'RMPA', '80218': 'RMPA', '80219': 'RMPA', '80220': 'RMPA', '80221': 'RMPA', '80222': 'RMPA', '80223': 'RMPA', '80224': 'RMPA', '80225': 'RMPA', '80226': 'RMPA', '80227': 'RMPA', '80228': 'RMPA', '80229': 'RMPA', '80230': 'RMPA', '80231': 'RMPA', '80232': 'RMPA', '80233': 'RMPA', '80234': 'RMPA', '80235': 'RMPA', '80236': 'RMPA', '80237': 'RMPA', '80238': 'RMPA', '80239': 'RMPA', '80241': 'RMPA', '80243': 'RMPA', '80244': 'RMPA', '80246': 'RMPA', '80247': 'RMPA', '80248': 'RMPA', '80249': 'RMPA', '80250': 'RMPA', '80251': 'RMPA', '80252': 'RMPA', '80256': 'RMPA', '80257': 'RMPA', '80259': 'RMPA', '80260': 'RMPA', '80261': 'RMPA', '80262': 'RMPA', '80263': 'RMPA', '80264': 'RMPA', '80265': 'RMPA', '80266': 'RMPA', '80271': 'RMPA', '80273': 'RMPA', '80274': 'RMPA', '80279': 'RMPA', '80280': 'RMPA', '80281': 'RMPA', '80290': 'RMPA', '80291': 'RMPA', '80293': 'RMPA', '80294': 'RMPA', '80295': 'RMPA', '80299': 'RMPA', '80301': 'RMPA', '80302': 'RMPA', '80303': 'RMPA', '80304': 'RMPA', '80305': 'RMPA', '80306': 'RMPA', '80307': 'RMPA', '80308': 'RMPA', '80309': 'RMPA', '80310': 'RMPA', '80314': 'RMPA', '80321': 'RMPA', '80322': 'RMPA', '80323': 'RMPA', '80328': 'RMPA', '80329': 'RMPA', '80401': 'RMPA', '80402': 'RMPA', '80403': 'RMPA', '80419': 'RMPA', '80420': 'RMPA', '80421': 'RMPA', '80422': 'RMPA', '80423': 'RMPA', '80424': 'RMPA', '80425': 'RMPA', '80426': 'RMPA', '80427': 'RMPA', '80428': 'RMPA', '80429': 'RMPA', '80430': 'RMPA', '80432': 'RMPA', '80433': 'RMPA', '80434': 'RMPA', '80435': 'RMPA', '80436': 'RMPA', '80437': 'RMPA', '80438': 'RMPA', '80439': 'RMPA', '80440': 'RMPA', '80442': 'RMPA', '80443': 'RMPA', '80444': 'RMPA', '80446': 'RMPA', '80447': 'RMPA', '80448': 'RMPA', '80449': 'RMPA', '80451': 'RMPA', '80452': 'RMPA', '80453': 'RMPA', '80454': 'RMPA', '80455': 'RMPA', '80456': 'RMPA', '80457': 'RMPA', '80459': 'RMPA', '80461': 'RMPA', '80463': 'RMPA', '80465': 'RMPA', '80466': 'RMPA', '80467': 'RMPA', '80468': 'RMPA', '80469': 'RMPA', '80470': 'RMPA', '80471': 'RMPA', '80473': 'RMPA', '80474': 'RMPA', '80475': 'RMPA', '80476': 'RMPA', '80477': 'RMPA', '80478': 'RMPA', '80479': 'RMPA', '80480': 'RMPA', '80481': 'RMPA', '80482': 'RMPA', '80483': 'RMPA', '80487': 'RMPA', '80488': 'RMPA', '80497': 'RMPA', '80498': 'RMPA', '80501': 'RMPA', '80502': 'RMPA', '80503': 'RMPA', '80504': 'RMPA', '80510': 'RMPA', '80511': 'RMPA', '80512': 'RMPA', '80513': 'RMPA', '80514': 'RMPA', '80515': 'RMPA', '80516': 'RMPA', '80517': 'RMPA', '80520': 'RMPA', '80521': 'RMPA', '80522': 'RMPA', '80523': 'RMPA', '80524': 'RMPA', '80525': 'RMPA', '80526': 'RMPA', '80527': 'RMPA', '80528': 'RMPA', '80530': 'RMPA', '80532': 'RMPA', '80533': 'RMPA', '80534': 'RMPA', '80535': 'RMPA', '80536': 'RMPA', '80537': 'RMPA', '80538': 'RMPA', '80539': 'RMPA', '80540': 'RMPA', '80541': 'RMPA', '80542': 'RMPA', '80543': 'RMPA', '80544': 'RMPA', '80545': 'RMPA', '80546': 'RMPA', '80547': 'RMPA', '80549': 'RMPA', '80550': 'RMPA', '80551': 'RMPA', '80553': 'RMPA', '80601': 'RMPA', '80602': 'RMPA', '80603': 'RMPA', '80610': 'RMPA', '80611': 'RMPA', '80612': 'RMPA', '80614': 'RMPA', '80615': 'RMPA', '80620': 'RMPA', '80621': 'RMPA', '80622': 'RMPA', '80623': 'RMPA', '80624': 'RMPA', '80631': 'RMPA', '80632': 'RMPA', '80633': 'RMPA', '80634': 'RMPA', '80638': 'RMPA', '80639': 'RMPA', '80640': 'RMPA', '80642': 'RMPA', '80643': 'RMPA', '80644': 'RMPA', '80645': 'RMPA', '80646': 'RMPA', '80648': 'RMPA', '80649': 'RMPA', '80650': 'RMPA', '80651': 'RMPA', '80652': 'RMPA', '80653': 'RMPA', '80654': 'RMPA', '80701': 'RMPA', '80705': 'RMPA', '80720': 'RMPA', '80721': 'RMPA', '80722': 'RMPA', '80723': 'RMPA', '80726': 'RMPA', '80727': 'RMPA', '80728': 'RMPA', '80729': 'RMPA', '80731': 'RMPA', '80732': 'RMPA', '80733': 'RMPA', '80734': 'RMPA', '80735': 'RMPA', '80736': 'RMPA', '80737': 'RMPA', '80740': 'RMPA', '80741': 'RMPA', '80742': 'RMPA', '80743': 'RMPA', '80744': 'RMPA', '80745': 'RMPA', '80746': 'RMPA', '80747': 'RMPA', '80749': 'RMPA', '80750': 'RMPA', '80751': 'RMPA', '80754': 'RMPA', '80755': 'RMPA', '80757': 'RMPA', '80758': 'RMPA', '80759': 'RMPA', '80801': 'RMPA', '80802': 'RMPA', '80804': 'RMPA', '80805': 'RMPA', '80807': 'RMPA', '80808': 'RMPA', '80809': 'RMPA', '80810': 'RMPA', '80812': 'RMPA', '80813': 'RMPA', '80814': 'RMPA', '80815': 'RMPA', '80816': 'RMPA', '80817': 'RMPA', '80818': 'RMPA', '80819': 'RMPA', '80820': 'RMPA', '80821': 'RMPA', '80822': 'RMPA', '80823': 'RMPA', '80824': 'RMPA', '80825': 'RMPA', '80826': 'RMPA', '80827': 'RMPA', '80828': 'RMPA', '80829': 'RMPA', '80830': 'RMPA', '80831': 'RMPA', '80832': 'RMPA', '80833': 'RMPA', '80834': 'RMPA', '80835': 'RMPA', '80836': 'RMPA', '80840': 'RMPA', '80841': 'RMPA', '80860': 'RMPA', '80861': 'RMPA', '80862': 'RMPA', '80863': 'RMPA', '80864': 'RMPA', '80866': 'RMPA', '80901': 'RMPA', '80902': 'RMPA', '80903': 'RMPA', '80904': 'RMPA', '80905': 'RMPA', '80906': 'RMPA', '80907': 'RMPA', '80908': 'RMPA', '80909': 'RMPA', '80910': 'RMPA', '80911': 'RMPA', '80912': 'RMPA', '80913': 'RMPA', '80914': 'RMPA', '80915': 'RMPA', '80916': 'RMPA', '80917': 'RMPA', '80918': 'RMPA', '80919': 'RMPA', '80920': 'RMPA', '80921': 'RMPA', '80922': 'RMPA', '80923': 'RMPA', '80924': 'RMPA', '80925': 'RMPA', '80926': 'RMPA', '80927': 'RMPA', '80928': 'RMPA', '80929': 'RMPA', '80930': 'RMPA', '80931': 'RMPA', '80932': 'RMPA', '80933': 'RMPA', '80934': 'RMPA', '80935': 'RMPA', '80936': 'RMPA', '80937': 'RMPA', '80938': 'RMPA', '80939': 'RMPA', '80941': 'RMPA', '80942': 'RMPA', '80943': 'RMPA', '80944': 'RMPA', '80945': 'RMPA', '80946': 'RMPA', '80947': 'RMPA', '80949': 'RMPA', '80950': 'RMPA', '80951': 'RMPA', '80960': 'RMPA', '80962': 'RMPA', '80970': 'RMPA', '80977': 'RMPA', '80995': 'RMPA', '80997': 'RMPA', '81001': 'RMPA', '81002': 'RMPA', '81003': 'RMPA', '81004': 'RMPA', '81005': 'RMPA', '81006': 'RMPA', '81007': 'RMPA', '81008': 'RMPA', '81009': 'RMPA', '81010': 'RMPA', '81011': 'RMPA', '81012': 'RMPA', '81019': 'RMPA', '81020': 'RMPA', '81021': 'RMPA', '81022': 'RMPA', '81023': 'RMPA', '81024': 'RMPA', '81025': 'RMPA', '81027': 'RMPA', '81029': 'RMPA', '81030': 'RMPA', '81033': 'RMPA', '81034': 'RMPA', '81036': 'RMPA', '81038': 'RMPA', '81039': 'RMPA', '81040': 'RMPA', '81041': 'RMPA', '81043': 'RMPA', '81044': 'RMPA', '81045': 'RMPA', '81046': 'RMPA', '81047': 'RMPA', '81049': 'RMPA', '81050': 'RMPA', '81052': 'RMPA', '81054': 'RMPA', '81055': 'RMPA', '81057': 'RMPA', '81058': 'RMPA', '81059': 'RMPA', '81062': 'RMPA', '81063': 'RMPA', '81064': 'RMPA', '81067': 'RMPA', '81069': 'RMPA', '81071': 'RMPA', '81073': 'RMPA', '81076': 'RMPA', '81077': 'RMPA', '81081': 'RMPA', '81082': 'RMPA', '81084': 'RMPA', '81087': 'RMPA', '81089': 'RMPA', '81090': 'RMPA', '81091': 'RMPA', '81092': 'RMPA', '81101': 'RMPA', '81102': 'RMPA', '81120': 'RMPA', '81121': 'RMPA', '81122': 'RMPA', '81123': 'RMPA', '81124': 'RMPA', '81125': 'RMPA', '81126': 'RMPA', '81127': 'RMPA', '81128': 'RMPA', '81129': 'RMPA', '81130': 'RMPA', '81131': 'RMPA', '81132': 'RMPA', '81133': 'RMPA', '81135': 'RMPA', '81136': 'RMPA', '81137': 'RMPA', '81138': 'RMPA', '81140': 'RMPA', '81141': 'RMPA', '81143': 'RMPA', '81144': 'RMPA', '81146': 'RMPA', '81147': 'RMPA', '81148': 'RMPA', '81149': 'RMPA', '81151': 'RMPA', '81152': 'RMPA', '81154': 'RMPA', '81155': 'RMPA', '81157': 'RMPA', '81201': 'RMPA', '81210': 'RMPA', '81211': 'RMPA', '81212': 'RMPA', '81215': 'RMPA', '81220': 'RMPA', '81221': 'RMPA', '81222': 'RMPA', '81223': 'RMPA', '81224': 'RMPA', '81225': 'RMPA', '81226': 'RMPA', '81227': 'RMPA', '81228': 'RMPA', '81230': 'RMPA', '81231': 'RMPA', '81232': 'RMPA', '81233': 'RMPA', '81235': 'RMPA', '81236': 'RMPA', '81237': 'RMPA', '81239': 'RMPA', '81240': 'RMPA', '81241': 'RMPA', '81242': 'RMPA', '81243': 'RMPA', '81244': 'RMPA', '81247': 'RMPA', '81248': 'RMPA', '81251': 'RMPA', '81252': 'RMPA', '81253': 'RMPA', '81290': 'RMPA', '81301': 'RMPA', '81302': 'RMPA', '81303': 'RMPA', '81320': 'RMPA', '81321': 'RMPA', '81323': 'RMPA', '81324': 'RMPA', '81325': 'RMPA', '81326': 'RMPA', '81327': 'RMPA', '81328': 'RMPA', '81329': 'RMPA', '81330': 'RMPA', '81331': 'RMPA', '81332': 'RMPA', '81334': 'RMPA', '81335': 'RMPA', '81401': 'RMPA', '81402': 'RMPA', '81403': 'RMPA', '81410': 'RMPA', '81411': 'RMPA', '81413': 'RMPA', '81414': 'RMPA', '81415': 'RMPA', '81416': 'RMPA', '81418': 'RMPA', '81419': 'RMPA', '81420': 'RMPA', '81422': 'RMPA', '81423': 'RMPA', '81424': 'RMPA', '81425': 'RMPA', '81426': 'RMPA', '81427': 'RMPA', '81428': 'RMPA', '81429': 'RMPA', '81430': 'RMPA', '81431': 'RMPA', '81432': 'RMPA', '81433': 'RMPA', '81434': 'RMPA', '81435': 'RMPA', '81501': 'RMPA', '81502': 'RMPA', '81503': 'RMPA', '81504': 'RMPA', '81505': 'RMPA', '81506': 'RMPA', '81507': 'RMPA', '81520': 'RMPA', '81521': 'RMPA', '81522': 'RMPA', '81523': 'RMPA', '81524': 'RMPA', '81525': 'RMPA', '81526': 'RMPA', '81527': 'RMPA', '81601': 'RMPA', '81602': 'RMPA', '81610': 'NWPP', '81611': 'RMPA', '81612': 'RMPA', '81615': 'RMPA', '81620': 'RMPA', '81621': 'RMPA', '81623': 'RMPA', '81624': 'RMPA', '81625': 'RMPA', '81626': 'NWPP', '81630': 'RMPA', '81631': 'RMPA', '81632': 'RMPA', '81633': 'RMPA', '81635': 'RMPA', '81636': 'RMPA', '81637': 'RMPA', '81638': 'RMPA', '81639': 'RMPA', '81640': 'RMPA', '81641': 'RMPA', '81642': 'RMPA', '81643': 'RMPA', '81645': 'RMPA', '81646': 'RMPA', '81647': 'RMPA', '81648': 'NWPP', '81649': 'RMPA', '81650': 'RMPA', '81652': 'RMPA', '81653': 'RMPA', '81654': 'RMPA', '81655': 'RMPA', '81656': 'RMPA', '81657': 'RMPA', '81658': 'RMPA', '82001': 'RMPA', '82002': 'RMPA', '82003': 'RMPA', '82005': 'RMPA', '82006': 'RMPA', '82007': 'RMPA', '82008': 'RMPA', '82009': 'RMPA', '82010': 'RMPA', '82050': 'RMPA', '82051': 'RMPA', '82052': 'RMPA', '82053': 'RMPA', '82054': 'RMPA', '82055': 'RMPA', '82058': 'NWPP', '82059': 'RMPA', '82060': 'RMPA', '82061': 'RMPA', '82063': 'RMPA', '82070': 'RMPA', '82071': 'NWPP', '82072': 'RMPA', '82073': 'NWPP', '82081': 'RMPA', '82082': 'RMPA', '82083': 'RMPA', '82084': 'RMPA', '82190': 'NWPP', '82201': 'NWPP', '82210': 'RMPA', '82212': 'RMPA', '82213': 'NWPP', '82214': 'RMPA', '82215': 'RMPA', '82217': 'RMPA', '82218': 'RMPA', '82219': 'RMPA', '82221': 'RMPA', '82222': 'RMPA', '82223': 'RMPA', '82224': 'RMPA', '82225': 'RMPA', '82227': 'NWPP', '82229': 'NWPP', '82240': 'RMPA', '82242': 'RMPA', '82243': 'RMPA', '82244': 'RMPA', '82301': 'RMPA', '82310': 'RMPA', '82321': 'NWPP', '82322': 'NWPP', '82323': 'NWPP', '82324': 'RMPA', '82325': 'NWPP', '82327': 'RMPA', '82329': 'RMPA', '82331': 'RMPA', '82332': 'NWPP', '82334': 'RMPA', '82335': 'NWPP', '82336': 'NWPP', '82401': 'RMPA', '82410': 'NWPP', '82411': 'NWPP', '82412': 'NWPP', '82414': 'RMPA', '82420': 'NWPP', '82421': 'NWPP', '82422': 'RMPA', '82423': 'NWPP', '82426': 'NWPP', '82428': 'RMPA', '82430': 'NWPP', '82431': 'NWPP', '82432': 'RMPA', '82433': 'RMPA', '82434': 'RMPA', '82435': 'NWPP', '82440': 'RMPA', '82441': 'NWPP', '82442': 'RMPA', '82443': 'RMPA', '82450': 'NWPP', '82501': 'RMPA', '82510': 'RMPA', '82512': 'RMPA', '82513': 'RMPA', '82514': 'RMPA', '82515': 'RMPA', '82516': 'RMPA', '82520': 'RMPA', '82523': 'RMPA', '82524': 'RMPA', '82601': 'RMPA', '82602': 'NWPP', '82604': 'RMPA', '82605': 'NWPP', '82609': 'RMPA', '82615': 'RMPA', '82620': 'RMPA', '82630': 'RMPA', '82633': 'NWPP', '82635': 'NWPP', '82636': 'NWPP', '82637': 'RMPA', '82638': 'RMPA', '82639': 'RMPA', '82640': 'NWPP', '82642': 'RMPA', '82643': 'NWPP', '82644': 'NWPP', '82646': 'RMPA', '82648': 'RMPA', '82649': 'RMPA', '82701': 'RMPA', '82710': 'RMPA', '82711': 'RMPA', '82712': 'RMPA', '82714': 'RMPA', '82715': 'RMPA', '82716': 'RMPA', '82717': 'RMPA', '82718': 'NWPP', '82720': 'RMPA', '82721': 'RMPA', '82723': 'RMPA', '82725': 'RMPA', '82727': 'RMPA', '82729': 'RMPA', '82730': 'RMPA', '82731': 'RMPA', '82732': 'RMPA', '82801': 'MROW', '82831': 'RMPA', '82832': 'MROW', '82833': 'MROW', '82834': 'MROW', '82835': 'NWPP', '82836': 'MROW', '82837': 'RMPA', '82838': 'MROW', '82839': 'MROW', '82840': 'RMPA', '82842': 'MROW', '82844': 'MROW', '82845': 'RMPA', '82901': 'NWPP', '82902': 'NWPP', '82922': 'NWPP', '82923': 'NWPP', '82925': 'RMPA', '82929': 'NWPP', '82930': 'NWPP', '82931': 'RMPA', '82932': 'NWPP', '82933': 'NWPP', '82934': 'NWPP', '82935': 'NWPP', '82936': 'NWPP', '82937': 'NWPP', '82938': 'NWPP', '82939': 'RMPA', '82941': 'NWPP', '82942': 'NWPP', '82943': 'NWPP', '82944': 'RMPA', '82945': 'NWPP', '83001': 'RMPA', '83002': 'NWPP', '83011': 'NWPP', '83012': 'RMPA', '83013': 'RMPA', '83014': 'NWPP', '83025': 'NWPP', '83101': 'NWPP', '83110': 'NWPP', '83111': 'NWPP', '83112': 'NWPP', '83113': 'NWPP', '83114': 'NWPP', '83115': 'NWPP', '83116': 'NWPP', '83118': 'NWPP', '83119': 'NWPP', '83120': 'NWPP', '83121': 'NWPP', '83122': 'NWPP', '83123': 'NWPP', '83124': 'NWPP', '83126': 'NWPP', '83127': 'NWPP', '83128': 'NWPP', '83201': 'NWPP', '83202': 'NWPP', '83203': 'NWPP', '83204': 'NWPP', '83205': 'NWPP', '83206': 'NWPP', '83209': 'NWPP', '83210': 'NWPP', '83211': 'NWPP', '83212': 'NWPP', '83213': 'NWPP', '83214': 'NWPP', '83215': 'NWPP', '83217': 'NWPP', '83218': 'NWPP', '83220': 'NWPP', '83221': 'NWPP', '83223': 'NWPP', '83226': 'NWPP', '83227': 'NWPP', '83228': 'NWPP', '83229': 'NWPP', '83230': 'NWPP', '83232': 'NWPP', '83233': 'NWPP', '83234': 'NWPP', '83235': 'NWPP', '83236': 'NWPP', '83237': 'NWPP', '83238': 'NWPP', '83239': 'NWPP', '83241': 'NWPP', '83243': 'NWPP', '83244': 'NWPP', '83245': 'NWPP', '83246': 'NWPP', '83250': 'NWPP', '83251': 'NWPP', '83252': 'NWPP', '83253': 'NWPP', '83254': 'NWPP', '83255': 'NWPP', '83256': 'NWPP', '83261': 'NWPP', '83262': 'NWPP', '83263': 'NWPP', '83271': 'NWPP', '83272': 'NWPP', '83274': 'NWPP', '83276': 'NWPP', '83277': 'NWPP', '83278': 'NWPP', '83281': 'NWPP', '83283': 'NWPP', '83285': 'NWPP', '83286': 'NWPP', '83287': 'NWPP', '83301': 'NWPP', '83302': 'NWPP', '83303': 'NWPP', '83311': 'NWPP', '83312': 'NWPP', '83313': 'NWPP', '83314': 'NWPP', '83316': 'NWPP', '83318': 'NWPP', '83320': 'NWPP', '83321': 'NWPP', '83322': 'NWPP', '83323': 'NWPP', '83324': 'NWPP', '83325': 'NWPP', '83327': 'NWPP', '83328': 'NWPP', '83330': 'NWPP', '83332': 'NWPP', '83333': 'NWPP', '83334': 'NWPP', '83335': 'NWPP', '83336': 'NWPP', '83337': 'NWPP', '83338': 'NWPP', '83340': 'NWPP', '83341': 'NWPP', '83342': 'NWPP', '83343': 'NWPP', '83344': 'NWPP', '83346': 'NWPP', '83347': 'NWPP', '83348': 'NWPP', '83349': 'NWPP', '83350': 'NWPP', '83352': 'NWPP', '83353': 'NWPP', '83354': 'NWPP', '83355': 'NWPP', '83401': 'NWPP', '83402': 'NWPP', '83403': 'NWPP', '83404': 'NWPP', '83405': 'NWPP', '83406': 'NWPP', '83414': 'NWPP', '83415': 'NWPP', '83420': 'NWPP', '83421': 'NWPP', '83422': 'NWPP', '83423': 'NWPP', '83424': 'NWPP', '83425': 'NWPP', '83427': 'NWPP', '83428': 'NWPP', '83429': 'NWPP', '83431': 'NWPP', '83433': 'NWPP', '83434': 'NWPP', '83435': 'NWPP', '83436': 'NWPP', '83438': 'NWPP', '83440': 'NWPP', '83441': 'NWPP', '83442': 'NWPP', '83443': 'NWPP', '83444': 'NWPP', '83445': 'NWPP', '83446': 'NWPP', '83448': 'NWPP', '83449': 'NWPP', '83450': 'NWPP', '83451': 'NWPP', '83452': 'NWPP', '83454': 'NWPP', '83455': 'NWPP', '83460': 'NWPP', '83462': 'NWPP', '83463': 'NWPP', '83464': 'NWPP', '83465': 'NWPP', '83466': 'NWPP', '83467': 'NWPP', '83468': 'NWPP', '83469': 'NWPP', '83501': 'NWPP', '83520': 'NWPP', '83522': 'NWPP', '83523': 'NWPP', '83524': 'NWPP', '83525': 'NWPP', '83526': 'NWPP', '83530': 'NWPP', '83531': 'NWPP', '83533': 'NWPP', '83535': 'NWPP', '83536': 'NWPP', '83537': 'NWPP', '83539': 'NWPP', '83540': 'NWPP', '83541': 'NWPP', '83542': 'NWPP', '83543': 'NWPP', '83544': 'NWPP', '83545': 'NWPP', '83546': 'NWPP', '83547': 'NWPP', '83548': 'NWPP', '83549': 'NWPP', '83552': 'NWPP', '83553': 'NWPP', '83554': 'NWPP', '83555': 'NWPP', '83601': 'NWPP', '83602': 'NWPP', '83604': 'NWPP', '83605': 'NWPP', '83606': 'NWPP', '83607': 'NWPP', '83610': 'NWPP', '83611': 'NWPP', '83612': 'NWPP', '83615': 'NWPP', '83616': 'NWPP', '83617': 'NWPP', '83619': 'NWPP', '83622': 'NWPP', '83623': 'NWPP', '83624': 'NWPP', '83626': 'NWPP', '83627': 'NWPP', '83628': 'NWPP', '83629': 'NWPP', '83630': 'NWPP', '83631': 'NWPP', '83632': 'NWPP', '83633': 'NWPP', '83634': 'NWPP', '83635': 'NWPP', '83636': 'NWPP', '83637': 'NWPP', '83638': 'NWPP', '83639': 'NWPP', '83641': 'NWPP', '83642': 'NWPP', '83643': 'NWPP', '83644': 'NWPP', '83645': 'NWPP', '83646': 'NWPP', '83647': 'NWPP', '83648': 'NWPP', '83650': 'NWPP', '83651': 'NWPP', '83652': 'NWPP', '83653': 'NWPP', '83654': 'NWPP', '83655': 'NWPP', '83656': 'NWPP', '83657': 'NWPP', '83660': 'NWPP', '83661': 'NWPP', '83666': 'NWPP', '83669': 'NWPP', '83670': 'NWPP', '83671': 'NWPP', '83672': 'NWPP', '83676': 'NWPP', '83677': 'NWPP', '83680': 'NWPP', '83686': 'NWPP', '83687': 'NWPP', '83701': 'NWPP', '83702': 'NWPP', '83703': 'NWPP', '83704': 'NWPP', '83705': 'NWPP', '83706': 'NWPP', '83707': 'NWPP', '83708': 'NWPP', '83709': 'NWPP', '83711': 'NWPP', '83712': 'NWPP', '83713': 'NWPP', '83714': 'NWPP', '83715': 'NWPP', '83716': 'NWPP', '83717': 'NWPP', '83719': 'NWPP', '83720': 'NWPP', '83722': 'NWPP', '83724': 'NWPP', '83725': 'NWPP', '83726': 'NWPP', '83728': 'NWPP', '83729': 'NWPP', '83731': 'NWPP', '83732': 'NWPP', '83735': 'NWPP', '83756': 'NWPP', '83799': 'NWPP', '83801': 'NWPP', '83802': 'NWPP', '83803': 'NWPP', '83804': 'NWPP', '83805': 'NWPP', '83806': 'NWPP', '83808': 'NWPP', '83809': 'NWPP', '83810': 'NWPP', '83811': 'NWPP', '83812': 'NWPP', '83813': 'NWPP', '83814': 'NWPP', '83815': 'NWPP', '83816': 'NWPP', '83821': 'NWPP', '83822': 'NWPP', '83823': 'NWPP', '83824': 'NWPP', '83825': 'NWPP', '83826': 'NWPP', '83827': 'NWPP', '83830': 'NWPP', '83832': 'NWPP', '83833': 'NWPP', '83834': 'NWPP', '83835': 'NWPP', '83836': 'NWPP', '83837': 'NWPP', '83839': 'NWPP', '83840': 'NWPP', '83841': 'NWPP', '83842': 'NWPP', '83843': 'NWPP', '83844': 'NWPP', '83845': 'NWPP', '83846': 'NWPP', '83847': 'NWPP', '83848': 'NWPP', '83849': 'NWPP', '83850': 'NWPP', '83851': 'NWPP', '83852': 'NWPP', '83853': 'NWPP', '83854': 'NWPP', '83855': 'NWPP', '83856': 'NWPP', '83857': 'NWPP', '83858': 'NWPP', '83860': 'NWPP', '83861': 'NWPP', '83864': 'NWPP', '83865': 'NWPP', '83866': 'NWPP', '83867': 'NWPP', '83868': 'NWPP', '83869': 'NWPP', '83870': 'NWPP', '83871': 'NWPP', '83872': 'NWPP', '83873': 'NWPP', '83874': 'NWPP', '83876': 'NWPP', '83877': 'NWPP', '84001': 'NWPP', '84002': 'NWPP', '84003': 'NWPP', '84004': 'NWPP', '84005': 'NWPP', '84006': 'NWPP', '84007': 'NWPP', '84008': 'NWPP', '84009': 'NWPP', '84010': 'NWPP', '84011': 'NWPP', '84013': 'NWPP', '84014': 'NWPP', '84015': 'NWPP', '84016': 'NWPP', '84017': 'NWPP', '84018': 'NWPP', '84020': 'NWPP', '84021': 'NWPP', '84022': 'NWPP', '84023': 'NWPP', '84024': 'NWPP', '84025': 'NWPP', '84026': 'NWPP', '84027': 'NWPP', '84028': 'NWPP', '84029': 'NWPP', '84031': 'NWPP', '84032': 'NWPP', '84033': 'NWPP', '84034': 'NWPP', '84035': 'NWPP', '84036': 'NWPP', '84037': 'NWPP', '84038': 'NWPP', '84039': 'NWPP', '84040': 'NWPP', '84041': 'NWPP', '84042': 'NWPP', '84043': 'NWPP', '84044': 'NWPP', '84045': 'NWPP', '84046': 'NWPP', '84047': 'NWPP', '84049': 'NWPP', '84050': 'NWPP', '84051': 'NWPP', '84052': 'NWPP', '84053': 'NWPP', '84054': 'NWPP', '84055': 'NWPP', '84056': 'NWPP', '84057': 'NWPP', '84058': 'NWPP', '84059': 'NWPP', '84060': 'NWPP', '84061': 'NWPP', '84062': 'NWPP', '84063': 'NWPP', '84064': 'NWPP', '84065': 'NWPP', '84066': 'NWPP', '84067': 'NWPP', '84068': 'NWPP', '84069': 'NWPP', '84070': 'NWPP', '84071': 'NWPP', '84072': 'NWPP', '84073': 'NWPP', '84074': 'NWPP', '84075': 'NWPP', '84076': 'NWPP', '84078': 'NWPP', '84079': 'NWPP', '84080': 'NWPP', '84081': 'NWPP', '84082': 'NWPP', '84083': 'NWPP', '84084': 'NWPP', '84085': 'NWPP', '84086': 'NWPP', '84087': 'NWPP', '84088': 'NWPP', '84089': 'NWPP', '84090': 'NWPP', '84091': 'NWPP', '84092': 'NWPP', '84093': 'NWPP', '84094': 'NWPP', '84095': 'NWPP', '84096': 'NWPP', '84097': 'NWPP', '84098': 'NWPP', '84101': 'NWPP', '84102': 'NWPP', '84103': 'NWPP', '84104': 'NWPP', '84105': 'NWPP', '84106': 'NWPP', '84107': 'NWPP', '84108': 'NWPP', '84109': 'NWPP', '84110': 'NWPP', '84111': 'NWPP', '84112': 'NWPP', '84113': 'NWPP', '84114': 'NWPP', '84115': 'NWPP', '84116': 'NWPP', '84117': 'NWPP', '84118': 'NWPP', '84119': 'NWPP', '84120': 'NWPP', '84121': 'NWPP', '84122': 'NWPP', '84123': 'NWPP', '84124': 'NWPP', '84125': 'NWPP', '84126': 'NWPP', '84127': 'NWPP', '84128': 'NWPP', '84129': 'NWPP', '84130': 'NWPP', '84131': 'NWPP', '84132': 'NWPP', '84133': 'NWPP', '84134': 'NWPP', '84136': 'NWPP', '84138': 'NWPP', '84139': 'NWPP', '84141': 'NWPP', '84143': 'NWPP', '84144': 'NWPP', '84145': 'NWPP', '84147': 'NWPP', '84148': 'NWPP', '84150': 'NWPP', '84151': 'NWPP', '84152': 'NWPP', '84157': 'NWPP', '84158': 'NWPP', '84165': 'NWPP', '84170': 'NWPP', '84171': 'NWPP', '84180': 'NWPP', '84184': 'NWPP', '84189': 'NWPP', '84190': 'NWPP', '84199': 'NWPP', '84201': 'NWPP', '84244': 'NWPP', '84301': 'NWPP', '84302': 'NWPP', '84304': 'NWPP', '84305': 'NWPP', '84306': 'NWPP', '84307': 'NWPP', '84308': 'NWPP', '84309': 'NWPP', '84310': 'NWPP', '84311': 'NWPP', '84312': 'NWPP', '84313': 'NWPP', '84314': 'NWPP', '84315': 'NWPP', '84316': 'NWPP', '84317': 'NWPP', '84318': 'NWPP', '84319': 'NWPP', '84320': 'NWPP', '84321': 'NWPP', '84322': 'NWPP', '84323': 'NWPP', '84324': 'NWPP', '84325': 'NWPP', '84326': 'NWPP', '84327': 'NWPP', '84328': 'NWPP', '84329': 'NWPP', '84330': 'NWPP', '84331': 'NWPP', '84332': 'NWPP', '84333': 'NWPP', '84334': 'NWPP', '84335': 'NWPP', '84336': 'NWPP', '84337': 'NWPP', '84338': 'NWPP', '84339': 'NWPP', '84340': 'NWPP', '84341': 'NWPP', '84401': 'NWPP', '84402': 'NWPP', '84403': 'NWPP', '84404': 'NWPP', '84405': 'NWPP', '84407': 'NWPP', '84408': 'NWPP', '84409': 'NWPP', '84412': 'NWPP', '84414': 'NWPP', '84415': 'NWPP', '84501': 'NWPP', '84510': 'NWPP', '84511': 'NWPP', '84512': 'NWPP', '84513': 'NWPP', '84515': 'NWPP', '84516': 'NWPP', '84518': 'NWPP', '84520': 'NWPP', '84521': 'NWPP', '84522': 'NWPP', '84523': 'NWPP', '84525': 'NWPP', '84526': 'NWPP', '84528': 'NWPP', '84529': 'NWPP', '84530': 'RMPA', '84531': 'NWPP', '84532': 'NWPP', '84533': 'NWPP', '84534': 'RMPA', '84535': 'NWPP', '84536': 'NWPP', '84537': 'NWPP', '84539': 'NWPP', '84540': 'NWPP', '84542': 'NWPP', '84601': 'NWPP', '84602': 'NWPP', '84603': 'NWPP', '84604': 'NWPP', '84605': 'NWPP', '84606': 'NWPP', '84620': 'NWPP', '84621': 'NWPP', '84622': 'NWPP', '84623': 'NWPP', '84624': 'NWPP', '84626': 'NWPP', '84627': 'NWPP', '84628': 'NWPP', '84629': 'NWPP', '84630': 'NWPP', '84631': 'NWPP', '84632': 'NWPP', '84633': 'NWPP', '84634': 'NWPP', '84635': 'NWPP', '84636': 'NWPP', '84637': 'NWPP', '84638': 'NWPP', '84639': 'NWPP', '84640': 'NWPP', '84642': 'NWPP', '84643': 'NWPP', '84644': 'NWPP', '84645': 'NWPP', '84646': 'NWPP', '84647': 'NWPP', '84648': 'NWPP', '84649': 'NWPP', '84651': 'NWPP', '84652': 'NWPP', '84653': 'NWPP', '84654': 'NWPP', '84655': 'NWPP', '84656': 'NWPP', '84657': 'NWPP', '84660': 'NWPP', '84662': 'NWPP', '84663': 'NWPP', '84664': 'NWPP', '84665': 'NWPP', '84667': 'NWPP', '84701': 'NWPP', '84710': 'NWPP', '84711': 'NWPP', '84712': 'NWPP', '84713': 'NWPP', '84714': 'NWPP', '84715': 'NWPP', '84716': 'NWPP', '84718': 'NWPP', '84719': 'NWPP', '84720': 'NWPP', '84721': 'NWPP', '84722': 'NWPP', '84723': 'NWPP', '84724': 'NWPP', '84725': 'NWPP', '84726': 'NWPP', '84728': 'NWPP', '84729': 'NWPP', '84730': 'NWPP', '84731': 'NWPP', '84732': 'NWPP', '84733': 'NWPP', '84734': 'NWPP', '84735': 'NWPP', '84736': 'NWPP', '84737': 'NWPP', '84738': 'NWPP', '84739': 'NWPP', '84740': 'NWPP', '84741': 'NWPP', '84742': 'NWPP', '84743': 'NWPP', '84744': 'NWPP', '84745': 'NWPP', '84746': 'NWPP', '84747': 'NWPP', '84749': 'NWPP', '84750': 'NWPP', '84751': 'NWPP', '84752': 'NWPP', '84753': 'NWPP', '84754': 'NWPP', '84755': 'NWPP', '84756': 'NWPP', '84757': 'NWPP', '84758': 'NWPP', '84759': 'NWPP', '84760': 'NWPP', '84761': 'NWPP', '84762': 'NWPP', '84763': 'NWPP', '84764': 'NWPP', '84765': 'NWPP', '84766': 'NWPP', '84767': 'NWPP', '84770': 'NWPP', '84771': 'NWPP', '84772': 'NWPP', '84773': 'NWPP', '84774': 'NWPP', '84775': 'NWPP', '84776': 'NWPP', '84779': 'NWPP', '84780': 'NWPP', '84781': 'NWPP', '84782': 'NWPP', '84783': 'NWPP', '84784': 'NWPP', '84790': 'NWPP', '84791': 'NWPP', '85001': 'AZNM', '85002': 'AZNM', '85003': 'AZNM', '85004': 'AZNM', '85005': 'AZNM', '85006': 'AZNM', '85007': 'AZNM', '85008': 'AZNM', '85009': 'AZNM', '85010': 'AZNM', '85011': 'AZNM', '85012': 'AZNM', '85013': 'AZNM', '85014': 'AZNM', '85015': 'AZNM', '85016': 'AZNM', '85017': 'AZNM', '85018': 'AZNM', '85019': 'AZNM', '85020': 'AZNM', '85021': 'AZNM', '85022': 'AZNM', '85023': 'AZNM', '85024': 'AZNM', '85025': 'AZNM', '85026': 'AZNM', '85027': 'AZNM', '85028': 'AZNM', '85029': 'AZNM', '85030': 'AZNM', '85031': 'AZNM', '85032': 'AZNM', '85033': 'AZNM', '85034': 'AZNM', '85035': 'AZNM', '85036': 'AZNM', '85037': 'AZNM', '85038': 'AZNM', '85039': 'AZNM', '85040': 'AZNM', '85041': 'AZNM', '85042': 'AZNM', '85043': 'AZNM', '85044': 'AZNM', '85045': 'AZNM', '85046': 'AZNM', '85048': 'AZNM', '85050': 'AZNM', '85051': 'AZNM', '85053': 'AZNM', '85054': 'AZNM', '85055': 'AZNM', '85060': 'AZNM', '85061': 'AZNM', '85062': 'AZNM', '85063': 'AZNM', '85064': 'AZNM', '85065': 'AZNM', '85066': 'AZNM', '85067': 'AZNM', '85068': 'AZNM', '85069': 'AZNM', '85070': 'AZNM', '85071': 'AZNM', '85072': 'AZNM', '85073': 'AZNM', '85074': 'AZNM', '85075': 'AZNM', '85076': 'AZNM', '85078': 'AZNM', '85079': 'AZNM', '85080': 'AZNM', '85082': 'AZNM', '85083': 'AZNM', '85085': 'AZNM', '85086': 'AZNM', '85087': 'AZNM', '85096': 'AZNM', '85097': 'AZNM', '85098': 'AZNM', '85117': 'AZNM', '85118': 'AZNM', '85119': 'AZNM', '85120': 'AZNM', '85121': 'AZNM', '85122': 'AZNM', '85123': 'AZNM', '85127': 'AZNM', '85128': 'AZNM', '85130': 'AZNM', '85131': 'AZNM', '85132': 'AZNM', '85135': 'AZNM', '85137': 'AZNM', '85138': 'AZNM', '85139': 'AZNM', '85140': 'AZNM', '85141': 'AZNM', '85142': 'AZNM', '85143': 'AZNM', '85145': 'AZNM', '85147': 'AZNM', '85172': 'AZNM', '85173': 'AZNM', '85178': 'AZNM', '85190': 'AZNM', '85191': 'AZNM', '85192': 'AZNM', '85193': 'AZNM', '85194': 'AZNM', '85201': 'AZNM', '85202': 'AZNM', '85203': 'AZNM', '85204': 'AZNM', '85205': 'AZNM', '85206': 'AZNM', '85207': 'AZNM', '85208': 'AZNM', '85209': 'AZNM', '85210': 'AZNM', '85211': 'AZNM', '85212': 'AZNM', '85213': 'AZNM', '85214': 'AZNM', '85215': 'AZNM', '85216': 'AZNM', '85217': 'AZNM', '85218': 'AZNM', '85219': 'AZNM', '85220': 'AZNM', '85221': 'AZNM', '85222': 'AZNM', '85223': 'AZNM', '85224': 'AZNM', '85225': 'AZNM', '85226': 'AZNM', '85227': 'AZNM', '85228': 'AZNM', '85230': 'AZNM', '85231': 'AZNM', '85232': 'AZNM', '85233': 'AZNM', '85234': 'AZNM', '85235': 'AZNM', '85236': 'AZNM', '85237': 'AZNM', '85238': 'AZNM', '85239': 'AZNM', '85240': 'AZNM', '85241': 'AZNM', '85242': 'AZNM', '85243': 'AZNM', '85244': 'AZNM', '85245': 'AZNM', '85246': 'AZNM', '85247': 'AZNM', '85248': 'AZNM', '85249': 'AZNM', '85250': 'AZNM', '85251': 'AZNM', '85252': 'AZNM', '85253': 'AZNM', '85254': 'AZNM', '85255': 'AZNM', '85256': 'AZNM', '85257': 'AZNM', '85258': 'AZNM', '85259': 'AZNM', '85260': 'AZNM', '85261': 'AZNM', '85262': 'AZNM', '85263': 'AZNM', '85264': 'AZNM', '85266': 'AZNM', '85267': 'AZNM', '85268': 'AZNM', '85269': 'AZNM', '85271': 'AZNM', '85272': 'AZNM', '85273': 'AZNM', '85274': 'AZNM', '85275': 'AZNM', '85277': 'AZNM', '85278': 'AZNM', '85280': 'AZNM', '85281': 'AZNM', '85282': 'AZNM', '85283': 'AZNM', '85284': 'AZNM', '85285': 'AZNM', '85286': 'AZNM', '85287': 'AZNM', '85290': 'AZNM', '85291': 'AZNM', '85292': 'AZNM', '85293': 'AZNM', '85294': 'AZNM', '85295': 'AZNM', '85296': 'AZNM', '85297': 'AZNM', '85298': 'AZNM', '85299': 'AZNM', '85301': 'AZNM', '85302': 'AZNM', '85303': 'AZNM', '85304': 'AZNM', '85305': 'AZNM', '85306': 'AZNM', '85307': 'AZNM', '85308': 'AZNM', '85309': 'AZNM', '85310': 'AZNM', '85311': 'AZNM', '85312': 'AZNM', '85318': 'AZNM', '85320': 'AZNM', '85321': 'AZNM', '85322': 'AZNM', '85323': 'AZNM', '85324': 'AZNM', '85325': 'AZNM', '85326': 'AZNM', '85327': 'AZNM', '85328': 'AZNM', '85329': 'AZNM', '85331': 'AZNM', '85332': 'AZNM', '85333': 'AZNM', '85334': 'AZNM', '85335': 'AZNM', '85336': 'AZNM', '85337': 'AZNM', '85338': 'AZNM', '85339': 'AZNM', '85340': 'AZNM', '85341': 'AZNM', '85342': 'AZNM', '85343': 'AZNM', '85344': 'AZNM', '85345': 'AZNM', '85346': 'AZNM', '85347': 'AZNM', '85348': 'AZNM', '85349': 'AZNM', '85350': 'AZNM', '85351': 'AZNM', '85352': 'AZNM', '85353': 'AZNM', '85354': 'AZNM', '85355': 'AZNM', '85356': 'AZNM', '85357': 'AZNM', '85358': 'AZNM', '85359': 'AZNM', '85360': 'AZNM', '85361': 'AZNM', '85362': 'AZNM', '85363': 'AZNM', '85364': 'AZNM', '85365': 'AZNM', '85366': 'AZNM', '85367': 'AZNM', '85369': 'AZNM', '85371': 'AZNM', '85372': 'AZNM', '85373': 'AZNM', '85374': 'AZNM', '85375': 'AZNM', '85376': 'AZNM', '85377': 'AZNM', '85378': 'AZNM', '85379': 'AZNM', '85380': 'AZNM', '85381': 'AZNM', '85382': 'AZNM', '85383': 'AZNM', '85385': 'AZNM', '85387': 'AZNM', '85388': 'AZNM', '85390': 'AZNM', '85392': 'AZNM', '85395': 'AZNM', '85396': 'AZNM', '85501': 'AZNM', '85502': 'AZNM', '85530': 'AZNM', '85531': 'AZNM', '85532': 'AZNM', '85533': 'AZNM', '85534': 'AZNM', '85535': 'AZNM', '85536': 'AZNM', '85539': 'AZNM', '85540': 'AZNM', '85541': 'AZNM', '85542': 'AZNM', '85543': 'AZNM', '85544': 'AZNM', '85545': 'AZNM', '85546': 'AZNM', '85547': 'AZNM', '85548': 'AZNM', '85550': 'AZNM', '85551': 'AZNM', '85552': 'AZNM', '85553': 'AZNM', '85554': 'AZNM', '85601': 'AZNM', '85602': 'AZNM', '85603': 'AZNM', '85605': 'AZNM', '85606': 'AZNM', '85607': 'AZNM', '85608': 'AZNM', '85609': 'AZNM', '85610': 'AZNM', '85611': 'AZNM', '85613': 'AZNM', '85614': 'AZNM', '85615': 'AZNM', '85616': 'AZNM', '85617': 'AZNM', '85618': 'AZNM', '85619': 'AZNM', '85620': 'AZNM', '85621': 'AZNM', '85622': 'AZNM', '85623': 'AZNM', '85624': 'AZNM', '85625': 'AZNM', '85626': 'AZNM', '85627': 'AZNM', '85628': 'AZNM', '85629': 'AZNM', '85630': 'AZNM', '85631': 'AZNM', '85632': 'AZNM', '85633': 'AZNM', '85634': 'AZNM', '85635': 'AZNM', '85636': 'AZNM', '85637': 'AZNM', '85638': 'AZNM', '85639': 'AZNM', '85640': 'AZNM', '85641': 'AZNM', '85643': 'AZNM', '85644': 'AZNM', '85645': 'AZNM', '85646': 'AZNM', '85648': 'AZNM', '85650': 'AZNM', '85652': 'AZNM', '85653': 'AZNM', '85654': 'AZNM', '85655': 'AZNM', '85658': 'AZNM', '85662': 'AZNM', '85670': 'AZNM', '85671': 'AZNM', '85701': 'AZNM', '85702': 'AZNM', '85703': 'AZNM', '85704': 'AZNM', '85705': 'AZNM', '85706': 'AZNM', '85707': 'AZNM', '85708': 'AZNM', '85709': 'AZNM', '85710': 'AZNM', '85711': 'AZNM', '85712': 'AZNM', '85713': 'AZNM', '85714': 'AZNM', '85715': 'AZNM', '85716': 'AZNM', '85717': 'AZNM', '85718': 'AZNM', '85719': 'AZNM', '85720': 'AZNM', '85721': 'AZNM', '85722': 'AZNM', '85723': 'AZNM', '85724': 'AZNM', '85725': 'AZNM', '85726': 'AZNM', '85728': 'AZNM', '85730': 'AZNM', '85731': 'AZNM', '85732': 'AZNM', '85733': 'AZNM', '85734': 'AZNM', '85735': 'AZNM', '85736': 'AZNM', '85737': 'AZNM', '85738': 'AZNM', '85739': 'AZNM', '85740': 'AZNM', '85741': 'AZNM', '85742': 'AZNM', '85743': 'AZNM', '85744': 'AZNM', '85745': 'AZNM', '85746': 'AZNM', '85747': 'AZNM', '85748': 'AZNM', '85749': 'AZNM', '85750': 'AZNM', '85751': 'AZNM', '85752': 'AZNM', '85754': 'AZNM', '85755': 'AZNM', '85756': 'AZNM', '85757': 'AZNM', '85775': 'AZNM', '85901': 'AZNM', '85902': 'AZNM', '85911': 'AZNM', '85912': 'AZNM', '85920': 'AZNM', '85922': 'AZNM', '85923': 'AZNM', '85924': 'AZNM', '85925': 'AZNM', '85926': 'AZNM', '85927': 'AZNM', '85928': 'AZNM', '85929': 'AZNM', '85930': 'AZNM', '85931': 'AZNM', '85932': 'AZNM', '85933': 'AZNM', '85934': 'AZNM', '85935': 'AZNM', '85936': 'AZNM', '85937': 'AZNM', '85938': 'AZNM', '85939': 'AZNM', '85940': 'AZNM', '85941': 'AZNM', '85942': 'AZNM', '86001': 'AZNM', '86002': 'AZNM', '86003': 'AZNM', '86004': 'AZNM', '86005': 'AZNM', '86011': 'AZNM', '86015': 'AZNM', '86016': 'AZNM', '86017': 'AZNM', '86018': 'AZNM', '86020': 'AZNM', '86021': 'NWPP', '86022': 'NWPP', '86023': 'AZNM', '86024': 'AZNM', '86025': 'AZNM', '86028': 'AZNM', '86029': 'AZNM', '86030': 'AZNM', '86031': 'AZNM', '86032': 'AZNM', '86033': 'NWPP', '86034': 'AZNM', '86035': 'AZNM', '86036': 'NWPP', '86038': 'AZNM', '86039': 'NWPP', '86040': 'NWPP', '86042': 'AZNM', '86043': 'AZNM', '86044': 'AZNM', '86045': 'AZNM', '86046': 'AZNM', '86047': 'AZNM', '86052': 'NWPP', '86053': 'NWPP', '86054': 'NWPP', '86301': 'AZNM', '86302': 'AZNM', '86303': 'AZNM', '86304': 'AZNM', '86305': 'AZNM', '86312': 'AZNM', '86313': 'AZNM', '86314': 'AZNM', '86315': 'AZNM', '86320': 'AZNM', '86321': 'AZNM', '86322': 'AZNM', '86323': 'AZNM', '86324': 'AZNM', '86325': 'AZNM', '86326': 'AZNM', '86327': 'AZNM', '86329': 'AZNM', '86331': 'AZNM', '86332': 'AZNM', '86333': 'AZNM', '86334': 'AZNM', '86335': 'AZNM', '86336': 'AZNM', '86337': 'AZNM', '86338': 'AZNM', '86339': 'AZNM', '86340': 'AZNM', '86341': 'AZNM', '86342': 'AZNM', '86343': 'AZNM', '86351': 'AZNM', '86401': 'AZNM', '86402': 'AZNM', '86403': 'AZNM', '86404': 'AZNM', '86405': 'AZNM', '86406': 'AZNM', '86409': 'AZNM', '86411': 'AZNM', '86412': 'AZNM', '86413': 'AZNM', '86426': 'AZNM', '86427': 'AZNM', '86429': 'AZNM', '86430': 'AZNM', '86431': 'AZNM', '86432': 'NWPP', '86433': 'AZNM', '86434': 'AZNM', '86435': 'AZNM', '86436': 'AZNM', '86437': 'NWPP', '86438': 'AZNM', '86439': 'AZNM', '86440': 'AZNM', '86441': 'AZNM', '86442': 'AZNM', '86443': 'AZNM', '86444': 'NWPP', '86445': 'AZNM', '86446': 'AZNM', '86502': 'NWPP', '86503': 'NWPP', '86504': 'NWPP', '86505': 'NWPP', '86506': 'NWPP', '86507': 'NWPP', '86508': 'NWPP', '86510': 'AZNM', '86511': 'NWPP', '86512': 'NWPP', '86514': 'NWPP', '86515': 'NWPP', '86520': 'NWPP', '86535': 'NWPP', '86538': 'NWPP', '86540': 'NWPP', '86544': 'NWPP', '86545': 'NWPP', '86547': 'NWPP', '86555': 'AZNM', '86556': 'NWPP', '87001': 'AZNM', '87002': 'AZNM', '87004': 'AZNM', '87005': 'AZNM', '87006': 'AZNM', '87007': 'AZNM', '87008': 'AZNM', '87009': 'AZNM', '87010': 'AZNM', '87011': 'AZNM', '87012': 'AZNM', '87013': 'AZNM', '87014': 'AZNM', '87015': 'AZNM', '87016': 'AZNM', '87017': 'AZNM', '87018': 'AZNM', '87020': 'AZNM', '87021': 'AZNM', '87022': 'AZNM', '87023': 'AZNM', '87024': 'AZNM', '87025': 'AZNM', '87026': 'AZNM', '87027': 'AZNM', '87028': 'AZNM', '87029': 'AZNM', '87031': 'AZNM', '87032': 'AZNM', '87034': 'AZNM', '87035': 'AZNM', '87036': 'AZNM', '87037': 'NWPP', '87038': 'AZNM', '87040': 'AZNM', '87041': 'AZNM', '87042': 'AZNM', '87043': 'AZNM', '87044': 'AZNM', '87045': 'AZNM', '87046': 'AZNM', '87047': 'AZNM', '87048': 'AZNM', '87049': 'AZNM', '87051': 'AZNM', '87052': 'AZNM', '87053': 'AZNM', '87056': 'AZNM', '87059': 'AZNM', '87060': 'AZNM', '87061': 'AZNM', '87062': 'AZNM', '87063': 'AZNM', '87064': 'AZNM', '87068': 'AZNM', '87070': 'AZNM', '87072': 'AZNM', '87083': 'AZNM', '87101': 'AZNM', '87102': 'AZNM', '87103': 'AZNM', '87104': 'AZNM', '87105': 'AZNM', '87106': 'AZNM', '87107': 'AZNM', '87108': 'AZNM', '87109': 'AZNM', '87110': 'AZNM', '87111': 'AZNM', '87112': 'AZNM', '87113': 'AZNM', '87114': 'AZNM', '87115': 'AZNM', '87116': 'AZNM', '87117': 'AZNM', '87119': 'AZNM', '87120': 'AZNM', '87121': 'AZNM', '87122': 'AZNM', '87123': 'AZNM', '87124': 'AZNM', '87125': 'AZNM', '87131': 'AZNM', '87144': 'AZNM', '87151': 'AZNM', '87153': 'AZNM', '87154': 'AZNM', '87158': 'AZNM', '87174': 'AZNM', '87176': 'AZNM', '87181': 'AZNM', '87184': 'AZNM', '87185': 'AZNM', '87187': 'AZNM', '87190': 'AZNM', '87191': 'AZNM', '87192': 'AZNM', '87193': 'AZNM', '87194': 'AZNM', '87195': 'AZNM', '87196': 'AZNM', '87197': 'AZNM', '87198': 'AZNM', '87199': 'AZNM', '87301': 'AZNM', '87302': 'AZNM', '87305': 'NWPP', '87310': 'NWPP', '87311': 'AZNM', '87312': 'AZNM', '87313': 'AZNM', '87315': 'AZNM', '87316': 'AZNM', '87317': 'NWPP', '87319': 'NWPP', '87320': 'NWPP', '87321': 'AZNM', '87322': 'AZNM', '87323': 'AZNM', '87325': 'NWPP', '87326': 'AZNM', '87327': 'AZNM', '87328': 'NWPP', '87347': 'AZNM', '87357': 'AZNM', '87364': 'NWPP', '87365': 'AZNM', '87375': 'NWPP', '87401': 'AZNM', '87402': 'AZNM', '87410': 'AZNM', '87412': 'AZNM', '87413': 'AZNM', '87415': 'AZNM', '87416': 'NWPP', '87417': 'NWPP', '87418': 'RMPA', '87419': 'AZNM', '87420': 'NWPP', '87421': 'NWPP', '87455': 'NWPP', '87461': 'NWPP', '87499': 'NWPP', '87501': 'AZNM', '87502': 'AZNM', '87503': 'AZNM', '87504': 'AZNM', '87505': 'AZNM', '87506': 'AZNM', '87507': 'AZNM', '87508': 'AZNM', '87509': 'AZNM', '87510': 'AZNM', '87511': 'AZNM', '87512': 'AZNM', '87513': 'AZNM', '87514': 'AZNM', '87515': 'AZNM', '87516': 'AZNM', '87517': 'AZNM', '87518': 'AZNM', '87519': 'AZNM', '87520': 'AZNM', '87521': 'AZNM', '87522': 'AZNM', '87523': 'AZNM', '87524': 'AZNM', '87525': 'AZNM', '87527': 'AZNM', '87528': 'AZNM', '87529': 'AZNM', '87530': 'AZNM', '87531': 'AZNM', '87532': 'AZNM', '87533': 'AZNM', '87535': 'AZNM', '87537': 'AZNM', '87538': 'AZNM', '87539': 'AZNM', '87540': 'AZNM', '87543': 'AZNM', '87544': 'AZNM', '87545': 'AZNM', '87547': 'AZNM', '87548': 'AZNM', '87549': 'AZNM', '87551': 'AZNM', '87552': 'AZNM', '87553': 'AZNM', '87554': 'AZNM', '87556': 'AZNM', '87557': 'AZNM', '87558': 'AZNM', '87560': 'AZNM', '87562': 'AZNM', '87564': 'AZNM', '87565': 'AZNM', '87566': 'AZNM', '87567': 'AZNM', '87569': 'AZNM', '87571': 'AZNM', '87573': 'AZNM', '87574': 'AZNM', '87575': 'AZNM', '87576': 'AZNM', '87577': 'AZNM', '87578': 'AZNM', '87579': 'AZNM', '87580': 'AZNM', '87581': 'AZNM', '87582': 'AZNM', '87583': 'AZNM', '87592': 'AZNM', '87594': 'AZNM', '87701': 'AZNM', '87710': 'AZNM', '87711': 'AZNM', '87712': 'AZNM', '87713': 'AZNM', '87714': 'AZNM', '87715': 'AZNM', '87718': 'AZNM', '87722': 'AZNM', '87723': 'AZNM', '87724': 'AZNM', '87728': 'AZNM', '87729': 'AZNM', '87730': 'AZNM', '87731': 'AZNM', '87732': 'AZNM', '87733': 'SPSO', '87734': 'AZNM', '87735': 'AZNM', '87736': 'AZNM', '87740': 'AZNM', '87742': 'AZNM', '87743': 'SPSO', '87745': 'AZNM', '87746': 'SPSO', '87747': 'AZNM', '87749': 'AZNM', '87750': 'AZNM', '87752': 'AZNM', '87753': 'AZNM', '87801': 'AZNM', '87820': 'AZNM', '87821': 'AZNM', '87823': 'AZNM', '87824': 'AZNM', '87825': 'AZNM', '87827': 'AZNM', '87828': 'AZNM', '87829': 'AZNM', '87830': 'AZNM', '87831': 'AZNM', '87832': 'AZNM', '87901': 'AZNM', '87930': 'AZNM', '87931': 'AZNM', '87933': 'AZNM', '87935': 'AZNM', '87936': 'AZNM', '87937': 'AZNM', '87939': 'AZNM', '87940': 'AZNM', '87941': 'AZNM', '87942': 'AZNM', '87943': 'AZNM', '88001': 'AZNM', '88002': 'AZNM', '88003': 'AZNM', '88004': 'AZNM', '88005': 'AZNM', '88006': 'AZNM', '88007': 'AZNM', '88008': 'AZNM', '88009': 'AZNM', '88011': 'AZNM', '88012': 'AZNM', '88013': 'AZNM', '88020': 'AZNM', '88021': 'AZNM', '88022': 'AZNM', '88023': 'AZNM', '88024': 'AZNM', '88025': 'AZNM', '88026': 'AZNM', '88027': 'AZNM', '88028': 'AZNM', '88029': 'AZNM', '88030': 'AZNM', '88031': 'AZNM', '88032': 'AZNM', '88033': 'AZNM', '88034': 'AZNM', '88036': 'AZNM', '88038': 'AZNM', '88039': 'AZNM', '88040': 'AZNM', '88041': 'AZNM', '88042': 'AZNM', '88043': 'AZNM', '88044': 'AZNM', '88045': 'AZNM', '88046': 'AZNM', '88047': 'AZNM', '88048': 'AZNM', '88049': 'AZNM', '88051': 'AZNM', '88052': 'AZNM', '88053': 'AZNM', '88054': 'AZNM', '88055': 'AZNM', '88056': 'AZNM', '88058': 'AZNM', '88061': 'AZNM', '88062': 'AZNM', '88063': 'AZNM', '88065': 'AZNM', '88072': 'AZNM', '88081': 'AZNM', '88101': 'SPSO', '88102': 'SPSO', '88103': 'SPSO', '88112': 'SPSO', '88113': 'SPSO', '88114': 'SPSO', '88115': 'SPSO', '88116': 'SPSO', '88118': 'SPSO', '88119': 'AZNM', '88120': 'SPSO', '88121': 'SPSO', '88122': 'SPSO', '88123': 'SPSO', '88124': 'SPSO', '88125': 'SPSO', '88126': 'SPSO', '88130': 'SPSO', '88132': 'SPSO', '88133': 'SPSO', '88134': 'SPSO', '88135': 'SPSO', '88136': 'AZNM', '88201': 'AZNM', '88202': 'AZNM', '88203': 'SPSO', '88210': 'SPSO', '88211': 'SPSO', '88213': 'SPSO', '88220': 'SPSO', '88221': 'SPSO', '88230': 'SPSO', '88231': 'SPSO', '88232': 'SPSO', '88240': 'SPSO', '88241': 'SPSO', '88242': 'SPSO', '88244': 'SPSO', '88250': 'SPSO', '88252': 'SPSO', '88253': 'SPSO', '88254': 'SPSO', '88255': 'SPSO', '88256': 'ERCT', '88260': 'SPSO', '88262': 'SPSO', '88263': 'SPSO', '88264': 'SPSO', '88265': 'SPSO', '88267': 'SPSO', '88268': 'ERCT', '88301': 'AZNM', '88310': 'AZNM', '88311': 'AZNM', '88312': 'AZNM', '88314': 'AZNM', '88316': 'AZNM', '88317': 'AZNM', '88318': 'AZNM', '88321': 'AZNM', '88323': 'AZNM', '88324': 'AZNM', '88325': 'AZNM', '88330': 'AZNM', '88336': 'AZNM', '88337': 'AZNM', '88338': 'AZNM', '88339': 'AZNM', '88340': 'AZNM', '88341': 'AZNM', '88342': 'AZNM', '88343': 'AZNM', '88344': 'AZNM', '88345': 'AZNM', '88346': 'AZNM', '88347': 'AZNM', '88348': 'AZNM', '88349': 'AZNM', '88350': 'AZNM', '88351': 'AZNM', '88352': 'AZNM', '88353': 'AZNM', '88354': 'AZNM', '88355': 'AZNM', '88401': 'SPSO', '88410': 'AZNM', '88411': 'SPSO', '88414': 'AZNM', '88415': 'AZNM', '88416': 'SPSO', '88417': 'SPSO', '88418': 'AZNM', '88419': 'AZNM', '88421': 'SPSO', '88422': 'AZNM', '88424': 'AZNM', '88426': 'SPSO', '88427': 'SPSO', '88430': 'SPSO', '88431': 'SPSO', '88433': 'SPSO', '88434': 'SPSO', '88435': 'AZNM', '88436': 'AZNM', '88439': 'SPSO', '88510': 'AZNM', '88511': 'AZNM', '88512': 'AZNM', '88513': 'AZNM', '88514': 'AZNM', '88515': 'AZNM', '88516': 'AZNM', '88517': 'AZNM', '88518': 'AZNM', '88519': 'AZNM', '88520': 'AZNM', '88521': 'AZNM', '88523': 'AZNM', '88524': 'AZNM', '88525': 'AZNM', '88526': 'AZNM', '88527': 'AZNM', '88528': 'AZNM', '88529': 'AZNM', '88530': 'AZNM', '88531': 'AZNM', '88532': 'AZNM', '88533': 'AZNM', '88534': 'AZNM', '88535': 'AZNM', '88536': 'AZNM', '88538': 'AZNM', '88539': 'AZNM', '88540': 'AZNM', '88541': 'AZNM', '88542': 'AZNM', '88543': 'AZNM', '88544': 'AZNM', '88545': 'AZNM', '88546': 'AZNM', '88547': 'AZNM', '88548': 'AZNM', '88549': 'AZNM', '88550': 'AZNM', '88553': 'AZNM', '88554': 'AZNM', '88555': 'AZNM', '88556': 'AZNM', '88557': 'AZNM', '88558': 'AZNM', '88559': 'AZNM', '88560': 'AZNM', '88561': 'AZNM', '88562': 'AZNM', '88563': 'AZNM', '88565': 'AZNM', '88566': 'AZNM', '88567': 'AZNM', '88568': 'AZNM', '88569': 'AZNM', '88570': 'AZNM', '88571': 'AZNM', '88572': 'AZNM', '88573': 'AZNM', '88574': 'AZNM', '88575': 'AZNM', '88576': 'AZNM', '88577': 'AZNM', '88578': 'AZNM', '88579': 'AZNM', '88580': 'AZNM', '88581': 'AZNM', '88582': 'AZNM', '88583': 'AZNM', '88584': 'AZNM', '88585': 'AZNM', '88586': 'AZNM', '88587': 'AZNM', '88588': 'AZNM', '88589': 'AZNM', '88590': 'AZNM', '88595': 'AZNM', '88901': 'AZNM', '88905': 'AZNM', '89001': 'AZNM', '89002': 'AZNM', '89003': 'NWPP', '89004': 'AZNM', '89005': 'AZNM', '89006': 'AZNM', '89007': 'AZNM', '89008': 'AZNM', '89009': 'AZNM', '89010': 'NWPP', '89011': 'AZNM', '89012': 'AZNM', '89013': 'NWPP', '89014': 'AZNM', '89015': 'AZNM', '89016': 'AZNM', '89017': 'NWPP', '89018': 'AZNM', '89019': 'AZNM', '89020': 'NWPP', '89021': 'AZNM', '89022': 'NWPP', '89023': 'AZNM', '89024': 'AZNM', '89025': 'AZNM', '89026': 'AZNM', '89027': 'AZNM', '89028': 'AZNM', '89029': 'AZNM', '89030': 'AZNM', '89031': 'AZNM', '89032': 'AZNM', '89033': 'AZNM', '89034': 'AZNM', '89036': 'AZNM', '89037': 'AZNM', '89039': 'AZNM', '89040': 'AZNM', '89041': 'NWPP', '89042': 'NWPP', '89043': 'NWPP', '89044': 'AZNM', '89045': 'NWPP', '89046': 'AZNM', '89047': 'NWPP', '89048': 'NWPP', '89049': 'NWPP', '89052': 'AZNM', '89053': 'AZNM', '89054': 'AZNM', '89060': 'AZNM', '89061': 'NWPP', '89067': 'AZNM', '89070': 'AZNM', '89074': 'AZNM', '89077': 'AZNM', '89081': 'AZNM', '89084': 'AZNM', '89085': 'AZNM', '89086': 'AZNM', '89087': 'AZNM', '89101': 'AZNM', '89102': 'AZNM', '89103': 'AZNM', '89104': 'AZNM', '89105': 'AZNM', '89106': 'AZNM', '89107': 'AZNM', '89108': 'AZNM', '89109': 'AZNM', '89110': 'AZNM', '89111': 'AZNM', '89112': 'AZNM', '89113': 'AZNM', '89114': 'AZNM', '89115': 'AZNM', '89116': 'AZNM', '89117': 'AZNM', '89118': 'AZNM', '89119': 'AZNM', '89120': 'AZNM', '89121': 'AZNM', '89122': 'AZNM', '89123': 'AZNM', '89124': 'AZNM', '89125': 'AZNM', '89126': 'AZNM', '89127': 'AZNM', '89128': 'AZNM', '89129': 'AZNM', '89130': 'AZNM', '89131': 'AZNM', '89132': 'AZNM', '89133': 'AZNM', '89134': 'AZNM', '89135': 'AZNM', '89136': 'AZNM', '89137': 'AZNM', '89138': 'AZNM', '89139': 'AZNM', '89140': 'AZNM', '89141': 'AZNM', '89142': 'AZNM', '89143': 'AZNM', '89144': 'AZNM', '89145': 'AZNM', '89146': 'AZNM', '89147': 'AZNM', '89148': 'AZNM', '89149': 'AZNM', '89150': 'AZNM', '89151': 'AZNM', '89152': 'AZNM', '89153': 'AZNM', '89154': 'AZNM', '89155': 'AZNM', '89156': 'AZNM', '89157': 'AZNM', '89158': 'AZNM', '89159': 'AZNM', '89160': 'AZNM', '89161': 'AZNM', '89162': 'AZNM', '89163': 'AZNM', '89164': 'AZNM', '89165': 'AZNM', '89166': 'AZNM', '89169': 'AZNM', '89170': 'AZNM', '89173': 'AZNM', '89177': 'AZNM', '89178': 'AZNM', '89179': 'AZNM', '89180': 'AZNM', '89183': 'AZNM', '89185': 'AZNM', '89191': 'AZNM', '89193': 'AZNM', '89195': 'AZNM', '89199': 'AZNM', '89301': 'NWPP', '89310': 'NWPP', '89311': 'NWPP', '89314': 'NWPP', '89315': 'NWPP', '89316': 'NWPP', '89317': 'NWPP', '89318': 'NWPP', '89319': 'NWPP', '89402': 'NWPP', '89403': 'NWPP', '89404': 'NWPP', '89405': 'NWPP', '89406': 'NWPP', '89407': 'NWPP', '89408': 'NWPP', '89409': 'NWPP', '89410': 'NWPP', '89411': 'NWPP', '89412': 'NWPP', '89413': 'NWPP', '89414': 'NWPP', '89415': 'NWPP', '89418': 'NWPP', '89419': 'NWPP', '89420': 'NWPP', '89421': 'NWPP', '89422': 'NWPP', '89423': 'NWPP', '89424': 'NWPP', '89425': 'NWPP', '89426': 'NWPP', '89427': 'NWPP', '89428': 'NWPP', '89429': 'NWPP', '89430': 'NWPP', '89431': 'NWPP', '89432': 'NWPP', '89433': 'NWPP', '89434': 'NWPP', '89435': 'NWPP', '89436': 'NWPP', '89437': 'NWPP', '89438': 'NWPP', '89439': 'CAMX', '89440': 'NWPP', '89441': 'NWPP', '89442': 'NWPP', '89444': 'NWPP', '89445': 'NWPP', '89446': 'NWPP', '89447': 'NWPP', '89448': 'NWPP', '89449': 'NWPP', '89450': 'NWPP', '89451': 'NWPP', '89452': 'NWPP', '89460': 'NWPP', '89496': 'NWPP', '89501': 'NWPP', '89502': 'NWPP', '89503': 'NWPP', '89504': 'NWPP', '89505': 'NWPP', '89506': 'NWPP', '89507': 'NWPP', '89508': 'NWPP', '89509': 'NWPP', '89510': 'NWPP', '89511': 'NWPP', '89512': 'NWPP', '89513': 'NWPP', '89515': 'NWPP', '89519': 'NWPP', '89520': 'NWPP', '89521': 'NWPP', '89523': 'NWPP', '89533': 'NWPP', '89555': 'NWPP', '89557': 'NWPP', '89570': 'NWPP', '89595': 'NWPP', '89599': 'NWPP', '89701': 'NWPP', '89702': 'NWPP', '89703': 'NWPP', '89704': 'NWPP', '89705': 'NWPP', '89706': 'NWPP', '89711': 'NWPP', '89712': 'NWPP', '89713': 'NWPP', '89714': 'NWPP', '89721': 'NWPP', '89801': 'NWPP', '89802': 'NWPP', '89803': 'NWPP', '89815': 'NWPP', '89820': 'NWPP', '89821': 'NWPP', '89822': 'NWPP', '89823': 'NWPP', '89825': 'NWPP', '89826': 'NWPP', '89828': 'NWPP', '89830': 'NWPP', '89831': 'NWPP', '89832': 'NWPP', '89833': 'NWPP', '89834': 'NWPP', '89835': 'NWPP', '89883': 'NWPP', '90001': 'CAMX', '90002': 'CAMX', '90003': 'CAMX', '90004': 'CAMX', '90005': 'CAMX', '90006': 'CAMX', '90007': 'CAMX', '90008': 'CAMX', '90009': 'CAMX', '90010': 'CAMX', '90011': 'CAMX', '90012': 'CAMX', '90013': 'CAMX', '90014': 'CAMX', '90015': 'CAMX', '90016': 'CAMX', '90017': 'CAMX', '90018': 'CAMX', '90019': 'CAMX', '90020': 'CAMX', '90021': 'CAMX', '90022': 'CAMX', '90023': 'CAMX', '90024': 'CAMX', '90025': 'CAMX', '90026': 'CAMX', '90027': 'CAMX', '90028': 'CAMX', '90029': 'CAMX', '90030': 'CAMX', '90031': 'CAMX', '90032': 'CAMX', '90033': 'CAMX', '90034': 'CAMX', '90035': 'CAMX', '90036': 'CAMX', '90037': 'CAMX', '90038': 'CAMX', '90039': 'CAMX', '90040': 'CAMX', '90041': 'CAMX', '90042': 'CAMX', '90043': 'CAMX', '90044': 'CAMX', '90045': 'CAMX', '90046': 'CAMX', '90047': 'CAMX', '90048': 'CAMX', '90049': 'CAMX', '90050': 'CAMX', '90051': 'CAMX', '90052': 'CAMX', '90053': 'CAMX', '90054': 'CAMX', '90055': 'CAMX', '90056': 'CAMX', '90057': 'CAMX', '90058': 'CAMX', '90059': 'CAMX', '90060': 'CAMX', '90061': 'CAMX', '90062': 'CAMX', '90063': 'CAMX', '90064': 'CAMX', '90065': 'CAMX', '90066': 'CAMX', '90067': 'CAMX', '90068': 'CAMX', '90069': 'CAMX', '90070': 'CAMX', '90071': 'CAMX', '90072': 'CAMX', '90073': 'CAMX', '90074': 'CAMX', '90075': 'CAMX', '90076': 'CAMX', '90077': 'CAMX', '90078': 'CAMX', '90079': 'CAMX', '90080': 'CAMX', '90081': 'CAMX', '90082': 'CAMX', '90083': 'CAMX', '90084': 'CAMX', '90086': 'CAMX', '90087': 'CAMX', '90088': 'CAMX', '90089': 'CAMX', '90090': 'CAMX', '90091': 'CAMX', '90093': 'CAMX', '90094': 'CAMX', '90095': 'CAMX', '90096': 'CAMX', '90099': 'CAMX', '90101': 'CAMX', '90103': 'CAMX', '90189': 'CAMX', '90201': 'CAMX', '90202': 'CAMX', '90209': 'CAMX', '90210': 'CAMX', '90211': 'CAMX', '90212': 'CAMX', '90213': 'CAMX', '90220': 'CAMX', '90221': 'CAMX', '90222': 'CAMX', '90223': 'CAMX', '90224': 'CAMX', '90230': 'CAMX', '90231': 'CAMX', '90232': 'CAMX', '90233': 'CAMX', '90239': 'CAMX', '90240': 'CAMX', '90241': 'CAMX', '90242': 'CAMX', '90245': 'CAMX', '90247': 'CAMX', '90248': 'CAMX', '90249': 'CAMX', '90250': 'CAMX', '90251': 'CAMX', '90254': 'CAMX', '90255': 'CAMX', '90260': 'CAMX', '90261': 'CAMX', '90262': 'CAMX', '90263': 'CAMX', '90264': 'CAMX', '90265': 'CAMX', '90266': 'CAMX', '90267': 'CAMX', '90270': 'CAMX', '90272': 'CAMX', '90274': 'CAMX', '90275': 'CAMX', '90277': 'CAMX', '90278': 'CAMX', '90280': 'CAMX', '90290': 'CAMX', '90291': 'CAMX', '90292': 'CAMX', '90293': 'CAMX', '90294': 'CAMX', '90295': 'CAMX', '90296': 'CAMX', '90301': 'CAMX', '90302': 'CAMX', '90303': 'CAMX', '90304': 'CAMX', '90305': 'CAMX', '90306': 'CAMX', '90307': 'CAMX', '90308': 'CAMX', '90309': 'CAMX', '90310': 'CAMX', '90311': 'CAMX', '90312': 'CAMX', '90401': 'CAMX', '90402': 'CAMX', '90403': 'CAMX', '90404': 'CAMX', '90405': 'CAMX', '90406': 'CAMX', '90407': 'CAMX', '90408': 'CAMX', '90409': 'CAMX', '90410': 'CAMX', '90411': 'CAMX', '90501': 'CAMX', '90502': 'CAMX', '90503': 'CAMX', '90504': 'CAMX', '90505': 'CAMX', '90506': 'CAMX', '90507': 'CAMX', '90508': 'CAMX', '90509': 'CAMX', '90510': 'CAMX', '90601': 'CAMX', '90602': 'CAMX', '90603': 'CAMX', '90604': 'CAMX', '90605': 'CAMX', '90606': 'CAMX', '90607': 'CAMX', '90608': 'CAMX', '90609': 'CAMX', '90610': 'CAMX', '90620': 'CAMX', '90621': 'CAMX', '90622': 'CAMX', '90623': 'CAMX', '90624': 'CAMX', '90630': 'CAMX', '90631': 'CAMX', '90632': 'CAMX', '90633': 'CAMX', '90637': 'CAMX', '90638': 'CAMX', '90639': 'CAMX', '90640': 'CAMX', '90650': 'CAMX', '90651': 'CAMX', '90652': 'CAMX', '90660': 'CAMX', '90661': 'CAMX', '90662': 'CAMX', '90670': 'CAMX', '90671': 'CAMX', '90680': 'CAMX', '90701': 'CAMX', '90702': 'CAMX', '90703': 'CAMX', '90704': 'CAMX', '90706': 'CAMX', '90707': 'CAMX', '90710': 'CAMX', '90711': 'CAMX', '90712': 'CAMX', '90713': 'CAMX', '90714': 'CAMX', '90715': 'CAMX', '90716': 'CAMX', '90717': 'CAMX', '90720': 'CAMX', '90721': 'CAMX', '90723': 'CAMX', '90731': 'CAMX', '90732': 'CAMX', '90733': 'CAMX', '90734': 'CAMX', '90740': 'CAMX', '90742': 'CAMX', '90743': 'CAMX', '90744': 'CAMX', '90745': 'CAMX', '90746': 'CAMX', '90747': 'CAMX', '90748': 'CAMX', '90749': 'CAMX', '90755': 'CAMX', '90801': 'CAMX', '90802': 'CAMX', '90803': 'CAMX', '90804': 'CAMX', '90805': 'CAMX', '90806': 'CAMX', '90807': 'CAMX', '90808': 'CAMX', '90809': 'CAMX', '90810': 'CAMX', '90813': 'CAMX', '90814': 'CAMX', '90815': 'CAMX', '90822': 'CAMX', '90831': 'CAMX', '90832': 'CAMX', '90833': 'CAMX', '90834': 'CAMX', '90835': 'CAMX', '90840': 'CAMX', '90842': 'CAMX', '90844': 'CAMX', '90846': 'CAMX', '90847': 'CAMX', '90848': 'CAMX', '90853': 'CAMX', '90895': 'CAMX', '90899': 'CAMX', '91001': 'CAMX', '91003': 'CAMX', '91006': 'CAMX', '91007': 'CAMX', '91008': 'CAMX', '91009': 'CAMX', '91010': 'CAMX', '91011': 'CAMX', '91012': 'CAMX', '91016': 'CAMX', '91017': 'CAMX', '91020': 'CAMX', '91021': 'CAMX', '91023': 'CAMX', '91024': 'CAMX', '91025': 'CAMX', '91030': 'CAMX', '91031': 'CAMX', '91040': 'CAMX', '91041': 'CAMX', '91042': 'CAMX', '91043': 'CAMX', '91046': 'CAMX', '91066': 'CAMX', '91077': 'CAMX', '91101': 'CAMX', '91102': 'CAMX', '91103': 'CAMX', '91104': 'CAMX', '91105': 'CAMX', '91106': 'CAMX', '91107': 'CAMX', '91108': 'CAMX', '91109': 'CAMX', '91110': 'CAMX', '91114': 'CAMX', '91115': 'CAMX', '91116': 'CAMX', '91117': 'CAMX', '91118': 'CAMX', '91121': 'CAMX', '91123': 'CAMX', '91124': 'CAMX', '91125': 'CAMX', '91126': 'CAMX', '91129': 'CAMX', '91182': 'CAMX', '91184': 'CAMX', '91185': 'CAMX', '91188': 'CAMX', '91189': 'CAMX', '91199': 'CAMX', '91201': 'CAMX', '91202': 'CAMX', '91203': 'CAMX', '91204': 'CAMX', '91205': 'CAMX', '91206': 'CAMX', '91207': 'CAMX', '91208': 'CAMX', '91209': 'CAMX', '91210': 'CAMX', '91214': 'CAMX', '91221': 'CAMX', '91222': 'CAMX', '91224': 'CAMX', '91225': 'CAMX', '91226': 'CAMX', '91301': 'CAMX', '91302': 'CAMX', '91303': 'CAMX', '91304': 'CAMX', '91305': 'CAMX', '91306': 'CAMX', '91307': 'CAMX', '91308': 'CAMX', '91309': 'CAMX', '91310': 'CAMX', '91311': 'CAMX', '91313': 'CAMX', '91316': 'CAMX', '91319': 'CAMX', '91320': 'CAMX', '91321': 'CAMX', '91322': 'CAMX', '91324': 'CAMX', '91325': 'CAMX', '91326': 'CAMX', '91327': 'CAMX', '91328': 'CAMX', '91329': 'CAMX', '91330': 'CAMX', '91331': 'CAMX', '91333': 'CAMX', '91334': 'CAMX', '91335': 'CAMX', '91337': 'CAMX', '91340': 'CAMX', '91341': 'CAMX', '91342': 'CAMX', '91343': 'CAMX', '91344': 'CAMX', '91345': 'CAMX', '91346': 'CAMX', '91350': 'CAMX', '91351': 'CAMX', '91352': 'CAMX', '91353': 'CAMX', '91354': 'CAMX', '91355': 'CAMX', '91356': 'CAMX', '91357': 'CAMX', '91358': 'CAMX', '91359': 'CAMX', '91360': 'CAMX', '91361': 'CAMX', '91362': 'CAMX', '91364': 'CAMX', '91365': 'CAMX', '91367': 'CAMX', '91371': 'CAMX', '91372': 'CAMX', '91376': 'CAMX', '91377': 'CAMX', '91380': 'CAMX', '91381': 'CAMX', '91382': 'CAMX', '91383': 'CAMX', '91384': 'CAMX', '91385': 'CAMX', '91386': 'CAMX', '91387': 'CAMX', '91390': 'CAMX', '91392': 'CAMX', '91393': 'CAMX', '91394': 'CAMX', '91395': 'CAMX', '91396': 'CAMX', '91401': 'CAMX', '91402': 'CAMX', '91403': 'CAMX', '91404': 'CAMX', '91405': 'CAMX', '91406': 'CAMX', '91407': 'CAMX', '91408': 'CAMX', '91409': 'CAMX', '91410': 'CAMX', '91411': 'CAMX', '91412': 'CAMX', '91413': 'CAMX', '91416': 'CAMX', '91423': 'CAMX', '91426': 'CAMX', '91436': 'CAMX', '91470': 'CAMX', '91482': 'CAMX', '91495': 'CAMX', '91496': 'CAMX', '91499': 'CAMX', '91501': 'CAMX', '91502': 'CAMX', '91503': 'CAMX', '91504': 'CAMX', '91505': 'CAMX', '91506': 'CAMX', '91507': 'CAMX', '91508': 'CAMX', '91510': 'CAMX', '91521': 'CAMX', '91522': 'CAMX', '91523': 'CAMX', '91526': 'CAMX', '91601': 'CAMX', '91602': 'CAMX', '91603': 'CAMX', '91604': 'CAMX', '91605': 'CAMX', '91606': 'CAMX', '91607': 'CAMX', '91608': 'CAMX', '91609': 'CAMX', '91610': 'CAMX', '91611': 'CAMX', '91612': 'CAMX', '91614': 'CAMX', '91615': 'CAMX', '91616': 'CAMX', '91617': 'CAMX', '91618': 'CAMX', '91701': 'CAMX', '91702': 'CAMX', '91706': 'CAMX', '91708': 'CAMX', '91709': 'CAMX', '91710': 'CAMX', '91711': 'CAMX', '91714': 'CAMX', '91715': 'CAMX', '91716': 'CAMX', '91722': 'CAMX', '91723': 'CAMX', '91724': 'CAMX', '91729': 'CAMX', '91730': 'CAMX', '91731': 'CAMX', '91732': 'CAMX', '91733': 'CAMX', '91734': 'CAMX', '91735': 'CAMX', '91737': 'CAMX', '91739': 'CAMX', '91740': 'CAMX', '91741': 'CAMX', '91743': 'CAMX', '91744': 'CAMX', '91745': 'CAMX', '91746': 'CAMX', '91747': 'CAMX', '91748': 'CAMX', '91749': 'CAMX', '91750': 'CAMX', '91752': 'CAMX', '91754': 'CAMX', '91755': 'CAMX', '91756': 'CAMX', '91758': 'CAMX', '91759': 'CAMX', '91761': 'CAMX', '91762': 'CAMX', '91763': 'CAMX', '91764': 'CAMX', '91765': 'CAMX', '91766': 'CAMX', '91767': 'CAMX', '91768': 'CAMX', '91769': 'CAMX', '91770': 'CAMX', '91771': 'CAMX', '91772': 'CAMX', '91773': 'CAMX', '91775': 'CAMX', '91776': 'CAMX', '91778': 'CAMX', '91780': 'CAMX', '91784': 'CAMX', '91785': 'CAMX', '91786': 'CAMX', '91788': 'CAMX', '91789': 'CAMX', '91790': 'CAMX', '91791': 'CAMX', '91792': 'CAMX', '91793': 'CAMX', '91795': 'CAMX', '91801': 'CAMX', '91802': 'CAMX', '91803': 'CAMX', '91804': 'CAMX', '91896': 'CAMX', '91899': 'CAMX', '91901': 'CAMX', '91902': 'CAMX', '91903': 'CAMX', '91905': 'CAMX', '91906': 'CAMX', '91908': 'CAMX', '91909': 'CAMX', '91910': 'CAMX', '91911': 'CAMX', '91912': 'CAMX', '91913': 'CAMX', '91914': 'CAMX', '91915': 'CAMX', '91916': 'CAMX', '91917': 'CAMX', '91921': 'CAMX', '91931': 'CAMX', '91932': 'CAMX', '91933': 'CAMX', '91934': 'AZNM', '91935': 'CAMX', '91941': 'CAMX', '91942': 'CAMX', '91943': 'CAMX', '91944': 'CAMX', '91945': 'CAMX', '91946': 'CAMX', '91947': 'CAMX', '91948': 'CAMX', '91950': 'CAMX', '91951': 'CAMX', '91962': 'CAMX', '91963': 'CAMX', '91976': 'CAMX', '91977': 'CAMX', '91978': 'CAMX', '91979': 'CAMX', '91980': 'CAMX', '91987': 'CAMX', '92003': 'CAMX', '92004': 'AZNM', '92007': 'CAMX', '92008': 'CAMX', '92009': 'CAMX', '92010': 'CAMX', '92011': 'CAMX', '92013': 'CAMX', '92014': 'CAMX', '92018': 'CAMX', '92019': 'CAMX', '92020': 'CAMX', '92021': 'CAMX', '92022': 'CAMX', '92023': 'CAMX', '92024': 'CAMX', '92025': 'CAMX', '92026': 'CAMX', '92027': 'CAMX', '92028': 'CAMX', '92029': 'CAMX', '92030': 'CAMX', '92033': 'CAMX', '92036': 'AZNM', '92037': 'CAMX', '92038': 'CAMX', '92039': 'CAMX', '92040': 'CAMX', '92046': 'CAMX', '92049': 'CAMX', '92051': 'CAMX', '92052': 'CAMX', '92054': 'CAMX', '92055': 'CAMX', '92056': 'CAMX', '92057': 'CAMX', '92058': 'CAMX', '92059': 'CAMX', '92060': 'CAMX', '92061': 'CAMX', '92064': 'CAMX', '92065': 'CAMX', '92066': 'CAMX', '92067': 'CAMX', '92068': 'CAMX', '92069': 'CAMX', '92070': 'CAMX', '92071': 'CAMX', '92072': 'CAMX', '92074': 'CAMX', '92075': 'CAMX', '92078': 'CAMX', '92079': 'CAMX', '92081': 'CAMX', '92082': 'CAMX', '92083': 'CAMX', '92084': 'CAMX', '92085': 'CAMX', '92086': 'CAMX', '92088': 'CAMX', '92091': 'CAMX', '92092': 'CAMX', '92093': 'CAMX', '92096': 'CAMX', '92101': 'CAMX', '92102': 'CAMX', '92103': 'CAMX', '92104': 'CAMX', '92105': 'CAMX', '92106': 'CAMX', '92107': 'CAMX', '92108': 'CAMX', '92109': 'CAMX', '92110': 'CAMX', '92111': 'CAMX', '92112': 'CAMX', '92113': 'CAMX', '92114': 'CAMX', '92115': 'CAMX', '92116': 'CAMX', '92117': 'CAMX', '92118': 'CAMX', '92119': 'CAMX', '92120': 'CAMX', '92121': 'CAMX', '92122': 'CAMX', '92123': 'CAMX', '92124': 'CAMX', '92126': 'CAMX', '92127': 'CAMX', '92128': 'CAMX', '92129': 'CAMX', '92130': 'CAMX', '92131': 'CAMX', '92132': 'CAMX', '92134': 'CAMX', '92135': 'CAMX', '92136': 'CAMX', '92137': 'CAMX', '92138': 'CAMX', '92139': 'CAMX', '92140': 'CAMX', '92142': 'CAMX', '92143': 'CAMX', '92145': 'CAMX', '92147': 'CAMX', '92149': 'CAMX', '92150': 'CAMX', '92152': 'CAMX', '92153': 'CAMX', '92154': 'CAMX', '92155': 'CAMX', '92158': 'CAMX', '92159': 'CAMX', '92160': 'CAMX', '92161': 'CAMX', '92162': 'CAMX', '92163': 'CAMX', '92164': 'CAMX', '92165': 'CAMX', '92166': 'CAMX', '92167': 'CAMX', '92168': 'CAMX', '92169': 'CAMX', '92170': 'CAMX', '92171': 'CAMX', '92172': 'CAMX', '92173': 'CAMX', '92174': 'CAMX', '92175': 'CAMX', '92176': 'CAMX', '92177': 'CAMX', '92178': 'CAMX', '92179': 'CAMX', '92182': 'CAMX', '92184': 'CAMX', '92186': 'CAMX', '92187': 'CAMX', '92190': 'CAMX', '92191': 'CAMX', '92192': 'CAMX', '92193': 'CAMX', '92194': 'CAMX', '92195': 'CAMX', '92196': 'CAMX', '92197': 'CAMX', '92198': 'CAMX', '92199': 'CAMX', '92201': 'AZNM', '92202': 'AZNM', '92203': 'AZNM', '92210': 'AZNM', '92211': 'AZNM', '92220': 'CAMX', '92222': 'AZNM', '92223': 'CAMX', '92225': 'AZNM', '92226': 'CAMX', '92227': 'AZNM', '92230': 'CAMX', '92231': 'AZNM', '92232': 'AZNM', '92233': 'AZNM', '92234': 'CAMX', '92235': 'CAMX', '92236': 'AZNM', '92239': 'AZNM', '92240': 'AZNM', '92241': 'AZNM', '92242': 'CAMX', '92243': 'AZNM', '92244': 'AZNM', '92247': 'AZNM', '92248': 'AZNM', '92249': 'AZNM', '92250': 'AZNM', '92251': 'AZNM', '92252': 'AZNM', '92253': 'AZNM', '92254': 'AZNM', '92255': 'CAMX', '92256': 'CAMX', '92257': 'AZNM', '92258': 'CAMX', '92259': 'AZNM', '92260': 'CAMX', '92261': 'CAMX', '92262': 'CAMX', '92263': 'CAMX', '92264': 'CAMX', '92266': 'AZNM', '92267': 'CAMX', '92268': 'CAMX', '92270': 'AZNM', '92273': 'AZNM', '92274': 'AZNM', '92275': 'AZNM', '92276': 'AZNM', '92277': 'AZNM', '92278': 'CAMX', '92280': 'CAMX', '92281': 'AZNM', '92282': 'CAMX', '92283': 'AZNM', '92284': 'AZNM', '92285': 'CAMX', '92286': 'CAMX', '92292': 'CAMX', '92301': 'CAMX', '92304': 'CAMX', '92305': 'CAMX', '92307': 'CAMX', '92308': 'CAMX', '92309': 'CAMX', '92310': 'CAMX', '92311': 'CAMX', '92312': 'CAMX', '92313': 'CAMX', '92314': 'CAMX', '92315': 'CAMX', '92316': 'CAMX', '92317': 'CAMX', '92318': 'CAMX', '92320': 'CAMX', '92321': 'CAMX', '92322': 'CAMX', '92323': 'CAMX', '92324': 'CAMX', '92325': 'CAMX', '92326': 'CAMX', '92327': 'CAMX', '92328': 'CAMX', '92329': 'CAMX', '92331': 'CAMX', '92332': 'CAMX', '92333': 'CAMX', '92334': 'CAMX', '92335': 'CAMX', '92336': 'CAMX', '92337': 'CAMX', '92338': 'CAMX', '92339': 'CAMX', '92340': 'CAMX', '92341': 'CAMX', '92342': 'CAMX', '92344': 'CAMX', '92345': 'CAMX', '92346': 'CAMX', '92347': 'CAMX', '92350': 'CAMX', '92352': 'CAMX', '92354': 'CAMX', '92356': 'CAMX', '92357': 'CAMX', '92358': 'CAMX', '92359': 'CAMX', '92363': 'CAMX', '92364': 'CAMX', '92365': 'CAMX', '92366': 'CAMX', '92368': 'CAMX', '92369': 'CAMX', '92371': 'CAMX', '92372': 'CAMX', '92373': 'CAMX', '92374': 'CAMX', '92375': 'CAMX', '92376': 'CAMX', '92377': 'CAMX', '92378': 'CAMX', '92382': 'CAMX', '92384': 'CAMX', '92385': 'CAMX', '92386': 'CAMX', '92389': 'CAMX', '92391': 'CAMX', '92392': 'CAMX', '92393': 'CAMX', '92394': 'CAMX', '92395': 'CAMX', '92397': 'CAMX', '92398': 'CAMX', '92399': 'CAMX', '92401': 'CAMX', '92402': 'CAMX', '92403': 'CAMX', '92404': 'CAMX', '92405': 'CAMX', '92406': 'CAMX', '92407': 'CAMX', '92408': 'CAMX', '92410': 'CAMX', '92411': 'CAMX', '92412': 'CAMX', '92413': 'CAMX', '92414': 'CAMX', '92415': 'CAMX', '92418': 'CAMX', '92423': 'CAMX', '92424': 'CAMX', '92427': 'CAMX', '92501': 'CAMX', '92502': 'CAMX', '92503': 'CAMX', '92504': 'CAMX', '92505': 'CAMX', '92506': 'CAMX', '92507': 'CAMX', '92508': 'CAMX', '92509': 'CAMX', '92513': 'CAMX', '92514': 'CAMX', '92515': 'CAMX', '92516': 'CAMX', '92517': 'CAMX', '92518': 'CAMX', '92519': 'CAMX', '92521': 'CAMX', '92522': 'CAMX', '92530': 'CAMX', '92531': 'CAMX', '92532': 'CAMX', '92536': 'CAMX', '92539': 'CAMX', '92543': 'CAMX', '92544': 'CAMX', '92545': 'CAMX', '92546': 'CAMX', '92548': 'CAMX', '92549': 'CAMX', '92551': 'CAMX', '92552': 'CAMX', '92553': 'CAMX', '92554': 'CAMX', '92555': 'CAMX', '92556': 'CAMX', '92557': 'CAMX', '92561': 'CAMX', '92562': 'CAMX', '92563': 'CAMX', '92564': 'CAMX', '92567': 'CAMX', '92570': 'CAMX', '92571': 'CAMX', '92572': 'CAMX', '92581': 'CAMX', '92582': 'CAMX', '92583': 'CAMX', '92584': 'CAMX', '92585': 'CAMX', '92586': 'CAMX', '92587': 'CAMX', '92589': 'CAMX', '92590': 'CAMX', '92591': 'CAMX', '92592': 'CAMX', '92593': 'CAMX', '92595': 'CAMX', '92596': 'CAMX', '92599': 'CAMX', '92602': 'CAMX', '92603': 'CAMX', '92604': 'CAMX', '92605': 'CAMX', '92606': 'CAMX', '92607': 'CAMX', '92609': 'CAMX', '92610': 'CAMX', '92612': 'CAMX', '92614': 'CAMX', '92615': 'CAMX', '92616': 'CAMX', '92617': 'CAMX', '92618': 'CAMX', '92619': 'CAMX', '92620': 'CAMX', '92623': 'CAMX', '92624': 'CAMX', '92625': 'CAMX', '92626': 'CAMX', '92627': 'CAMX', '92628': 'CAMX', '92629': 'CAMX', '92630': 'CAMX', '92637': 'CAMX', '92646': 'CAMX', '92647': 'CAMX', '92648': 'CAMX', '92649': 'CAMX', '92650': 'CAMX', '92651': 'CAMX', '92652': 'CAMX', '92653': 'CAMX', '92654': 'CAMX', '92655': 'CAMX', '92656': 'CAMX', '92657': 'CAMX', '92658': 'CAMX', '92659': 'CAMX', '92660': 'CAMX', '92661': 'CAMX', '92662': 'CAMX', '92663': 'CAMX', '92672': 'CAMX', '92673': 'CAMX', '92674': 'CAMX', '92675': 'CAMX', '92676': 'CAMX', '92677': 'CAMX', '92678': 'CAMX', '92679': 'CAMX', '92683': 'CAMX', '92684': 'CAMX', '92685': 'CAMX', '92688': 'CAMX', '92690': 'CAMX', '92691': 'CAMX', '92692': 'CAMX', '92693': 'CAMX', '92694': 'CAMX', '92697': 'CAMX', '92698': 'CAMX', '92701': 'CAMX', '92702': 'CAMX', '92703': 'CAMX', '92704': 'CAMX', '92705': 'CAMX', '92706': 'CAMX', '92707': 'CAMX', '92708': 'CAMX', '92711': 'CAMX', '92712': 'CAMX', '92725': 'CAMX', '92728': 'CAMX', '92735': 'CAMX', '92780': 'CAMX', '92781': 'CAMX', '92782': 'CAMX', '92799': 'CAMX', '92801': 'CAMX', '92802': 'CAMX', '92803': 'CAMX', '92804': 'CAMX', '92805': 'CAMX', '92806': 'CAMX', '92807': 'CAMX', '92808': 'CAMX', '92809': 'CAMX', '92811': 'CAMX', '92812': 'CAMX', '92814': 'CAMX', '92815': 'CAMX', '92816': 'CAMX', '92817': 'CAMX', '92821': 'CAMX', '92822': 'CAMX', '92823': 'CAMX', '92825': 'CAMX', '92831': 'CAMX', '92832': 'CAMX', '92833': 'CAMX', '92834': 'CAMX', '92835': 'CAMX', '92836': 'CAMX', '92837': 'CAMX', '92838': 'CAMX', '92840': 'CAMX', '92841': 'CAMX', '92842': 'CAMX', '92843': 'CAMX', '92844': 'CAMX', '92845': 'CAMX', '92846': 'CAMX', '92850': 'CAMX', '92856': 'CAMX', '92857': 'CAMX', '92859': 'CAMX', '92860': 'CAMX', '92861': 'CAMX', '92862': 'CAMX', '92863': 'CAMX', '92864': 'CAMX', '92865': 'CAMX', '92866': 'CAMX', '92867': 'CAMX', '92868': 'CAMX', '92869': 'CAMX', '92870': 'CAMX', '92871': 'CAMX', '92877': 'CAMX', '92878': 'CAMX', '92879': 'CAMX', '92880': 'CAMX', '92881': 'CAMX', '92882': 'CAMX', '92883': 'CAMX', '92885': 'CAMX', '92886': 'CAMX', '92887': 'CAMX', '92899': 'CAMX', '93001': 'CAMX', '93002': 'CAMX', '93003': 'CAMX', '93004': 'CAMX', '93005': 'CAMX', '93006': 'CAMX', '93007': 'CAMX', '93009': 'CAMX', '93010': 'CAMX', '93011': 'CAMX', '93012': 'CAMX', '93013': 'CAMX', '93014': 'CAMX', '93015': 'CAMX', '93016': 'CAMX', '93020': 'CAMX', '93021': 'CAMX', '93022': 'CAMX', '93023': 'CAMX', '93024': 'CAMX', '93030': 'CAMX', '93031': 'CAMX', '93032': 'CAMX', '93033': 'CAMX', '93034': 'CAMX', '93035': 'CAMX', '93036': 'CAMX', '93040': 'CAMX', '93041': 'CAMX', '93042': 'CAMX', '93043': 'CAMX', '93044': 'CAMX', '93060': 'CAMX', '93061': 'CAMX', '93062': 'CAMX', '93063': 'CAMX', '93064': 'CAMX', '93065': 'CAMX', '93066': 'CAMX', '93067': 'CAMX', '93094': 'CAMX', '93099': 'CAMX', '93101': 'CAMX', '93102': 'CAMX', '93103': 'CAMX', '93105': 'CAMX', '93106': 'CAMX', '93107': 'CAMX', '93108': 'CAMX', '93109': 'CAMX', '93110': 'CAMX', '93111': 'CAMX', '93116': 'CAMX', '93117': 'CAMX', '93118': 'CAMX', '93120': 'CAMX', '93121': 'CAMX', '93130': 'CAMX', '93140': 'CAMX', '93150': 'CAMX', '93160': 'CAMX', '93190': 'CAMX', '93199': 'CAMX', '93201': 'CAMX', '93202': 'CAMX', '93203': 'CAMX', '93204': 'CAMX', '93205': 'CAMX', '93206': 'CAMX', '93207': 'CAMX', '93208': 'CAMX', '93210': 'CAMX', '93212': 'CAMX', '93215': 'CAMX', '93216': 'CAMX', '93218': 'CAMX', '93219': 'CAMX', '93220': 'CAMX', '93221': 'CAMX', '93222': 'CAMX', '93223': 'CAMX', '93224': 'CAMX', '93225': 'CAMX', '93226': 'CAMX', '93227': 'CAMX', '93230': 'CAMX', '93232': 'CAMX', '93234': 'CAMX', '93235': 'CAMX', '93237': 'CAMX', '93238': 'CAMX', '93239': 'CAMX', '93240': 'CAMX', '93241': 'CAMX', '93242': 'CAMX', '93243': 'CAMX', '93244': 'CAMX', '93245': 'CAMX', '93246': 'CAMX', '93247': 'CAMX', '93249': 'CAMX', '93250': 'CAMX', '93251': 'CAMX', '93252': 'CAMX', '93254': 'CAMX', '93255': 'CAMX', '93256': 'CAMX', '93257': 'CAMX', '93258': 'CAMX', '93260': 'CAMX', '93261': 'CAMX', '93262': 'CAMX', '93263': 'CAMX', '93265': 'CAMX', '93266': 'CAMX', '93267': 'CAMX', '93268': 'CAMX', '93270': 'CAMX', '93271': 'CAMX', '93272': 'CAMX', '93274': 'CAMX', '93275': 'CAMX', '93276': 'CAMX', '93277': 'CAMX', '93278': 'CAMX', '93279': 'CAMX', '93280': 'CAMX', '93282': 'CAMX', '93283': 'CAMX', '93285': 'CAMX', '93286': 'CAMX', '93287': 'CAMX', '93290': 'CAMX', '93291': 'CAMX', '93292': 'CAMX', '93301': 'CAMX', '93302': 'CAMX', '93303': 'CAMX', '93304': 'CAMX', '93305': 'CAMX', '93306': 'CAMX', '93307': 'CAMX', '93308': 'CAMX', '93309': 'CAMX', '93311': 'CAMX', '93312': 'CAMX', '93313': 'CAMX', '93314': 'CAMX', '93380': 'CAMX', '93383': 'CAMX', '93384': 'CAMX', '93385': 'CAMX', '93386': 'CAMX', '93387': 'CAMX', '93388': 'CAMX', '93389': 'CAMX', '93390': 'CAMX', '93401': 'CAMX', '93402': 'CAMX', '93403': 'CAMX', '93405': 'CAMX', '93406': 'CAMX', '93407': 'CAMX', '93408': 'CAMX', '93409': 'CAMX', '93410': 'CAMX', '93412': 'CAMX', '93420': 'CAMX', '93421': 'CAMX', '93422': 'CAMX', '93423': 'CAMX', '93424': 'CAMX', '93426': 'CAMX', '93427': 'CAMX', '93428': 'CAMX', '93429': 'CAMX', '93430': 'CAMX', '93432': 'CAMX', '93433': 'CAMX', '93434': 'CAMX', '93435': 'CAMX', '93436': 'CAMX', '93437': 'CAMX', '93438': 'CAMX', '93440': 'CAMX', '93441': 'CAMX', '93442': 'CAMX', '93443': 'CAMX', '93444': 'CAMX', '93445': 'CAMX', '93446': 'CAMX', '93447': 'CAMX', '93448': 'CAMX', '93449': 'CAMX', '93450': 'CAMX', '93451': 'CAMX', '93452': 'CAMX', '93453': 'CAMX', '93454': 'CAMX', '93455': 'CAMX', '93456': 'CAMX', '93457': 'CAMX', '93458': 'CAMX', '93460': 'CAMX', '93461': 'CAMX', '93463': 'CAMX', '93464': 'CAMX', '93465': 'CAMX', '93475': 'CAMX', '93483': 'CAMX', '93501': 'CAMX', '93502': 'CAMX', '93504': 'CAMX', '93505': 'CAMX', '93510': 'CAMX', '93512': 'CAMX', '93513': 'CAMX', '93514': 'CAMX', '93515': 'CAMX', '93516': 'CAMX', '93517': 'CAMX', '93518': 'CAMX', '93519': 'CAMX', '93522': 'CAMX', '93523': 'CAMX', '93524': 'CAMX', '93526': 'CAMX', '93527': 'CAMX', '93528': 'CAMX', '93529': 'CAMX', '93530': 'CAMX', '93531': 'CAMX', '93532': 'CAMX', '93534': 'CAMX', '93535': 'CAMX', '93536': 'CAMX', '93539': 'CAMX', '93541': 'CAMX', '93542': 'CAMX', '93543': 'CAMX', '93544': 'CAMX', '93545': 'CAMX', '93546': 'CAMX', '93549': 'CAMX', '93550': 'CAMX', '93551': 'CAMX', '93552': 'CAMX', '93553': 'CAMX', '93554': 'CAMX', '93555': 'CAMX', '93556': 'CAMX', '93558': 'CAMX', '93560': 'CAMX', '93561': 'CAMX', '93562': 'CAMX', '93563': 'CAMX', '93581': 'CAMX', '93584': 'CAMX', '93586': 'CAMX', '93590': 'CAMX', '93591': 'CAMX', '93592': 'CAMX', '93596': 'CAMX', '93599': 'CAMX', '93601': 'CAMX', '93602': 'CAMX', '93603': 'CAMX', '93604': 'CAMX', '93605': 'CAMX', '93606': 'CAMX', '93607': 'CAMX', '93608': 'CAMX', '93609': 'CAMX', '93610': 'CAMX', '93611': 'CAMX', '93612': 'CAMX', '93613': 'CAMX', '93614': 'CAMX', '93615': 'CAMX', '93616': 'CAMX', '93618': 'CAMX', '93619': 'CAMX', '93620': 'CAMX', '93621': 'CAMX', '93622': 'CAMX', '93623': 'CAMX', '93624': 'CAMX', '93625': 'CAMX', '93626': 'CAMX', '93627': 'CAMX', '93628': 'CAMX', '93630': 'CAMX', '93631': 'CAMX', '93633': 'CAMX', '93634': 'CAMX', '93635': 'CAMX', '93636': 'CAMX', '93637': 'CAMX', '93638': 'CAMX', '93639': 'CAMX', '93640': 'CAMX', '93641': 'CAMX', '93642': 'CAMX', '93643': 'CAMX', '93644': 'CAMX', '93645': 'CAMX', '93646': 'CAMX', '93647': 'CAMX', '93648': 'CAMX', '93649': 'CAMX', '93650': 'CAMX', '93651': 'CAMX', '93652': 'CAMX', '93653': 'CAMX', '93654': 'CAMX', '93656': 'CAMX', '93657': 'CAMX', '93660': 'CAMX', '93661': 'CAMX', '93662': 'CAMX', '93664': 'CAMX', '93665': 'CAMX', '93666': 'CAMX', '93667': 'CAMX', '93668': 'CAMX', '93669': 'CAMX', '93670': 'CAMX', '93673': 'CAMX', '93675': 'CAMX', '93701': 'CAMX', '93702': 'CAMX', '93703': 'CAMX', '93704': 'CAMX', '93705': 'CAMX', '93706': 'CAMX', '93707': 'CAMX', '93708': 'CAMX', '93709': 'CAMX', '93710': 'CAMX', '93711': 'CAMX', '93712': 'CAMX', '93714': 'CAMX', '93715': 'CAMX', '93716': 'CAMX', '93717': 'CAMX', '93718': 'CAMX', '93720': 'CAMX', '93721': 'CAMX', '93722': 'CAMX', '93723': 'CAMX', '93724': 'CAMX', '93725': 'CAMX', '93726': 'CAMX', '93727': 'CAMX', '93728': 'CAMX', '93729': 'CAMX', '93730': 'CAMX', '93737': 'CAMX', '93740': 'CAMX', '93741': 'CAMX', '93744': 'CAMX', '93745': 'CAMX', '93747': 'CAMX', '93750': 'CAMX', '93755': 'CAMX', '93760': 'CAMX', '93761': 'CAMX', '93764': 'CAMX', '93765': 'CAMX', '93771': 'CAMX', '93772': 'CAMX', '93773': 'CAMX', '93774': 'CAMX', '93775': 'CAMX', '93776': 'CAMX', '93777': 'CAMX', '93778': 'CAMX', '93779': 'CAMX', '93786': 'CAMX', '93790': 'CAMX', '93791': 'CAMX', '93792': 'CAMX', '93793': 'CAMX', '93794': 'CAMX', '93844': 'CAMX', '93888': 'CAMX', '93901': 'CAMX', '93902': 'CAMX', '93905': 'CAMX', '93906': 'CAMX', '93907': 'CAMX', '93908': 'CAMX', '93912': 'CAMX', '93915': 'CAMX', '93920': 'CAMX', '93921': 'CAMX', '93922': 'CAMX', '93923': 'CAMX', '93924': 'CAMX', '93925': 'CAMX', '93926': 'CAMX', '93927': 'CAMX', '93928': 'CAMX', '93930': 'CAMX', '93932': 'CAMX', '93933': 'CAMX', '93940': 'CAMX', '93942': 'CAMX', '93943': 'CAMX', '93944': 'CAMX', '93950': 'CAMX', '93953': 'CAMX', '93954': 'CAMX', '93955': 'CAMX', '93960': 'CAMX', '93962': 'CAMX', '94002': 'CAMX', '94005': 'CAMX', '94010': 'CAMX', '94011': 'CAMX', '94013': 'CAMX', '94014': 'CAMX', '94015': 'CAMX', '94016': 'CAMX', '94017': 'CAMX', '94018': 'CAMX', '94019': 'CAMX', '94020': 'CAMX', '94021': 'CAMX', '94022': 'CAMX', '94023': 'CAMX', '94024': 'CAMX', '94025': 'CAMX', '94026': 'CAMX', '94027': 'CAMX', '94028': 'CAMX', '94030': 'CAMX', '94035': 'CAMX', '94037': 'CAMX', '94038': 'CAMX', '94039': 'CAMX', '94040': 'CAMX', '94041': 'CAMX', '94042': 'CAMX', '94043': 'CAMX', '94044': 'CAMX', '94060': 'CAMX', '94061': 'CAMX', '94062': 'CAMX', '94063': 'CAMX', '94064': 'CAMX', '94065': 'CAMX', '94066': 'CAMX', '94070': 'CAMX', '94074': 'CAMX', '94080': 'CAMX', '94083': 'CAMX', '94085': 'CAMX', '94086': 'CAMX', '94087': 'CAMX', '94088': 'CAMX', '94089': 'CAMX', '94101': 'CAMX', '94102': 'CAMX', '94103': 'CAMX', '94104': 'CAMX', '94105': 'CAMX', '94107': 'CAMX', '94108': 'CAMX', '94109': 'CAMX', '94110': 'CAMX', '94111': 'CAMX', '94112': 'CAMX', '94114': 'CAMX', '94115': 'CAMX', '94116': 'CAMX', '94117': 'CAMX', '94118': 'CAMX', '94119': 'CAMX', '94120': 'CAMX', '94121': 'CAMX', '94122': 'CAMX', '94123': 'CAMX', '94124': 'CAMX', '94125': 'CAMX', '94126': 'CAMX', '94127': 'CAMX', '94128': 'CAMX', '94129': 'CAMX', '94130': 'CAMX', '94131': 'CAMX', '94132': 'CAMX', '94133': 'CAMX', '94134': 'CAMX', '94137': 'CAMX', '94139': 'CAMX', '94140': 'CAMX', '94141': 'CAMX', '94142': 'CAMX', '94143': 'CAMX', '94144': 'CAMX', '94145': 'CAMX', '94146': 'CAMX', '94147': 'CAMX', '94151': 'CAMX', '94153': 'CAMX', '94154': 'CAMX', '94156': 'CAMX', '94158': 'CAMX', '94159': 'CAMX', '94160': 'CAMX', '94161': 'CAMX', '94162': 'CAMX', '94163': 'CAMX', '94164': 'CAMX', '94171': 'CAMX', '94172': 'CAMX', '94177': 'CAMX', '94188': 'CAMX', '94199': 'CAMX', '94203': 'CAMX', '94204': 'CAMX', '94205': 'CAMX', '94206': 'CAMX', '94207': 'CAMX', '94208': 'CAMX', '94209': 'CAMX', '94211': 'CAMX', '94229': 'CAMX', '94230': 'CAMX', '94232': 'CAMX', '94234': 'CAMX', '94235': 'CAMX', '94236': 'CAMX', '94237': 'CAMX', '94239': 'CAMX', '94240': 'CAMX', '94244': 'CAMX', '94245': 'CAMX', '94246': 'CAMX', '94247': 'CAMX', '94248': 'CAMX', '94249': 'CAMX', '94250': 'CAMX', '94252': 'CAMX', '94254': 'CAMX', '94256': 'CAMX', '94257': 'CAMX', '94258': 'CAMX', '94259': 'CAMX', '94261': 'CAMX', '94262': 'CAMX', '94263': 'CAMX', '94267': 'CAMX', '94268': 'CAMX', '94269': 'CAMX', '94271': 'CAMX', '94273': 'CAMX', '94274': 'CAMX', '94277': 'CAMX', '94278': 'CAMX', '94279': 'CAMX', '94280': 'CAMX', '94282': 'CAMX', '94283': 'CAMX', '94284': 'CAMX', '94285': 'CAMX', '94286': 'CAMX', '94287': 'CAMX', '94288': 'CAMX', '94289': 'CAMX', '94290': 'CAMX', '94291': 'CAMX', '94293': 'CAMX', '94294': 'CAMX', '94295': 'CAMX', '94296': 'CAMX', '94297': 'CAMX', '94298': 'CAMX', '94299': 'CAMX', '94301': 'CAMX', '94302': 'CAMX', '94303': 'CAMX', '94304': 'CAMX', '94305': 'CAMX', '94306': 'CAMX', '94309': 'CAMX', '94401': 'CAMX', '94402': 'CAMX', '94403': 'CAMX', '94404': 'CAMX', '94497': 'CAMX', '94501': 'CAMX', '94502': 'CAMX', '94503': 'CAMX', '94505': 'CAMX', '94506': 'CAMX', '94507': 'CAMX', '94508': 'CAMX', '94509': 'CAMX', '94510': 'CAMX', '94511': 'CAMX', '94512': 'CAMX', '94513': 'CAMX', '94514': 'CAMX', '94515': 'CAMX', '94516': 'CAMX', '94517': 'CAMX', '94518': 'CAMX', '94519': 'CAMX', '94520': 'CAMX', '94521': 'CAMX', '94522': 'CAMX', '94523': 'CAMX', '94524': 'CAMX', '94525': 'CAMX', '94526': 'CAMX', '94527': 'CAMX', '94528': 'CAMX', '94529': 'CAMX', '94530': 'CAMX', '94531': 'CAMX', '94533': 'CAMX', '94534': 'CAMX', '94535': 'CAMX', '94536': 'CAMX', '94537': 'CAMX', '94538': 'CAMX', '94539': 'CAMX', '94540': 'CAMX', '94541': 'CAMX', '94542': 'CAMX', '94543': 'CAMX', '94544': 'CAMX', '94545': 'CAMX', '94546': 'CAMX', '94547': 'CAMX', '94548': 'CAMX', '94549': 'CAMX', '94550': 'CAMX', '94551': 'CAMX', '94552': 'CAMX', '94553': 'CAMX', '94555': 'CAMX', '94556': 'CAMX', '94557': 'CAMX', '94558': 'CAMX', '94559': 'CAMX', '94560': 'CAMX', '94561': 'CAMX', '94562': 'CAMX', '94563': 'CAMX', '94564': 'CAMX', '94565': 'CAMX', '94566': 'CAMX', '94567': 'CAMX', '94568': 'CAMX', '94569': 'CAMX', '94570': 'CAMX', '94571': 'CAMX', '94572': 'CAMX', '94573': 'CAMX', '94574': 'CAMX', '94575': 'CAMX', '94576': 'CAMX', '94577': 'CAMX', '94578': 'CAMX', '94579': 'CAMX', '94580': 'CAMX', '94581': 'CAMX', '94582': 'CAMX', '94583': 'CAMX', '94585': 'CAMX', '94586': 'CAMX', '94587': 'CAMX', '94588': 'CAMX', '94589': 'CAMX', '94590': 'CAMX', '94591': 'CAMX', '94592': 'CAMX', '94595': 'CAMX', '94596': 'CAMX', '94597': 'CAMX', '94598': 'CAMX', '94599': 'CAMX', '94601': 'CAMX', '94602': 'CAMX', '94603': 'CAMX', '94604': 'CAMX', '94605': 'CAMX', '94606': 'CAMX', '94607': 'CAMX', '94608': 'CAMX', '94609': 'CAMX', '94610': 'CAMX', '94611': 'CAMX', '94612': 'CAMX', '94613': 'CAMX', '94614': 'CAMX', '94615': 'CAMX', '94617': 'CAMX', '94618': 'CAMX', '94619': 'CAMX', '94620': 'CAMX', '94621': 'CAMX', '94622': 'CAMX', '94623': 'CAMX', '94624': 'CAMX', '94649': 'CAMX', '94659': 'CAMX', '94660': 'CAMX', '94661': 'CAMX', '94662': 'CAMX', '94666': 'CAMX', '94701': 'CAMX', '94702': 'CAMX', '94703': 'CAMX', '94704': 'CAMX', '94705': 'CAMX', '94706': 'CAMX', '94707': 'CAMX', '94708': 'CAMX', '94709': 'CAMX', '94710': 'CAMX', '94712': 'CAMX', '94720': 'CAMX', '94801': 'CAMX', '94802': 'CAMX', '94803': 'CAMX', '94804': 'CAMX', '94805': 'CAMX', '94806': 'CAMX', '94807': 'CAMX', '94808': 'CAMX', '94820': 'CAMX', '94850': 'CAMX', '94901': 'CAMX', '94903': 'CAMX', '94904': 'CAMX', '94912': 'CAMX', '94913': 'CAMX', '94914': 'CAMX', '94915': 'CAMX', '94920': 'CAMX', '94922': 'CAMX', '94923': 'CAMX', '94924': 'CAMX', '94925': 'CAMX', '94926': 'CAMX', '94927': 'CAMX', '94928': 'CAMX', '94929': 'CAMX', '94930': 'CAMX', '94931': 'CAMX', '94933': 'CAMX', '94937': 'CAMX', '94938': 'CAMX', '94939': 'CAMX', '94940': 'CAMX', '94941': 'CAMX', '94942': 'CAMX', '94945': 'CAMX', '94946': 'CAMX', '94947': 'CAMX', '94948': 'CAMX', '94949': 'CAMX', '94950': 'CAMX', '94951': 'CAMX', '94952': 'CAMX', '94953': 'CAMX', '94954': 'CAMX', '94955': 'CAMX', '94956': 'CAMX', '94957': 'CAMX', '94960': 'CAMX', '94963': 'CAMX', '94964': 'CAMX', '94965': 'CAMX', '94966': 'CAMX', '94970': 'CAMX', '94971': 'CAMX', '94972': 'CAMX', '94973': 'CAMX', '94974': 'CAMX', '94975': 'CAMX', '94976': 'CAMX', '94977': 'CAMX', '94978': 'CAMX', '94979': 'CAMX', '94998': 'CAMX', '94999': 'CAMX', '95001': 'CAMX', '95002': 'CAMX', '95003': 'CAMX', '95004': 'CAMX', '95005': 'CAMX', '95006': 'CAMX', '95007': 'CAMX', '95008': 'CAMX', '95009': 'CAMX', '95010': 'CAMX', '95011': 'CAMX', '95012': 'CAMX', '95013': 'CAMX', '95014': 'CAMX', '95015': 'CAMX', '95017': 'CAMX', '95018': 'CAMX', '95019': 'CAMX', '95020': 'CAMX', '95021': 'CAMX', '95023': 'CAMX', '95024': 'CAMX', '95026': 'CAMX', '95030': 'CAMX', '95031': 'CAMX', '95032': 'CAMX', '95033': 'CAMX', '95035': 'CAMX', '95036': 'CAMX', '95037': 'CAMX', '95038': 'CAMX', '95039': 'CAMX', '95041': 'CAMX', '95042': 'CAMX', '95043': 'CAMX', '95044': 'CAMX', '95045': 'CAMX', '95046': 'CAMX', '95050': 'CAMX', '95051': 'CAMX', '95052': 'CAMX', '95053': 'CAMX', '95054': 'CAMX', '95055': 'CAMX', '95056': 'CAMX', '95060': 'CAMX', '95061': 'CAMX', '95062': 'CAMX', '95063': 'CAMX', '95064': 'CAMX', '95065': 'CAMX', '95066': 'CAMX', '95067': 'CAMX', '95070': 'CAMX', '95071': 'CAMX', '95073': 'CAMX', '95075': 'CAMX', '95076': 'CAMX', '95077': 'CAMX', '95101': 'CAMX', '95103': 'CAMX', '95106': 'CAMX', '95108': 'CAMX', '95109': 'CAMX', '95110': 'CAMX', '95111': 'CAMX', '95112': 'CAMX', '95113': 'CAMX', '95115': 'CAMX', '95116': 'CAMX', '95117': 'CAMX', '95118': 'CAMX', '95119': 'CAMX', '95120': 'CAMX', '95121': 'CAMX', '95122': 'CAMX', '95123': 'CAMX', '95124': 'CAMX', '95125': 'CAMX', '95126': 'CAMX', '95127': 'CAMX', '95128': 'CAMX', '95129': 'CAMX', '95130': 'CAMX', '95131': 'CAMX', '95132': 'CAMX', '95133': 'CAMX', '95134': 'CAMX', '95135': 'CAMX', '95136': 'CAMX', '95138': 'CAMX', '95139': 'CAMX', '95140': 'CAMX', '95141': 'CAMX', '95148': 'CAMX', '95150': 'CAMX', '95151': 'CAMX', '95152': 'CAMX', '95153': 'CAMX', '95154': 'CAMX', '95155': 'CAMX', '95156': 'CAMX', '95157': 'CAMX', '95158': 'CAMX', '95159': 'CAMX', '95160': 'CAMX', '95161': 'CAMX', '95164': 'CAMX', '95170': 'CAMX', '95172': 'CAMX', '95173': 'CAMX', '95190': 'CAMX', '95191': 'CAMX', '95192': 'CAMX', '95193': 'CAMX', '95194': 'CAMX', '95196': 'CAMX', '95201': 'CAMX', '95202': 'CAMX', '95203': 'CAMX', '95204': 'CAMX', '95205': 'CAMX', '95206': 'CAMX', '95207': 'CAMX', '95208': 'CAMX', '95209': 'CAMX', '95210': 'CAMX', '95211': 'CAMX', '95212': 'CAMX', '95213': 'CAMX', '95215': 'CAMX', '95219': 'CAMX', '95220': 'CAMX', '95221': 'CAMX', '95222': 'CAMX', '95223': 'CAMX', '95224': 'CAMX', '95225': 'CAMX', '95226': 'CAMX', '95227': 'CAMX', '95228': 'CAMX', '95229': 'CAMX', '95230': 'CAMX', '95231': 'CAMX', '95232': 'CAMX', '95233': 'CAMX', '95234': 'CAMX', '95236': 'CAMX', '95237': 'CAMX', '95240': 'CAMX', '95241': 'CAMX', '95242': 'CAMX', '95245': 'CAMX', '95246': 'CAMX', '95247': 'CAMX', '95248': 'CAMX', '95249': 'CAMX', '95250': 'CAMX', '95251': 'CAMX', '95252': 'CAMX', '95253': 'CAMX', '95254': 'CAMX', '95255': 'CAMX', '95257': 'CAMX', '95258': 'CAMX', '95267': 'CAMX', '95269': 'CAMX', '95296': 'CAMX', '95297': 'CAMX', '95301': 'CAMX', '95303': 'CAMX', '95304': 'CAMX', '95305': 'CAMX', '95306': 'CAMX', '95307': 'CAMX', '95309': 'CAMX', '95310': 'CAMX', '95311': 'CAMX', '95312': 'CAMX', '95313': 'CAMX', '95314': 'CAMX', '95315': 'CAMX', '95316': 'CAMX', '95317': 'CAMX', '95318': 'CAMX', '95319': 'CAMX', '95320': 'CAMX', '95321': 'CAMX', '95322': 'CAMX', '95323': 'CAMX', '95324': 'CAMX', '95325': 'CAMX', '95326': 'CAMX', '95327': 'CAMX', '95328': 'CAMX', '95329': 'CAMX', '95330': 'CAMX', '95333': 'CAMX', '95334': 'CAMX', '95335': 'CAMX', '95336': 'CAMX', '95337': 'CAMX', '95338': 'CAMX', '95340': 'CAMX', '95341': 'CAMX', '95343': 'CAMX', '95344': 'CAMX', '95345': 'CAMX', '95346': 'CAMX', '95347': 'CAMX', '95348': 'CAMX', '95350': 'CAMX', '95351': 'CAMX', '95352': 'CAMX', '95353': 'CAMX', '95354': 'CAMX', '95355': 'CAMX', '95356': 'CAMX', '95357': 'CAMX', '95358': 'CAMX', '95360': 'CAMX', '95361': 'CAMX', '95363': 'CAMX', '95364': 'CAMX', '95365': 'CAMX', '95366': 'CAMX', '95367': 'CAMX', '95368': 'CAMX', '95369': 'CAMX', '95370': 'CAMX', '95372': 'CAMX', '95373': 'CAMX', '95374': 'CAMX', '95375': 'CAMX', '95376': 'CAMX', '95377': 'CAMX', '95378': 'CAMX', '95379': 'CAMX', '95380': 'CAMX', '95381': 'CAMX', '95382': 'CAMX', '95383': 'CAMX', '95385': 'CAMX', '95386': 'CAMX', '95387': 'CAMX', '95388': 'CAMX', '95389': 'CAMX', '95391': 'CAMX', '95397': 'CAMX', '95401': 'CAMX', '95402': 'CAMX', '95403': 'CAMX', '95404': 'CAMX', '95405': 'CAMX', '95406': 'CAMX', '95407': 'CAMX', '95409': 'CAMX', '95410': 'CAMX', '95412': 'CAMX', '95415': 'CAMX', '95416': 'CAMX', '95417': 'CAMX', '95418': 'CAMX', '95419': 'CAMX', '95420': 'CAMX', '95421': 'CAMX', '95422': 'CAMX', '95423': 'CAMX', '95424': 'CAMX', '95425': 'CAMX', '95426': 'CAMX', '95427': 'CAMX', '95428': 'CAMX', '95429': 'CAMX', '95430': 'CAMX', '95431': 'CAMX', '95432': 'CAMX', '95433': 'CAMX', '95435': 'CAMX', '95436': 'CAMX', '95437': 'CAMX', '95439': 'CAMX', '95441': 'CAMX', '95442': 'CAMX', '95443': 'CAMX', '95444': 'CAMX', '95445': 'CAMX', '95446': 'CAMX', '95448': 'CAMX', '95449': 'CAMX', '95450': 'CAMX', '95451': 'CAMX', '95452': 'CAMX', '95453': 'CAMX', '95454': 'CAMX', '95456': 'CAMX', '95457': 'CAMX', '95458': 'CAMX', '95459': 'CAMX', '95460': 'CAMX', '95461': 'CAMX', '95462': 'CAMX', '95463': 'CAMX', '95464': 'CAMX', '95465': 'CAMX', '95466': 'CAMX', '95467': 'CAMX', '95468': 'CAMX', '95469': 'CAMX', '95470': 'CAMX', '95471': 'CAMX', '95472': 'CAMX', '95473': 'CAMX', '95476': 'CAMX', '95480': 'CAMX', '95481': 'CAMX', '95482': 'CAMX', '95485': 'CAMX', '95486': 'CAMX', '95487': 'CAMX', '95488': 'CAMX', '95490': 'CAMX', '95492': 'CAMX', '95493': 'CAMX', '95494': 'CAMX', '95497': 'CAMX', '95501': 'CAMX', '95502': 'CAMX', '95503': 'CAMX', '95511': 'CAMX', '95514': 'CAMX', '95518': 'CAMX', '95519': 'CAMX', '95521': 'CAMX', '95524': 'CAMX', '95525': 'CAMX', '95526': 'CAMX', '95527': 'CAMX', '95528': 'CAMX', '95531': 'NWPP', '95532': 'NWPP', '95534': 'CAMX', '95536': 'CAMX', '95537': 'CAMX', '95538': 'NWPP', '95540': 'CAMX', '95542': 'CAMX', '95543': 'NWPP', '95545': 'CAMX', '95546': 'CAMX', '95547': 'CAMX', '95548': 'CAMX', '95549': 'CAMX', '95550': 'CAMX', '95551': 'CAMX', '95552': 'CAMX', '95553': 'CAMX', '95554': 'CAMX', '95555': 'CAMX', '95556': 'CAMX', '95558': 'CAMX', '95559': 'CAMX', '95560': 'CAMX', '95562': 'CAMX', '95563': 'CAMX', '95564': 'CAMX', '95565': 'CAMX', '95567': 'NWPP', '95568': 'CAMX', '95569': 'CAMX', '95570': 'CAMX', '95571': 'CAMX', '95573': 'CAMX', '95585': 'CAMX', '95587': 'CAMX', '95589': 'CAMX', '95595': 'CAMX', '95601': 'CAMX', '95602': 'CAMX', '95603': 'CAMX', '95604': 'CAMX', '95605': 'CAMX', '95606': 'CAMX', '95607': 'CAMX', '95608': 'CAMX', '95609': 'CAMX', '95610': 'CAMX', '95611': 'CAMX', '95612': 'CAMX', '95613': 'CAMX', '95614': 'CAMX', '95615': 'CAMX', '95616': 'CAMX', '95617': 'CAMX', '95618': 'CAMX', '95619': 'CAMX', '95620': 'CAMX', '95621': 'CAMX', '95623': 'CAMX', '95624': 'CAMX', '95625': 'CAMX', '95626': 'CAMX', '95627': 'CAMX', '95628': 'CAMX', '95629': 'CAMX', '95630': 'CAMX', '95631': 'CAMX', '95632': 'CAMX', '95633': 'CAMX', '95634': 'CAMX', '95635': 'CAMX', '95636': 'CAMX', '95637': 'CAMX', '95638': 'CAMX', '95639': 'CAMX', '95640': 'CAMX', '95641': 'CAMX', '95642': 'CAMX', '95644': 'CAMX', '95645': 'CAMX', '95646': 'CAMX', '95648': 'CAMX', '95650': 'CAMX', '95651': 'CAMX', '95652': 'CAMX', '95653': 'CAMX', '95654': 'CAMX', '95655': 'CAMX', '95656': 'CAMX', '95658': 'CAMX', '95659': 'CAMX', '95660': 'CAMX', '95661': 'CAMX', '95662': 'CAMX', '95663': 'CAMX', '95664': 'CAMX', '95665': 'CAMX', '95666': 'CAMX', '95667': 'CAMX', '95668': 'CAMX', '95669': 'CAMX', '95670': 'CAMX', '95671': 'CAMX', '95672': 'CAMX', '95673': 'CAMX', '95674': 'CAMX', '95675': 'CAMX', '95676': 'CAMX', '95677': 'CAMX', '95678': 'CAMX', '95679': 'CAMX', '95680': 'CAMX', '95681': 'CAMX', '95682': 'CAMX', '95683': 'CAMX', '95684': 'CAMX', '95685': 'CAMX', '95686': 'CAMX', '95687': 'CAMX', '95688': 'CAMX', '95689': 'CAMX', '95690': 'CAMX', '95691': 'CAMX', '95692': 'CAMX', '95693': 'CAMX', '95694': 'CAMX', '95695': 'CAMX', '95696': 'CAMX', '95697': 'CAMX', '95698': 'CAMX', '95699': 'CAMX', '95701': 'CAMX', '95703': 'CAMX', '95709': 'CAMX', '95712': 'CAMX', '95713': 'CAMX', '95714': 'CAMX', '95715': 'CAMX', '95717': 'CAMX', '95720': 'CAMX', '95721': 'CAMX', '95722': 'CAMX', '95724': 'CAMX', '95726': 'CAMX', '95728': 'CAMX', '95735': 'CAMX', '95736': 'CAMX', '95741': 'CAMX', '95742': 'CAMX', '95746': 'CAMX', '95747': 'CAMX', '95757': 'CAMX', '95758': 'CAMX', '95759': 'CAMX', '95762': 'CAMX', '95763': 'CAMX', '95765': 'CAMX', '95776': 'CAMX', '95798': 'CAMX', '95799': 'CAMX', '95811': 'CAMX', '95812': 'CAMX', '95813': 'CAMX', '95814': 'CAMX', '95815': 'CAMX', '95816': 'CAMX', '95817': 'CAMX', '95818': 'CAMX', '95819': 'CAMX', '95820': 'CAMX', '95821': 'CAMX', '95822': 'CAMX', '95823': 'CAMX', '95824': 'CAMX', '95825': 'CAMX', '95826': 'CAMX', '95827': 'CAMX', '95828': 'CAMX', '95829': 'CAMX', '95830': 'CAMX', '95831': 'CAMX', '95832': 'CAMX', '95833': 'CAMX', '95834': 'CAMX', '95835': 'CAMX', '95836': 'CAMX', '95837': 'CAMX', '95838': 'CAMX', '95840': 'CAMX', '95841': 'CAMX', '95842': 'CAMX', '95843': 'CAMX', '95851': 'CAMX', '95852': 'CAMX', '95853': 'CAMX', '95860': 'CAMX', '95864': 'CAMX', '95865': 'CAMX', '95866': 'CAMX', '95867': 'CAMX', '95887': 'CAMX', '95894': 'CAMX', '95899': 'CAMX', '95901': 'CAMX', '95903': 'CAMX', '95910': 'CAMX', '95912': 'CAMX', '95913': 'CAMX', '95914': 'CAMX', '95915': 'CAMX', '95916': 'CAMX', '95917': 'CAMX', '95918': 'CAMX', '95919': 'CAMX', '95920': 'CAMX', '95922': 'CAMX', '95923': 'CAMX', '95924': 'CAMX', '95925': 'CAMX', '95926': 'CAMX', '95927': 'CAMX', '95928': 'CAMX', '95929': 'CAMX', '95930': 'CAMX', '95932': 'CAMX', '95934': 'CAMX', '95935': 'CAMX', '95936': 'CAMX', '95937': 'CAMX', '95938': 'CAMX', '95939': 'CAMX', '95940': 'CAMX', '95941': 'CAMX', '95942': 'CAMX', '95943': 'CAMX', '95944': 'CAMX', '95945': 'CAMX', '95946': 'CAMX', '95947': 'CAMX', '95948': 'CAMX', '95949': 'CAMX', '95950': 'CAMX', '95951': 'CAMX', '95953': 'CAMX', '95954': 'CAMX', '95955': 'CAMX', '95956': 'CAMX', '95957': 'CAMX', '95958': 'CAMX', '95959': 'CAMX', '95960': 'CAMX', '95961': 'CAMX', '95962': 'CAMX', '95963': 'CAMX', '95965': 'CAMX', '95966': 'CAMX', '95967': 'CAMX', '95968': 'CAMX', '95969': 'CAMX', '95970': 'CAMX', '95971': 'CAMX', '95972': 'CAMX', '95973': 'CAMX', '95974': 'CAMX', '95975': 'CAMX', '95976': 'CAMX', '95977': 'CAMX', '95978': 'CAMX', '95979': 'CAMX', '95980': 'CAMX', '95981': 'CAMX', '95982': 'CAMX', '95983': 'CAMX', '95984': 'CAMX', '95986': 'CAMX', '95987': 'CAMX', '95988': 'CAMX', '95991': 'CAMX', '95992': 'CAMX', '95993': 'CAMX', '96001': 'CAMX', '96002': 'CAMX', '96003': 'CAMX', '96006': 'NWPP', '96007': 'CAMX', '96008': 'CAMX', '96009': 'CAMX', '96010': 'CAMX', '96011': 'CAMX', '96013': 'CAMX', '96014': 'NWPP', '96015': 'NWPP', '96016': 'CAMX', '96017': 'NWPP', '96019': 'CAMX', '96020': 'CAMX', '96021': 'CAMX', '96022': 'CAMX', '96023': 'NWPP', '96024': 'CAMX', '96025': 'NWPP', '96027': 'NWPP', '96028': 'CAMX', '96029': 'CAMX', '96031': 'CAMX', '96032': 'NWPP', '96033': 'CAMX', '96034': 'NWPP', '96035': 'CAMX', '96037': 'NWPP', '96038': 'NWPP', '96039': 'CAMX', '96040': 'CAMX', '96041': 'CAMX', '96044': 'NWPP', '96046': 'CAMX', '96047': 'CAMX', '96048': 'NWPP', '96049': 'NWPP', '96050': 'NWPP', '96051': 'CAMX', '96052': 'CAMX', '96054': 'CAMX', '96055': 'CAMX', '96056': 'CAMX', '96057': 'NWPP', '96058': 'NWPP', '96059': 'CAMX', '96061': 'CAMX', '96062': 'CAMX', '96063': 'CAMX', '96064': 'NWPP', '96065': 'CAMX', '96067': 'NWPP', '96068': 'CAMX', '96069': 'CAMX', '96070': 'CAMX', '96071': 'CAMX', '96073': 'CAMX', '96074': 'CAMX', '96075': 'CAMX', '96076': 'CAMX', '96078': 'CAMX', '96079': 'CAMX', '96080': 'CAMX', '96084': 'CAMX', '96085': 'NWPP', '96086': 'NWPP', '96087': 'CAMX', '96088': 'CAMX', '96089': 'CAMX', '96090': 'CAMX', '96091': 'NWPP', '96092': 'CAMX', '96093': 'CAMX', '96094': 'NWPP', '96095': 'CAMX', '96096': 'CAMX', '96097': 'NWPP', '96099': 'CAMX', '96101': 'NWPP', '96103': 'CAMX', '96104': 'NWPP', '96105': 'CAMX', '96106': 'CAMX', '96107': 'CAMX', '96108': 'NWPP', '96109': 'CAMX', '96110': 'NWPP', '96111': 'CAMX', '96112': 'NWPP', '96113': 'CAMX', '96114': 'CAMX', '96115': 'NWPP', '96116': 'NWPP', '96117': 'CAMX', '96118': 'CAMX', '96119': 'CAMX', '96120': 'CAMX', '96121': 'CAMX', '96122': 'CAMX', '96123': 'NWPP', '96124': 'CAMX', '96125': 'CAMX', '96126': 'CAMX', '96127': 'CAMX', '96128': 'CAMX', '96129': 'CAMX', '96130': 'CAMX', '96132': 'NWPP', '96133': 'CAMX', '96134': 'NWPP', '96135': 'CAMX', '96136': 'CAMX', '96137': 'CAMX', '96140': 'CAMX', '96141': 'CAMX', '96142': 'CAMX', '96143': 'CAMX', '96145': 'CAMX', '96146': 'CAMX', '96148': 'CAMX', '96150': 'CAMX', '96151': 'CAMX', '96152': 'CAMX', '96154': 'CAMX', '96155': 'CAMX', '96156': 'CAMX', '96157': 'CAMX', '96158': 'CAMX', '96160': 'NWPP', '96161': 'CAMX', '96162': 'CAMX', '96701': 'HIOA', '96703': 'HIMS', '96704': 'HIMS', '96705': 'HIMS', '96706': 'HIOA', '96707': 'HIOA', '96708': 'HIMS', '96709': 'HIOA', '96710': 'HIMS', '96712': 'HIOA', '96713': 'HIMS', '96714': 'HIMS', '96715': 'HIMS', '96716': 'HIMS', '96717': 'HIOA', '96718': 'HIMS', '96719': 'HIMS', '96720': 'HIMS', '96721': 'HIMS', '96722': 'HIMS', '96725': 'HIMS', '96726': 'HIMS', '96727': 'HIMS', '96728': 'HIMS', '96729': 'HIMS', '96730': 'HIOA', '96731': 'HIOA', '96732': 'HIMS', '96733': 'HIMS', '96734': 'HIOA', '96737': 'HIMS', '96738': 'HIMS', '96739': 'HIMS', '96740': 'HIMS', '96741': 'HIMS', '96742': 'HIMS', '96743': 'HIMS', '96744': 'HIOA', '96745': 'HIMS', '96746': 'HIMS', '96747': 'HIMS', '96748': 'HIMS', '96749': 'HIMS', '96750': 'HIMS', '96751': 'HIMS', '96752': 'HIMS', '96753': 'HIMS', '96754': 'HIMS', '96755': 'HIMS', '96756': 'HIMS', '96757': 'HIMS', '96759': 'HIOA', '96760': 'HIMS', '96761': 'HIMS', '96762': 'HIOA', '96763': 'HIMS', '96764': 'HIMS', '96765': 'HIMS', '96766': 'HIMS', '96767': 'HIMS', '96768': 'HIMS', '96769': 'HIMS', '96770': 'HIMS', '96771': 'HIMS', '96772': 'HIMS', '96773': 'HIMS', '96774': 'HIMS', '96776': 'HIMS', '96777': 'HIMS', '96778': 'HIMS', '96779': 'HIMS', '96780': 'HIMS', '96781': 'HIMS', '96782': 'HIOA', '96783': 'HIMS', '96784': 'HIMS', '96785': 'HIMS', '96786': 'HIOA', '96788': 'HIMS', '96789': 'HIOA', '96790': 'HIMS', '96791': 'HIOA', '96792': 'HIOA', '96793': 'HIMS', '96795': 'HIOA', '96796': 'HIMS', '96797': 'HIOA', '96801': 'HIOA', '96802': 'HIOA', '96803': 'HIOA', '96804': 'HIOA', '96805': 'HIOA', '96806': 'HIOA', '96807': 'HIOA', '96808': 'HIOA', '96809': 'HIOA', '96810': 'HIOA', '96811': 'HIOA', '96812': 'HIOA', '96813': 'HIOA', '96814': 'HIOA', '96815': 'HIOA', '96816': 'HIOA', '96817': 'HIOA', '96818': 'HIOA', '96819': 'HIOA', '96820': 'HIOA', '96821': 'HIOA', '96822': 'HIOA', '96823': 'HIOA', '96824': 'HIOA', '96825': 'HIOA', '96826': 'HIOA', '96827': 'HIOA', '96828': 'HIOA', '96830': 'HIOA', '96836': 'HIOA', '96837': 'HIOA', '96838': 'HIOA', '96839': 'HIOA', '96840': 'HIOA', '96841': 'HIOA', '96843': 'HIOA', '96844': 'HIOA', '96846': 'HIOA', '96847': 'HIOA', '96848': 'HIOA', '96849': 'HIOA', '96850': 'HIOA', '96853': 'HIOA', '96854': 'HIOA', '96857': 'HIOA', '96858': 'HIOA', '96859': 'HIOA', '96860': 'HIOA', '96861': 'HIOA', '96863': 'HIOA', '96898': 'HIOA', '97001': 'NWPP', '97002': 'NWPP', '97003': 'NWPP', '97004': 'NWPP', '97005': 'NWPP', '97006': 'NWPP', '97007': 'NWPP', '97008': 'NWPP', '97009': 'NWPP', '97010': 'NWPP', '97011': 'NWPP', '97013': 'NWPP', '97014': 'NWPP', '97015': 'NWPP', '97016': 'NWPP', '97017': 'NWPP', '97018': 'NWPP', '97019': 'NWPP', '97020': 'NWPP', '97021': 'NWPP', '97022': 'NWPP', '97023': 'NWPP', '97024': 'NWPP', '97026': 'NWPP', '97027': 'NWPP', '97028': 'NWPP', '97029': 'NWPP', '97030': 'NWPP', '97031': 'NWPP', '97032': 'NWPP', '97033': 'NWPP', '97034': 'NWPP', '97035': 'NWPP', '97036': 'NWPP', '97037': 'NWPP', '97038': 'NWPP', '97039': 'NWPP', '97040': 'NWPP', '97041': 'NWPP', '97042': 'NWPP', '97044': 'NWPP', '97045': 'NWPP', '97048': 'NWPP', '97049': 'NWPP', '97050': 'NWPP', '97051': 'NWPP', '97053': 'NWPP', '97054': 'NWPP', '97055': 'NWPP', '97056': 'NWPP', '97057': 'NWPP', '97058': 'NWPP', '97060': 'NWPP', '97062': 'NWPP', '97063': 'NWPP', '97064': 'NWPP', '97065': 'NWPP', '97067': 'NWPP', '97068': 'NWPP', '97070': 'NWPP', '97071': 'NWPP', '97075': 'NWPP', '97076': 'NWPP', '97077': 'NWPP', '97078': 'NWPP', '97080': 'NWPP', '97086': 'NWPP', '97089': 'NWPP', '97101': 'NWPP', '97102': 'NWPP', '97103': 'NWPP', '97106': 'NWPP', '97107': 'NWPP', '97108': 'NWPP', '97109': 'NWPP', '97110': 'NWPP', '97111': 'NWPP', '97112': 'NWPP', '97113': 'NWPP', '97114': 'NWPP', '97115': 'NWPP', '97116': 'NWPP', '97117': 'NWPP', '97118': 'NWPP', '97119': 'NWPP', '97121': 'NWPP', '97122': 'NWPP', '97123': 'NWPP', '97124': 'NWPP', '97125': 'NWPP', '97127': 'NWPP', '97128': 'NWPP', '97130': 'NWPP', '97131': 'NWPP', '97132': 'NWPP', '97133': 'NWPP', '97134': 'NWPP', '97135': 'NWPP', '97136': 'NWPP', '97137': 'NWPP', '97138': 'NWPP', '97140': 'NWPP', '97141': 'NWPP', '97143': 'NWPP', '97144': 'NWPP', '97145': 'NWPP', '97146': 'NWPP', '97147': 'NWPP', '97148': 'NWPP', '97149': 'NWPP', '97201': 'NWPP', '97202': 'NWPP', '97203': 'NWPP', '97204': 'NWPP', '97205': 'NWPP', '97206': 'NWPP', '97207': 'NWPP', '97208': 'NWPP', '97209': 'NWPP', '97210': 'NWPP', '97211': 'NWPP', '97212': 'NWPP', '97213': 'NWPP', '97214': 'NWPP', '97215': 'NWPP', '97216': 'NWPP', '97217': 'NWPP', '97218': 'NWPP', '97219': 'NWPP', '97220': 'NWPP', '97221': 'NWPP', '97222': 'NWPP', '97223': 'NWPP', '97224': 'NWPP', '97225': 'NWPP', '97227': 'NWPP', '97228': 'NWPP', '97229': 'NWPP', '97230': 'NWPP', '97231': 'NWPP', '97232': 'NWPP', '97233': 'NWPP', '97236': 'NWPP', '97238': 'NWPP', '97239': 'NWPP', '97240': 'NWPP', '97242': 'NWPP', '97256': 'NWPP', '97258': 'NWPP', '97266': 'NWPP', '97267': 'NWPP', '97268': 'NWPP', '97269': 'NWPP', '97280': 'NWPP', '97281': 'NWPP', '97282': 'NWPP', '97283': 'NWPP', '97286': 'NWPP', '97290': 'NWPP', '97291': 'NWPP', '97292': 'NWPP', '97293': 'NWPP', '97294': 'NWPP', '97296': 'NWPP', '97298': 'NWPP', '97299': 'NWPP', '97301': 'NWPP', '97302': 'NWPP', '97303': 'NWPP', '97304': 'NWPP', '97305': 'NWPP', '97306': 'NWPP', '97307': 'NWPP', '97308': 'NWPP', '97309': 'NWPP', '97310': 'NWPP', '97311': 'NWPP', '97312': 'NWPP', '97314': 'NWPP', '97317': 'NWPP', '97321': 'NWPP', '97322': 'NWPP', '97324': 'NWPP', '97325': 'NWPP', '97326': 'NWPP', '97327': 'NWPP', '97329': 'NWPP', '97330': 'NWPP', '97331': 'NWPP', '97333': 'NWPP', '97335': 'NWPP', '97336': 'NWPP', '97338': 'NWPP', '97339': 'NWPP', '97341': 'NWPP', '97342': 'NWPP', '97343': 'NWPP', '97344': 'NWPP', '97345': 'NWPP', '97346': 'NWPP', '97347': 'NWPP', '97348': 'NWPP', '97350': 'NWPP', '97351': 'NWPP', '97352': 'NWPP', '97355': 'NWPP', '97357': 'NWPP', '97358': 'NWPP', '97360': 'NWPP', '97361': 'NWPP', '97362': 'NWPP', '97364': 'NWPP', '97365': 'NWPP', '97366': 'NWPP', '97367': 'NWPP', '97368': 'NWPP', '97369': 'NWPP', '97370': 'NWPP', '97371': 'NWPP', '97373': 'NWPP', '97374': 'NWPP', '97375': 'NWPP', '97376': 'NWPP', '97377': 'NWPP', '97378': 'NWPP', '97380': 'NWPP', '97381': 'NWPP', '97383': 'NWPP', '97384': 'NWPP', '97385': 'NWPP', '97386': 'NWPP', '97388': 'NWPP', '97389': 'NWPP', '97390': 'NWPP', '97391': 'NWPP', '97392': 'NWPP', '97394': 'NWPP', '97396': 'NWPP', '97401': 'NWPP', '97402': 'NWPP', '97403': 'NWPP', '97404': 'NWPP', '97405': 'NWPP', '97406': 'NWPP', '97407': 'NWPP', '97408': 'NWPP', '97409': 'NWPP', '97410': 'NWPP', '97411': 'NWPP', '97412': 'NWPP', '97413': 'NWPP', '97414': 'NWPP', '97415': 'NWPP', '97416': 'NWPP', '97417': 'NWPP', '97419': 'NWPP', '97420': 'NWPP', '97423': 'NWPP', '97424': 'NWPP', '97426': 'NWPP', '97427': 'NWPP', '97429': 'NWPP', '97430': 'NWPP', '97431': 'NWPP', '97432': 'NWPP', '97434': 'NWPP', '97435': 'NWPP', '97436': 'NWPP', '97437': 'NWPP', '97438': 'NWPP', '97439': 'NWPP', '97440': 'NWPP', '97441': 'NWPP', '97442': 'NWPP', '97443': 'NWPP', '97444': 'NWPP', '97446': 'NWPP', '97447': 'NWPP', '97448': 'NWPP', '97449': 'NWPP', '97450': 'NWPP', '97451': 'NWPP', '97452': 'NWPP', '97453': 'NWPP', '97454': 'NWPP', '97455': 'NWPP', '97456': 'NWPP', '97457': 'NWPP', '97458': 'NWPP', '97459': 'NWPP', '97461': 'NWPP', '97462': 'NWPP', '97463': 'NWPP', '97464': 'NWPP', '97465': 'NWPP', '97466': 'NWPP', '97467': 'NWPP', '97469': 'NWPP', '97470': 'NWPP', '97471': 'NWPP', '97473': 'NWPP', '97475': 'NWPP', '97476': 'NWPP', '97477': 'NWPP', '97478': 'NWPP', '97479': 'NWPP', '97480': 'NWPP', '97481': 'NWPP', '97482': 'NWPP', '97484': 'NWPP', '97486': 'NWPP', '97487': 'NWPP', '97488': 'NWPP', '97489': 'NWPP', '97490': 'NWPP', '97491': 'NWPP', '97492': 'NWPP', '97493': 'NWPP', '97494': 'NWPP', '97495': 'NWPP', '97496': 'NWPP', '97497': 'NWPP', '97498': 'NWPP', '97499': 'NWPP', '97501': 'NWPP', '97502': 'NWPP', '97503': 'NWPP', '97504': 'NWPP', '97520': 'NWPP', '97522': 'NWPP', '97523': 'NWPP', '97524': 'NWPP', '97525': 'NWPP', '97526': 'NWPP', '97527': 'NWPP', '97528': 'NWPP', '97530': 'NWPP', '97531': 'NWPP', '97532': 'NWPP', '97533': 'NWPP', '97534': 'NWPP', '97535': 'NWPP', '97536': 'NWPP', '97537': 'NWPP', '97538': 'NWPP', '97539': 'NWPP', '97540': 'NWPP', '97541': 'NWPP', '97543': 'NWPP', '97544': 'NWPP', '97601': 'NWPP', '97602': 'NWPP', '97603': 'NWPP', '97604': 'NWPP', '97620': 'NWPP', '97621': 'NWPP', '97622': 'NWPP', '97623': 'NWPP', '97624': 'NWPP', '97625': 'NWPP', '97626': 'NWPP', '97627': 'NWPP', '97630': 'NWPP', '97632': 'NWPP', '97633': 'NWPP', '97634': 'NWPP', '97635': 'NWPP', '97636': 'NWPP', '97637': 'NWPP', '97638': 'NWPP', '97639': 'NWPP', '97640': 'NWPP', '97641': 'NWPP', '97701': 'NWPP', '97702': 'NWPP', '97703': 'NWPP', '97707': 'NWPP', '97708': 'NWPP', '97709': 'NWPP', '97710': 'NWPP', '97711': 'NWPP', '97712': 'NWPP', '97720': 'NWPP', '97721': 'NWPP', '97722': 'NWPP', '97730': 'NWPP', '97731': 'NWPP', '97732': 'NWPP', '97733': 'NWPP', '97734': 'NWPP', '97735': 'NWPP', '97736': 'NWPP', '97737': 'NWPP', '97738': 'NWPP', '97739': 'NWPP', '97741': 'NWPP', '97750': 'NWPP', '97751': 'NWPP', '97752': 'NWPP', '97753': 'NWPP', '97754': 'NWPP', '97756': 'NWPP', '97758': 'NWPP', '97759': 'NWPP', '97760': 'NWPP', '97761': 'NWPP', '97801': 'NWPP', '97810': 'NWPP', '97812': 'NWPP', '97813': 'NWPP', '97814': 'NWPP', '97817': 'NWPP', '97818': 'NWPP', '97819': 'NWPP', '97820': 'NWPP', '97823': 'NWPP', '97824': 'NWPP', '97825': 'NWPP', '97826': 'NWPP', '97827': 'NWPP', '97828': 'NWPP', '97830': 'NWPP', '97833': 'NWPP', '97834': 'NWPP', '97835': 'NWPP', '97836': 'NWPP', '97837': 'NWPP', '97838': 'NWPP', '97839': 'NWPP', '97840': 'NWPP', '97841': 'NWPP', '97842': 'NWPP', '97843': 'NWPP', '97844': 'NWPP', '97845': 'NWPP', '97846': 'NWPP', '97848': 'NWPP', '97850': 'NWPP', '97856': 'NWPP', '97857': 'NWPP', '97859': 'NWPP', '97861': 'NWPP', '97862': 'NWPP', '97864': 'NWPP', '97865': 'NWPP', '97867': 'NWPP', '97868': 'NWPP', '97869': 'NWPP', '97870': 'NWPP', '97873': 'NWPP', '97874': 'NWPP', '97875': 'NWPP', '97876': 'NWPP', '97877': 'NWPP', '97880': 'NWPP', '97882': 'NWPP', '97883': 'NWPP', '97884': 'NWPP', '97885': 'NWPP', '97886': 'NWPP', '97901': 'NWPP', '97902': 'NWPP', '97903': 'NWPP', '97904': 'NWPP', '97905': 'NWPP', '97906': 'NWPP', '97907': 'NWPP', '97908': 'NWPP', '97909': 'NWPP', '97910': 'NWPP', '97911': 'NWPP', '97913': 'NWPP', '97914': 'NWPP', '97917': 'NWPP', '97918': 'NWPP', '97920': 'NWPP', '98001': 'NWPP', '98002': 'NWPP', '98003': 'NWPP', '98004': 'NWPP', '98005': 'NWPP', '98006': 'NWPP', '98007': 'NWPP', '98008': 'NWPP', '98009': 'NWPP', '98010': 'NWPP', '98011': 'NWPP', '98012': 'NWPP', '98013': 'NWPP', '98014': 'NWPP', '98015': 'NWPP', '98019': 'NWPP', '98020': 'NWPP', '98021': 'NWPP', '98022': 'NWPP', '98023': 'NWPP', '98024': 'NWPP', '98025': 'NWPP', '98026': 'NWPP', '98027': 'NWPP', '98028': 'NWPP', '98029': 'NWPP', '98030': 'NWPP', '98031': 'NWPP', '98032': 'NWPP', '98033': 'NWPP', '98034': 'NWPP', '98035': 'NWPP', '98036': 'NWPP', '98037': 'NWPP', '98038': 'NWPP', '98039': 'NWPP', '98040': 'NWPP', '98041': 'NWPP', '98042': 'NWPP', '98043': 'NWPP', '98045': 'NWPP', '98046': 'NWPP', '98047': 'NWPP', '98050': 'NWPP', '98051': 'NWPP', '98052': 'NWPP', '98053': 'NWPP', '98054': 'NWPP', '98055': 'NWPP', '98056': 'NWPP', '98057': 'NWPP', '98058': 'NWPP', '98059': 'NWPP', '98061': 'NWPP', '98062': 'NWPP', '98063': 'NWPP', '98064': 'NWPP', '98065': 'NWPP', '98068': 'NWPP', '98070': 'NWPP', '98071': 'NWPP', '98072': 'NWPP', '98073': 'NWPP', '98074': 'NWPP', '98075': 'NWPP', '98077': 'NWPP', '98082': 'NWPP', '98083': 'NWPP', '98087': 'NWPP', '98089': 'NWPP', '98092': 'NWPP', '98093': 'NWPP', '98101': 'NWPP', '98102': 'NWPP', '98103': 'NWPP', '98104': 'NWPP', '98105': 'NWPP', '98106': 'NWPP', '98107': 'NWPP', '98108': 'NWPP', '98109': 'NWPP', '98110': 'NWPP', '98111': 'NWPP', '98112': 'NWPP', '98113': 'NWPP', '98114': 'NWPP', '98115': 'NWPP', '98116': 'NWPP', '98117': 'NWPP', '98118': 'NWPP', '98119': 'NWPP', '98121': 'NWPP', '98122': 'NWPP', '98124': 'NWPP', '98125': 'NWPP', '98126': 'NWPP', '98127': 'NWPP', '98129': 'NWPP', '98131': 'NWPP', '98132': 'NWPP', '98133': 'NWPP', '98134': 'NWPP', '98136': 'NWPP', '98138': 'NWPP', '98139': 'NWPP', '98141': 'NWPP', '98144': 'NWPP', '98145': 'NWPP', '98146': 'NWPP', '98148': 'NWPP', '98154': 'NWPP', '98155': 'NWPP', '98158': 'NWPP', '98160': 'NWPP', '98161': 'NWPP', '98164': 'NWPP', '98165': 'NWPP', '98166': 'NWPP', '98168': 'NWPP', '98170': 'NWPP', '98171': 'NWPP', '98174': 'NWPP', '98175': 'NWPP', '98177': 'NWPP', '98178': 'NWPP', '98181': 'NWPP', '98184': 'NWPP', '98185': 'NWPP', '98188': 'NWPP', '98189': 'NWPP', '98190': 'NWPP', '98191': 'NWPP', '98194': 'NWPP', '98195': 'NWPP', '98198': 'NWPP', '98199': 'NWPP', '98201': 'NWPP', '98203': 'NWPP', '98204': 'NWPP', '98205': 'NWPP', '98206': 'NWPP', '98207': 'NWPP', '98208': 'NWPP', '98213': 'NWPP', '98220': 'NWPP', '98221': 'NWPP', '98222': 'NWPP', '98223': 'NWPP', '98224': 'NWPP', '98225': 'NWPP', '98226': 'NWPP', '98227': 'NWPP', '98228': 'NWPP', '98229': 'NWPP', '98230': 'NWPP', '98231': 'NWPP', '98232': 'NWPP', '98233': 'NWPP', '98235': 'NWPP', '98236': 'NWPP', '98237': 'NWPP', '98238': 'NWPP', '98239': 'NWPP', '98240': 'NWPP', '98241': 'NWPP', '98243': 'NWPP', '98244': 'NWPP', '98245': 'NWPP', '98247': 'NWPP', '98248': 'NWPP', '98249': 'NWPP', '98250': 'NWPP', '98251': 'NWPP', '98252': 'NWPP', '98253': 'NWPP', '98255': 'NWPP', '98256': 'NWPP', '98257': 'NWPP', '98258': 'NWPP', '98259': 'NWPP', '98260': 'NWPP', '98261': 'NWPP', '98262': 'NWPP', '98263': 'NWPP', '98264': 'NWPP', '98266': 'NWPP', '98267': 'NWPP', '98270': 'NWPP', '98271': 'NWPP', '98272': 'NWPP', '98273': 'NWPP', '98274': 'NWPP', '98275': 'NWPP', '98276': 'NWPP', '98277': 'NWPP', '98278': 'NWPP', '98279': 'NWPP', '98280': 'NWPP', '98281': 'NWPP', '98282': 'NWPP', '98283': 'NWPP', '98284': 'NWPP', '98286': 'NWPP', '98287': 'NWPP', '98288': 'NWPP', '98290': 'NWPP', '98291': 'NWPP', '98292': 'NWPP', '98293': 'NWPP', '98294': 'NWPP', '98295': 'NWPP', '98296': 'NWPP', '98297': 'NWPP', '98303': 'NWPP', '98304': 'NWPP', '98305': 'NWPP', '98310': 'NWPP', '98311': 'NWPP', '98312': 'NWPP', '98314': 'NWPP', '98315': 'NWPP', '98320': 'NWPP', '98321': 'NWPP', '98322': 'NWPP', '98323': 'NWPP', '98324': 'NWPP', '98325': 'NWPP', '98326': 'NWPP', '98327': 'NWPP', '98328': 'NWPP', '98329': 'NWPP', '98330': 'NWPP', '98331': 'NWPP', '98332': 'NWPP', '98333': 'NWPP', '98335': 'NWPP', '98336': 'NWPP', '98337': 'NWPP', '98338': 'NWPP', '98339': 'NWPP', '98340': 'NWPP', '98342': 'NWPP', '98343': 'NWPP', '98344': 'NWPP', '98345': 'NWPP', '98346': 'NWPP', '98348': 'NWPP', '98349': 'NWPP', '98350': 'NWPP', '98351': 'NWPP', '98352': 'NWPP', '98353': 'NWPP', '98354': 'NWPP', '98355': 'NWPP', '98356': 'NWPP', '98357': 'NWPP', '98358': 'NWPP', '98359': 'NWPP', '98360': 'NWPP', '98361': 'NWPP', '98362': 'NWPP', '98363': 'NWPP', '98364': 'NWPP', '98365': 'NWPP', '98366': 'NWPP', '98367': 'NWPP', '98368': 'NWPP', '98370': 'NWPP', '98371': 'NWPP', '98372': 'NWPP', '98373': 'NWPP', '98374': 'NWPP', '98375': 'NWPP', '98376': 'NWPP', '98377': 'NWPP', '98378': 'NWPP', '98380': 'NWPP', '98381': 'NWPP', '98382': 'NWPP', '98383': 'NWPP', '98384': 'NWPP', '98385': 'NWPP', '98386': 'NWPP', '98387': 'NWPP', '98388': 'NWPP', '98390': 'NWPP', '98391': 'NWPP', '98392': 'NWPP', '98393': 'NWPP', '98394': 'NWPP', '98395': 'NWPP', '98396': 'NWPP', '98397': 'NWPP', '98398': 'NWPP', '98401': 'NWPP', '98402': 'NWPP', '98403': 'NWPP', '98404': 'NWPP', '98405': 'NWPP', '98406': 'NWPP', '98407': 'NWPP', '98408': 'NWPP', '98409': 'NWPP', '98411': 'NWPP', '98412': 'NWPP', '98413': 'NWPP', '98415': 'NWPP', '98416': 'NWPP', '98417': 'NWPP', '98418': 'NWPP', '98419': 'NWPP', '98421': 'NWPP', '98422': 'NWPP', '98424': 'NWPP', '98430': 'NWPP', '98431': 'NWPP', '98433': 'NWPP', '98438': 'NWPP', '98439': 'NWPP', '98442': 'NWPP', '98443': 'NWPP', '98444': 'NWPP', '98445': 'NWPP', '98446': 'NWPP', '98447': 'NWPP', '98448': 'NWPP', '98464': 'NWPP', '98465': 'NWPP', '98466': 'NWPP', '98467': 'NWPP', '98471': 'NWPP', '98481': 'NWPP', '98490': 'NWPP', '98492': 'NWPP', '98493': 'NWPP', '98496': 'NWPP', '98497': 'NWPP', '98498': 'NWPP', '98499': 'NWPP', '98501': 'NWPP', '98502': 'NWPP', '98503': 'NWPP', '98504': 'NWPP', '98505': 'NWPP', '98506': 'NWPP', '98507': 'NWPP', '98508': 'NWPP', '98509': 'NWPP', '98511': 'NWPP', '98512': 'NWPP', '98513': 'NWPP', '98516': 'NWPP', '98520': 'NWPP', '98522': 'NWPP', '98524': 'NWPP', '98526': 'NWPP', '98527': 'NWPP', '98528': 'NWPP', '98530': 'NWPP', '98531': 'NWPP', '98532': 'NWPP', '98533': 'NWPP', '98535': 'NWPP', '98536': 'NWPP', '98537': 'NWPP', '98538': 'NWPP', '98539': 'NWPP', '98540': 'NWPP', '98541': 'NWPP', '98542': 'NWPP', '98544': 'NWPP', '98546': 'NWPP', '98547': 'NWPP', '98548': 'NWPP', '98550': 'NWPP', '98552': 'NWPP', '98554': 'NWPP', '98555': 'NWPP', '98556': 'NWPP', '98557': 'NWPP', '98558': 'NWPP', '98559': 'NWPP', '98560': 'NWPP', '98561': 'NWPP', '98562': 'NWPP', '98563': 'NWPP', '98564': 'NWPP', '98565': 'NWPP', '98566': 'NWPP', '98568': 'NWPP', '98569': 'NWPP', '98570': 'NWPP', '98571': 'NWPP', '98572': 'NWPP', '98575': 'NWPP', '98576': 'NWPP', '98577': 'NWPP', '98579': 'NWPP', '98580': 'NWPP', '98581': 'NWPP', '98582': 'NWPP', '98583': 'NWPP', '98584': 'NWPP', '98585': 'NWPP', '98586': 'NWPP', '98587': 'NWPP', '98588': 'NWPP', '98589': 'NWPP', '98590': 'NWPP', '98591': 'NWPP', '98592': 'NWPP', '98593': 'NWPP', '98595': 'NWPP', '98596': 'NWPP', '98597': 'NWPP', '98599': 'NWPP', '98601': 'NWPP', '98602': 'NWPP', '98603': 'NWPP', '98604': 'NWPP', '98605': 'NWPP', '98606': 'NWPP', '98607': 'NWPP', '98609': 'NWPP', '98610': 'NWPP', '98611': 'NWPP', '98612': 'NWPP', '98613': 'NWPP', '98614': 'NWPP', '98616': 'NWPP', '98617': 'NWPP', '98619': 'NWPP', '98620': 'NWPP', '98621': 'NWPP', '98622': 'NWPP', '98623': 'NWPP', '98624': 'NWPP', '98625': 'NWPP', '98626': 'NWPP', '98628': 'NWPP', '98629': 'NWPP', '98631': 'NWPP', '98632': 'NWPP', '98635': 'NWPP', '98637': 'NWPP', '98638': 'NWPP', '98639': 'NWPP', '98640': 'NWPP', '98641': 'NWPP', '98642': 'NWPP', '98643': 'NWPP', '98644': 'NWPP', '98645': 'NWPP', '98647': 'NWPP', '98648': 'NWPP', '98649': 'NWPP', '98650': 'NWPP', '98651': 'NWPP', '98660': 'NWPP', '98661': 'NWPP', '98662': 'NWPP', '98663': 'NWPP', '98664': 'NWPP', '98665': 'NWPP', '98666': 'NWPP', '98668': 'NWPP', '98670': 'NWPP', '98671': 'NWPP', '98672': 'NWPP', '98673': 'NWPP', '98674': 'NWPP', '98675': 'NWPP', '98682': 'NWPP', '98683': 'NWPP', '98684': 'NWPP', '98685': 'NWPP', '98686': 'NWPP', '98687': 'NWPP', '98801': 'NWPP', '98802': 'NWPP', '98807': 'NWPP', '98811': 'NWPP', '98812': 'NWPP', '98813': 'NWPP', '98814': 'NWPP', '98815': 'NWPP', '98816': 'NWPP', '98817': 'NWPP', '98819': 'NWPP', '98821': 'NWPP', '98822': 'NWPP', '98823': 'NWPP', '98824': 'NWPP', '98826': 'NWPP', '98827': 'NWPP', '98828': 'NWPP', '98829': 'NWPP', '98830': 'NWPP', '98831': 'NWPP', '98832': 'NWPP', '98833': 'NWPP', '98834': 'NWPP', '98836': 'NWPP', '98837': 'NWPP', '98840': 'NWPP', '98841': 'NWPP', '98843': 'NWPP', '98844': 'NWPP', '98845': 'NWPP', '98846': 'NWPP', '98847': 'NWPP', '98848': 'NWPP', '98849': 'NWPP', '98850': 'NWPP', '98851': 'NWPP', '98852': 'NWPP', '98853': 'NWPP', '98855': 'NWPP', '98856': 'NWPP', '98857': 'NWPP', '98858': 'NWPP', '98859': 'NWPP', '98860': 'NWPP', '98862': 'NWPP', '98901': 'NWPP', '98902': 'NWPP', '98903': 'NWPP', '98904': 'NWPP', '98907': 'NWPP', '98908': 'NWPP', '98909': 'NWPP', '98920': 'NWPP', '98921': 'NWPP', '98922': 'NWPP', '98923': 'NWPP', '98925': 'NWPP', '98926': 'NWPP', '98929': 'NWPP', '98930': 'NWPP', '98932': 'NWPP', '98933': 'NWPP', '98934': 'NWPP', '98935': 'NWPP', '98936': 'NWPP', '98937': 'NWPP', '98938': 'NWPP', '98939': 'NWPP', '98940': 'NWPP', '98941': 'NWPP', '98942': 'NWPP', '98943': 'NWPP', '98944': 'NWPP', '98946': 'NWPP', '98947': 'NWPP', '98948': 'NWPP', '98950': 'NWPP', '98951': 'NWPP', '98952': 'NWPP', '98953': 'NWPP', '99001': 'NWPP', '99003': 'NWPP', '99004': 'NWPP', '99005': 'NWPP', '99006': 'NWPP', '99008': 'NWPP', '99009': 'NWPP', '99011': 'NWPP', '99012': 'NWPP', '99013': 'NWPP', '99014': 'NWPP', '99016': 'NWPP', '99017': 'NWPP', '99018': 'NWPP', '99019': 'NWPP', '99020': 'NWPP', '99021': 'NWPP', '99022': 'NWPP', '99023': 'NWPP', '99025': 'NWPP', '99026': 'NWPP', '99027': 'NWPP', '99029': 'NWPP', '99030': 'NWPP', '99031': 'NWPP', '99032': 'NWPP', '99033': 'NWPP', '99034': 'NWPP', '99036': 'NWPP', '99037': 'NWPP', '99039': 'NWPP', '99040': 'NWPP', '99101': 'NWPP', '99102': 'NWPP', '99103': 'NWPP', '99104': 'NWPP', '99105': 'NWPP', '99107': 'NWPP', '99109': 'NWPP', '99110': 'NWPP', '99111': 'NWPP', '99113': 'NWPP', '99114': 'NWPP', '99115': 'NWPP', '99116': 'NWPP', '99117': 'NWPP', '99118': 'NWPP', '99119': 'NWPP', '99121': 'NWPP', '99122': 'NWPP', '99123': 'NWPP', '99124': 'NWPP', '99125': 'NWPP', '99126': 'NWPP', '99128': 'NWPP', '99129': 'NWPP', '99130': 'NWPP', '99131': 'NWPP', '99133': 'NWPP', '99134': 'NWPP', '99135': 'NWPP', '99136': 'NWPP', '99137': 'NWPP', '99138': 'NWPP', '99139': 'NWPP', '99140': 'NWPP', '99141': 'NWPP', '99143': 'NWPP', '99144': 'NWPP', '99146': 'NWPP', '99147': 'NWPP', '99148': 'NWPP', '99149': 'NWPP', '99150': 'NWPP', '99151': 'NWPP', '99152': 'NWPP', '99153': 'NWPP', '99154': 'NWPP', '99155': 'NWPP', '99156': 'NWPP', '99157': 'NWPP', '99158': 'NWPP', '99159': 'NWPP', '99160': 'NWPP', '99161': 'NWPP', '99163': 'NWPP', '99164': 'NWPP', '99166': 'NWPP', '99167': 'NWPP', '99169': 'NWPP', '99170': 'NWPP', '99171': 'NWPP', '99173': 'NWPP', '99174': 'NWPP', '99176': 'NWPP', '99179': 'NWPP', '99180': 'NWPP', '99181': 'NWPP', '99185': 'NWPP', '99201': 'NWPP', '99202': 'NWPP', '99203': 'NWPP', '99204': 'NWPP', '99205': 'NWPP', '99206': 'NWPP', '99207': 'NWPP', '99208': 'NWPP', '99209': 'NWPP', '99210': 'NWPP', '99211': 'NWPP', '99212': 'NWPP', '99213': 'NWPP', '99214': 'NWPP', '99215': 'NWPP', '99216': 'NWPP', '99217': 'NWPP', '99218': 'NWPP', '99219': 'NWPP', '99220': 'NWPP', '99223': 'NWPP', '99224': 'NWPP', '99228': 'NWPP', '99251': 'NWPP', '99252': 'NWPP', '99256': 'NWPP', '99258': 'NWPP', '99260': 'NWPP', '99299': 'NWPP', '99301': 'NWPP', '99302': 'NWPP', '99320': 'NWPP', '99321': 'NWPP', '99322': 'NWPP', '99323': 'NWPP', '99324': 'NWPP', '99326': 'NWPP', '99328': 'NWPP', '99329': 'NWPP', '99330': 'NWPP', '99333': 'NWPP', '99335': 'NWPP', '99336': 'NWPP', '99337': 'NWPP', '99338': 'NWPP', '99341': 'NWPP', '99343': 'NWPP', '99344': 'NWPP', '99345': 'NWPP', '99346': 'NWPP', '99347': 'NWPP', '99348': 'NWPP', '99349': 'NWPP', '99350': 'NWPP', '99352': 'NWPP', '99353': 'NWPP', '99354': 'NWPP', '99356': 'NWPP', '99357': 'NWPP', '99359': 'NWPP', '99360': 'NWPP', '99361': 'NWPP', '99362': 'NWPP', '99363': 'NWPP', '99371': 'NWPP', '99401': 'NWPP', '99402': 'NWPP', '99403': 'NWPP', '99501': 'AKGD', '99502': 'AKGD', '99503': 'AKGD', '99504': 'AKGD', '99505': 'AKGD', '99506': 'AKGD', '99507': 'AKGD', '99508': 'AKGD', '99509': 'AKGD', '99510': 'AKGD', '99511': 'AKGD', '99513': 'AKGD', '99514': 'AKGD', '99515': 'AKGD', '99516': 'AKGD', '99517': 'AKGD', '99518': 'AKGD', '99519': 'AKGD', '99520': 'AKGD', '99521': 'AKGD', '99522': 'AKGD', '99523': 'AKGD', '99524': 'AKGD', '99529': 'AKGD', '99530': 'AKGD', '99540': 'AKGD', '99545': 'AKMS', '99546': 'AKMS', '99547': 'AKMS', '99548': 'AKMS', '99549': 'AKMS', '99550': 'AKMS', '99551': 'AKMS', '99552': 'AKMS', '99553': 'AKMS', '99554': 'AKMS', '99555': 'AKMS', '99556': 'AKGD', '99557': 'AKMS', '99558': 'AKMS', '99559': 'AKMS', '99561': 'AKMS', '99563': 'AKMS', '99564': 'AKMS', '99565': 'AKMS', '99566': 'AKMS', '99567': 'AKGD', '99568': 'AKGD', '99569': 'AKMS', '99571': 'AKMS', '99572': 'AKGD', '99573': 'AKMS', '99574': 'AKGD', '99575': 'AKMS', '99576': 'AKMS', '99577': 'AKGD', '99578': 'AKMS', '99579': 'AKMS', '99580': 'AKMS', '99581': 'AKMS', '99583': 'AKMS', '99585': 'AKMS', '99586': 'AKGD', '99587': 'AKGD', '99588': 'AKGD', '99589': 'AKMS', '99590': 'AKMS', '99591': 'AKMS', '99599': 'AKGD', '99602': 'AKMS', '99603': 'AKGD', '99604': 'AKMS', '99605': 'AKGD', '99606': 'AKMS', '99607': 'AKMS', '99608': 'AKMS', '99609': 'AKMS', '99610': 'AKGD', '99611': 'AKGD', '99612': 'AKMS', '99613': 'AKMS', '99614': 'AKMS', '99615': 'AKMS', '99619': 'AKMS', '99620': 'AKMS', '99621': 'AKMS', '99622': 'AKMS', '99623': 'AKGD', '99624': 'AKMS', '99625': 'AKMS', '99626': 'AKMS', '99627': 'AKMS', '99628': 'AKMS', '99629': 'AKGD', '99630': 'AKMS', '99631': 'AKGD', '99632': 'AKMS', '99633': 'AKMS', '99634': 'AKMS', '99635': 'AKGD', '99636': 'AKMS', '99637': 'AKMS', '99638': 'AKMS', '99639': 'AKGD', '99640': 'AKMS', '99641': 'AKMS', '99643': 'AKMS', '99644': 'AKMS', '99645': 'AKGD', '99647': 'AKMS', '99648': 'AKMS', '99649': 'AKMS', '99650': 'AKMS', '99651': 'AKMS', '99652': 'AKGD', '99653': 'AKMS', '99654': 'AKGD', '99655': 'AKMS', '99656': 'AKMS', '99657': 'AKMS', '99658': 'AKMS', '99659': 'AKMS', '99660': 'AKMS', '99661': 'AKMS', '99662': 'AKMS', '99663': 'AKGD', '99664': 'AKGD', '99665': 'AKMS', '99666': 'AKMS', '99667': 'AKGD', '99668': 'AKMS', '99669': 'AKGD', '99670': 'AKMS', '99671': 'AKMS', '99672': 'AKGD', '99674': 'AKGD', '99675': 'AKMS', '99676': 'AKGD', '99677': 'AKMS', '99678': 'AKMS', '99679': 'AKMS', '99680': 'AKMS', '99681': 'AKMS', '99682': 'AKGD', '99683': 'AKGD', '99684': 'AKMS', '99685': 'AKMS', '99686': 'AKGD', '99687': 'AKGD', '99688': 'AKGD', '99689': 'AKMS', '99690': 'AKMS', '99691': 'AKMS', '99692': 'AKMS', '99693': 'AKMS', '99694': 'AKGD', '99695': 'AKGD', '99697': 'AKMS', '99701': 'AKGD', '99702': 'AKGD', '99703': 'AKGD', '99704': 'AKGD', '99705': 'AKGD', '99706': 'AKGD', '99707': 'AKGD', '99708': 'AKGD', '99709': 'AKGD', '99710': 'AKGD', '99711': 'AKGD', '99712': 'AKGD', '99714': 'AKGD', '99716': 'AKGD', '99720': 'AKMS', '99721': 'AKMS', '99722': 'AKMS', '99723': 'AKMS', '99724': 'AKGD', '99725': 'AKGD', '99726': 'AKMS', '99727': 'AKMS', '99729': 'AKGD', '99730': 'AKMS', '99731': 'AKGD', '99732': 'AKGD', '99733': 'AKGD', '99734': 'AKMS', '99736': 'AKMS', '99737': 'AKMS', '99738': 'AKMS', '99739': 'AKMS', '99740': 'AKGD', '99741': 'AKMS', '99742': 'AKMS', '99743': 'AKGD', '99744': 'AKGD', '99745': 'AKMS', '99746': 'AKMS', '99747': 'AKMS', '99748': 'AKMS', '99749': 'AKMS', '99750': 'AKMS', '99751': 'AKMS', '99752': 'AKMS', '99753': 'AKMS', '99754': 'AKMS', '99755': 'AKGD', '99756': 'AKMS', '99757': 'AKGD', '99758': 'AKMS', '99759': 'AKMS', '99760': 'AKMS', '99761': 'AKMS', '99762': 'AKMS', '99763': 'AKMS', '99764': 'AKMS', '99765': 'AKMS', '99766': 'AKMS', '99767': 'AKMS', '99768': 'AKMS', '99769': 'AKMS', '99770': 'AKMS', '99771': 'AKMS', '99772': 'AKMS', '99773': 'AKMS', '99774': 'AKMS', '99775': 'AKGD', '99776': 'AKMS', '99777': 'AKMS', '99778': 'AKMS', '99780': 'AKMS', '99781': 'AKMS', '99782': 'AKMS', '99783': 'AKMS', '99784': 'AKMS', '99785': 'AKMS', '99786': 'AKMS', '99788': 'AKMS', '99789': 'AKMS', '99790': 'AKGD', '99791': 'AKMS', '99801': 'AKMS', '99802': 'AKMS', '99803': 'AKMS', '99811': 'AKMS', '99812': 'AKMS', '99820': 'AKMS', '99821': 'AKMS', '99824': 'AKMS', '99825': 'AKMS', '99826': 'AKMS', '99827': 'AKMS', '99829': 'AKMS', '99830': 'AKMS', '99832': 'AKMS', '99833': 'AKMS', '99835': 'AKMS', '99836': 'AKMS', '99840': 'AKMS', '99841': 'AKMS', '99850': 'AKMS', '99901': 'AKMS', '99903': 'AKMS', '99918': 'AKMS', '99919': 'AKMS', '99921': 'AKMS', '99922': 'AKMS', '99923': 'AKMS', '99925': 'AKMS', '99926': 'AKMS', '99927': 'AKMS', '99928': 'AKMS', '99929': 'AKMS', '99950': 'AKMS'}
-
-subregion_rates = {
-    'AKGD': 314.6743845,
-    'AKMS': 142.753517,
-    'AZNM': 241.232415,
-    'CAMX': 156.390973,
-    'ERCT': 239.4985346,
-    'FRCC': 245.1154748,
-    'HIMS': 335.2590856,
-    'HIOA': 482.2690504,
-    'MROE': 466.669109,
-    'MROW': 293.9783118,
-    'NEWE': 159.4340563,
-    'NWPP': 187.1403869,
-    'NYCW': 239.7075029,
-    'NYLI': 357.2432591,
-    'NYUP': 68.5890973,
-    'PRMS': 458.3516999,
-    'RFCE': 198.123095,
-    'RFCM': 358.1008206,
-    'RFCW': 308.4827081,
-    'RMPA': 341.802755,
-    'SPNO': 292.8185815,
-    'SPSO': 303.9413834,
-    'SRMV': 227.2596717,
-    'SRMW': 455.6567995,
-    'SRSO': 262.7315358,
-    'SRTV': 274.7546893,
-    'SRVC': 188.4100234,
-    'National Average': 281.5,
-    'Global Average': 306.92
-}
+import os
+import re
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+#eGRID subregions, the position in this list is the code stored in the zip index file
+subregion_codes = [
+    'AKGD', 'AKMS', 'AZNM', 'CAMX', 'ERCT', 'FRCC', 'HIMS', 'HIOA', 'MROE',
+    'MROW', 'NEWE', 'NWPP', 'NYCW', 'NYLI', 'NYUP', 'PRMS', 'RFCE', 'RFCM',
+    'RFCW', 'RMPA', 'SPNO', 'SPSO', 'SRMV', 'SRMW', 'SRSO', 'SRTV', 'SRVC'
+]
+
+
+#Maps five digit zip codes to eGRID subregions. The index file holds every zip as a sorted
+#little-endian uint32 followed by one uint8 subregion code per zip, and is only memory-mapped
+#the first time a zip is looked up.
+class SubregionIndex:
+    def __init__(self, path):
+        self._path = path
+        self._zips = None
+        self._codes = None
+
+    def _load(self):
+        if self._zips is None:
+            data = np.memmap(self._path, dtype=np.uint8, mode='r')
+            count = len(data) // 5
+            self._zips = data[:count * 4].view('<u4')
+            self._codes = data[count * 4:]
+        return self._zips, self._codes
+
+    @staticmethod
+    def _as_int(postal):
+        if isinstance(postal, str) and len(postal) == 5 and postal.isdigit():
+            return int(postal)
+        return None
+
+    #position of each zip in the index, or -1 when it isn't there
+    def positions(self, postals):
+        zips = self._load()[0]
+        keys = np.array([self._as_int(p) for p in postals], dtype=object)
+        valid = keys != None
+        numbers = np.where(valid, keys, 0).astype('<u4')
+        found = np.searchsorted(zips, numbers)
+        found[found >= len(zips)] = 0
+        hit = valid & (zips[found] == numbers)
+        return np.where(hit, found, -1)
+
+    #vectorized lookup, returns the subregion of each zip or None
+    def lookup(self, postals):
+        codes = self._load()[1]
+        found = self.positions(postals)
+        names = np.array(subregion_codes, dtype=object)[codes[np.maximum(found, 0)]]
+        names[found < 0] = None
+        return names
+
+    def get(self, postal, default=None):
+        subregion = self.lookup([postal])[0]
+        return default if subregion is None else subregion
+
+    def __contains__(self, postal):
+        return self.positions([postal])[0] >= 0
+
+    def __getitem__(self, postal):
+        subregion = self.lookup([postal])[0]
+        if subregion is None:
+            raise KeyError(postal)
+        return subregion
+
+    def __len__(self):
+        return len(self._load()[0])
+
+    #write a {zip: subregion} mapping out in the index file format
+    @staticmethod
+    def write(mapping, path):
+        zips = np.array([int(z) for z in mapping], dtype='<u4')
+        codes = np.array([subregion_codes.index(s) for s in mapping.values()], dtype=np.uint8)
+        order = np.argsort(zips)
+        with open(path, 'wb') as f:
+            f.write(zips[order].tobytes())
+            f.write(codes[order].tobytes())
+
+
+subregions = SubregionIndex(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'zip_subregions.bin'))
+
+#Emissions factors of every eGRID vintage in data/factors, one egrid<year>.csv per vintage with
+#kind (electricity or fuel), name and factor columns. The vintages are packed into one array per kind,
+#a row per vintage and a column per subregion or fuel. A data year uses the latest vintage up to it,
+#years before the first vintage use the first one.
+class FactorStore:
+    def __init__(self, path):
+        self._path = path
+        self._years = None
+        self._electricity = None
+        self._fuels = None
+
+    def _load(self):
+        if self._years is None:
+            frames = {}
+            for file in sorted(os.listdir(self._path)):
+                match = re.fullmatch(r'egrid(\d{4})\.csv', file)
+                if match is not None:
+                    frames[int(match.group(1))] = pd.read_csv(os.path.join(self._path, file))
+            if len(frames) == 0:
+                raise FileNotFoundError(f'No egrid<year>.csv factor files in {self._path}.')
+            table = pd.concat(frames, names=['year', 'row']).reset_index('year')
+            packed = {}
+            for kind, rows in table.groupby('kind'):
+                packed[kind] = rows.pivot(index='year', columns='name', values='factor').sort_index()
+            #a fuel missing from one vintage keeps its factor from the closest vintage that has it
+            packed['fuel'] = packed['fuel'].ffill().bfill()
+            self._electricity = packed['electricity']
+            self._fuels = packed['fuel']
+            self._years = self._electricity.index.to_numpy(dtype='int64')
+        return self._years
+
+    @property
+    def years(self):
+        return self._load()
+
+    @property
+    def latest(self):
+        return int(self._load()[-1])
+
+    #vintage of each data year, the latest vintage where the year is None
+    def vintages(self, years):
+        vintages = self._load()
+        years = np.array([self.latest if y is None else y for y in years], dtype='int64')
+        return vintages[np.maximum(np.searchsorted(vintages, years, side='right') - 1, 0)]
+
+    #years of data covered by each vintage, as first and last arrays. Open ended at both ends.
+    def coverage(self):
+        vintages = self._load()
+        first = np.r_[np.iinfo('int64').min // 2, vintages[1:]]
+        last = np.r_[vintages[1:] - 1, np.iinfo('int64').max // 2]
+        return first, last
+
+    #{subregion: lb CO2e/MMBtu of site electricity} of a vintage, the eGRID lb/MWh rate divided by 3.412,
+    #NaN where the vintage has no rate
+    def subregion_rates(self, vintage=None):
+        self._load()
+        return self._electricity.loc[self.latest if vintage is None else vintage].to_dict()
+
+    #{fuel: lb CO2e/MMBtu} of a vintage, the same unit as the electricity rates and the export
+    def fuel_factors(self, vintage=None):
+        self._load()
+        return self._fuels.loc[self.latest if vintage is None else vintage].to_dict()
+
+    #vectorized electricity rates for pairs of vintage and subregion, NaN for unknown subregions
+    def rates(self, vintages, subregions):
+        self._load()
+        rows = self._electricity.index.get_indexer(vintages)
+        columns = self._electricity.columns.get_indexer(pd.Index(subregions, dtype=object))
+        values = self._electricity.to_numpy()[rows, np.maximum(columns, 0)]
+        return np.where(columns >= 0, values, np.nan)
+
+
+factor_store = FactorStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'factors'))
+
+#subregion_rates and fuel_factors hold the latest vintage, for callers that don't pick one. They are
+#read on first use, so importing the module doesn't load the factor files.
+def __getattr__(name):
+    if name == 'subregion_rates':
+        return factor_store.subregion_rates()
+    if name == 'fuel_factors':
+        return factor_store.fuel_factors()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-fuel_factors = {
-    'Natural Gas': 116.65,
-    'Propane': 138.63,
-    'Fuel Oil (No. 2)': 163.45,
-    'Diesel': 163.45,
-    'District Steam': 116.65 / 0.7,
-    'District Hot Water': 116.65 / 0.7,
-    'District Chilled Water - Absorption': 116.65,
-    'District Chilled Water - Engine': 116.65
-}
 
 def new_note(original, addition):
     note = original
@@ -52,83 +178,171 @@ def new_note(original, addition):
     return note
 
 
-def get_factors(fuel_types, country, postal):
-    #fuel types in format {'E': [], 'G': []...}
-    #can be any of
-    #'Natural Gas'
-    #'Propane'
-    #'Fuel Oil (No. 2)'
-    #'Diesel'
-    #'District Steam'
-    #'District Hot Water'
-    #'Electric - Grid'
-    #'Electric - Solar'
-    #'Electric - Wind'
-    #'District Chilled Water - Electric'
-    #'District Chilled Water - Absorption'
-    #'District Chilled Water - Engine'
-    #'District Chilled Water - Other'
+#notes raised while picking factors, by note code
+note_messages = {
+    'zip_not_found': 'Zip code not found.',
+    'subregion_not_found': 'Electricity subregion  not found.',
+    'global_average': 'Used global average for electricity factor.',
+    'fuel_not_found': 'Fuel type {} not in database.'
+}
 
-    factors = {'E': None, 'G': None, 'S': None, 'C': None, 'notes': None}
+us_countries = ['United States', 'USA', 'US']
+
+#factors already worked out, keyed by (country, postal, fuel signature, vintage), oldest first.
+#Conversions run on several threads at once, so every read and write of it holds factor_cache_lock.
+factor_cache = OrderedDict()
+factor_cache_size = 65536
+factor_cache_lock = threading.Lock()
+
+
+#hashable version of a {'E': [], 'G': []...} fuel type dict, the order of fuels is kept
+def fuel_signature(fuel_types):
+    return tuple((t, tuple(fuel_types[t])) for t in sorted(fuel_types))
 
-    if country == "United States" or country == 'USA' or country == 'US':
-        if postal in subregions:
-            subregion = subregions[postal]
-            if subregion in subregion_rates:
-                factors['E'] = subregion_rates[subregion]
-            else:
-                factors['E'] = subregion_rates['National Average']
-                factors['notes'] = new_note(factors['notes'], 'Electricity subregion  not found.')
-        else:
-            factors['E'] = subregion_rates['National Average']
-            factors['notes'] = new_note(factors['notes'], 'Zip code not found.')
-    else:
-        factors['E'] = subregion_rates['Global Average']
-        factors['notes'] = new_note(factors['notes'], 'Used global average for electricity factor.')
 
-        
-    
+#G, S and C factors for a fuel signature once the electricity factor is known, with the fuel
+#factors of one vintage, the latest by default
+def get_fuel_factors(e, signature, fuel_factors=None):
+    fuel_factors = factor_store.fuel_factors() if fuel_factors is None else fuel_factors
+    fuel_types = dict(signature)
+    codes = []
+
     if 'G' in fuel_types:
         vals = [fuel_factors[f] for f in fuel_types['G'] if f in fuel_factors]
-        if len(vals) > 0:
-            factors['G'] = sum(vals) / len(vals)
-        else:
-            factors['G'] = fuel_factors['Natural Gas']
-        for fuel in fuel_types['G']:
-            if fuel not in fuel_factors:
-                factors['notes'] = new_note(factors['notes'], f'Fuel type {fuel} not in database.')
+        g = sum(vals) / len(vals) if len(vals) > 0 else fuel_factors['Natural Gas']
+        codes += [('fuel_not_found', f) for f in fuel_types['G'] if f not in fuel_factors]
     else:
-        factors['G'] = fuel_factors['Natural Gas']
+        g = fuel_factors['Natural Gas']
 
-    
     if 'S' in fuel_types:
         vals = [fuel_factors[f] for f in fuel_types['S'] if f in fuel_factors]
-        if len(vals) > 0:
-            factors['S'] = sum(vals) / len(vals)
-        else:
-            factors['S'] = fuel_factors['District Steam']
-        for fuel in fuel_types['S']:
-            if fuel not in fuel_factors:
-                factors['notes'] = new_note(factors['notes'], f'Fuel type {fuel} not in database.')
+        s = sum(vals) / len(vals) if len(vals) > 0 else fuel_factors['District Steam']
+        codes += [('fuel_not_found', f) for f in fuel_types['S'] if f not in fuel_factors]
     else:
-        factors['S'] = fuel_factors['District Steam']
-    
+        s = fuel_factors['District Steam']
+
     if 'C' in fuel_types:
         vals = []
         for f in fuel_types['C']:
-            if f == 'District Chilled Water - Electric':
-                vals.append(factors['E'] / 4.4)
+            if f == 'District Chilled Water - Electric' or f == 'District Chilled Water - Other':
+                vals.append(e / 4.4)
             elif f == 'District Chilled Water - Absorption' or f == 'District Chilled Water - Engine':
-                vals.append(factors['G'])
-            elif f == 'District Chilled Water - Other':
-                vals.append(factors['E'] / 4.4)
+                vals.append(g)
             else:
-                factors['notes'] = new_note(factors['notes'], f'Fuel type {fuel} not in database.')
-        if len(vals) > 0:
-            factors['C'] =  sum(vals) / len(vals)
-        else:
-            factors['C'] = factors['E'] / 4.4
+                codes.append(('fuel_not_found', f))
+        c = sum(vals) / len(vals) if len(vals) > 0 else e / 4.4
     else:
-        factors['C'] = factors['E'] / 4.4
+        c = e / 4.4
+
+    return g, s, c, codes
+
+
+#first and last data year of each fill year label (2022 or '2019-2022'), the latest vintage when
+#a label has no year
+def data_years(labels, count):
+    labels = pd.Series([None] * count if labels is None else list(labels), dtype=object)
+    parts = labels.map(lambda label: '' if label is None else str(label)).str.extract(r'^(\d{4})(?:-(\d{4}))?$')
+    first = pd.to_numeric(parts[0]).fillna(factor_store.latest).to_numpy(dtype='int64')
+    last = pd.to_numeric(parts[1]).fillna(pd.Series(first)).to_numpy(dtype='int64')
+    return first, last
+
+
+#E, G, S, C and note codes for distinct (country, postal, fuel signature, vintage) keys
+def resolve_factors(keys):
+    vintage = np.array([k[3] for k in keys], dtype='int64')
+    country = np.array([k[0] for k in keys], dtype=object)
+    subregion = subregions.lookup([k[1] for k in keys])
+    rate = factor_store.rates(vintage, subregion)
+    national = factor_store.rates(vintage, ['National Average'] * len(keys))
+    world = factor_store.rates(vintage, ['Global Average'] * len(keys))
+    in_us = np.isin(country, us_countries)
+    zip_found = subregion != None
+    conditions = [~in_us, ~zip_found, np.isnan(rate)]
+    e = np.select(conditions, [world, national, national], rate)
+    e_code = np.select(conditions, ['global_average', 'zip_not_found', 'subregion_not_found'], '')
+
+    fuels = {}
+    resolved = []
+    for i, key in enumerate(keys):
+        if key[3] not in fuels:
+            fuels[key[3]] = factor_store.fuel_factors(key[3])
+        g, s, c, codes = get_fuel_factors(e[i], key[2], fuels[key[3]])
+        if e_code[i] != '':
+            codes = [(e_code[i], None)] + codes
+        resolved.append((e[i], g, s, c, codes))
+    return resolved
+
+
+#resolve the factors for many buildings at once, one row per building with columns
+#E, G, S, C, notes and note_codes. years holds the fill year label of each building: a range such as
+#'2019-2022' is weighted by the years each eGRID vintage covers, no year uses the latest vintage.
+#Each distinct (country, postal, fuel signature, vintage) is only worked out once and kept in
+#factor_cache for later calls.
+def get_factors_batch(fuel_types, countries, postals, years=None):
+    base = [(country, postal, fuel_signature(f)) for f, country, postal in zip(fuel_types, countries, postals)]
+    first, last = data_years(years, len(base))
+    cover_first, cover_last = factor_store.coverage()
+    overlap = np.minimum(last[:, None], cover_last) - np.maximum(first[:, None], cover_first) + 1
+    weights = np.clip(overlap, 0, None).astype('float64')
+    weights[weights.sum(axis=1) == 0, -1] = 1
+    buildings, vintages = np.nonzero(weights)
+    shares = weights[buildings, vintages] / weights.sum(axis=1)[buildings]
+    keys = [(*base[b], int(factor_store.years[v])) for b, v in zip(buildings, vintages)]
 
-    return factors
\ No newline at end of file
+    resolved = {}
+    missing = []
+    with factor_cache_lock:
+        for key in dict.fromkeys(keys):
+            if key in factor_cache:
+                factor_cache.move_to_end(key)
+                resolved[key] = factor_cache[key]
+            else:
+                missing.append(key)
+    #worked out without the lock, another thread may store the same keys in the meantime
+    if len(missing) > 0:
+        resolved.update(zip(missing, resolve_factors(missing)))
+        with factor_cache_lock:
+            for key in missing:
+                factor_cache[key] = resolved[key]
+            while len(factor_cache) > factor_cache_size:
+                factor_cache.popitem(last=False)
+
+    #share weighted factors per building, the notes of the latest vintage it was given
+    values = np.array([resolved[key][:4] for key in keys], dtype='float64').reshape(-1, 4)
+    columns = {
+        name: np.bincount(buildings, shares * values[:, i], minlength=len(base))
+        for i, name in enumerate(['E', 'G', 'S', 'C'])
+    }
+    latest = np.r_[buildings[1:] != buildings[:-1], True] if len(buildings) > 0 else np.array([], dtype=bool)
+    codes = [resolved[key][4] for key, keep in zip(keys, latest) if keep]
+    notes = []
+    for building_codes in codes:
+        note = None
+        for code, detail in building_codes:
+            note = new_note(note, note_messages[code].format(detail))
+        notes.append(note)
+    return pd.DataFrame({
+        **columns,
+        'notes': pd.Series(notes, dtype=object),
+        'note_codes': pd.Series([tuple(code for code, detail in c) for c in codes], dtype=object)
+    })
+
+
+def get_factors(fuel_types, country, postal):
+    #fuel types in format {'E': [], 'G': []...}
+    #can be any of
+    #'Natural Gas'
+    #'Propane'
+    #'Fuel Oil (No. 2)'
+    #'Diesel'
+    #'District Steam'
+    #'District Hot Water'
+    #'Electric - Grid'
+    #'Electric - Solar'
+    #'Electric - Wind'
+    #'District Chilled Water - Electric'
+    #'District Chilled Water - Absorption'
+    #'District Chilled Water - Engine'
+    #'District Chilled Water - Other'
+    row = get_factors_batch([fuel_types], [country], [postal]).iloc[0]
+    return {'E': row['E'], 'G': row['G'], 'S': row['S'], 'C': row['C'], 'notes': row['notes']}
@@ -0,0 +1,2049 @@
+import io
+import sys
+import json
+import logging
+import time
+import tracemalloc
+import contextlib
+import itertools
+import zipfile
+import pandas as pd
+import numpy as np
+import datetime
+try:
+    import resource
+except ImportError:
+    resource = None
+from openpyxl import Workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from pandas.io.parsers import TextParser
+from emissions_factors import get_factors_batch
+
+
+logger = logging.getLogger('energy_star')
+
+
+
+
+#-------------------- UTILITY FUNCTIONS --------------------
+
+
+#https://portfoliomanager.energystar.gov/pdf/reference/Thermal%20Conversions.pdf
+conversions = {
+    'Area': {
+        'Sq. M.': {'Sq. Ft.': 10.76}
+    },
+    'Natural Gas': {
+        'ccf (hundred cubic feet)': {'kBtu (thousand Btu)': 102.6},
+        'cf (cubic feet)': {'kBtu (thousand Btu)': 1.026},
+        'cm (cubic meters)': {'kBtu (thousand Btu)': 36.303},
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'kcf (thousand cubic feet)': {'kBtu (thousand Btu)': 1026},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'Mcf (million cubic feet)': {'kBtu (thousand Btu)': 1026000},
+        'therms': {'kBtu (thousand Btu)': 100}
+    },
+    'Propane': {
+        'ccf (hundred cubic feet)': {'kBtu (thousand Btu)': 251.6},
+        'cf (cubic feet)': {'kBtu (thousand Btu)': 2.516},
+        'Gallons (UK)': {'kBtu (thousand Btu)': 110.484},
+        'Gallons (US)': {'kBtu (thousand Btu)': 92},
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'kcf (thousand cubic feet)': {'kBtu (thousand Btu)': 2516},
+        'Liters': {'kBtu (thousand Btu)': 24.304},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000}
+    },
+    'Fuel Oil (No. 2)': {
+        'Gallons (UK)': {'kBtu (thousand Btu)': 165.726},
+        'Gallons (US)': {'kBtu (thousand Btu)': 138},
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'Liters': {'kBtu (thousand Btu)': 36.456},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000}
+    },
+    'Diesel': {
+        'Gallons (UK)': {'kBtu (thousand Btu)': 165.726},
+        'Gallons (US)': {'kBtu (thousand Btu)': 138},
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'Liters': {'kBtu (thousand Btu)': 36.456},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000}
+    },
+    'District Steam': {
+        'kg (kilograms)': {'kBtu (thousand Btu)': 2.632},
+        'kLbs. (thousand pounds)': {'kBtu (thousand Btu)': 1194},
+        'Lbs. (pounds)': {'kBtu (thousand Btu)': 1.194},
+        'MLbs. (million pounds)': {'kBtu (thousand Btu)': 1194000},
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'therms': {'kBtu (thousand Btu)': 100}
+    },
+    'District Hot Water': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'therms': {'kBtu (thousand Btu)': 100}
+    },
+    'Electric - Grid': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'kWh (thousand Watt-hours)': {'kBtu (thousand Btu)': 3.412},
+        'MWh (million Watt-hours)': {'kBtu (thousand Btu)': 3412}
+    },
+    'Electric - Solar': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'kWh (thousand Watt-hours)': {'kBtu (thousand Btu)': 3.412},
+        'MWh (million Watt-hours)': {'kBtu (thousand Btu)': 3412}
+    },
+    'Electric - Wind': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'kWh (thousand Watt-hours)': {'kBtu (thousand Btu)': 3.412},
+        'MWh (million Watt-hours)': {'kBtu (thousand Btu)': 3412}
+    },
+    'District Chilled Water - Electric': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'ton hours': {'kBtu (thousand Btu)': 12.0}
+    },
+    'District Chilled Water - Absorption': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'ton hours': {'kBtu (thousand Btu)': 12.0}
+    },
+    'District Chilled Water - Engine': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'ton hours': {'kBtu (thousand Btu)': 12.0}
+    },
+    'District Chilled Water - Other': {
+        'GJ': {'kBtu (thousand Btu)': 947.817},
+        'MBtu/ MMBtu/ Dth (million Btu/ dekatherm)': {'kBtu (thousand Btu)': 1000},
+        'ton hours': {'kBtu (thousand Btu)': 12.0}
+    }
+}
+
+#the same factors flattened to (type, unit) -> factor to the one target unit of each type
+conversion_factors = pd.Series({
+    (t, a): factor
+    for t in conversions
+    for a in conversions[t]
+    for factor in conversions[t][a].values()
+}, dtype='float64')
+
+
+#meter types in the order of the output columns
+meter_types = ['E', 'G', 'S', 'C', 'R']
+
+#monthly output columns, E1-E12 through R1-R12
+month_columns = [f'{u}{m}' for u in meter_types for m in range(1, 13)]
+
+#number of columns in the Carbon Signal Inputs sheet
+excel_width = 78
+
+diagnostic_columns = ['code', 'meter', 'building', 'detail', 'rows', 'sample_rows']
+
+#what each diagnostic code means, in the building notes and the validation sheet
+diagnostic_labels = {
+    'unit': 'a unit that cannot be converted to kBtu',
+    'date': 'an unrecognized date',
+    'no_dates': 'no dates',
+    'amount': 'a missing or invalid amount',
+    'order': 'an end date before the start date'
+}
+
+
+#convert a whole column, returns the converted values and a mask of rows whose (type, unit) has no factor
+def convert_column(types, units, values, target):
+    keys = pd.MultiIndex.from_arrays([types, units])
+    factor = conversion_factors.reindex(keys).to_numpy()
+    factor[(units == target).to_numpy()] = 1.0
+    unconvertible = np.isnan(factor)
+    return values * factor, pd.Series(unconvertible, index=values.index)
+
+
+
+#traverses the Excel file and adds a Building for each property to the portfolio
+def get_buildings(workbook, portfolio=None):
+
+    if portfolio is None:
+        portfolio = Portfolio()
+
+    df_buildings = workbook.frame('Properties')
+
+    for ind in df_buildings.index:
+        building = Building(df_buildings['Property Name'][ind])
+        
+        address = df_buildings['Street Address'][ind]
+        if df_buildings['Street Address 2'][ind] != 'Not Available':
+            address += f', {df_buildings["Street Address 2"][ind]}'
+        building.address = address
+        
+        building.city = df_buildings['City/Municipality'][ind]
+        building.state = df_buildings['State/Province'][ind]
+        building.postal = df_buildings['Postal Code'][ind]
+        building.country = df_buildings['Country'][ind]
+        
+        if df_buildings['Parent Property Name (if Applicable)'][ind] != 'Not Available':
+            building.parent = df_buildings['Parent Property Name (if Applicable)'][ind]
+        
+        portfolio.add_building(building)
+    
+    df_uses = workbook.frame('Uses')
+
+    #whole numbers of the area unit, converted to Sq. Ft. in one lookup
+    area = pd.to_numeric(df_uses['Gross Floor Area for Use'], errors='coerce')
+    bad_area = area.isna()
+    area = np.trunc(area.fillna(0)).astype('int64')
+    area_units = df_uses['Gross Floor Area Units']
+    converted, unconvertible = convert_column(
+        pd.Series('Area', index=df_uses.index), area_units, area, 'Sq. Ft.'
+    )
+    areas = area.astype(object)
+    to_convert = (area_units != 'Sq. Ft.') & ~unconvertible
+    areas[to_convert] = converted[to_convert]
+
+    for ind in df_uses.index:
+        name = df_uses['Property Name'][ind]
+        building = portfolio.building(name)
+        
+        if building is None:
+            portfolio.report_unmatched('Uses', 'property', name)
+        else:
+            use_type = df_uses['Use Type'][ind]
+            if bad_area[ind]:
+                building.add_note(f'Unable to get area 0 from use type {use_type}.')
+            if unconvertible[ind]:
+                building.add_note(f'Unable to convert area unit {area_units[ind]} to Sq. Ft.')
+            
+            building.add_use([use_type, areas[ind]])
+    
+    return portfolio
+
+
+#traverses the Excel file, adds each supported Meter to the portfolio and attaches it to its building
+#resolution 'month' splits each entry straight into calendar months, 'day' keeps a row per day.
+#With chunk_rows the Meter Entries sheet is streamed in chunks that are folded into per meter and
+#period totals, so memory depends on the number of meters and periods rather than on the rows.
+#The row hashes of each chunk are appended to entry_hashes when a list is given, see fingerprint_buildings.
+def get_meters(workbook, portfolio, resolution='month', chunk_rows=None, entry_hashes=None):
+
+    df_meters = workbook.frame('Meters')
+
+    for ind in df_meters.index:
+        meter_type = df_meters['Meter Type'][ind]
+        if Meter.valid_meter(meter_type):
+            meter = Meter(df_meters['Portfolio Manager Meter ID'][ind])
+            meter.building_name = df_meters['Property Name'][ind]
+            meter.meter_type = meter_type
+            portfolio.add_meter(meter)
+        else:
+            portfolio.skip_meter(df_meters['Portfolio Manager Meter ID'][ind])
+    
+    first_row = workbook.first_row('Meter Entries')
+    if chunk_rows is None:
+        ingest_entries(workbook.frame('Meter Entries'), portfolio, resolution, first_row)
+    else:
+        owners = meter_owners(df_meters)
+        totals = None
+        for chunk in workbook.chunks('Meter Entries', chunk_rows):
+            spread = spread_entries(chunk, portfolio, resolution, first_row)
+            #a chunk with no entries of known meters adds nothing
+            if spread is not None:
+                totals = spread if totals is None else totals.add(spread, fill_value=0)
+            if entry_hashes is not None:
+                entry_hashes.append(sheet_hashes(chunk, 'Meter Entries', chunk['Portfolio Manager Meter ID'].map(owners)))
+        assign_entries(totals, portfolio)
+
+    for name, note in diagnostic_notes(portfolio.diagnostics).items():
+        building = portfolio.building(name)
+        if building is not None:
+            building.add_note(note)
+    portfolio.link_meters()
+    return portfolio
+
+
+#split a column of dates into timestamps and a mask of the cells that are recognized
+def parse_dates(col):
+    recognized = col.map(lambda v: isinstance(v, datetime.datetime)) & col.notna()
+    dates = pd.to_datetime(col.where(recognized), errors='coerce')
+    return dates, recognized
+
+
+#validate, convert and spread the whole Meter Entries sheet over days or months in one pass
+def ingest_entries(df_entries, portfolio, resolution='month', first_row=1):
+    assign_entries(spread_entries(df_entries, portfolio, resolution, first_row), portfolio)
+
+
+#hand each meter its kbtu totals from a Series indexed by (id, timestamp), in one append to the entry store
+def assign_entries(spread, portfolio):
+    if spread is None:
+        return
+    ids = spread.index.get_level_values('id')
+    codes = pd.Series({id: portfolio.meter(id).code for id in ids.unique()})
+    portfolio.entry_store.add(
+        codes[ids].to_numpy(),
+        spread.index.get_level_values('timestamp').to_numpy(),
+        spread.to_numpy(dtype='float64')
+    )
+
+
+#validate and convert entry rows and split them over days or months. Notes and unmatched rows are
+#recorded on the portfolio, the kbtu totals are returned indexed by (id, timestamp), or None.
+#first_row is the sheet row of the first entry, see entry_diagnostics.
+def spread_entries(df_entries, portfolio, resolution='month', first_row=1):
+    known = df_entries['Portfolio Manager Meter ID'].isin(portfolio.meter_ids)
+
+    #entries for meters that are neither in the Meters tab nor skipped for their type
+    skipped = df_entries['Portfolio Manager Meter ID'].isin(portfolio.skipped_meter_ids)
+    for id, rows in df_entries.loc[~known & ~skipped, 'Portfolio Manager Meter ID'].value_counts(sort=False).items():
+        portfolio.report_unmatched('Meter Entries', 'meter', id, rows)
+
+    df = df_entries[known]
+    if len(df) == 0:
+        return None
+
+    diagnostics, keep, begin, days, kbtu = validate_entries(df, portfolio, first_row)
+    portfolio.add_diagnostics(diagnostics)
+
+    ids = df['Portfolio Manager Meter ID']
+    days = days[keep].to_numpy(dtype='int64')
+    kbtu = kbtu[keep].fillna(0).to_numpy()
+    if resolution == 'day':
+        rows, timestamps, values = spread_days(begin[keep].to_numpy(), days, kbtu)
+    else:
+        rows, timestamps, values = apportion_months(begin[keep].to_numpy(), days, kbtu)
+
+    spread = pd.DataFrame({
+        'id': ids[keep].to_numpy()[rows],
+        'timestamp': timestamps,
+        'kbtu': values
+    })
+    return spread.groupby(['id', 'timestamp'])['kbtu'].sum()
+
+
+#column checks over entry rows of known meters. Returns the diagnostics, the mask of rows to keep and
+#the period start, length in days and kbtu amount of every row.
+def validate_entries(df, portfolio, first_row=1):
+    ids = df['Portfolio Manager Meter ID']
+    fuel = df['Meter Type']
+    units = df['Usage Units']
+    raw_amount = df['Usage/Quantity']
+    amount = pd.to_numeric(raw_amount, errors='coerce')
+    bad_amount = amount.isna() & raw_amount.notna()
+
+    kbtu, unconvertible = convert_column(fuel, units, amount, 'kBtu (thousand Btu)')
+
+    start, start_ok = parse_dates(df['Start Date'])
+    end, end_ok = parse_dates(df['End Date'])
+    delivery, delivery_ok = parse_dates(df['Delivery Date'])
+    start_na = df['Start Date'].eq('Not Available')
+    end_na = df['End Date'].eq('Not Available')
+    delivery_na = df['Delivery Date'].eq('Not Available')
+
+    #billing periods use start and end, otherwise fall back to whichever single date is present
+    begin = start.where(start_ok & end_ok, delivery.where(delivery_ok, end.where(end_ok, start)))
+    finish = end.where(start_ok & end_ok, begin)
+    days = (finish - begin) // pd.Timedelta(days=1) + 1
+
+    invalid = ~unconvertible & (
+        ~(start_ok | start_na) | ~(end_ok | end_na) | ~(delivery_ok | delivery_na)
+        | (start_na & end_na & delivery_na) | bad_amount | (days < 1)
+    )
+
+    #one diagnostic per problem, meter and detail instead of a note per failing row
+    bad_dates = [~(ok | na) for ok, na in [(start_ok, start_na), (end_ok, end_na), (delivery_ok, delivery_na)]]
+    checks = [
+        ('unit', unconvertible, fuel + ' in ' + units),
+        *[('date', bad & ~unconvertible, col) for col, bad in zip(['Start Date', 'End Date', 'Delivery Date'], bad_dates)],
+        ('no_dates', start_na & end_na & delivery_na & ~unconvertible, None),
+        ('amount', bad_amount & ~unconvertible, None),
+        ('order', invalid & (days < 1) & ~np.logical_or.reduce(bad_dates) & ~bad_amount, None)
+    ]
+    return entry_diagnostics(ids, checks, portfolio, first_row), ~(unconvertible | invalid), begin, days, kbtu
+
+
+#(code, meter, detail, rows, sample_rows) for every check mask over a frame of entries, where detail is a
+#Series of text, a single text or None. Sample rows are the first three failing rows, numbered as in the
+#file: first_row is the row number of the entry at index 0, e.g. the Excel row below the header.
+def entry_diagnostics(ids, checks, portfolio, first_row=1):
+    frames = []
+    for code, mask, detail in checks:
+        if not mask.any():
+            continue
+        frames.append(pd.DataFrame({
+            'code': code,
+            'meter': ids[mask],
+            'detail': detail[mask] if isinstance(detail, pd.Series) else detail,
+            'row': ids.index[mask] + first_row
+        }))
+    if len(frames) == 0:
+        return None
+    failed = pd.concat(frames, ignore_index=True)
+    failed['detail'] = failed['detail'].astype(object).where(failed['detail'].notna(), '')
+    keys = ['code', 'meter', 'detail']
+    diagnostics = failed.groupby(keys, sort=False).size().rename('rows').to_frame()
+    diagnostics['sample_rows'] = failed.groupby(keys, sort=False).head(3).groupby(keys, sort=False)['row'].agg(list)
+    diagnostics = diagnostics.reset_index()
+    owners = {id: portfolio.meter(id).building_name for id in diagnostics['meter'].unique()}
+    diagnostics.insert(2, 'building', diagnostics['meter'].map(owners))
+    return diagnostics
+
+
+#one short note per building summing its diagnostics by problem, the rows are in the validation sheet
+def diagnostic_notes(diagnostics, skipped='Meter entries'):
+    notes = {}
+    if len(diagnostics) == 0:
+        return notes
+    rows = diagnostics.groupby(['building', 'code'], sort=False)['rows'].sum()
+    for building, counts in rows.groupby(level='building', sort=False):
+        counts = counts.droplevel('building')
+        summary = ', '.join(f'{counts[code]} with {label}' for code, label in diagnostic_labels.items() if code in counts)
+        notes[building] = f'{skipped} skipped: {summary}. See the validation sheet.'
+    return notes
+
+
+#repeat every period once per day and step the dates forward, the amount is split evenly over the days
+def spread_days(begin, days, amount):
+    rows = np.repeat(np.arange(len(days)), days)
+    offsets = np.arange(days.sum()) - np.repeat(np.cumsum(days) - days, days)
+    timestamps = begin[rows] + offsets.astype('timedelta64[D]')
+    return rows, timestamps, (amount / days)[rows]
+
+
+#split every period over the calendar months it overlaps, in proportion to the days in each month.
+#gives the same monthly totals as spread_days without making a row per day.
+def apportion_months(begin, days, amount):
+    first_day = begin.astype('datetime64[D]')
+    last_day = first_day + (days - 1).astype('timedelta64[D]')
+    first_month = first_day.astype('datetime64[M]')
+    months = (last_day.astype('datetime64[M]') - first_month).astype('int64') + 1
+
+    rows = np.repeat(np.arange(len(days)), months)
+    offsets = np.arange(months.sum()) - np.repeat(np.cumsum(months) - months, months)
+    month_start = first_month[rows] + offsets.astype('timedelta64[M]')
+    next_month = (month_start + np.timedelta64(1, 'M')).astype('datetime64[D]')
+    month_start = month_start.astype('datetime64[D]')
+
+    overlap = np.minimum(last_day[rows] + 1, next_month) - np.maximum(first_day[rows], month_start)
+    values = amount[rows] * overlap.astype('int64') / days[rows]
+    return rows, month_start.astype('datetime64[ns]'), values
+
+
+#interval readings, a CSV or Parquet file with a row per reading stamped with the time it starts
+interval_columns = ['Portfolio Manager Meter ID', 'Timestamp', 'Usage/Quantity', 'Usage Units']
+
+
+#the readings of an interval file in frames of up to chunk_rows rows, numbered on across chunks.
+#Meter ids and units are read as categories, so a chunk holds one small code per reading instead of two strings.
+def interval_chunks(source, chunk_rows=1000000):
+    id_column, unit_column = interval_columns[0], interval_columns[3]
+    if str(source).endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        #batches stop at row group ends, so small row groups are gathered up to chunk_rows
+        def chunks():
+            start = 0
+            batches = []
+            file = pq.ParquetFile(source, read_dictionary=[id_column, unit_column])
+            for batch in itertools.chain(file.iter_batches(batch_size=chunk_rows, columns=interval_columns), [None]):
+                if batch is not None:
+                    batches.append(batch)
+                rows = sum(len(b) for b in batches)
+                if rows > 0 and (batch is None or rows >= chunk_rows):
+                    df = pa.Table.from_batches(batches).to_pandas()
+                    df.index = pd.RangeIndex(start, start + rows)
+                    start += rows
+                    batches = []
+                    yield df
+        frames = chunks()
+    else:
+        frames = pd.read_csv(
+            source,
+            usecols=interval_columns,
+            dtype={id_column: 'category', unit_column: 'category'},
+            na_values={'Usage/Quantity': ['Not Available']},
+            chunksize=chunk_rows
+        )
+    for df in frames:
+        for column in [id_column, unit_column]:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype(str).astype('category')
+            df[column] = df[column].cat.rename_categories(df[column].cat.categories.astype(str))
+        yield df
+
+
+#add interval readings straight to the entry store as daily or monthly kBtu sums. Each chunk is bucketed
+#with integer keys (meter * periods + period) and np.bincount, units are converted with one factor per
+#(meter, unit) pair, so no frame or date range is made per reading. Returns the number of readings.
+def ingest_intervals(source, portfolio, resolution='month', chunk_rows=1000000):
+    readings = 0
+    merged = Portfolio()
+    unit = 'datetime64[D]' if resolution == 'day' else 'datetime64[M]'
+    #CSV rows are numbered by line, below the header line
+    first_row = 1 if str(source).endswith('.parquet') else 2
+    for df in interval_chunks(source, chunk_rows):
+        readings += len(df)
+        ids = df['Portfolio Manager Meter ID']
+        known = ids.isin(portfolio.meter_ids)
+        skipped = ids.isin(portfolio.skipped_meter_ids)
+        for id, rows in ids[~known & ~skipped].value_counts(sort=False).items():
+            if rows > 0:
+                portfolio.report_unmatched('Intervals', 'meter', id, rows)
+        if not known.all():
+            df, ids = df[known], ids[known]
+        if len(df) == 0:
+            continue
+
+        timestamps = df['Timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, format='ISO8601', errors='coerce')
+        amount = pd.to_numeric(df['Usage/Quantity'], errors='coerce')
+        id_codes, id_values = pd.factorize(ids)
+        unit_codes, unit_values = pd.factorize(df['Usage Units'])
+        meters = [portfolio.meter(id) for id in id_values]
+
+        #one conversion factor per (meter, unit) pair instead of one lookup per reading
+        fuels = pd.Series([meter.meter_fuel for meter in meters]).repeat(max(len(unit_values), 1)).reset_index(drop=True)
+        units = pd.Series(np.tile(np.asarray(unit_values, dtype=object), len(meters)))
+        factors, unconvertible = convert_column(fuels, units, pd.Series(np.ones(len(units))), 'kBtu (thousand Btu)')
+        pairs = np.where(unit_codes < 0, len(units), id_codes * len(unit_values) + unit_codes)
+        factor = np.append(factors.to_numpy(), np.nan)[pairs]
+
+        bad_time = timestamps.isna().to_numpy()
+        bad_amount = amount.isna().to_numpy() & ~bad_time
+        bad_unit = np.isnan(factor) & ~bad_time & ~bad_amount
+        if bad_time.any() or bad_amount.any() or bad_unit.any():
+            labels = fuels.astype(object) + ' in ' + units.astype(object)
+            checks = [
+                ('unit', bad_unit, pd.Series(np.append(labels.to_numpy(), 'no unit')[pairs], index=ids.index)),
+                ('date', bad_time, 'Timestamp'),
+                ('amount', bad_amount, None)
+            ]
+            checks = [(code, pd.Series(mask, index=ids.index), detail) for code, mask, detail in checks]
+            merged.add_diagnostics(entry_diagnostics(ids.astype(str), checks, portfolio, first_row))
+
+        ok = ~(bad_time | bad_amount | bad_unit)
+        periods = timestamps.to_numpy()[ok].astype(unit).astype('int64')
+        if len(periods) == 0:
+            continue
+        first = periods.min()
+        span = periods.max() - first + 1
+        keys = id_codes[ok].astype('int64') * span + (periods - first)
+        kbtu = amount.to_numpy(dtype='float64')[ok] * factor[ok]
+        #a dense count per (meter, period) when that's no bigger than the chunk, sorted keys otherwise
+        if len(meters) * span <= len(keys) + 1000000:
+            counts = np.bincount(keys, minlength=len(meters) * span)
+            groups = np.flatnonzero(counts)
+            sums = np.bincount(keys, kbtu, minlength=len(meters) * span)[groups]
+        else:
+            groups, inverse = np.unique(keys, return_inverse=True)
+            sums = np.bincount(inverse, kbtu)
+        positions, offsets = np.divmod(groups, span)
+        codes = np.array([meter.code for meter in meters], dtype='int32')
+        portfolio.entry_store.add(codes[positions], (offsets + first).astype(unit).astype('datetime64[ns]'), sums)
+
+    if len(merged.diagnostics) > 0:
+        portfolio.add_diagnostics(merged.diagnostics)
+        for name, note in diagnostic_notes(merged.diagnostics, 'Interval readings').items():
+            building = portfolio.building(name)
+            if building is not None:
+                building.add_note(note)
+    return readings
+
+
+#sum the entries of every meter in the buildings into one kBtu series indexed by (building, type, year, month).
+#Entries are grouped by integer codes, the rank of the building's name and of its meter type, and the
+#names are only put back on the summed rows. Ranks keep the rows in the same order as grouping by name.
+def build_monthly_cube(buildings):
+    building_codes, building_names = pd.factorize(pd.Index([b.name for b in buildings], dtype=object), sort=True)
+    type_names = sorted(meter_types)
+    codes = []
+    types = []
+    timestamps = []
+    values = []
+    for building, code in zip(buildings, building_codes):
+        if code < 0:
+            continue
+        for meter in building.meters:
+            meter_timestamps, kbtu = meter.timestamps, meter.kbtu
+            if len(kbtu) >= 1:
+                codes.append(np.full(len(kbtu), code, dtype='int32'))
+                types.append(np.full(len(kbtu), type_names.index(meter.meter_type), dtype='int8'))
+                timestamps.append(meter_timestamps)
+                values.append(kbtu)
+
+    if len(values) == 0:
+        index = pd.MultiIndex.from_arrays([[], [], [], []], names=['building', 'type', 'year', 'month'])
+        return pd.Series([], index=index, dtype='float64', name='kbtu')
+
+    dates = pd.DatetimeIndex(np.concatenate(timestamps))
+    df = pd.DataFrame({
+        'building': np.concatenate(codes),
+        'type': np.concatenate(types),
+        'year': dates.year,
+        'month': dates.month,
+        'kbtu': np.concatenate(values)
+    })
+    cube = df.groupby(['building', 'type', 'year', 'month'])['kbtu'].sum()
+    index = cube.index
+    cube.index = pd.MultiIndex.from_arrays([
+        building_names.take(index.get_level_values('building')),
+        pd.Index(type_names, dtype=object).take(index.get_level_values('type')),
+        index.get_level_values('year'),
+        index.get_level_values('month')
+    ], names=['building', 'type', 'year', 'month'])
+    return cube
+
+
+#the part of the portfolio cube for one building, or a new cube of just its meters
+def cube_slice(cube, building):
+    if cube is None:
+        return build_monthly_cube([building])
+    return cube[cube.index.get_level_values('building') == building.name]
+
+
+#label for the years values were taken from: the year when there is one value, otherwise 'first-last'
+def year_labels(first, last, count):
+    labels = first.astype(str) + '-' + last.astype(str)
+    labels = labels.astype(object)
+    labels[count == 1] = first[count == 1]
+    labels[count == 0] = ''
+    return labels
+
+
+#Blend for every building and meter type in a cube at once. Returns a frame indexed by building
+#with a column per filled month (e.g. 'G3', NaN where there was no data) and the year label.
+def fill_blend(cube):
+    nz = cube[cube > 0].reset_index()
+    by_year = ['building', 'type', 'year']
+    by_type = ['building', 'type']
+    by_month = ['building', 'type', 'month']
+
+    #see how many years there are with less than 4 months of data, which might indicate deliveries
+    months_in_year = nz.groupby(by_year)['kbtu'].transform('size')
+    first_of_year = ~nz.duplicated(by_year)
+    years = first_of_year.groupby([nz['building'], nz['type']]).transform('sum')
+    delivery_years = (first_of_year & (months_in_year <= 4)).groupby([nz['building'], nz['type']]).transform('sum')
+
+    #if this is a trend, smooth out the values over the course of a year
+    smooth = delivery_years / years >= 0.5
+    nz['kbtu'] = nz['kbtu'].where(~smooth, nz.groupby(by_year)['kbtu'].transform('sum') / 12)
+
+    #remove values more than one standard deviation from the mean of their month, a month
+    #with a single value keeps it and a month where every value would go keeps them all
+    grouped = nz.groupby(by_month)['kbtu']
+    count = grouped.transform('size')
+    keep = (count == 1) | ((nz['kbtu'] - grouped.transform('mean')).abs() < grouped.transform('std'))
+    keep = keep | ~keep.groupby([nz[c] for c in by_month]).transform('any')
+    kept = nz[keep].sort_values(by_month + ['year'])
+
+    #grab the last 5 years of each month and take an average
+    kept = kept[kept.groupby(by_month).cumcount(ascending=False) < 5]
+    means = kept.groupby(by_month)['kbtu'].mean().reset_index()
+    means['key'] = means['type'] + means['month'].astype(str)
+    blended = means.pivot(index='building', columns='key', values='kbtu')
+
+    years = kept.groupby('building')['year'].agg(['min', 'max', 'size'])
+    blended['year'] = year_labels(years['min'], years['max'], years['size'])
+    return blended
+
+
+#Complete for every building and meter type in a cube at once: the calendar year with the most
+#months of data for each meter type. Same frame layout as fill_blend.
+def fill_complete(cube):
+    nz = cube[cube > 0].reset_index()
+    counts = nz.groupby(['building', 'type', 'year']).size().rename('count').reset_index()
+    #the year with the most complete entries, the latest one on a tie
+    best = counts.sort_values(['building', 'type', 'count', 'year']).drop_duplicates(['building', 'type'], keep='last')
+
+    values = cube.reset_index().merge(best[['building', 'type', 'year']], on=['building', 'type', 'year'])
+    values['key'] = values['type'] + values['month'].astype(str)
+    completed = values.pivot(index='building', columns='key', values='kbtu')
+
+    years = best.groupby('building')['year'].agg(['min', 'max', 'size'])
+    completed['year'] = year_labels(years['min'], years['max'], years['size'])
+    return completed
+
+
+#Latest for every building in a cube at once: the months of one calendar year
+def fill_latest(cube, year):
+    values = cube[cube.index.get_level_values('year') == year].reset_index()
+    values['key'] = values['type'] + values['month'].astype(str)
+    latest = values.pivot(index='building', columns='key', values='kbtu')
+    latest['year'] = year
+    return latest
+
+
+#the filled frame for one method, Latest uses the last calendar year unless another is given
+def fill_table(cube, method='Blend', year=None):
+    if method == 'Latest':
+        return fill_latest(cube, datetime.date.today().year - 1 if year is None else year)
+    elif method == 'Complete':
+        return fill_complete(cube)
+    return fill_blend(cube)
+
+
+#the cube split into chunks of whole buildings. Each chunk is a plain Series, so it pickles as a few
+#arrays instead of Building and Meter objects.
+def cube_chunks(cube, chunk_size=1000):
+    codes = pd.factorize(cube.index.get_level_values('building'), sort=True)[0]
+    return [chunk for _, chunk in cube.groupby(codes // chunk_size, sort=True)]
+
+
+#fill_table over chunks of buildings on a process pool, the same frame as fill_table on the whole cube.
+#Without a pool the cube is filled in this process.
+def fill_table_parallel(cube, method='Blend', year=None, pool=None, chunk_size=1000):
+    chunks = cube_chunks(cube, chunk_size)
+    if pool is None or len(chunks) <= 1:
+        return fill_table(cube, method, year)
+    tables = list(pool.map(fill_table, chunks, itertools.repeat(method), itertools.repeat(year)))
+    return pd.concat(tables).reindex(columns=[*month_columns, 'year'])
+
+
+#E1-R12 and year entries for each building from a filled frame
+#has_meters overrides whether each building counts as metered, e.g. a parent whose children have meters
+def fill_entries(buildings, table, method='Blend', year=None, has_meters=None):
+    names = [b.name for b in buildings]
+    values = table.reindex(index=names, columns=month_columns).astype(float).fillna(0)
+    labels = table['year'].reindex(names).astype(object)
+
+    #buildings with meters but no usable data still get a year (Latest) or an empty one (Complete)
+    if has_meters is None:
+        has_meters = np.array([len(b.meters) > 0 for b in buildings], dtype=bool)
+    if method == 'Latest':
+        labels[:] = datetime.date.today().year - 1 if year is None else year
+    elif method == 'Complete':
+        labels[labels.isna()] = ''
+    labels[~has_meters | labels.isna().to_numpy()] = None
+    labels = [int(y) if isinstance(y, float) else y for y in labels]
+
+    entries = values.to_dict('records')
+    for entry, label in zip(entries, labels):
+        entry['year'] = label
+    return entries
+
+
+#compile the monthly data and fill in missing data according to different methods
+def compile_building_data(building, method='Blend', cube=None, year=None):
+    table = fill_table(cube_slice(cube, building), method, year)
+    return fill_entries([building], table, method, year)[0]
+
+
+#build the output records of every building with one fill method. Blend and Complete come from the
+#frames made in process_workbook, Latest is a single slice of the cube for the chosen year.
+#rollup 'parents' gives one row per top level property holding the totals of all its children,
+#'all' keeps every row and gives each parent the totals of its children, see rollup_portfolio.
+def compile_records(portfolio, method='Blend', year=None, pool=None, chunk_size=1000, rollup=None):
+    buildings = portfolio.buildings
+    if method in portfolio.filled:
+        table = portfolio.filled[method]
+    else:
+        table = fill_table_parallel(portfolio.cube, method, year, pool, chunk_size)
+
+    areas = [b.area_ft2 for b in buildings]
+    uses = [b.primary_use for b in buildings]
+    fuel_types = [b.fuel_types for b in buildings]
+    rolled_notes = [None] * len(buildings)
+    has_meters = None
+    keep = None
+    if rollup is not None:
+        tree, rolled = rollup_portfolio(portfolio)
+        parents = tree.index[tree['children'] > 0]
+        table = pd.concat([
+            table[~table.index.isin(buildings[i].name for i in parents)],
+            fill_table_parallel(rolled, method, year, pool, chunk_size)
+        ])
+        has_meters = tree['meters'].to_numpy() > 0
+        for i in parents:
+            areas[i] = tree.at[i, 'area_ft2']
+            uses[i] = tree.at[i, 'primary_use']
+            fuel_types[i] = tree.at[i, 'fuel_types']
+            count = tree.at[i, 'descendants']
+            rolled_notes[i] = f'Totals include {count} child {"property" if count == 1 else "properties"}.'
+        if rollup == 'parents':
+            keep = (tree['parent'] < 0).to_numpy()
+
+    records = fill_entries(buildings, table, method, year, has_meters)
+    #factors of the eGRID vintages covering the years each record's data comes from, with the notes
+    #of the vintage they were taken from. A rolled up parent gets them for the fuels of its whole subtree.
+    factors = get_factors_batch(
+        fuel_types,
+        [b.country for b in buildings],
+        [b.postal for b in buildings],
+        [output['year'] for output in records]
+    )
+    for building, factors, output, area, use, rolled_note in zip(buildings, factors.to_dict('records'), records, areas, uses, rolled_notes):
+        note = '; '.join(n for n in [building.notes, factors['notes'], rolled_note] if n is not None) or None
+        output['building_name'] = building.name
+        output['area_ft2'] = area
+        output['buliding_type'] = use
+        output['address'] = building.address
+        output['city'] = building.city
+        output['state'] = building.state
+        output['country'] = building.country
+        output['zip'] = building.postal
+        output['notes'] = note
+        output['emissions_electricity'] = factors['E']
+        output['emissions_gas'] = factors['G']
+        output['emissions_district_heating'] = factors['S']
+        output['emissions_district_cooling'] = factors['C']
+    if keep is not None:
+        records = [output for output, kept in zip(records, keep) if kept]
+    return records
+
+
+#position of the parent of every building, -1 for top level ones. A parent that isn't in the export,
+#a repeated property name and the link that would close a loop are left out, so the result is a forest.
+def parent_positions(buildings):
+    first = {}
+    for i, building in enumerate(buildings):
+        first.setdefault(building.name, i)
+    parents = np.full(len(buildings), -1, dtype='int64')
+    for i, building in enumerate(buildings):
+        p = first.get(building.parent, -1)
+        if first[building.name] == i and p != i:
+            parents[i] = p
+
+    #follow each chain of parents once, a chain that runs into itself is cut where it does
+    state = np.zeros(len(buildings), dtype='int8')
+    for i in range(len(buildings)):
+        path = []
+        node = i
+        while node >= 0 and state[node] == 0:
+            state[node] = 1
+            path.append(node)
+            node = parents[node]
+        if node >= 0 and state[node] == 1:
+            parents[path[-1]] = -1
+        state[path] = 2
+    return parents
+
+
+#every building's subtree totals in one pass. The parent index is built once, the buildings are put in
+#preorder and then visited in reverse, so each one adds its monthly kBtu, area and meters to its parent
+#after all of its children did. Returns a frame by building position (parent, children, descendants,
+#meters, area_ft2, primary_use, fuel_types) and the cube of every parent's totals under the parent's name.
+def rollup_portfolio(portfolio):
+    buildings = portfolio.buildings
+    parents = parent_positions(buildings)
+    children = [[] for b in buildings]
+    for i, p in enumerate(parents):
+        if p >= 0:
+            children[p].append(i)
+
+    order = []
+    stack = [i for i in range(len(buildings)) if parents[i] < 0 and len(children[i]) > 0][::-1]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(reversed(children[node]))
+
+    #dense rows for the buildings in a hierarchy only, one column per (type, year, month) in their cube
+    position = pd.Series(np.arange(len(order)), index=[buildings[i].name for i in order])
+    cube = portfolio.cube[portfolio.cube.index.get_level_values('building').isin(position.index)]
+    rows = position[cube.index.get_level_values('building')].to_numpy()
+    #one integer per (type, year, month) from the level codes, cheaper than factorizing tuples
+    levels = cube.index.levels[1:]
+    level_codes = [c.astype('int64') for c in cube.index.codes[1:]]
+    combined = (level_codes[0] * len(levels[1]) + level_codes[1]) * len(levels[2]) + level_codes[2]
+    columns, keys = np.unique(combined, return_inverse=True)
+    kbtu = np.zeros((len(order), len(columns)))
+    present = np.zeros((len(order), len(columns)), dtype=bool)
+    kbtu[rows, keys] = cube.to_numpy()
+    present[rows, keys] = True
+
+    use_types = {}
+    use_areas = np.zeros((len(order), len({u[0] for i in order for u in buildings[i].uses})))
+    for row, i in enumerate(order):
+        for use, area in buildings[i].uses:
+            use_areas[row, use_types.setdefault(use, len(use_types))] += area
+    #object so whole square feet stay ints, the same as Building.area_ft2
+    area_ft2 = np.array([buildings[i].area_ft2 for i in order] + [None], dtype=object)[:-1]
+    meters = np.array([len(buildings[i].meters) for i in order], dtype='int64')
+    descendants = np.zeros(len(order), dtype='int64')
+    #meter fuels of each meter type, one entry per meter the same as Building.fuel_types
+    fuels = [{t: list(f) for t, f in buildings[i].fuel_types.items()} for i in order]
+
+    row_of = dict(zip(order, range(len(order))))
+    for row in range(len(order) - 1, -1, -1):
+        p = parents[order[row]]
+        if p < 0:
+            continue
+        up = row_of[p]
+        kbtu[up] += kbtu[row]
+        present[up] |= present[row]
+        use_areas[up] += use_areas[row]
+        area_ft2[up] += area_ft2[row]
+        meters[up] += meters[row]
+        descendants[up] += descendants[row] + 1
+        for meter_type, meter_fuels in fuels[row].items():
+            fuels[up].setdefault(meter_type, []).extend(meter_fuels)
+
+    subtree_descendants = np.zeros(len(buildings), dtype='int64')
+    subtree_meters = np.array([len(b.meters) for b in buildings], dtype='int64')
+    subtree_area = [b.area_ft2 for b in buildings]
+    subtree_use = [b.primary_use for b in buildings]
+    subtree_fuels = [b.fuel_types for b in buildings]
+    use_names = list(use_types)
+    for row, i in enumerate(order):
+        if len(children[i]) > 0:
+            subtree_descendants[i] = descendants[row]
+            subtree_meters[i] = meters[row]
+            subtree_area[i] = area_ft2[row]
+            subtree_fuels[i] = fuels[row]
+            if len(use_names) > 0 and use_areas[row].max() > 0:
+                subtree_use[i] = use_names[use_areas[row].argmax()]
+    tree = pd.DataFrame({
+        'parent': parents,
+        'children': [len(c) for c in children],
+        'descendants': subtree_descendants,
+        'meters': subtree_meters,
+        'area_ft2': pd.Series(subtree_area, dtype=object),
+        'primary_use': pd.Series(subtree_use, dtype=object),
+        'fuel_types': pd.Series(subtree_fuels, dtype=object)
+    })
+
+    #only the parents' rows, the cube of everyone else is unchanged
+    if len(order) == 0:
+        return tree, portfolio.cube.iloc[:0]
+    parent_rows = np.array([row for row, i in enumerate(order) if len(children[i]) > 0], dtype='int64')
+    hit_rows, hit_keys = np.nonzero(present[parent_rows])
+    index = pd.MultiIndex.from_arrays(
+        [
+            np.array([buildings[order[r]].name for r in parent_rows], dtype=object)[hit_rows],
+            levels[0][columns[hit_keys] // (len(levels[1]) * len(levels[2]))],
+            levels[1][columns[hit_keys] // len(levels[2]) % len(levels[1])],
+            levels[2][columns[hit_keys] % len(levels[2])]
+        ],
+        names=['building', 'type', 'year', 'month']
+    )
+    rolled = pd.Series(kbtu[parent_rows[hit_rows], hit_keys], index=index, name='kbtu').sort_index()
+    return tree, rolled
+
+
+#everything that doesn't depend on the fill method, done once per upload. With the portfolio from
+#a previous run of the same export, only buildings whose rows changed are processed again.
+#Stage timings are kept on the portfolio. Given a process pool, the fill methods run on chunks of
+#chunk_size buildings across its workers.
+#intervals is an optional interval data file for the meters of the export, see ingest_intervals.
+#It isn't part of the fingerprints, so a portfolio with interval data is never reused.
+def process_workbook(filepath, previous=None, timer=None, pool=None, chunk_size=1000, chunk_rows=None, intervals=None):
+    timer = StageTimer() if timer is None else timer
+    if chunk_rows is not None:
+        return stream_workbook(filepath, timer, pool, chunk_size, chunk_rows, intervals)
+    with timer.stage('load') as stage:
+        workbook = PortfolioWorkbook(filepath)
+        stage['rows'] = sum(len(df) for df in workbook.frames().values())
+    if intervals is not None:
+        portfolio = process_frames(workbook, timer, pool, chunk_size, intervals=intervals)
+        portfolio.stages = timer.stages
+        return portfolio
+    with timer.stage('fingerprint') as stage:
+        fingerprints = fingerprint_buildings(workbook)
+        stage['rows'] = len(fingerprints)
+    if previous is not None and previous.fingerprints is not None:
+        portfolio = reprocess_workbook(workbook, fingerprints, previous, timer, pool, chunk_size)
+    else:
+        portfolio = process_frames(workbook, timer, pool, chunk_size)
+    portfolio.fingerprints = fingerprints
+    portfolio.stages = timer.stages
+    return portfolio
+
+
+#Meter Entries rows are read in chunks of chunk_rows while they are ingested, for sheets too large to
+#hold in memory. The whole sheet is never in memory, so there is no previous run to compare it with.
+def stream_workbook(filepath, timer=None, pool=None, chunk_size=1000, chunk_rows=100000, intervals=None):
+    timer = StageTimer() if timer is None else timer
+    with timer.stage('load') as stage:
+        workbook = PortfolioWorkbook(filepath)
+        stage['rows'] = sum(len(workbook.frame(sheet)) for sheet in ['Properties', 'Uses', 'Meters'])
+    entry_hashes = []
+    portfolio = process_frames(workbook, timer, pool, chunk_size, chunk_rows, entry_hashes, intervals)
+    if intervals is None:
+        with timer.stage('fingerprint') as stage:
+            portfolio.fingerprints = fingerprint_buildings(workbook, entry_hashes)
+            stage['rows'] = len(portfolio.fingerprints)
+    portfolio.stages = timer.stages
+    return portfolio
+
+
+def process_frames(workbook, timer=None, pool=None, chunk_size=1000, chunk_rows=None, entry_hashes=None, intervals=None):
+    timer = StageTimer() if timer is None else timer
+    with timer.stage('buildings') as stage:
+        portfolio = get_buildings(workbook)
+        stage['rows'] = len(portfolio.buildings)
+    with timer.stage('meters') as stage:
+        get_meters(workbook, portfolio, chunk_rows=chunk_rows, entry_hashes=entry_hashes)
+        stage['rows'] = workbook.rows('Meter Entries')
+    if intervals is not None:
+        with timer.stage('intervals') as stage:
+            stage['rows'] = ingest_intervals(intervals, portfolio)
+
+    buildings = portfolio.buildings
+    with timer.stage('cube') as stage:
+        portfolio.cube = build_monthly_cube(buildings)
+        stage['rows'] = len(portfolio.cube)
+    with timer.stage('fill') as stage:
+        fill_portfolio(portfolio, pool, chunk_size)
+        stage['rows'] = len(buildings)
+    return portfolio
+
+
+#the property owning each meter id, the first one listed when an id repeats
+def meter_owners(df_meters):
+    return df_meters.drop_duplicates('Portfolio Manager Meter ID').set_index('Portfolio Manager Meter ID')['Property Name']
+
+
+#row hashes of a sheet summed by the property name each row belongs to. Values are hashed as text,
+#object columns otherwise hash differently when every value in them happens to be a date.
+def sheet_hashes(frame, sheet, names):
+    rows = pd.util.hash_pandas_object(frame.astype(str).assign(sheet=sheet), index=False)
+    return pd.Series(rows.to_numpy(), index=names.to_numpy()).groupby(level=0).sum()
+
+
+#one hash per property name over its Properties, Uses and Meters rows and the entries of its meters.
+#Row hashes are summed, so a building's fingerprint doesn't depend on where its rows sit in the sheets,
+#and the entries can be hashed chunk by chunk while they are streamed (entry_hashes).
+def fingerprint_buildings(workbook, entry_hashes=None):
+    frames = {sheet: workbook.frame(sheet) for sheet in ['Properties', 'Uses', 'Meters']}
+    hashes = [sheet_hashes(frame, sheet, frame['Property Name']) for sheet, frame in frames.items()]
+    if entry_hashes is None:
+        entries = workbook.frame('Meter Entries')
+        owners = meter_owners(frames['Meters'])
+        hashes.append(sheet_hashes(entries, 'Meter Entries', entries['Portfolio Manager Meter ID'].map(owners)))
+    else:
+        hashes += entry_hashes
+    return pd.concat(hashes).groupby(level=0).sum()
+
+
+#process only the buildings that changed since the previous run and take the rest from it
+def reprocess_workbook(workbook, fingerprints, previous, timer=None, pool=None, chunk_size=1000):
+    frames = workbook.frames()
+    names = frames['Properties']['Property Name']
+    meters = frames['Meters']
+    entries = frames['Meter Entries']
+
+    #reused buildings appear once in both runs, and none of their meters is shared with another property
+    same = fingerprints.reindex(names.dropna().unique()) == previous.fingerprints.reindex(names.dropna().unique())
+    previous_names = pd.Series([b.name for b in previous.buildings], dtype=object)
+    shared_meters = meters['Portfolio Manager Meter ID'].duplicated(keep=False)
+    unchanged = (
+        set(same.index[same.to_numpy()])
+        - set(names[names.duplicated(keep=False)])
+        - set(previous_names[previous_names.duplicated(keep=False)])
+        - set(meters.loc[shared_meters, 'Property Name'])
+    )
+
+    reused_meters = meters['Property Name'].isin(unchanged)
+    reused_ids = meters.loc[reused_meters, 'Portfolio Manager Meter ID']
+    partial = process_frames(WorkbookSubset({
+        'Properties': frames['Properties'][~names.isin(unchanged)],
+        'Uses': frames['Uses'][~frames['Uses']['Property Name'].isin(unchanged)],
+        'Meters': meters[~reused_meters],
+        'Meter Entries': entries[~entries['Portfolio Manager Meter ID'].isin(reused_ids)]
+    }, {sheet: workbook.first_row(sheet) for sheet in frames}), timer, pool, chunk_size)
+    with timer.stage('combine') as stage:
+        portfolio = Portfolio.combine(names, unchanged, previous, partial)
+        #the rows of reused buildings may have moved, so their diagnostics are checked again on this export
+        reused_entries = entries[entries['Portfolio Manager Meter ID'].isin(reused_ids) & entries['Portfolio Manager Meter ID'].isin(portfolio.meter_ids)]
+        if len(reused_entries) > 0:
+            portfolio.add_diagnostics(validate_entries(reused_entries, portfolio, workbook.first_row('Meter Entries'))[0])
+        stage['rows'] = portfolio.reused
+    return portfolio
+
+
+#the fill methods that don't take a year, made once from the cube
+def fill_portfolio(portfolio, pool=None, chunk_size=1000):
+    portfolio.filled = {
+        'Blend': fill_table_parallel(portfolio.cube, 'Blend', pool=pool, chunk_size=chunk_size),
+        'Complete': fill_table_parallel(portfolio.cube, 'Complete', pool=pool, chunk_size=chunk_size)
+    }
+    return portfolio
+
+
+#bump whenever a change to parsing or ingestion changes what process_workbook produces,
+#so portfolios stored by an older version are not reused
+pipeline_version = 7
+
+
+#rebuild a processed portfolio from the tables made by Portfolio.to_tables
+def restore_portfolio(tables, pool=None, chunk_size=1000):
+    return fill_portfolio(Portfolio.from_tables(tables), pool, chunk_size)
+
+
+#columns of the columnar export and the dtype each one is stored as
+table_columns = {
+    'building_name': 'string',
+    'area_ft2': 'float64',
+    'building_type': 'string',
+    'address': 'string',
+    'city': 'string',
+    'state': 'string',
+    'country': 'string',
+    'zip': 'string',
+    'year': 'string',
+    **{col: 'float64' for col in month_columns},
+    'emissions_electricity': 'float64',
+    'emissions_gas': 'float64',
+    'emissions_district_heating': 'float64',
+    'emissions_district_cooling': 'float64',
+    'notes': 'string'
+}
+
+#output formats offered besides the Carbon Signal workbook: file extension and mime type
+table_formats = {
+    'CSV': ['csv', 'text/csv'],
+    'Parquet': ['parquet', 'application/vnd.apache.parquet'],
+    'Arrow': ['arrow', 'application/vnd.apache.arrow.file']
+}
+output_formats = {'Excel': ['xlsx', 'application/vnd.ms-excel'], **table_formats}
+
+
+#the records as one typed table, a column per field instead of a dict per building
+def records_table(records):
+    table = pd.DataFrame.from_records(records).rename(columns={'buliding_type': 'building_type'})
+    #reindexed first, so a portfolio without records still gets every column
+    table = table.reindex(columns=list(table_columns))
+    #year labels are a single year or a range like 2019-2022, kept as text. They are taken from the
+    #records, a column of int years and None would already have turned into floats.
+    table['year'] = pd.Series([None if r['year'] is None else str(r['year']) for r in records], dtype=object)
+    return table.astype(table_columns)
+
+
+#write the records table as CSV, Parquet or Arrow IPC into target, a new buffer by default
+def export_table(table, output='Parquet', target=None):
+    target = io.BytesIO() if target is None else target
+    if output == 'CSV':
+        table.to_csv(target, index=False)
+    elif output == 'Parquet':
+        table.to_parquet(target, index=False)
+    elif output == 'Arrow':
+        import pyarrow as pa
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+        with pa.ipc.new_file(target, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    else:
+        raise ValueError(f'Unknown output format {output}.')
+    if isinstance(target, io.BytesIO):
+        target.seek(0)
+    return target
+
+
+#create and save an excel file of records with standard header
+def create_excel(records, target=None):
+    target = io.BytesIO() if target is None else target
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Inputs')
+    #create headers
+    headings = [
+        ['Building Name', 'This is your unique building identifier.', 1],
+        ['Area', 'Gross floor area.', 2],
+        ['Building Type', 'The primary program type.', 3],
+        ['Location', 'We use this information to locate the building.', 4],
+        ['Year of Data', 'Energy data reference year.', 9],
+        ['Heating System', 'Primary source of heating (optional)', 10],
+        ['Cooling System', 'Primary source of cooling (optional)', 11],
+        ['Electricity', 'The total amout of electricity consumed each month.', 12],
+        ['Gas', 'The total amout of gas consumed each month.', 24],
+        ['District Heating', 'The total amout of district steam or hot water consumed each month.', 36],
+        ['District Cooling', 'The total amout of district chilled water consumed each month.', 48],
+        ['PV Generation', 'The total amout of energy produced by onsite PV systems.', 60],
+        ['PV Metering', 'How is the PV energy metered?', 72],
+        ['Emissions Factors', "Optional - we'll use a default value based on location if you leave these blank.", 73],
+        ['Leased', 'Is the building leased or owned?', 77],
+        ['Notes', 'Any relevant notes about the building.', 78]
+    ]
+    units = [
+        ['FT2', 2],
+        ['kBtu', 12],
+        ['kBtu', 24],
+        ['kBtu', 36],
+        ['kBtu', 48],
+        ['kBtu', 60],
+        ['Lbs CO2e / MBtu', 73],
+        ['Lbs CO2e / MBtu', 74],
+        ['Lbs CO2e / MBtu', 75],
+        ['Lbs CO2e / MBtu', 76]
+    ]
+    subheadings = [
+        ['ADDRESS', 4],
+        ['CITY', 5],
+        ['STATE', 6],
+        ['COUNTRY', 7],
+        ['ZIP', 8],
+        *list(zip(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], list(range(12, 24)))),
+        *list(zip(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], list(range(24, 36)))),
+        *list(zip(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], list(range(36, 48)))),
+        *list(zip(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], list(range(48, 60)))),
+        *list(zip(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], list(range(60, 72)))),
+        ['ELECTRICITY', 73],
+        ['GAS', 74],
+        ['DISTRICT HEATING', 75],
+        ['DISTRICT COOLING', 76]
+    ]
+
+    #the four header rows, one list per row
+    header = [[None] * excel_width for i in range(4)]
+    for heading in headings:
+        header[0][heading[2] - 1] = heading[0]
+        header[1][heading[2] - 1] = heading[1]
+    for unit in units:
+        header[2][unit[1] - 1] = unit[0]
+    for subheading in subheadings:
+        header[3][subheading[1] - 1] = subheading[0]
+    for row in header:
+        sheet.append(row)
+
+    #rows are appended whole and streamed out, so memory doesn't grow with the number of buildings
+    for record in records:
+        sheet.append([
+            record['building_name'],
+            record['area_ft2'],
+            record['buliding_type'],
+            record['address'],
+            record['city'],
+            record['state'],
+            record['country'],
+            record['zip'],
+            record['year'],
+            'Unknown',
+            'Unknown',
+            *[record[col] for col in month_columns],
+            'Unknown',
+            record['emissions_electricity'],
+            record['emissions_gas'],
+            record['emissions_district_heating'],
+            record['emissions_district_cooling'],
+            'Unknown',
+            record['notes']
+        ])
+
+    workbook.save(target)
+    if isinstance(target, io.BytesIO):
+        target.seek(0)
+    return target
+
+
+#write the records in any of the output formats, the Carbon Signal workbook by default
+def export_records(records, output='Excel', target=None):
+    if output == 'Excel':
+        return create_excel(records, target)
+    return export_table(records_table(records), output, target)
+
+
+#the diagnostics as a readable sheet, one line per problem, meter and detail
+def validation_table(diagnostics):
+    table = diagnostics.copy()
+    table.insert(1, 'problem', table['code'].map(diagnostic_labels))
+    table['sample_rows'] = table['sample_rows'].map(lambda rows: ', '.join(str(r) for r in rows))
+    return table.sort_values(['building', 'meter', 'code'], kind='stable').reset_index(drop=True)
+
+
+#the validation sheet as an Excel workbook into target, a new buffer by default
+def export_validation(diagnostics, target=None):
+    target = io.BytesIO() if target is None else target
+    validation_table(diagnostics).to_excel(target, sheet_name='Validation', index=False, engine='openpyxl')
+    return target
+
+
+
+
+
+
+
+
+
+
+
+#-------------------- MAIN CLASSES --------------------
+
+
+#Raised when the uploaded file is not a usable Portfolio Manager export
+class WorkbookError(Exception):
+    pass
+
+
+#errors of a damaged .xlsx, which can also turn up while a sheet is read. Reported the same as WorkbookError.
+workbook_read_errors = (WorkbookError, zipfile.BadZipFile, InvalidFileException)
+
+
+#Wall time, rows and memory of each pipeline stage. Process memory is read from the high-water mark the
+#OS already keeps, traced memory is only reported when tracemalloc is running, since tracing is slow.
+#Both are process wide, so they only belong to one conversion when no other runs at the same time.
+class StageTimer:
+    def __init__(self, stages=None):
+        self._stages = [] if stages is None else list(stages)
+        self._current = None
+
+    @property
+    def stages(self):
+        return self._stages
+
+    #the stage running right now, read by the app while a background job works
+    @property
+    def current(self):
+        return self._current
+
+    @staticmethod
+    def max_rss_mb():
+        if resource is None:
+            return None
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        #kilobytes on Linux, bytes on macOS
+        return round(rss / 1024 ** (2 if sys.platform == 'darwin' else 1), 1)
+
+    #times the block, the caller can set record['rows']
+    @contextlib.contextmanager
+    def stage(self, name):
+        record = {'stage': name, 'rows': None}
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            held = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        self._current = name
+        try:
+            yield record
+        finally:
+            self._current = None
+            seconds = time.perf_counter() - start
+            record['seconds'] = round(seconds, 6)
+            record['rows_per_second'] = None if record['rows'] is None or seconds == 0 else round(record['rows'] / seconds, 1)
+            record['peak_mb'] = round((tracemalloc.get_traced_memory()[1] - held) / 1024 ** 2, 3) if tracing else None
+            record['max_rss_mb'] = self.max_rss_mb()
+            self._stages.append(record)
+
+    def total_seconds(self):
+        return round(sum(s['seconds'] for s in self._stages), 6)
+
+    #one JSON line per run on the energy_star logger
+    def log(self, **fields):
+        logger.info(json.dumps({**fields, 'seconds': self.total_seconds(), 'stages': self._stages}, default=str))
+
+
+#Opens the Portfolio Manager export once and hands out the parsed sheets
+class PortfolioWorkbook:
+    #columns used from each sheet and the dtype they are read as
+    sheets = {
+        'Properties': {
+            'Property Name': str,
+            'Street Address': str,
+            'Street Address 2': str,
+            'City/Municipality': str,
+            'State/Province': str,
+            'Postal Code': str,
+            'Country': str,
+            'Parent Property Name (if Applicable)': str
+        },
+        'Uses': {
+            'Property Name': str,
+            'Use Type': str,
+            'Gross Floor Area for Use': object,
+            'Gross Floor Area Units': str
+        },
+        'Meters': {
+            'Meter Type': str,
+            'Portfolio Manager Meter ID': str,
+            'Property Name': str
+        },
+        'Meter Entries': {
+            'Portfolio Manager Meter ID': str,
+            'Start Date': object,
+            'End Date': object,
+            'Delivery Date': object,
+            'Meter Type': str,
+            'Usage/Quantity': object,
+            'Usage Units': str
+        }
+    }
+
+    def __init__(self, filepath):
+        #openpyxl is opened in read-only mode and every sheet is parsed from this one handle
+        #a file that isn't a zip, or a zip without the parts of a workbook, is not an .xlsx export
+        try:
+            self._xl = pd.ExcelFile(filepath, engine='openpyxl')
+        except (zipfile.BadZipFile, InvalidFileException, KeyError) as e:
+            raise WorkbookError('The file is not a readable .xlsx workbook.') from e
+        self._frames = {}
+        self._rows = {}
+        self._headers = {}
+        for sheet in PortfolioWorkbook.sheets:
+            self.check_sheet(sheet)
+
+    #check to make sure the relevant sheets are in the file
+    def check_sheet(self, sheet):
+        if sheet not in self._xl.sheet_names:
+            raise WorkbookError(f'Sheet {sheet} not found in Excel file.')
+
+    #get the row to use for headers
+    def get_header_index(self, sheet):
+        if sheet not in self._headers:
+            df = self._xl.parse(sheet, header=None, nrows=21)
+            header_loc = df[df == 'Property Name'].dropna(axis=1, how='all').dropna(how='all')
+            if not header_loc.shape[0] == 1:
+                raise WorkbookError(f'Header row with Property Name column was not found.')
+            self._headers[sheet] = header_loc.index.item()
+        return self._headers[sheet]
+
+    #Excel row number of the first row below the header, so reported rows match the sheet
+    def first_row(self, sheet):
+        return self.get_header_index(sheet) + 2
+
+    #read only the needed columns of a sheet, parsed once and kept for later calls
+    def frame(self, sheet):
+        if sheet not in self._frames:
+            dtypes = PortfolioWorkbook.sheets[sheet]
+            df = self._xl.parse(
+                sheet,
+                header=self.get_header_index(sheet),
+                usecols=lambda c: c in dtypes,
+                dtype=dtypes
+            )
+            #check to make sure the dataframe has all the necessary columns
+            for c in dtypes:
+                if c not in df.columns:
+                    raise WorkbookError(f'Missing column in {sheet} tab.')
+            self._frames[sheet] = df
+        return self._frames[sheet]
+
+    def frames(self):
+        return {sheet: self.frame(sheet) for sheet in PortfolioWorkbook.sheets}
+
+    #the needed columns of a sheet in frames of up to chunk_rows rows, read straight from the
+    #read-only openpyxl sheet and parsed the same way as frame
+    def chunks(self, sheet, chunk_rows=100000):
+        dtypes = PortfolioWorkbook.sheets[sheet]
+        header_index = self.get_header_index(sheet)
+        header = None
+        rows = []
+        self._rows[sheet] = 0
+        for number, row in enumerate(self._xl.book[sheet].iter_rows(values_only=True)):
+            if number < header_index:
+                continue
+            row = [excel_value(v) for v in row]
+            if header is None:
+                header = row
+                for c in dtypes:
+                    if c not in header:
+                        raise WorkbookError(f'Missing column in {sheet} tab.')
+                continue
+            rows.append(row)
+            if len(rows) == chunk_rows:
+                yield self.parse_rows(sheet, header, rows)
+                rows = []
+        if len(rows) > 0 or header is None:
+            yield self.parse_rows(sheet, header or list(dtypes), rows)
+
+    def parse_rows(self, sheet, header, rows):
+        dtypes = PortfolioWorkbook.sheets[sheet]
+        width = len(header)
+        rows = [row[:width] + [''] * (width - len(row)) for row in rows]
+        df = TextParser([header, *rows], header=0, usecols=lambda c: c in dtypes, dtype=dtypes).read()
+        #a chunk of nothing but dates would otherwise come back as datetime64
+        df = df.astype({c: object for c, dtype in dtypes.items() if dtype is object})
+        #rows are numbered on from the previous chunk, the same as in frame
+        start = self._rows.get(sheet, 0)
+        df.index = pd.RangeIndex(start, start + len(df))
+        self._rows[sheet] = start + len(df)
+        return df
+
+    #rows read from a sheet, whole or in chunks
+    def rows(self, sheet):
+        if sheet in self._frames:
+            return len(self._frames[sheet])
+        return self._rows.get(sheet, 0)
+
+
+#cell values as pandas reads them from openpyxl: empty cells are '' and whole floats are ints
+def excel_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+#The rows of a PortfolioWorkbook that still need processing, handed out the same way
+class WorkbookSubset:
+    def __init__(self, frames, first_rows=None):
+        self._frames = frames
+        self._first_rows = {} if first_rows is None else first_rows
+
+    def frame(self, sheet):
+        return self._frames[sheet]
+
+    def frames(self):
+        return dict(self._frames)
+
+    def rows(self, sheet):
+        return len(self._frames[sheet])
+
+    def first_row(self, sheet):
+        return self._first_rows.get(sheet, 1)
+
+
+#Holds all the buliding details. Slotted, a portfolio can hold tens of thousands of them.
+class Building:
+    __slots__ = (
+        '_name', '_address', '_city', '_state', '_postal', '_country', '_uses', '_parent',
+        '_notes', '_primary_use', '_area_ft2', '_meters', '_fuel_types'
+    )
+
+    def __init__(self, name):
+        self._name = name
+        self._address = None
+        self._city = None
+        self._state = None
+        self._postal = None
+        self._country = None
+        self._uses = []
+        self._parent = None
+        self._notes = []
+        self._primary_use = None
+        self._area_ft2 = 0
+        self._meters = []
+        self._fuel_types = {}
+    
+    @property
+    def name(self):
+        return self._name
+    @name.setter
+    def name(self, name):
+        self._name = name
+    
+    @property
+    def address(self):
+        return self._address
+    @address.setter
+    def address(self, address):
+        self._address = address
+    
+    @property
+    def city(self):
+        return self._city
+    @city.setter
+    def city(self, city):
+        self._city = city
+
+    @property
+    def state(self):
+        return self._state
+    @state.setter
+    def state(self, state):
+        self._state = state
+
+    @property
+    def postal(self):
+        return self._postal
+    @postal.setter
+    def postal(self, postal):
+        padded = str(postal).zfill(5)
+        if '-' in padded:
+            self._postal = padded.split('-')[0]
+        else:
+            self._postal = padded
+
+    @property
+    def country(self):
+        return self._country
+    @country.setter
+    def country(self, country):
+        self._country = country
+    
+    @property
+    def uses(self):
+        return self._uses
+    
+    @property
+    def primary_use(self):
+        return self._primary_use
+    
+    @property
+    def area_ft2(self):
+        return self._area_ft2
+    
+    def add_use(self, use):
+        self._uses.append(use)
+        self._area_ft2 = sum([u[1] for u in self._uses])
+        sorted_ascending_uses = sorted(self._uses, key=lambda u: u[1])
+        self._primary_use = sorted_ascending_uses[-1][0]
+            
+
+    @property
+    def parent(self):
+        return self._parent
+    @parent.setter
+    def parent(self, parent):
+        self._parent = parent
+    
+    @property
+    def meters(self):
+        return self._meters
+
+    @property
+    def fuel_types(self):
+        return self._fuel_types
+    
+    def add_meter(self, meter):
+        self._meters.append(meter)
+        try:
+            meter_type = meter.meter_type
+            meter_fuel = meter.meter_fuel
+            if meter_type in self._fuel_types:
+                self._fuel_types[meter_type].append(meter_fuel)
+            else:
+                self._fuel_types[meter_type] = [meter_fuel]
+        except:
+            self.add_note(f'Problem parsing meter fuel and type.')
+    
+    #notes are kept as a list and joined when read, so adding one doesn't copy the ones before it
+    @property
+    def notes(self):
+        return '; '.join(self._notes) if self._notes else None
+    
+    def add_note(self, note):
+        if note is not None:
+            self._notes.append(note)
+
+
+
+#kBtu entries of many meters in three shared columns: meter code, timestamp and value.
+#Entries are appended as they come and sorted by meter and timestamp on the next read, repeated
+#timestamps of a meter are summed. A meter reads its entries as a slice of the columns.
+class EntryStore:
+    __slots__ = ('_codes', '_timestamps', '_kbtu', '_pending')
+
+    def __init__(self):
+        self._codes = np.empty(0, dtype='int32')
+        self._timestamps = np.empty(0, dtype='datetime64[ns]')
+        self._kbtu = np.empty(0, dtype='float64')
+        self._pending = []
+
+    def __len__(self):
+        self.consolidate()
+        return len(self._kbtu)
+
+    #codes is a meter code or an array of them, one per timestamp
+    def add(self, codes, timestamps, kbtu):
+        timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+        codes = np.broadcast_to(np.asarray(codes, dtype='int32'), timestamps.shape)
+        self._pending.append((codes, timestamps, np.asarray(kbtu, dtype='float64')))
+
+    def consolidate(self):
+        if len(self._pending) == 0:
+            return
+        codes = np.concatenate([self._codes, *[p[0] for p in self._pending]])
+        timestamps = np.concatenate([self._timestamps, *[p[1] for p in self._pending]])
+        kbtu = np.concatenate([self._kbtu, *[p[2] for p in self._pending]])
+        self._pending = []
+        order = np.lexsort((timestamps, codes))
+        codes, timestamps, kbtu = codes[order], timestamps[order], kbtu[order]
+        starts = np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]) | (timestamps[1:] != timestamps[:-1])])
+        if len(starts) < len(kbtu):
+            kbtu = np.add.reduceat(kbtu, starts)
+            codes, timestamps = codes[starts], timestamps[starts]
+        self._codes, self._timestamps, self._kbtu = codes, timestamps, kbtu
+
+    #(timestamps, kbtu) of one meter, views into the shared columns
+    def slice(self, code):
+        self.consolidate()
+        #bounds of the same dtype as the codes, otherwise the whole column is cast on every call
+        start, end = np.searchsorted(self._codes, np.array([code, code + 1], dtype=self._codes.dtype))
+        return self._timestamps[start:end], self._kbtu[start:end]
+
+    @property
+    def codes(self):
+        self.consolidate()
+        return self._codes
+
+    @property
+    def timestamps(self):
+        self.consolidate()
+        return self._timestamps
+
+    @property
+    def kbtu(self):
+        self.consolidate()
+        return self._kbtu
+
+
+#Holds all the meter details. Gets attached to building. The fuel is kept as its position in
+#Meter.fuels and the entries live in an EntryStore shared with the other meters of the portfolio.
+class Meter:
+    meters = {
+        'Natural Gas': 'G',
+        'Propane': 'G',
+        'Fuel Oil (No. 2)': 'G',
+        'Diesel': 'G',
+        'District Steam': 'S',
+        'District Hot Water': 'S',
+        'Electric - Grid': 'E',
+        'Electric - Solar': 'R',
+        'Electric - Wind': 'R',
+        'District Chilled Water - Electric': 'C',
+        'District Chilled Water - Absorption': 'C',
+        'District Chilled Water - Engine': 'C',
+        'District Chilled Water - Other': 'C'
+    }
+    fuels = tuple(meters)
+
+    __slots__ = ('_id', '_building_name', '_fuel', '_notes', '_store', '_code')
+    
+    def __init__(self, id):
+        self._id = id
+        self._building_name = None
+        self._fuel = None
+        self._notes = []
+        self._store = None
+        self._code = None
+
+    @classmethod
+    def valid_meter(cls, meter):
+        return meter in Meter.meters
+    
+    @property
+    def id(self):
+        return self._id
+    @id.setter
+    def id(self, id):
+        self._id = id
+    
+    @property
+    def building_name(self):
+        return self._building_name
+    @building_name.setter
+    def building_name(self, name):
+        self._building_name = name
+    
+    @property
+    def meter_fuel(self):
+        return None if self._fuel is None else Meter.fuels[self._fuel]
+    
+    @property
+    def meter_type(self):
+        return None if self._fuel is None else Meter.meters[Meter.fuels[self._fuel]]
+    @meter_type.setter
+    def meter_type(self, meter):
+        if meter in Meter.meters:
+            self._fuel = Meter.fuels.index(meter)
+        else:
+            self.add_note(f'Meter of type {meter} is not recognized.')
+    
+    #notes are kept as a list and joined when read, so adding one doesn't copy the ones before it
+    @property
+    def notes(self):
+        return '; '.join(self._notes) if self._notes else None
+    
+    def add_note(self, note):
+        if note is not None:
+            self._notes.append(note)
+    
+    #the meter's place in its EntryStore
+    @property
+    def code(self):
+        return self._code
+
+    #keep the entries in a store shared with other meters, a meter without one gets its own
+    def attach(self, store, code):
+        self._store = store
+        self._code = code
+
+    @property
+    def store(self):
+        return self._store
+
+    #timestamps and kbtu values as arrays, without building a frame
+    @property
+    def timestamps(self):
+        if self._store is None:
+            return np.empty(0, dtype='datetime64[ns]')
+        return self._store.slice(self._code)[0]
+
+    @property
+    def kbtu(self):
+        if self._store is None:
+            return np.empty(0, dtype='float64')
+        return self._store.slice(self._code)[1]
+
+    #daily or monthly kbtu values indexed by timestamp, built from the store on every call
+    @property
+    def entries(self):
+        timestamps, kbtu = (None, None) if self._store is None else self._store.slice(self._code)
+        if kbtu is None or len(kbtu) == 0:
+            return pd.DataFrame(columns=['kbtu'])
+        return pd.DataFrame({'kbtu': kbtu}, index=pd.DatetimeIndex(timestamps, name='timestamp'))
+
+
+
+#Holds every building and meter in an export, indexed by property name and meter id
+class Portfolio:
+    def __init__(self):
+        self._buildings = []
+        self._meters = []
+        self._building_index = {}
+        self._meter_index = {}
+        self._building_meters = {}
+        self._entry_store = EntryStore()
+        self._diagnostics = []
+        self._skipped_meters = set()
+        self._unmatched = {}
+        self._cube = None
+        self._filled = {}
+        self._fingerprints = None
+        self._reused = 0
+        self._stages = []
+
+    @property
+    def buildings(self):
+        return self._buildings
+
+    #monthly kBtu indexed by (building, type, year, month)
+    @property
+    def cube(self):
+        return self._cube
+    @cube.setter
+    def cube(self, cube):
+        self._cube = cube
+
+    #filled frames by fill method
+    @property
+    def filled(self):
+        return self._filled
+    @filled.setter
+    def filled(self, filled):
+        self._filled = filled
+
+    #content hash of every property's rows, by property name
+    @property
+    def fingerprints(self):
+        return self._fingerprints
+    @fingerprints.setter
+    def fingerprints(self, fingerprints):
+        self._fingerprints = fingerprints
+
+    #number of buildings taken unchanged from a previous run
+    @property
+    def reused(self):
+        return self._reused
+
+    #timings of the stages that built this portfolio, see StageTimer
+    @property
+    def stages(self):
+        return self._stages
+    @stages.setter
+    def stages(self, stages):
+        self._stages = stages
+
+    @property
+    def meters(self):
+        return self._meters
+
+    #the first building with a given name wins, same as the exports are read top to bottom
+    def add_building(self, building):
+        self._buildings.append(building)
+        if building.name not in self._building_index:
+            self._building_index[building.name] = building
+            self._building_meters[building.name] = []
+
+    def building(self, name):
+        return self._building_index.get(name)
+
+    #entries of the meters parsed into this portfolio, meters taken from another one keep their own store
+    @property
+    def entry_store(self):
+        return self._entry_store
+
+    def add_meter(self, meter):
+        self._meters.append(meter)
+        if meter.store is None:
+            meter.attach(self._entry_store, len(self._meters) - 1)
+        if meter.id not in self._meter_index:
+            self._meter_index[meter.id] = meter
+        if meter.building_name in self._building_meters:
+            self._building_meters[meter.building_name].append(meter)
+        else:
+            self.report_unmatched('Meters', 'property', meter.building_name)
+
+    def meter(self, id):
+        return self._meter_index.get(id)
+
+    @property
+    def meter_ids(self):
+        return list(self._meter_index)
+
+    #meters with an unsupported type are left out on purpose and their entries are not reported
+    def skip_meter(self, id):
+        self._skipped_meters.add(id)
+
+    @property
+    def skipped_meter_ids(self):
+        return list(self._skipped_meters)
+
+    #attach every meter to its building once its entries are loaded
+    def link_meters(self):
+        for name, meters in self._building_meters.items():
+            building = self._building_index[name]
+            for meter in meters:
+                building.add_meter(meter)
+                building.add_note(meter.notes)
+
+    #rows that point to a property or meter that isn't in the export
+    def report_unmatched(self, sheet, kind, key, rows=1):
+        self._unmatched[(sheet, kind, key)] = self._unmatched.get((sheet, kind, key), 0) + rows
+
+    @property
+    def unmatched(self):
+        return self._unmatched
+
+    #a frame from entry_diagnostics, added once per sheet or chunk
+    def add_diagnostics(self, diagnostics):
+        if diagnostics is not None and len(diagnostics) > 0:
+            self._diagnostics.append(diagnostics)
+
+    #every entry problem by code, meter, building and detail, with the number of rows and up to three
+    #sample rows. Chunks that found the same problem are merged into one line.
+    @property
+    def diagnostics(self):
+        if len(self._diagnostics) == 0:
+            return pd.DataFrame(columns=diagnostic_columns)
+        if len(self._diagnostics) > 1:
+            merged = pd.concat(self._diagnostics, ignore_index=True)
+            keys = ['code', 'meter', 'building', 'detail']
+            grouped = merged.groupby(keys, sort=False, dropna=False)
+            merged = grouped['rows'].sum().to_frame()
+            merged['sample_rows'] = grouped['sample_rows'].agg(lambda rows: [r for sample in rows for r in sample][:3])
+            self._diagnostics = [merged.reset_index()[diagnostic_columns]]
+        return self._diagnostics[0]
+
+    #the parsed portfolio as plain tables, enough to build it again without the workbook
+    def to_tables(self):
+        building_fields = ['name', 'address', 'city', 'state', 'postal', 'country', 'parent', 'notes']
+        buildings = pd.DataFrame(
+            [[getattr(b, f) for f in building_fields] for b in self._buildings],
+            columns=building_fields,
+            dtype=object
+        )
+        uses = pd.DataFrame(
+            [[index, use[0], use[1]] for index, b in enumerate(self._buildings) for use in b.uses],
+            columns=['building', 'use', 'area']
+        ).astype({'building': 'int64', 'use': object, 'area': 'float64'})
+        meters = pd.DataFrame(
+            [[m.id, m.building_name, m.meter_fuel, m.notes] for m in self._meters],
+            columns=['id', 'building_name', 'fuel', 'notes'],
+            dtype=object
+        )
+        entries = [(m.timestamps, m.kbtu) for m in self._meters]
+        entries = pd.DataFrame({
+            'meter': np.repeat(np.arange(len(entries), dtype='int64'), [len(e[1]) for e in entries]),
+            'timestamp': pd.DatetimeIndex(np.concatenate([e[0] for e in entries] or [[]]).astype('datetime64[ns]')),
+            'kbtu': np.concatenate([e[1] for e in entries] or [[]]).astype('float64')
+        })
+        unmatched = pd.DataFrame(
+            [[sheet, kind, key, rows] for (sheet, kind, key), rows in self._unmatched.items()],
+            columns=['sheet', 'kind', 'key', 'rows']
+        ).astype({'sheet': object, 'kind': object, 'key': object, 'rows': 'int64'})
+        return {
+            'buildings': buildings,
+            'uses': uses,
+            'meters': meters,
+            'entries': entries,
+            'skipped': pd.DataFrame({'id': pd.Series(sorted(self._skipped_meters), dtype=object)}),
+            'unmatched': unmatched,
+            'cube': self._cube.reset_index(),
+            'diagnostics': self.diagnostics.astype({'rows': 'int64'}).assign(
+                sample_rows=self.diagnostics['sample_rows'].map(lambda rows: [int(r) for r in rows])
+            ),
+            'fingerprints': pd.DataFrame({
+                'name': pd.Series(self._fingerprints.index, dtype=object),
+                'fingerprint': self._fingerprints.to_numpy(dtype='uint64')
+            })
+        }
+
+    @classmethod
+    def from_tables(cls, tables):
+        portfolio = cls()
+        buildings = []
+        for row in tables['buildings'].itertuples(index=False):
+            building = Building(row.name)
+            building.address = row.address
+            building.city = row.city
+            building.state = row.state
+            if row.postal is not None:
+                building.postal = row.postal
+            building.country = row.country
+            building.parent = row.parent
+            building.add_note(row.notes)
+            buildings.append(building)
+            portfolio.add_building(building)
+        for row in tables['uses'].itertuples(index=False):
+            buildings[row.building].add_use([row.use, row.area])
+
+        for row in tables['meters'].itertuples(index=False):
+            meter = Meter(row.id)
+            meter.building_name = row.building_name
+            meter.meter_type = row.fuel
+            meter.add_note(row.notes)
+            portfolio.add_meter(meter)
+        #meters were added in table order, so the meter column is already the store code
+        entries = tables['entries']
+        portfolio.entry_store.add(entries['meter'].to_numpy(), entries['timestamp'].to_numpy(), entries['kbtu'].to_numpy())
+        #building notes already include the meter notes, so meters are attached without them
+        for name, meters in portfolio._building_meters.items():
+            for meter in meters:
+                portfolio._building_index[name].add_meter(meter)
+
+        for id in tables['skipped']['id']:
+            portfolio.skip_meter(id)
+        portfolio._unmatched = {
+            (row.sheet, row.kind, row.key): int(row.rows) for row in tables['unmatched'].itertuples(index=False)
+        }
+        portfolio.cube = tables['cube'].set_index(['building', 'type', 'year', 'month'])['kbtu']
+        diagnostics = tables['diagnostics'].copy()
+        diagnostics['sample_rows'] = diagnostics['sample_rows'].map(list)
+        portfolio.add_diagnostics(diagnostics)
+        portfolio.fingerprints = tables['fingerprints'].set_index('name')['fingerprint']
+        return portfolio
+
+    #the buildings named in unchanged come from previous, every other one from partial, in the order
+    #of the Properties tab. Unmatched rows were all part of the partial run, the diagnostics of the
+    #reused rows are added by reprocess_workbook.
+    @classmethod
+    def combine(cls, names, unchanged, previous, partial):
+        portfolio = cls()
+        previous_index = {b.name: index for index, b in enumerate(previous.buildings)}
+        partial_buildings = iter(partial.buildings)
+        reused = 0
+        for name in names:
+            if name in unchanged:
+                building = previous.buildings[previous_index[name]]
+                reused += 1
+            else:
+                building = next(partial_buildings)
+            portfolio.add_building(building)
+            for meter in building.meters:
+                portfolio.add_meter(meter)
+        for meter in partial.meters:
+            if meter.building_name not in portfolio._building_meters:
+                portfolio.add_meter(meter)
+
+        kept = previous.cube.index.get_level_values('building').isin(unchanged)
+        portfolio.cube = pd.concat([previous.cube[kept], partial.cube]).sort_index()
+        portfolio.filled = {
+            method: pd.concat([previous.filled[method][previous.filled[method].index.isin(unchanged)], table])
+            for method, table in partial.filled.items()
+        }
+
+        for id in set(previous.skipped_meter_ids) | set(partial.skipped_meter_ids):
+            portfolio.skip_meter(id)
+        portfolio._unmatched = dict(partial.unmatched)
+        portfolio.add_diagnostics(partial.diagnostics)
+        portfolio._reused = reused
+        return portfolio
+
+    def unmatched_messages(self):
+        messages = []
+        for (sheet, kind, key), rows in self._unmatched.items():
+            if rows == 1:
+                messages.append(f'1 row in the {sheet} tab points to unknown {kind} {key}.')
+            else:
+                messages.append(f'{rows} rows in the {sheet} tab point to unknown {kind} {key}.')
+        return messages
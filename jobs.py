@@ -0,0 +1,184 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from energy_star import StageTimer, logger, workbook_read_errors
+
+
+
+
+#-------------------- JOB SETTINGS --------------------
+
+
+#stages shown as the progress of a conversion, in the order they run. Compiling and exporting the
+#records happen in the page afterwards, so they are not part of a job.
+job_stages = ['load', 'buildings', 'meters', 'cube', 'fill']
+
+
+
+
+#-------------------- MAIN CLASSES --------------------
+
+
+#One conversion running in the background. The work gets the job's StageTimer, so the finished stages
+#and the one running can be read from another thread while it works.
+class Job:
+    def __init__(self, id, label):
+        self._id = id
+        self._label = label
+        self._status = 'queued'
+        self._timer = StageTimer()
+        self._submitted = time.time()
+        self._started = None
+        self._finished = None
+        self._result = None
+        self._error = None
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def label(self):
+        return self._label
+
+    #queued, running, then ok, invalid for a workbook that can't be read, or failed
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def done(self):
+        return self._status not in ('queued', 'running')
+
+    @property
+    def timer(self):
+        return self._timer
+
+    @property
+    def result(self):
+        return self._result
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def submitted(self):
+        return self._submitted
+
+    def elapsed(self):
+        if self._started is None:
+            return 0.0
+        return (time.time() if self._finished is None else self._finished) - self._started
+
+    #buildings in the portfolio, known once they are parsed or read from the cache
+    def buildings(self):
+        for stage in self._timer.stages:
+            if stage['stage'] in ('buildings', 'cache') and stage['rows'] is not None:
+                return stage['rows']
+        return None
+
+    def buildings_per_second(self):
+        buildings = self.buildings()
+        elapsed = self.elapsed()
+        return None if buildings is None or elapsed == 0 else round(buildings / elapsed, 1)
+
+    #status, seconds and rows of each of job_stages. A stage that never ran but was passed, such as
+    #parsing a workbook that came from the cache, counts as done.
+    def progress(self):
+        stages = list(self._timer.stages)
+        finished = {stage['stage']: stage for stage in stages}
+        current = self._timer.current
+        reached = [job_stages.index(s['stage']) for s in stages if s['stage'] in job_stages]
+        if current in job_stages:
+            reached.append(job_stages.index(current))
+        last = max(reached, default=-1)
+        rows = []
+        for index, name in enumerate(job_stages):
+            if name in finished:
+                status = 'done'
+            elif name == current:
+                status = 'running'
+            elif index < last or self._status == 'ok':
+                status = 'done'
+            else:
+                status = 'waiting'
+            stage = finished.get(name, {})
+            rows.append({'stage': name, 'status': status, 'seconds': stage.get('seconds'), 'rows': stage.get('rows')})
+        return rows
+
+    def fraction(self):
+        return sum(row['status'] == 'done' for row in self.progress()) / len(job_stages)
+
+    def run(self, work, args):
+        self._status = 'running'
+        self._started = time.time()
+        try:
+            self._result = work(self._timer, *args)
+            self._status = 'ok'
+        except workbook_read_errors as e:
+            self._status = 'invalid'
+            self._error = str(e)
+        except Exception as e:
+            self._status = 'failed'
+            self._error = f'{type(e).__name__}: {e}'
+            logger.exception(f'Job {self._id} for {self._label} failed')
+        self._finished = time.time()
+
+
+#Background conversions shared by every session. At most max_jobs run at once, the rest wait in
+#submission order, so one huge upload can't hold up everyone else. Jobs are keyed by what they convert,
+#so the same upload from another session or after a refresh joins the job already there instead of
+#starting over. Finished jobs keep their result until more than max_finished have piled up.
+class JobPool:
+    def __init__(self, max_jobs=2, max_finished=64):
+        self._max_jobs = max_jobs
+        self._max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix='energy-star-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_jobs(self):
+        return self._max_jobs
+
+    @property
+    def max_finished(self):
+        return self._max_finished
+
+    #work is called as work(timer, *args) on a worker thread. A failed job is kept, with its error,
+    #and only started again with retry.
+    def submit(self, id, label, work, *args, retry=False):
+        with self._lock:
+            job = self._jobs.get(id)
+            if job is not None and not (retry and job.status == 'failed'):
+                return job
+            job = Job(id, label)
+            self._jobs.pop(id, None)
+            self._jobs[id] = job
+        self._executor.submit(self._run, job, work, args)
+        return job
+
+    def _run(self, job, work, args):
+        job.run(work, args)
+        self.evict()
+
+    def get(self, id):
+        return self._jobs.get(id)
+
+    #queued jobs that will start before this one
+    def ahead(self, job):
+        with self._lock:
+            queued = [j for j in self._jobs.values() if j.status == 'queued']
+        return sum(j.submitted < job.submitted for j in queued)
+
+    def evict(self):
+        with self._lock:
+            finished = [id for id, job in self._jobs.items() if job.done]
+            for id in finished[:max(0, len(finished) - self._max_finished)]:
+                del self._jobs[id]
+
+    def stats(self):
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {status: statuses.count(status) for status in ['queued', 'running', 'ok', 'invalid', 'failed']}
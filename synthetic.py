@@ -0,0 +1,238 @@
+import argparse
+import datetime
+import random
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from energy_star import PortfolioWorkbook, conversions, interval_columns
+
+
+
+
+#-------------------- GENERATOR SETTINGS --------------------
+
+
+#share of meters of each type, the default roughly follows a mixed office portfolio
+default_fuel_mix = {
+    'Electric - Grid': 0.45,
+    'Natural Gas': 0.25,
+    'District Steam': 0.05,
+    'District Hot Water': 0.02,
+    'District Chilled Water - Electric': 0.04,
+    'Electric - Solar': 0.04,
+    'Propane': 0.04,
+    'Fuel Oil (No. 2)': 0.04,
+    'Diesel': 0.02,
+    'Potable Water': 0.05
+}
+
+#fuels Portfolio Manager records by delivery date instead of billing period
+delivery_fuels = {'Propane', 'Fuel Oil (No. 2)', 'Diesel'}
+
+#units for meter types the app doesn't convert
+other_units = {'Potable Water': ['Gallons (US)', 'cf (cubic feet)']}
+
+#zip codes spread over several eGRID subregions
+postal_codes = ['02134', '10001', '19103', '30303', '33101', '55401', '60601', '78701', '80202', '85001', '94105', '98101']
+
+use_types = ['Office', 'Retail Store', 'Parking', 'K-12 School', 'Hotel', 'Multifamily Housing', 'Warehouse']
+
+headers = {
+    'Properties': [
+        'Property Id', 'Property Name', 'Parent Property Name (if Applicable)', 'Street Address',
+        'Street Address 2', 'City/Municipality', 'State/Province', 'Postal Code', 'Country'
+    ],
+    'Uses': ['Property Id', 'Property Name', 'Use Type', 'Gross Floor Area for Use', 'Gross Floor Area Units'],
+    'Meters': ['Property Id', 'Property Name', 'Portfolio Manager Meter ID', 'Meter Name', 'Meter Type'],
+    'Meter Entries': [
+        'Property Id', 'Property Name', 'Portfolio Manager Meter ID', 'Meter Type', 'Start Date',
+        'End Date', 'Delivery Date', 'Usage/Quantity', 'Usage Units'
+    ]
+}
+
+
+
+
+#-------------------- GENERATOR FUNCTIONS --------------------
+
+
+#units a meter can be reported in, kBtu first
+def meter_units(fuel):
+    if fuel in other_units:
+        return other_units[fuel]
+    return ['kBtu (thousand Btu)', *sorted(conversions[fuel])]
+
+
+#amounts are drawn in kBtu and divided by this, so a meter in MLbs or MWh still reports a plausible amount
+def unit_scale(fuel, unit):
+    if fuel in other_units or unit == 'kBtu (thousand Btu)':
+        return 1.0
+    return 1 / conversions[fuel][unit]['kBtu (thousand Btu)']
+
+
+#an amount drawn in kBtu, in the meter's unit. Small units keep more decimals so they don't round to 0.
+def scaled_amount(kbtu, scale):
+    return round(kbtu * scale, 2 if scale >= 1 else 6)
+
+
+#write a Portfolio Manager style export with the four sheets the app reads.
+#non_kbtu_share is the share of meters reported in a unit other than kBtu, not_available_share the
+#share of entries whose dates or amount are 'Not Available'. Returns the number of rows per sheet.
+def generate_workbook(
+    path,
+    buildings=100,
+    meters_per_building=3,
+    years=3,
+    fuel_mix=None,
+    non_kbtu_share=0.5,
+    not_available_share=0.02,
+    last_year=None,
+    seed=0
+):
+    rng = random.Random(seed)
+    fuel_mix = default_fuel_mix if fuel_mix is None else fuel_mix
+    fuels = list(fuel_mix)
+    weights = [fuel_mix[f] for f in fuels]
+    last_year = datetime.date.today().year - 1 if last_year is None else last_year
+    first_year = last_year - years + 1
+
+    #write-only sheets keep memory flat for large portfolios
+    workbook = Workbook(write_only=True)
+    sheets = {}
+    for name, columns in headers.items():
+        sheet = workbook.create_sheet(name)
+        sheet.append([f'{name} export generated for testing'])
+        sheet.append([f'Generated {datetime.date.today().isoformat()}'])
+        sheet.append([])
+        sheet.append(columns)
+        sheets[name] = sheet
+    counts = {name: 0 for name in headers}
+
+    def append(sheet, row):
+        sheets[sheet].append(row)
+        counts[sheet] += 1
+
+    meter_id = 100000
+    for index in range(buildings):
+        property_id = 1000000 + index
+        name = f'Building {index + 1}'
+        #every tenth building is part of a campus headed by the building before it
+        parent = f'Building {index}' if index % 10 == 9 else 'Not Available'
+        append('Properties', [
+            property_id,
+            name,
+            parent,
+            f'{rng.randint(1, 9999)} {rng.choice(["Main", "Oak", "Pine", "Maple", "Cedar"])} St',
+            f'Suite {rng.randint(100, 999)}' if rng.random() < 0.2 else 'Not Available',
+            rng.choice(['Boston', 'Chicago', 'Denver', 'Seattle', 'Austin', 'Atlanta']),
+            rng.choice(['MA', 'IL', 'CO', 'WA', 'TX', 'GA']),
+            rng.choice(postal_codes),
+            'United States'
+        ])
+
+        for use in range(rng.randint(1, 3)):
+            square_meters = rng.random() < 0.1
+            append('Uses', [
+                property_id,
+                name,
+                use_types[(index + use) % len(use_types)],
+                rng.randint(500, 20000) if square_meters else rng.randint(5000, 250000),
+                'Sq. M.' if square_meters else 'Sq. Ft.'
+            ])
+
+        for m in range(max(0, meters_per_building + rng.randint(-1, 1))):
+            meter_id += 1
+            fuel = rng.choices(fuels, weights)[0]
+            units = meter_units(fuel)
+            unit = rng.choice(units[1:]) if len(units) > 1 and rng.random() < non_kbtu_share else units[0]
+            scale = unit_scale(fuel, unit)
+            append('Meters', [property_id, name, meter_id, f'{fuel} meter {m + 1}', fuel])
+
+            if fuel in delivery_fuels:
+                for year in range(first_year, last_year + 1):
+                    for delivery in range(rng.randint(2, 6)):
+                        date = datetime.datetime(year, rng.randint(1, 12), rng.randint(1, 28))
+                        entry = ['Not Available', 'Not Available', date, scaled_amount(rng.uniform(50, 2000), scale)]
+                        if rng.random() < not_available_share:
+                            entry[2] = 'Not Available'
+                        append('Meter Entries', [property_id, name, meter_id, fuel, *entry, unit])
+            else:
+                start = datetime.datetime(first_year, 1, rng.randint(1, 15))
+                while start.year <= last_year:
+                    end = start + datetime.timedelta(days=rng.randint(27, 33))
+                    entry = [start, end, 'Not Available', scaled_amount(rng.uniform(100, 50000), scale)]
+                    if rng.random() < not_available_share:
+                        entry[rng.choice([0, 1, 3])] = 'Not Available'
+                    append('Meter Entries', [property_id, name, meter_id, fuel, *entry, unit])
+                    start = end + datetime.timedelta(days=1)
+
+    workbook.save(path)
+    return counts
+
+
+#write interval readings for the given (meter id, fuel) pairs, one every `minutes` over the last `days` days
+#of last_year, as Parquet when the path ends in .parquet and as CSV otherwise. Meters are written one at a
+#time so memory stays flat. Returns the number of readings.
+def generate_intervals(path, meters, days=365, minutes=15, last_year=None, seed=0):
+    rng = np.random.default_rng(seed)
+    last_year = datetime.date.today().year - 1 if last_year is None else last_year
+    start = np.datetime64(f'{last_year + 1}-01-01') - np.timedelta64(days, 'D')
+    timestamps = start + np.arange(days * 24 * 60 // minutes) * np.timedelta64(minutes, 'm')
+    parquet = str(path).endswith('.parquet')
+    writer = None
+    for index, (meter_id, fuel) in enumerate(meters):
+        units = meter_units(fuel)
+        unit = units[rng.integers(len(units))]
+        df = pd.DataFrame({
+            'Portfolio Manager Meter ID': str(meter_id),
+            'Timestamp': timestamps,
+            'Usage/Quantity': (rng.uniform(0, 50, len(timestamps)) * unit_scale(fuel, unit)).round(6),
+            'Usage Units': unit
+        })[interval_columns]
+        if parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            writer = pq.ParquetWriter(path, table.schema) if writer is None else writer
+            writer.write_table(table)
+        else:
+            df.to_csv(path, mode='w' if index == 0 else 'a', header=index == 0, index=False, date_format='%Y-%m-%dT%H:%M:%S')
+    if writer is not None:
+        writer.close()
+    return len(meters) * len(timestamps)
+
+
+
+
+
+#-------------------- MAIN EXECUTION --------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a synthetic Portfolio Manager export.')
+    parser.add_argument('path')
+    parser.add_argument('-b', '--buildings', type=int, default=100)
+    parser.add_argument('-m', '--meters', type=int, default=3, help='meters per building, give or take one')
+    parser.add_argument('-y', '--years', type=int, default=3)
+    parser.add_argument('--fuel-mix', default=None, help="comma separated fuel=share pairs, e.g. 'Electric - Grid=0.7,Propane=0.3'")
+    parser.add_argument('--non-kbtu', type=float, default=0.5, help='share of meters reported in units other than kBtu')
+    parser.add_argument('--not-available', type=float, default=0.02, help="share of entries with a 'Not Available' date or amount")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--intervals', default=None, help='also write 15 minute readings of the last year for every meter, to this .parquet or .csv file')
+    args = parser.parse_args(argv)
+
+    fuel_mix = None
+    if args.fuel_mix is not None:
+        fuel_mix = {f.strip(): float(s) for f, s in (pair.rsplit('=', 1) for pair in args.fuel_mix.split(','))}
+    counts = generate_workbook(
+        args.path, args.buildings, args.meters, args.years, fuel_mix, args.non_kbtu, args.not_available, seed=args.seed
+    )
+    print(', '.join(f'{rows} {sheet} rows' for sheet, rows in counts.items()))
+    if args.intervals is not None:
+        df_meters = PortfolioWorkbook(args.path).frame('Meters')
+        meters = zip(df_meters['Portfolio Manager Meter ID'], df_meters['Meter Type'])
+        print(f'{generate_intervals(args.intervals, list(meters), seed=args.seed)} interval readings')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from energy_star import compile_records
+from synthetic import headers, generate_workbook
+
+
+
+
+#-------------------- FIXTURES --------------------
+
+
+#writes a Portfolio Manager export with the given rows under each sheet's headers, after the same
+#title rows as a real export
+@pytest.fixture
+def write_workbook(tmp_path):
+    def write(rows, name='portfolio.xlsx'):
+        path = tmp_path / name
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for sheet_name, columns in headers.items():
+            sheet = workbook.create_sheet(sheet_name)
+            sheet.append([f'{sheet_name} export'])
+            sheet.append([f'Generated {datetime.date.today().isoformat()}'])
+            sheet.append([])
+            sheet.append(columns)
+            for row in rows.get(sheet_name, []):
+                sheet.append(row)
+        workbook.save(path)
+        return path
+    return write
+
+
+#a generated export of a small mixed portfolio, see synthetic.generate_workbook
+@pytest.fixture
+def synthetic_workbook(tmp_path):
+    def generate(name='synthetic.xlsx', buildings=30, seed=0):
+        path = tmp_path / name
+        generate_workbook(path, buildings=buildings, years=3, last_year=2023, seed=seed)
+        return path
+    return generate
+
+
+#what a conversion gives the user for a portfolio: the records of each fill method, every meter's
+#monthly kBtu and notes, the skipped entries and unmatched properties
+@pytest.fixture
+def portfolio_outputs():
+    def outputs(portfolio):
+        diagnostics = portfolio.diagnostics
+        if len(diagnostics) > 0:
+            diagnostics = diagnostics.sort_values(list(diagnostics.columns[:3])).reset_index(drop=True)
+        return {
+            'records': {method: compile_records(portfolio, method, 2023) for method in ['Blend', 'Complete', 'Latest']},
+            'meters': {
+                str(meter.id): (meter.timestamps.tolist(), meter.kbtu.tolist(), meter.notes)
+                for meter in portfolio.meters
+            },
+            'diagnostics': diagnostics,
+            'unmatched': portfolio.unmatched_messages()
+        }
+    return outputs
+
+
+#compares two portfolio_outputs. Entries summed in another order, such as over streamed chunks or
+#when a previous run is reused, can differ in the last bits of their kBtu.
+@pytest.fixture
+def assert_same_outputs():
+    def compare(actual, expected):
+        for method, records in expected['records'].items():
+            pd.testing.assert_frame_equal(pd.DataFrame(actual['records'][method]), pd.DataFrame(records))
+        assert actual['meters'].keys() == expected['meters'].keys()
+        for id, (timestamps, kbtu, notes) in expected['meters'].items():
+            assert actual['meters'][id][0] == timestamps
+            np.testing.assert_allclose(actual['meters'][id][1], kbtu, rtol=1e-12)
+            assert actual['meters'][id][2] == notes
+        assert actual['unmatched'] == expected['unmatched']
+        pd.testing.assert_frame_equal(actual['diagnostics'], expected['diagnostics'])
+    return compare
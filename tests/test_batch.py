@@ -0,0 +1,50 @@
+import time
+import zipfile
+import openpyxl
+import pytest
+from batch import convert_file
+from energy_star import process_workbook
+from jobs import JobPool
+
+
+def not_a_workbook(tmp_path, kind):
+    path = tmp_path / f'{kind}.xlsx'
+    if kind == 'text':
+        path.write_text('Property Name,City\nBuilding 1,Boston\n')
+    elif kind == 'empty':
+        path.write_bytes(b'')
+    else:
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr('readme.txt', 'not a workbook')
+    return path
+
+
+#the status the app gives the same file
+def job_status(path):
+    job = JobPool(max_jobs=1).submit(path.name, path.name, lambda timer: process_workbook(str(path), timer=timer))
+    while not job.done:
+        time.sleep(0.01)
+    return job.status, job.error
+
+
+@pytest.mark.parametrize('kind', ['text', 'empty', 'zip'])
+def test_unreadable_input_is_invalid(tmp_path, kind):
+    path = not_a_workbook(tmp_path, kind)
+    result = convert_file(str(path), str(tmp_path / 'out.xlsx'))
+    assert (result['status'], result['output']) == ('invalid', None)
+    assert job_status(path) == ('invalid', result['error'])
+
+
+def test_missing_tab_is_invalid(write_workbook, tmp_path):
+    path = write_workbook({})
+    workbook = openpyxl.load_workbook(path)
+    del workbook['Uses']
+    workbook.save(path)
+    result = convert_file(str(path), str(tmp_path / 'out.xlsx'))
+    assert (result['status'], result['error']) == ('invalid', 'Sheet Uses not found in Excel file.')
+    assert job_status(path) == ('invalid', result['error'])
+
+
+def test_workbook_converts(synthetic_workbook, tmp_path):
+    result = convert_file(str(synthetic_workbook(buildings=5)), str(tmp_path / 'out.xlsx'))
+    assert (result['status'], result['buildings']) == ('ok', 5)
@@ -0,0 +1,19 @@
+from cache import PortfolioCache
+from energy_star import process_workbook
+
+
+def test_cached_portfolio_matches_full_run(tmp_path, synthetic_workbook, portfolio_outputs, assert_same_outputs):
+    path = synthetic_workbook()
+    data = path.read_bytes()
+    cache = PortfolioCache(str(tmp_path / 'cache'))
+
+    converted = cache.load(data)
+    assert cache.misses == 1 and cache.has(cache.key(data))
+    cached = cache.load(data)
+    assert cache.hits == 1
+
+    full = portfolio_outputs(process_workbook(path))
+    assert_same_outputs(portfolio_outputs(converted), full)
+    assert_same_outputs(portfolio_outputs(cached), full)
+    assert [b.name for b in cached.buildings] == [b.name for b in converted.buildings]
+    assert [b.fuel_types for b in cached.buildings] == [b.fuel_types for b in converted.buildings]
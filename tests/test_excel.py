@@ -0,0 +1,35 @@
+import os
+import openpyxl
+import pytest
+from energy_star import process_workbook, compile_records, export_records, month_columns
+
+
+def test_excel_export_is_written_to_memory(synthetic_workbook, tmp_path, monkeypatch):
+    records = compile_records(process_workbook(synthetic_workbook(buildings=4)), 'Blend', 2023)
+    monkeypatch.chdir(tmp_path)
+    before = sorted(os.listdir(tmp_path))
+    target = export_records(records, 'Excel')
+    assert sorted(os.listdir(tmp_path)) == before
+    assert target.tell() == 0
+
+    sheet = openpyxl.load_workbook(target).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert sheet.title == 'Inputs'
+    assert len(rows) == 4 + len(records)
+    assert (rows[0][0], rows[0][11], rows[0][77]) == ('Building Name', 'Electricity', 'Notes')
+    assert (rows[2][1], rows[3][7], rows[3][11]) == ('FT2', 'ZIP', 'JAN')
+
+    for row, record in zip(rows[4:], records):
+        assert row[:3] == (record['building_name'], record['area_ft2'], record['buliding_type'])
+        assert row[7:9] == (record['zip'], record['year'])
+        #openpyxl writes floats with 15 significant digits
+        assert list(row[11:71]) == pytest.approx([record[col] for col in month_columns], rel=1e-14)
+        assert row[77] == record['notes']
+
+
+def test_excel_export_into_a_given_file(synthetic_workbook, tmp_path):
+    records = compile_records(process_workbook(synthetic_workbook(buildings=2)), 'Latest', 2023)
+    path = tmp_path / 'export.xlsx'
+    with open(path, 'wb') as f:
+        export_records(records, 'Excel', f)
+    assert openpyxl.load_workbook(path).active.max_row == 4 + len(records)
@@ -0,0 +1,50 @@
+import datetime
+import io
+import pandas as pd
+import pytest
+from energy_star import process_workbook, compile_records, records_table, export_records, output_formats
+
+
+def property_rows(*names):
+    return [
+        [i + 1, name, 'Not Available', f'{i + 1} Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States']
+        for i, name in enumerate(names)
+    ]
+
+
+#one building with a year of data, one whose meter has no entries and one without meters
+@pytest.fixture
+def mixed_years(write_workbook):
+    entries = [
+        [1, 'Metered', 11, 'Electric - Grid', datetime.datetime(2021, month, 1), datetime.datetime(2021, month, 28), 'Not Available', 1000, 'kBtu (thousand Btu)']
+        for month in range(1, 13)
+    ]
+    return process_workbook(write_workbook({
+        'Properties': property_rows('Metered', 'Empty meter', 'No meters'),
+        'Uses': [[1, 'Metered', 'Office', 10000, 'Sq. Ft.'], [2, 'Empty meter', 'Office', 10000, 'Sq. Ft.'], [3, 'No meters', 'Office', 10000, 'Sq. Ft.']],
+        'Meters': [[1, 'Metered', 11, 'Electric', 'Electric - Grid'], [2, 'Empty meter', 21, 'Electric', 'Electric - Grid']],
+        'Meter Entries': entries
+    }))
+
+
+@pytest.mark.parametrize('method, years', [
+    ('Blend', ['2021-2021', None, None]),
+    ('Complete', [2021, '', None]),
+    ('Latest', [2021, 2021, None])
+])
+def test_records_table_keeps_year_labels(mixed_years, method, years):
+    records = compile_records(mixed_years, method, 2021)
+    assert [r['year'] for r in records] == years
+    labels = [None if y is None else str(y) for y in years]
+    table = records_table(records)
+    assert table['year'].tolist() == [pd.NA if y is None else y for y in labels]
+
+    csv = pd.read_csv(io.BytesIO(export_records(records, 'CSV').getvalue()), dtype={'year': str}, keep_default_na=False)
+    assert csv['year'].tolist() == [y or '' for y in labels]
+
+
+@pytest.mark.parametrize('output', list(output_formats))
+def test_empty_portfolio_exports(write_workbook, output):
+    records = compile_records(process_workbook(write_workbook({})), 'Blend')
+    assert records == []
+    assert len(export_records(records, output).getvalue()) > 0
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import emissions_factors
+from emissions_factors import get_factors_batch
+from synthetic import postal_codes
+
+
+def portfolio_keys(offset):
+    fuels = [{'E': ['Electric - Grid']}, {'E': ['Electric - Grid'], 'G': ['Natural Gas', 'Propane']}, {'C': ['District Chilled Water - Electric']}]
+    count = 200
+    return (
+        [fuels[(i + offset) % len(fuels)] for i in range(count)],
+        ['United States'] * count,
+        [postal_codes[(i * 7 + offset) % len(postal_codes)] for i in range(count)],
+        [2015 + (i + offset) % 9 for i in range(count)]
+    )
+
+
+#conversions on several job threads share factor_cache, a cache far smaller than the keys in use
+#keeps every thread evicting while the others read
+def test_factor_cache_is_shared_safely_between_threads(monkeypatch):
+    monkeypatch.setattr(emissions_factors, 'factor_cache_size', 8)
+    emissions_factors.factor_cache.clear()
+    expected = [get_factors_batch(*portfolio_keys(offset)) for offset in range(16)]
+
+    emissions_factors.factor_cache.clear()
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda offset: get_factors_batch(*portfolio_keys(offset)), list(range(16)) * 4))
+    for offset, result in enumerate(results):
+        pd.testing.assert_frame_equal(result, expected[offset % 16])
+    assert len(emissions_factors.factor_cache) <= 8
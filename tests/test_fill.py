@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+from energy_star import fill_blend, fill_table_parallel, month_columns
+
+
+#a cube of random monthly kBtu: buildings billed monthly with gaps and zero months, and buildings
+#with a few deliveries a year
+def synthetic_cube(buildings=12, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for b in range(buildings):
+        for meter_type in ['E', 'G', 'S'][:rng.integers(1, 4)]:
+            delivered = meter_type == 'G' and b % 3 == 0
+            for year in range(2014, 2014 + rng.integers(1, 9)):
+                months = rng.choice(12, rng.integers(1, 4) if delivered else rng.integers(1, 13), replace=False) + 1
+                for month in months:
+                    kbtu = 0.0 if rng.random() < 0.1 else float(rng.integers(1, 50) * 100)
+                    rows.append((f'Building {b}', meter_type, year, month, kbtu))
+    df = pd.DataFrame(rows, columns=['building', 'type', 'year', 'month', 'kbtu'])
+    return df.groupby(['building', 'type', 'year', 'month'])['kbtu'].sum()
+
+
+#the per-building Blend loop fill_blend replaced, for one building's slice of the cube. The two cases
+#it used to break on are written out: a month with one value keeps it, where it gave NaN, and a month
+#whose values would all be removed keeps them all, where it raised ZeroDivisionError.
+def reference_blend(building_cube):
+    resampled = building_cube.droplevel('building').unstack('type', fill_value=0).reset_index()
+    entries = {}
+    meter_years = []
+    for m in [c for c in resampled.columns if c not in ('year', 'month')]:
+        non_zero = resampled[resampled[m] > 0].copy()
+
+        years = [[year, group[m].count()] for year, group in non_zero.groupby('year')]
+        delivery_years = len([y for y in years if y[1] <= 4])
+        if len(years) > 0 and delivery_years / len(years) >= 0.5:
+            for year, _ in years:
+                total = non_zero.loc[non_zero['year'] == year, m].sum()
+                non_zero.loc[non_zero['year'] == year, m] = total / 12
+
+        for month, group in non_zero.groupby('month'):
+            if len(group) > 1:
+                filtered = group[(group[m] - group[m].mean()).abs() < group[m].std()]
+                if len(filtered) == 0:
+                    filtered = group
+            else:
+                filtered = group
+            latest_years = sorted(filtered.set_index('year')[m].to_dict().items())[-5:]
+            meter_years += [y[0] for y in latest_years]
+            entries[f'{m}{month}'] = sum(y[1] for y in latest_years) / len(latest_years)
+
+    if len(meter_years) == 0:
+        entries['year'] = ''
+    elif len(meter_years) == 1:
+        entries['year'] = meter_years[0]
+    else:
+        entries['year'] = f'{min(meter_years)}-{max(meter_years)}'
+    return entries
+
+
+def blended_entries(table, building):
+    row = table.loc[building]
+    return {k: v for k, v in row.items() if not (isinstance(v, float) and np.isnan(v))}
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_fill_blend_matches_per_building_loop(seed):
+    cube = synthetic_cube(seed=seed)
+    table = fill_blend(cube)
+    for building, building_cube in cube.groupby(level='building'):
+        expected = reference_blend(building_cube)
+        if expected == {'year': ''}:
+            assert building not in table.index
+            continue
+        actual = blended_entries(table, building)
+        assert actual.keys() == expected.keys()
+        assert actual.pop('year') == expected.pop('year')
+        assert actual == pytest.approx(expected)
+
+
+def cube_of(rows):
+    df = pd.DataFrame(rows, columns=['building', 'type', 'year', 'month', 'kbtu'])
+    return df.set_index(['building', 'type', 'year', 'month'])['kbtu']
+
+
+def test_fill_blend_keeps_a_months_only_value():
+    #March only has data in 2020, the old loop compared it with its own Series and gave NaN
+    rows = [('A', 'E', year, month, 100.0 * year) for year in [2019, 2020] for month in [1, 2, 4, 5, 6, 7]]
+    rows.append(('A', 'E', 2020, 3, 500.0))
+    table = fill_blend(cube_of(rows))
+    assert table.at['A', 'E3'] == 500.0
+    assert table.at['A', 'year'] == '2019-2020'
+
+
+def test_fill_blend_averages_equal_values():
+    #every March value is equal, so none is within a standard deviation of zero
+    rows = [('A', 'G', year, month, 40.0) for year in [2019, 2020, 2021] for month in range(1, 13)]
+    table = fill_blend(cube_of(rows))
+    assert table.loc['A', [f'G{month}' for month in range(1, 13)]].tolist() == [40.0] * 12
+    assert table.at['A', 'year'] == '2019-2021'
+
+
+def test_fill_blend_chunks_match_whole_cube():
+    cube = synthetic_cube(buildings=25)
+    whole = fill_blend(cube).reindex(columns=[*month_columns, 'year'])
+    with ThreadPoolExecutor(2) as pool:
+        chunked = fill_table_parallel(cube, 'Blend', pool=pool, chunk_size=4)
+    pd.testing.assert_frame_equal(chunked.sort_index(), whole.sort_index())
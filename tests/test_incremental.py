@@ -0,0 +1,82 @@
+import json
+import os
+import openpyxl
+import pytest
+from cache import PortfolioCache
+from energy_star import pipeline_version, process_workbook
+
+
+#a new export of the same portfolio: one building's usage changed, another moved city and a third
+#lost a meter entry
+def edit_workbook(path, target):
+    workbook = openpyxl.load_workbook(path)
+    entries = workbook['Meter Entries']
+    header = [cell.value for cell in entries[4]]
+    name, amount = header.index('Property Name'), header.index('Usage/Quantity')
+    removed = None
+    for number, row in enumerate(entries.iter_rows(min_row=5), start=5):
+        if row[name].value == 'Building 3' and isinstance(row[amount].value, (int, float)):
+            row[amount].value = row[amount].value * 2
+        if row[name].value == 'Building 7' and removed is None:
+            removed = number
+    entries.delete_rows(removed)
+
+    properties = workbook['Properties']
+    header = [cell.value for cell in properties[4]]
+    for row in properties.iter_rows(min_row=5):
+        if row[header.index('Property Name')].value == 'Building 5':
+            row[header.index('City/Municipality')].value = 'Springfield'
+    workbook.save(target)
+    return target
+
+
+@pytest.fixture
+def exports(tmp_path, synthetic_workbook):
+    first = synthetic_workbook()
+    return first, edit_workbook(first, tmp_path / 'edited.xlsx')
+
+
+def test_reprocessed_workbook_matches_full_run(exports, portfolio_outputs, assert_same_outputs):
+    first, second = exports
+    previous = process_workbook(first)
+    incremental = process_workbook(second, previous)
+    full = process_workbook(second)
+    assert incremental.reused == len(full.buildings) - 3
+    assert incremental.fingerprints.equals(full.fingerprints)
+    assert_same_outputs(portfolio_outputs(incremental), portfolio_outputs(full))
+    #the edits really changed the conversion
+    assert portfolio_outputs(full)['records'] != portfolio_outputs(previous)['records']
+
+
+def test_labelled_export_reuses_previous_run(tmp_path, exports, portfolio_outputs, assert_same_outputs):
+    first, second = exports
+    cache = PortfolioCache(str(tmp_path / 'cache'))
+    cache.load(first.read_bytes(), label='portfolio.xlsx')
+    incremental = cache.load(second.read_bytes(), label='portfolio.xlsx')
+    assert incremental.reused == len(incremental.buildings) - 3
+    assert_same_outputs(portfolio_outputs(incremental), portfolio_outputs(process_workbook(second)))
+
+
+#an entry left by an older pipeline version is not reused, and one that can't be restored is
+#processed again instead of failing the upload
+@pytest.mark.parametrize('damage', ['downgrade', 'missing table'])
+def test_stale_labelled_entry_falls_back_to_full_run(tmp_path, exports, portfolio_outputs, assert_same_outputs, damage):
+    first, second = exports
+    cache = PortfolioCache(str(tmp_path / 'cache'))
+    cache.load(first.read_bytes(), label='portfolio.xlsx')
+    entry = cache.entry(cache.labels()['portfolio.xlsx'])
+    if damage == 'downgrade':
+        with open(os.path.join(entry, 'manifest.json'), 'w') as f:
+            json.dump({**cache.manifest(), 'pipeline_version': pipeline_version - 1}, f)
+    else:
+        os.remove(os.path.join(entry, 'diagnostics.parquet'))
+
+    assert cache.read(cache.labels()['portfolio.xlsx']) is None
+    incremental = cache.load(second.read_bytes(), label='portfolio.xlsx')
+    assert incremental.reused == 0
+    assert_same_outputs(portfolio_outputs(incremental), portfolio_outputs(process_workbook(second)))
+
+    #the same upload again replaces its damaged entry
+    again = cache.load(first.read_bytes())
+    assert cache.read(cache.key(first.read_bytes())) is not None
+    assert_same_outputs(portfolio_outputs(again), portfolio_outputs(process_workbook(first)))
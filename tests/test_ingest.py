@@ -0,0 +1,74 @@
+import datetime
+import numpy as np
+import pandas as pd
+from energy_star import PortfolioWorkbook, get_buildings, get_meters, process_workbook
+
+
+def day(year, month, d):
+    return datetime.datetime(year, month, d)
+
+
+#one building with a grid meter billed over start and end dates and an oil tank filled on delivery dates
+def billed_and_delivered(write_workbook, entries):
+    return write_workbook({
+        'Properties': [[1, 'Office', 'Not Available', '1 Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States']],
+        'Uses': [[1, 'Office', 'Office', 10000, 'Sq. Ft.']],
+        'Meters': [
+            [1, 'Office', 11, 'Electric', 'Electric - Grid'],
+            [1, 'Office', 12, 'Oil', 'Fuel Oil (No. 2)'],
+            [1, 'Office', 13, 'Water', 'Municipally Supplied Potable Water - Indoor']
+        ],
+        'Meter Entries': entries
+    })
+
+
+def meter_series(portfolio, id):
+    meter = portfolio.meter(id)
+    return pd.Series(meter.kbtu, index=pd.DatetimeIndex(meter.timestamps))
+
+
+def test_entries_are_converted_and_summed_per_month(write_workbook):
+    portfolio = process_workbook(billed_and_delivered(write_workbook, [
+        [1, 'Office', 11, 'Electric - Grid', day(2022, 1, 1), day(2022, 1, 31), 'Not Available', 100, 'kWh (thousand Watt-hours)'],
+        [1, 'Office', 11, 'Electric - Grid', day(2022, 2, 1), day(2022, 2, 28), 'Not Available', 2, 'MWh (million Watt-hours)'],
+        [1, 'Office', 12, 'Fuel Oil (No. 2)', 'Not Available', 'Not Available', day(2022, 1, 5), 10, 'Gallons (US)'],
+        [1, 'Office', 12, 'Fuel Oil (No. 2)', 'Not Available', 'Not Available', day(2022, 1, 20), 5, 'Gallons (US)'],
+        [1, 'Office', 13, 'Municipally Supplied Potable Water - Indoor', day(2022, 1, 1), day(2022, 1, 31), 'Not Available', 7, 'Gallons (US)']
+    ]))
+
+    electric = meter_series(portfolio, '11')
+    assert electric.index.tolist() == [pd.Timestamp(2022, 1, 1), pd.Timestamp(2022, 2, 1)]
+    np.testing.assert_allclose(electric.to_numpy(), [341.2, 6824.0])
+
+    #both deliveries fall in January and a delivery's month is the month of its date
+    oil = meter_series(portfolio, '12')
+    assert oil.index.tolist() == [pd.Timestamp(2022, 1, 1)]
+    np.testing.assert_allclose(oil.to_numpy(), [15 * 138])
+
+    #entries of a meter skipped for its type are neither kept nor reported as unmatched
+    assert portfolio.meter('13') is None
+    assert portfolio.unmatched_messages() == []
+
+
+def test_entries_of_unknown_meters_are_counted_as_unmatched(write_workbook):
+    portfolio = process_workbook(billed_and_delivered(write_workbook, [
+        [1, 'Office', 11, 'Electric - Grid', day(2022, 1, 1), day(2022, 1, 31), 'Not Available', 100, 'kBtu (thousand Btu)'],
+        [1, 'Office', 99, 'Electric - Grid', day(2022, 1, 1), day(2022, 1, 31), 'Not Available', 100, 'kBtu (thousand Btu)'],
+        [1, 'Office', 99, 'Electric - Grid', day(2022, 2, 1), day(2022, 2, 28), 'Not Available', 100, 'kBtu (thousand Btu)']
+    ]))
+    assert meter_series(portfolio, '11').tolist() == [100]
+    assert len(portfolio.unmatched) == 1
+    assert '99' in portfolio.unmatched_messages()[0]
+
+
+def test_day_resolution_spreads_evenly_over_the_period(write_workbook):
+    path = billed_and_delivered(write_workbook, [
+        [1, 'Office', 11, 'Electric - Grid', day(2022, 1, 30), day(2022, 2, 2), 'Not Available', 400, 'kBtu (thousand Btu)'],
+        [1, 'Office', 11, 'Electric - Grid', day(2022, 2, 1), day(2022, 2, 1), 'Not Available', 50, 'kBtu (thousand Btu)']
+    ])
+    workbook = PortfolioWorkbook(str(path))
+    portfolio = get_meters(workbook, get_buildings(workbook), resolution='day')
+
+    electric = meter_series(portfolio, '11')
+    assert electric.index.tolist() == list(pd.date_range('2022-01-30', '2022-02-02'))
+    assert electric.tolist() == [100, 100, 150, 100]
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from energy_star import process_workbook, ingest_intervals, conversions
+from synthetic import generate_intervals
+
+
+#monthly kBtu of every meter's readings in an interval file, worked out row by row with pandas
+def expected_totals(df, portfolio):
+    fuels = {str(meter.id): meter.meter_fuel for meter in portfolio.meters}
+    df = df[df['Portfolio Manager Meter ID'].isin(fuels)]
+    factors = [
+        1.0 if unit == 'kBtu (thousand Btu)' else conversions[fuels[id]][unit]['kBtu (thousand Btu)']
+        for id, unit in zip(df['Portfolio Manager Meter ID'], df['Usage Units'])
+    ]
+    month = df['Timestamp'].dt.to_period('M').dt.to_timestamp()
+    return (df['Usage/Quantity'] * factors).groupby([df['Portfolio Manager Meter ID'], month]).sum()
+
+
+def meter_totals(portfolio):
+    return {
+        str(meter.id): pd.Series(meter.kbtu, index=pd.DatetimeIndex(meter.timestamps))
+        for meter in portfolio.meters
+    }
+
+
+@pytest.mark.parametrize('suffix', ['parquet', 'csv'])
+def test_interval_totals(tmp_path, synthetic_workbook, suffix):
+    path = synthetic_workbook(buildings=8)
+    without = process_workbook(path)
+    source = tmp_path / f'readings.{suffix}'
+    meters = [(meter.id, meter.meter_fuel) for meter in without.meters][::2] + [(999999, 'Electric - Grid')]
+    generate_intervals(source, meters, days=45, minutes=60, last_year=2023)
+    with_intervals = process_workbook(path, intervals=str(source))
+
+    readings = pd.read_parquet(source) if suffix == 'parquet' else pd.read_csv(source, parse_dates=['Timestamp'])
+    readings['Portfolio Manager Meter ID'] = readings['Portfolio Manager Meter ID'].astype(str)
+    expected = expected_totals(readings, without)
+    assert len(expected) > 0
+
+    before, after = meter_totals(without), meter_totals(with_intervals)
+    for id, totals in expected.groupby(level=0):
+        added = after[id].sub(before[id], fill_value=0)
+        added = added[added.abs() > 1e-6]
+        np.testing.assert_allclose(added.to_numpy(), totals.droplevel(0).reindex(added.index).to_numpy(), rtol=1e-9)
+        assert len(added) == len(totals)
+    #meters without readings are untouched
+    for id in set(before) - set(expected.index.get_level_values(0)):
+        pd.testing.assert_series_equal(after[id], before[id])
+    assert any('999999' in message for message in with_intervals.unmatched_messages())
+
+
+#readings split over many small chunks sum to the same months as one chunk
+def test_interval_chunks_match_one_chunk(tmp_path, synthetic_workbook):
+    path = synthetic_workbook(buildings=4)
+    source = tmp_path / 'readings.parquet'
+    portfolio = process_workbook(path)
+    generate_intervals(source, [(meter.id, meter.meter_fuel) for meter in portfolio.meters], days=40, minutes=60, last_year=2023)
+
+    whole, chunked = process_workbook(path), process_workbook(path)
+    assert ingest_intervals(str(source), whole) == ingest_intervals(str(source), chunked, chunk_rows=317)
+    for id, totals in meter_totals(whole).items():
+        np.testing.assert_allclose(meter_totals(chunked)[id].to_numpy(), totals.to_numpy(), rtol=1e-12)
+        assert meter_totals(chunked)[id].index.equals(totals.index)
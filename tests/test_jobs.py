@@ -0,0 +1,114 @@
+import threading
+import time
+import pytest
+from energy_star import WorkbookError
+from jobs import JobPool, job_stages
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+#work that runs the first stages of a conversion and then holds in 'meters' until released
+def staged_work(release):
+    def work(timer):
+        with timer.stage('load') as stage:
+            stage['rows'] = 10
+        with timer.stage('buildings') as stage:
+            stage['rows'] = 4
+        with timer.stage('meters'):
+            release.wait(5)
+        return 'done'
+    return work
+
+
+def blocked(release):
+    def work(timer):
+        release.wait(5)
+        return 'done'
+    return work
+
+
+def test_jobs_queue_in_submission_order():
+    pool = JobPool(max_jobs=1)
+    release = threading.Event()
+    first = pool.submit('a', 'a.xlsx', blocked(release))
+    wait_for(lambda: first.status == 'running')
+    second = pool.submit('b', 'b.xlsx', blocked(release))
+    third = pool.submit('c', 'c.xlsx', blocked(release))
+    assert (second.status, third.status) == ('queued', 'queued')
+    assert pool.ahead(second) == 0
+    assert pool.ahead(third) == 1
+    assert pool.stats()['queued'] == 2 and pool.stats()['running'] == 1
+
+    #the same id joins the job already there
+    assert pool.submit('c', 'c.xlsx', blocked(release)) is third
+    release.set()
+    wait_for(lambda: third.done)
+    assert [job.result for job in (first, second, third)] == ['done'] * 3
+    assert pool.stats()['ok'] == 3
+
+
+def test_failed_job_is_kept_until_retried():
+    pool = JobPool(max_jobs=1)
+    calls = []
+
+    def fail(timer):
+        calls.append(1)
+        raise ValueError('bad sheet')
+
+    job = pool.submit('a', 'a.xlsx', fail)
+    wait_for(lambda: job.done)
+    assert job.status == 'failed'
+    assert job.error == 'ValueError: bad sheet'
+    assert pool.submit('a', 'a.xlsx', fail) is job
+    assert len(calls) == 1
+
+    again = pool.submit('a', 'a.xlsx', lambda timer: 'fixed', retry=True)
+    assert again is not job
+    wait_for(lambda: again.done)
+    assert (again.status, again.result) == ('ok', 'fixed')
+    assert pool.get('a') is again
+
+
+def test_invalid_workbook_is_not_retried():
+    pool = JobPool(max_jobs=1)
+
+    def invalid(timer):
+        raise WorkbookError('Missing Meters tab.')
+
+    job = pool.submit('a', 'a.xlsx', invalid)
+    wait_for(lambda: job.done)
+    assert (job.status, job.error) == ('invalid', 'Missing Meters tab.')
+    assert pool.submit('a', 'a.xlsx', invalid, retry=True) is job
+
+
+def test_progress_follows_the_stages():
+    pool = JobPool(max_jobs=1)
+    release = threading.Event()
+    job = pool.submit('a', 'a.xlsx', staged_work(release))
+    wait_for(lambda: job.timer.current == 'meters')
+
+    progress = job.progress()
+    assert [row['stage'] for row in progress] == job_stages
+    assert [row['status'] for row in progress] == ['done', 'done', 'running', 'waiting', 'waiting']
+    assert progress[1]['rows'] == 4
+    assert job.buildings() == 4
+    assert job.fraction() == pytest.approx(2 / len(job_stages))
+
+    release.set()
+    wait_for(lambda: job.done)
+    #stages the work passed without running, such as a cache hit skipping the fill, count as done
+    assert [row['status'] for row in job.progress()] == ['done'] * len(job_stages)
+    assert job.fraction() == 1
+
+
+def test_finished_jobs_are_evicted():
+    pool = JobPool(max_jobs=1, max_finished=2)
+    jobs = [pool.submit(str(i), f'{i}.xlsx', lambda timer, i=i: i) for i in range(4)]
+    wait_for(lambda: all(job.done for job in jobs))
+    pool.evict()
+    assert [pool.get(str(i)) for i in range(4)] == [None, None, jobs[2], jobs[3]]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from energy_star import spread_days, apportion_months
+
+
+def periods(*spans):
+    begin = np.array([np.datetime64(start, 'ns') for start, _, _ in spans])
+    days = np.array([days for _, days, _ in spans], dtype='int64')
+    amount = np.array([amount for _, _, amount in spans], dtype='float64')
+    return begin, days, amount
+
+
+#the per-month totals of either spread, indexed by (period, month)
+def monthly(rows, timestamps, values):
+    months = pd.DatetimeIndex(timestamps).to_period('M').to_timestamp()
+    return pd.Series(values).groupby([rows, months]).sum()
+
+
+def test_period_is_split_by_days_in_each_month():
+    #January 20 to March 10 of a leap year: 12, 29 and 10 days
+    rows, timestamps, values = apportion_months(*periods(('2024-01-20', 51, 510.0)))
+    assert rows.tolist() == [0, 0, 0]
+    assert pd.DatetimeIndex(timestamps).tolist() == [pd.Timestamp(2024, month, 1) for month in [1, 2, 3]]
+    np.testing.assert_allclose(values, [120.0, 290.0, 100.0])
+
+
+def test_single_day_and_whole_month_periods():
+    rows, timestamps, values = apportion_months(*periods(('2023-02-28', 1, 5.0), ('2023-04-01', 30, 300.0)))
+    assert rows.tolist() == [0, 1]
+    assert pd.DatetimeIndex(timestamps).tolist() == [pd.Timestamp(2023, 2, 1), pd.Timestamp(2023, 4, 1)]
+    assert values.tolist() == [5.0, 300.0]
+
+
+def test_months_match_the_daily_spread():
+    rng = np.random.default_rng(0)
+    starts = np.datetime64('2019-01-01') + rng.integers(0, 1500, 200).astype('timedelta64[D]')
+    spans = [(start, int(days), float(amount)) for start, days, amount in zip(
+        starts, rng.integers(1, 800, 200), rng.integers(0, 10000, 200)
+    )]
+    begin, days, amount = periods(*spans)
+    by_month = monthly(*apportion_months(begin, days, amount))
+    by_day = monthly(*spread_days(begin, days, amount))
+    pd.testing.assert_series_equal(by_month, by_day, rtol=1e-12)
+    np.testing.assert_allclose(by_month.groupby(level=0).sum().to_numpy(), amount)
@@ -0,0 +1,59 @@
+import datetime
+from energy_star import process_workbook, compile_records, rollup_portfolio
+from emissions_factors import factor_store
+
+
+def monthly_entries(property_id, name, meter_id, fuel, unit, year=2021):
+    entries = []
+    for month in range(1, 13):
+        start = datetime.datetime(year, month, 1)
+        end = datetime.datetime(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+        entries.append([property_id, name, meter_id, fuel, start, end, 'Not Available', 1000, unit])
+    return entries
+
+
+def campus(write_workbook):
+    return write_workbook({
+        'Properties': [
+            [1, 'Campus', 'Not Available', '1 Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States'],
+            [2, 'Annex', 'Campus', '2 Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States']
+        ],
+        'Uses': [
+            [1, 'Campus', 'Office', 50000, 'Sq. Ft.'],
+            [2, 'Annex', 'Office', 10000, 'Sq. Ft.']
+        ],
+        'Meters': [
+            [1, 'Campus', 11, 'Gas', 'Natural Gas'],
+            [2, 'Annex', 21, 'Propane', 'Propane']
+        ],
+        'Meter Entries': [
+            *monthly_entries(1, 'Campus', 11, 'Natural Gas', 'kBtu (thousand Btu)'),
+            *monthly_entries(2, 'Annex', 21, 'Propane', 'kBtu (thousand Btu)')
+        ]
+    })
+
+
+def test_rollup_fuel_types_cover_subtree(write_workbook):
+    portfolio = process_workbook(campus(write_workbook))
+    tree, rolled = rollup_portfolio(portfolio)
+    assert tree.at[0, 'fuel_types'] == {'G': ['Natural Gas', 'Propane']}
+    assert tree.at[1, 'fuel_types'] == {'G': ['Propane']}
+    #the building's own fuels are left alone
+    assert portfolio.buildings[0].fuel_types == {'G': ['Natural Gas']}
+
+
+def test_rolled_up_parent_gets_factors_of_child_fuels(write_workbook):
+    portfolio = process_workbook(campus(write_workbook))
+    fuel_factors = factor_store.fuel_factors()
+    gas, propane = fuel_factors['Natural Gas'], fuel_factors['Propane']
+
+    records = {r['building_name']: r for r in compile_records(portfolio, 'Blend', rollup='all')}
+    assert records['Campus']['emissions_gas'] == (gas + propane) / 2
+    assert records['Annex']['emissions_gas'] == propane
+
+    records = compile_records(portfolio, 'Blend', rollup='parents')
+    assert [r['building_name'] for r in records] == ['Campus']
+    assert records[0]['emissions_gas'] == (gas + propane) / 2
+
+    records = {r['building_name']: r for r in compile_records(portfolio, 'Blend')}
+    assert records['Campus']['emissions_gas'] == gas
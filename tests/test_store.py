@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from energy_star import EntryStore, process_workbook, build_monthly_cube
+
+
+def test_entry_store_sums_and_slices_by_meter_code():
+    store = EntryStore()
+    store.add(2, ['2021-02-01', '2021-01-01'], [5.0, 1.0])
+    store.add(np.array([0, 2]), ['2021-01-01', '2021-01-01'], [3.0, 4.0])
+    store.add(1, [], [])
+    assert len(store) == 3
+    timestamps, kbtu = store.slice(2)
+    assert timestamps.tolist() == np.array(['2021-01-01', '2021-02-01'], dtype='datetime64[ns]').tolist()
+    assert kbtu.tolist() == [5.0, 5.0]
+    assert store.slice(0)[1].tolist() == [3.0]
+    assert len(store.slice(1)[1]) == 0
+    assert store.codes.dtype == np.int32
+
+
+#the cube grouped by integer codes matches grouping the entries by building name and type
+def test_monthly_cube_matches_grouping_by_name(synthetic_workbook):
+    portfolio = process_workbook(synthetic_workbook())
+    rows = [
+        (building.name, meter.meter_type, timestamp, kbtu)
+        for building in portfolio.buildings
+        for meter in building.meters
+        for timestamp, kbtu in zip(pd.DatetimeIndex(meter.timestamps), meter.kbtu)
+    ]
+    df = pd.DataFrame(rows, columns=['building', 'type', 'timestamp', 'kbtu'])
+    df['year'] = pd.DatetimeIndex(df['timestamp']).year
+    df['month'] = pd.DatetimeIndex(df['timestamp']).month
+    expected = df.groupby(['building', 'type', 'year', 'month'])['kbtu'].sum()
+    pd.testing.assert_series_equal(build_monthly_cube(portfolio.buildings), expected)
+    assert len(build_monthly_cube([])) == 0
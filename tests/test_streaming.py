@@ -0,0 +1,11 @@
+import pytest
+from energy_star import process_workbook
+
+
+#a chunk of one row is often all entries of a skipped meter type, such as water
+@pytest.mark.parametrize('chunk_rows, buildings', [(1, 6), (97, 30), (1000000, 30)])
+def test_streamed_workbook_matches_in_memory(synthetic_workbook, portfolio_outputs, assert_same_outputs, chunk_rows, buildings):
+    path = synthetic_workbook(buildings=buildings)
+    whole = portfolio_outputs(process_workbook(path))
+    streamed = portfolio_outputs(process_workbook(path, chunk_rows=chunk_rows))
+    assert_same_outputs(streamed, whole)
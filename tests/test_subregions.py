@@ -0,0 +1,26 @@
+import pytest
+from emissions_factors import SubregionIndex, subregions
+
+
+def test_lookup_of_known_unknown_and_malformed_zips():
+    postals = ['02134', '99950', '99951', '2134', '021345', 'ABCDE', 2134, None]
+    assert subregions.lookup(postals).tolist() == ['NEWE', 'AKMS', None, None, None, None, None, None]
+
+
+def test_mapping_interface():
+    assert '02134' in subregions
+    assert '2134' not in subregions
+    assert subregions['02134'] == 'NEWE'
+    assert subregions.get('99951', 'unknown') == 'unknown'
+    with pytest.raises(KeyError):
+        subregions['99951']
+
+
+def test_written_index_reads_back(tmp_path):
+    mapping = {'90210': 'CAMX', '02134': 'NEWE', '10001': 'NYCW'}
+    path = tmp_path / 'zips.bin'
+    SubregionIndex.write(mapping, path)
+    index = SubregionIndex(path)
+    assert len(index) == 3
+    assert {postal: index[postal] for postal in mapping} == mapping
+    assert index.lookup(['00000', '99999']).tolist() == [None, None]
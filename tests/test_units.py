@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from energy_star import process_workbook, convert_column, conversion_factors, conversions
+
+
+def test_factor_table_matches_conversions():
+    expected = {
+        (fuel, unit): targets[target]
+        for fuel, units in conversions.items() for unit, targets in units.items() for target in targets
+    }
+    assert conversion_factors.to_dict() == expected
+
+
+def test_convert_column():
+    types = pd.Series(['Electric - Grid', 'Natural Gas', 'Natural Gas', 'Propane', 'Electric - Grid', 'Natural Gas'])
+    units = pd.Series(['kWh (thousand Watt-hours)', 'therms', 'kBtu (thousand Btu)', 'Liters', 'therms', 'Barrels'])
+    values = pd.Series([10.0, 2.0, 5.0, 1.0, 3.0, 4.0])
+    converted, unconvertible = convert_column(types, units, values, 'kBtu (thousand Btu)')
+
+    #a value already in the target unit is kept, whatever its type
+    assert unconvertible.tolist() == [False, False, False, False, True, True]
+    np.testing.assert_allclose(converted[~unconvertible].to_numpy(), [34.12, 200.0, 5.0, 24.304])
+    assert converted[unconvertible].isna().all()
+    assert converted.index.equals(values.index)
+
+
+def test_use_areas_are_converted_to_square_feet(write_workbook):
+    portfolio = process_workbook(write_workbook({
+        'Properties': [
+            [i + 1, name, 'Not Available', f'{i + 1} Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States']
+            for i, name in enumerate(['Feet', 'Meters', 'Acres'])
+        ],
+        'Uses': [
+            [1, 'Feet', 'Office', 1000, 'Sq. Ft.'],
+            [2, 'Meters', 'Office', 100, 'Sq. M.'],
+            [3, 'Acres', 'Office', 2, 'Acres']
+        ]
+    }))
+    assert portfolio.building('Feet').uses == [['Office', 1000]]
+    assert portfolio.building('Meters').uses == [['Office', 1076.0]]
+    assert portfolio.building('Acres').notes == 'Unable to convert area unit Acres to Sq. Ft.'
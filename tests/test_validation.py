@@ -0,0 +1,76 @@
+import datetime
+import io
+import pandas as pd
+from energy_star import process_workbook, export_validation, diagnostic_columns
+
+
+def entry(meter_id, start, end, delivery, amount, unit='kBtu (thousand Btu)', fuel='Electric - Grid'):
+    return [1, 'Office', meter_id, fuel, start, end, delivery, amount, unit]
+
+
+def jan(day):
+    return datetime.datetime(2022, 1, day)
+
+
+#one building with two grid meters; the entries are on sheet rows 5 and down, below the title rows and header
+def office(write_workbook, entries):
+    return process_workbook(write_workbook({
+        'Properties': [[1, 'Office', 'Not Available', '1 Main St', 'Not Available', 'Boston', 'MA', '02134', 'United States']],
+        'Uses': [[1, 'Office', 'Office', 10000, 'Sq. Ft.']],
+        'Meters': [[1, 'Office', 11, 'Electric', 'Electric - Grid'], [1, 'Office', 12, 'Electric', 'Electric - Grid']],
+        'Meter Entries': entries
+    }))
+
+
+def test_bad_entries_are_reported_once_per_problem(write_workbook):
+    portfolio = office(write_workbook, [
+        entry(11, jan(1), jan(31), 'Not Available', 100),
+        entry(11, 'Not Available', 'Not Available', 'Not Available', 100),
+        entry(11, 'Not Available', 'Not Available', 'Not Available', 100),
+        entry(11, 'soon', jan(31), 'Not Available', 100),
+        entry(11, jan(1), jan(31), 'Not Available', 'lots'),
+        entry(11, jan(31), jan(1), 'Not Available', 100),
+        entry(12, jan(1), jan(31), 'Not Available', 100, 'therms'),
+        entry(12, jan(1), jan(31), 'Not Available', 100, 'therms'),
+        entry(12, jan(1), jan(31), 'Not Available', 100)
+    ])
+    diagnostics = portfolio.diagnostics.sort_values(['meter', 'code']).reset_index(drop=True)
+    assert list(diagnostics.columns) == diagnostic_columns
+    assert diagnostics.to_dict('records') == [
+        {'code': 'amount', 'meter': '11', 'building': 'Office', 'detail': '', 'rows': 1, 'sample_rows': [9]},
+        {'code': 'date', 'meter': '11', 'building': 'Office', 'detail': 'Start Date', 'rows': 1, 'sample_rows': [8]},
+        {'code': 'no_dates', 'meter': '11', 'building': 'Office', 'detail': '', 'rows': 2, 'sample_rows': [6, 7]},
+        {'code': 'order', 'meter': '11', 'building': 'Office', 'detail': '', 'rows': 1, 'sample_rows': [10]},
+        {'code': 'unit', 'meter': '12', 'building': 'Office', 'detail': 'Electric - Grid in therms', 'rows': 2, 'sample_rows': [11, 12]}
+    ]
+
+    #only the valid entries are kept, and the building gets one short note instead of a note per row
+    assert portfolio.meter('11').kbtu.tolist() == [100]
+    assert portfolio.meter('12').kbtu.tolist() == [100]
+    assert portfolio.building('Office').notes == (
+        'Meter entries skipped: 2 with a unit that cannot be converted to kBtu, 1 with an unrecognized date, '
+        '2 with no dates, 1 with a missing or invalid amount, 1 with an end date before the start date. '
+        'See the validation sheet.'
+    )
+
+
+def test_not_available_amount_is_skipped(write_workbook):
+    portfolio = office(write_workbook, [
+        entry(11, jan(1), jan(31), 'Not Available', 'Not Available'),
+        entry(11, datetime.datetime(2022, 2, 1), datetime.datetime(2022, 2, 28), 'Not Available', 50)
+    ])
+    assert portfolio.diagnostics[['code', 'rows', 'sample_rows']].to_dict('records') == [
+        {'code': 'amount', 'rows': 1, 'sample_rows': [5]}
+    ]
+    assert pd.DatetimeIndex(portfolio.meter('11').timestamps).tolist() == [pd.Timestamp(2022, 2, 1)]
+    assert portfolio.meter('11').kbtu.tolist() == [50]
+
+
+def test_sample_rows_are_capped_and_exported(write_workbook):
+    portfolio = office(write_workbook, [entry(11, jan(31), jan(1), 'Not Available', 100)] * 5)
+    assert portfolio.diagnostics[['rows', 'sample_rows']].to_dict('records') == [{'rows': 5, 'sample_rows': [5, 6, 7]}]
+
+    sheet = pd.read_excel(io.BytesIO(export_validation(portfolio.diagnostics).getvalue()), sheet_name='Validation')
+    assert sheet[['problem', 'rows', 'sample_rows']].to_dict('records') == [
+        {'problem': 'an end date before the start date', 'rows': 5, 'sample_rows': '5, 6, 7'}
+    ]